@@ -1,17 +1,29 @@
 import streamlit as st
-import pandas as pd
-import pyAesCrypt
-import io
 import os
+import tempfile
+from contextlib import nullcontext
 from datetime import datetime
-import base64
-import requests
 import streamlit.components.v1 as components
-from fpdf import FPDF
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from cert_cache import CertificateCache
+from cert_engine import CertificateTemplate, certificate_filename, today, write_zip
+from dashboard import ProgressDashboard, export_csv, export_excel
+from github_client import API_URL, RAW_URL, GitHubClient
+from metrics import Metrics
+from progress_store import GitHubProgressBackend, ProgressCache, ProgressStore
+from roster import load_roster as load_roster_index
+from tracing import tracer
 
 # ====================== CONFIG ======================
 BUFFER_SIZE = 64 * 1024
 CERT_DIR = "certificates"
+CERT_CACHE_DIR = os.path.join(CERT_DIR, "cache")
+CERT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+CERT_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+# Each PDF in a ZIP embeds the ~370 KB background (about 37 MB per 100 students);
+# larger selections are only offered as one multi-page PDF, which shares it.
+BULK_ZIP_MAX_STUDENTS = 100
+ROSTER_CACHE_DIR = ".roster_cache"
 os.makedirs(CERT_DIR, exist_ok=True)
 
 VIDEO_URL = "https://youtu.be/yuNwRG2o_n8"  
@@ -22,143 +34,168 @@ AES_PASSWORD = st.secrets["aes"]["password"]
 
 GITHUB_TOKEN = st.secrets["github"]["token"]
 REPO = st.secrets["github"]["repo"]
+# Overridable so the app can run against a local fake GitHub (bench/fake_github.py).
+GITHUB_API_URL = st.secrets["github"].get("api_url", API_URL)
+GITHUB_RAW_URL = st.secrets["github"].get("raw_url", RAW_URL)
 PROGRESS_FILE = st.secrets["github"]["progress_file"]
 
 ADMIN_PASSWORD = st.secrets["admin"]["password"]
 
+METRICS_DB = "metrics.db"
+METRICS_FLUSH_INTERVAL = 10  # seconds
+
+PROGRESS_JOURNAL = "progress_journal.db"
+PROGRESS_FLUSH_INTERVAL = 30  # seconds between batched GitHub writes
+PROGRESS_FLUSH_BATCH = 25     # flush early once this many completions are pending
+PROGRESS_CACHE_TTL = 10       # seconds before the cached progress is revalidated
+
+# Stage timings (tracing.py). Off unless enabled in secrets:
+#   [tracing]
+#   enabled = true   # spans, histograms, traces/traces.json + traces/metrics.prom
+#   profile = true   # also dump a cProfile/pyinstrument profile of every rerun
+TRACING = st.secrets.get("tracing", {})
+TRACE_DIR = TRACING.get("export_dir", "traces")
+TRACE_PROFILE = TRACING.get("profile", False)
+tracer.configure(TRACING.get("enabled", False))
+
+def session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
 # ====================== COUNTERS ======================
+@st.cache_resource
+def get_metrics():
+    metrics = Metrics(METRICS_DB, flush_interval=METRICS_FLUSH_INTERVAL)
+    # Carry over the totals from the old counter files.
+    metrics.seed("visits", "counter.txt")
+    metrics.seed("downloads", "downloads.txt")
+    return metrics
+
 def update_visit_count():
-    count_file = "counter.txt"
-    if not os.path.exists(count_file):
-        with open(count_file, "w") as f:
-            f.write("0")
-    with open(count_file, "r") as f:
-        count = int(f.read())
+    metrics = get_metrics()
     if "counted" not in st.session_state:
-        count += 1
-        with open(count_file, "w") as f:
-            f.write(str(count))
+        metrics.incr("visits")
         st.session_state.counted = True
-    return count
-
-def update_download_count():
-    count_file = "downloads.txt"
-    if not os.path.exists(count_file):
-        with open(count_file, "w") as f:
-            f.write("0")
-    with open(count_file, "r") as f:
-        count = int(f.read())
-    count += 1
-    with open(count_file, "w") as f:
-        f.write(str(count))
-    return count
+    return metrics.total("visits")
+
+def update_download_count(group=""):
+    # Used as the download buttons' on_click, so it runs on an actual download.
+    metrics = get_metrics()
+    metrics.incr("downloads", group)
+    return metrics.total("downloads")
 
 def get_download_count():
-    count_file = "downloads.txt"
-    if not os.path.exists(count_file):
-        return 0
-    with open(count_file, "r") as f:
-        return int(f.read())
+    return get_metrics().total("downloads")
 
 visit_count = update_visit_count()
 download_total = get_download_count()
 
 
-# ====================== EMBEDDED CERTIFICATE BACKGROUND ======================
-certificate_base64 = """iVBORw0KGgoAAAANSUhEUgAAB9AAAAWGCAIAAABYEqntAAAACXBIWXMAABpMAAAaTAEcLDmcAAAFBmlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSfvu78nIGlkPSdXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQnPz4KPHg6eG1wbWV0YSB4bWxuczp4PSdhZG9iZTpuczptZXRhLyc+CjxyZGY6UkRGIHhtbG5zOnJkZj0naHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyc+CgogPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9JycKICB4bWxuczpBdHRyaWI9J2h0dHA6Ly9ucy5hdHRyaWJ1dGlvbi5jb20vYWRzLzEuMC8nPgogIDxBdHRyaWI6QWRzPgogICA8cmRmOlNlcT4KICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0nUmVzb3VyY2UnPgogICAgIDxBdHRyaWI6Q3JlYXRlZD4yMDI1LTEwLTAzPC9BdHRyaWI6Q3JlYXRlZD4KICAgICA8QXR0cmliOkV4dElkPjc2NzY4NDI1LWZiMjQtNDFhYi04NzNmLWFkYzA1ZWUxYzE4YTwvQXR0cmliOkV4dElkPgogICAgIDxBdHRyaWI6RmJJZD41MjUyNjU5MTQxNzk1ODA8L0F0dHJpYjpGYklkPgogICAgIDxBdHRyaWI6VG91Y2hUeXBlPjI8L0F0dHJpYjpUb3VjaFR5cGU+CiAgICA8L3JkZjpsaT4KICAgPC9yZGY6U2VxPgogIDwvQXR0cmliOkFkcz4KIDwvcmRmOkRlc2NyaXB0aW9uPgoKIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PScnCiAgeG1sbnM6ZGM9J2h0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvJz4KICA8ZGM6dGl0bGU+CiAgIDxyZGY6QWx0PgogICAgPHJkZjpsaSB4bWw6bGFuZz0neC1kZWZhdWx0Jz5tci4gRS4gUmFnaHV2YXJhbiBBUC9DU0UgLSAxPC9yZGY6bGk+CiAgIDwvcmRmOkFsdD4KICA8L2RjOnRpdGxlPgogPC9yZGY6RGVzY3JpcHRpb24+CgogPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9JycKICB4bWxuczpwZGY9J2h0dHA6Ly9ucy5hZG9iZS5jb20vcGRmLzEuMy8nPgogIDxwZGY6QXV0aG9yPlJBR0hVIFZBUkFOPC9wZGY6QXV0aG9yPgogPC9yZGY6RGVzY3JpcHRpb24+CgogPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9JycKICB4bWxuczp4bXA9J2h0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8nPgogIDx4bXA6Q3JlYXRvclRvb2w+Q2FudmEgKFJlbmRlcmVyKSBkb2M9REFHMHJtcnBGR3cgdXNlcj1VQUQ2RWhJRTV6ZyBicmFuZD1NciBLaXNob3JlJiMzOTtzIFRlYW0gdGVtcGxhdGU9QmVpZ2UgYW5kIENyZWFtIEdlb21ldHJpYyBCb3JkZXJlZCBDb21wbGV0aW9uIENlcnRpZmljYXRlPC94bXA6Q3JlYXRvclRvb2w+CiA8L3JkZjpEZXNjcmlwdGlvbj4KPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KPD94cGFja2V0IGVuZD0ncic/Pl6A6QwABgCgSURBVHic7NhBDcAgAMBAQMNMYAP/oiZiTUiWOwV9dz77DAAAAAAA4Jt1OwAAAAAAAP7AcAcAAAAAgIDhDgAAAAAAAcMdAAAAAAAChjsAAAAAAAQMdwAAAAAACBjuAAAAAAAQMNwBAAAAACBguAMAAAAAQMBwBwAAAACAgOEOAAAAAAABwx0AAAAAAAKGOwAAAAAABAx3AAAAAAAIGO4AAAAAABAw3AEAAAAAIGC4AwAAAABAwHAHAAAAAICA4Q4AAAAAAAHDHQAAAAAAAoY7AAAAAAAEDHcAAAAAAAgY7gAAAAAAEDDcAQAAAAAgYLgDAAAAAEDAcAcAAAAAgIDhDgAAAAAAAcMdAAAAAAAChjsAAAAAAAQMdwAAAAAACBjuAAAAAAAQMNwBAAAAACBguAMAAAAAQMBwBwAAAACAgOEOAAAAAAABwx0AAAAAAAKGOwAAAAAABAx3AAAAAAAIGO4AAAAAABAw3AEAAAAAIGC4AwAAAABAwHAHAAAAAICA4Q4AAAAAAIEXAAD//+zYsQAAAADAIH/rSewsjIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAwCAAD//+zcIW4UcRjG4ZmdbUtZIISSQEIwFRgcKCQJAgIH6AHgADX4HgGJRqIQBMslUFgCJJsQSpptS3Y7XGBFxdv56PZ57Gde9Re/TEZwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAgHH1gHOjGzW3tyZdV70DqHM8b/q+egQAAMCw1sfNqK0eAdSZL/rv01n1inNDcD+te3fWXj3bqF4B1PJmAgAAF9CiaXx8BBdX24523wrup+WXMgAAAAAAECC4AwAAAABAgOAOAAAAAAABgjsAAAAAAAQI7gAAAAAAECC4AwAAAABAgOAOAAAAAAAB4+oBq6G9fOVG9YaMw9nv/mSx9LQ5ud623cB74L9yd/thN16vXgEAADCon9++HM3+VK+ASkeH+yeL+dLTpc1ro25t4D1no58d/KresAoE94j2+c5e9YaMT+/3DvanS0+PX+xOrm4NvAcAAACodf/B0+oJUOzzxzfTH1+Xnh49eXnz1vbAe87C3+PZh3evq1esgn8AAAD//+zdd5wc53kn+Od9K1d17umenDAzyCACcwRJURKDg7yiLMuyZXtXXp/D+ePzrde+9Xm969v1Wbdne1fW7n1snU/SyZalsyRLWokyFSgmEDljZjA5z3RP5+7KVe/73h89BEFyQABEGIB+vx/8gZnuqXqrujr96q3n4SVlOI7jOI7jOI7jOI7jOI7jOO464IE7x3Ecx3Ecx3Ecx3Ecx3Ecx10HPHDnOI7jOI7jOI7jOI7jOI7juOuAB+4cx3Ecx3Ecx3Ecx3Ecx3Ecdx3wwJ3jOI7jOI7jOI7jOI7jOI7jrgMeuHMcx3Ecx3Ecx3Ecx3Ecx3HcdcADd47jOI7jOI7jOI7jOI7jOI67DsSNHgDHcRzHcddNzq57YUAooYwyRknzH2WMAQAgBAAMASCEMWCMMUYYY4QRxgi1aJGIpG7wBnAcx3Ecx3Ecx3Hc7YwH7hzHcRx3Wyo06iXTDEkY0JBQShmhjP732dM5s+r4vk/8gLouceu+6wRhQBECJGKGERMQFpAoIVkWZU2WFUmWsaAI0qNdW7elugSEBSxIgiBLoiiK3Ym0hIWN3laO4ziO4ziO4ziOuz3wwJ3jOI7jbgP1wJ2vlWzXITQMwjAk4aGpydPzM67v264TkIAyyhhBAhJFWVaMwWwLQwoRjEAOCSCGRIQQBiZghLEAFBhFQFnNsQqlIiE0DIOxsUlEJcxEWRQiqhyL6oauP7N9X0TTJUFQJFmT1V2Zzo3eExzHcRzHcRzHcRx36+KBO8dxHMfdopwgmCzk647lBt50vfDDueHVSsELPc/3KKWyKG9t6dgUaZeYICNRFVVVVnVN0xXd0GJPb9sq4Mt3apkqrZ5ZmffD0HJty3UcP3Rczws8QoOJ8tJSPX90acJHTEZiTIu0RBKfvOMhSRAUUUrH4ttaefjO3UwMSADEh9ADQQI52qyR9F5AfPBNQAKIKmARbp9rShgDQhljjDIABgAACDACjBFGgN4zD9A/DSGhph1WzaBc94OQUgaSgHRVTEalqCFFtCv92sgYeD5xfWJ7RJWFeETCaP1jIQhpww6DkCKEDE0w1EuuglAWhNRyiO2GEU3UVEEWMcbX/wCjlAUhq9sBY8xQRVnCksh7nnEcx3Ecd9V44M5xHMdxtxafhK/Mj9qeW6jVfnh+tFAt264NmEmy0JVq6W3JyKJkaFo8Gn+sb8dAPHst6xpIZwfS6y/hhzPn5iurFcc2Pc9z3OGlxfJK8T/M/3+UUUWWNnV1PrV9rySIMSPSm8xuiqWvZRgcd3kMwLfAqYBdBDUOKQPQbRNMX4ZvQWWGiToYrUjWb5fAnQFQxvyABiElhFEGDBjGSMRIkbEkYOH22A5ujevRhVXn7FTtxFi5YYc+oTFN7M7qdwwlhroiES1yhcuhlNWsIF92l4tua0rd3h8TBRDWS9xdn86uWA07wBj1thm6Il7qHE0Q0poZLOTthbzd3xHpzGpxQ5JvQOAeENZwgsmFRkBYb6ueisk8cOc4juM47l3ggTvHcRzH3Spemhqt1GsFq/qF0RfrjgkBiqmx/pbWvZk7Iooa040dnb27OnpvzmDe178T+t/48eXJsXylXLPNslOvBs4LS+ePvjhNCUkb8Ts7Bh7pGIjpkU0tbX2XiO+5WxYDCEJq2mHdCmpWYLvE9UhAaBBSQhmhQBnDCDBCooAEAYkCViSsKkJUE6O6FNVFVRHkm5NJCTIQny2fASwgqwTJPoh13Iz13jihB+UpKE/T0gzKbIFEL+Bb7sM5Y8x0woYd1sygYYe2F7oecQPi+sT1qOOTIFjrzMwAEAIBI0XCqiyoiqDKgipjVRZ0VYzpYtyQ4hFJlgRR2JjJ765PynW/VPOLNY9QSilgfDPm4TMAxoAxhjEYqpiMyu1pTVeFWyTMDQmbWGiMzTdGZuozy+bCqhMSyhiIAlopuosFp6/d2NRh7BpI9HcYV7K0XMkdnqmdmaxt74/1txuaKgjrheOOR6aWzOkls9zwH7ojE9VEQxNlaZ19Uqr5R0bK4/ONxVX7/QLOppRmJ/Drzg9IseodGS3bLiE70hijqCFdr4VXGn6x6lXNQBDQYGckakj8GhCO4ziOe6+65T7TcxzHcdw/NS8tjufLpYZpfvXkwVqjQWjY2ZF5ZnBfRDXS0dRQpvPu1p6NHiM8Mrjlwv9N39s6dsz07FyldHJ++vjY8OHh0xHN2NnZd1fv4N6ega2Z2zwGfa9rZn8hZYSwkFLTDvNld6ngLOSdUt2rNHzbI65H/IAGhIaECRhEASmSoMiCKgtRXYxHpLaU1p5WOzJaMiJHdFHASMBIENClykdcK4RAVBmlND+KvDqy8sAo6CnA0u0yJfzNGJAA3AqsnGDLp1k1B0oMy/pGj2pNswszoSwkLCS0OVt5IW+vlNxy3auafs0K6lZQtwPHo0FIKX0j/sQIJAnrihjVpZghJSJi3JBbEkpHi9aV1XqyekSXdFW4cMDcnNozlLEgoKWaP7nYGF8wxxfqfkgJoYJwMyJ3RoFSRoGJAkrHlU0dkT1DrDWpxiNS8ylzowfwDihljkdOjldeOlk4P1e3nFAUsCxhUUCmQyoNf3LJPDtVbUuroog7MpokoHeu5UIoK9a8qSXzxFhZlbHrE1nCsF5q7QVkqeCcGKuen6sbqrilJyoI6O2BO2OwWnFfPlUYnakVqt6uwQS8XsHouvMCWq77J8YqNTNoS6mZpNJ9/RZeqnnDM/WZZVOWcEtcierie6cuFsdxHMdxb8YDd47jOI7bGCdzc+MrCzXL/Ob4iXy1JABuTaY/sfOxqKr3Zdsf7N9y+UVskIisfGLXgwBQ95yTS7OrtUrFrI+VVw7NT7wyM7KvY9O+rk2ZZOqensHOWHKjB8utw/NJzQrmctbMirVUsFerXt0KTDu0XOL5xAsooYwQ2pzezhig1wtzN0NSScSyhDVF0BRBV8VkREonlM4WrSuj97YZ6ZgsyzcmxEQYSRqKZlFQR4URYCFzitC+F+JdgDDA7RNdUQI0hJVTaOUkFEaZXaNKEsnxW2K2MwBlrFD1cmV3LmcvF+2Vklsz/boVWm7oeMT1iR/SIKTN8zGEMEqBXZR/MoZYQCkNXZ/WLD9fxpKEVUnQVcFQRUMT03E5m1C7slp3Vu9pNSKXmNR8PbeIsoYdvna2eHqyOpuzijWvbgXN6vMYoZtx4DBoXgGAMSiSMDxTO3C2sHcoee/2dFdWT8XkGz+CSypUvZll68xkLV92t/XFNnUYW3pjkogxAkKhXPPGFxozy9Zczjo6WtYUYdemeEtCeYcFSiLqb48ghNrTWm+bbmiCJK6/iw1V3NYXy5fdiYVGoeKNLTR0VYy9eUY5Zcz3aaUeLOStkLCeNr0trSYi8qWWeR0hfJ3z8KoZzCybw9N1XRUevzNkt9NrFsdxHMdxV4cH7htjZvygbVY2ehTr8F3rUjdNnPuRpNwqE684bkNs2fW4KKkbPQruveCVhYmR5flXJ4enlxcwQulo/J/f9Xg6nmhvyT7SOXTtyz876S8u5m3LkiSprTVzz+7YxbdW6/7YZCWVkIc2XWsaHlO0/Zu2Nf+/UC8fXpioNxon56a/cPhHWBD29vTv6OpvT2ce7BpIq5cvRMDdaEFIHY80yxrkyu7YfGNsvj6bs1arnh+8aZLyVYnqYjqm9LYZm9qNfNntyurJmJyISHHjes/eRYgJCugtrDrPKjMo9JBXA4QY8UFLgWyAeMu/RNMQAhfcCliraOkILB1jVpFhg6X7kRK7/J/fSH5ATSds2EHNChZXnbmcNbFozuWshVW7WWXoCpfDgFECISEABJx17pCKya1Jtb8jMtBhrFa8loSSjEjxiGxo4mVnT787xZo/s2y+eqZw7Hw5V3H94Eq35YaqmQFjcDdlioxVef2iKzdBoeqNzNaml03HIzs3xe/fld49mLxQ86dQ9TqzOiG505PV87P1qCZ2Z/Vm4B4S1rz8BWOEEfJDaruhJGBRRJmEYmhCT1YzNPEdNk1ThMHOyPSSKYooX3HPz9YHOiIA2sX3IYTVzKBQdYtVX1eFoe5oa1LR1bWLWhgD1yeOR0LCEAJNEWQJX1zhqlnMhxAaEiaJWBAQpcwLqO2EDEDAqPknV3hdThBS1ycASMBwcWWk5jBcnwQhBQBJxIokqIqAYC2ybw6jYYVLBWdh1Y5oYqXuux5RZQFdtOpmv1nbI4QwBkxTBEUSJHH9F1HPp45PXI+EhAoC0mRB10QRrz2DCGF+SBGCZluFC08rxiAkNCTswgnUCwunjAUBo4w1Lz1pPmrNxsh+QB0vJBQAmCIJsoQV6U1NaxkDSllAaPOMLKEsDJkbEIyQpuDmEQIAhDIvoJ5P/IA2y5Spzf2/sVd5cFdsdvyQZZY3ehQct5GsRulSN82MvZZfOn8zB3OFhnbslxX+RWwD8MB9Y8yOHSzmpzd6FFdnYvjFjR4Cx22wTVsf5IE7d41enBw+Oj324sz5vF2LKNrP3LW/J9mSjafu6R0U8PWZ4/mlfxj+xxcnTdMWRRQERJK1Jx/r/ecfvfPCHebmi5/57Av37use2rT/7X9+4sxKreHu29Uej13d0d4dS3XvuBcAJgdzZ5bmXlucPLYweXhxKiJrR7sHd3T1Prl1b0LlJ243DGNQt8K5nHXgbGF0rr5UcNbqcfs0CCl7t2k7ANguCUK3avpj8/WXThdak+rm7ui+Lcl7tqU1VVCua5lihkWqJJkQCQMk2RWRudQqQuoc674f0kMocR3LP9wYgQPVOVg+AfMHwSshrx66AdGTKJJFWnxjh1Y1g9HZ+unJyumparXh16zQ8ULXp55P6HUtmN2wQ9e3Vivu6cmKpgidLXp/h3H31tT2/lgyKis3oEDQ6Ynq94/mhmdqq1UvDG9QMZKrNrHYKDd8QGCoYmdGM7SN+V5WqHgjM/VqI4gZ4p6h5Obu2MX5eCIi7ducmF2xVElYLbsTi6blhs2bHI/UrWCtUr+EK3V/ctFMRKVMXInoYjImxwxJwEgULhmmKhLuyGitKVUWcb7snpuqPbCr5S33CUK2ULCXCk5IaGvK2DOUSMfX5tdTxihlKyV3PmfV7UAScHer3ppSW+LKRRE2I4TV7bBuBumEHFFFL6ArRWdiocEYaIrQ2260JlVFxs22rgguCsDZmyrXMAYNO1xYtRGApgitKbU5Gb9ZoWu17C6s2uWGzxikonJHRutu1QWMmotljIWEWW5YbQReQGWRLhed9hato0WVxLXMmzIghK1WvZllq2EHjLHeNqMtraZiyro9D0p1byFvz+bshh1ENKGn1djcE4togioLlDLHC4s1X8BIVYSoLqqy0BwqZaxuh3Ur0GRBUwVDFZsLZwAhYaW6F4RUUwRDEw1VbO5kxyP5sjuzbDleSBm0p9W2tNaaUprLbP5tszBRxfR1VUhGZdendTNYKjiShHrbDF0VZBEBgB/QlZKTK7krRUeVhZgu9bbrmYSiygLaoBNO3FWZnThcWJnY6FFw3C1qdvzQRg9hfT0Dd/HAfUPwwJ3jOI7jbrjj+dkD82PlSvn0zFS+WkvHkr987xMDrR33dw8a8jtdm/8Wi3nv0Mnc1OxKuVzFGG0e7PvAI32d2TeW8NXnJj/9Vy/29GY//lM7IhHVcf2vfGfhv33ugCiIn3h2d/M+tYZ9enSuu3Od7Ht0yvqrL77WsMw//FdPXW3gfsFgS9tgS9tdA5sni7kDkyMn5iZ+OHbihanTh+bOb+nq//ldD0auZpO562K14i6s2jPL1sRC4+x0dWHVKTf8dz2l/S0IZcQnrk8AAgAoVL2q6VdNf6Xk9rcbPa16NqlemJF6jZAgo0iWqKkwQIgFGALwLBS6jAGyCmBugngXGBlAwq1VHJlRID7UFqE6i0qTUDwPlUlGCSEs8BgzVCnejvTEhgyt0vCLNa85pX162ZxYNKeWGs3TMDdojUFIgxBslzR/LNf91apbt4K5vNXZondl9Z6srirXp7FqM+IcnaufnqyW6p7rk2tf5vXSsEPHI+ema+mYEotIGxW4+yG1XBISihGSRCS+OfeURJyIytv7Yh+8rw0BZJJq9PVxziybJ8erqbgc0yVRQMtFZ2SmfsdgQlfEgFDTCWeWrUxS2dEfl0S87qOJMdIUoSWh9HdGVgpOvuyW677lhKryxqR4PyCzy9bsiuUHNB2Xt/XFE1GJUGa7ZKlgj801FledXNmxXCJilE0pXRm9p1Xv6zA6WjQACELWsIPR2fqZiWp/RyQRlQoVb6nozK1YjIEs4fYWrb/d2DkQb0komiLAWpmXtQz6wkuk5YYTC+bUkjmzZHa36lt7YyFhzcnySwV7fL7R7HBQtwPGIKZLmaTSmla39cZ62wxNEaqmP7lojszUl4uO7YaUsMPDJcrg7m2ploRsaKLlkHzZHZurz+ft5aJruyED1pbSOjNaT5ve12Z0t77xll2oetPL5uSiOb1k5kqu7RFNwa3Jxvm5xra+2EBnJKaLpbp/eKRku0QS8b3bU0Pd0bXH2gnPTlZHZuqJqNTdqt8xmIgbEgA4HilWvaMjZdcnW3qjXRldV8Ry3cuV3IkFcz5vrxQdL6CUsZa40ppSulv1/o7IYFdEwIhR5vpkYdU+NlqOGtKmTmOp4KwU3HzF7crq2aSqKUJI2PhCY3rJnM/bqxW3XPMlERuq2JZWu1v1gc5Ia0pNxzeythLHcRzHXV88cOc4juO4G2i6VHjx/JmXZ4fPVZYYIf3ptv9h30Pb23q2tXZeVdQOAOPTpc///akjZ5bjydZYLDM3M/vDA6+cGZ74jV+8b6B3bVbg3/79EcLk3/rlh+/b24oxogza2zt+8/eXPvs3B7dtHrz7DgMAKMJIMfToOvUrJuftsxPleBRTuk44cvRM7eiJ052d2Z98/9bLjrYnkuyJJLem25/aurds1v7m3IEfTg+/PDc2Pje7ua3rk/e+TxJux0aXt6vpZev7R3PHxyrTyyalrFmZ/QYxnWBsIZxYbDx/JPfY3uwju7P37Uxft8BdUnCiHfRMGGDMQBBAlAiyV2H2RVYYRcleNvgBUBMgIEC30gFGQ/BMWDyMFo+g6iwEFkIkIBB4EPiAkYbjHdjYmIYHKyX35Hj5+SO58YWG4xFCbuzh8XaVhl81g4kFM6qLg52RB3a2PHV/RyahiNfjJaLaCEZn6xOLjcWCfVO36spQCufnG4Ym7hyIt6U25hI6jJEoIIxQENJK3a/bgaLgtxS237kp3pnVgpAJCGWSa+9c56ZqX/zubG+7kYrJhLCVojM235AlvLk3uloJzk3Vvvbiwj3b0z2tRlQX3+HRTMXkPUMJ36eLq3ap5pUbflZULwTuXkCnlq3pZcsPaSomD3VHFEkIQlqqewfPlf7mu3NV0w8IA8YAACHUmdE2d0c/tL+zGbj7AS1V/YNnS1/+/vyugXg6oYzP1wsVz/UpYwwhJGDY0hv7xWf6dw8lNPmSg6w2gu8fyR08V5rPWR+8t21zT7Q5ab1hB0dHK1/87my57jseYa8Po9n99RNP9T19v5hNqssF57nXVk5PVOdzNgNmOeHzh3NVM0hGJVGMqbJQqnnHRst/+/zcUsEmFC4spzWlbuuLPXlf28WB+1zO+tqLC6MzjfmczZrPVgTNqjg/tb/ryfvah7oj+bL7/KGV+bxNKcQNqRm4ux5ptp/95stLnRntnu3p3jajGbg37GBm2frvB5YdN/xJ1BnRxGxKWVh1jgyXnnttZXbFunCZC0Iooos9rfoH7m3rbdcxFigDyyXj842v/GA+EZXv2pY6OV4Zn294Pn1od8vDu1uaD8TLJwvfP5pbLji2+8aOQgg2dUSeur/tnu1pHrhzHMdx7yU8cOc4juO4G2KmUX5u6uyJieGJxTkI4MO777l/cEsyEtuUzEblqw5WlgvOl7517sXXxp98fNczT2yPRGLVSu9Xvnmgblne63M2Xz62OrdY6usb2LU13SyuihHs3Bzbvr3/5ZeOHTy+dPcdmwGAUBpQIq7XpbBQadSdcNuWPk3T3n7rgVPm//W5o9mM8e3vnzZUpa+vd+/uTfvvfKc6GB3RREc0AQDdmbaVaulzB194ZXL4wNzocGGqI9Xybx7+yNXuB+7KNZsNzuft42OVs9PVkdlaruzeuGnLFzQLLFAAQsnIbN31yVLJ3j2Y2Lc5qSnitc47FyRktOB4u5DupNaq55qMgShSQBR7FVYhMPk9KE9DdjskesDIAN7oz7peA6wCFMegcB5VppG5AsRhlIQEAg9CIuJYi9DSC5EWkG5ewSVCmefTqSXz9GR1etmcXjbnVizLCQndgFD69QOGmU44l7NCwhYLzva+2La+WG+bcY0NRetWMLnUKNe961sV53phwCoNb7ngFCpeZ1oztGt+gly99pS6ZyiRL7nLRedbry6fnqy2ptX2tNqaUlNRJR6RDFVQZJyKKZQyBHChw20zU14pOuWal4jKbWl1S2/0zi3JVFQu17yaFTgeCcLLn75JRuWdm+KzK9bMijmft2eWrbghKRIGgCCkph3my67rkZ5WvS2tqbLAGMuX3ecOrBw7Xw4JvW9neu/mJEbg+nS14i4VnLH5xqFzJVHAW3ujqixgDIwxLyBzOcvxyKaOyP07W1pTquOSYs07dr5crHrHzpc1RWjWomkWeEEISQIWBMQYHD9fPjJaPjVRlQT01P3t9+5Id2Y0QxXLdf+lU4VD50qlmrdnKLl7KCFLGCHwQ3pmsvbq6cKp8Yqhio/dmW1Pa++/p9VQBcbYasVTJPzAHS13bUsNdkUNVayawY+Orx48V/ICeue21H070hihC9VX5laswyNlXRM3d0fjEWlp1T47VRubbfS06o/f2aqrQrNm/cRC4+hoeXy+gQBiRndEEzd1RupWOJ+zLSd0PCJL2HbDxVWnXPe9gFYafqnmNcvfiwIqVLzpZbNm+lFd6ms30nHF8+npieqhcyVJwg/e0bJrMKFImFJWqHkrRWd6yRqZqR0ZLg92RbJJFTXfcQI6n7cDwiQB7RpItKfV3UOJeERaXLXPz9XPTdf8gD6wq6W9RU1FZYSQ7ZETY5VS1TtwpqQp4ra+2KUK1nMcx3HcbWejv4RwHMdx3HvRaH7pM68+f2h+lGHyoTvufXLT3v50ayb27ms0r+Trp0dymWz344/ceecODQCgt6Uj+4jjhl3ta4s9N5Z3XZaIJy7u/oYx6ujMYEErlOoAUDHRyUkUhAStVzG+0rA8grLZjKqsE3IdPjnrsdT7PvDBuwbqf//cwtiLIy++Nmz/3P1PPTpw2fFvS7dvS7d3RdMlu/6p17754sw5eUHK5yp7+rf/0l0PvZs9wr0jSpnr03zZPTlR/YeXF+fzVs0KbvIYGIO5vJWvuPOrds0KWhJKR1qL6tI15SlYBDWOE+1i60C4FPhmo3m0ixJAaKPABjPPCufBbwDxAWFQ4xvWSZUSCB1oLENhDOZfg6UjAACIAQBZm9vOCJbkVLeQ6Uda6uaMkzEIQtpwwkLFOzxSeu61lVzFqTT8m7DqywpCulr1VqveyYnKbC5VswJCGcZRQxVE8V0WeDadcC5nV82bffBfIcbAtMNizSvVvIYTaqog3PS4sTWl3jEYPz9XXy46h4ZLpyeq6bg81BMd6op0Z/XWlJqKyboqqLKgKaIiv/HOIYpYEvFqxcUIZVPqlt7onVtTPa16VJcIYZYbErrWLBTeMXGPG9KWnuiRYYVRWMjb08vm1t5oszy67ZJywy9VPcrYQGekPa0KGDXscHHVefHE6mLB7szo+/dmf2p/pyCghh1OLZo/OJo/M1U7PVlFCLUklO6sJgoIY9RsYhEzyI5N8ft2pLf1xepWMLNiFareqYnKmalqe4t63840QtD8hxGIAgpDVq77h0dKPzq+2rDD7f2xp+5vH+iMZJMqAJgF5+xkdS5naYpwz47Us49166qAEHJ98tUXFg6dLU4umqKA92xO9AwmMsmM59OlgmN7JKqLT9zdum9LMh6RGna4sOocPFc6M1ntbTce3p35+Ad7MUaOS8bm6q+cLkwsNIanaxihqCYqEp7N2ZML5kLeuW9ny7OPdaXicrPY+quni5ZL5vPWyGy9bgUdGW1rb3S56EwumqYTNuwwEZEslyzk7boVCBg1S/CbduD5RNTEQtWbWbZcj7anxZ5WPRGRLIfM56z5VXtHf+yh3Zmn7283NDEkbHbFPDRcGp9vTC9ZJ8crUV1sTaoIA0KIAVQbvu2Se3ek79qa3LEp3tumx3Tp/Fzj1ES1WPXihrR/b2bP5mRXRsMYVRq+gNGLJ1bPTVd723UvoKKI3nJ1BcdxHMfdpnjgznEcx3HX02y19NnDPzw9cb7UqG9p7/jAHXc+vWVP1rjWdohmwyrmqw/cnd2z5Y25590db6pBEYSB71NJiFz8fRUBkkXNdgLTcgHAdujCcgBUVNfrX1qtmEEAd+9KphLS2289d+Z0T1vLr3+0O2mE24e6TMsMgqCj7SrqYGzOtgO0fyr68w3X+oOvf+nl0eFjM1PzpeU//OBPX/lCuCthuWRx1f7uoZVj58sLq7btbVjp6iCk+bJ7eLhUM4PH72x9dE9GFLFwbf3xcDQr9d9L7UZYnA88RilQikQJRLGZKJts8Sg08lCZgfY90HbH9dqWq+PXYekY5IehOIHMPABDCBgDEkLgg+8xRgErstC2RWzfim5WR+6Q0MVV+9xM7aVThalFc6Xk3FJlzS+YXjYtJ5xdsfYMJfbvzbam1Hd3zPgBqVm+F9yK23gBocxyQscNGduA/hYxQ+rviDz9QEdHi3ZkpLxSdPNl13TCyYWGpoiqjGUJd2X1ga7IXVuSQ93RC01FPZ807IAQ1ppRn7yv/Y7BeDIq66pAKYSEhYQBYwgubkK6PlURMkklFZMVGS+u2pMLprtv7UKcfMWdWjJNJ4xHpJ0Dia6sThlrXpnRsMOBjsizj3fvGogLAkII6YrQ32Fs74+NLcRKVf/sVPXRfZmeVl0QsIARRmiwO3LnluSdW5K9bYYooKghdWa0trRqLIjFqleq+YwBgjeadyIE08vm8fPlk2NVz6dP3d9+59bkUFc0aqx9g9YUob/DSMXkuCHt25LUVUEQEAKkykIqJve06bZLGnZwoU+vKCJFFgSMRIxjhmSoIkJobsU6Mlwu1rz2FvWf7e/ctzXZbKKqSLi/w6g0/LH5xnLROTZaundHqq/dIJQSRmGtA+obJzOGuiMf+0DP7LLleKQ1pTZnuJ+bqjMGpbq3UnI0BTfrxjg+ScQkP6COTxZXnZaEqqtioeLN52yEIWqIGKMgpLYX9rYbj2J019bklp6YIgsAIGBoTaldGV2RBD+g1Ubg+hQAEKx1zUjFlN42/aHdLfftTMcNSVcFjJGuCG0pNbpLikekbX2xlri8dqJUwG1ptSOjNS9tcbxQVwWet3Mcx3HvDTxw5ziO47jro2ibXzj20sHJc3PVYkqPf3z/B35i296UEY1cfQGZt2MMwoDIQhi5dNmJnt4OWRJrVfPiK/gZQOAxWRJas2kACEPimK6EFU1ep2iMZdoiFtMJRRLf+pX3uQNlx7E3p2KZOAFAm3oiAJG3L+H8ZPnsRHn3tpbNfZfsALkl3Q4An/novzR953e/86UvH/jhmZmxh3ft+60Hn7nMXuCuAKUsJGx6yTw+Xjk4XBxfaAThRpbTIJSZTjiXtysN31DFVFTu7zBa4tcULCItjlu3CKvTQmGG2jXmO83+hmuzU4kPjSXwTebVgIaAEETaQEvepE6qjAAJwcxBeRoWj0JxDNWXgYWo2TmVQOBD6DNKABtJoaVPyA6geAcI65ziuu4qDT9fdk9PVo+dLx88V7xFJravq9Lw61ZQM4O6FYgi3t4X723TFUl4+0vTOyOUuT4Jya1YT+YCxhih7N00MWYMGAFAgPC7PrYVGUuSfMdAPGZIqizM5+1Kw3c94vq02UizbgXzeXup4DSfYh0ZPaKJABCErFmopDWpbu2NDnSuvSNYbkgpo2uvOpcfliggURCzKbUro+XLXq7k1q3AD6gs4ZWiOzbXaNhhW0od6o60plTGYKXkzixbtheKohrRxGojODdVg2bldIwcjyiSYLuh7RLPpwiBiFGzvnl7Wh3qiXZl9URUAgAFo5guxQxJkYVizbNdAowhBBgjhMBywqklyw/IfN7Ol9yoIe0eTOweTEQ0Eb8eyRuq2OyemoxKgoAmFs0wpCFhhLDFVae58Refb8BorVw+xqBIQrM4z2rFG19oNKwgHpFURTCt8OxUFQAAgYCR5RJJxI5HChXPdkJRQOmYnIrKsoRzJefoaDkZkaKGqCliRBMHOyPpmOwHNBWTZQl3ZvRkVGaMlWt+ruR2tmiWQ+ZylojRUFc0V3IohZWy213zurNapeHnK248ImVTqihghJAooC090fa02pXVGWPnZ+uEMkJZENL5vO0GRBQwfVvFoERUGuyODnVH+9uNC79MxuSh7ihGSJYwoWw+b3sBbV4GsVxwLCeklDHaPEnz7o5ijuM4jrvl8MCd4ziO466DvFn9nW9//tTUSFyP/rO9D3x876MJzYgp123Wqq5rqXRybJ6eGA32bXtTNve9H07u2Jbt7Ii9/57MZ7LK2bOnwnDfhbf4MAiPHTuejAs7tvcAgOc6pcKKrsrRaPQtqzg/Zc8tViIRUZbX+Xjwo0MzxWo4MVP/yK98KxaVHrp/b3e7+MQDLRfucOhU4S8+f3Rmat7zfUUKezozjz583098oL8ju/6HjYFsGwP2mWc/+V8OfO/Y2On/50fPHZkee3rfAz+3475r2VFcEDLbDV89W3ju4Mpqxd3YtP0CP6CVhn94pFS3w48+3n2NgTtIGorKQvs2ya4Ec6dIxQl81pzvKUlIFAFhBmGDlafBrUFxHDY/DZ13gqjejE6qJADPhNlXYP4gmHnkNxAiAMAoBAELfQgCoBQQAqF1QNp0L0r1gRIDvF6Np+ttesk6NFw8eK40sdSwnPAmrPFaUMqKNc+eCOdXrUf2ZJ99tDuTUCXxPfjlpRlESuJVHgOMASVAPAAEogLw7jN3jFA8Im/vE3vbdD+gIWGFqpcvuUsFZ2rJHJ6uVRr+ybGK44XFmvtjD3ZGOiMAQCgLQpZKKdmUKq/XFOSqdGa03UOJ186WTCcs1rx2W03FlYW8PTxdq1tBf4fRndVTMZkxVjeDcs0LQrZUcJ4/nBMERAgDAEFAioSLNW9uxapbYbMoDUIgCKj59IroYjIqvemcDQJRwKKIm7sTADAGjBECyJfd5w/nKGWuT7IJpbtVb0koxkVpOwBEDXHP5oTtENMJT41Xz83U6lZgOaHlhIWqt1JyWuJKMipf/MgyBq+Hymuvy6YdNpu4BlXvR8dXDVUMQsqAIQyaJNatYHbZalhh8w90VdzWG19cdSK6dHK8OjxT12SciMldWX3XQPzOLclUTI4ZkiRijCAdkw1NZAzKdT9Xcrwgbrnh4qq9vT+2d3Py+FilboWFileu+wzAtMO6FWztjfa16bKEFRlLohLRpLodLOTtk+ONkZm65YRuQBt2UK4Hq2Wvp003NLFZQZ69vgNjutTbpkf1Nz1P29JqKip7AV2tuCfHq3M5q1DxbI9YTpgruZWG73gEIYTf2qyX4ziO425j78HPrLe7/i0PaMYlZwXeaJPDL/qeve5NQzsfleSb186L425BkrQB13pztz478P79979++Pypkld7eNvuP3jiYxFFiyrrzB+/4PsHFr7y9YNj43MP3r/3937joUTs8rl8KhVr70gdOTY1MrZp37ahC7//j3/6rW/8w8G/+NNf6uyIRXThx3/8ob/+3Hd+7fe++ePPvO9jP9YShPTf/qeX5ufGP/Sh/U/cpwMApYRSD2PmOO5bVrGcr5WrVjyRUJR1DvWz56Y7O1o//rPPVsuLp08e/fPPfPG+fW1PPPDzzVsPncr/mz95cWml+uhjDzz75CbiB998/vzf/v0L4xMDv/Ev7t3U89ZwvwkBGkhl/+gDH16+97E/OfDtk+eHJ/O5XLH4r/b/2GV3CHcpiwX75HjlzFR1ueQEwS2RtgMAYywksFpxGcCJ8YihCb1tRrP08LuBMAgYp/tEGrDAA2C0USLEZz4AZYwiQQKMCWIu2EUWuDD3Cnh1aNsFRhYkFW5QqEMDCBwoTULuLKycgtoCIg5QAoiREMIAwgBICIwC1uI4nhU7dwmdu5CRAnzDTwM0OyIeGikdHS3P5Mz6TS/o/y4wgIDQhs0cnxwdLQOge7aldg3Eo/paR833BlUW4oaUSSixiHQVp10Yg9IkVOfBLgFCSEuw1AAk+68qc6eMUcqKVb9U82KGFDOkREQWBcQAEhEpm1C6slp/h7G1Nzo6Wz87VSvV/ZGZxn07vK6MJksCY4wyJolIkfC1d7psS2vb++PnpusNO1jI221pNRVTqqZfrHktCaWnVTc0URRQEDI3oLZHCGV+QCoNnwGEa72gEUZAGaTiSmtKbU9ryZjMGBDKKANAIGIsifgtBW7eXjIcAQACwpjnk1Rc3tRpNKxwteJOLDSiutiZ1SRh7XGyXTK1ZM4uW3M5a3rZWly1m+dOIrpoaKIqC4Dg4k7EF78aX1ipH1LbCwmhlKKaGdgucX0CCBAARj4AxKNSKi5ripCKyYQyTRG29saefaxrLmctFZxizVsuOlUzqNT9hZzdkdF624zt/bFMQhEFFDOktrTq+mSx4KxW3LoZuD7NJNQ7BhPFmj+1ZJZqXq7kVuq+5YYIoLNF687qsogYg5DQ4ena6Fx9Pm8vF5yVkiNgpMqCIgtxA4oVlzEICaNvOn0AgoA0RXhLz4WaGSwXnKklc2rJnF42K43AD2hEExUZxwwxJNQPbng3b+666Bu6N9M+dPn7cdx719zEYatRWvemvs336ZHUTR7PBVMjL3uuuVFr59bFA/dbzqatD6YyvRu19vmpo5cK3DfvfHwDXz44juNuTV4YfPRLfzY8O9OVzPzLB5/9xT0PvnPU3jQ6uXRqNN/Vtftb3z2JsPy//ub9hn6ZghL9nfoHH+o4enT4B6/M7t7Rs2tIAYBXTrivHK20dvTF4ms14n/lY5tNt/7Vr/1g+M8m//KzGGPkBeJP/sQDv//rD2oKAgCMQVKE1XL5Tz79tc/85ddlAVKp6C9/Yv9PPb2nVHUtDwtYJmyd6GT49JndOwf/x58RKOkKgmwYhhemNI7PVj/7dydyq6Vf+pm7fv0TOzRVYAwe3Hf3n/6V9aNXJlZyg5cK3AEAIZRU9bii/ddnfmH0rsXf+dbffPal774yM/qz9z320a13XXZPchdjDBhjU0vmN15ZnM/b7sbVbb8U0wn90D46WpIlnIjIuiJeS0yHk11IT4BnIeIFvk2doFmqhRAmA5IkhAQG1GW2BzMvQXUORAVEBQT5xgTcDEIP7CIsHoGRbwANEaNIYICAEhT4zPcYIQAMIYxwLCP27hW69+DWrTdgJG8eFgPK2Hzefv5I7sR4ZWy+fqPXeH1RxvyADc/UhmdqjhcmI1JvuyGL8k3vLXpDIAQRVWyJK20pNRldp1X1JTCgIcudhZmXUHUWEIJYO9r8NIv3AMawbkfsdZdCwQ/YbM46N1Xrazd62/ROSRcFAQE08/fu1rWpNq+eLoaEjczU53JWqe7bHmnOCkdrVVOuesPfLptUtvTG4hGpUHVnc1ZXqzbYFW1YoeWE2/rig93RC2dZwpB6AWWUIYSaT2XGEAAQwhyPxiJSe4vWldH62o1sUmEMwpARygCarVDXKyiP1ondJQFHDWFLT2TfluT3Duenl6yjo2VVETIJRdQwAmAMynXvlVOFw8Ol4ekaA1Ak3JJQMkljW18sV3JtNwxCZruEvGNFI0KoH1DKQMQgYCRg1KxpA4x5PjE0sSNjtKfVjha1Na36AcUy3twTHeqKDM/WT01Uj46WJxYa+ZK7kLMPni22tWg7+uNxQ0rHZYxQIiL1thuWEy6tOksFp9LwGWOZpLKtPza1ZObL7mrVWy46uZJru0QScWdG68xokoiDkNWt8AfH8v94cMVyQ8ZAkXFrSo1H5E2dhufTXMlZt17T2vHw5r25uGq/drb4o+OrY3MNjJGhiYmI1NOqd7fqlUawmLcbdgjA68ncBvo282sQuX/qiiuTlwrc+7c80NK66SaP54KlmVM8cL/V8MCd4ziO496l/+XbX3z+7EFbYI/svuu/Pf0LkiBKwhUFeSGhLdnWP/rtfX/1JeXLX30+CMP/+K/3NzuSXYogoL27Nz/6cOE7331hfmb8zr27GqZ5/OSoqqh//PvPbN2cbd5NU4V//cm7/qdf2LNWPRcAEIiieGHhg73xL/yfTxHyAQYwOee/fKRYLObiiSQAGJrQntXPT039/K+doW49kUhmWyKf/bOPt2Vjn/t6CRje//CDusIAMMCbpuSvrJQPHx15/4MDv/3JO2VpbUVSRIxExFx+4YUD+c2DXZnUO33kwAjFFO3u7sG/ePZf/G8vfOP8/NR/+vbflculX33gg1eyP7mmmhVMLjROT1bn87Z5qxYMCQmbWjIjmri9L2aoYsyQriWtQ6KCO3eJogyiEuYnSHGeMQhDABcoYaIMAgYsAAMCdoFNfh+cMvQ+DFoSpMufGLsKjIBnQmkC5l5Bq6PAQoQoQ4ySZotURgJGCSAApEWE7Caha7fYfzeOd1zPMVxC1fRPT1aPjJRPjFXylbde13J7OXa+7PnkA/e079oUT0RlUbjtQ3eM0GBXZM9QImpcTRF/pwKNFVSegvoShC4AYo08lKYgMQLxbtCuopE1QjC3Yr1wPN/fHtk1EI8Zkq6s806kqUImqajL2HEJIWv59ZrrFJMqEo4bYialLBWdxYIzMlOPaNJqxVVkYagrMtgZuXCKV5GwrggYo55W/UMPd+nq2oApA0oYQiAIGCHQFEESMWMsfL0+/lrZk3ccLmXQnJKejMn3bEvt3ZLcNRBfKbqWQyYWGhFN3NwdaUtruiKU6/70kjU8XQsJ278v299h9LTqqixEdDEZlY+OlEdma34Q+gF95+uMRBGrsoAxyibVJ+9ra02pIV076U0oA0CigBAAxiiqSwCwVHTCkIoCjunS/TvSA52Rmhl4PilUvaWCM7HQmFuxRmfrsYjUldHSCWV7X2x4ulaoeCfHKpZLIrqoKYKAUTaltqbUlZIzs2K9fLpQrHqJqNSSUBIRWcBoetk8fr4yudBQZeH997T1tRuGJuiqaKiioQmzK9aBM4XmJQ5sna1744lJKPMDOrFgvnKqIGD00O7Mvi2JTFJVJByPSJKIR2frlhO8B57LHMdxHPcWPHDnOI7juHfjmS996tzMREpUf3H/M79zzweFK55UCADJZKRQmGb0gU//u0cC3/7c558rFulf/+n7hHf8zjnQo/z5Hz721P6uv/6bV44ePpBqSfz0s+979pmtfR3qxZGlLAkXUu+3wxhpqtj8ALBnm7J7axSgr/nnTz3a88FHupvhyYuvrZw+t1Qo5iRJAIDv/ugHbiC8+trcpv69H36icfECF/P06y+YgOWdOza9Zb1bt/Tcf/fg+x9ONdP2//z/nv3il7/30F33/vHv3Wfo63wCwQjd0dbzlY/9xstTI7/7zS/82Qvf+M7kmV978KmnB3ZedpdyhLJSzTs+Vjk3XSvWvFukkszbUcpyZTeybC7k7dakGtXF9WacXjFBwqleJKnAKGARApc6DeY7QdBMgRBIIGCGgIFXg9wpBhQZLSy9GWKd68zDfHcYhcBF9QXIn2Xzr4FTRkCbvw4DCH0IfEYpAMJYiwjpbrFnr9C9R2jbfqMryTAGphPM5ezXzhaPj1Wmlhu3eO/Qy5paMisNP5tQ44akq6J4ZSc4b1maIsQNaVtfbOemRPRyFzm9iWdCfQnMHDjltd84PjRWoDoHWvIqAncEGKG6Fc4uW3UrZAC7BuKJiCTLb3orogwIoSGhjAHCCGN0oYDMWnx9PQ4rScSGJnZmtPmcvVp2zwEQwoo1P6ZLzSy7WQkdIRQzpHRcns/hmCENdUfbW9SLi1Ply+7simU5oUVZSJgsAb1Q04XBuvHwxZrXCQGDiCYOdUe39caGuqM7NyVWK97x85WR2frIbF0QcE9Wb9hBvuwurNpRXdo9lLhne3pHfwxej5jH5xtByChrTv9f210XXurY6+k/QmBoYktCyZddQxMGuiJbemIXTiE0y6/Prlh1O3A9AgwIZQt5u1z3GYNtvbEtvdHNr19AtrBqj842ChXv3HRtqeAUKl5bSk3H5K29sdkVay5nD8/UJRGn4kpElwSMskmlNaVQyhZXbccLXZ+2ptRUTDE0EQBWK+6p8cpy0ZUlfP+u9D3bU4YmYoQoYzUzKFY9ASPK1r9i4OI9TCjzArpcdEZnGzsH4jsH4k/d39GV1ZpbV7OCuZxN6esnbXjqznEcx72H8MCd4ziO464CZYwy+uOf/9SxmbF9W3c+//HfudQ9m5UcgAHG8JavpCJGgWdTSjBGf/knT0ly+99/7bsf/hXna3/5Y++QuSMAhNGTj29+8vHN12VbXi8F8EYWIAhrEeQTD3c+8XDnhXt+5Ccf62rvP31i4vf/4N/93h94A/3Jpx/f+puffAwA6g1zemYhnU7293cBwORk8ctffbXm4I995IGnHu5/5pFNzU2nlB0+OlUsCy8fOL7/x1958smH/+1v3S8KGL+50isCEBB+bHDnp3/2V//4R98YnRz/VO0r/vu8n9i279prBL+HUcYclywXncMjxYmFxi2btl/genQ+b3dn9a6sfu3VuJGWFHruRGoMR1Lh7PEwNw6ACAHqAaUgUhAlEAQGLETVWRj7Ngx+kBkZwNL1ibxJAE4Z5l5Fy8eRbwIwhCAMIAgg8BghwBhCiCFRErt2ij17ha7dKNZ2E7qkhoSOzjYOj5SOj1Xm89abZiXfthyPHBsr65rQ06pfyCVvU50Zbfdg4u5t6a19MeOqtoVRCH1gby57TQIIHKBXUUgKIySJ0JpSh3qiK0V3ZsmcWDSjutiV1dHrr8yUspCwxYLz2tlS1Vw72xHVxRvxgiyJeKgrulr2Xj5ZODtVm1m2RBF3ZrXWtBqPSAJGAIAQdLfqm7ujY/ONUt07OV5hLDHUHYXXs/JzU7XPPzfTrI7SklD62w38rrvJoma1GXTHYJxSNrtiLRWc5w7mBIx7sm/0tWoWyFLltWe065NcyV1YtXMlJ6ZLEV28ePo2QoAAwVpleSYg1Nmi7RqILxfshh2OzNR1RdzSu7Y5hLKJhcYXnpv1fJKOK3FD6mkzphbNM5O1+bz10+/r3twTufDpQpWFdExWFYwAMAYBA0KQislDPdEDZ4u2R+Zzdlta3dYfa0nIGKNMQs2mVAZQrHqlmre5O7qlJxY11sIBQpjrE0KZLGFNEVRZaBbdCUM2Ols/OVE1nTBmSLoqvHOz37U675QhAE0RDE24cJosCGndCs5NV89O12yPwPUpTcRxHMdxtwoeuHMcx3HclXLD4M8Pff8fjr2cyxd+9t4P/pcP/eyl7hkSem668Xf/OJ5bKn74/duf2t998ZdSVVYNNUkI9gMWhmEilUpl2o+dnvy53/7e//2/P2boV17J9yb5yBPZjzyRBbjHD+h//uLZmcmxU8ePwScfAwCMmSwFEgTNyiCDgy2bdw18+vNHXvzd77zvwX2//PEtA70yAPz5504cPjH14Q9/6A9/tf9T//XF5184/aUvP/c//+pP/von7113jfe1b/r3jz/7l8rzh0dP/+FzX2wE1s/sfEAS+OeW9RHClkvO1JK5UHCqln8tixIwkkRsqKIiY0nEGCOM1qpGUMpCyoKQOh5xvJAQeNctWQlllhM6b64y38zL/JB6PlVlLEvClQYwoowiGQyAJBUAQBBJeZE5DUoghDdiSYwYeDUou1Dohkg7JHquqvjGJTVWYHUUCuehvgTUZ4wRAoEPQbNFKiCEME60iy29Qt9dQscOnOwC6Uq70DMARpnrE0pBkbEorFuCeh2mE5Zq3smJytHR0mLhOpcYQggQQposqDKWRCwKuHlaEa314Vyb5Ov6xA9pEF7Pdoh+SOfy9sSiWah6uireiMwdIcAYyQJWZAHgcjOir8yFZSAEsoijutQSV7b3x/YOJYa6IonI1Uxvh+ZThcJbRsYYUPLWX76j5uPY1248eEfmlVOFYs07OlIq1bzOjKbKgiTiIKR+QB2fHB0pLxed3jZj91CiJSG/JWN9x1VexYBEAfW26bmScehcKVcKynV/x6b4QFckGZUv1JPBCLWn1S290eGZSKXhHxou1cxgpehKIqIUGnZw8Fzp3HRte3+8Ja40y76/cxmZ5q3s0oVxEEAmqW7uiW7ri52ZrE0sNEZma5u7IxihZEyO6pLjkZGZWkhooeL5IW3YQb7szSxbsiRQBg0rnFmx0nG5La2pspCIyrKEq2bw2pmi59OBrkg8Iu3oj43PN+Zy9onxiumEuYorCYgB1M3g9GT13HS1o0Xb1h/XFEEUUDwiN3t1HDxbiuhSVBMlCRPCSnV/pehYTtiSVNpbtFRcFjASFSGTUJJRWVeEUt1HCLqzWjIiY4SiupiKylFNQgA1M4gaUn/HG42sY4bU22Ysrjo1KzgxVnE8EtFE16d1KxhfaEwtmoyBH9D5vJ0vu3U7QBgpEkYIMfamxxwjkCUcN6RMUnE8MrVoHo2W03EFABp2mCs5cyu24xHKWKHqnRivPro3o61X1IjjOI7jbjv8iyvHcRzHXZG65/yHF775naOvZpOpn3vfj/3R4z+x7t1CwkzLP3B0+v/4q/+fvfsOkuO67wT+3uuce3KezQG7i11gkYMAkCBFSgyWTEkWKUsnyVawZKtsX519Z9/VnX13Lqtkn31ykFi25ZMsS7QoMymQIkECBANA5LBIi805TQ49Hd/9MSCIsBFcBpH9+Qs16O7p7umd3f6+X//e/omZXLFkHz/el8/f9sn726+WuYmCQhHyw4/MtbQSBw48d+7c0Pr1G1ku/swzz3x06vLj/+9LArfC/OXtQlPoDz7fBUDX1Ve8HnHj+sZnn33lct/oli6ZZYhP3LNWc3x//pdPnzpxIntPANSES5p1/NRlnvf+9q/5FRH92R/evvMDe595+pnDrx1cKHAHAKwPJ7/9wBeePH/0Lw8+9afPPFKp6B/v2iHSLPnWlwb/0jEtp2+seHE4X65YbzIfpEhC5qh4kPN7aImnaBKRBKr26jUtp1yxC2VzMqVNprFu2M6qNorHAFsOzpesVE4PehgPicCND4csBgo+yKkUJyMlZJz6qV3JAwxsC9hWNcoHNAMRtrBhg9mLAFGA+uCqBO547jIYehnmxoFVgQhbNjB1bBrAtq4EmpAgyPhauuODUI1B3gvgCuKkagfqdN4wLexXaZ5ZbhuVVE4/P5g/diF1ui+76p1kIIQEgl6ZDqhMtbsLTSGEIATAsrBhObppZ4vmbKaSLZqrG7jbNs4UjIk5bWymrIgUz65qL34AAAAQQppEMk/7ZBoAYONV2P+rISSJoCJSDVFxY6u3ISYmXu+UsgquTGC64vWak6JXoedy+oGTMy8cnzlwYpZnCY9EizxZKFvFslkoW5pum6bT3azevTUS8l43hwdetE8LBmD+Lt/zIQkUD/KzGd0jUdNpwtKsqJ9rScrSNS3IIARBL2s7eH1L6XBP6pXTc2cuZwMeRuYp03KGJkv5soUx6G723LszGvKyDga2je2F9wBjfKWlyU2LXB3UoEnkV5lta/2WjV84PnNhKB/yMlvb/PEAF/AwPf25Jw6OJ4J82MfmS0ZRs8q6QxEoGuCmU5WR6fKhnhRJwD0SLfNkzM8KLDEwXvzuz4f6xoqfvDOZDPNtdUr/eClfMo+eT5+6nA15WZEjAQbDU6Vs0XQc3NGgfvz2uE9hKAKua1Jn0pWXz8y9eHL2+KVMbZiXRUrT7bmsMZXSgl62tUZurZGSIYFAEEDAMyCg0AEPUyxbPEtE/ZwskBACliYUkQp4GHmGypVMn0wngtzVEayIn9vS7usbK/aNF364byTkYeIBfjajT6YqPEsQBKQoVChbh8+masNCc0IKehmBu/LL2cFvRO4kiSQCRQNcfUwcnCgOTZZ6RwoCRyIEp1OVdN5QRErmKa1i948XHzswtqnV4wbuLpfL5XpvcAN3l8vlcrmWNlcq/Jd9P9p3/mRzOPqDT/2OT5DmXcww7UOnpv76O8dyE1NbO9vWf3LDsYujjz7zwsGTEzs2N9TFrmRDXlVxHObI0Uvnzu5PxIX/8cefe+ieBEXCz/zu7NT42KM/u/jZj61d6R4WjIphmbbt2NhxsHOlgfUbSUg1iLkuUYAAQljt4gsJhAiERIZlVlhFHvQQH9kb6+tLPPLUadsBH727ASFybGyK4fCXv7BpQ1cYAPB33+85da7oUxOptC6LZa+H+/B28OHtdwGw9Jyov9K2iaaYb+7/yV/84vF9Axd/Z+eHNkdrabfU/RrVSsPhqdLARKli3Eo4SJFI5MhYgGuISUGV8SuMIlI8SzI0IhFEEFZTM9vBpuXoplMom7miOZvVJ+a0wcnSXE4vlM0VBf00iQIexiPR18aDEEACgZmMduT8HM9QfpXtalIDKrPcjUIECATFIBHpoCwbjp21J3ocLY9Nw74yMIBJChIEBqVZMHsJeOoBIwPeB4hbfaZEz4PSHExfhtlBaBUxxtWO7aYBHAcAhCDFEN4kEe8kEp3Qk4SMCNDKLt0LQ4Wz/VnTdrwSvXmNt9peeXGWjXXDPj+Uf/bI1NBU2ViNvJtAkCZRyMuGvGxAZbwyrYiULFASR1WL3AkCXqlwd7DtYMvGmm6XK1a+ZOZKZrZopvPGdKYyl9VT+Tc7wYDjYN1wskWzXFlB+5Tlo0nkU5iOOmVLm48k4GoNVlS/ihGCLE14ZToe4D0SzS46V/bbg6aQT6b3dAcDKnN5tDA+q01nKvmyWa5YloNJAiXDQtTPJkPCuma1NiLwrxdB14SFPeuDPoVujIvXtsQhEQp62ZYaWdPt5oTE0Gjx6UmughBQBAx62O1r/WEvmy6Y65rVxrgoXn/ZEwiqEr25zSdyZEBlxme1uZxeLFvV19vqlMaEuLnNF/KwLE2YliNwZH1E2Nbhb0yIXoWhrxnhIBGsj4pb2q1swWitkRCCFAkVke5oUAplKxHiZJ6s7hjPEq01km7Ymm6rIoUxQAgEvezdWyMhD3uqL2MYzuh0mSJhwMM2xaWAysgi9eqZuaHJEgDYsByMQcDDdDaqczmDolAqq7MMQSBIEkjgyA2tHp4lwl52dFabyeiFkkkSUOLJhpjYnJQ2tHgCHoahCAiAX2XWt3gerCR7Rwtj0+V82Spolu1ghiLa6uTORrWr0RML8FcH+AkE62Pi1nZf2MvGQ3xdVFREunpQskB1NqosQ9TMam11SsTPXb0gZYGsjwp7ugMCR/SPF0uaPTxVZmhUFxM66pSAhylpdu9o4fjFtGXjQtnyq4xXpje2er0KHQtwV7+pql3rWpLSvTuixy6ke0cLxbJVqtg0jWJBrrvVkwjypuWc7c+VKpb93uh75XK5XC4XAMAN3F0ul8vlWlzeqGS10n9/+ocHL/dsbu745r2fWShtBwCc75v9rf/2hCoqf/DV+z/ywQgAQHgx8GpPfUt9KBrkr+bdWzqZeEwemyG+/80v1caFq6t/768fXP6O5XQtp5dN27QdBwP8VO+xS9PDqWwpWyoX9bJu2QDStuM4toExxpjABMbIhAgDhLCNEYAUQbAExRIsTbIyL/oU5f41na3+MASQQARFUBRJBTlxyflg1zR4fv8LWx/+3uHHnnpx34FzrBTtuTjkV6mgXwEAzGW0o8fOszQj0Lnf+6PHmxp9X/vC5kTM7/cut6vGh5o6aZL+9ktPXxi8/H/K2tf23LuttnmlAwPvYbbjaLo9NlsenSkZ5soiSAgBRSJZoGJ+bkOrd3dXsCbM31DBOi/LxiPT5fND+ZfPzPaOFsZmyhXDXmYtM4EgzxFRH+dT6GsL2CEEBITpvH66P13WsCqyEk8yFKIpRBKIXF5mB1gZ0gIpBaEUBEYJpIadUtqxHWxW9w0TBASVLLAskLoMeD9gpFsP3LUsmL0AMwOwNAkgcJwrte2WCRBBIJpFoo9IrKW77oeiH1DLrcXGGJi2Y5qOYTknLqWfennCr9LtdXJXk7qcxtm6Yc9m9Z6B3IFTM2++upwkIE0ijiFVkVpTK6+pkVuSUiLIh30cScAb5mC4mabbhZI5NqsNTBQvDucvjxUxALphm5Zj2ti51XjNtp2SZunGWxK4kyT0ynRHg/KRXbF3QyD+VkMQcgyxvcPXmpRO92VP92VP9+XKmmVZjkgiv8o0xsXuFs+mNV6KvO7HsC4i3LEpxLOET2GuHQoiCBjyso6DJZ6M+FiWJoilrpOrIIQ+hd6+1l8XFWczlY4GtTYsMPSNv4NEjuxqVMNeNhbgD/fMHb+YNiwssGRdVNjU5tu9LsCxRDVYxxhKPNmUkCwHNyckv8Jc7U4DACBJ1JgQRZ7UdCvq5xCCNIk8ErW+xaMbdk1EkF/v9sPSRG1YIBGEEOqmTVOIIpFPoe/YFAp6GJKEfWPFmXTFIzMddcrd2yLxACdwJIKAoZAqUzSFIAQ+hZEFqtqepX+8mAjyAkdSBGQo1FGvRP1c1M8du5B+tSdlWQ5FovqY0N3i2b0+qIo0RV45hxJPdtQr8SB36OzcoZ7UbEYvahZFo2SYb6+Tt7T72mqV6z5fBOqiAkOjZJj3ykwyxF/9sGSe6mpUQ152Nqt31MsBlbk6NCKwJM+Qu9YFwj5239GZ/vFioWyFfGx7nXJbd7A2LKTzxqtn5zJ5Q+JJy8YYA5/CbO3wizyZDPE3jJHUx8R4kBc5kufInv6sptscS65r9mzv8CfDfEmzfAozPFWayVaWf6m4XC6Xy/Uu596sulwul8u1oEyl/KOLR588+cr03OyHOzb98R0PhAR5keUdy7E03Nju27JeBgAUy0YqU4QYHT+Hnz+c2bGOU6Qr5bqIMLxeiSRXdm9Z0Cszhbxu6RZ2fjHas3/4zHRmOlfRTGhhQgcQIkciAE0JNokQiWEjH6IQICACmMAYO8AqOfq4lrGwDQCAAOjYLDm6DbJmyXZK1r7xF4FtE5iSWTXiDUfk4Odbtwc4iSHJGm9gkW4F7U3eb/7PDx98rf9fHzsxNj5COeXdWzfUJoMAgG/9y4nTPWNf/eKDn30g8W9PnXj2hWMPffnhzz1073/6yrbldwvZW9dKkug7h5472X/pzw888fu779tV28qS79LGO2+zXNEcm9VSeaNcWXGBIEWg1qTcUa9saPHWRoSghxGXUUMNACAQDHoYmlJjfnZgonhhKH+8N3NxOL/kitXJ+mpDYiLEe2X65pYxHoluSUhHL2ZP92fKutVWp6xrUusiQtS/7OYhEEGKI0LNcNOvWUNHrIFDTiGN9ZJlVR/rACQJEDCcdD/gvMBbD2hxuVu+QWkGjB0BxUkAgW0B0wCmARwbQASR6EH+WrJhBxFpg4J3RZm+ptuDk8WLw4Uz/blLI7npdKk+yiaCHEstq/fIZLpy4MTM+aG8aTm33GQfVFuZQxj18201cmut3BgXVZFWRErhSZ4ll9lNniaRLFK1JPKrTEtSyhTMdME4P5i7MJzvHy9mCrc43wBEkCSXWzftWiaBI9fUymEfu7nNZ9uO4wCEAEMRskBWu6jfMN4T9LIsQ5AEZCh07cgEgaAqUgyFAirDMQRN3jg59uI4hkiG+YCHqRiSKlIMjRYKYRWBaq2RfAq9rcNvO5gkkMiTfoXm2TcifoKAHEPURARVpmWeEjji2jEDhEDEx6oiZTuYYwgEIURA5Kk1tXJ1wIC55rgghD6F2dDqsR1MQOiVaQggSYD6qMjtIAplq6LbLEN4RCriY6srbmz11kaE12dVJar70xATq9sRWDLkZa92UBE4sjkh+WS6u8XjYIAQEDnSKzMSf2MjKZpCqkRvWuOrjYgVw7ZsDCEQOFIVKb9y0yNBEHplmmWIiI+jKcSzxNWPg2WIWIDzynTFtD0iTVz/Qw0hUCW6tUZWRbpQtkzbETlSEamwlyVJqErUpjZvxM96Zcav0iJPOg5e16xSBBQ5kr7py4ok4Jo6Oehldnb6LRuTBAx4mIDK8AxBk2hLu7e9XtYNZzkP8bhcLpfL9UvB/ZXmcrlcLtf8ZrXij84e/vHRg7lS8ba29f9x131hSV18lUjIe+/e7qd+cfgv/oH57MfXHzkz/L0fH8un8Om5yZ4zh3/7P2z55H3tskQDAGiUY0kdgmX1wM7r2lB2pmIZJydHn+o5Pp6ZKhoaRphmEEkgieYYmgpLAkvSFJJ5ihd5kqPpiD/61eZdN2xqtJj+cf9R07Es0zJMQ6toJa2sWbpm6SawMkYxp5c1w6lYdv/k+MDYxKEzp7yiFJGU3999LwkJhmI8opwU5u98vWtLw64tDb2DlYt9hY4WPhqgRiayx0/31tTU3rVTUkTwxYe6v/hQ99f/9oVkfLFxi3ntTjRDCH8qKC/0HPvfz/6bdccDt9d3uJk7ACBXMsdmy7miudLmIQJH+hVmXZNnW4dvfZNHWcnMjRACkSNFjowHuIiPC3s4ikQEgjOZSr5sGub8SS9JIJ4hmhNSZ4Ma9nFXe1NcSxGp+qh0ojc7NlOcy+pTab1QNmczen1MUAVaFkiRp5aodocQEBSUg4QUAAAAW7cne+30mKNrtmWZ1U7XjgULEzg7CMpzgBaXX35+hWMBUwOFSZjuBZWc4wDTBKYJbBtAkiU4kQi3EPFOom4LUqPL3GS5YhXKVrZozmQql0YKp/tyxy6lC6UKRTgeiYr5OWapauvqVLTDk6UjF1JDk8Vbbs8AIeAYQhaokIdrSUrrGtWOeqUxLq6gof7rCAISBFFtogJCvGVj3XRCHsYj04pIDU2WZjK6ptuWvYJLF1V7rAsUx7g3MquJoVDYy4aX8YBLlcST13ZXv6p6/XAM4ZVv5dkRikQeifYs+CDZG1iGYBki6FlshxGEiIRemZ53ZxCEskDJwhtffRBCBsF5T0I11L4hESYg9Cm0T5n/SBMhPhG67lkuBKFfZfzzdcpiKBTwMAEP07rI8QAAACAJSBJEMswnw0s/KAYB4FmSZ0mg3PhfJAEVkVrkm7/6Oc77zBPHEMkQn7z+6OKBBb9IEYILXV00BWrCws2vu1wul8v1S839O9XlcrlcrnnMaoXvnzv06ImXbMO4v3vHF7fsjS6VtgMAIkH2c59oPndp+JkDl49ezOuV/Jq6yOc/0ZnKlZ94+rV/+MFxjqY+cnezJNK/eu96mpFUebGYTzON3pmJsqmfnRv57pkDM6VMBVgkSbECpUpyLeeLcqpEsQFRjfqCdzR1eLmlb1kTovf3uhbsnH5kYuDU2OB0NpPTipph6NjsKYylzNxEbvqTT3yDxGRI9nfXtn2qbqNIcz5RjknzJO/NdWxz3ZWb6ieeuzw4UahNBMantNq4xDIEAOAPf/v2JfdzXrviTbviTX/HS989vf9PX3gEogdvr+twe8tki+b4rKbpK57ANOrnuhrUD3T5OxtUYb7se5l8Ci2wStDHrmvy/PzwxJm+bCpvzNvMhGeIsIf7QFdgV1fAI82f8kg8XRORRBbatl4x4dBUaS6nHz6fDqnMxlZvV6PaWiNdG5AtDAIIUbiVkoKQ2w/QETw77Ogl08AQQYgwAfKoNGWnBwElQDUBVjTdpFnB2VGYH4N61jENywSmjm0LQACQ5CVCjVTTbiLeBVh5mRvFGE+lK+f688d70xdG8tmClS+ZRc2ybIsibJ9Ch308vdTsmrphD06Uzg/l+saKqfwtFo8DACCEIS+7tl69c1O4ISbKPCWwxC2k7TcjEORo1FGvJkPCljbfyd7M04cnx2bKudJyA3cIAUlAiadiAW6hS8jlcrlcLpfL5Xpnvd/vUV0ul8vlutmsVni059CTx14yDeOedVt/c+OeedP2i315XmCSketK1WIR9Vc+1P3tfzkwOjrzsY/c9sWPtzRFHQCAxOvf/NbTjz7+WmdroKsjdP9d3Qu9u+nYp+eGi7o2kpr9/tGXZsu5slMBBOBYtkn21HvCflGJqqHbEm1NcmB1D3xztH5ztP7aVx4+sW84N52rFE5MD2T18kwx/YvTrxw881pMCayLN32ooSsi+5q9oYU2uLW7rqzpL71y8Vv/fHBurqWlKdre5KeW1xljIV+97VdYmf/7F37yF88/jvc4dzR2vs/nUC1XrHRe180V1AhXu4XUhoQt7b7aiLC8/HpBFIkoEtEUIXKkYTlRPzc8VZrJ6Jm8YTvYwZhAkGdJVaKTQb4+Kq5rUkM+llqgnxLHEEGVDaiMKpIl3S5pelm3ciVzNqPrpjOV0i4O56N+LuRlgl7WJ1fbQCx8pIwIKY5IrAOIACRrz43YhZRtOZYBILQIPQ9zw0AMASWxorwdWBrIDcPiJLQN23QsAzg2ACRHSF4i3kHUbEThFij6F9+G7eCKYU+lKtPpykxWH5kqDU6U+saL43OaYWHbtrFj8QwIetiAyqgSTS4VuJcr9rnB3PnBfK44/4DHcoS8bDLIdzQonQ3q2nrFrzKr2FUZQgAhlHhSYAlZIGkSEQie6cv2DOYyBaOoLT1oRBEoFuBrw4JPpq/24nC5XC6Xy+Vyud5V3tc3qC6Xy+Vy3Wy6XHj84pF/P/aiUTLu6dzyufW74vPVcb9ydPzb3+2JxJSPfjC6bUPy6utehbxvb2xguPnpF/t4UlN5CwAEANjenah8ajPh2B5lwXATY3x0tG80N/MPl16YKGbyuRKEhMxLrUptmxwKSZ49zV3rAom34qgX8qXuO6r/+OHZV0bSk3Pl/Cszfaly/lx25GJu4heXT26Otfxq04YaT6A1FLt59c1r/ZvX7ty2vnb/i6e+/+OjFMN98dc37t3ZRJFvKin7jQ13Opr9ndee+/rzP4YA3NnURaL3b/Sm6XauZJkrCdwRhCRCdRFhW7tP5FanTJihUcTH3rs9urnNe24g1zOQOzeY003bsjFDEREf15KUu5rUjnoZgsUicpYmGAqFfVzYy4zOlA0TEJA1TMcwzSMXUscvpViaaE5IW9t9W9p8Mk9BChGLF18jgoh3IjkEEQTYcUpZ23IAxgQBCUMDuVHgqQUAr7DCvQyzQ6A4jR1sm9g0gOMAJEpEpIWq30o07QHLqAe3LJwrmid7s6+dTx27mM4UDMOyAUAAQIwxdizbqcgiVxuRgh5uyd76GINSxTrdlz03mFvR6MsN6iLCHRtDm9t8jTFpNYra54cQlHiqvU5pq5NfPDnrOOD8cG45gTtNoaa4tKZWVkSKWmoEwuVyuVwul8vleke4gbvL5XK5XNc5PNr7yGv79Ypx34Ydn+7elVC88y72p3+1fzrtzGZyJ0+c+vKntzY2JLvaryyZiIi/enfzkZODLxw4s7k9dM+eEACgvdHT3njbIu+7b+jcdDb9g9MHx3MzObPEC0JLILk11uTh5fXR+t2x5lU/0hV5cO0OAIDl2D/qOzqWmpoqZg+N9qXz+f29p44OXNyQbLirtbPZG+sM1dy87u4t8d1b4k8fGHzk8YP9QzN7tjUsHrgXikZv38zY2Hi5XOI4NpGMN9aHFem6Jrlf2Hk3xVDffulnX3/+3zGAdzevQ29dOvjuZlpY0y1rJQ27OYbwK4xPZQSOXOnMvYuDEMg81ZyUfArTUa/YDsYYEAjyHOmR6IDCLO9jglG/0JRQ0wW9UK7YACBEQUgCCBwHVgxndEYzrdm+sWLUP1MbEeqjYkNclHmSJBZKYCFgZSK5ESMKY8dJj9ulOcsCsKITxSmgZR28nIT8dRgDS4flWVzO2QawbYARTXgjZHQN2bAdBRoW2ZbjYMNyxme1y6PFoaniyHR5MlWZSlXyJdOyMQAIY4yBjR0LOybAdtjLdTX5vPI8HZ9vMDJdOtOXHZ/Tipp1a3Olhn1cZ72yaY1vY6snqLJvw88ThAAC2JyQPro7HjzLnOjNjEyXCuUFY/eQh62PijvW+rua1HknAHC5XC6Xy+Vyud4N3D9VXS6Xy+V6w4Wp0Z+fOlSq6Pet2/5Q9wcWStsBAONzqbauDzx0V+I7333+T77+i7Vrmz/20c7GhvDaRgEA0FDj+/Btrf/22OGDLx5b17IrFllsArh9fafHs7P/dPbliUIaQ0ug2PWBtjvrOpqCsTvq21f/IN8EEhEPNW8FAOR17WeXTl2aHn15sn8iP7tv9PSL0z2bQ433NG7eGG9o8szTZOZDe+pqEkpjUqGpxdL2uVTxqZ+fevzJV/v7+xxscxzd0Fj/0ft23bW33e8Tr13ys5v22rbzNwd/+o39TzIEvbfx3XWu3jaW7eiG46wkcGdpwq8yqkixS83DeQs4hogH+Hhg6dn8FgIhiAWF1hr10khmNqPZjuEAjBCAgHAAdGw8m9Vns5WewTzHoLX16romtdrKRhUpjiHmPShI8zDUQiIEzLKJgV3J246NdAOV5mAlCxwTQArA5VRMY+CYwCzBcsrWCqaJbUABViLDzWTNBiKxHrLz/7A7GJcrdrFsZQrGucHc4XOp80P5wclide9eP3CIgYMdy3F0BByKhPGAsLbB65GWCNwxACNT5TN9uel0RTPsZRzFdQgEBY5siIq3dYfWNigNMXHpdVZPLMCFfSyAACEIIZiY0zTdtmxcnfQVQUAgSFMES6PmhLyuSe1u8TS+vXvocrlcLpfL5XKtiBu4u1wul8t1xeXU1N+/8vSx0YF71m//dPeuWsW3yMJNTc2jw0PNjev+8HfveeWVY8+8NPIn33xxw/rGu3eEu9Ykmmu5T9y7ppBNYcc0zQXzr30DPWPF9A/OHBhKT9kWUDihNdawI9i0NtG8K9b4FhziqpEZ7sHObVl93YbxyyNzkxfnRl8a7jk8fOnk5PD2ePPu2jXbk2vq1Rtj97aGBQcwqrI57d+fPP63f/9YsVjYub1j8+Zm0zSOHu/9znef8nmpu++4sfH9b2y987WpkaN9F77x3GOYAHfUvR8zdweDaiH58hEE5Bi0urXtq6s2LBqGffzS3FRayxd1xzFt7CBEQkhBWJ3AEwKAdcPpHS3MZCpHL6Qb41I1fG+ICQv1rIFyhGy+HTsO0DJOKWUZGlGpoEoBahnAKoBabBLjK7CDtRwoppxK0dF108BQUEh/HVm/lYithfT8W8AAGJbTM5A73ZftGciOz2mZvJEvWwAACFF1AYxt7NiOY2LHwsDhWNKvcg1xZU2NunTbHwyGp8s9g7lC2Vz6EG4icOSmVu/WDv+6JjWgLl1Nv+oQhO11skei6iLC+aH8hcHcbE7Pl00AAEMRqkjXhvnmpLSmRmlOSEHPO7CHLpfL5XK5XC7X8rmB+3vB7OTl1dqUbS14n5aaHiwVUqv1Ri7XLyNfsA69v+dmfG/rnZ3421d+/urQpd1NnZ9Z/4G6RdN2AMBXPrXpwS/8zb5XN37toeSGjl3x+oH/+pfPPn/wzKmTF3Z0137insadWxu+9NkdWsWsTc4z4erxiYETw5efGDw1UJgpGSWVF7/UsVdAdEs8uS3adMtHcaF3amhoZO+ebpp+O65VleHuq+8E9Z0j2bktoYajk30vjJzb13/i2FTvoeGLG6NNexu7ksoSU0depVXs/S/1P/zw4+Wy9rEH7vr8Z/asaQkBAE6dGfqzb/zLkz852FQfbqiP3rDW5zbvNWzn0IWTf3XgSY6id8Rv/ey9f2CMHQzArfQdeZvIAh0Pie11nlSucn4wVTFsgB0HYAQxQBQABIAIYGBjkCmYmYIxOFmazeqZvJErGTNZOeLjvDItcSS6fsJPyIiQEcloO9Cy1vApJz/mWBY0NKjnAcUuL3DHwCiCStbRK7aFHUySvlqyZgMKNUMpePPiumEXytZ0pjI+q526nD07kL00UiiUzder2iHGGACMgYMdG2MTOzbGNgDAIzFdjf6muOJT2MX3SNPtQtkanSmPzpQ1fcXl7apI1YSFjWu865s8ET/HvLk5jW8NhMCvMCJHShzpV5iQh53L6fmyCQGgKaQKdDLEN8bFRIgPepY4Gy6Xy+V6i2RTY6ahvdN74XK9kwyjvNB/ZedGsbPiP8PmJSlBlldWtApe+M96uKJpilyrx02O3gsO/Oz/vg3vcnj/P78N7+JyvZvd++D/4oR5klPXe8BQauYfX3725b7zW+taf3PL3kbvjaXZx05NQsS3t0gscyWNunO7vy7m2f/i4a89lDRMq+fcsFcU2tvWGFrqyJFjMZ+5c2tDMjZ/QfdPe4/98MzL52fG8romMOymSPP9Td2f7tx9a13ID7x8plzGO7Y0Kwp3oXdG4MjDx/p2bm1GCD3z3FkIYE1tpLVpifGDNymp+n99w21bU61bki2vjvW+OHT+6YEzB8cvn5kb217XfltyjZ8VltzI9Ez2B488Nz0z/cADd3/pN+5srL9y9tZ11u7+QPc/fe/nPRcGbw7ct0Vr4bY7ynblVG/PP7767I5PvO8C92rPjRVdO5aNy5plvImpNd8GIkdubguWNHNgPFcxbAAAdiwHOhDbEFEQURAiCNCVGwyMp1KVdN44O5hLBLg7N0U2tHga4iKD5jkvKNRC0byTm3UKk7ZtQ9NEeglyS8/YWX0jaJYdvWgZlo0RIBki1km13A65+e+L8iXr8ljhxZMzL52ZzZesUsUyLAcAWO3zDgHAjo2xhbHlYBs7FoSw+lmGfcLtG+NNiaV/6WQKRv94cXy2nC0at9C9PRESNrR4N7Z4G+Mi/Y5OQ8pQRDzIB71sd4vHsrFlO6A6wS8BKRLRFKIW7NHvcrlcrrfcyUOPzk31v9N74XK9S5089OhqbWrDzgfrW3esaJVFUvVFsnjXW8oN3F0ul8v1fjdVzP/ryVf3nz+zub7pKzvubgsnbl7msSePzKXhf//Pt13bjX3Pjq4nnj/2d4/0Dw8Mn+yZ+qOvbGtpbjTN8tBAKBnzzPteh8f7D41c+NnlYwO5GQqSa2K1D7ZsaQkl14eSt5a2X+yfdhzo9QhHTgyQFN3cEGxpCj78z/u2bW564qdH41GfZTlneybf6sC9qtEXafRFNkQafaLvhdFz47mZn1w+emp6pH96/HPr94TEJSo1MpnM4aNHN2xc8+XffCNtryIpKl8ul7TKvCtujdb93s57/qSYP9Z34VsvP/NbO+9etUP6ZUASiKEJYr5keSGabk+lK1PpylxWl3iSeQs6ub95DEXUhMWuJt/4XPn8YHpoMg8AAABjbGMHQOxASEBIQIgAhABA08ambemmoxs2Rc1MpbWWpNRaIzclpBtODWREoETIxFrbLjupPsfQiUoGWIFl7RZ2gFkGesmxbCgF6UArEWyEvAeg684hxiBfNi8M5S+N5HtHChdH8uNzmmVj540xDgywUw3ZMbYxdq4+cSBwVHNC2doRakkoy5kuNZ03zg/m53K6vZI+/gAAmkIcTXQ2qDs7A9F3qLb9WhACikQUiQQWYHzl/hACsLLRJNdqMC3HMB3LxhACmkIkgUjC/RRWB8YAAFzNRtxz6nK5XC7Xe9X/BwAA///snXecHVd598+ZPnPn9r69r3ZX0u6qS1axXORuMMUYbLCxwSSQ0BICIQkB3gQCCbwh5IXYmOQ1zQb7NeAmN9lWl1Z1u7Zry91ye59+zvvHlWRptVrt2rIt5Pn+oY925pwz59w7c2fmd57ze0zB3cTExMTkPU00n328/cD2riONReV/sfnmpcGyOYtpOt51oOOJFyoeuLPRajl197zvrpbfvXTooV+3FbmZf/jC5s1rC3WtLUtWztnICwPHftO1t31yKJ3PlroDdy/b1Fxa0+otYxdpVTQxmRoYnK6q8JSXue0iV7KqThTYgeEZXcfVFV6aIq7Z3PT0s/vKyopXr6hSVGPqhUFFMdq7I0iX162pWNSx3gT13qJP8Vs3Vyx5YeDI64PHp+KTT2QSkXR8TVXTLdXNInNBAVHXdUPXly+vbVxyThh7aFrp6p02DINjmQvVXV9U9XfXffhvn/7FT3c9J1j4e1u3XMohXd4wNCFwJLkYOUxSDEkxxmfyYzP58oDA0ORlKGnSFOF38UurXKqOMcZTsbxuYIQwxghghIEGCRJCiiAYCEgIiYKKpRs4kVH3dUb6xlLVxdab1wWLvTxDERR51pQWQUHORpc1E1hVUlNIlYGUAPrc0znngYGaw0oWGYhwFTONW6C7ApD0WbsBxlhR0VRM2nFkpq0nNjKV0/SC0A5BITMqxgAjhHSMNYx0jE/thZCgSOixcxuXB69aHigNCOy8GYYLhysI7vG0uqiPFwAgsJTXwbbUONY1uS+3EwCaauQ7DsYAYWwYWDdwVtJzki6rBoRA5GmBI3mWpEh4znW0eAyENR1BACEBKAISBDxzRJKAFHlmgceVSWGkuoEwxiRJUBQ0F22YmJiYmJhcqZiCu4mJiYnJe5qpROzpg7uLbLav3HDH0qK51XYAwCfvWT80lf3lH/aVVhbdepWbpSEAoLHOWV5WFInlbtm2dfPawDxHOTA5+Pp4777hroGZcYagV1U03L1s0/VVyy0XVp/nYXRs5sRARFHZE32JmfDUlk1LxDJvbdUbNjiN9cXI0JY2VgAAkGEMjQztawNFAV/b4bimDm7a+LanYy0VHaWio8buuaWq+RdHXz08Ofhc34FDE/1DkYm/XHuTlZ3bKZtlGb/XLUuzvRH3t/Xs3n28qqysuGi+D3lTWd23brrry0/97OHdz5IEvKd58yUbz+UNxxB2C00v3gykczhFEHDb2sDyaoeFoy7PCFanjW2pdamaQZFE+2BsfCbzhiCHEcYawhhCEhIkgCSEJAAAAogxzkrGyGT2hYPT42FpU7OnqdLOM2dNSxAUsBUBZwXgbAAjIMUXKrhjDLQc0POApKDFDd01kD/H9UVRjayk726PHOyJnRjNzMRlw8AAQAghBgBgjJCOsQHwG4HtZ0YEIWip9axu8K5t8pUHRepiYhxCWNVxNKUMTWbTuUWnSy328huXeUp8whUscZosHEkxpqJSz2j6WH8iJ+mKigwDQwgokrAKlF2k1zS5myptIk+9iV+bAuMz+T3tUZKEHjvbWGnzOtlkRusbTbf1xJuqbC21TrtI8+zluODmkjAwkWkfSI5N51Ud1ZRaG8qtjZX2y/OH18TExMTExOQtYgruJiYmJibvXULJ+MM7X5Ck/IY1V82jtgMAGuv9192w5vs/+vWjT7y6tfV21s4BACAEV61b+ZtfPUUZ86WQ2jXc+/Dx146Fh+VctszmuXflNavL6qocfp6i56k1D/W1weIiD8tyiqyWlHBOp3h+mYLaDgBgGOrWG5fZrKLfa9c1PDQSnr/x13d3hEKx669p9fneasaCcru33O4tsroeOfrqvvHuUC76y+4do6mZDTUr765fRRGzJRuH3dbYUHv4SNeBw6PrVpUXNr62s/uhh/6Qy+YffODGxvpSAMCJ/tjOV/ffdtu6ouLZ6Vivrmr8/u33fuXph3998BWvxX1DTdNbHMKfBBaOctuZN+EHMhbOZWXdaWMICIs8vFOkRYEmCLgYc5q3HQtHWThR1zFDkRhjhFAspSiacSrXKMYAaBgYEFEQYkAACAoOM0BRUURVspIxOp0jCUgRsCIo2kX6lLwFCcA7gTVA2AIQKUDNAWOBgjUGSIMAExYXtPqh6APEqcdphLBu4KmYPBTKvn4sfKA7lpcN3UCFwHYMCjMEBsY6RjrGOgAYYwBPAewi63Vwa5t8G5cHakrtDvGC6znOoBk4k9eiKWUqJqn6Ihz5CQIyFFHqE9Y1eQJuMw3pex2MQTqnTcWkzqFUW09sT0eUJCBLkxQBMcCqjiEAJAlVHWEMaopFt52hqTcT6h5OKDuPRSgKVhVb/C7WaWOSWfXEaPrFA1MGwuVBC8+RV6TgrulIUowTo5kdh8PjM3mCACQBg24OYwzMlRwmJiYmJiZXIqbgbmJiYmLyHiWSy/zv15/b09e9bcWajzSvO7/A0c6Z4bHcuhX+kqAFAPDBayv6B7c+s33nv/+P5+t/vpljKQDA/e8ve+KXmdGhLgAq5zzKrpHeH+5+pjsaImjyM2tuurGmudLlv1CI9wLxuK0dXUcddnFFSx0Ab8jiB9v64/GMwPO6odEMvXljIwCAJImCTh2LZ3sHBrduWjarteOdg3sPdK5f07Siua77RNjlcpWVeEfGMrwgWEXm57942QDwvruuZpg3+cxQ5yn+y3U3f2z5xm/s+k1HZHTHeHfn5GQ8lvzixutnWUb4/Y5PfuK67//7Y//8/f++/prNdpvz5PDYjlf3TIVTn7r/ljvvWG8VuZ6++H//3+e3P/fy4WMD/+tb9wUC53jlk5DYUNm4sn754faOp9v2vEcEd4eVKfYKArfoL0jTcDylPL9/smck1VLrbK5xLK9x8Cz57mbOnJOgh7fwlFWgijyWl9omQpGsfipsHABQELJVDA0CG4CgAKAAJCAAGANFM+Jp/GLb1GRU+uCWkiXlNpv4hlIIOZEMNEA5BsBi8sdCCvBOMuCBrrKzxTJVR8mMtr8z+sfdoam4nJcLWT8Lse0F6/mCh4xx+nCn+k9AyNBkS63npnVldaW2Ur8ocAvSHBXVmI7JsZSqaMai0qWyNOFxcBVBS0OF7YrUN00WhW6g3tH04d74/q7YdFQiAKwvs9WVWkWBNBCOJtXBiWzvydTLB2dGQrkPbC1pqXV47OyibKwKSIoxGZUYCtottKwihLCsGjnJyOT1vKyrGkKLzEPwp0I6pw1P5jqHkj0jKYfIVBVbGittJV6euKymN01MTExMTEwuHabgbmJiYmLyXiStyA8f27Ojv3Npbe0Xtt4StM6O5m4fSPznLw4ePT5dXelf1lR2/4fry4qEv/nU2lxc/eP2rprahrtvCpAELC/iPvLhzZ++a82cR3ll8Pi3djwWkjNBm+fupRvvatng4ueIRl8g/YOT+w8NECTLcUIsnlnV/Eaf9x7oV1RUV+WtrPCRJIkwJgj46C923PuJa8+U0Q00OZNvOxqKRKcqyz2b1jcUtkejab/HNT2T+e1TR0LTiW1bG6oqgy+/9trIWBwjbd2ahld3ncCL0fLOp9TmLrW5f3Dd/d/f92zbRP+UFH28//VpJfy9a+85uxjLUFetX/I56X3/9p9PPPTIb9W8Ieclp8v2F392+z0f2+p2ie1dkZ889MyLL+y2OvwHjk187Zu/+td/+oTXc04uVgvNfHHtrX8fSh8aH/nZkd2fXrnprfT8TwK7SJd4BYeVYRlS09DChVeEsaLhUETK5nVJMSJJZXQm77YxDpG2W2hRoC0cybMUyxDEu22szLMUS5ONlU6WIQkC9ozEh0LpVE7NSfqp2HGMITAQxhBgCBGEFIAEABAhoGAUikgYYZ+D0QzUWuc84y0DGQvhrYQ5K9azkBYW1BVIYM4B7SUELUJ7sBBNjzHQDTQVk4/2xQ/0xE6MpXX0Rn5UjBHGBsI6KJjJgDNfECRJ6BCZoEeoLravafCtWuJ12hiRX+jzuawakzEpnl50ulQLR1UXiWV+i02kTcHvPU5O1mMptX0gebQvkcyoQQ9fV2atKRHLAxaBJQ2Mk1mt1CcE3VzPSKp7JBVwcyQBNyxzC4vMPgIAMBCWFN0wCEU1CictQkBHWDOQjjDCb/FWc/miaCickKNJJZPXW+qca5vcNSVWt519S474JiYmJiYmJpcxpuBuYmJiYvJeJCPnn2vbWyTav3vb3UU25/kFOruHTgyE7a7qUEzt/P2BvXv215YH/v6vrvv2VzZ++C9S//Xojo9c/1GSIWmK/NKnr/a4Zkt1ffGpR9pe2T/SGcOSz2a/u3HDPc2bbNxbCmyPJzI0Ba+7uunw8RFnpaepoaSwfftL+8vLioqCXqvIkWeZPt94w8rfPL43mY599sHbAQBup7hta0Nvf/iGa5dPhKKvvN5x3dXLAQAcxweDwrKmMkVBhmHY7TwA4AO3r3zptcE1K8qrKtz7D568JGvea13Bb2/58A+PvPJi996IEtved1CJ5//9ww+eXYbnmG1bW5c2lPf0Tu3ZO7ykznfV+iq/32W3CweOTfzHT/6467VDS+qbvvpXt/WNyf/104e+9Z1ffueb99tsb3z+BCSavCVfv/GDn/vdzx/d/ZLHarujrvmtd/5yxiHSpX7eY2dFnkoZKjIW3UI6r3UMJbtHUgQBS31CRcBSWypWBMQSL+91ch4HS5HgXU+rShDQ6+ScVrahwtnWHf79rpG+sWRO0s5kIgUAY6xjw4CQgARDEDQkqMJeHeHphPzcgUlZM6qKLJSdJUkSAABpjnSWYt6G5TRgbQsaISSBxQcojuTsQHAWBHeEsaQYQxOZJ18fH5nMqjoCEJ7W4g2MdIw0hDQATpm5n24LMxRZ5hevWh64fVNFwCWwNLGomQ1JMUKRfGzx6VKtAtVQbiv18abaZ5LMaIMT2SMnEv1jmaoicetK3x1Xl/Bs4WZSOIfx6gZXNqf9+MnB5/dNvnpkBgDQUud4E6tqzoeAl5eH1duEpqOcpCsaokm4os5xzSq/00qzl2W2ahMTExMTE5NLgim4X+HwFodo8y68fDxy0tDn9jB1+SpIchF2w6n4pKrkzt/OsBa7q2jh7QAAculoPpeYc5fF6hHEOZQyE5O3A2LxwVwmlydJKffF3z+Sy2VvaV1XYnfNWea2a5u6OsId/epXHmwZmq595oU9L+7tPNIbL6towkxJaLzna9/b8b//YRuE4Hy1vTM89q1dT3RMDmOEmrzl96669rqKpW/RRgYA0LyskqK4yen01RuXQAh47pTF88b1zRzH0PTs89Pvd1x37dKv//0PAbgdAEBRRE2Vt6TIkUopxztTOUmeiXataC4BmBgZTZaXGSVF1jN1vR7b7Tc1CTz9+q6RbEZ5iz0/Q9Dq+Nt1N/1Fy5YH/99PRhOTe+J9d/3me49/7Ktnl+F5troyWFrs27ihgWMpnqcBALsPnPzBj5460NYhWvjPf+6aLZtq16uYhh/7t+/9K8To+9/5DM+/kX6WIohVZVU/uOOeLzz58MvdbVe84E5AyNJkuV+oCFj6xoyspC+2BYyBbmDdwACA6bgsKcZMQu4aTtsslMjTokA5RMYh0iJPWQXKJtBWC20VKIGjGPod1coICGkKWgW6odJBEJUD46n+8VTXcHwymtcNhDGAkDg1IKwhhCA2IKQgJAGEhgFSWe3EaOb5/VPrmtzLqh0AAEDSmHcAmoe8E7LWeQ9+phMktHgwZwMUByiuoEjmZeNgT2xPR2QqJuUVBCGBMQDgbMd2A0JweuIK0xTBMmRDhaup0lVTYq0ttfscPMcsWn1TdRRPq9n84r5xCIGFoyqCFp/TdG+fA8PAmZw2Mpnb1xWlCKKwZGThkdcYYwMBhoI8RwbdvMvG8Ax5OTuHTITzbT2x6Zgk8tS6pe6WOofIz0qhDEUIGYpYWmWfjkuhsJST9Wxetwp0IXWEpBjTMXl4Mts3llE1hDEmCehxsEvKbcVe3u96M6cZQthA+MRoZnAiG07IeVknIPS7uTK/UF0szmoTY6BqKJyQe0bSUzEpkVGtAu1xsA0VNgtHRpIKS5N2kXKIjOWs5SNjM/mhUHZ8Oh9LKxgDh5X2u7j6MltF0EIubOZL1VAyq46Ect0jqbxsqDqCEDitTG2ptSwglPoEAICioamodHwgsft4dGQypxn4UG8cA9BYaSsPWAIu7nI+N0xMZuFwl5y+z5qYvL1gZERnhi+01xusXVRrqpxLJSbn3OX2VxHEIrz1krEJTZ07d5fDXUIzC33d0zUlER1b+HEvCgYXfFKBZrKQdwlTPLrCKaloaVn/oYWX3/7Et7KpyJy71m39pMXqXnhTe196aHKs8/ztnkD1Vdc/eP72eeg89McT7S/PuaumcVPdsmvn3GViYmIyJ5Ku/t3O33VNDm1tWP35q667UDG7lV+9ouHgkdf++CL7lw+suvvmO/+4M7H9lb6O7j7FIFUl99quQwBsO79i5+TJrz336IieoDjmA9Wrv7T+NpHl2UsxW8NzjM0mdvSEBIGqq/af2W61XtAKw+uxff+7Xz7zJ0US8Xj2uRdP+II1tKQEg1Qmkxk8mV3VWhXwWwAAHT2hA4d7ZFkReEHkhZu2NW9YXzY0NPFP//KHb/79B378sx11tcU3X9v4Vkbh4iwuzvLru750969+0JMaySD5wacfevj2z8wqxjAkc/qZdee+4e/+2+/a20+UFBfl8skXXm1vWV5ZVuL6xEfWTY3f2d7eYxizDbhpkqzxBxsrq/ac7PnRoRe/sPqGt9Lnyx+GIiqClpoScWwml5P1t2LLkM5p6Zw2Hs4X/iQISJEw4Ob9Ttbr4HwO1u/kfE7O62RddsbKUzRFUCRBkZCmiAWqVPOAMcAYYwyICzQFIaBIWOYXy/xifbnjxGgSQogwSGcVSTVUDZ3OTmoAiABEAGJIQoAJBKCs4pGpnKZP2yx0VbHI0iRFUoARASNCjMECuw4JwDsgABicCgBWNBRNKQe6Y2098URG03R8OtzeQEg9V22HJAEZmnCIjNvBbWoObmktLvHyNstFAhoKPkEEhLPemVQNxdNqZjFTLBACmiSsFrrUx7tt7MUrvPfQDZzKaUOhLE1CAIBhAAzwPO+xZ4MxQAgYBuY50iHSDRW2yqDodbAWjmSZy9ErH2MQikhHTySSWa3Yy69c4qwvs5HnScAkCXmSbKy0SYre1hMXOErVka4jhiYU1Ygmla7h1IHu2K72iKYhgAGEoNQnbFmhrqh3WjiKZQh6MZkhEAZZyUhm1EO98T3t0dHpXDqnERBWl4jLa+wYA44hLadnBRDGmo7DCbl7JP3igen+8XQ4rrjtTHnQoqiGw8oMh7JOK1NZZKFJoiC4qxrKyXrPyfTe9kjnUGoinAcA+JxcZbFFVpHAUQ6R5tmLTIBpOkpm1cGJ7P7O6MttMzlJV3WEEA56+HVL3Wsa3TaB5llS1YxQJN89kj7UG0/nNAjB0b5ELK0aBuYY0ufkTPHS5E+I1vUffre7YPJeQVXyf/zl38y5i+XEq2/5wqJamxzt3PvyQ3Pu2rjtMwxrWXhTrz/3o8jUwJy7Wjfc6fFXLbCdZDz08lPfXfhxL8o8qvoCn2FMLjmm4G5iYmJi8t5C143dx49UewL/dvvHBWY+vem2G8r7h+sf+3+HPnpb2fL6mo/fwn9km1/Xjf/147Y9+yOf+uQcbx3d02Off/aRmJYDsnbPqmu/tOFWnmYuYecz2WwikTIM3zxlHn9yTzKZ/tR9N1AUCSF0uc6xOMcAeD3csgb+qWdHGILefHtrc1OQosiBweme3rHly8o+cecWXJAGIXzs8Zfe/74t9358g24gkiRomr9uU/0lGYjHYnvyvq/d+8f/6AuPvdJ/6FN/NB5532fnLPniS0f/6Tu/7Ogfv/V9N//VZ2/eu7/9pz/5xUff31pW4uI5+qt/faeu6RbLHBGUxTbXVzbf9oWnfvbE/tdK7N4P1q24JD2/PKEpoq7UmsxoxweS6byuqIu3lbkAGGPdALGkkstroYjE0gTHkBxDcixpFSinlfE5uCIPX+Lli7y818mRxJs3iEAY6wZWVSRrhshT3MUESo+dW17t8jq4/nHfod5I70iifzx52mGm0HkDA4ANRBAMABSEMCcbY+F8x1DS5+QaK2x+F/eGrr/wuYKzgtUBAMOh7LH+RP94JpJSDAMACDBGp6V2HQB8+hAQAGy1MA3lzpZa98olnmKv6HXyF81ZijHIyYZuIJ4lC7MaZ3apGo6l1UWtaSiEHhe5ObtIs4yp9c2BYeCspI9O5+JpBQC4KFtxDADAAGFcmII6fCJe4hNaah3LqhxNlfbLzT8EYWAYOJFRQxGJYwifk7VaaJa+oK94ZdBiF+nltQ6eJYNujmVIw8B9Y5nj/Yn9XbFIQvHYmYCLc4rMeFjK5LXXjoRn4nIyozZW2ssDC5UzDIRVDR3tTzy/b2p0KpfIqEE3Vxm0KBrKy/qe49FIUhmezF270lfk5QEAsoIiSfnp3ZMHumLTMYljyeY6h6wayaz6/P4phHAmrzdW2qwWKuA+NYl7ciq340i4ezg1HMqKPNVUZadIIitpJ06m01m992T6lg1FjRU25sIfhYHwZFTqHk7tOBwenc5BCOsrbF4HOxOT0zmtrSceS6kzcXl1gyvo4eG5IcEYA1P6MDExMTExueIxBXcTExMTk/cQmmHc+sgPoI43Na08X23v6J549LE9FGP72Ic3NDc4GJr4ymfXnxyd+tq3X/ivH3xgxfIihqYAoP7lq1chtJ4iZ8tkg7Hpzzz98IySFEn2zuar/2bT+6jFLFGch5Oj4e0vd9TVFm/dtKR5aen54YdnePyJAxzvDgSdP31k+1/+2a3nFygrcWUy8mNPHsCA/sMzBxU5de/HrjlybOCZ53Zu3dJaXRU4O674nrtv3LWv56q1SywC+9V/+M0//+Nd1GKiFOfHyvK/vOOLn3rmoeNjJ/aPd9/92+//+iNzRLKMjo6NTYZuun3bV77wvuZ61/LG62OR8P0P/tMXPv/Ze+/eZLUygJt7SoOAsLWo6js33v353/7XkcGeK1twJwnoc3JVxZbaUjGv6BMz+Uul5xRCznOynpPP2Q4hYBnSJtABJ1fs5Ut8QolPKPJwNoG2i7RdZHiWLNhNLPJ4IJ3XpqKSz8m5bAzLkOdaW5yDwFECRwXcQtBjETjaITKiQE/HpXhKVnWEEMIYA2wAiDCAgAAAUKqOVc3oG8tYedppZVw2hiIJCBejtgNwRmw3ENZ0NDCeOdATGw/nc5IBIMQYYaxjpGGsY4whBAAQNEVwDOl38VVFtpZaT2udu7XeM8+FfAZFNfKyEU4qCOEiL0+fTtKAMTAMLClGKqvl5cUJ7i4b43VwAkvN89m+l0EYqxpWNTWRWbQ5/vmMzuTTOU3TsShQbhtrFS6jly+EsKIZWUlP5zWnzeKxswJ7Kp/wnDhtjNPGVBWLAAAIgG7gnKR3j6QO9cYno5JdpBsrbWV+i9vKnJzOD05kek+m+8cymo6sAl3sFeY/4SEAEEAIQU7WR6fyR07Edx0L+11cfZm1tsxqs9CKYoxO54ZC2eFQTlZQVZHFwlNWCzUTlzuHkge7Y0OhbGGhT02pmMpq4YQyHMpORqRERnXbGEk2DANpOoqn1Z6T6d3HI6qGvE62psQacHM0BWdicv9YdjImRdqVMr9gF+liL3+hHzFNR32jmQPd8Z6RNMcQLXWO2lJr0M1Nx6SRyVzPyfTYTD6T1102xmljrDwV9PDlAWEiLKXzWqlfaKiwFXl5q0BfbnMwJiYmJiYmJpeKy+iZz8TExMTE5O3mSweeDqWnN5XUfPWq28/fm0pLx9tDHR1H//BM1/rNq/7i/lWrmmwf+MgdncOP/p9fdH7zrxylQQEAQFMEALNfwsfTsfueeXhCTjhZ/raalX9/7aVcdctyvM3m1HVEEJC48ILBZ7d33nxDi81WCPdu+t4Pf/fVL985qwyEcGlj8dLG4n1tg0cO752emQIArGytXdl6ygzx4JGpV1/b73HbP/C+tW6XeM3mZYXtFENeQrW9gIVmf377n/31jt/sOXH4YHj4ul/8430rt93TdNXZZR789Psf/PT7z/xJkfCbf/dxTclzLIXxbCeZWRAQFrl9y2qXPN17yOf2fHHtjZe2/5cPEAKGIvxO7qqlXlVFobC0qLDcNwHGQFVRXFczeW10JkfTBEsTVoGuKbI2VNhaah2lPsHrXJxjScGiPZFRjw8mKoNimV8IunmKv/jDqtvGbm4OLClzbGrOb98/trdzOplRZBVBSACAC/HmECCCABBQEBInp/OajpqqbJVBi4WHb1p3VlSUzmk9o+lDvfG8gk6p7UhDSAG44Cl/yrRdYKmAR7h5fdnaJl/QLdhFZoHGzcmsForkR2fyhch0QjhVC2MsqUZW0rJ5bVELGggC2i20w0rPo6uaXEJSWfVIX1zTEUZgTaOrocL2bvfoDXQd5SRd1RABod1CO20MRV78R/7MeSMpRiShdA6kBsazNaXimkb31hU+kadIEq5sQEMT2ZfapntH0juPRRor7S11zvnXrEAACtdENKnsODxzpDeek/WtK33v31zMsyRFQoTBdEwemcw+s2fy5FS2cygl8lRjpe3EaHr7gelQVCrx8Q/cVrmk3CZwpIFwIqPtaY+29cSO9iUghCQJIYRZST8+kDx8Ij46ldvc6r1tY7HfxdotNIQgrxjpnP6rF06+diR85ERCYEmn1c/OtUYNY6yqqK0ntrcjKnDkuqWeO68ttVoomiI0HU2EpZLu2JG+xPH+xNIqW1WRJejhVxFQVtG+zmj3cGrLCt/1q/0+JyvytGngbmJiYmJicqViCu4mJiYmJu8VFF3bc3SvV7T8z31fmrPApvW1O575q1d2zvz4Z/t2vrZn597dazas/esH1r3/1o2/fWLnzx4f+sInG9yO2bdODMBkOv7AE/81Eg353e4bSxu/fe1HL23Pg37r3XeubDs89N0fPnfd1mWrW8vmLOZyOUmKfPKPXbKi3fXB5mXLluu6QVGzNY7R8cQfnuuYCIVXr2699Zb1Z7YjhF5+9UQqTd579w3BgPDk7/dcc3WL23UqkyRDk9/94dOlxd67Prjm/DbfNALF/MvVH/k6xK/0HhqcCT3ZtZei6bvq1sxf65+/Pdvz/ULUuPyf23Djl//wyB/bdtU5gzdfuQlUIQR2C91UaY+n1YlIfiomX5L43HlAGCMD6waQFAOcEv2VvGTE0spEJF/s5Ys8fGVQLPZwPLfQYGoIgW6gnKR1DyenotKWVp9lAYI7TRF2kWFo0mFlVc3wOrn+sdTIVHoinNN0o+DlgpGOACQIDAAtKUYkpQ5MZIu9Qn2pdSGa/pzE00rvaHp8Jp/O6RjggtqOkXZabQcAAKeVK/Vbakrs9WWO1jpPVbHVwtELl/iHJ3N72iMMDYq9/Ol4eQAAwAComiGrhmYUDN4XCgGhKNBWgV5IfL3JW0c3cCavD4WyAACPgykLCCw937qNdxIMgIEwwgAAwNAEx5DEYiZVExl1aDI7E5cRxnWl1sYKW9DNnfFq1w28vNoRS6kdQ8lwQpmJy4F5s6eSJKQpgoAwJxkDY5lkViv28GV+ocQnKJqBESBJWOTlOYZ47Wg4k9fHZvIVQUt9uTWSVIZCWY4hK4vEyiKx2MsXVGyRp5dW2+JppXs4hQFGCGCAJcXoH8uMTOYMhL0Otr7MSlOQJCHGgGNJr4MNuDmWIcbD+eHJ3EZt7jndnGyEE3I4oaia0VRlqy+3Fnt55nQsPAGhrBqhqJTJ66GINBbOu2ysVaCd1lO+8A6R9rs4q0AtytfexMTExMTE5E8LU3A3MTExMXmv8NHf/Gs+Gdu25iKZlq/b4r9uyx0v7Vz5P4/tP9bW/kD3dFXdUsR4n3/16MfvKHY7XGcXxgBMZxIP/OEnw4lJj2i/saz5O9s+8jb1f0VLBSQITdPm3Ktpxvo1xRDCnu4OVQcYLbv5+iU/f/SVB+6dnRg2Ho9hI/KPX72NIAmWeSNbY9uhoYoyZzSOH/31ax/54GqLYCfPssT5x699SJY1TTd+8dgL93/8lks4LhvLf2vTh0lIvd7f3hWZeLn70G0Vyy3MfNLMolhXWvuNrR/+xrO/7BofuraqkaUukqDyTxcLT9WWillJiyTltt5YMqu+zWHu54AxUDQ0Fs6NhXP7u6NuO1vsFW5dH2SXe30EJDlqgeYJBMQUgTuGUroBGyrsRV7+gj7K58KzJM+S168pXt3g3d0+vfPYVDytZHIYAQwwxgABpCKASZJEiFBU3DeW8TnZUp+wEE1/TsIJ5VBPfDImYwAwxhjpp2PbMTwFCLr5LS1FVzUHVtZ7FtU4xgAh3Hsy/ey+qfVL7RVB/myFHGOg6kjRDAMtbjEDJICFI0WeMgX3d5LpuDwdl5dVO1rrnC4bPN+R7F0EFqLLCUCSC0p6XDjfIASxlNI/lknlNAtHNZTbKoOWs5dNWAWqodI2OJEBAMRSSigi2cX5fntJAtIUQRBAVoyJiKQbqL7c5rQyhoHTWV3VEccQDE14HBzHkKqGpmNSNKkYCKdzWjguL6u2VxVbLDx5JmacoYnqIjEUlliaQBhoCCEMZMUo+MwwNGGz0DaRyuT0dF5DBhA40mFl7BbabqGjSWUinNcuILhnclooKuVlw8JTTZX2yiLL2VeTVaDqy6wdA0kAwExCHpnK1ZZazYvNxMTExMTkvYYpuJuYmJiYvCcIZ1PdQwOrqxu+f8M9s3ZpOspkVV3XBJ4RLadMMLZtKdu2pWxXW/q3zxzv6u9JJuMWCzzfw2Q6m/z8C//TMzXstDpvrHq71HbDQLKit3ecPHhkePPGxjnLHDk2VFHu83nt3/j6xwpb0pl8RUXp+SUdDpuskF//5mMut+u2W1avXF5U2L5ube3+gye9HuErX7xZ1bTDR/oN9IZVRSyWfvaFbquNW4jarmo6AeHCA+HdvPj1De8DmNg11LFveuhr2//vP9/4CRsrLLD6RQk6PZW+oifb9wXd3o+3bLpUzV6elPqEbWsCJAkxABNhKZOfe4bm7SYn6aFI/oWDU/3jmfoya2OFvanKvhBXd6+TX1HvGQzlOodTT+8NxdLqVcs8ArcIgZLnyGXVLqtA15XZjvZFj/RF87KmagbGGCDDAApB0JpOjE7nAi5uXaPmEOnFhpoihFUNTcXkjuF0JKmczpKqnVHbBY4OuC1rG73Lql11ZfYiz0IzRp5qH+Ohieyu9sjejoiqqSU+S32ZQ+DeeG7HGOsGNgyw2DkVAkKeIXl2cbHMJpeEaEoZm8kX0g6/230BAACSgAJL0hREGGQlPZXVdH2+80lWjUxen4pKLENWBi2qhjJ5XdMRQxNWgbJwFDzL8YyAkKWJwpWlakiSDcOYr3GCgDQFz8yuJTJa32j6d6+O7+mISLJhIFxQ5CEBu4ZSBAE4lmQZonBEAkKbhXZaz7HEISBgGZJjCAghBIA4nagBY6DrSFKM14+GZxKyrBiajjHGhUQLJ0bTsZRKU5BnyQv5veRlI5ZSFdWgKcJpZWznWrETBOQYsjBwRUV5yTAMvBCvHhMTExMTE5MrCVNwNzExMTG58knIuTt//l2KYn79idlpORVVP3h8+ie/PDQ1Nnr3HasevG/j2Xs3r7FtXrMZgM3/8atdNk+R3+84e28kl/n8i784EurnBfb6qqXfu/Hut6n/sUT+9d39PE99+r5rmQtIluvW1G1/8Ujz8iqLhSUIQtf0J57a/eADN51fsqTY8/k/v7W9Y/Q/fvp00EecEdwBAOvXVuzc3WsR6I6u4a1XN5/xkwEAfPmrP330ka8usMPHO09aLFxTfcnCx+i32H607e6D42vuffI/d0ycsOx86m83f8DOXRrNvbm44q6Vm7/x/G9OhqcyimxlL1n4/GWIx8F6HGw6rysaIonE2Ew+K+kIvYOx7gAAAGTVkFUjllIGJjLj4Xw6r7MMEXDzdgtNEvMF0jpFlikjbSKdyin7uiK6gb0OtsTH2y00ScKFRLuzNFkRFP0uvr7cbrMwiopCkVwkmZcUTTcMgDCGUDfI6Zg8Op2PJBWPg3WIi5PDNB0nstpUTBqezEmKhoFxJksqx5ACxxR7LY2VrpvWly0pd9gti3Bq1g0sKUYiox7tTzy7bzKcyLMMLvLwpX6RZc7pJELYWPzXCkFBhVxYMLPJJSWV1aZjcpn/kk0lvkVIEnIsyTEkTcFMXo+nVE2fLzFGIqOOzeS7h9MuG1Ps5XWEVR0ZCBAQcizJMOdcnRACkoCFMx8hoBsXsT4iCHh2iL2mo3ROH5nMzsRlTUOGgTHAJElQFCQIWFUklgcEp41BGCMEIAQ8SwosdW4PAEVCkjy1rfAvBkA3kI4wwmAyJkmaoarIMDDAABKAgBBA4HOydpEu9goUNfc1ougoK+magUkCWjiSY0gwa+DkqYEbCOvGmTUo5hVnYmJiYmLyHsIU3E1MTExMrnx+fODFSCqxbcVVs7arGtp3ZOJffrxDVdSyYlcw6AYA5CQjmzOsFkrg35C3Pn/P5vOb/fZrv++fHmMI5ub61n/b9sm3r/8+j9i8NHD42MSegyGvm1m6xMeyc9zBb7ph5a49vYlUluctkfDMnGq7omg9/ZHQVI4m9aKiQFGRb1aBLZsaAADFRStnbV+1cmksnnW7xIv2Np/XOruHS0vcixLcC/itzi01za8NH3vlZJdbdDy46lo7wy+2kTmpLSlfu2TZi73Han3Fd7XMPhOuPJZW2Z0i7Xdyh3rjR/riOVl/t3oiKUbfeCaZVXtPpreu9F2zwi+w5IXmjQAANAVFnipys0EXE8toh3pj8bR6davv6lav1ULzCw4NZmjCZWU3twRrSuy7jk8d6gn3jyfTOQVjhJFuAKgBJpXVBkNZp5UuZE1cOHlFH57MTkQkVUO6oSNDw6di24HfJSypcG1qDrTUuv0uQeQpuBjzllRWG5nKvtw2c2wgMRHJO0WiMih4HQzHELMmGxACaJF+MgCcUiFpaoE+PSaXEkVFeVmfP9D7nYSAkKEIq4V22tlMTg9FJVk1Cks05iw/OJ7d3xXrGEzWlVk3NXtokiikMz3lBY/w2c4qCGFFQwUFn6EJniMvkqcXF5ZrnCrjtrM1JeKaJnddqTWZUSVFNxBgKIJlCIGlRIFyWmmRpzUNqxoCAOgG1hHC4I3PFmOg6UjTT6UvLsS5GwjnFQNj4HGwW1q9m1q8qawmKQbGuKD4izwlcBQBocNKizyFMD7/UiEJyFAEQRQOgXUDAfyGnI4QVlTjnIETEAAMwOXyvZuYmJiYmJi8A5iCu4mJiYnJFU4ol9zZ0WZhxR/cMttMJjSTfeR3XU63+wv3X7O+1SareHQyu/vAxMHj6fUrvDdeHXQ5LhgK3R0Zf33kaDaTu3Pllu9tm93yJae+tqi+tqi9a+JY56jAEw11gTmLbd7YcPq/czvPjE3EXnjleHFx+cBgaNt1azasKQ5NJRw2wXLaS+d8JqcSNM385Z/f8tB/v/qZ+6+Zv5/ZnPrarv7d+wbvuNV2aktWZlmaphekk1Y4PF9Yty2rZNpCfb/r2eWwix+pXWtbpOauGygSSQcD5yxHWOouur2mpWOor2tyJFbX7BYuPnPwJ43bxggsiQHgGJJjiZHJXCiSV3Wkv+Nin27gZEbNy/pMXKEpSBGwqdJe4hPOto84G4KANIRBN18esMQzqcloLpnVCQIaCFcXi6U+3mVjF2JNQxKQZMgij+BzcoaBWJrgWHIolJ6J5RA2AAIGJDOSNjKZLfXx9WW2RQ0qLxsnp3LTMUk3dIR0jHUAkCjQAZeluda9usG3ot5dVbS4NlNZLZKU+8ezXcPp/d2xsemsrCmVAXtDucNlYy+h5XrBcf5StWayWC6fjx5CACH0OtiaErF/NB1PKSency4763Oys65N3cCqjgZD2eMDyXBcLvUJCAOOIRwizdCErqNkRsvkdYeVPlNR0VA4IaeyGgDAKlBuG8vMa9yEMDYMfCYMniQgx5CVQcuqBmc6qykqQhiTJKRIIhyXJdUgCEgQgCAAhAAhnM5piYx29u+bgXAioyUymoEwLES4QwghYBmSpggD4YCLW7XEmZV0WUUYYwJCgoCpnJbN64XwfHiBmQeOIewizVBEUtdiaSWd04q8b9ykFA1Fkko6pwEAHCLtc7IsQ8y/dMDExMTExMTkysMU3E1MTExMrnB+evTVUCr+0XU3wPMWdGez+ZPjkY996Or1rba8jA90JH711OGjh/vTGbRjF51IrbznA8vt1jk0947p0Qe3P5wFSrUr8L3zTOHfJnJ5NZmSGIpk34L/L8fRVeWuJfVeUeStVm58Ir5zX8+K5oq1K2vnLD8TTv/mt/uCRcWbNpTqujx/49ms+uLL3b96/NWTY+M3XLO0sHFiMh7wOxz2hbooNHpLPrfmxvFXIpO52B869pRy9hurWxdYF2M8OpYYGh7f/sKhz3/u/WVl56SprAuWtlbWPd9/rNjtv6dl05VtLAMA4BiyodwWdPPLquw7Dk8/t38qlVN1w7h4zbcBTUdpQ9vXFR2ezH7ixkqHyNgsFHEBxwYAQcAtVBdbT4wmwppiYGJfV6xrOL211XvVcveKOhdLMws/NEkSLbXugFtw2/nd7VPxlKwUPJuRlpeU0elsOGGdJ6p3TiTFGJ3Oz8QlZOgYaRjpEAKvg9/cUrR+mX9No3chUwKzCEXy+7tjeztjXcNpWdU1TUWG4nMwTZUepzjHuQohgOf/qF0UDHQda7opub8LUCRkaPJyS1db5OFX1jtjSSWeVo4PJEWB9tgZ4txodEUz0jltOJQdmsh4HKzLzpAEtPCUz8nyDBmV9KmoHPUrdgsNTt+d8rI+MpWbjssAA6eVCXp4jp3vzmUYWNXRGfMrWTWiSUXVDI4mGQdx+nTFqo5fPDDVPZJeXmNfWmVvrLAzNGEgPJNQJqOSelaaU11HU1FpKippOoIQkBBAAGgKeh2swJHhuCyrBs9SLEOeuRYgAJ1Dqf1dMY4hakqtPicrzNVnkad8LpZnSVk1JiJSOKnUnRXdL8nG2Ew+mlQAAF4HV+638CxpCu4mJiYmJibvNUzB3cTExMTkSmYoHm7rbHfY3V+5+tZZgpqu46kZSZb0QKBYUvD+Y/Gf/frQ0PDYmlWN5WW+V/cc/d3zbc1Nno2rqma12R2d+PKzPw9JESvF37P2+ndsLIPDM6Pj8U3r6x02OpXK2xcsYZ9BVQ2e41a01Bw6Nr6ypYKmyKpy2+RULJuVAQCxRI5jqDOh7tFY1m7n+wcjFM0XF9m6e8cbG+ZIwXo2Q8Oxx3/7+v59x3mLoKmnhN0ldUXz1zqfErvnuprWZ/oODk2H9g31tPgqA1bHRWtNzUjDI+M/f3TX3r0HVDlDUtT3/vm+swss8QRvXNLaNTnySveRZn/5hoq6xXbsTwsIAUMTDpGmKbipxeeys6PTuZGp3MhUNpnVNO0dtXXHGGCMs5I+FZX3dkYhAFct93gd7JwyNwSg2GtZUu5o65mZjsmqoUoy0nR8bCCZkfThyfySMuuScqtVoPl5JbwzrbEM6XVwrXXugm/FidHE6HQGY0NWtZm4nMhoCGO4YMndQDgvGzNxOZFWENYxRjxL1pc7V9R5r1rurymxWbiFPmAbCGdy2mRUOjGa6RvL9I1nTk7nM3kVI40ikZWnS3xCbanVJtLn1yUJSBKLVtwRBrJqSIrxztv6mzisdMDNzfLif9cJuLnWOsdIKNsxZHQPpVQNpTJaeUAIuDmSJDQNpbLawESmazjVNZyiKWLlEldrnZNjCJeNqSmxehzMeDi/pyOiG4hlSLed4RgykpR7TqYP98bjabUiaPG5OKtAUXNbypw6Dw2ENR0hDGwi3Vrn6D2ZnopJXcMpn4urClqsFlrV0OBEtmMw2dYTT2bV5lp7IfdvqV9oqXPG0+rgeGZfZzSds5f6hVhKGZvOH+iKHR9ISoqBT/nVAAtHLa2yJzJqNKn0jWVebptuqLQF3TwAYCoq9Y1lDnRF+0YzTVV2y4WTpgoc5XNyRR5+PCz1jaZFnvI52SIPb7PQqazWN555/Uh4eCrnsrMlPr7UL/AsWQh4nz1mExMTExMTkysXU3A3MTExMbmS+cXhndOx2N2bb6CJ2bc8VUORuK4o+s7dHemY9aWdwyMjYzddu+rjH1pWW84wVPy5V7tUdQ7n6+/veWokP2khubuaNt3XOoe3+9uEJEmKnFFV5Wh72NCVVSsrXE7rxaudqS6rR9vHZsKyz8PLspZKZ9e0lmZzGkKcXWRDk8nDx8ZsVnZFS5ndxp/oD7X3TDfWl65bUzk2ntuwppxZQFi9piMEKI83oGlqOJzL5w1BeDPB+GV290eXbYznsy+fOLx98LhLdNzTstkjzDfY4x0TTz3dvX37K9F4on5JRU2lZ9f+453d48uazpkkaAiWrS6rOzTYczQ0tCRQ4rpESVkvZxiaYGhmdYNrRb2zezh1tD9BEPDkVC4raaqODQMZb8IH/M1iGDgr6Qe7Y6qGqopEm4VmmblFuICbl1VbwC2MTGUTaRVjYBhk/3h2dDp/fCC5ttFFU7DEJ3jsLE0R82dhLSBwVH2ZnWdInqEwxjPxvG5gVdViSSWVUTUdQxqTC1DcMQaqhrKSHkkoqayCkE5T0GVj1jX5NzUHl1W7hAWo7fi0wXRe1ifC0tG++PP7p8bCUiqnY4AxQAipLEf4XUKZX6wIWs5vAUJIkZAiF23FjjHOK0Ze0U29/Z2EJCBJQo+dLfJwC5kleifxOliRp06cTE/H5YHxbDihhMLSqgbXsmo7S5N5RR+fkQ50RV89EmZpoiJoWb/U3VrnYBlS4CiWJou9fPtA8lBPXDdQsY+vCFrsFrp/LHN8INkxkBQ4amm1vch9atQQAALCM47qZ2MgrOsIY+y00uuWuhXNGAplu4ZTDEOQBAy6+bysH+yOPb07lM7pXidrtzA2C00QsCJo2bDM8/rRcCgs7T4eyckGhGBgPNs1nGrrjo3N5DUdYQAMjDHGFp5aXuNIZNSuodRwKPvMnhCAgKFIAEDPyfQLB6aHJjJ52bDylNfJXmCGAPAs6bGzlUWWkclc33iGJGDAzakaKvYKE+F8x2Byd3vUQLg8KJQFLEH36eUpZ8+OmQtMTExMTExMrnRMwd3ExMTE5IqlMzJxfLTfY3V+ZvU1NDlb4xB4csOqQGNdxdPbDz67g6oq4u//6LprNtbWljMAABJgmyCyzGwnhz3DfZ0zQ7TIVGD3NzZ/6B0aCQAAgNISXySaOzkad7kcPT3Tg4PsmtULFdw1HfX0hV/f3btmZX02J9VVO/0eAQAgSVoqKcWiiVgsxbHs0EgsGLDbbfzufUN2p7WzN55JZ2ZmwhjP7Qg/C91Adqf7+utLR08OHTw0WFvbVV7mIEmKICmSpFLJuNvlqCh3U/M6+Raodfo/1XpNXlV2jXQ909vW4Cm+oa5lzpIjo/Hu7oGfPvza8eODuq7e/oFbP33/1oCXuO9zD/3nw8889KPPnl14iStwTfXS9rHB5wc7WsprN5bULGRcVwYEhKV+QeCp2lJrKCKNz+SHJrMjU9loUslK71xKVQxwVtJHp3M7j4cVDa2od86pakEALTzdVOmKpZSjfRFZVTHABEFrBpXMaEf6EjNxuaZErCu1Ntc4SnwCTV0oGvUc3Hautd6TlTUD4Z6RRDip5mQ1lVPjadVpZQTu4koowjiZUSMJKSMpiqZhrNeWOlvrPGsafVXFtnmSwZ6NriNZQe1DiY6h1MhkdnQ6H4pIecXAAGOkYaRhbLht3Kol3lL/3MkGIAA0RTD0AqYaZvcf5CQ9m9cNU3F/B/HY2YqgpbpY9Do4dmEJLd5JGIrYsMxjF5k97ZHhydxQKJtIq4d64iQBdYRzkp7Ja04bvXG5Z22Tp6HCJgqnsu4yNNzc6uMY8tUj4cmI/NhLYxaOpGkildVysm4X6RX1rhvXB8r8pyaNSALyLMnQBM+SJAkhACQJC5fuGRHeZqGXVTs0HSkaCseV1w6He4bTAkvqBp6OyYm0urrRtbrB1VBhc1gZAsIyv0CRkKJg52BqbDoXTkwd6Y1n8pqqobKA4Laz3cMphLCqIQNhmiKCHq61zpmX9a7hVM9IOpPXt++fAgDE0+pkRCoPWBoqbGubXJVFlnm+KYYi1i/18CxJHYTRlPLsnsndxyICR+ZkI53TSBK21ju3rfEvKTt1jyYISFNEIW1swUz+bf5KTUxMTExMTN5lTMHdxMTExOSK5dftewaikw+uv4mj5zBkAAD4POJnPr6mtdFqQLKlwXfrNdWF7d0D0d6BSEO1tyRgP7v8vom+7+x+MgcRLcOPrb16IX2YCWcNhIoCi0ufOCfFQUdxsBUAMB1O5bIur9c+E84JAm0VL+5njRDOZDWnw3r91nN8VLweoaba0tkVq64qra8r6huIpDPZ9u6x5curm+q9E1P5gYHRJfUe4gKBfrPACPMsv3F9lduZ/8PTB156xeZ02CFBAEwiZCSTM+Xlxc3LylwuVzqTYjna0DXRaud4azYnx+IpCDAAmsiDTRuWAQCW+ksfXHldJpc9Pj300sixGk+g2jU7VezOvd1PPHlgx459OoKrN6waGhwNBDxrWry5vHbXh7Y89pvf79zdvmVT89lVlgRKG4or9432R1NJULKQYV0hQAicVsZpZWqKxXhaHZ3OF3l5n5OdikqxlJpXdEkxZNWQVaTpCOG3K+wdY6BoxkxCPtQbFwW6tkQUBYo+bw4GQmDhqKZKVzQp948lNF01kIoABADmEM7P6KPT+YmINBmR8opRn1Y9DtYp0naRmV/IsvCUhadaaz3IwDlJy0pJRdOzeTWRVnmWXJDgjnA6p8XTiiSrJIktHNNU6dq4PFhf5vBeOMfy2WNPZrRoSgknlIM9sSN98YmwlMppEEKMMQYGRhoAOsfAoEdorfeUeOcIby98PixDcAxZCPBfuHqOEM5KWjqvoXc8fe57E5oiRJ6qKRHXNXmqi0WrcDm+fJEkrCoWRYFGGIsC1TeakRQjnJAxAASENAl9Tm5JhXVLq291o9sqUGfSn5IE0VBh4xgyJxsD45l4Wo2lFIQwQ5MOK11eIaxtcq2sd525Kh1WenmNnaaIUr9gs9AkCUWOKvHyLbXOcr8g8hRNEhxDFnt5VXcYCB89kTgxmpmKSgYCJAFYmqwtta5rcq9d6vY5OZ4lMQYOkeZZEiHMMSRCOJpSYimFIgmXjWmqtKdz2tBE5tTxIaRIaLfQ1cUiSQCSgHnZSOX0WEoFENAk4XGwy2vsa5vcNSVWt32+GytJwqpiC8MQyZzWPZyamJGmYpJhYIoirAK1tNq+fql743LvmRk4jiZ9Dq6mRJRVw+fkaIpY9OIUExMTExMTkz8pLsdnvj9B8OvP/WhRFVLxyQvtOrr3cYpeTBq3eV+IJ04eT8ZDC29MyiUXcej5eUceI82XRRMTkwvRG57sHR9hOObOFRu4C6RYtPDw2vXua9dvLPw5FoofPHoymdX2H5ueDOO77lhaXnKO4P4/nS/3y6OERj3QeuPHWrcspBt9Q+He/kjAxyOMOI632qxNdZ50WkmlczWV7lhCD/g4+kKpIy+AomhOl1NWiMPHRyjK2LS+yuOeO9QdY3xiMByJRJ0OW2Odp39gamwiWVZyjh96a0tNa8upQO/6Wm93rxxP5pc3lYkWZkkNs6Tm4ubpZ4AAEAADjADUaYZYurSirNitqpquapKc53kXSVPtHeHly7hUJs3xrK6pkkruOjg0Nh6bCEWzmSRDy9durikI7gCAVcVVN9eu6EmMP3PyiNfueaD5Gi9/jv746K9ffeWFtpWrV99yy9LVa9Z+7/+z995hdlz1/f8502du73d713b1VbMtWZa7bGJMNcaYADGEhPBLCPgHIQl5viSQ8iU4xN/8gBAwX8DgBjbGVZIlq3pVVtL23ndv73f6nPP746qsVitpV165zsvW8+xzZ+bMmdnZuTPv8znv9789sWf3K/d/tKWh1n/r1rqXX3I+/sSueYL7Cm/R5trmNyZH2kcHNpTVFNtdiz/A9wx2C11XZi3185tbPJm8Fkkoo7P58XB+MpyfjcuxtKJqyLiWpgd5We+fyAQ93Lp6V6lf8NgX+AvlWaqpypnIyG/0hBUNpfMqgVQEMEEwGBIQwnBCzuTV/slsmZ9fXeda1+De0OAmiCtXj1YWWXmWDCXEjKiPh0RZ1RIZ1X1Zfe0cGIOcZGRFTTd0l5WuKra0NfrWN/gs/JUfqhHG8bRypDveMZjqHE6lc1pOMhQNQQgxBhhpCKkY6wwNfU6hpsSxqtYTcPMLNgUh5BjSKpBWjmJoQlIWm4WLME7ntFRO05GZ4vhWYOWpxgr79St9t24IOhfy4n/n4LLR16/0tlQ7klktnlaSGbVQEu600m4743YwLhtjEyiSOD88BiHgWbK6xPKJW8sjSWU2JqXzmqIhr4P1OVmfi3XbLxgDqy6xfvbuaggBS5NOG81QRMDNbV3jb65xOCy0y8ack/KLPJxd8NWX2yNJJRSXZNXgWdLnZIs8vNvBOCw0TREYA4SxbmCEcEWRJeDm2hpcedmQFMPCUxxDIASO9yVIkqBIaOEo+uzIsd1C1ZfbvU72upXemZicymkQApeNLvLwXgfrstPcIizUIIR+F7dzS/GGRk84LieySk7SXTbG42ADbs7jYDjm/AQUh41uqXGUB4XbNxUVhgoWNSXHxMTExORirmLA8tJbLGOBScehJ2hm4ce2i9E15TJLBzp3TwwfW9Lec9nYpRa1732MpBb1lFsAo8U+VZpcHlNwXxZwdHZwudpKxiaXqykAgJRPLaeGviTeEi3cfFY1MTG5FC92Hp+Jxj65abv9Qp9uTUcv7x/TVfGe21rmbTI0Ev7vn78eTerBktJ771zX2lB0QYMDHV2RMQ3plYz/c+tvoYhFeUeUFNnTGTkvSggZI7NGNJUeGs8lk/lYNFZXaUumiU1tNW2r3NRSNHeLwPYNhCCkggHhVM9EPCl6PbaOU8Oqhle1VHAcDQB49dVjpaVlK1b4Tp+ecbthNidHYtOqruj6FVS25islo14GDJCi5lVNttusCBmlxZadd6yat87gUEbV1TIiiBGcmppSFdTXO0JQFmAQU+NTTQ3eO2/dNHf9DZX1G6ZqXps8vW+484aiel/FBRX6pWUlkAB33b3z05+oJgn40B/v+NM/2/+Tn/3hX7/9x16P/XMP3qFr0sX9bCutWVdatXfg9I66lven4E6R0MpTVp7yYlbVUJFHC7i5qiJLJCXH0koio2ZFPSdqOUmXFENSDEUzZBXlZV3XMVqONxPDwFlJn45KXcNpliYXFNxJAtoEuixgXVvvMwycHoljYAAEEAAQUoCgZBXLKkpmtUxekxSUyKhTEbHEyxd5+YCLvYyXusBRQQ+/rsGXk/RYajovazNxqci7qHIHhHEmryWyiqbrpX5h+9qS+gqn03aF15hYWgnH5emYNDqb6x7NDE/nxmbzCIMzvs4YYaQjrGGsYQwElm6p9rRUe7wO7lLCH4SAJCHHkA4rLbDU4gV3A+FERo0k5Zykazq6eG6BCQEhTUELTzmtDC68ii/ukscAAFww6McUSbAM4bEzJT6hvtzWUuUo8vDv8JpmmiI8DtZhZYq9KJ3XcqKOEKZIwspTFp681JASSUALR1k4ym1ngm4uL+uqjhwWxm6hLDxFXigrWzjqXCZBwUKGY0mWIb0OpqBNnztFHENyDGnl6aCbK/Xxqo4KEdAuG3POAB5jAAEYmckNTGQxBi4701rtqOBIVUMsQyKEe0Yz8bSqG9jCUyU+/lyaMU0RNEXwLOl3cQE3n5d0AIFNoNx2pjBlZJFnjKWJoJtzWOiAm8uKmqwaVp6yCbTdQs9zymIogrYSdgsFMFjAwN7ExMTEZPFcxYPopbdYxjtyKj61XE1l05FsOrJcrSWi48vVlMmSMAV3k2vGJW5cqpxb6viEmEteapFZ4W5iYnIphkLThE58qGmj9UIfdkXVH/nJ6/XVRRcL7tWVvs9+YouuE0UlwZbGgM91/lty/+TA/2l/aTabFgj+8xtu5xZdJlBT6a2p9BZ+fulg/OkX+37bPxD0ea9bXWQTdK+bHhrPIaQ5bHxzvWORj3wQwkDAWuR3BvzOUDwBID78Rp+iqBartf34+Mb1lUfah/sHM8PDfStW+AXGcsv2FbKineqabFtdUl3pXmTPrwKSIjCBNE0tKiolSPZ019TmTa1e9wUDHnW19udf6X/9wOm6upaKYqJ/KGvhWbfHo+Qyq1qq7t65bnNbzdz1671FN9Ws6otOzESmXhk6VuH2lNo855Z+/EM3vPLivhMd7Q9+vBIQ5Ja24u3bNry+d3/fwJ0NKwJ33LJuwX42uANtpVVHB069PtbVXFoRtDgWXO39QMGZxEuzHgfTVGXHGBgGklSjUKw6FRVDCSWSlJNZNZZSZuNyDunLaEUSSynH+pLFPr6h4pJpBAEXv211USqrdI8mMUYYI4gNgiiIbiQAEGOczqknh1Jdo2n6ANy22nfDKt/GJs/lw0tZhmxr9OsGPtIVzoraZERcUbaoRASEcDKnJjKqZhgVQevO68rtwpXLlifD4uGu+P5T0f7JrKafCaotvONhjBDWMZIxNjBGEBI2C7uhObBmhffyjvAEhCxNumyMhSfjmcX0HQAADAPH0spsXEplNdltCu4LQBJQ4KgSn1C4JHRj0f5KGCCMEQIIAYEjXHZmZY2zttQadHMcu5hE3ncEFAkpkuQYMuACGOBC0udiOi9wFM9SBSEEnvlvPhAuIG0s+GEBliEYmnHamAV7Utjw1GDq8V2T6ZxaX27760/Uu+22QhRzMqv2jmd6xjKyajhtTHWx1cJfMHxFkpAnyRIfXxhRuXQvrgDPkhxD+pzs5U/XGev2d8llYGJiYvKOBSFjqYJSOnlJh4lrZaFoYmIK7ibXkEvcuGLhkaU68FwG86nVxMRkQV4Z6RrKhMv8xeyFZjII4Zf3jkRmpv/hL+8AACRT8r5DkwG/sHl9CQCgssxbWeZdsMHfdR8ZSM/SJNsUrL29YfXFEaxXpKs//sru0719EVFUMaY2rG1sqHEAAIbHc6KocNwSZC+P2+pxn4lSpKFx6MjpnGjce9emkiLXT355ZM2q0tcOdN3/kR2pZOKl3SeHJ8IArOBYeuO66qX2eakYOqIp3mKx0SyHEfP6/r7bbl7vdVfMW6210d/RwbWtdrc2+cdn+lwuHqBcQ5175+031lQXXdzsdRVNnZOjLw4efWn4+PaalXMF96YVvr/7m0995Wvf33dg5Y4bmymK/NOH7jp9upJjr/CEs7Wm+bW+46+NnL6zue39LLgXgHPkMZIgCAIGXNDKU0EPl5cNUTZk1RBlPZPXspKel/RMXkvltHBSjqaUeFpRtas0J0nntYGpTCjuFmWDpc8kCs7DKlA1JfaVNZ7JSH58NhNLyxhjhDQAMIQ0hCSABAYQI6xhbBigeyyTEfWu0XRtqa2x3F7s431OdoFDBpBjiICLa611Z0WUzKqyuqgicYRBTtIRBo0VrtpSh4WnLhUCLKtGKCGPzuR6xzNjs+JEWJyKiopmFKxcIIQYI4ARQhrCOsAIY0BAorbMuabOW1dm9zjYBU/IXBiacNkZ6yLcbC48BJyX9Imw6HGw70xL8bcXioIuG9NQYb95XYCiIEJg8QUeGJ/5n6Ygy5A+J+uy0SxDvusMuwv9Xao8DBcrzi9nT8oCQluDq70nPjyV+8lzo8U+3i5QomKksurgZE5WjE3NntYah8CTC/6pwoWHBpa5kyYmJiYmy4WmSsspKL3bvqBN3kWYD9kmJiYmJu9BXuo9MZNPfebm21yCde7nCOFf/vpIc331lnUBAEA4kv7hY3t33NhcENwvxa6hzpPhEREpxaz7s6tusi7anm8unT2hN46PUnygrNKtyHFV1wqf11RYAbBeftvLsH517UwoKlitbpcVAKCp4m+fO7Rje3NNtZ0gnMdOjrhdS8kFeXMQBKUpqONUyB8M2G3+sbGRSCQOwHzBvaLM9cB920bHYxjgaHT6Ex9eCwC2W/mmhvmZqAXK7Z5PrbtpVkzuneh8tvdYtauo3HFec7/ztnXfeyT4/f94bMeN/0IQsLW5tLX5ylmo9d7ilvKa08f27urrrnIG/dZFVTe/H4AQ0hR0WAmHlQbg/KWOMNB1lJf1VE6LJpXZuDw8kx2dyY+H8omsmpd0zUDGEovfc7IuRYxIUs6KGmGlyYXGsXiW4lmqudqVyCq6jjKipukGQgZCCEJMEDSEFABkoUTJwHg8JE5GxI5BckWZLbNaa65yIIQtPMUxJHneURlAWDDQ4FbWeCbCUipnLDJ3FGOg6YhnqcoiT12pnaXJeQYUCGEd4bykx9JK71jmaG9i36lIOqepGj6r2xYK2zHGBkY6QirGBgCApkiOoZoqXZtaA5VBq91y5cJ5hiK8dsa2iBL7eYeQl4zR2Xyxl68uXjiU9f0MSUKrQFUEhQ1N7sV4eZu8vZT7hY3NnlhKOTWY2nsiInCky85kRV2UdYqEtSW2LSu9hWTXt7unJiYmJiYmJu8jTMHdxMTExOS9xpHJ4f7ZCZfNtrasgqcvkKJeO6SMjCZ+8ugnAACZrPrqgTGBx7fdeMbDpP3EaFdf5PabWoqDF4hQe4Y6wkpCoKk/a7v9xrIGhria93ZJw05vidtfFQh6w6F+ilweJ4fSEk9pyXn1efv19ZmsuGZlNUEQAID1q695VftcCAhTqWRekjZvaX7ggbv+679+/bvn32hsLK2q8M9bs7LcfrB9/PEnj2i6uqa19PipyUup7QUaAqUrS2uPR8f3j/R8tGnLXMEdAPC//v5zD37ma/v292y7oWnu5+mMsvv1wWPHT0uycuuOdXfcvHLu0ntbt5ycGD0w1PuBpnWm4H5FIAQUCS08xdCEw0KX+vmmSlta1BJptXMkfbAzGorLyay6pDYxxoYB0nktklRYhryMIlZdbOMYMp1X03k1lBBlRccYA6AbCBEAnS11P+PrjDCQVTQ6k8+JMx2DyfKAsLnF21xld1jPRzIWsAl0S43LJjDjYdHKX/nvGgNAEMBjZ2pKbA3l1qpi68WVy6JsJLPqwc7YycHUVFQMJ+RMTteNgtp+xnCiILVjpGFcOBAAIfQ4uMqgbUOzf32912FdlGkVx5BFXt51JQf5i8lKet9YpiIoYOwxS7tM3tV4nGwrTVh5as0KV+dwOpKU85LusTPVxZbmKkdDha22zOZdXCSyiYmJiYmJiclyYQruJiYmJibvNQ4Pdicy6T/bfneJfb5f+W+eOaYa7FBYWwdAIpV/YU9v84ri1sYAAGB0Unz82VGekWzWCzT6l4Y7TsdHVE32Wz3XldcL9NW8tw9NqaeH0ioiZE3PS/lMJqXr+lUf4GWor7tcqf61RtNkiwA9flssEQtH8oBEe/ef+sTHrr9YcAcAbL++6q+/8aO/+/r9qqaf7h7dsqHq8o3f07ChLzy1b7DrZ8f3FtldlS7fuUWbN9Y/+h9fr6w4/0kmKz3x2yNvvNF54uRUWkSSLDI0NU9wb/CW1HpLX+k+kVfEN3fc7wsgAJCADAEZirCcnTVhGFhSDZeNoUh4aijVP5HJSfriHWYwBhjgTF6LJGW/iwXgkpXaThsrcFRbg0+S9faeSCghqpqBMQIAYQQAAQDAAJAQQgAgwNgwcCqnpXJaKCGPhfKajtN5rSIgFHl4n5Mlztak8yxVHrDSJMkypNNKY3wFOwyMMYSgyMPbLXRNqc1jZ+aun5f1SFKZiohjs/nD3fGukXQ6r805G4V8VICBgZGGkAZw4RAARZE8Q9WWOq5bGWipdhV5hQX2vRAcSxR5eJeNgXBpEWKirI+F8hMhMZZWrDzFs2bxr8m7FYEleYa0C3TQzbnszExUSmRUC0d6HGxLtb0sYHFY50eYmpiYmJiYmJhca0zB3cTExMTkPcWh2dHj06M0hiv9ZRZ6vndzTozIWv67//nsviMNhiqQtPDQJzcXFvUOTPcMxj9933rbhbWl+4ZOjediFGb+Yv1dxdYFEkc1Db1+ZJLl2OvbggCARFqfDKmr6i+QzHqHw5h2FZW6ecF591Z7e4d/98HJYr/N674ad5qrIKPJT4+dVBEq5ux3V8xPi10Wxicimq589St3MSxDUeTJ7lmfnx8bz/3gv/5QFHRfPBJQHLS2ta2rrfYfPx274+bWK7Zf5fStDFS2jw0cme77v92HvrD2Jp9wviz9lh2bCj+IovKdf/ttd29/X9+41VlUXbsmEk92dh7V9AWKr31WJ0GDX/fsL/V4S+2ei1cwuTwECQWWbKl2VBdb3HbGQGhoKpfQllbnnhW1aEqW1SsYK9EUsbk1YLPQ8bScl/VERi58jrGODQShAQkaEjSABAQQ4zP+LXlZV1T04pHZEwPJdfWuzS2eG1b52bOCO00RLivLUKTbztoEGmFMXNbME2NAQFgRFAwE3HaGZS6ol48mlX0dkWP9ydNDKVExFLVgU3PGRgZCeNZGRsVYx0iHEEJIAAB4hgy6+fUNvg/dWG25bNbrPDiGLPbybjtDQIiWkvulaCiSksdC+b7xbE2J1RTcTd7VQAg4lijx8R4HoxvYMDBBAJKAHEPSFEGYaruJiYmJiYnJW44puJuYmJiYvKfoi81OZBPFHr/ALOBd/q2vbYvE1n7nv9t3vT6g5FmXiz09pq+oBqMT2VdeG2ustdy29QL77xcGTp6MTIiyUueuWh2s4Rcqb9cN49ipSUwIJ7pT8USGIBnD0E51WXxeC0liAsLaCk8uJ09Nh3RdgIBqP5XP5VE8lBYlda5H9jLyX+27ZhKRZCppYEM3gAGxDLQxKaVhwEPmCW4PjSFLkALDeeyO7Q0rN1fUvck9RmLZRFpZtbLC6TjjxuP12BRVicdT7UcHHn+y44sPOf3e+W7R932o7anfd4uiuPETGxazlw+1bOwMj+4ePX14sv/jTZvmCu4AAIzxl778yMDgxNhkxupwfvDeD3zknrVjk+LXv/Wr4hLX+vUrL27wY6s3H5vsPDbZl5Sy7wHBXZSNcFKOp5V4RkUIEwS0C5TXwZb4eJaZbzW+LBTK3nmW5Fmytdohyno2r6dzGkJLqLeWVSMjFkxXLrsvCO0CXVNiv21jmd3CvNEdTudVSdEBgABgjHWAMAIIQhJAEgCiYJWOEFARUnNI1REEICfpMzG5odxWU2K1CnQhqVXgKJokKOpMffxl+wAoEtotDACApYmCn0xW1ONppX8y2zOW7hpJj8+K0ZRy4UkCAGCMDIwNjI1CRGphGUlAm4WuLXFctzK4sdnvti+Q73oZaJKwW2i/iy3x8cmMmpUWO28GY6zpeDIiHjgV5Vmy2PvWJT2YmFwLCAgZGjL08ni1mZiYmJiYmJi8SUzBfVkgbtz5pSVt0HHoyXRyZsFFa7d81O4qWnxTGKN9L/zgUktLKlfXNW9bUt8uBSfYl7bBW1JNsrR0NhMTk/cB0/FIWsr91fV3lrm8Fy9tqPWuqPZ8z+/+/Z7UG0cHugeG/v5fn35pT4tA23qHoh//YLPbcYGpxdHx/qlU3M05/nzj7RWOhQVZlqEe+PBKDMjxmfw/PTpqtwotjSUOJ9u20gchBgAKHK2pusDYCM7Gk5TV7qdIOBmPGsZinTcWw9NDx4+N9YcSyawsjSZDqqaoikJDiiFZiqJICiIAMIaioQ8kJWQYiqGoSCNo4uWxkwGXy2NzVgVLPlizps6+gP3LFRElVVWNc2o7AMBmZXbe0nriaO/o0OxTT+7+4F2tFwvuXjd76Miplc1XMJM5R9DqbCguPzjZOxabenzo2J+t2u5hz88k2LV/YNfuQ+VlNV/+i8/etK3c53XFYqlH/uNxXQl9+sF7di5URF/scPkczpOhYVXTln7Q7xRwQW/WcTyjdo2ke8cyfZMZXcc0BUt9fHOVg2VIj4PhWRJetnz7TbKizMbQ5Omh9OhsXtXQ4sutFQ2J8pUFdwAAQcCAi7/rugq7hQknxdGZrKIiXMgfxQhjBLEOCRpCmiBoCAkMAAC4YLYiynrfRHZ0Nr//VPSuLcUMRZQGBMrGEASkSEgtlNe6QAcgJEhInV0XY2wgEEspPWPpZ16fOj2cEmWEzle1AwBh4R9CBsYaRho+YyMDISQghAxNFrmFtfXeD2+vDix9vgtJQgtJ+l1cTbF1AGUXL7gXmIlJe09G6itsq2qdFHkNrw0TExMTExMTk3cgS5geCAAAYPWmD2mq9Ob3m8tEj+3/1aWWrmjdUVy+tBnJ7fv+r5hLLLhow40PChbn4pvSNPngKz9c0t5NFsQU3JcHX9HSagPpheouC7i85W5/5Zvt0FkEi3OpfVs23hIt3Hw3NDExmUcqm2ZoptjlYakLpPNXDyQjkdj999YRBGyochR/zHb/3b6h8cZ/+Z/jrx3sQgq67YbSD9/ZMHeTZ4dP7g/1q6ryzW0fvrm6ZV6D+44ktm1yAwAIAhYH7ZG49KNfdw2NTm3dUPX5j1dwDLQI579kPR5vXW3x5ERMleTrW4jaivJH/ye0XPewnxx77eB4z1BkKpFNG5jgWN7tdHrsjm/fcC9xVtc7GycJCvIfxhhhdCI++fTQscnI7ImJQUVRLDS79+jh5pKKz2+6vdazhKFfAEBJ0Bnwzs8dtVkYr9sW8PlmZyPf/NYvf/DvfzLXZh0AgDEeHRlf01qz+B19qnVrz8zoKwMnjox1P9iwaa7gvnFNxe9/928cxztdTpuVHh2PfPmrPxweGv7kJ3d+/oEbHfaFv3krgmX8aO+PD+4K3u4pcSxgGfTOR1KMeFo53BXrHElPR6V4RinUmBMEDMXlkZn8sb7k+gbXpmav285Y+Wv17MfQpE2gfC7WbWeiKQXpi30OQAhrBl7kCw+EkKJAY5XzM3c17D0xc7AzHEtJeUk/JxZjpAOIEDYgQUFIFaTtsw4zWDeQKIMj3fFYWm1rcLdUO2pKrAJ3lYYqoYQyPJU91p88NZgaDeUVFZ2zsjnnIQOAgZCOsI6RXlhUsJEBAPicXFWx7aZ1xesbfA4rfdV6t8fOtFQ5Yml1Orq0N0BZNRIZ5eRg0m1nWqocXufS6utNTExMTExMTN7VLLXcwOkpvfJKi4BmLxfYY3P4l6rjUdQlY8bcvgqbYwkFVaqZbrVMmIL7Ow68rEL18ra2LNgcgbKadcvVmse/2LpIExOT9wNPnTpyYny4zFdk5ecXUz/6k5dyOen+e+sAABACh41w2ISAl/tpraezL/Lr53qv31jqsF2gN3XPDE9nIx6LpcLh4+Y8xLy8J6xj67ZNjnOfiDJ66tXU4GiiqWUlpqn+Cbhl5flv2NP9qRf3dA5PyiVFtZ/6UNlrB0/94ncKRTlebVc/5jYc1qt3T37s1OFnTh0Jp2OKKjIANAQr/mbHR/xWJ0mSJEHMc1y5mFK376aKJs3QdMN4dbT7hb7jgzMTPScmD4z0NJZX/92NH6l0LDBLYEFomqTphQ4EonXrWxEmXtv90sN/+9NH/vWhYOB8hQXGIBxOivklVJe7OWtDoOrAaNdkdEq90JbdbuPstvLCz7Ph5Fe+8T+nT3bf88GbH/7LP3LYL/lQ+9lV27uHhrunJnKyBByXWuudi4FwKC71jGV2Hw+fHEzlJd1AF3z1j85Ckkhl8hpDEY2VjvKAwNDEtbCXoUjIs6TDStsEOpFRF/9LRRggY7EFRhACEsJSn6XUZylEtvaOJqejeVHWzxqmI4QQhBgCTBAAQhLgwpUJAcAGwgZCg1O5qagkKYaiGSQJS7y8w3rJvNYFUTWUyml945kjXfGjfYne8czZJfjsvgDGGGADYf1cYfvZlzrIMaSFpxsqnGvrvVtXF9WWvqkrz21nm6sc3WMZioTGEqYWAE1Hmo56xjI8SzosNM+RPEsSb1+hO0JY0ZCkGHlZ13WkIwwAICCkSMixpIWjWJqgKdMzZJlBCBsI6AZCCJ8Zml1wPQwAAAQBaYogiWs+H0I3sKYjAACEoLDHa7u/5QNjYCCsG0jXMUMTFEW8e/puYmJi8k6BJOmmtXcuV2vZdHhy+PiCi5Za4b5svF37NXkLMQX3dxxwWYu2l7e1ZcHmDDQv363TxMTEZC4T0ZAkiX+96roV7sD8RTOZ9W0b531IkYTfzW/bWLZhZRF9offr7sm+/VN9kiK1Va9wWS/w1JqZjfMWlucsv38xAoCEgbZ9a1U0nrM5XNXVtTyrTc1GwcrzFeLhSMZidbe1BSOzqd/vmr3v7saRMDx2Knayc+TurVaH9XIFDpfiD30djx3efXpmHNNUwOZcX9f4+bXbyu1uG8sTcLGCFEdSHH8mqfL+1us+1NCmI+PHnft/13Hg1Y4jp4cHG0or/33np32WK1uKjU/Fw9HshjWV8z6Px6L3fmDN9VtWfvPb6lO/ef4vHyb/83uf97jP7PTR/2lfsaIpEFhaNf0X1u3omOw+MN7997ue+v7OB/0XdS+dEf/5+787sO/IHTtv/pd/fNBm5QEAJ06P/fujT+YziS8+9OGbt58f97UzvJ20ZWVFR8vp8PPWgDGQFdTek/j9oenJsCjK+sXe6RhjA+HTw6lISr57SwkBfSU+/qprui8PBIAkCHKJEYVw6eVFBdas8Hid3O6j02/0RAYmUnlZP9sYBgBhpCGMIKQIggaQhBCePTcYAKBoxunhVCqnxtLq5mbPllbvkroQzygHTseO9iY6BpLJnHpeZz/rIYOxgZGBsXbOsX2uQ3zAzbfWeG5YFVzf6PM63qx/utvONFU7ijujFp4SZaMgUy6e8VAeIRx08yxN1pRaWfpte3RUNTQTlYamc71j6XhGzeY1AABDE04bU1Vsbaq0l3h5swx/2VF1JMpGKqtJik4QEACMMICgcCGfAWOAMYYAMDThdbJWnqKu8dBMXtZjSQUDQFPQ52SFpYQJv73oBhJlI5XTEhkl6OE9doYioSm6m5iYmCwJkqKXUTWaGe+8lOD+thnqmUZ+7wPeNc8uJiYmJiYmVyQv5xlIOlmBIi4QnR97ZoSA5KYN6wAwLt6KIgmbdf4svInQZDQVs7PCfc3X17kvUIQ/+dEGACFJgttv8RWENlnBDE0wLBOJxz0OYnomBcD5TXSD2Lbel87rUyMZPY9I6Ll3u/sDW62P/DR9Fce4f2b4x8d2nxjqUVS1rrT84W1/tL64miQIhqTejP7BkhRLUgCAv1p/65fW7Hj0yEsvdbW3D3TePPXNTa3rv7/9Pp66XAkwBAQB5gv9Tz79RipDBAJem43duGn9K7tO7tp96rv//tI/fP0DgsAAAF7ete/zD33h7puWVt4r0GxtccXx0FB/aFy5yHtdkvUf/PDQz3/6h5b1mz/5qQcVhX781z3PPP1cz+hAXs+2rCgztPmSdJmvhJoa/NaB5x654/5i6xIsDt92EML9E5me8UzfeFbVjEvZoGMMklk1K2pHuuMkAa9b6S31CQy9/HoZxkDXkaYvrWiHJCFDEVchSHkcnMBRoqyzDGkT6JGZzFQkDwA4G6OKCjYyCGEIKUAUklTB2TBVnMgohapeAgKBI0v9gm8RYq5uoImw2DmSPtQZ6x3PTMeks7VRhSIHCDDGGCGsYaRjbACAMMbn1HYrT5cHrK217rZGf2u1qzxgXepRXwzHkAxNlPqFioBlLJRfquCek/SpqNTeGycgYBki4Oaune/QpcAYTEfF8bDYN54ZmsoOT+fSOS0v6wAAmiJsAj0VFaejUkO5rbbMWuzl7cLSZiSYXIZUVpsIi0NT2UhCmVvhPvf+gDHAGEAAHFZ6Q5O7PChYOHhNRYrZmHSkM44AtlvozS3ed5HgLqtoJiYNTeX6xjObW70C6xA40hTcTUxMTExM3m+8a55dTExMTExMLs+TvUdfnx6ysQJ3kTTc2x8eHpno6OgCH2hcZGvxfEoWxfJAmYe3zxMmz9XC09QZES0vqvFUwuf31FU57tpM7T6cnbu+ohq/e3Xc43G0NNfs3Op47XA3w+LmOk82kzKMpYUc/qHv+D/temoml3JYrJsaV32x7ZY13pLlnczEkBRDUn99wwe+cv3dX/nDY3uHu148uG9gYOiVL/w9felgybJSVyaT/97/eWXdmuptm2s7e2d/9fieQwdObr/p9tEp6/D0ZGfPaFVVFcTMD3/4i+Li4j//k000RRi6ds8tLlnRXn2t745bmhbfyb/d8pGeieHj0xPfPPDsI7fc52TPp02KovSjH/6iuKz+pu237Xu98//96lNDff1eb9Hm6zZ86lM7bt9ac7Hw8eUbbz4a6uuaGpNVZamn6+1FN/DBztjoTE5Srixy6wZu742lcmqRh3NaGRdFL7tehjAQFUOUdYSWILnTFMEyBHlVTiEcQ61v9JX6LGUB655j02cFd1CoWMIYY6wDoEOCJgANCQZCAgKI8RlJOivqPWMZVcN5ybhtY3AxgruioiPd8b0dke7RTDqnnZuJXJDUMcAY6widyUc9u+T8sXkc3I62kk3N/pZqN7ugC9PSgRAQAFYELc1VjkRGzSzFo6lATtIOdcVEWfc4WJKAb73gjjDuHEnv64h0DCYjSUU3EMbg3EBGLK2Mh/NvdMdX1bk2NLpvaQuagvsyEknKJweS+zqi/ROZK65c4hPcDsbjZHj22pr7jEznn947hTAu9vJVxdYS35Ijhd8u8pI+Mp3bfzK653jYJlBVRRaWJmjzndvExMTExOR9hvnlb2JiYmLyHmEyHplOxb975yfXVdTO/Rwh0H5qxO4q+u3vX/vts3+oqiptam2+fcfau7cosCC/XSQ7/rxr3+PDRwwdfaF1x4aSWnAldF0fHZ8WPOUpmfqvp2frS8izNa2gc1DfcyhBEySBNUlOQcIWLCn9zo/bpbzWVL/ixUOJj98h2IQrfB1jgDuj0/9+6NnD450koJv95V++4e5b6pYWXr8kCAgBhN+/+48BAJ967JGDk71rH/3q1tb1/3Hjx8mFLGsgAC1NpaNj8a89/LPyMmfDiqAqo9tu+0Begk88+ZLby/u81hu3trWzQJJC//RP308k/kLXtY0bNkAIEEKpTHKp3XOTDoMj26e7VV0FcwR3goBerzOVzjz2k59ms4mg3/qtf/jCX37p7su3RiBNR4rxbnOVMTAemcknM+oiS8oVDc3GpT0nIpqObljtEzhqGZ2RExl1PJQPxaVMXjOWIrjzLOmwMlfnzQ0hYCjC4+Raa9wUCf1u/tRgbHAyLauGbswp0cUGQhhiTBAUgBSAAOAzNuu6gUMJ6fgAtlkoAHFtqc1tu2Tq1PB0rmsk3d6bGJ7O5ST97AUDz9S1AwMjHZ/JR0VzbywsQ9oFZvUKz+o679p6T3nAyrPUMo53QAgqg5Z0rdY3nommZHUBb6HLgTFQNTQeEl84PBPPKLLqCXo450Xzfq4RIzO5zuH0ke5450g6llZk9cJ5SBggAICBVQBGZnIQAJeNwRiU+QWWMf3clwHdwLJqSIpOU0RDhc3v5mw8bRhIu3DGTMFnxu1gSn08z1DXumI76OE2t3gwAG4741pixMLbC8cQAQ/XWGVXNKMiaOFZkliiy5aJiYmJiYnJewBTcDcxMTExeS9gIJRXJIbjGHZ+jerP/5Acn4rdfPN1Dru1v79vbHziueennn/++R/U+te1Vl3fVrXzpkqKgnObSiv5nK4Uuf2ORdiXYwAwIOvrm5KSYaPin/9U/QsHEq8eCt16XREAIJVKV1ZU3HqDX9GM3/y+65Gfd7W0tPzrwzuLPOgfH+0YH8/oetHlv44Rxh3hiUcOvdAx2cfS7J9vvutP1txyVSfpKvn5g1/++sFnnjuy53d7X6AQ+u7Wj/L0wkqcw+4uClTftK3yTx+6qac3+9tnT+7as3dwePiTD3zwC5+5oThgAWALAGD77d/40Y9+XFlZ+bWH/xQAADDW9CXX5DaV1byWHBKxKmoqBueL/Bma3rZ13fPPv9bQVPfBP7rvMw9sWkxrAbeHDI3/uH3fN276gJO7Glf9twWM8FREzIiLnSeBMUjltIOnoyQBakqsQQ9vEyj4pp0hCv7OobjcN56ZiUtZcWm/TQtHuW0M8ybKvS0cVV1s8zm51mq3haMkxYgmpaykaWd1Z4wRwAhAhACCBCAACSFxrjg9lVNTOY1nSYyxhaOsHEVf5M+kG1jVUc9Y+pWjoZ6xTCguz42WhAAiYGCkIUMFoJCPShSuSpKANEV4nXx5wHb7pvLNLQGnlb4WyZ8lPl7TUYmPn4yKyYxqLD2MK5yUw0lZUg2KhKtqXQxFsAx57cIqEcKajiTF6BxOP3dwemQ6F0rIV+hhQhZlw21nBY7yOVlTcF8WEMaFrF2Hld7Y7GmpdgQ9vKoZsnp+ABJjgDCGEHIMEfTwPHsmFOHc0DKEAGFsnE0/JghIEPBS1w7CGCFQmAdDkpA4ewvC+PwgWYmPv6ktAAHgWdLjYM91o7DHwmoIYR3hwh/i3HYus0eMcaFvl7+wEcIIA8PAAAICApJYwIQdY4ABhmft7g2EEcIEhCxDlvoFmiKCHq6u1CpwJEVAfDaXDxa8p3BhFxhhQEBAEJfsfOHMF/pDEoCAEBKFlIh3ZFSXiYmJiYmJyVlMwd3ExMTE5L3AwcmhY2NDHqvdJljmLTqw/5DLwf7gm6sEngagQVaNf/nvE11dQxMj0089MXz4dR9N3nfnjuC59Q+ND+7u79Rlta6mPOByX3HXsmz85OkBVdFKPM7776x6/pCk65p4VgNFCNWWqiXe3NEuGgMvRaFcEsaiIgON0qKKA28cy+U1p429lEygI3QsNPbtA8+eGu8rs3v/n+vu/mjLwgoykkVk6IVcu0LiHUmRBDf/bFwGpGlYUzAyAAAAEiQvQOKMBvqd6+4ts9qeObL7xcN7srHs9//o03Zu/gR/TTMi0VgsETZwCQCgqdF2usuOsGq1MWNj/dHoqqCPJwgCAPCNb/zprx5/9oUX9/zqF7/YtuFPeIH/2D3XL76fBb60+baXxzu645NfefanP7/vLyzMmeRJi4X99rc+dvOOdTtvW4JHTWNZzcH+7qGJMU3TwZvNsHzrwADkZX1Jnt2GgTOidmoobRhj29b4t7R6eJZ8k/pvQTbtGEy+eiwUvpJmejE2gfK7We5Ni6ccQ3qc3O2bympK7Ie7wp3DidGZrKIZ4GwiFsYYIA1jBCBNEDSAxBzZHY+HRACg284CAGtLLCxzwQBANCX3jmXaexM9Y5l0TgPgzCgPhBBjhFDBRkbHwAAYnFPbAQBuO1tT6mhr9LU1+soCVptALTVUdpGQJHRY6VW1rqyot/fGJWWBvIrFMDSVkxRjIiytqXOtb3R5HdckpNRAOC/pQ1O5109GukbTg5PZrLSocSNVMwanskEPt6HR7QDvpsLndywYg4JqzdJEwM0Ve3mvk8UYzJunUlB4SQLyLEmREEKgqEhWDZoiaApSJCFKRiytSIphGNjjYO1WmmcWzmbIS3oyq+UlHQLgc3FWgWIoYq76XDCLry21AgBIAgocWZDaVQ3JmsGzJEMRGINMXgsnFB0hkoAeB2u30DQFF8ymkGQjndOSWVXRkNNGO62M00pfylcdIZyT9HROi6VVioRWnvI4GLvlgosNY6Bohm5gAkKKggxFpLJqJq8JHMUypE2gWFrwOVmbUBi9g4aBZcUonECaIhDCiayazWs5SXdYaaeVsfIUQy9wD1R1lBP1VE7N5jW3g3VaaYGjCAIYBoAQFKbomcF7JiYmJiYm70BMwd3ExMTE5L1AOBFLpJL1NbUe6/yadI7IbFpTdE7k4hjy777YBkBbMqX+4unhZDwd8Lvmrh9Kx2biERYyt1W2NniKwJXAGFME8fDnVv7g8cwfDhA0SeXy2owWA6BSVox0Ovvcy8M//lmGIK2AEWZCIS0Xe/x/cv6As6m5qrLc+fLB6P138Ty3QHmvjowTs6P/a89vesLjtSXlf7zqpo82z1fbkZjFqoSRHnnl8cxwtyErBCAxSekQBqrK3Xd9DlIsZfcu5hymTh9JHXlFj00aAAOLs+KPPs0HK6DFCQgCAPDFVbd8YeWOe3/6T4d6O78CfvnPH7jPzV+g5h8/Of7Us+1ZMVuo/FU1nMnmKBp+4QsPCJz2m2f2eT07S4o8AIBbtpbdsvXPf/TYqsd+9qs77vn63TtvrV9R8rEPtS2mk3MptXuHYjNjkel5VjAWgTmnthsGzuVVSVJUVUXYIAiC41iHTWDZCx6BPtdy/d6jRwanpvQluuq/7RAEWJLagjBWNDwVEVNZjSQhScKygBBwsTaBppYuBOsGFmU9lJDHQ+Lx/kTPWEZRl6DzFrQnl43xu9h5AvdVQFMETRENFc4ij0BThIWjBY6ajuajSRkX5MJCkipGmAAIYUjQAJzfaTKn6jP4aF+CoQmPnXHbYUH/MhCWFWM8JB7sjHWNZEIJGRQKVQEAAGCMztrInDFtL5i5Qwg4hgq4+boyx6o6z8Ym/+o6z5s8wMtDQGjhqZZqRyqrDk/nomlZUa/GIimWVpJZVVKMnKgjjKqLrW47axUogV0Gx/nCLyGZ1eIZZToqnRpK7TkRmY1LucWp7QAAzcCzcWkyLKZzmtPGsAtplCZLBWOMMSAJwsrTdgttE+jF3FVm4tLIdN5hpS0cSRIwllbGZ/N5WdcN7HNyRV6+PCA4bfTcSICsqIcT8kxUmolLOVGHEAQ9vM/Fum2MpBiKhoq9nNvOMDSRl/TpqAQAYGmC8gkWDuoGmoyIozP5gIezCZQoG+GEPB4SdR2RJPS52GIvXxG02C303KsiJ+nhhByKy7MxKZ5RFc1w2Ri/iwu6uaCH87nYea5y8bQaTcmhuBxOyJGkQlOETaCKvHyRhyvy8FaBIkkIATAQHg+J8bTCMiTPkDxHjs3kI0m5ttQa9PAWjszktVBcLvULLENCEqSy6tBUDmPMMqTAkZqOx2bz8bRSENx9Tq48KARcnMN6/j6s6SiWVgunK55W0nnN62B9Ljbg5ggIc5LustEeB2vhKfOvwMTExMTE5B2IKbibmJiYmLwXSOYymqrurGhucPrnLfrP79634CYuJ/Olz87PUBV1dSofz2pS0O13CLYr7hdjkMpqigxnQ1I2KobGZlatrIIGSRCWdBZ3dEX7R9Kb1pdMTjGTM2IslUjH+ltq3etXtzY01uzYWuGwMd99dE886SkJ2ucJHBoyTsyM/e/9z07Exxr8gc9vuP2e2vVzV9BzKZTPyAeekrpfx2KEVpNBpPAkRVMMAqQKsNx1eKrrOVi0sviBbzPekssfCJLy0ugJcmK/y0hAhNQEqf20C5WsFB74W8J+psyfgMSvP/XwQ0/+9+t9p/+WY//h1g96eWthkaoZ0ViOpLmi4qKCj8DEpByOygTEm1Y7brqx9ZFHH49EogGfk6LOyHYPPXjDZz953b987+njJw4aWjVYuuC+oaLhxGh/yshOZZONHH/x9HpV1U93h5/4bWf7sVODw0OynHPYhVWtjZ954NYd2xoE4QJjHJ/NfQqNhKVMwOFasEbyHQiEwOvgZNVIZq+88lxUHaXy6msd4e6x9I1r/BubPM1VjitmCVyMpBijs+Lhrtiuo6FQQpYUAy/FyYRlSKeF9rs4v5O7Crn/Ulh5elNLoCJoa6117zk2/Wr7tI7QOe8LAADGOsYGATAgaAipM0MWGIiSdqw3AQGoLrbQFCwYWagamo3L3aPp/adisbRyzvYCAoixgZBaENzBWam9sAuSIHxO7vaNZesbfXVljrfGD51nyBVl1lROPT2S0g10RYeWS4EQngiLiYzaPZZqrXZev9LXUGGvCC6D1RJG2EC4fyJztDdxYiA5NptP57UlTdHACOclPZFRQgnZZWcWk3Nrco04OZB6YvdkZZHgcbC6gWai0sBEVtMRBoAmiapiy80bgitrHSvKzn+TTkXE3x+Y6RvPTIZFhDAkoMCRJT5+RZk9FJfSee3u64vXN7jddqZ7NPP4rnGEgN/JffyWshVlNklB7T2JJ/dMrq5z+tzceEiciUrhhGQYuJDlsKLMdu/20sZKu8/JnbuFz8ak5w/O9IxmxkNiIYyXJKHLxhR7+Vs3Bm/ZEKCICxT3ntH0gdOxntFMOCFpOoYQkAR029naMus9W0saK+wCT0IINR0d7Ix1DCSdAm2z0DYL1TWcDifke28sZWgimYGHu2LP7Z+5/7aKWzcGrTw1ERaf2DOh69hhoa0CJauoaySdzKgGwiQJ7QJ93Srvhib36jqn7WwgcF7S3+iOH+tNdI2kc6JuIEyR0GVnmirtBsKTYXFtg3tzi6e62Mo63qK4BRMTExMTE5PFYwruJiYmJibvejKqHBIzLMNZ2Pk+J0ulPTr68ky3AVCjv7zE6bvi+gbCL+6bIoD8s193DvVFk4kZJHatXN3k9pb+9tUk1o3tm0vXr/IBAF47lD5yIuG1Ew89sHLT+opzLbStqX957/ADH14518NaR0bH7Ni3dj01ODtU7fV85kK13cinjHQ8cfD36omXbErYgbMsobCUAQmIsI4N2cCQxMDJUnbDiE50zP74q0Wf+UcmUHWZA1HHe/XxbhvOeGmRRDqkSFUUp/okPDtutTrOectwFP2fH/z0n/zmh7u6j9rtwl9tvMUn2AEAYxOpZ184cfjIG7xgAaAOAFBbzZeXWAxdNQwdAPDlP7vv+//xy5Iiv99/3qWHJImvf/UjAHxkcb+c+Xym+fo/HN2fMZSH9zz+zIf/kiYvqMBVVP3Aob5vf/c33T0DPq+3vrbIauUw1sdGhv/13x7X1A/fedsqjjv/IFTiC5I88+ip177nuc/GvDtsZQgIywNCJq9OA2lJGyKMkYETGTUn6TxDpnPa8HS2yMP7nKzDytgEiqVJhiZI4rwShQHACGs6VjQjK+qZvBZJKrMxaSyc7x3LDM/kNB2hpWSlAgBsAlVVbPU62AW9FK4akoROK0NThIWjIIAOK9s/kZoIZdM5VdXRWe91jLAOESYghgQJIAEgMBBI57Wx2fyR7njBpAIAkJP0k4PJU0OpaKqQ53nGbRphA2MNIQ3gc2o+BABYedppY+rLnc1VrrZGf1Wxzevkrp0T+lwIAgocVR4QtrR4dQOHk/LSjdwBAAADIKuGqqGsqGk6llVjaDpbHhB8Ts7rYN02RuBJbnEzEgoO1IULJp5WoiklllYGJrIDU9nR2Xwqq15F3wyEFQ3lZf3qSvivgqs6ixc3gcECEd1vP4UZGRACzUCprBpPqwQBz9ijnwUhjBDmGJJjSY4hC8NjoqKHE7Kk6DaesvCUhaPamtwIAVHRu0fSA5NZliFZmqgrtUEIJMUYnsq19yZO9CcxADWlVpeNoUgYz6iibBzrS8RTioFwKqvpBsYYZEVtbFZECGsakhQDA4AwTue0sdk8xsDnYgt5qnWlVkkxUjl1YCLbP5E92ptkaNLrYCGEsmIMTmaP9SWP9yV1A1cXW5w2hmWIbF6Pp5X+iYzVQlEUbKl2lHh5AEAspYyHxPaexOmhFEUSNSU2n4tFCIuKMTqTPzWYsvFUXtI3NnsKeQ+ipIfj8nRY4lnSaaNVHRX7eJ+TZWkyllZmotLIdC6ZVQtJEqqO0jktmlIABm47Y7fSVUWWujIrRRBD07mpqHhyIEmRsNwvcAxJU8R0VOqfyB7tSYzN5i0cVR4QfE42ldOyoj48nUtltWhKKfEJsoKWlFBtYmJiYmJi8pZhCu4mJiYmJu96Ds6OHgyN2m02K3/lGkyEQTiuSKKkSLLVwpSVXuDSHknFZtJhmqZuKKppcgcv1cg5IADlRexnP1KXSCqP/riTwNzfPHwbAGAmIj7/6oDLCtavWl1YU8xlS7x8YobAxgWRkju2lPwmGporwhgYdUWn/veB54ZTk0GP/76V2z/ScN7i3MjE0weeltpfEMSoF6V4Kk8iFWCEEKkgLo8ZjWAgwzMkpckiCVCApRKRvshPv+Z/8LtMUc2lDoRrWM90H0SRDl3Vsa5QNEnTvMCR47ueqS+rowXruTXtHP/ohz/zxWf+v1dPHfRR7F/dcBcAQBTFVCqhKHkMdAAQACCTVSVZwUgp+GwAANasbhaENzsiMo8Sp78rGxqPh/BFmtjkdOzvv/OLyOz4g3+8867bb9i2+cx4w97Xu7/zz48/8cT+murgqtbzhf8txRWClR8KjevoKs2v33pIAlYXWaai4lW3oGqoYzDZPZq2Waj6MtvaFe7aUmtF0OKyMTaB5lji/LwBDHSE84qeyqoTIXFkOn+sL9E/mY1lZFW7St3TaWUaym2ea1OeaeEoS9Ba7LNsXVP05O7hV49OKVpG1dXzbjBIB9BA0ICAIUgOAAAgABiHk8prJyJuO7u+wQ0AyOS1w93xk4MpVUfn7HswQBgpCOkY6xASEJ4fMHDamBVlzo/uqLlhVZAi3wZ/5aCb37EuEEkq7T1xBJY05eACCu5DIzO5kZmclac8dnZ9g3tVrbOxwl7k5RcruAOs6Siakoemcp3D6c6RdNdIStPfrEqIMFY1pBtvkeD+Js7iuRYKaZ/gHai5QwgIAkAAVA2FErInKiKMZfWC0FTdQKqGPA7W62A8DpYiSQAATRIsQ8zEJAhAbal1bb3rnm2lEIJQXP7hs0OHOuP7OiIBN3fXdcUAgKyo7z8V3X8qOjCRvX6V955tpQ0VNo4hj/Ul9p6IvHQ4JKuG08YY6MxMFISAoSOEgGHgQixJYfjPMPDQVDaWUtY2uLat8d2+KZjKqgMT2Z+/ON49kj7UGXPamLZGNwFATtL3dURfPxkdmsptbvXce2NZQ4XNZWNGZ/O7j4V/+dL4gVOx2bhk4aoLgvtkRHq5PXSsNzEbk+7YXLRtjX9tvUs30GxM+vFzI7vaw7GUkpP01lonz5IAQJ4hCQimIiKAwONg2xrdG5rcTVUOhiImI5KkInAm5RVggGkSFurcZ2OypBgeB3vPtpLaUhvHEE/smXxm33TfRBZjsKXV63GwNEX0T2T3dkTae+I8S+5oC1zX6l1T7xqayh3tSTyxe2J0Jocw0HT0TruWTExMTExMTM7x/wMAAP//7N1nfFzHfS/8/5TTz/ZdlEXvhZ0Ui0SJlKguy5ZkK1YSl2s7dhK3tCf3Po7vY398k/g6cXpunCc9duLYjh0XyVa1eqUkSqTE3kAQRG+LrafP3BdLgiAIkgAJSoQ031fkKbOzB4td7H/m/EYU3AVBEIQlL1PITeSzG6ubK0LROQ8YGPWLRS+XLdieYzveYy+P9h/ry46PXrep5Qu/ddv0YXnHPpEZz9uFtJ4MKfNabpQQdPO19QAgUWhrwiHzZI0+XaFvuzo9MVmYPjIRh9ZmScFm2Jy90N99d62b+d+i6/zV9od2Dx2JSPInNt388ZXXT+/ypkbyz3zPf/mHMXsihF0aWCjwgRKPSzkWstRK3rQKjDjVDE4lt5Avjg3Lo0ckVLBHDo3/+Ovhu75g1pxznjtNt/uxZi9jyxgQgM24RSBU34TJ7L8Wkkb4T+782If/489fPPDGHR2rOytq43HztlvWh0Py7r2HC8XCseOjh45kenoHTZNMp6Vv3bJ6Ppd0QTY1dj49dCDvWvtG+lenG6e3+z4/fiI7PDL5gfff9sdf+ejMU67fsuzIkRu++72nB/oHZxbcb2tb9tcvGr2ZYcbeqireJSMErW6PHRsu7lKI67MguMiqoM940Qp6hop5y991ZCqsU1UhmkJ0lcoUl5f48wNuOUHJ9ouOXyj62aI3mnGyRfeiHxQhSEbkNe2xqvhlvJ8AY6TJ5JoVlfGw8ubRyT09mX3HJssZJqdWUg2AeQwAYQkhAgCOG4xknBMjxZ6BvBfwnsHi8IRdsHxeXjUSOGc+Zx5jPgCbWWpPxbRlTfEVLbGVLfHWugjBaGH5+otElnAsJK9qjd6xqfqNI1N9oxc/HjPN8dhk3tl1ONM/Wnpxz3jUlMorPYZ1SZGxRDElGCMABIxBwLjnM9sNSrafLXhTBS9b9DJ5dyLrTORcL2Ds0srXCIEikXhYnhkOvohcjw1P2M+/MT6V9yhBJ9P/L61NzoExjhAqL8JZGVebq83KuJK4PGvSLgjGSCIYY5TJuc/tGtvbkzU06gc8OGuGe1t9qLsxvLYjpiknf1NyBQ8B1KS0WzdVr+uIlWOpklF5eXNkKu8d7ssHAfMDhjGy3aBvuGQ7wbqu2FVd8fb6UMSUCEZdDWHLDvJF/9CJfL50OsofASBAaOZIKgIOwAEqE2p7XWjbuoqVrVFZwlFTrq8ymmuMkYydybuZnMM5L9lsbMo5PlxijN+wrmJDd7yjPhQ1JVnC1Ql1TVs0W/AOHM8NjdtTedeyA0XGE1ln58GMqdGtayo2Lku01pqqjBlDVQlt27pKXSGvHchMZJ2j/QVeY+gKdX3muIxx3lEXvmNzdWOVUZPSoqZUsHzXC04GJSFACBAgP+BFJ3A9JlF03erUDesqmtJmSKcEo5Yac0NX7OU9E+XlIlyfAUDvYHHv0ayp0c7G8MbuRH2VjhGqjCkrWiKZfNWO/ZO7Dk/xS39dCoIgCIJw2YiCuyAIgrDk5UvFgl1aX9/Smqyctevlnb1j4/mnXnWHB+3jfSMOc6fyOc91G9LRNe2p9rb0zIMPT46+NnScBWx5dWNnun5BfQiFlF/8hbUzt7Q2V7Q2nw6U33RVLQB0tG49fzsBYy+fOPpC737T0D7SufkTM6vtmZGpJ/4dXv5BimUUVAJgwDlDks21opQo1m2gNd3xm3+RGJHpU4wgmHzwX/M7H9ECm432Djz6nY5P/M9zPXTq6tunmJd56t+dqWMUPE9S/KZ16evvJsoc9dCYEf7FTTd/67mHv/b4D79yxy831aQ++ZHrtm3pfm3XsSCwd+89Tghdu7pu7Zr6traGs09fLL+8evP///qjOc/6y+ce/OZ9n53eni+6Tz3bp1Jl86arASCftwYGxsIRPV2dBIC2tlZF3T6Vzc1qTVUU1/fOnix/xcIItdWa9VV6ZVwdm3KK8155chbGuO0GwxPB8IR9qmWQKNZVqspEpiTg3PNZyfJtL/D9RYgwoAQZKq1JaR0NoUT4MtYcMQJZwt1NsXTKqIjpuioVLW88a+VLHmPltSI5gA+MAyCEEQByfebm3ePDxTePZhyP94/ao1OO5QRQrs9zxpnHTi+RijFGMsVhQ+5siG5dU72mPbmsae6Rv7cGJcjUaWdDiDNesP1MwS05wUWPi5R5PvN8li8Vjg4WAECViaGRyqiajCha+UUiYYwQQhAw7gXMdVnB8rNFd3zKGc+6frBowRcYIUXGYZ3GQrKuXpYvMp7PJnNu0Zo63F8oT02/9DYZB8Y5AJIoiplyU9pY2xbrbAgDgKHRed4ucGEX1VOEEMYIAByPDY5bEzm3PMwwc1p/+Z+aSipiqnsqc9/1WdH2TY1WJ7UN3fHy0wEAzqWWtDkwavUOFhnnnHPP50XLH560fcZXtkaWNYdrUyfvdqqr1G03mMy5uZKXLxVOP9i5h6tSUaWjIbSmPdZYbQCApOHKuFqT0mIhaTzjFEo+Byja/viUOzxpewFrqzfrq3RFxkU7KNo+AhQLy91N4aFx62h/IVvwinaAMGTy7tH+wur2aGutWRlXZQln8idviKmv0gul6N5juamC1zdciodlTSGuxxyflXO9btlQFTElmWIAyJV8zz85XFFe7QEQ+IyXbD9gXFPIqtbo5hVJdOrul5qU1tUQ3n8sxzn4AfcDxhgfmrD6RkrLmyMd9aHOxnDUlAAgGpIxQeXLvvdYtpzXdOl3XwiCIAiCcDmIgrsgCIKw5HmeRwlR5NnBFH2D1h/9zVOjk0FXcyRmatXrYvFU5fOvDw31n/jKF37xhvWzPwQLdnGikFWJvK6ysfWsxVffGrbv/dHT9weAuiuafuO6e6a3e5nR7BPfge0/jLOMzItAAsYAsGKTyKRcpay8seLWj+Oz+owISdzxUSOk5x75G6U0ZUz2+gOHaU0bAFi5XG54yIxFjdTpUYro5vflZa10dJdvF2UzVHPLx0goDnMJy+oHuzcMZcYf2rX9e7ue/73r7wGA5oZEc0Ni8S/KeSX0UH9hYmBqbOZGSiAe5cAdxnwA6D0+8g//9MDKFQ2f+pW7AKBYKmbzWT+YXZ5OhGMSlfYO91/X1InRYqaKXyYIgSKTtprQ1cuSL+0dv+iC+9k4By/gBcu3nAAhBMDLM5cvdXLyKSFdWtkS7W6MRE15cQPcz8VQaVdTNGJK7XWRp14feGH3sGX7rncyk4HzALjHGGAsIYQ58KNDxQdfGmYM8pafLXrl4h9nXrnaDsCmQ9s1mVQn9BvX16zrTDWnw/HLOX4wf6moSlvxcMZ2Pb732NRUwbvwOfPm+oyVuOuVRjIOIaic9V/OSykXAMsJ4L7PHI95AVvEmiClKJ3U6quMqCkp8mV55XAOAWO2x71yZM1i9H26jXKaebboHhssdjWGV7fG1nfFW2vN8528gMe4mOFCxrjnM855PCxfuyrZlDYTEdnzmDtjMduA8SDgVQk1ndIjhnTqRGAMoqaciirlWnMZQkiRiaqQ8iAMxiib98azjusxQ6UNVcasMTZdpemUGtYlAOAMzjk0w8sp+BA15WREkWY+IoAiE02h+NRiCQXLn8w5rscKln+0v1CygwPH877PA84lgiwnmMi6YxmHc267Qd7yAsZKdsA5z+TdI/0F2w0MjboeQwCEoKIVDE/auaJHMJoquCUnAA7lm4oMjYYMSTuVa3+ei+y6TCLYMKmqEDQja4piJEu43PNyI7bL/IDLFNdWaDUpTZrRskRwPCxHDAkhVL6VRES4C4IgCMKVSRTcrziLO7Guv3fX1OTAIjY4f9nJwbflcQVBeLcZLeaHspmQZhhnBbi/tGtictLfsO7aP/iddlMnAOAHvP+rU9ZU6exqOwDkSoWJqYypGiF1McofC8c5f+Torp7JEw2xqg90XT293ZkaH3/mx/SVn1b6OZW4HLMAYRdTF0ULWr2y/r3mlg/gyDkq3VSW192qPvcdeWoAT/YUXnogeu//AwBOqTS0excJrIr29mhds5I4GYYTWn9zaP3N5+pg7tjhcFN7+T8pPfTLKzdvP7x/+5E9uzrWrK5uXKzrsCCNFemDY30juTMK7iFTueXGtv/4vjQ0PATQ7fvQ158JhWQAOHz0xKOPP1koZk1jdmpQZSQpcfq9157dVN+m0CVQcAcASlBDlbGhKz4yaWfzXt7y/Euby1xWXiKVMb6YZVoAOJUHUhlXr+qMdzWENYW8NQuKShQnwoqu0IqYzoFLFB3syw6OlYpWOeOEA/MBA+cYAAGCiaxr2T4A+AFYTnBybjv3y9V2zjlCWJWJqUnt9ZEVLfEtq6vb6yIhQ35rns4F6SqRJXVVa9T1Wcnxjw0Ws0V3serejHGXcddjAIs2xjMfGCFdoZ314a7GsKlLl+9Scw5BwC/xtoBzcT1WtPzRjGM5QaHkGxoxNRoLy8r8R54QAkxmzwDHGDC9iBQjxnnAOONgqLSzIbyyNVoVV72Aed6ZBXfGdZXqKinnycDJ7yxcVYipSeTMcjMliJ768SCEHDcolHw/YKpMzr41QaIopJeHT8oT68/9OuUclW+wUOkZBW4EBCNKTlexHTcoWL4fMNtlw5N20Q5kCXseDxgvB9ZzDhJF9VVGxJQQQL7kl2yfA5Rr60XbpwQ7blAu8SMAz+cRU6qMq7pKKEEcoPy2IUtYkTAlCJ/3ypdfUQQjXSUSPeNYhBE5udgDJwRxDrYbBIxTgmIhORqS8YzXOcFIV6mqEFR+S2KLcweGIAjCO9y536Gff+zvMV6k+8wWwvect+yx0Hmev3A5iYL7FWdxfxms4pRVnFrEBgVBEK40h0aG9g+diOpG6KyCe2u91t5S0X+s51v/kWlrq7l5awPnbN/ePR2tdXM2ZXlOwbHq4tVRPXz5Oz6HlwaPfPW575u69PHVW+9pPx1Q406OFg+9EecBpZz7LiccsOLiSFZrkFbfbmy+i5yr2g4AAJiQUEWNle0nYOWz4+W0i2hVVfPVV/c+/dPjD3+71NQaa+hQVV1uWnb2NPmTfTj0cjAxPvTSM3DL3eHl15Q3Vofjd6/d/O0dT/799p//9+vvaY4lF+tSzN+dHetePLBr3J14YeTo5srTq8Lqml5dXfPS9r01VckjRwfGxkvjk2x41Nqx8+ArO9687prly5c1z2rqhoaup3a8NDA6vEjTuN8i6aSqKfjYYHEi6x4ZyJ89c/+KghAK6VJDpbGxO9FeH3qLy9OqTGSKb76qZlVL4vtPHX1u19CJEWY55XUaOWceA4wxYCS5LvO8AMpjDxwBZ5y55SQZhFA5uj1syE3p0Puua9y2Lq0pVKYYXxnV9jJCUHdjRFdpvuQFAd/XuziDMW8jglFIl9Z1xtd1xHT1bfh6vLiGJ61s0YuHZV2ha9qjyvzz3DEBIsOsu3AwBUmDhVcNOAfGgANIFCUiSkVUiYVlmGulWIQQRrNXfSVkul48BwSAEfgBdzzG+Mm8+Fm/9QgQPnU+n8fMI4yBkDMfkJ/K/jl1sudzxw0Y477PCiXf8zggYIwHAfcCpkg4bEjplFaV0JrTpqnRgXGrYPnAwfGCbNGz3QAj5PvMZ9xnzFCoqdO2OrMpbTZUGVFDglPJNxgjjM9Xyjmz54jic1bmESCCMeNge0EQcISQqhBVnn08RnD+4r4gCIIw27k/WiZGet7Cfrw9llBa5juMKLgLgiAIS1uumM9nc6vb25qjqVm71i1PfO6TW3ftPP6DH+978OeHe/vaUpW1YyO5u+/YdnY7Q6XsnqkBQGh5sqEzkT77gLfAP7382NjUxPrmzv+2/oaZ2/VkdWr1tdb2kVwha0oK4X7RU6xQWl5zh3ndPTQ+O7l+NoS4qlmcUfD9IJjeHE7Xt227M3OgurDnxfE3nglphtKxDlK1IKsMS4xzSggELuae51ts5yP66LCRLU75o4h5oZVbASCm6fcu3zCay/x8945na/c1r99yGa7KBdxU0/k1oo4Q+Pd9L84suCcTkVu2rfuLv/z+G7t6bNeybaepubl/qLhiWcvnPn3futXtsxL8AeDG2o6/pEamkF9aqbgSxRFD3tAd58BtL+gfKy1itsziQgAyxatao9esSFbG1QVM6V2sDiAgBJm6RAneurra1KRX9o4eG8qPTJTKP3LOPc6AA+IIA5+uajHOfMY84CcjaHSVVif1lS2Jjd0Vq1oTsdAVESMzCwJQZFyVUK9dmZIoDhgfGrcm8+7b3a+LgRHCGK1sja7vinc3huMhhV5JYxsXxw94yfYPncjHw3JrrbmABVSVMMQaIVLPswPIzgICUEyI1kOiFZSLGy3mwAFhRDCazgiabxW5/G557rdMDiBJuHwvS8C45Z5aUPQU12fZome7DABhfLr4fi5n1fznQAmSJYIxioXkte2xyoQa0iXOOeMQBIwSpCqEEqzKJBVTJIoJPjlmkE5qy1silXHVVCnjPGDAOJcplinCBMVCcnmS+6wnOH/o3FOrOHDGGcFIkQmliHFetPyiFcz8OAoYL9q+5fgcACOY7rYgCIIgCFcaUXAXBEEQljbLsmzb6o5VN8yVNr6qM7qqM9rUUHnw0NHvPvCmw487gRxPzTHDvWdqZPvwESJLbdGqpvDbMFP76YEjb/QcicnRT667ddYuEo6F1t/EnXx+x/3YAgUFBRLFK24OX3sXuWC1HYAxls9NIeAIsCSfUdPRqhq0qoZifdv4z79v9e5hOx6SkIdV1eXY9ZmmqsyzKPICr6R4pQgODB1lJ/ZmH/lH34fY2q0AUGVGbmrq/vkbr+7oP7S5o6stPHvY4y0QUkyqKkf7j8/cGA6pt21buf2lA6ZBu7qqQqFQfV1dbdqoSiWXdzWdqymdKmNs6d0Zpsh4bUdMVUjvSMlyfNsJ2BW5lp5EccSQ1nfGNq9MREzpbeyJqpCrl1emkzrFGCGUyTleEDDGOQsYAgCMsIQwRoCAM8YDxnzOfIQAASIEx8PKypbEDWvTt2ysvUIyZM4lYkgbuxOKRPJFHwHkLT8I+NK6hwMhUGRsqNLVyxLvvTadjCjvgOntZYzz4yPFsCndWPIY4/O9Q0KNgGzyeCvkh2HqOCCEwlWQaOWJ9ouIlLlEJ1NgzrUXgDGuStjUKCHI9Vi24JWcYOYxlhOMTtrlYUKEYFFuE1EkrKuEYBQLyes64ytaInWVp++BCxh3PTaRc3MFL6RJlCJFwhJBgCCd1DZ0xVe0Rqvip1cL9wNuOcHIpM0BoiFJkcmpRYAX8xepvHIGIRDSqUxxEPDJrDuZc2dGG/kBy+TcbMHjnOOTWTSL1wNBEARBEBaPKLgLgiAIS5vjuTxgCjnfJ9qWa6q2XFNVXZf40RMT+ULhwYeejEvNd97cMfOYolWaKExRQii8PeHdP9j3asayl6eb72hac/ZeGqsIX/O+HAuyrz8KxSxetS209V6SqJ5Py4wFubHBOCUBlyRZPfsAo3kFv00pbn/QP/A85AdkK6+jACOAIkMIAWMS4gR7wB1KZQOk/OTIwPYnywV3AIiHIo3V1TuHj754/EDbireh4B7XI7KjnhidvXZITU3iC797XySiNdRF5tmUTpUALali5CkIoeqEdve1NXFTfuTloVzJs86sal0JljVFrlmRXNESjZny+dcYfGskIur1a6t1lSAEPYO5ofEiAABwzgMEBAEtp1Rz5nNevpiIUtJeF1ndltyyprq9LrJUsh3qK/U7N6cTEdnQ6JGBwkT2rUsOvUSUIEOlK1ui16+pWNYciYcVWXqHVNsBgHOwnCCTcwfHreqElgjL8y03I4yqV4CRBDsDCHMlDJFaOLV27cX3Z7ETwf2A2y5TZBINyTLFA5nSK/snwgZtThsAwDn4ARsat17cM9E3Wjq5DPFi3PkeC8u1KU1TyWjGefPoVDQkzSy4D45Zrx/MHOzLj2Wce7fVrm6PVsTUeFhGAH0jpZ2Hpuoq9emCO+dwpD+/vze36/BUPCzftL6qJoUoWfy/E8oLq/o+R4DKt6Qc6MtXxNWNyxLTq8oULP/NI9lDJ/J+wDE6I7ZeEARBEIQriii4C4IgCEubDwEGoHDhEsydN3Y2t3h79yb+68dv/OBHz88quFu+M2Xn0kaqIhS9bJ09n739RwPwf+Pa2891AE1Uh6+9Z5LoA7teTTVukCvq59Ms89yJ5x4gToFgycWqPtd9AABgNrQrmma3r4LSVPa1n7PBgyYvScySMHDGGSAEis9kh2u2VmEl2is2n+5nXSx5XVv3N1786eDE6EKf9aL42FXXP/WzXYo2+zVg6PLK5VUzt4xNuEePZXLZwvj4eD6X2XbDirbWmpkHxI2INxl8//D2j3VvWXKVjKgpreuMez4fn3KODBT6x0qOF1whsd2mRpNRZV1H7Po1FTUpbdaqiW8XU5M6G6Kcg+czglHJ9ouW5weMc59zcjK/nTPOfYAAABmqlIiqa9qTV6+oXNN+hSbJzCkeluNhmTFACEkEH+7PT+bdWckeVxqEQFNoPCQ3VunXrkzesqHq1NKa7yiuxwqWn8m5+ZIfC8376SEEkToIp8F3AaGTke4X9ZaFEJSDSSwn6B0qyhRHTelc736yhJNRJaRT5bzDHvxUBLwf8JIThDQaMWhVQh3N2Ad6c6mIUhFTKUHAoeQEe3qyh08UJnOuKhM+o4npPPc5JpOf/12Ng6nRiriaTmiZnHuwLx8NyfGwrCqEYGQ7wf7e3DM7xwbGLD9g+ZJPMQ4bpDKuNlQblhPs6cm21JgYI10hAeOWE+zYP7nryNSRE4W2upAfsOmwHc7nETp/6jlMP5c5jucAAIyD6zE/4AhBKqakk+pEzt3Xm3vzyFRlXJUodv2gf9Ta3TPVP2oFAYeTwytL7HNKEARBEN4lrohvO4IgCIJw0RjmiqJodF6Vr+5GqaOuo60+MTk5PGtXwJnL3aimJ0PznQ0NAIzxHbv7OIONaxoW0OmzPHxkz0h+IhoO3dSx/DyH0UR1ZPN7UfMaNXnhJBkAABaUXviJtf3HSeS6PriJusi6m891rFRRJ1XUAQBKd3mTQ2jvM/bIkZJdJIgDAANKlYi89YNY0jUzHm073c+Ioi1PNyTjyQNjg7uH+1dU1c7zWS+WLc2dnmtr4fBDR968o3Xl9PbMVPHRn7+x78AR23Vc1w2CIDPhDA5mHccvFIoY+02NyVkF96gR9pD/eN/u/9a9ZcmVMRBGEoKVrZF0Sn3wxaFnXh8dmLDyJe/t7hcAQH2lccfV1WvaYk3VhiJfWTOUG6rMqFmPEHK94NCJ7GTO5jzgPGCcAWecB5wzzjlCqLbSXNOWvH5tekVLPKS/nZE4F6et1oyFpKq4+sq+iad3jl7hee4Eo5qEtqoteuuGqtbaUMSUyBVwV8TlwDn3fO4HCxz/QAiAgKTAycrrRV4cjJBEMUZoZNL+4ZP9mkooOWfSeCqm3Lm5elVbtDKunadNzk5Won2flaxAk4mp0auXJxjn2/dMPPry8BuHs1FTwgSNZeypvOd5wclFUxlnDKCcRcP5dFjNzOCaM5dHPeuhAThwSnDElNZ1xVw/eONIdirvHujN1VXqhkaODxX7RkonRqz2utC6zlhthYYxQggaq417ttQ898b43mPZ7z/R98o+o7nWLFr+4Kh1fKRUtPyWGnNVW7QmpZkatd2g3AfOgLNz9uZkOZ5zXl6ctvxWMuvgk7V4zhn3fFZ+Gaxpj7k+e/jFoT1Hp/4qY1fG1UREGcvYkzm3ZPuFks85MMb94IrMDhMEQRAEQRTcBUEQhCXtcG5s58SAomqaer4v/zMRglavSAHMTj5BGDDCLbHKrtQCVkz1PP9rf/qtRDyxcc1n53/W2R7fv8t13VUdyy54pBJLpGKJeTY7/syP/Ke/WVns1WQYDjQ70YTTrRc8y2zqgqYuVtfq5SeZ75ZzqzkgTFW5ee7xgGWp+vc2rfnZ69v3DfYuSsH9RH/mzT2Dba2p9taK+RyvSJLtuNuPH55ZcM/nraee2fXMc9sVXVMV2TA0UzOrKhPxeLy7q6q+Lrxi+ewwd0PTAx4U7CIAX3IzBxEAQigWkqOmtGlZgmK091i2Z6gwNGG/XXOZFYlETam5xlzXEdvYnahJaoZ2xf3xqatUV+na9mQQMMbh0AmeKziMM848AA48AOC6SmMhdXVropwkEw8vmbntM5k6VWTMOSgSliV88ET+2FDRsn3Hu7KmuiME6aTWWGV0NURWtkSWNUdiIfnimqIE6wqVLkMAyCJCCMkSlujCO1muuV8aQ6UVMaWuUi+/DDyfOd4c730cIAi4ImPHY4wBcJ6IKB0N4cZqIxVTZOn0GRiBoZFUVCnvKueMqwrpagpzAIpR34g1PGlP5l1VxqZG6yp0iaKjA8XJvDu9HmrYkFpqTMZ5eZHS8nLH8bDcXGNWJ7SIIc38mWKMoiG5tkIv2n5lXEUIIYQ0hSxrigSMMwaDE9bB47nRjK3IeDLnEoza6kLrOmMblyVSUbX8kKmYsr477voMYzQ2ZR84nh+dchw3yBU8Q6NtdaH1XfEVLZGQLlGCCEaVcaW11kQIVcQUNCMISCIoYkrVCbWpxoyFZYkghJCp0aa0YblBLCSH9DPeA2UJhw0pndRcj5n6yddqXaXOOXddtqcn2z9aGhizxrOuRFBIp/VV+ljG2X00u/gBQIIgCIIgLJ4r7juPIAiCIMzfUGHqWHYUUYLpJRUd+rLjL/YdRBzHVSOhmxc+4RTG2K5dvdduXkCNfk5HB48Tn3/xmvddYjsz9f/sX5zXf5bOHwkTx/WVQE8pNR0XPu0UXFGvzC+1BgASqtEZqb7fcTP5zEV19qTxicLR3tFYWPvG3z9slYJP/cod8zzR1LQJOz+ZPePRU8nwp3/1tvvu3STJkiRRWZJlWVZkWVHUREI35pqhHA6ZCKBQKi7pOgZCaH1nvKXGfPHN8efeHMvkx96ugruh0ea0ed+2+tVt0XhYvhzBx4tlRWs8FVOzRa9Qcku253oBZ+UJ4BwAoqbS0RDdtLzyhrXVi7Ko49tForihSq+MKytaok/vHP3hMyeGJ2zHu4KmupcTTroawrdtrF7WHKlN6ZeyLK0s4YgpX+FBNAQjU6O6Qt6WFKuwKTVUGdmiX17HmHEeBBwhmJkqU55q7rhBSJcSYUWRCEKorkLfvDJZEVPqK3Vtxm0rGKN4WG5KG7mi15g2DI1IFCsSbkmblTF1RUvk+TfGn3xtNFfyDI1uu6qyOq4GjD/04tAr+ycRAoQBACriyoZlCQ48YkgRU8IYSRTXVOjru+Pt9aHKuCpLp3+mhKB0Ul3WHI6YUkuNiRFCAKpM2utDiYhck9Kf3Tn6xKsjPQPFgLGwKa1sjd6yoaqjPtxQpU8vwxA15bAhhQyppdZ86KXhXYenThyeogSFNLppeeKalcllTZFkVCm/GglGLbVmeTS6JW3OfIkqMqmIKa11oZIT1KQ0RSblC7KuI+YF3NRoInLGcJ2ukIqo2tEQ9nyWjCqqQgAgHpLDOm1Km3t7so++PHxssDiZc5Z1xpc1hWsr9F2HMwf78pfhtSAIgiAIwqIRBfcrzgWTAM/WtvyGw3uemnNXTePqtmVbF9pg39HXeg48P+eu+tb1zR3XLLTBmWTVuJTTBUEQZnJcq+QWQrIu0dmfaD/86RvXXd1SkZxdPbds7/f/+LEVy2p/+d5V0xunSqXe8UnMCVngbMH7H+0tFcmxY9kv/eEDt9y08rpNjRf1PGAoOx6WtZWJxQljKT38z6X+A/jws1VBJqwElkNHeExu3xzdeOOitD+nsG6GzdDLI0c3jh1fk7qYgJ2pnLX/8HBnW+XAQAZTY+vW5o72+S7BGjGNseLkZH5q5kZNk1evbF5QH97TtfJvX1YtZ8ksKXkuhKCwIa1oiZg6bakx9x/P7e/NZQpu0fLfmg6kk1pL2uxqDHc3RroawxFTouSKXmGUYBQ1lWtXVQHwguWNZmzbZVBetFOTuxpj7722YVlT7EoeM5gnjJEik3gYXdUZM3V65ET+UH/+YF9+YsoJ2Ns5ZVaVSXVSa04bnfXhjvpQW20oGVEucXHdkC41p42+keJidXJxIQRRU04n1VRUCenS2/IbEjZoQ7VhaDRfisCp2jrAmXf4cODAg4DLEq6vNEydIgz1VbpEU5pCQrqkKac/gglGsZDcVheKhuSIIekKYYxP5tzeoaLns1hI7m4Kp2KK6zFZwk3VRtEKDp3IFWwfI9AUoqsUY1QZUzd2xzmAIuGoKZdzb1pqTFXGiYgSD8nKzII7Rumkpqu0qdqMhaTpITGCUXmmvExRS43p+owzUBRcGVOb0mY8LM8slCMEBKF4SG6vDxOMN3TFS7ZPMJIl3FBt1Ka0iCFNH08IaqkxkxEFAYqa0swhIUXGlXGVElyd0OordUXCGEM8Il/VFWeMSxQnwmfcrqGppCqhblqWYIynk1r5ch0bLI5OOSGdhnR60/rKQsm3nKA6oZo6zVt+yQ4454ZGk1HlSkvoEgRBuAIlq5qvf89vXkoLVnHq5ae/Necu3YhtuP6jC22wkBvb8dx35twVilSk688XMbpQ54qJEy43UXC/4lzEL0MofM56hG5EU9VtC21wcuz4uRuMXUSDgiAIl4nj2rZXSplxRZmd8PDAQ8+/8nrv//j8zYm4Pr3xuw+MPXD/Yzt3HWlpaT2zHS9XKFFEzi7cn981V6Vvv/X2/v6xBx9+pbYmfnEF97/b/cyEW+hOtlzEuQcef9AZ7NEoI8zGgSN7juKXpP49ar4/hbKSzANfyeIEbtkSu/NTNDrfLJqy4cd/WDy2m7gFzj1AKCCKHK+p/+BvzHmwqZmRcLwnO9IzOXL+gvvPn3xz29blzz1/iAOTFXrVmqZdb/S2tVb96IEd9Q21mUx+5+6jv/P5W/tOjP3ssdcT8ZAfOMs76xtqk+dpM6KHMOBc6VLLatXhCKXEdpd8wR0AFAk315g1FfrK1uhLe8YJhuMjpZFJ23GZ6zPfZ4teWsUYyRQrMlYl0tUYvnpZYkNXoq0utNiPc7noKl3TngwCdvB41vXY8GQJAGSJ1qT0la2J69emTW3p5bbPiWCkKaSjPtxRH95/PFdzeAoDOkIKRdu33cDxGH8Lo6EliiWKVRknwkp3U2Rjd2Lr6lTYkC6x1F4WNmhrjbn3WFaRsBdwtviv+ktSDiRpqjaSUUVX357KqaFSQ6XVCXWhJ1bF1ar4HGdhjMKGFDak+sqTH76WE+QK3q7DUyU76GoINaaNlS1RghEH8Hy2pyd7bKhYsHxdpeWZ/gSj8jK/M5ulBNWmtNrUHPFxBKNkVElG5wh6UmVSnSDVCXVD97w+/gyNGhqd81FmPWJtSq+d6xuYTHG58211p8f7I4YUMeZ+91BlosokETn5ZDnnjEPPYGFPT64qoTZWGytaIoZGKUG+z8ezzvHh4kTWKYfUp6KKemXfvSEIgnAlkBXjEqtYhdzYuXYRSb6IxiVFP9cuKqmqvoAVxS7oIib1CotCFNwFQRCEJcz1fdsLVqXrl1fODnVZsaL7Oz98YTQb/NmXb49HNQD48l+8+tAjO0r5wt0fuOX9d54R3u0z3/FsWSKKtLCCWl1N6Cu/d/P9D4869sQH3td9cc/ihd69HoXGyouZ3s7H+pT9T8VgioDNmAMsoIgrECiyLzEESJ1wZNK0KnXf79L4/NZZBQCA3NM/LO59kYwejdqTCvIwZgCBZTsWNken+uXmddGb7pt1Sldl+trWjr/fcWyqeL5b3Z947tDf/sN3r7vmK2tW1/Pyen0S7e6q1TT5umuWPftCX++xvnvet97z8ViGN9anNR2/9MreRFQ/f8E9JIcIUiwvmLV9/4G+P/nz/8rl8p7nlUpF1/cZYEqVgHHPKqxZt+K3PntPe2v1zFMQwrZrLcEI97lJBIUN6arOeG2FPjhm9Q4X9/RM9QwVB8esYFGLjxgjXSGttaHO+nB3U7i+Qq9KqEsr6xwhkAiqqzBv21RPCR6etAAgaqpb19Ss766QLy236opVk9QMlbbWmr3DxYN9+f292YN9ecdjb0EMEQJACCqiSlO1uaw50lZrVie1yphqavRSYmRmioXk7qbIwRP5nsHC0LiduzLWEJ6GEXTWh9d3JspxLu9UsoQRht6h4r5j2Zf3jl+7MnnT+sqIKXMOvUPFl/dNbN8zocpkRUskGVUoQVfyrTCXG0IIA0xk3b3Hsq8dmGysNiynornGrIypwxPW/t7cY6+M9I+WqhNqVUKNmNLFRP8LgiAIgnD5iYK7IAiCsIT5jDlBoEmKLs1eUu9TH77ax7Hv/vDpz/x/j6xbu2737gOPPvFSd2fDf/3jfZGIGYuccXwQ+J7vyNqCC+4IQWWFjrAnyfpLO0bfe+sC8t+nDUyOEpV+cet7L+JckwQGyyS9fgIOA8YQAMEIYeAs4IwSxQcplqgiC6m2j9z/d96rP0vYIyYvYOQy5vmcUYwiFLygMHnwiVw+c3bBXZOksKY5gXf+6eFTuaBU4pxDJHJ6ZkcopAGARPmOV3Y0tTa9+kbG1NmN1zXKMkEIentP2PYFMqZVSZWQFJxVQM7lirv3HNI0wzBCkppMV6STqdpQODYwOPTsM08c7c2UrNkFOISQ611ZVblLgTFSMEonteqE1lBlNFTp8bCcThVOjJRyRa9g+SXbt5zAcgN/gfN/CUESxZpMdJWYGg0bUiKstNeFOhvCy5sjEUOaGbK8VGCMEhF1bUfyxGhh5+FxjFBdpbGqNdFSE1mUCddXoPJk5LpKvb5Sr4qrqaiSiqmTOXcq7+ZLXtEKSo4fMFjEGe/qydeMFNJpWJfqK/WWGnN5c6Q5bRoqoYtaQCxPH17eFMnk3F2HM73DpbzlBWe/U7zlEEAiotRW6Ktaox31IUN9J38pIxipMklGZErw4RMFRSKyRKIhiXM4Nlg8OlCw7KCtNrRpeaIipi7pNRIWBUIQDcnJiLK3J7u/N6cqeGDMqoypQxPWscFi72BRV8ma9lhz2lRFnowgCIIgXKneyX/bCYIgCO94CCPAaM5KUCSsfu6jy2tqq//lWw/95V/9azgSu+8X7vzSZ7tS8Tnu4As4c31XpoquXeBG8rM5tv1P//QPng8f/fB733vrwhLDyzwIbM9KLmSx1mkIAec2ZjZBgBEG8BALOAAEHBCAUwpLxvj+7d6/f7X2I//zgq1NPvWf+R0Pa5mj6SCj4gJ2XQCOEQdKOAAOfAX8KGT45P6+f/1K/ce/Mut0RZE1VT3PfYtf+ep3xiac6qr6L375O4Fv/fVffGZ6Vz5v79s/eNdd11y7uZ1SOjRSeOSJQ1NTGSKRkbFxKmVOjDtWMb/tmu7WpqqzW05EY4EfBNLsh16zuvVnP/kaRhhhhAARQnsH6E8fPvjGrj0T4xNrV7eoyuyhGlWR4QoNfL4kCEHEkHQlVFuhFy0/b/k9A8Uj/fnjI8X+0dLQhJ0vec68C+4IncxWTifVxiqjpSbUWmvWVxqaQjSZqApZrBnKbz1NITUpvTkd6qiPKBJprA7VVRgRQ3pn1wERQDysrG6jnQ3hkh30DhWPDOT39+Z6Bgt9w5btBf7iFaljYbmuQm+vC3XUhdrrQrGwbKhUU4gs4csUYr6qNVoZV3WVIjR+8ES+FLxFKxmcCwJACHU3hu+4Or2sKVKV0Ch9J7+6ACBiSrdfXR0NyT95duDoQOFIf4EQBACuF0RDckd96LrVqevXpPR39MDD/G1cFk/FFImiN49MPf7KCEJIosjzOcYQMaWruuP33lBXMVeEjiAIgiAIVwjxN40gCIKwhHHOOXB0jgmRpk7vu7Wi6N53/09f3Hr99Z//IDK0uaeDIYQQwhgIxQv7ZAwCfv+jx8cmplQ9+oOfPIWw+4XfvLW8q6dnbHKyeNVVjRdsxGOuJF3kPDWi6lxWg0BiSAIkE+QRbiHmAgZwAShTVSpxd/DN5ye//plEVaNS35G8/q6z25l88aeFl39KJnpCpeEIslSwMQuAA8iACCCOPdenHDDmKrJNf9LqfcV74UfS5vfPbESmVKKY8bmTKD75a1+trV/+pf/3TtOUgcPvf/X7H/rYH/zHN79U3muayi03r0AIlS/FVGaC+9mP3LcJADjngAAh/NruwRdfOarKUm3N7DRehUgYgKPZDy3LUmVFbPq/P35gxx/+7+8d6znR2NL0uc994pc+sKa1KTzrFEzesXMGKUGUEE0hYUNK+dxUaUVM6agPTeTcybyTK/r5kud6zHGZ4wWuz4KAM845B4SgvGihLGFFwopMVJmEdBoxpXhITkaVyphaGVfjYRkt/TQIjJGMUWtt+OYNdRLFyYiSuOSlO5cESpCpUVOjLMxVmcTDck1KG5mMjmWcqYKbLXrlWyIsx3e98jIA3At4wDibEfmOEcIICMEEI0pOvmbKt0GEdCmk05AuJaNKKqpUJ7SqhFqdUFX5sg/PGBpNJ7VNyxLRkNTZEB7J2JM51/dZwDh6q16ynAPnHCGkK6Scvr2iJbqqNZqIKEvxXpCFkilOp7SrOuMAMDJpZwue6zPgoKmkIqrUVerdTZFoaPbw57tWxJCa08b1ayvqKvXRSado+67HVBmbulQZVzobwumk9m542QiCIAjC0iUK7oIgCMISxjhj4MNZZdZHnxn6u28+NlYiajSdK+Kx8aK3fe/uQ3J+9GhtdTiken/8xRtnHu95gWX5Wlwm5MKRMk881bfl2lpJwgDg+8GPfvLs1ZtvS9c2PfjgTwZHTsaXP/vcri988W9v2nbVVVf96gUbdD1X1y5yqhqXNFc2864ZBIoTqIwxihyT2iZyqez4HsvaPFxfV4MjAwMnrKED5MDTfT//Zy0cpbrhcmbbJWbnJS+n2JmkVwhJjCoIAfc94hCZqJJbKigSwVjSJQmQB56HGVe4o9ljY4d2pmcV3GVJken244evre9dW9M4c9eLzx1GTP74hzdVVZ4scH/19z+0dtOvTR+AEJLlmX+WcEqRqp7x47BKdqnkzTkJm2KCEWJ8dob7tOdePPilr3xr587doWjkzvdv++ynbl+3qpaQOSbUUowZO2c77wwEIyKjukq9rlIHAM6BcZ4repM5J1v0swUvW/AKlmc5QcB4uUooEWxoNKRLEYNGQ3I0JEVDsqG8Y+OWW2oj6ZSJEFCM3m25DRihiphSEVOWN0cY4wHjQxN2/1ipb7g0OF4am3JOhREFJScop72zU2lEBGNKkCKRcpaLqdGQQeMhuTKu1lfotRV6bYWmKkR+y4OnNYWs74ovb46MZ92jA/kDx3MlO3A9RgjCl78vnCPOgTFWXt6zqdpc3hwJG/TdE8CNMTJU2t0U7m4K50veVN4rWD4AJKNKSKeKRN6hbyQXCWMUC8k3XlV53apUoeRPFdxcyYuF5Igpmxp9N4z/CYIgCMJSJwrugiAIwhLGgTPgcNY3dcuyRkdHMzYdPnwCUV3TQ2/uPMHcoszt3chXKLru6nV33hCdPp4QIssKxvSCM9z/6I//8xvf+Le777l31ZqViErPv/D6K6++/pX/9Yc3bOQ/+L5vGHEAODGQfW33xNbrt23Zsno+zyLwXN1UF/jUTyqCMuqEqo22dG1r+J7fRvGq4n/9+cSR1/sHDjRLtqaCFMjUjFd86huxkd7hb/yGkx2PyoROZnAOVPBDQQn5lgyuQjGVMA+Q4+OcL+e5bFMTgapFsMScID8ZAicucQAfMFe4a0KxMDU0qzMypYok267teLMj16emsrl8DmH41397BiPkOIVQrLpkw/2PZu66NQZnWbemdd2aVgB4/c3h//zhS1uuaUzXNLa31N60pX3O64ARQRz5cxXKd+/r/9IffvvpJ59XJWPrDds+/+n33HzD3I2UUYJh8eKqlwSEAAPoKiUYRQzmxpnjMd9nfnBy5nJ5hjsl+PQkdwnLEj77V+8dgxKkKwTKaxi+o8Nkzg8hRDDEw7Ii4YqYWrTCthu4HvMD5gU8CPj0bRDlLCmMEEKIYEQIohhRimWKFJloCilPn1cVQt++6ylRHAtJ7XWhiqjiBzxg/K374XJgwDEgVSEhnRqLtzDskqPKJBZGIZ1yAE0m0lwDn0IZIcjQKKUoYkqyRBQJvwXjQ4IgCIIgXDpRcBcEQRCWMMYQCzDw2V/W776t+e7b/vtcx/OfPjniONbMajsAMOAB5xgwggt871+3bvWHPmR/+Uu/qOsKAHzoF7ru/ejU3n0H+k5UypL8s5+98OTjT/zef//Qb3/mxvO3MxNnTCEULvTQc8KJ2mWf/7NoVfX0FuPe3zEAAKDv926rtEYNHIzufU39/teND/6Pyt/8u5EH/iHTu4/kRnFxypA8UwooDgIOpYCUfCWPwq5eRVPNVR/4nFLdON3m2Ld/f+LIK27mcBx5soaQ58ksr7IiDwI0I4AFY0IJ5Q4EbPY9B5IiGREdY/zxj26d3vj1P40ipOTy9mNP7rvrjpVzzpVe2Z06dqyKEFjRGQYA3w8AgHP+8M/fvGZjWzIRKh/25VW3/8fjD7Ngdili1+6eT//2/+k5OnzDtvf++ifvvHFLNefc9fzpnHlKyayKG3lX1jMQQoqEFJFRcArB6F1bD50JIUDoZNTMAlZevlJNx+akkwterkNYLBLF756p/ZeofDeSIovLJQiCIAhLjCi4C4IgCEsaAo7OvUjnbBiju26aY8lNjDGlFM2j5n3zTR0339QxYwMvFoYee/Q/P/XJz3zsI+998snH77pj8913dJf3BQGzHQ8AqYpEzn0POAZ0VijOfLWs33CuXfVfe2Toi7dJzqAK1sD+11vtopxI1338KwDg9e7JPfZNpzjhByXEPNf3XSTTcEXq1k+qrWvPbir14S8DwOQfvCc7ejDFAgg8iQApTEw8e3/yhtOpMpwDMJjzKlqua0ZjhBLXY5KEEYDrMcbxyPDov3z72M7Xnu/tOZZMxEslixAMiHMOnCOMCSAoFEuyLPf2jLEgAMIxxSMj469s357N3PWBe7aURz4A5p5sXSxaExOFlSvWXXvtluMD/tf/+oWJ8f5sPsNZUCpaiiT91ufvWr3yjKVuESB8UYMfgiAIgiAIgiAIgiAK7oIgCMIShhFggPkHgBRK5YyMIGyekZnOGWd+AJzzcyz4eS4SpV/43V9xPPd9tywbGJxKRPK//onTM7iP9Ez+47886bj0lz54TWe7GTK1ORdHRZj4fgBnjhtwxjyrhAmh6sXPxGTLrhvf8Z/pmOwUegb++Ut1n/3zk91uXJ741T9daGuR5TeOPzfpBRMScjmWgwAH3hkRLjxggR/wgJz9AyGyMlW0goA99/rwdWsrZYk8vn2yZFnVVbE7b2kEuGHhT+7Ds/6PkMdhdgS/RGWVKvt2v3n0yBHfy/PAVlVJlhTOcRB4qVS0VCrNbphzEXAgCIIgCIIgCIIgXBxRcBcEQRCWNoTQ2XObi6Ugmyt5AWOM8XIZnXFA+PuPjJZcz7UnvvS5raZ++h5tzjnjjEPAFlhwJwTfeioQXFYkRKUf3P/q3e9ZEzJVALBsNj7hHT505LXXX1u+ouY3P3v3so70HK1g7JwVPu4U8vseuV8Lhbpuv2dBXZop/cHfPbHviWJ+OCbLxUyfl52QIomzD/MdBxCisnz+1shdv+W8+aqVnZI4cIa8gBMtNPMAjwWu7xuglsdBZpJltWR5jPEbN568Andcl/wdDIE/O+394ozZeR8CFsy+jOl0xWc+/cuMIUWRQiHdNNTWpkh76xwX4fSz4IyJLBFBEARBEARBEAThooiCuyAIgrCEIYyBEECzy7vPvTzxD998YjhrF12PBS73fQlAUqJTru64jkFzmzdseN/1xvTxhBBJop7vupdQ/7Ud56VXXu05dFSWlJtu6CwUrdd29RBqbt2yfmj4UG1Npa7NvTJqANw+q+CuhiMtm7fu//mPL7o/AACYmF03ZF+/PxGUtMyxoe/8Sd1HvoDMM/LrA9s6sfM1NRqr7lp2gdYQ0Ppl1ps7wwQAISWWSl1328z9tuvkHas5lo6b4ULJsR2fMVbI5w3dKBXcVLwyX/JHJ/IEIwDEAi6T8wTtLMyfvPkwolLgzJ5aX5uO/PonrllQU0XP896VMe6CIAiCIAiCIAjCpRMFd0EQBGEp4xw48LMSTHQdtTTHm7BsRKKKppm62VBTnylGH3rqtd27X6P+VMQ88wTGEeMM8YD5F9eRgPFszonHI6vff4th6i++evylVw787OFXr9u09tc+dX1D3c3nOVemStbJzfXkmF/IOdmMEoldXK8QodH3/+bgnscZy0UlG4/sLb3wgHHrR2cekz20e/K1Zys3XT+f9mhtp7+HcuAMMCPKrN2u7zHM1zU2dldW7dzX1zuQcRzvicef2bR2NQR0bHTopZ39IQNpCkUcW8UAIwZo3gH85+WxgCOQpdmRMhch4BxEwV0QBEEQBEEQBEG4KKLgLgiCICxhCBAGhs4quG/ZmNqy8dbp/45l+NDQ8Ld/eujI/ucTJvulOzdsvcqYeTxGiCLkB77nX0zB3fODvfsHdh/IfvS+2zetqylvXNGdrmuoa6wNN9RdoApsyvpgZuJ4ZqIlUTFrlz02Mvj8E03vufcielXGAUqEBCwIo8Ar9OdOHJj5zP1cJnPgDSVwI7F51PQRSm25ffSxPwgwtbjM1NCs/Y7rlKxSOYx+TXf9mu56AGhvSNTXJF/dcaSmJvGe61urK08/0Fe/9s/8opeLPVPJsXzmSXTWQArk8qUDB084joMQxphQSaKUEIwoJYQQRZWrUmFNOyNLhzNG0RxR+4IgCIIgCIIgCIJwQaLgLgiCICxhFGMJoalSIWtbkXMsLnr4ePEHjww+/OBzo6MjN29ru2Hr+g/c2jDrGIwxocQKbMdbcKRMELA39xz72te/vXHDVR/5hRXT2xtrIzde114sXbiCnzRjh/v6/u215/7XLR+YuZ0QImHIH9vNM9eiWNVCO1bGAeyAc0wws9WgUCiMuROjcqICAILCVOaFh6zXn0xuuyfU0jWf1pyhPs6Ri7UCjeudG2fuyjn2aCHPGT9z8VdYu6IJAIKAOSWHMzY8kueAEEK+P++1buehUCr5gS/R2TPT9+3v+8Sn/yyfzcmKzkGSFcU0dVXGmiorqtzQmP7sp27tPjNYnwdcJoswU14QBEEQBEEQBEF4FxJ3TAuCIAhLmESpSuWDw4OHR4fO3ts/4j77cv8f/p/t//bdRx0ffe7X7vyb/33v2dV2AKCEyIpsB67lOQvtQxCw/Yf6j/Ucp/isYey54m7OVher0pB8Ynx4dq+oFIlGyPB+5/XHF9qrMzBAQAAQRj5MDWd2Pl/eXOrZW9zxiBlM6fMsL3M2+exPALANuhVpjNzwSzN3Hhodfrn3qCapmjw7agYAJCpbBY8x3j+Y6+/PnhgsHDueA75oa5MWbQs4KGdFyjiO5zl848Z1975/29WbVgUMj0/kOVdsG+1+48iOV/bnssXZbQVMpRKIZVMFQRAEQRAEQRCEhRMz3N/hDu99+vDep9/uXgiCIFwuiiRrslayrZJtzdp18MjY937W8+RzBwol9/23r7hm49r3bJ0dgTJNlmXTMN3MkL3wGe6yTO95z6Zi3mXsjGSSicnSa7uOGrq0dlni/C3c2LT8pdd3HB8bnLVd0s3qti5r6PX84ddR59VKTctC+wYACMCE/8venUfHcdx3Av9VVR/Tc89gBjO4bwLgJd6iJEsUKVH2irKuSJbPON44srNONhtn/dZJ1vHz5r2N93n/yG7y/JyVbGdtWU6eDlvS2pIsWeJlifcFgsQlkrivGczRMz19VdX+MRIJAiAI0pRExvX5D9VXdc/0YPDtwq+YzBgHxgG4VTDTk+VF3MjK+qgXUzk7wnPTKBS/zL44OOmzfiSVuIoic59b5Ir61MxMxBeK+MLzN2XMDYX8hJANa2tm75Dza/Psv2CWAEHA452/qLoq+fgfPnLPtuaunux//86zErY++6kHFFl68gc/m05npfll38uBuyAIgiAIgiAIwqXp2clnnvyTD7sXwvVIjHAXBEEQbmCypHgUzaXMoXTOomdeOPTKawdi8ar/9Pj2b/757a11uKsvs//46O6DZ17dfepI9/DslVVJCXr9lDHHda6iGz6f53Of2rp8eX1P/1S5pVB0dr915sdPv9bT03PZze9rWhnzBkZz03PaJV8g0nmTxk167lh21zN0euSKe8aYc/rtCHIU1wbqcswR2LyUAwArM22N9AagqFGd9u+no71L2B13U+9IRCkp8ejGj85ZVnRKBbO0Kta4Il43f0vXtTChc6dIRQjg2lRL14tFAPCrcwN36jqMWoGACgAYuZwXOtoCH91Wu/X2ZHNjwOuVCLloKHvP9IRruco16pUgCIIgCIIgCILwu0aMcBcEQRBuYI3BWEe4pjc/xGBu5ZbxyayLvf5odWYm/eSPh4905/JG1mGuZVuGUdpya8e6FRdy4bjP3xFL7hkuR8BXzLLdnv6JtpbYd7+/q7le2bxpdXUyGvAr92ztWLV8gfR5vnggfHz67M/7Dz/Ytn52OwdAiGusUOzfV0g2hLZ96lJ7WBBnbnHn015alLgDwLHEAdkILAAwxs7mew7UopKCnJKewsX8Zb8T5PY+q1g521vp3fJJ3+rbZi8aLcwcnjpDJLw23tgeSczfVlG0dDrX05dOpUzqWooiWza3bI6w54rO6FIMs4QBxYMXTf1qGO65wbzfK9VU+QHAskzbLOH3XmKjZBBCJOmi836996RtO5WRhecDEARBEARBEARBEITFicBdEARBuIE1h+KrorUnBt6ZP9lpc0tj7+TI2PR4dtLRJL52peq4IY+mYUIwxu1tVbNXjvsCy2NJxGHC0Afz6YbgZYrAzOY47i9fOfTUT9+8fcstbx16p28ArV+3IhxS775z2d13LlviTpqqa8l49z8ceHVO4I4kGQfCkq77SmPFk29Idct8F6+wuMLx3dbMSIiVEGbAASHOucPBAQDGXO4WgZdkTImVtc+dVls3ksglq8qk9/7CeuV7EkJWqKb2rk/MWdqfHn/93PGg3195ceR9HmWgevyUguNQ13UBIdvhqqpNTc/8ete5YEDZuK6tvGbRcHK6VZ3wL/00AcBhjoTx/Ss3zm7M69bp3lRFhbe+NgQAjm07tonfe6RimoZHVVXlokJAGT0PDKLBMBJF3AVBEARBEARBEIQrJwJ3QRAE4cZGELYt27DMOe333tXZ3lGNJU9I8/i9nlXLVLxoHTWCsARkIDXRMz12RYE7pfx0b+btfSdPDpjBcMWmDWsk6ZLF4i9lx/L1z/a9NZqa3HWub0vjhZheiiSVtR8r7PxhjFh0cF/xNaQqfyI1rF7ibtOvP+UzU5rCmMkwAkSRRDAGBACYMYkzghg4poaK+f79Vuet3ksE7vk9Pyu+9rSXugU5UrHt0/NXKNpmuqivrm9aXbPAnLQAQJlNCF/eHq2uunBtEVi6PnO0ayJecSFwB4Cxsczo6NTGdc1j4zOOSxvqLlNc/s3BXodTAmhLQ8fsdr9fvvWW5sGhd7/t1NWEP/+ZbXU173YgHNYUj0dRLvouVLItxCEWii5+REEQBEEQBEEQBEFYkAjcBUEQhBsbAURdd37t9c7WcGfrArN3XooiKV7Zk9P1jJ5f4iYvv9GFEY6G4x0dnX/zX/9w/3E0nc6+sfOISgrf+vq9Sz80AKyvamxK1B48eeJnXftmB+7YH0Ftm/W9P484wxFsF4b2ZX6Jcce2QOfNSnLhaPu86Re/p6T6K1SHMJtyAIwQQwhJnBEAQJggJHHABIHGS4X0QPHAi3IsISeb5+wn9fpPzN0/CbhGwSXBto2BtVvnrDCYnX5joEsmanuyriG8cFS9emXDU//60u63eh/csdHjkQHg5dcOh4L47i11GCeUWXOUUooGRwq6PuPzSi+9vO+mVc2XDdxf6TvKgGmSOqfd71O237U8PfPuhaquij7y0JbzSx9+YItLSUX0orLvuaKOODy4bD26quJCgiAIgiAIgiAIwu84EbgLgiAINzYJY4zR/BruiygUze//+LVNG9bcsuFCgXWvoka1YDqT00vGUnaya9/wt/72B+s3bfjqH99XlQxWxhqX7U//1X97Ws/PcDZ3Btel+Oqmex/vPn167Oycdk+iIXjz/cbOJxKqS1iB9e0pjo8Y4334jkel2vYFd1U68HJh8BTf92yS5BW7CNzBMgIGwAnHqiv7AACrHlcLlgrER7Dk2mGWLfb8SrezuLpd0UIIK5Qzu6QjI8u7d3rtTNGVlJr14e2fnX+4wZnJPf1dG2taP9a25lJn11BX+aUv3P/yr07PpDI+r2a7bNeeI9/4q8+t7LwQ0Od1c9+hMwDI75cPHRkbn5iurEy0t9Ve9tJNpKc4gM+zQOF1v8/j9y1cJn792o75jfmCjjnakKgXcbsgCIIgCIIgCIJwFUTgLgiCINzYPIoqy+RoavjW3HRL6JJDoV96sy+nlz57/00AYJr2cy8dcFhoduDu83hjwchUOmvRuYPl53v11yf+x9+/MDntNjavbmkMAYBesLpPdVFn6nOf3v7IjuVXcSJbats7qhv70kP/a98v/mzzjvPtcjDqb1tf3Pd8ySoq3Ipi7i0OFo5n0qlhqGrHgVho/V1KvAYASt0HipNnqD7NT+9FE/2VuKBxk1k2KIAQZhwYIY6kqdEqANCqm/wrbjN2nrKoqSGuIVumqWL/69bZ/a7kJ0RDGFApL9m6pio5pOKqZZEHv4wbOud0ezA3/ezpt03L6gxXd1RUwaVt27IhFIyYJevZ5w88cP/G5sbtd21dO3uFomGPjufuuKXFtLnlIK/X99B9N0fDl59VNZ3LMsajgbnl40fH0j/5l12MsbraqnVrWzvbF5jNdY6SbUmSJAq4C4IgCIIgCIIgCFdHBO6CIAjCjc3v9fr83rP5yfFCZk7g/r+feCMQrvrEjjafV9r1m6GDh0+WA3dCpFhl3dDw5OyVW8OJ22s6Tp09R/nlB8sfOX6uWCStyzbt3ds1PnTigXtvvWVj/R23tq1ZmWhpbVAI2v2bsZrqQEvTlRVz/+t7Hv3Us9959vTbswN3AFDq2t3bfk/f9X9CmCvU9rG85Biloaw1dsyR/dm+N+VghSp53Ilhlh3h5owPWQGPK1tF4AyrCBCiDkJEYgjzaFV80zYAkP3hSMvq4smW0pQjY0NyTQnZAZl5OHVKOYxkIiHGKFKVSQtKtcurHv4zpWnl/D6P6TM7h05VRmMt8csPRV+/tgUAfvqvb3A5kspNP//L4wRzRZYwIqWSOzg0HgwFVVU+1Tf6xd+/fWhw4hcvHahKVnDXdh0bYaR6PJZDT5w8yRj7/O/vqKqKlXerG0VCpER8bp4+PpH+3pMvcEa8Hrm6Ot7QlEhWJivjsaamug3raqoSC4yIdxn1erzz2wVBEARBEARBEARhKUTg/m9c24o719zyyIfdC0EQhPeR16Npmpa1CyXHmrPo4IkJb1B54J4WH0AkVJ2ePFhul2S5pbVj8J3Ts1cOKVqtN4IR3j917tDk4IbEYhXSH33o5u1b1/3nb7yx/8SB1sbtbS0VikJuWlkDUAMA3adG/u+PXoxEtS89/vG2ptjSz2VdTXM8HEkZ+t+++tw3Pvp759tJIIIbVuS8lZJFMbNlZqvIkbjlcwucYjpyBjjCVMIMcewAdggwcBGWgVkcS8BdYIABK0VQUDihxqvLu5UbVpI19+Z35ZCbCkhIogamroIpwYQiRhm4kjbjqFLz+sod/1FtXDG/w4PZ1BOHdpqus7a1dUvrAhVaFvTlx3dEY+G6KhUjQIgTjBFCrsuCAfLiLw9l0qOPPXJXQTdMw9x0c6tP83DOOKOAgBCJMp6o8nLOQyF/eW8/GzietUv+oO9ray+qm5/Xzb37+mVZ3b793xULhf6Bc796vZvSE4qMw0F/Iq5tvrXjc5++u6UxeX6TF/pPzFhGNBgUBdwFQRAEQRAEQQAAfzD+6Bf/8RruMDsz+trzf3cNdyhch0TgLgiCINzYViZrV9c0/L+Bw4Y9N3BPVtUcOTFs22sBlD94tOWHPyy8vr94980+ryZ94r5l3/h2397DuY+sD51fX5OUgMfTMz10amJo8cC9tSnxT/98qPvo7ocfvffP//iO6uRFI9kliQQCaiLuT1Ze2Qh3gvHfb//3f/DP//OVs4dqu2NfWHFhhk9P8xp786PmG08EwQDuIAk4ptx1JUmSgDPGCEcYEQAGjHEEgAhCCoAJjCMORCVFkA0lpsYunBfyBn233m/a9uTbz4FLQ8TBYCHEXYR1qpSQ1yCJise+plU1S5UNMC+Dni7pPzixe99A96b6tj/d9LEKr2+Jp7lyRRMAAMwdSC4R5lOR6+A9e7oSichtt3bG48H5m9fXX/QMY/dQt6kib4GvCFfPbtd1o6vrnTUrav/yL+5xXbrnrZ7v/tOroZB32bK6seHpo0eOJesqGcezN9k33JPnpXWxDiwC9+sVY9xyGOMcABQJyxK+7CbCh8h2me0wy2GUsvlLZQlrKpElTPD7fsdxDpZDSxbVDVeRccArfTDvH8a4Q7lhurrhqjLWVFI+5ff7uFfBdlm+6EgEh3zy4h+BjHNKueUw06KmTSnjiox9HinglQGAMm7atLwIAAhBqkwwgoLpIoQCXkkmmGBkWK7tXHhX+DTJ55HK3SgYruVQynjQK/s1CaEP7RmoYdGCcaHKHCFYlbEiY+W6fAUFQRAEQbh+iMBdEARBuLEFVU/I4y1almnbcxZ1dnbs2T9AKQWAmqQaqEj+5vD4Hetannk109U1MJXKnxu5KHAPar5oINSXHzcc87LH3XHPspPdH/3Lv7inOumfs6ixIfa1rz6kKiTgU6/oXBCgmxJNm1tX7Ro6tvOdY7MDd+ILkWSb7kkUi2aAUM4dRhkhCChFmEsEEMbAODDGOecYAQC1bAkhQBwwUCxlXNWpXRfd8tjsI5JgNLrtE0TVZva/oOtDmBYo57YUxLGayL1fCcYa1EQDkuQFe5sp6m+cOiRjsrZuWX3oCgbyX0qiMvKVL+8ghHDGvF41GFxSaZcxfdomtE2bW0+mZJRGBsc2rmuvqfIBwIkAQZhuv2vVZx67df/+iYJufmRTZ31NdPYmKSNjE/pHt21TiPiCdJ2yHDY+Y5oWBYDKiBoLXdktJnzAcgVnPF0aT5v54gJzY0SDSlttIBpU/Nr7fse5lE1nrYGRwpG+TDLqWbsskqzwRAPK+31c22UzebtnMH+kP1MX9zZW+cqn/H4f9yrkCs7+7nQ4IG9eEZPIYgm34/JCyR2dMgYni4MTRtF0qyo8HQ3BtW0RDmCYdHCiODRRHJw0AMDvlaorNI9Cus5kFRmvbYtUhFRNJf3D+sTMhV+1K5tCnY3BcjeO9mUmZsxCydnUWbGiKaTImHxIifvotHGsP3v+x6BPSlZoVVGtMiI+eQRBEARBWIz4e1IQBEG44SmSzBxqzwvcq5MxSulzOwuPPxx46jVSoLHnXzh4cN+JM2fHJMIRAtu5aJN1tc13ta48eXD4wNjZ2yZHViUWK0peWx38m6/viFcsEAqrqlxTHZ3fvhQeSf76XY8cf3700LmB77z53Ne2Xigs4+/cxLZ/PvXak6zohnFJcS0EDBCACwAAiHNAHGNAnANDnBIFg8XABRvhHAsagUZvwzoyLxmX/OHIHQ/RdVuBOgAMgHNEEFGkcBxJl0yFJou5b+/++Vg69fF1t31hzR1Xd7JzKIpUXXXF1y1v6Jw7rfX1c9pN05pOZRqaGss/5vJ5hKG9vTER9wOyXGaFQpqqXPRFKFcsUs4SgbAoKXPdKppuz2A+q9uKjDEOXcPA3bRpyaIli8oSjgSUxQNHYYkkgjwKkQjKF53+Eb1YcgFAlrBfk1pq/MkKjyyhaz68nXMo2dS0aMmiHpVEAwpCYLtsYLRwqGfmcO9MdUwjBMlSZHbgPjFjTs6YdZXeq07DOQfKeK5gT2bMWMhTzmRNm45MG93n8vu700MVxnTWioXU6y1w5xwKJXd4yjjUO1MT11Y2hXyatOAw/PI5jqdKR/oy4+lSOmdNZa1iyR2cKJoWq4x4prPW0KQxOmXM6LbrsqJJ9ZJTE9M0hZwazHsUQhmsbgm11QbSeat3KJ/R7fI494BX6mgIliw6Ol06cDo9NGkYphvyKYmoJxZSNZVc0Rnli075XlYVrCkEX+17jHNwKTszVphImwCQjHqWN4U0hSwSuJcvUbZgp3JWIuKJvP8PdQRBEARBuA6JwF0QBEG44QV9Pp+i7j3Ts6muvT1edb59yzoSD6Mf/OiZHz2NJtNqsWCpUV9e59u2bF65ovbjd2pzxlBrshLy+DDGg5nJ8Wxq8cAdABZM239LCKFlseQT933p00995/mjeyPB0BfX311ehD3e4OYd1DXTv/6+ZE4GMAOwgXNAAAgBIMY4IIYRYARAOTUZIcA9gZIt5eVYeNXWwJ0PLXhQrPmxNnec/iKypvF3u1/c3X1sXX3rN+98JKIttZjMNfeT43um8jPMdr5++31zFnHgRIJkdRQAxqeKx04Or+4Ibru9GQDGJ8YYt/3+ud0ulUzpQxtJKSyJbrhHejOTmVLIJ1eGPR1zn7NcvbzhTmXMqRnT75X8WlgiVxbwCQsK+xWfR/IoJKPb3WdyQ5MGAAR8cmPSt2l5xbK6QDSgSOQaV+fgnOcKzlTGnMqY8bAa9smEIMth3WdyB06nz44Xc0WHA9TGtbbaC1W/+of1vSem772l+qrTcMa57bChSWNv1/TGjopyJmuY9Nx4sXcw3zuknxsvTmXMjZ3Rlpor+Lz9ADDOUzlrYKRwpDejG+6MbkuXqLfDOXdc1jesP/XquZJN/ZqkSNhyWM9g3nZYfcJ3sDe972TaMGkkIK9rj6Ty9sFTM31+WVVIJm9rKilZNBZU1rdHXcrH0+bJM7msbgPAqpZwOac+O17Y150emjQ45y01gZYav88jXWngPp21xlJmyC9XBBUlgq86cA945fqE762u9O5j0wDQXO33qKQmtsCE2+cxxi2HDk4UD/dmblsVE4G7IAiCIPxuEoG7IAiCcMOLBsIV/tBkJj1T1GFW4K6psKw+PD09Vl1Vd/um9pbGuk/eG8cYybIkS8SjLvAXuNej+TzetJ7NGPoHeAYXwQg3ReIfab7p7eGTPzqxyx8KfLL15ncXKVrk9kcpc8d+9UTSpEGPijAD1wbqUmCMccIAEQAEwIEoMsea7qpT3Ke0bArt+COkLhYTLJHh2t89unP36WMBb2Bzx5oPMW0HgN/0HC85dkDxRuc9MIjHK/7DVx67Z9sKACgZhuuUksmw5pEAIDU1jTkJ+C7a5NkTh1P5fCIax1gU570ecQ6mTdN5a3iqeG68qCpkZXPYdphE0FWnabOdPpc7MZDVVNJU7aeM//Y7FAAAIZAkFAko0YDCAWyXAQDByKeRsF8JemVCrv3/kziUHx/IDIwUNJV4VVJ+LSWM4mE1HlYHJwy/R2pIeMsFxwEgW7CHp4yjfZnjA9nNK66+Ola+6Bztz/QO6kMTRkf9u/NPSAQHfbJfkwhGlRFPQ9Ln9Vx3f39RyoenjP4RXTecqYx5tC9zU1ukdaGnArbLRqeNoUljJm9jjKJB3FYb8GvS4IQnEfEgBAXDTeWsgFeKR9Tman/Yr9gOVSTiuMwwXVXBNTEtHFAIRpVhT01M6xnMl98VlHGMIeCVYyG1MuLRDde0acgvhwPKFZW8p4y7lHedyR3vz27sjPo1if8Wd3PQJzUkfZpKyp10KKOUL/7xkDec/hG9ZzB/Zqywqjm02KqCIAiCIPzbdd194RMEQRCEK3V3/fLuut4Xuw7opeKcRd/+5oOU3o8wJhhjjGXpMtFOLBhJhirODQ8a7twpWD9IUc3/13c//JWX9e6h3t3dR88H7gCAZTW+9TMljy+386e59KjKSl6iSpgSRCUVYcSBcddlFpIM8OQdpaRGw6s+UvGp/4Lka1N8w7Ssf9n1iu26D9+y9U83bLsm+7xq44U0Z6ipshbB3Fc2URn67GNbZIkAQGN97Nvf+sL5YM+jkJpkNBi8KE4aGB22THvtqtWSKOB+XeKc54rO5Iw5njbLA6XHpku5ohPwSh7l6kejcw62yyybdr2T23si1dkYTFZofF5Exxgvp/AIIYIvnxFzDpxzyjhCCGNAsMAmjHHKOXAABAShpcwMyRh3y5Miz+oG45y9N/fkpfq24IZXjQMAB8o455wQhABRxjGCBZ98YIQCXinok89X6VEV7NfkgHexYcuMcfbef++gebMYl6t2AFyYyxkhKH8ImDbN6PbRvkz3ufzyhmBj0sc5B0CyhOsqvW21gbGUWZ/0djQEIwGZc3BcNpE2D52eOdqfeWe0sGCt+aVcENOiY6nSW12pM2NFlzLDou+erIwrw56auLc27m2vD6xsDoV8F82KwTjnDBhf7K0y9+Jwzth7F+e3nlC0fAsMThQHRnTDoqmsdbg3UxnxLBi4Oy4bS5XGUkbJoj5N0lSyrC7QWOWrT3gBACEoV/KpjKjJqNZU7a+rZOXIO1dwShZVFdzeEEhEVIQgHlarY5oqXwjTy2+VqgptWV2gXIaoJqZVBBVFvihwp4yz927GOaWfOAfDpBndPjGQfftkqi7hba31z4/HOQfG370dYP4vj/dWYIyrMklGidezpE+Y8ttpOmMd68sOjBUm06WiSeevVu4/B8BLfsUFQRAEQbjh/H8AAAD//+y9d7QlyX3fV6FzuDm9nN/ktDOzeTG7i8UiEEQSQFAiQcOySImmDNOH55CiJYjyMc1DHdo6JkWbIiXTNEmIECgAJAKBBbEAFhtnNkyeN29ezjenzl1dVf7jTg67M7O7wGJPf8788V53V93qrrr3zf3+fvX9xV8pY2JiYmJ+4hEQMiTVC0InuL7YqSLfvODnrXjv4Lal8Xv+3cb6F2eOjhUGHh3Z8dYN8w6AEI6nC7//5Gf+h2/8f0/Pn/2Np/7i377/M1fOYlF76JPag5+ofPuLzaPfDsKmELR45AkcYIgCCjwueJLhqGl9ZOfkZ38LAgjeoqxtJwwe+U+/hXT5SN/u3378kzfoYD9S/ujcM+vEioJox+DUjYoFhLCntgMAEIKKcmVf/5NPPvKRj4iTk/mrr1+rl0HIfnP/k+ZbFJmIeWuhjC9u2GcXOz0fcABALyt5z0SyL3uXWzcY42HEFjbs43Otk/Pteifo2UnfiOPTWttHEEoSShvSGxpcEMr8gLZtghBMGaIs3sSgw3KjrktIxEQBpQxJkW5u4nE1thdV24GAoSzilCH2huH6tG0TAICIYcqUZPEmndh+VGsF+NqGdw2lnESsbZOA0EJKQQi0LaIq+Dop+c1g+5HlRKKAFAlpinCdrhqQS7csIAAAgkAUUM8L/vRC++hM89RCp+OEJLoym5KApofMTFI6tD1jqEIpqyR00Q/p8pbz8kzju69UelGcu4NSfnyudfRs48Rc2/GjbOLKZ4im4LE+3dCEvZOphCakTCmbvPJZxAHwfOr41PEjSUApQ5QkJL6Rx05vxiUByiLWVfwmPXl6IYr5dXtu3fYC2gTh6cXOwW03L6dBGbe9yPUp4xwAgCDMJeXpQXMwr23WvYUNy7709pRElEtKKUMayKsAABLxe3dmEIKFtJxJyAAAUUCSeBOzl2JG+cjDA7ZHSMQHC1pCF8WrZp9z0HWI5UWEMF0V8in5cg2A3tv53HLn6VcrJxfaQdSTtW8CiZjjRxjB3hiuqyLQ080dP2rbRJGwqQm3ueWFRGx5y3l1tvncqZrjRzctBcw56DjEdiMSMUXGKUOURRxXjIiJiYmJiXn3EQvuMTExMTHvBlRB4pz7EeGcv5lsMQigjmVDUipWs2l338IR3vlIwLZc6X9//8/+sy//yVdPPIcY/V/f/xkE0UWNG0IAcfFDPwc+9HPuM19xzx9zuk0ImCwpsmbmMkXlY/8cvKWZ2pSziNLDf/jrVMLTRvaPP/lLb2Hnd8fplQs2IxpW//WhDwhXRRQ6Hee3fvvPv/b1597/oQ/8g0+859H7hxC6xnVkz57+G3treF0BQAHGfjLvRHru2Mtl58K65foXFb2NmntqoT1U0K4W3CPKvSCqNIOuQ8KIMc4xgkMFTVeESsu33CgklAMgCWis35AFtFZ1X7vQ+uGJ2sKm3XVIueHNrVmqhIeKWimjIARDwspNv9ryK01fFJEuC5qK04bUl1MNVZBF5PrUckml6dt+BACQRSSL2PairkMa3RAjmE1KY336SFFHl1LLuw6ptYO1qlttBbKEJAEJGGYScjEtp0xJV4SIso5NKi3fC+hlGxZJQC07XKt4GENdweP9RsoQI8orLX+t4gIAZAkP5tW+rFrMKAKGHICQMMslW3W/2vJrnUAUkCrjpC5mE1Ixo+iKIImo45COTRqdwAspACChiUlDRBASyhqdMCAUAJDUxbQp9WrJuj6ttv3Nmmf7NIpYQhcxgl5IR0ranQrujPGI8kY3qLaCkDBCGQBAFJAi4Xo7qLZ9SUBJXRwsaLmknDYlCAGJ2FbDLzf9WtvnHIgCiiiXRTRc1EQBdR3yymzzuZO1taoLANhqeOdXu5KIsklZV3DTCr2AYgwp481uCAGMGDsx1zo20zy/2nV9qkh4bt06eq6hSlgQEILAC2jvsRiK0JdTw4i1rfDypCQ0sS+rcAAcLzp+oXX0XGO14kAIBYzm162XzjZMTUAIun5EIi4KkAMQRVdE4I5DGp1gs+41rZBzcDmOkk3K+ZSsKTiivNUNKy0/CC8+HAEjVUJNKyw3fElEhioMFrRCSk6b0l0bK3Ucslpxyw2vbYWMc8fnG1W3VxDV0MSr4zctK1yruAub9mbDiygPCO155dc7gSJh2yXnV61aJ+Ccuz6ttPzzK9bUkNGXVatNv22Hvd0Vjk91hSY0AWEoXCt19xZzqxs6fkQZhxAwyknEMMI0Yo5PG52g3gm8gLo+7bpEkXAxLRczSj6lKBLyQrq06bw803z2ZK3RCRECK1vOCU3cangjRX20T48o70UX2lbYdkjvmWdMKZOQUqYkCQgAYHtRxyYbda/a8ltWqClC2hCrzetj+TfiBrTRCU7Mt47NNC6sWxDCYlqZXe0mdTFtiilTSptSsxtuNbytht91SC8IJwqomJYLaSVpiG9mp05MTExMTEzMO41YcI+JiYmJeTdQyuaK+cJ/PPX8YLHvkaGpq0+FhIYhYfzSxnEIIAA9y4ieiYMgYPmqL7rjpYHBbPH0xqITBZQx/GN19N7bN/L7H/ns577yR188/cPXWsv/5N4PfGz8sIiu+VquHfmEduQTd288fBv4Efn80b/97qljXbt7z9D01z77L97OV7stCIsqnYZPwqnkKLpBJUeIURZ+5cvf+Osv/u3OPft+/mff+48+dQBjLErCTbNBAxoBFReSmR/vdMfcCkq5G9CNmrdadv3wYtryVtM/t9x9eO81OxW8gK5VvW+9tHVmsV3vhJQyWcI//+ToxIDxrZc2z69ajU7AGE+b0i9/fHIwr33/eOXlmebZpa4fUsr46cXO/Ib91LHyowcKP/VgvySiejv49tGt5S2HUGaooibjthUWM+rH3jMwPWTmknK15Z9b7n776Nb8ugUAyKXkUkaptYNmN3QDiiDUZPyJI4PFR5XLqayrFffpVytnFjtbDW96yEQIzq/bo33avTuyh7dnxvoN24vOLHW+9dLWetVtWSEAQJZwNil7QVRu+AAAXRUe2JUtZhTLjRY27LNLHQCArgiTg8b9u7IfvL/f1IRe7dCZlc7f/HBjveYhBBQJiwKijI+UtA/e1zcxYOSS8krZeW229fzp+kbNBQDsHE0emE7JIm7Z4fOn6tWWDwDYO5k6vD1zeEc2ZYjLW84LZ+pPv1pJ6KIsoVorgBAUM8qTh0uXjctvE0K55ZJjM82njpUb7cByCQAgaYj9ObXaCrbqHoSwkJHv25m9d0f28I4MhtD2ou+9WnltrtW2wohyCKHtkoQufuw9g6qETy60zyy059atXm77axdaMyvWN57fvGdbeqxPPzbTXK+6AIBsUu7PqQ/vzadN8Qcnqifm2r1FFRL2tec2XjzT6M8rCU2URLRWdTdrHgBgYsD86CMDbTt8eaa5WfcanaD3rD76yAAHoNzwjl9oza1ZAWEAgHXi/u2zG8+erG0bTigSXtpyug4JCe3LqduGzY89Mjg9ZAIAlrec50/XTsy1qy1/uKiHEVuruKN9+u7x5OP3FMf7dcuNXrvQ+tbRrVrL79gEAGBqYn9ObVnhetWFEGYS0n07M4d3ZA/vyNy1XFtt+mcWO7YXiQIKI8YYDxhbr7rnlrvbRxL51JVs/V4U4Ycna0ubTkhYRNkisZ86Vp7fsAdy6mrV/eGJWtchlPFaOzh6tnF+ufvwvvxHHxl46mj56NlGSKimCv059X2HSx+4t3TjSPyQvni6/tK5xtKW4/kRAODDDw2892CxP6dGlC1tOs+frj97slbMyJKI1queH1IRo0fvKTx+sNifU+vt4BsvbL462yw3/N4CePrVyotn6yJGnzgy+E8+MuEG0Vbdf3mmsVx2OjaxvIhEbMdIYs9E6vD2TK9Y7lbdO7XQfvrVyvy63YvlqDIu34bgXm8F55Y733u1emKuZXsRgMAP6Je+t/bsydrh7ZlDOzKHd2TPLHa++eLmasUlEZseMv2Qzq/bB7elH9yT2zuR6n/dWqwxMTExMTExP1nEgntMTExMzLuBJ7fvP7a+8JWzL3u+d92pr35z9vf+4EvrdVtPZjhgqoQVyLqtriDoiVRGlOBHPrj71//7I5evv79v4r1ju86Ul//z6ecns30PDE6BHyuHh6f+6Od+9d/84EsnFmf+wP+aH5BPTt+nitIbt3yL6ATub/zgr79/+uWQkMPjO96/6743bvP28xdnnl3r1hDj//HT/9SQlatPJZP6v/u3v/Lrv/aZP/gPzxx75fypU7Of/1/++P/4P+UDB7b/o5994uH7xnVdkaVr/gv0O0e/ea61+cTwPkl8yzwxYt5COjZZr7oRY+mEpMi4Y4f1dmi7UbnhbdS8WitImWLPXUTAUJaQIiES8fWq64dUlbFPqCQijKHrRytlJ6Lc8iLXp7oqTA6YlWawXHYoY4iCfEoeyKv9OW3bsGmowvyGfWahfWaxExA6XNCHilrSEJ85Xj290NZV7AX04b25numE60dbDT8grGWRtkVySTmXlGdWuh2HiBjOrlmzq9ZISdcVXG8HZ5c6x2YaLSsUEBop6QCAmeXuwobtB0xTBE0RFBn3PFI6DlnacgAAmYRUyiiSLvoBrTT9RicQMezPqQldlEU0NWjOrVsrFccLaSGt9NRGSvn5le4Lp+vnlrsQgukhs5hWZAkdm2menGsrEvZD+sCunKkK6YTUssLeC6VNadzRR0sS42K9E/QOFtJKxyEkYl2HnFxon5xvL27Yh3dmx/sNWUAdh1gOuexafvtgBGQRKSKSxV7yvtt7LV0VAACaIlRavuNHioSLaeXgtrTlRitl99xyd2HdViQ0VNQn+vWXzjU6DvEDmk1I24bMthWuVV3LjRACpYzan1cHcurkgNHLxG/bpOsS16cIwYgyUxMLKSVtSl5AGeMYw6khc/tIImNKEAIvoHNrdu8JqDK2vUjAqJCW5zfsy8/K8aNMQu7PqSlTUmRMKMcImpowNWROD5kDOdUPWaXpb9W9jbpLGc8kpCCkAWGWS2ZXuy+eafRy1cf79YjythVWmr7rR2lT6k26ImFFwpeXQTYhaQrmnBuaUGn6bTsUBZgypANTaXC3fxMqLX92tduXVVVFOLPY7tiEA77Z8M4td/qy6tWCe9qUh4v6cNGx3Giz7kkCSpnSeL+xczTRU6uHi9pqxal3mKbg/qy6fSSxYySR0kXOecsKW1aoyBgC0Ius3Gw9wGxKTuhiteXX2wEAoNkNAkIZ4/V28Nyp+svnG4ub9viAPlrSo4gvbTnLZefUQjtlSoqEDE3YMZKoNP0LqxZlXJXxaJ8+kFNNTRwu6UFIX5ttvTbbml3rSgKaGjKrrWC95p5f6Tp+ZGrCaElP6OL5le5zp+rnV7phxLcPm4qEKeMdh7TeqIy6quBsUi5mlGxS8kOKETR1cftwYtuwOTFgSAK6sNo9Od86vdDmABRSytSgUWsHp+bbMyvdiHJJQCJGlz/HYmJiYmJiYn7SiQX3mJiYmJh3CaokkcBv2RahVMRXcv0+/bGdy6uPbtQtUVYC3xExVEVJU9OJ7Oj8aufbT/3dzPmV67oayhT7EtnNRnWjXQ/7xyX0Y97ovT8//PmHPvW79OvHN2d/77tf7rS7P7PvoYSiK8Lbqw53As8N/V976j8fW5zhlD42sfdPf+ZX3tZXvH1OL81arpMStVv5yJcKid/51z/90ss7fvFX/oTxQBbBD3/46vefPbVzx9Rv/trHn3xs59UXr5c3XM/+5YefSKn6j2T4MXdGoxvMb1iSgCb6DQDAasVpdkM/pE0rXC47Y326ppo9oUqVcT4pTw+ZWw3vwprlhxQCoMk4l5TG+4z1qju3ZkX0oqlHPiU/eW9JwHCl4ixvOX5Id48n37O/cGR/3tTEkLCnX608d7q+XnWHi9qB6dQ905liRpld6c4sV7/+fAAAuGc6nUlIk4NGTyYmNHT9qN4BD+7O9efVnitFwPhqxXlttmmqAuDShTXr1Hz71HynL6dsHzGO7M9zDmZXu2eXuoubtVJWKaWVbSNmMaNMDhqbdW9hwwYAGKqweyypq0Kl5b9yvnlmsXNuudu2yb07MztGE8MF/UvfX92se+tVd6PuRZQBAEjEj8+1njlRq7b8HaOJB3dnd40ldVVY2LBfPFNvdkMBwf1T6YGCBiC82g0GIzjWbzDGbzShbtvkldnm+dWuH9LJAePJw6VK01/YsE8ttO9iWgWMTA0NFbW948lyw+sJ7qIAk7pk5gUAwLFzjY26N7dm7RhJcA5q7eDCmrW0ZbftcNuw+dCe3MffM0g5eHmmKQhwsKA9tCeHMVyvuisVV8Rw/3TqyL7Ce/bnRQE1u+Hcur3V8LxLgQFTE4eL2sHtaceP6u2AREwW0UceGvjoIwMAgHonWCm7K2X31dkrA+7Pqf05daXsnlvqXD7Yl1UKaWVmpbu05YTEkSU8VNA+8vDARx8eAACsVlwAeEDoRv2KR7wXROs179xy99XZZtKQ9g6knjhcQhAIGL54tnFyvp3QRVGAR/YXBvPq3vFkpeEtbToAAEFACV3sefscm2kubNjnlrvDRb1nOHMXcAAqreDCmvWRhwdMTdysub1U+q2GP7PSPbQ9e/XFk4NGNilxwDkH9U6Q0MTxfv19h4u9XSbnV7scgB+e4C2L5FPyvTuzv/CB0V7Wdn9OzaVk55IZ1K2QRbRvIuUF9KUz9Z7gfplKy3/61fJK2QWA7x5PPrw3n0lIAIK1qru4aYsCmho07ttpfOLIIGX8meNVyrihCo/dUzyyPz9S0iEAthc9c7z6tec3g5A+si//3oPF1Yp79Fzj2LnGetXNJWRK+Wiffnqx8+zJWkDojtHkRx8ZNFShZQVeQDfr18fyryOfklUZ19q+H9KmRWQBjRS1Tz429MShIgBgcdN+5nj15Hx7o+5tGzb3Tabed7i0tOWcXuysVty1iptNyElD0hQzFtxjYmJiYmLeHcSCe0xMTEzMu4SsmTRl9dszJ/YNjG0vXGPS/Rufe/S6iyPKzlywTl4oF0rZvXsnrzv70al7ZjdX/vSV735p7pWp0tC+3OBtjiGKeKdDKeMQAAghBxxwwDmAACIIEIIYcQi5ZghYuDO/3YP9I79+5MN/9Ip8evX8f3jha9+58OovHH7i/dMHTOnt2oS+abf+71e+/71zr5XbjZ19w7tHJ3/3sU+9Ta91p7QCt+K0OaH3TmyXbh11IIRubjU4D37tV//hE48d+NMvvPiXf/HXmiykUtcYX3Q8t2t3E5oh4NhC9x3KZt0/Mdce6zPG+w1COQDgzGInopxEfHnLWSjao326fmmfA8awZziO79bVGgAQhKzjhFt1r9zwAsIUGfd8lmURYQR7nvJti6yUnaGChiDUVUFXsOXAUlbZMZLYM5FMmVIurWw2fC+4ojNaXnR6sbO4ZXPO06Y0mNNUWaCU5ZJyQhfq7WC96s2udQcK17+vNUWYGjIzCSlVkxY37d7BbEJ6eE8+n1ZCwi7XXXT9aK3qhREnESs3/WY3IJRJAkoakq4KsogxghHllksa3bDS9AtpBdw2vRuPKOcAvDzT9EO6dyI11q+LAhouanf3qDVFKGZUVb74rWQgp33gvlLHJnPrFkIwotz2Ii+gPQP0Xr6z69PFTefo2YYowGxC+tADfWN9hqbgN1PA420CQSCJSMDooqcZAACAlkVOzLV6ZVo1GZuaICAIIeiZDlHKN+veWsUNQqYquJhRtEuRj2JaeeJQKaJsYcPGCHLOScRIdKvioG9A2yYbNdcLopGSPlLSTU0YKeldN2p2g7YVrpbdrYbXsnRTE++oqidlvNYKKk3/6qK1twOEUFewoQqv40fPASARD0Lmh5REt1fMFICuQ9aqbssilHJNEZKGmDKkRjeURYQQdAO61fAySam3mSAkjDGgSmggrxbTihdoz5+u39GN3EjHJueWu1sNH0GY1MVMQuptYVEkLGDoB3yj7q5V3bF+PQ75xsTExMTEvDuIBfeYmJiYmHcJk4X+oWR2o1bpus7rXMY5qHfI7Nzm//aHL25tbf7jn3/P537h0I2XJSRVEsT5ylrT7oDbFtwbTfrlL7ebzcgwhXSWex5zbZH4HERcglyXmaFEihTsOKRnSmomr4viHSi8h/tGzQd/6iuJ5A+WTp7rrH/+mb+q2O33ju0dSud06Q4kszdk02o2Het3XvryCwvnQIQfmdz7xx//Re1HaGLzhvzl3NE5qy5x4Tcf/lhSviLzcc5X16rdrqPphqLI6+vtP//Ci4WscWDfxHC//NjDg8+/OPjokal7D1wzoV85+fJWszExOCS/k+4xpgdlnERsq+nNrds7RpOTg2ZA2EbNxRjBiEURW604i5vq/TuzSUPsKewYQUMTdVV4M4b8AaFtmzQ6QbMbAgAuC9aigBCCnIOIso4TrlW9lCHpqqBISJEwhCCTkLYNm6N9uirjngFIEF7xWnF9Or9urdc8xrmhCtmkJIuIIJBJSIYqcMDLTW9xy7nfp/haiVPpyX8ZBUBoaheDTKYu7hxLajJeLjuXNcqAsEYnQAhSylpWaLkRAEAQUM+pRkAQQkgZ9wLassLNuqffkMb+OiAIZRGJGEIAZle7HYdkk/L0kDlc1HJJ+Y3b3wxFwinzSnHObFI6uC2zsGH1boox7gU0IAxwjjGUBIQRDAmrNP1TC+2A0APT6R2jyVxSUt9UhOXtAkIoYnSdYG170fy6VW35EEBJRKqMMYIcAFGAGEHKeLUVbNS9MGKGKqRMSbn0lyJlivunUo1OsFpx8cV1yOntys7X07HDs0sdx4v6c2pvBfbl1I2617ZC24sqLX+14k4M+IqE7ygYyRjvOKRth5e3ktwmEAJZwqqEbxTcVVkYzGuM8TBiQUg36m6tFVhuxG8v1GC50VrV6zghZVwUIACg6xDXjyjjl72baq3AVMWuQ3rbBSQRZxPSQF6ljCe0N7uZzPaixS2n3gkgAJoiJDQBIygKKKEJsog6jFdbQbnp3WmIIiYmJiYmJuYdSyy4x8TExMS8S3h4YPL5vpGvbL2w0q7tiUbVWyQ+h4T9X381++WvfDOXSvzqLz352U/uvull2wqDI7ni2cb6QqN8uH/CuD1FW1GkgYGC6/p79+qPP0rKFXF+QQ484nbdwLU5cQB1GPeOH91qWeSTnzkoqqmQAE45oxEJgigMOKOolwYPoCAIGCNNQ7n8RSVre7b/fz7yM/eP7vybCy+fXJv//Wf+5i9f/sEvPvDk3oExUzVGzayM7/4ve9XrVpy2FwZ/9srTz86dCgEbSBUfnTrwm/d/+B2ltgMAlirrTd+ZzpZEfM0shyT67d/9wt9/99j09O6hoUHL8U6dmXnisT0HducBALVKxXU62Wzyut5WyuuB4x8enNLe0rhFzFuC69NK06+3Qz+kfkhDwjjnGEFZRCFBEeUbdW9py6l3g3RCutEC5a7xCes4JHxd/csLaKXljfv6TTVrjKChCroitK3w8kESsUY37Drkap1QxMjUREXCgIOuGzU6QRgx9c3tt6CU+YTR11U8LZeslJ1SRpFvu96moQrbhsxGJ6y0/Ijyeif4zrHyStk5MJUezL/tJR/zKXliwEibkiigMKL1TuDP07ZNqq3gA/f1FdMKeOcJ7jeFMR4Qdis9mnHescNWN4zeZvm1l3bNOcgmpK5DgpCaqpDUxd4+gZCwuTWrL6uUMooq/5h3/4z16Z/90Nh6zS03/I5Dvv3S1nLZLTf829T03SCqtDwvoJzzkLC5Nfu/fG81IKxjh6qMdVUwNDGirNLy3Tfyvbk7evUP/JDiqzZhGKowVNQ261656bt+5HgRu9vYSUxMTExMTMw7jVhwj4mJiYl595AxU4IsfW3u5L7hielM8cYLFteds+eXv/Dl7+RSmX/23zz+6Q9P3KqrxyZ2v1iZO9/d+sJrzx4ojB4cuuWVV5NMsF27/FNn2r0MuVKRlIq96nAYgCQAV6TeP/vT40sr/sIGbrQF4kXECbpbW82tNUR91dBcwAnAiURG1+DEhPixT46l0leSdR8f2f34yO5vn3/tC2eeP1lf/lc//CtDN7f1jf/j6QcHtJQqSjuLg/i2k3trdme9Vfdp8PdbZ7+7fHKzXmM+O1Sa3NU3MZ4f/PiOA4Z0W4mrjks2NlvdrkN5DwAAxxiJAlZVNWEa+Zwq3qGRzk1ZqJcXa1uE88f33Gso12h8EMKBYq6Q719c3Dw3s6AlUpqRrDec4ydWRUk6cXKhlE8d2Dt9XYcdzzFl7WNj+1Nvmz9PzF1juWR+w6p3fM5BueHNKhgA0OyGmiIEhPVUqlorWCm7GfOtFNwp5QFhr++MHVHu+jS6xUUQQlHopTZfWfaUcT+gIbmmCUKw5zrCAQgJ9QP65nU3xgGlnIPX64cQZrkkjNjtC+4JXdw7meq6UaXlt6zQ9aOlTZtETBJQIS3vHLs+mvXWYqhCf07dO5my3Gh+w3b8yAuCXlLwrrFEPiXf/o38eOGcU8pvNcucg4CwgLyN6ivjnES8ZYXLZUeVsCTA+Q1bQNDyIgCAgBFjLIzYctkZ2FAP78j0Ss6+XaO5DWQJFdJyoxPYXlTvBM1uiBFUpNsdE4mY59OIcs5BGDEOuK4I2STuWczLIkrqIqGsYxNyh1n5twnjgBBGKb/aTQ5CIOKLO2YIZSTisd4eExMTExPzriEW3GNiYmJi3j3s7B8uJjOrlS3bdUHm+rMnzpb//V+e/rvvPrtn97Zf/oXHP/5Y3+v3tjc/Mm7k1iqV4+XlqUJ/Qr4tNRYCSgLb6igAvF5WuGkkvvGNKhOTAU0wBjEVA1dxHFmTdSRkIhJxLIXMDDo2veBfOM/ufeB6Af0D2+9JpdNPz598eWtxuVmdnZv7VxfmDVHJmalffPBxVZQh57IkYwglURQFAXAAAOSAR4ySiASEUMo4AK+szH1/9njD6wSAIkG8pzgxmR34pUNPjqbyt3O/AADLDi7MVU6dXv37751b3WhEAEUcICwIgqCIWJWFfDYzOjJ074FCsZjcszMjiXfv9LFi1f/9S984t7la1DOfmLzHvDYnXRKFf/kvP/Pe9//UufMXqtVaMpl03fDP//yr//x/+k+JRHppdfGznzlyYM/Q1U0uNDYrfnMkX1JvL64Q8yOm45CzS51aKxAwnFu312seAMD1I13FXoBcHwAAbI/MrnbzKXmkFBsgv72kDPHQ9kxEeb0dnF3qLHsRoWyz7lkuGcirjx+8SZjzLUTAKJOQnjhU0hSh9b3VgNCQ8a4bbdS8meVuJiFnk++svTjvWBgDjhc1umG1GWAMw4itVFwAAaXc9iJRQJTxiPKNmrdSdm03ilL8xyu4O160sGE/e6r29KuV6UFzqKgZqrBacavX1lZ9Q3qRhoGc+qnHh9LmxdUCAUAIzq9bL55tvA1jvyUkYh2H+FdZTsXExMTExMS8a4gF95iYmJiYdw8PjW77emHw786+4pObfAn/wz974ennTt13cO/n/ttHH78v94a9fXjqnuNLs/+lWfurmRfuHZ7aWxy+nTEIAtQkodMQmg0xkyW3uuzAvsHZswsU6RAnAk4Rg5KuMlFQ0wUlky/IuqSZnDPfaUu4g7AOwE3u6P7i2P3FsRfXlk6tL1XaNZd6xxrzi9bar33n/6GMSVg0VE1GyFA1VZIxxAigkEYBC+zAszzXCwhlXELYkNWd/WOjRiGtJT+29/6J3G2pZmFI19a7luWurHW+8/ezy0uVIOCa3OdRTjkQ9aQoqhIWRAF3LXb6lH3yhJXOGv/gw6V0SugrZcdG70Yb/frCK0db85yzn952b1o1rjt7/NRmoVB45P7sI/c/0Dty7vz6sZdeOX5ifm2zcujw9gcf2Htdky+e/uFse/WX7v3ppBprte8sGOM+YdWWP7dm59Pye/bnBYx65s4kYkFIf3C8+tLZBgCg65DTC53+nHpoe+aOqju+Dj0HdkV6veCQKEBTE+4ogKRIqD+v1tpBo3vlHR1R5nhRQCiEoOfZLQpvwn4eAAB6hTqhiF+vH0XC2aSiSBhBoCpYlbEfMgAA4CCirJcOfB0dh1xYs0LCHrunUMwo55Y7F9astkU6NrG9KCQMY/j2KbOWS5rdsN4JTE34yMMD55Y6x+favUfXskPLIewOLVgwgkldMjXxRtNwUUDGDZPbk6Fv9EyHAJiqmDLEzdd94JcRMDJUQb7F6rpoZS7f/j4lAAAICLO96NR8u9z0ZBGPlLSdo0lJRDedDjeIzi13Gt1gz0SymFGujlStlp1TC+3lslNp+l5A651gbt1SFTxS/HF+QtY74YtnGjPLXceLcil5YsAIQlZu+q+z1BgHXhC5fsQYV2Uhm5R7b2fOgRfQStM3VCGXlHtVebdqXr0TSsKV1XvRL54wxu7GJZ+y3haZiw0lAaUTkuVFV9sEhYR1HBIQhiBQZazJGL/zqv7GxMTExMTE3B2x4B4TExMT865ipG9AnTtzfHVxV2k4qWpXn7p3f3F06MFHH3ng4QPmbfb20NiuFzbnVjr1V8qLY+mCeRse37IkmLq4suTNnEs/9MgtLxvfJudzcrXNIQecAYhEQVBFSZe1FMeqGzKHepxTSJksyhCJNxXcezwwNPbA0Fjv568uvTJfXe+4lhcGM8263e3SMOp2rQZpioIEAIpohDCAGOQTKcGQ87IxletL6+bjI3v2FN4gosABuLBobW5VHcf1fd9zopWVAAIxYWhPPLZXeDzHmdyxu2dna90w9CJs2aEiySP9A6aiCgBGAXWdzne+VWbcGh62Dh4yR8b7JoZFAEBI2MKKq+t4uO/1thGsdpvnyisNq5U3Mp/aeShzrUR+aqb2+d/+6u59Bz/4vvHhwfxYPwQADA8W/8fPffrkqdkwog89uOuBg2NXN1lpN5aqZQjRfaPTCSX2k3lnETHetsKtur9cdvZNpv7hEyOXT5GIBYTV2sGrsy1KueVGM8vdqSGz6xBDFSAEEAJ4yciFA0Ai5ocsIJREN6uxeNWllPGAUMejuopzSVlXBBGjnrMyY5xSHtGLtg8QQkXCmYSkSBgAzhhgPR8lDtglJxfKerYhHHDAAeAAqLIwWtIrTb9phYz1euMk4h2HuD4FAKQMqZhWZBHdVOHjHFzya7o4YH6LqpGKiEQBqTIWMKSMc8574++NBUIAITQ0sT+r6orAONcVQVOEkISM85Ay240I5TcaZLes8IXT9WJGee+hYjGjFNJy2yZti0SUhxELIybDmyi81/fCrzl26TlcOclvbAIAAKDjkLWqu7BhqzL+8AP9xbRSaQWbda9n1OOHlHMOAeiJlpz3fIGo7UWaIjB+E4MdjGHKkFKG2JO2e0vFC2jvl6R+pZQr4yCMmOtHfsCucwQCAEAIErqQSUiiACnjjIOQMNenGIGIMnZpkhgHjHEOgCyizKWSA/zSQc4vLhgEYUITU6YkYMR65jP8mqdz04fjBXSr7j11rHz8QitpCI/sKwzmtaQh4htsdhjnthudWmh3HXJoe3r3eGrHSOLy2TNLHYSgG9Byw48oa3aDc0vdTEIeLugQ9kYL2BuYFd0WPSH7Sjf84vKm7ErnvZejnNfawUvnGqsVB0KYS8p9WXW14vbEa8YBZTwkLIzYxQgTvNh/1yFNK+w6RMCwL6vqigAh5Jy3rPDUfFvEUJWxH9BaO7iwZtlupMqCJKDebfaE+LYdRhEPLs34xTninHNwK20cQgABiChzA+r6kRtQBIEgwFJG6dik3gku33h4KcMdIWhqYkIX8VsUL4yJiYmJiYn5sRML7jExMTEx7yoeHNv27OnjX331xUendifVaxTkX/q5h+60t8en9n538fRyu/qFM88+NDi9Ldv/hk1MUxwdVxYWKo2GCEDqda7M5Mz1WheICQQ4YFDAiigaWNA5ECmLQhIwRmWBIyyg2y6f+PGxQ2DsUO/nb18447hOEAZ+EJAoAgj1pAAEuYBRMpkwjcRoMjuZfmPrmDOz9ZXV8tp65YXX2surZd8LJUGYGu17/OGx0eGRfCYjS6jThKEPTZ0GNsgPKC2bnjlX99xQApGGuSaIqqbjTIrQPsuza+3W17/R6puEB/dImqQ22/Z3XlieGNM+9wv7X2cYP1g8e768wdzoQwcP5o3r3aKbLX+j6p7/xksvnlzfv3v4/Q+ld2wbGhtUjjw0fuSh8Zt2+OzS7Pzm1lB2QFO0m14Q82PE8aKXzzfPLndkESnX1mzEGCoQDRa0naOJ1YrbtsMwohs199i5xq7xZF9WlQQkCghCCACgjJ9Z7Dhe9PL51sKGfWMdUYygImEBwzBi61XvhdON+XV732Rqz3iqL6dODRmrFdcPaLXl6wqWJez6kYChpgh9WXXbcCJtSn5IW1bY6pJeWmvHJj35r9Lwa+2AMRBRHoSMMp5S8PRQYrPunV/pVtvB4qZ9744M5WCj5jWtEEI41q/vmUiamth1b7I/hjIehFdKoRLKLDeCN1P+ZAkndXG4qA0X9a2G5we00vIVGWMEXZ9KAkoa0nBR2zZsJnSxbYeGKugK7jqw0Q1nli3HoxFlravKvfaIKLdc4viReAKN9ek7x5IvnWtUmj4AoJeyfRO1nQNCWXiVI3lEeS9xuPdr1yWrZce+dL+M8SCktyqGGRA2u2oJApwcNJOGeO+OzAtn6tVWoKuCpggQQQFDWcIYwYDQrYb/wpnGzEr30PbsUEGNoptMvaEJmiIgCHsDO73YwRiSiA3ktT0TSeWSWt11yKn5tiwhy402au71w4JAlQVTFQQM/ZB2HPLK+WYQ0r6syjjvOIRQxgGwHFJrhwFhAzn1vl25Wjs4Od/u2KTRCXsxpLWq27GJKKCdo4n9kyldEXqFbbvOpYfDeUDYjTcCAKg0vdOL7c262+gGlksWN+zZ1e7koNmzKb+arhOt17yZFQsAsGcipVyryGdMac9Ecn7d7v3atsjLM818Sr5nOi0KKKK8ZYVti9xF0vfVMA4anWCr7gXhRS07oswLIsenLSu8XBfBC2jLClQZN7uBF0S9VXFivr3V9NtWWG35hDLbjTZq3vELLUVC20eSGEFZxIzxkLClTScg7IXT9T0TqYPbMqWsamqC60ebde+pY+WNmje9ajW7IcZwvN8opBVRgKcXOpKACWVNKzx2rilgWGsHs6tWbzx+SGvtoG2TgFBRuH61QwgkAfUke8enlab//Km669NcSo4ids+2TEhYre3XO+FWw+99RHRsEoRMwGi0pE8MGK+/pSYmJiYmJibmJ4hYcI+JiYmJeVexL9u3p3/kv26svrS1PJIvGuKbNeZ+//SBs9WVk5Xlp1bP9JmZxBsluesGHB0VQOTZndbrC+57DyRPzDQYz2OsMEqRqAiKzkUBy5IkiDQkPCIIc4go53eT9faB6d2Xfw5Cem6pGUVMk+GuycLtd3LsRLlcdX/w/OrKWn11rR5FMAi4rpq5Qn73rn27d5cwgl2bV8swaQKMSbnKhkaVg4d01wNjg/j8rN9sUAwjSRQQDyiJZFnI5vsHhgcrVneuvPLFr9d1LNuuvVStkUgE4JaC+5xVfX7tTN3u5vTih6YP5rTrtykceWDo8//ik0srtf/6zTPf/Nb3j76cvPfg9kcfGNm7c3BySLxpnyvV9dAPnpw+WDBeb6ZifvT0cpnPr3Q3ap4s4YDQzbqXMkRNEQAAJOKOF4kY5lJyxya9spldh5xaaKdNKW1IsojSpphPyn5Ig5Aubtpdl1SaPqFcUwTOuSphyyWNbpjURVMVh4pa2yZeQDsOYRWnbYf9ORVjODFgdOyQMk4Zv7BmdWwiS9j1aS4pDxa0qSFzIK9CALtO4Ie0p7oCANp22OgEJGJuEAEANAVzwLsu8QMqCmhiQN9qJC6sWZTx5S3nzFIHAFhp+RjBkaK2fTgxNWjKEvJb1PYiAEAvD1rAqGmFJOKVpk8o6x1EEFZbvuNFTStkDFw6CBrdcJhQQ1Wnh8xqK4AQRJRfWO22rVDAyA9oLiWP9xuTg0Yxq0AAXB8N5NXBgta2ievT1YoTEIoR7Fnc9GbE9iIvpJxxL6BdN+rppClDxAjm03ImIffn1BsdbELCvJC2rLDa9gUML96LAEnEap2g0vRVGTc64UbNiyi/nPFdafqNTuD6kYAuNmGMl5u+G9CI8lo78EI6s9xBCEoCSuoiBGCooOVTMkYwoYtDBa1jk1o7aFkhiVi1hUsZ1VSFMGIYI03BPS8XL6CuTzUZ51NyKav0giWrFUcSoKGJmYSsSDiblPqyatchXkAXNmxZQpTyiF0cKkKwYxPXpwjATELqz6m5lEwod/1orepCCAhlioQ7NqGUG6qAEQxC2uqGrKRPDhjbhhOjJcP1o2Y3nF21/JCuVlzGwUBe3TOR3DGSkATYscl6zQ2jizMOIay2/a5D/IDiSw+HA1Bt+S0r9AJKIhYS5oe01vZXK24hrVwtuF9yZnfn1qxq01ckbLmR7UW2FykSwghFlHEOJAFrCr70iqDS9lcq7vKWY2qC7UXNbuiHVFOwLCLGgeVG9U4gCcjxIteP0KVRQQjKTV9TBFXG4SXXFAQhhNALaL0dbNS8SstH6OIa80O2XvM6Nik3fYxR72DP+0VXhYhyXRF0BZOIu37UdUhvi4kqYwiBF9CmFbYsElGWNMTpIXOr4dleVG37PqGSgCYHzVJGmRw0pjbN1YrTscm55Y4f0pYdUsr7curBbdJATpVEtG3YXK+59XYAOD8532Ic2F7U7AYIQVlEkojCiAUh9UOG4PXuSRjBTEIuZZVsUiYR90O6XHYkCe0cTfRn1X0TqY4drlXdIKRLW87phfZmw3O8yNTETELaNpwYLumS+JNR9TcmJiYmJibmDcFafuyNr4oBIJ/EB6dupdrAXfd88I56W77wouu0bnpqfNuDqn5nX/tbtZWttbM3PZUtjJaGdt5RbzExMTE/6aiyfGxlbs5qvmdse/pNZy6PpvNntlZO11YWncYHx/dnlDf2sbVa0ezJJqTR2HhWT9wyYS2bE1481vSIjgSFMyAiTKJI1FRR1UPKKYAQQFFAqsSmp9S+Pv+ubyEIou89d+Ho8c2tin/hwoYA2EB/+jbb/pvfe+rYqcB2lVRqdOf2Q2NDU4asDfX1mYri2t6F2dbp05X5xfpWtdK2a/V2bXGtKohB4HndjicLgmfDcrkFISBRaDsWZQRLkDC/ZbXatt11qedhu0MCCgkCGJH9O4fSyZtnA3z1wtFvzB1zHP9n9z362Pgu/doap2fOV4p5Y8dk+tC+0kApNTqUnF1xXju9cuxUZb3S9Vxb09RU4pomp+trf/3qM5zB/+6+J0Yzt1shNuZHAAfg7FLntdnWctl1/AhBCCGw3ChlSJmEBACot4OZlc7MirVR8wQMTU1MGZIkYS+gSUPs/es1cX1a74SigEQBFTNKxpQkESV1MWlIPakul5IVCSc0MaI8IDSiLKlLB6bTeydS4/1GypBShhQQ1rLCc0vd+XV7adOOGJ8YMJ44VLpnW6aUUastf2HDXqm4lLGELqoSpgwIGNkeqbYCAaOUIcki5owPFfViRkmbkiZjQxEsN1racmZXrbNLHcuNxvv1I/sLh3dkhks6ifjSlvPK+abtRboipAwpaYgYwbWaO7dmdV0iizhlSElTFAW0UXcvrFldh8gSThmSImHHp7mkNDFgmLqUNiUSsaYVnlnszm/Yy1sO5WBqwHj8UGnPRCqXlAEAAEJFwozzzbrvhzQkrJhWMgkJQtB7dUGAEeWDeY1xcG6527FDL6SnFtovnml0HDJa0p88XNo7mcomrv+vcqMbrpadE3OtmeWu41NNEVKGpCuCKCASMcejgIOVsnN+zYoo12QhZUhJXQQQLG45a1WXA2CoYsqQErpIKO+l9s+v21sNb6Puzax0Z1csUxP2TaaO7C9MDZmKhCCEhib0Esb9kGaT8j3T6WxSDghb2rItl2iKoKmCgGAuJRuqkE5IooBCwkLCOjZJGmIpozywO7djJGGqgu1TALjtRY5HGeeGKg4XNQGj3qM2NCGiPJuQxvoMSUSSiB0v8gLaskguIQ0VtcG8hhCaX7ctj2iKkNDFhC5qCpZFXMoqioSThuiHtNz059ft04udcsPvlSJ4aE9uYsCIKF/ask8tdELCVBn3Hg6CcLPhbTa8y08soYuUcV0Vhgr6SsWtdwIIQDYhF9NKf14rZa4Eif2QdWzy4pnGsZlGEDFRQI4XQQh7QxIwtL1ofsM+NtOotQOMYG/hmZooCrDRDTpO1OyG8xuW41FVxpqCBYRkCYeEeSFbr3qzq10/ZIqEU4akKth2o65DKOWza1atHagS1lVBFJCuCJyDs0vdjbqLMUxoYu/WvJAubNjrNdcntLfwJBFxDoYKuizirkM4gJyDe3dmH9mXf2BXNpuUa+1AEnHSEA9tz+waS2aTsiSgbFKmjFsuoRzkk/KRA4V9E6lCRpZFnNBEy4lsP/IDJghIFtG24cQ90+ltw2YmKasyLqSVyUFDU7AX0Pl1GyE43qe3LOL4tJRV+nNqIa0MFbRSVulto7l6tSMIE7ooibjrEMo5obyQVoYL2v27cjtHE4WMjBHEGLYssrjpnFronF/pBoTum0y992DxwHS6p/jfdMNKTExMTMy7DN+zFmeeu+kpVUuOb7/jbdkL534Y+PZNT03uOiLfxhfYy1BKZk/9/U1PQQifevWGfX4xtyDOcI+JiYmJebdxaGh8sn/w+YVZ3797kfpqPrLz3jPt9TPlpa+ee/GfHnzSlN/A7FtTxGJSra81Vme7+YHM61xZKGaa8z5EEUZSFAEkmRRKDAtIACLiFBEECQM3GAbfCRFlR19bO/by3Pse36cq2uIi+vZ3ZkVRPrBv4HaaLyxvJvP9nMD1tc1cMjUxOlBKCIVMwnW6vusRygNCQka3yuXnX1oUEBroK/mWN3eWsZALSCEUlOvNRDojyQplUMBitFFut1scwGyh3/aY70UBiRLZRIKRdruyuOaOD91kD8Fss/zi0kwncPuyhScmd+f1a9Lbnz+6+Sf/77fe9/ihn/+ZfZKIP/zExGMPjezcOTZzofzt7698//svL80ZiYQ5OnBtq6WzS63yp/c+Oph+4wq6MT9KeiUoB/OqKuOeobahCmlTUi8Zy0giShrStiEzqV+/d2GoqGmKoEi4L6s+tDdXyip7xpMJXUwZUjYpMca7bsQYxxhmE3LakAQEk7o4OWgwzksZpesQUxOmh8yhgiaJKJuUEDICQvuy6nrV7b10Qhf7c+qusWQxo2AMFQnnU/J9O7PTQxcXGISglFFUGYsC6jmz9xoWM4osYk3Bw0UNQmDq4mhJJ5QjBDRZGClpU0PmUEHr3WY+JR+YSvvhxeaKhLMJiTKeMsTJQaPnraHKOJuUCOGZhDw5cPEgRlAUUD6lIARzSQlCM6JsIKeuVz0IgSTihC4M5rWdY8li+qI+LgloMK8d3JbhHHQdwhgfLGgJTey65LJfee82JREd3pHpOZw0u6HjRwldHC3p+6ZShdRNElNEARqaUMwoGMHhkn7ZDEfAMKGLuaRsaMJgQTtIeRSx3vh1VcgmpKQuFVJXPgpMTcgm5WxCFgX40N7cxIABwMXKrkMFbaxPHyrqvZzoTELqTcRQUes6JJeUp4dMWcSU8QPT6cvVQSEEY32GqQqqjPuy6gO7c8W0smvMzSbl4aI21qdnEhJCcLSkvWdfoZRRG91AFFAmIZUySteJHD8CAIgC0hScS8oQAlMThovaA7tz/Xmt3PCLGXkwr5WyCqU8ipjtmZeXQSmjJA1RlvBAQUMImpqwUnGjiPUqvg4VtPEBfbSkm5roBVExoxyYToXk4sPRFJxNyAGhhbRy3RMrZdR0Qnp4b04W0cn5tqGJuZSsXefFhKAkov6cuncidXmp9OdUTREEDCGEAkZpQxrvMwop5fLaAwDIEtJkIZuQJBEdmEpPXvosRQiWMkomIZma0JdT90+l/Ut2QL0SArmknNDFnaPJtCld7q2QVrIJefuIWUhfWTNpU0rqYsoQC2l5YsCglzpJ6EIhLUMAH9mXnx5OtO1w12hyvN9I6GI2Kfe8g2QR7x5P9jxhckl5/1RKEtFwQSOUFVLKvqlUf1aFEPbnVAQhgmD7iNl1Ik3BaVOaHjJHS3rSuOjX35dVTE2QBFRIK6N9TtoQR/r0vqzatMJsQkqZUlITh0uaIuIb/dYRgoYmjJS0h/flx/uNRjfMJqSBvDpQ0FKmBACYGDAhhIW0sln3IsoFDFUZbx9ObBtO9AIwN76DYmJiYmJiYn5CiQX3mJiYmJh3IX25Ilq48DevHut7LJ3S7iCkX2mGcyvNgZw8NnQlB/y+4ek9c6OLlfUvnXrm07seekPBPZ0Xt+3Wygur7UYHgNcT3B87Yq6s2RGNZFkJCESCxhCOGAAIY8g555xFt6ofeJuEYfSdp08U8ukH7x0FAGSS6vHXWs89N3ubgruqyhixjfLG2tJyUmF5EyHg60o6qeVoxLGg+YQGNNL0VKfj8CiaGtm2a5eZ+//Zu+8wO676YPznnOnl9nv37t7tRbuqq2YVq9mW3AtgYxwXTDcxCSUvb5Jf8vJLCAkheXlCgJCEktBbMGAMNq5YsuSiXlfS9t5vr9PnnPePK61Xq5Us2RLY1vn48fNoZ87MnDMzd8t3vvM9YdOx7LFBlEqhaFXMARAjVjeJYTqOZWCk25ZtG5jFMJ9KQllUPVEtlcql0o7tzNuNl/qPd0yNMIS9c9Ha5lB0zlqvV0ilyNe+tX1gfHztmmU3b6pVJPbWa2q3XBVbu6L+6LFYJqu1Ncx9eyyeTHCQWdvUGlIudBJd6vempVZtrlYJAOXpJiGEEAB0uoBDwMP7VW5Jo+/sGUMRguWMeJFnwn5hc3uEkFPTopZTR2c2gRAiCCCCEABJYCJ+4eqlofKHrbwTAEA5cr1lhbCp/fR2p3eFEIAAQgAqAmLELyxr9s/uDISwPPXirMMBBGF5v0GvEPDwS5v8r9Y1h6AcCixvqEjs4nrvwjrPzC7L08CWvyKn580sn5ZTC884OpjpfzQgRvzCluWReftfbs8yMODhV7UGVrT4y60QBADA2Xs9tU8IGqvU8tLy/+X5VxEC82bmllOkm2Lq7FMx+xRBCBpj6ppFodnXpTyos89n+QBtdd7Zk4hCVD51p46uSKwisrGwVD63szdc2nTGDYNQuQNQFtigl1+3OIjJqZPDnM4zrq2QqyPyxvbw6ZN3xl0EIQAAlu9KjkUVATHsF8ozoEIAyvchAGD2vVG+juU+8ywfULmF9aeHU76mp4cDIVBlbmmjb3GD7/xXvLywPJY7NlY3VqnJnBn2C6113vIbITMEDvEsv2VFZFN7+NX+lM8eBBAAVWbb6jwLaj1nnv5TIy0PZ/bFAuDUXVG+21e1Bma6CsqLIYAALKj1nH01V5HAvB8ZcMZtByCA5SltG6qU8nIEIUQAAhj28UsavTNXs3zSWBkpElMTkclVp65RuY4NBMArcx6Zba5WT036CgE8fRvM3D8sg3wKv3phcFVbEONT0wuT07Oklk/BzOd0XhG/uG1VFJNXb4OZb1yxsFQZEtcvCb067vIH/xwfH4qiKIqi3rpowJ2iKIp6G3rX4lUHTx5/7uSRB9ZvufCAe/dA4Se/7jzW0bVlbcsDd19VEX41VHHPkg2dI4OdhdF/ffnRz217r1c4X6UaUUFV9QLLwqkhMzUOQueObLc0gqAXTk3nOUkGPGPYDkAQMAwDoOMACBGEiOHYN/KXOMEkmSxGK2OFkn3gWArbgix7SsXJC9xcFUExP5nPTLhOaWCo3zKLQb9vcjrJQBYB1usJen0+RRGrK6PNd26EoJjPqKqqtrQiXcOOzfnDHIHAdh1MoGURraRzPOc6jcWiputuoYQtl8S13OTU5PBgn20Uu7p6b75mbon5F0c6n+o7WNSKzdH6jbULz67qs2xR6DN/eevY+NSXvvfy0zv6ThzfcMO1K9sXMqrCbF5TsWKRP5e3amLq7E1eGew+NjxUE672nzX5KvVmgCAEp9I957n7T0UJz7F2pg1zVpHl8+yQgZA5z6p59nOBnTlv/89Kkp3ZBiKIzjm6Cz0QuID+n7fZPFsh5pzHmne38NXA/jm2Oufa+du/xnUHAJxjyOfcEAIGwnNcKchAcHF30QUf9zVv49O3wbkazF1oO7h7tHByKMdzqDIgVAVFRZr7t97574fXOuI5Dz1r2Xz3zDl3eBF3+Nk3HpwVy569JYRw3ru0fDe+5g0MT90Psz+eF/EzGELAMK/zmwlFURRFUW8bNOBOURRFvQ0tDlctrqp7Jn3w8eGOD/g2Kix//vZTKefpnRPPbj92tGPMpyCvqsjSGS93t1fWra1f2n1s/Pnhjujup/9s0x0iO/88nGWiLCheJTmhp8atUPX5jq6oPpSwHMchgEDosiwPAHBd7LqYAAIQgAi9kQx3iJDHEzp06MQD71m178j0jme310Rj125uucDN/9fD2/YesR/NTCSn8vmSOJ1GiOcMl0CCgItQPIsAYBHwB5TGxoDfx3MC8vigJAOOQ4qXMRzY2Ggnk7CqikyOsqk44jjoONCv+AiSX97f6Q8HE+OFvr5+AcKmhpZMbm7xwRPpqUd695/MjfOQfdeC1a2h2Lz9vHpNDKyJBSL+7z06+ssnunZsP37/Hy27/92rAQAelfeocy/BweG+eL74oVWbGvy0ejtFUW95LiaG5Q5NlMYSWoVfrIsqQR9/9jS2FEVRFEVR1O8BDbhTFEVRb0/v33Dd/tETz3Tvu2fh6vME3LNFvOtAdseLx3a8dNK2nJUrFt66tXXbhgpVmVtN9b5VG48n+g5N9/7yxMt/sv7m8wfcZY8SqY4mRkt60QaABwCMjEqj41zJsE3TcjEp6prlQNtRekZZx+EZl2UYCCDLQcaxXEAgRAAhxADEvLFJ1BBCkYro4aNdh09C7LA9XZ1bt7Rff33bBW6+/qrmpka3kJsaGjyeSg1W14RjdSEI2UK+hF0EMSIutDBJ5PTUMc3U8xyyJycqEtM1HtUfT+rTKXtwsjA2ka2t8VYFG3hZ4RjQvkTnePzIo2OYQxYghUKJZ4T2thbI5AwjOacDx8YH9o50O9h57/Lr3rnwKh8/T4X3GVs3NNXX1gwMNj3yxOh//6yzd9Reu7Lylmsa5jR7eaR/e/cJv8e3pLLOw59rRnSKoqi3jJLupPKWKrNLG/3RoFgVEmkmNUVRFEVR1B8KDbhTFEVRb08tkcqGWGz30MlfdO3/YPuWeePj8bTxzZ90/OaZA/mi3lBXddetK7atr4lGFI+MduztDnjlFYtqZxrX+YN/s+2PHvrpv05D88+f++F/3PoRjjnnFGfBKLdghXe0N33wmYGBA6iA+QyOpDRGdxzdtBDHYg4SVtFNhoESDxkbM4gDLiYcC1mAbAIQYRADEGbQOYpOXCDsupPjU1evW11XCY6ywl133vTg/WshAie6ppcsnFsMfV4VIeZDD6wGROvrn1i7fsON19QaJti1L5POFKensqlkyXGQKHo4QfapKs+4U4lS8oVe07AxFGwkDE/GB0dHgwF/+8JkXWUk4JVyOiEQdnT1ITmcKeQMzVjQ2Bz0+ybjE/4m7+xD7xnre6xzfzqXqY1UrGtaHDmr/MtnvvjbZKKEIOIZiDjISVwwFA74q2qb2pJF8Qc/353JVJ8dcD8+OjiSiX9kw/WLohdUyJ6iKOrNj0EwGhBZBtVUSJJAZ+CkKIqiKIr6g6EBd4qiKOpt66+uu/uD3/3XZw7uu3/x1XMC7iXNfeQ3A796fFfPWE72yg/cs+neWxZURjxehQUAPPvy8L/82zO1Ff6/+OQtCxe8WnKkNRzbvHD1k0OHt/ce+eLO33xm653nOjQnQF+E42Q4PV7Ij/MWIhobtxg3XBXkfJwS8K25Gh7oUk72QEhYs+Roug1ZkTAY8QBjyAEAMQCoPGshxgS/vjPguuRnj54cGer9969+NBJi7ruzBoBoVdRjmo4snS9Df45YpefhD12ra6bq8QR8LMagskKybccwrJGx4pPPj00nS8lsxjCB3xusr6qM+CXiOvFkdmx0smAaUBI5r2c4nhwYGmqpiwksm07nEtkiEbVCyQ77gwGvOjLc1dDAvv+elTMH7Zge+d7+33VNDQUF9d62jWsrm+f06p+/9dJvdg7Joh9grOWzxULGJQ7PySIX5HgfI4gCixvr5pageWWoa/vJ/RG/Z0ldvSqcL1+eoijqrUKRWElgMCYAQo6lue0URVEURVF/SDTgTlEURb1tNQQqFlTU7+k95rjOnFWOg4dHs4PDidtuXv/we9tDATXoO1V25qkdPf/6rV2pLHjgrqV1Nf45G35yw23TTumF4/sf73ixIhp5aMmmcx29aaH3mnc0vvDL0cSU4RJSsNOhWt+2G+XGNplhWdUDRuNGt1sgTognDGIYngVE5BADLNvmOA5iAgCEkABAALnoKu6PPn6I430C7x8YKiRS+iOPdgb9XgY6uq4HQmGP159KpoYG+5YuCd9+68rX3h0A4aAMgqemikUIhAMsACwAYnWVunBBwLQcx8Gd/fbOvdnpydGRkRyDmELB7B0eFbx+Al1O4BArZNIZxV/x0IMVL+wUU5lSwbLzJUNk5amJQdvJrVixOhb1zBxxJD19aKzHccwHV1xz79KNnjOLybx0bPpXT+8zbXnD5o0fv8vHIddxnKf3wmw6ZxscJiSZmljS2vDgu+cWz+mZGB5JT31w482rq5su9qxSFEW9OTGIzsZJURRFURT1ZkED7hRFUdTb2effef993xn6+K+/+d17PiXOquTuUdlPfHjZB+9t9niUoP/VKt5dw+RnT41Pxwt/9tA1d9+x7Ow08ArF+4/X3PPRqYkTpZEfHHrqPAF3QWJWbAqOTWce/WnKdKS8ZbrQFPwkFGEAIACAbRvB5LA70BPXcpBhZYtxMQMYKIgC6zgYY4wgQggi5vXUcC8U7M99/m9lpdLBcnw6Nf1fvzFKOUFEupaVeNYXjGRTGQjMP/3YHQBcUMD9XHgORSNS+d/VVWT9Sp9lVXX3F4+cyI2MpifTUyU9m0ln9Xw2FKzMpQsDI5O7Dy8QPZ5KMei3DYbhx8bimp7bcs3i2258tcDLS8PdXzvwnMa4zbH65Y0tPlGec9yVC0IPvPPmXz119HdPPYlLq7/+2TUsi+rroOtGCAYEEMeJiQLjVc+4gi8MnfxV18FAMLwgVqdwtHo7dckQAsr/QfiGJl34AyIEEEIIKH9/OgsEEAIIICg/AzzrrRuIALr4kRMCMCEYk/J5Q2+Fs4cxwQQAAN48HS5fO0wAmXk6CwEEEEIAASh3ERMCAUAIYkzOeIZbvrJvinFcMjMnBLyZLhNFURRFUVcOGnCnKIqi3s4qPL7aytiuE4dcF8/+oYcQDAXFUPBU0vTYePEnPz/UPRRn1ZreodT7/mj9fe9ql8T5f0pWyN5v3/Nnm77zv6dK6Y8+8l/fuuehcx2dF1AJGgN6npfkgkXYYrFo2TNrVRk8eJ/n2aeCh/YndRMiACzX0XQLQmSbruM6HA9Z1kLAgPCif17f/a6V11/zlV//Lv3UM6/4gqGmppb9B/amMsm66thVqxZ6VXn5kprrr2v2qHMD2W+EwEOB5wDgwiF5zYqw4zR+5h8GXtwz4hHZ5pbGpqa23bv3dHUfZhnDKOm2rssiz/I8YZjWVu9H3tusyKeKDh8Y7f/ijsd601Mhr/LutvVbYgvPPpYisR+5p+2+Oxq+9N8nnnz6xfYtT9x0w5Yvf+4GANDpJvOUMB6OT41mkh/dcNOG+gudNpaiXpPjkmTOLOmO7eCAh48G35KlivIlezSuFTRbN92z13IsqqmQ/SoHAEjmzLG4NufFm7qo0lKjXtQRbQfrpts3XuwaznsVrsIvtNZ5/Oo557h+k+gYyPWNFwAA0YC4pNHnkTn2jc208QZZDtZNd2SqNDyt5Uq2YboAAI/MhryCV+H8KhfyCZaNByaLEZ/QUuPpHSuMJ/SZzf0ePuQVQj5eld4+fxhmCtZU2ugZLbiYNFUpsbD0Fv1UUhRFURT1FvX2+b2KoiiKoub173f+8Y3Df/ueb37xiU/8/wiisxv0DhX/+ev7duzc5/WqimpOTiVEruZc0faykOJ914obnz68+3f9hz/x5A+/duuDZ7cZmrD/56nhJ57tG9dNqE25lpnT8ee+7F69ZtkH766oi6Hf7ZLjcTGTYVi/H5dMgyGCKEPEAgw5hCzdYljbNuL+SGnF0tqz939+iswrcuTD94XuuqXq7//vY1/8+5sGhq/6X595LODVv/JP90AIWRbx3OWaVY9jIccyADDvvG3L0Y4f2TYeHx/K5xNLFsf+4S83h4Pyk9sT0IWuaQsKc8N1FQyD5NOxnqPTQ//w8s87s2MyK31g+bb7Fm3kmfmvhSwxsiR/9pOr/uqPl/7157f/8rGdz+48/rGH7//4vfNPBru95/iP971YGaxcUN0onGOfFPU62A6eSOqTKb2kuwtq1LdoaM92cL5kjye0qbRR1B3DwgAAhACDYNDDR4NiwMMrIgsAyJeciaSeyltFzWEZKIusT+UCnosOlJs2ns4Yx/qzLxyKB718S40aCYhehXsdmfK/H45LLBsfH8y9fCwBAGir81YERJZBHvnV7yea4WSKtkdivcpFzJPx+riY6KabzJnjCf3kUK5rOF/SXcfFAs/4VS7iF1SJ8ypcRUAwbdwzkl/c6Gup8cQzZudwPle0TRsDABoq5QW1HpFHb6eAe/m+2nMi5bg42xIAALxFP5UURVEURb1FvX1+r6IoiqKoeam8uHrBsp2H9/7dzsf//tp3nt0gnS0c7Ryra1r05w9fe8M69cePHfnuI/sqwuI9d6zYtS/xn9/b3tvX//X/e9/alY2zt/r7jXflcqWnO/ftHev6xx2Pfea6d81eOzFt/ugXR3/06725kqrIMZkTVUkI+P1+n29ySvnP7xGRh7ZZIsBkeRmJskeSsQsAIcB1ECECz4ksqKxSVE80Gs6yzEXXcC8TeBTwy8vbW77wpZ//49/c97n/75ov/MvPFfn3l0C6bUu1KH/0a1//1WQ8vX59y6f/eH1lRIEQ3H3bq3OZMrOSQ4eyya8f2N6ZHBJE6YMrtn109VYWzX1G8sLe5NBoQVGlGzeFfSoriYwkSv/2hZs3bNn8k1+++Hef+7edz8R+/t0/PbsziXw2V9I+smrTdbULLtN4qSuTaePBieLxwXwqZzIIrGwN/KF79Hp4VW5xgxcTMp7Ue0YLQ1MlAIDIMYrM3rS2cnVb0O/hZaH8lE7iOfTM3snjg7mgl19Y513W5K+tkC72iPmS3TmUPzGY6xrJ8yzKFu2rFoZiYYln36QFQAqaPZUyuobzR/uyAADXJQvrvCLPzA64D09r2w9Or24Lrl8Sutz9MUy3f6ywvyu980gimTMNy60KSbGwVB+VEYIlwzk5lEvmTNshDIKqxFaGJACAJDAIwhNDuYmkDgDIFv0Cz8TCF3353sz6x4uvdCR7RguOizXD9Xm4t+inkqIoiqKotygacKcoiqLe/r5254Nbeo4//crOeQPuksBGvGhBnX37Fh8AYPWaxfv79R89N727u+fAK69MjI1s2bgiFJz7tzqHmP+4/QMPEv3ZPS8+aZJQJPLw0o0za2NRYfO6usNdDo9qg2otywq8xAkizyJkW6bj2NjlFFW0HGA62NExyzISBwQGCoiHQCuWhha0ivfcWc7Ie0NVXwSevffOFd/6XhpCyLHMvDn+lw9CcPPa4Oa1H56znJmvAsNYKfvFg0/u6t3LIHxXy6pPr795ToMdu3Nf/+5TB44cN3SCXbC0fcny9tbPfnK5V+U4jnnwDu8f3XzLP38tUEqNnL3z7T3Hv7HrmZpAZGF1/Zs2f5Z6KyonhveNF48PZHMlu7FKSeUtRWRE/nK9QXKZ8CziPXzIKwS8vGG5UykDAOCRWYigJLCVIZFjUXlaTp/KcyzyqRzHIo5FisRWhsTXl9ANIXAcohku5oHj4vKSNzOEoOOSctUdyyEQgpmZSg3LjWfMjv7snhOpaFAE4DIG3AkB2aI1Mq3tPpHa15nuGMiqIlsVkhY3eFtrPVUhCROSK9p+lR+Z1jr6swXNqQgKlo0BALLASAKTL9nlS1wTsUq6Yzuv87HumxQBGBPddB0XY/z2GhpFURRFUW8FNOBOURRFXRE2rrzqJ88+/uFH//vbd31kzqr2RZE/f2jV17+79/mXJrZtii1rkLatbfnHr+148fm9C1tiP/iPD21cUzPvPiEA377lI3ens32T4//z4jPZZPLPt9zOolNRtmvWVYp8+LfPshz02y4q6IapaxzLcxzHMgImoFByEWIhYkUB8AzhoAtsDUBdkrWmZcwdt16y9999XvkvPnk7AIBlWElSHAez7O817H4hCCGT2cT2E3tYgX1Xy5q/v/6MKj2YgCeeHf7P/36eFbkPffB9iuw7cOD4jl37+wamevqGfvCVOwJeAQDAc+hvP70BgA1zdn48Pv79/btcx373ynWb61t+f6OirgDlmh69o4XukQLGZDypj0yXaivkt1zAvcyrcnVRRTk9XzTHIp/CqRIrcMxMKJxnEadytRXyghpVEpiQl5cFhrv47yqSwFRH5LBfEDkmEhBiYckrsxyL3rQhd1lko0EY8vI+lQcABL18RUBU5VPnqqg5R3oz+zrTXcP5zcsjl7UnBJDRuHagK/3MvqmBiaLt4LoGZePS8KblkdZaT/m5CCbExSSeMb/31GBHf3bmbSFJZD0KxzJvup8Cl1AkIDTFlMHJku3ipphS4adTZFMURVEU9XtFA+4URVHUFeGfbnzPof6uvZ3H8obmFefmjDc21lTXDP5ux541y2/bfbj4/Z90OCXrrtuu/eQHly1fFNAN27IcTAiEUOB5UXg18CSw3I/v/bMHfvyVzvGh5/qPQp751NqbRPZU/IVHFnDSWcvkOB+DECGMiyG2CeMijoUQMSwHWBYj6AKngN1c0OM01nlvuvVSTmQ6m+O4Bw8O/Ps3t3/sI9cIwmWvL3zhMCFHpwY/9Ni/mY71zkWbP3/D++c0OHIi98hju2prff/7T7cubA4AAMD7o//6ncr/eWzPSy8f+buv1n7pr9ey7PxhOgfj4cTUwOToO1esu3/N5ss9FupKMzRVOtSdSWRN28EAgMmUfrA7I/JM2HehMT7LwUXNcTGBAKgy+5qRetNyDQsblssw0K/y887Y6brEdnFRdywbswyUBFaV2AtJHkcQsgjOxLwhhAgCCM9IPIcQQAAFjpFFlmUgQuerAIMJKeqOaWEAgMgzqvzqB1USmOqIdO3KiqqQqEhsRUCMBIQ3GG0vaHZBc/wqL4uv/cDDdUlRdxxMWAaKHCPwCADgYmKcPsNemVMl1rBcQoDII5aBksBsWh6pDIkAgMqgFAuLksBgTIamSicGcy8eTZwcyumWe1mzqou6k8pbe0+kXjyWmErpDIKhoLSsybehPVxbIUvCGQMPecmq1gCCcCyulZfMzsovIwA4Li7pTkF3WAaqEjvzNsMcGBPDwuV3EYTTZ+w8dNMt6g4AgGGgKrH8eZ/KEAAcB5s2LuqOyCH/uWcFsB2cPV2D3quwXnnuj7O6Chkuj8QiMsakLirXVyrn7ydFURRFUdSlRQPuFEVR1JXiXRu3fuvpX77jm1/41Uf/OiCd8ed3U533nncu+ep39t754Udy6Zws8g/ctfX+O9vqqtyiZn3pm7ueeOqoqTuKIt144/qPPrAkViHPRJi8gvS9ez/x8d9859hY/yN7t3Ms+uOV2xROAACsXC7zovTUDj2RzECgIMhDhgUAAUAQAoIAADZdM09IIRzCNZXSO26/XKH2MpZlWZZ56ZXDXi9/77vXyfIfPumPAJIzjcH05Ece+6plGfev3PqP190/p41mOL995hXI+/70oc0LmwOmhVkWMgh++kNLRFH41g/IK3uOYnIVAPPH145OjfzHy88qgriwtuGyj4e6khAAAAFDk6VDPels0YYQEAKm08bBrvSCGrWt1gPPrF7kuMR2sGm5LiYEAARPxbWLhjudNiwHQwBiYSniF3gOIQgJIaaNDcvFBBBCAAAMgiyDMgUrU7DyJZvnUH1U8ancTIyVEOC42LKxZrolw0nmrJLucCz0KVxFQJRFRuSY88fHLxzLwNnxU4yJg4lhubb9arAZQYgJmU4bec0BAAQ8XFVIkniGY5GLCSGAZ9HCOk9bnQcAwCKoSKztYN10HUxmYtYIQp5DksAQAlxMTMt1XEIAEDgkCUz5tNsOdlziuGQ6bSSyZizshrwCzyGORSwDbQfbDjZt7GICAGAZxLMIE2JY7mTSMG1XFJgKvxDhRNN2S7qTLlj5klPUnYqAEPLyJcNlECw/DDAst7XG01KtAgA4BokCAwAoGs6JwdxLRxN7T6YSWRMAUDLcZM5kEIQAEkBmriAEAKHTw8HAdrFpYcfF5YWycEEPRXJFe2C8uL8rvb8zDQAI+4TaqLy40bdywTxlykWeWdbkQxAalitw88S7XZeYlpvKWwyC8awpcKgiIPpVzitzM7cKxsTFxHaIYbm5km1aLibAq7B+lRc4xDAQEGA5WDdfvVcRhCwDMwVrImUAAHgWVQZFv8pJIoMgJAAYpmvarusScvp2QhAWdSdXtONZ06uwtZjIIityCMJT3ShfR9shRd0ZT+pF3XExqQqKVSFRFBieRSyDMCaWg2WRbYqpTTEVQsggKL7WgwGKoiiKoqhLiwbcKYqiqCvFx9o3TqUTv9z13F//9iffuPuhOWs3rmkolPQvfPmJRQuin3r4pquWRwFwAQDf+cWxH/7qQCBQ+Y5b1hn56d0v75mcmvry392izEqpC8nqV25//1889ePDoz0/3bedIPDhJdf4JQUAsKQNIkY8cBhMTZJ0xoQM4gQGQAyBC7HukQte2a6oEG++gWUv/89k13UXtlZ9+YsP/eLXB3/1+P4H/mjTZT/keREARnKpLxx4dlfHboise5Zv+Yezou0AgKdfGPjtC4MVVbW5Eszk8Qsvj7Y1Sa3NIZZl/uT+llf29z+/45VcwY4E5wm4G47dPzVe0oofuPr62xetvPxjoq4grktsByey5kTScF3CMch2cSZv9YwWJlNGQXcUkZ1JP3ddMpHU+8YK+zvTiZxpO9incKrMAgBK+umAOwRLm3zLmvwrWvxehSsZzqGezP7OdK5oaaYLAIj4hfpKZXiqNDyl2S6WBaYqJF29NHz9VVEAACHAcvBYXDvSlx1PaImsiRB0HJzOWxACVeI2LguvWxyaHaC/hHIlezpjvtKR7BrO2w7GhAAAvDInicx02ihoDgAgGhSbqpT1S8ML6zyJrNk9UnilI5kpWLaLAQCxsHT3tbWYkJ2HE+NJLZ23AAAsg2SRaW/2X7OiwnJwMmce6EqPTGu2jVe1BbatjnIsMm23d7QwPK1NJHXHJQAQyyY+hVve4m+KKbGwNBrXukcKR/uykykdAFAfVRY1eDXDSeWt7pGCZjgemdu2Orp1dcXhnkxHf25oquS4RBYZw3ItG/tVvqla2bA0PJE0XjmezBWtctZ2U0zdsiICCEjmzJePJQ/1ZMvDBAC8cHh6PKEFPYLAI8NyddMtGQ4AgGNRxC8sbvBduzJS1J3ByVJ5OH6VW94SuP6q6IVcmkTWONafTeWt8pcemW2pVs/1RgXLwIqACCH0Kmw0ME+lslTePD6YOzmUJwQYtsuzSJXYLcsr1i8N+VWu/L5FQXPiWbNvrDAyrWmGUzJczXBCPqGmQlrREqipkGyHnBzK7TwczxVt3XIBAF6Fq69UUjmze6QAAOBZFA2Ky1v8N6yJemTOcfDLHckjvZlE1jQsFwBQE5EjfmFgohjPmIblijzjU7ltq6NrF4cU8VTBorGEfnIw1ztWnM4YPIs000lkTZ5FAQ+/YWl4aZOvOiJlClbvaOFYf653rAAAkEU24hfWLApubr+8RX4oiqIoiqJmowF3iqIo6gryN1vuGB0fOTHcN5xJ1gfCc9YuXdTwf/78vY0xua3ZN7PQMF1ZCbQvX/7R+5rrKhf99LGqr3zzmc7e+Or22Ow00ajq+6eb7vvcjl8cGun56YvP6vniw1ffEpY8AIBFLWhRCzjZxR0+queKSc1kBQFJIhF5fMdNvM97zrfmLzkIIcOwtdX+TesaDx4e1nVHkv6Qvwn0pyY/t+MXe0d6BYG9pXnlP2x9cN5m0Yja3FS550D3V7+jtDXXHdj99Nr2wCcfvi1a4QcArFixbM++Y7sOZt59Q9WcDU3Hfq7n2Je2/3pr89IPrrvuso+HusKUDCeeMXIlmwDiVViEQKZgaaZrOcZYXBtP6HVRWT39ESMAuJhkCvax/mzfeLGg2T6V96ucV+EwJqmclddszXAyBcu0cEOl4lE4QkAya54cyg1OlpJZEwBQE5EWN/rSeSueMZI5C2MS8PAemVu7OFgOjKbzZs9o4aWjiXjWMC1cX6kgBPrGium8SQDgWBj08W113ssRcCcE2DYenCjuOZHMlezy/JxVISkaFHJFO1ey8yXbr/JDk6XqiLywzuNikivZvWOF/vFiMmcCANrqPNtWR2WRzWt251D++EAOE1KenVXgmY3Lwq6LNcM5OZjrGimIPKqNyhiTVM6cTOl7T6YGJ0uZghUNitGA2D2S0ww3r9mWgwMe3rRxvmQf6k53DOQAAM3VarpgWjbJFq2TQ/mS4fgUrqVG1Uz3+GBu19H4RNIIevmlTb54xhxPaD6VgxCsXBAo6vZEUu8cyo1MawCAVa2BtjqPLLKmjQ3btZzyqwsAAGBYOFe0OQbpJsoUrdF4qX+8SAgQBaY5psoia9khFxPDdE8M5DoGcksafU0xlZALKkSTzlvdI/ls4VTAXZHYuqjsV+evEoYQVCWW55Bf5eat6FIy3HjGZBA0LHciqdsO5ljkU/naqMSzKs8hxyVjCe1wb/bEYG4qpUcCIiAkmbMm0/rAeLH8FodXYTMFq3ukMDhZimcMAEDYJyxt8hmWOxrXckXbsHDQyzkuXtka4FkGIpAtWv0TxWN92fKTlZYatT6qpPJWMmvGswbGhGNROXm/JiJBCA3L7Rsr7Dqa6B0taKa7rNlnWnh0WssWLQAAhFDgUNDLu5iYNu4fL77SkTQsV5HY+kqlMnjJ5kShKIqiKIq6EDTgTlEURV1BWMR89d0PXfvVv/70b77/5Xd+oM4fmr22JirVRKXyv1PpYr5oVIQ9Vy1r/u0zxwqZSddZAAB/37vanto5+rG/fPKlxz8knFlqudob+OzWu7/8ylM7Og/++uReh4EPrdha7Tt1iMULrcULGQDkzj6nMoICvj/AG+4QQQJgLm+pqtd1fV09uZXLXz0DhYLBcYwo/p5qu/cmxj/99LcHcwmB5W6uX/7Fm+fWbZ+xcXWM467hOXXfwYGOI0duu3HRww9tjFZ4y2vT6TTHcrdfUzFnKxu7e8f6v7rzCZ8ob1664jKOhLpSxTPG/s60abmNlQomIJkzi7rjuC4hYHCy1DGQDXi4mYA7g2AsJOWq7VhEimfNouYUNRsQUFshh7x8Vcgdnir1jBaGJksSz9y4tpJnEaNw1RFpQY0nlbPKAXfLwbmS3RxTl7f4dxyKD02WUjlzPKkNT2mxsMSzsH+8eLQve6w/61O4llrP9aujsshohnt8AKfzZu9Y0X88FfIKl2MOSa/CsQysr1RiYcmwcDngrspsLCzVVMiZvNUxkMsWbd0sZAoWy6BoQGytVVcvDDguLgfcy2or5HduqjYt3DtatBy3vJBnkU/lWAZBCH0qFwuJS5t8y1v8XoU7MZTbfTy1rzNlO7ihUlm7KLSyNZDImC8eSzy3z3Qc3FrrqQiIK1sD2w9Ol/c2nTb2nkgHvDyDYLkcOQDAsNxMweofL/aPF3mOWVDrueuamp6RQsdANpE1WQZ6ZK6tzosJKOlOOeBeFgtJi+q9hukCAA52ZcpjuXZlxb3b6lgG6aYzltB3HIoPTJQIIQyEisQqIoMQrPCLIs+8cDgez5jXXxVdsyjEcxf0ICSv2cPTWjnLHgAg8kxk1tyt8+IY5JG5c9Wr4Tm0eXlEYNHPXxgdi2vYwlMpvX+8GPGLqsQWdOdYf+6R50dyJdursDesqawKSaPx0r7O9OGeDELAtN1rV1bURORlzT7NcMoBd0yIZeOIX2isUg52Z3rHCpmCPZkyhqdLksBE/EJbnTdTsIcmSuWAe1Fz8pq9qjVgOfiZvZPJnIltPBrXuobzXoUDAEwkjY6B3EvHEgyDmmLKretjjosFDp0YzI0l9M6hnF/lljT5ogHRs4gbmiwNTBYnk/qFnE+KoiiKoqhLjgbcKYqiqCsLx7K3rFz/5JH9n3/+sc/e/J5qxTtvs8efObxzT+/D779u6/rGZ5dXPruzs7tvSXVU4Tk4OTnBMvOHy6s9gY+vvcE2zZcGjv3i8K5sMf/hNTdUe0NB8dWS8YtaLtcP35HRRGVlgOfOuX/suolUfmCkAF3DtjXvmcn1L+/u9nqVVSsbROGy/3pwZHLwb5/8/oiRsnTjwTXX/s217z5/+7XtIfC+9arECwL42IMrVMVjO4BjQWdf8oUXdrzz1pXMWfNGThdz3zv4AjGt92684dYF7ZdtKNSVK5WzjvRmqkLS2sUhAEDfWGFwsqSbLiFgZLrUOSS0N/kjfrFcVQZCIPBIERmRZ8pLRJ6JBIT2Fn+FXxiZPlVBRTfdguY4LoEQsAwUeUYWmZm6NNGgtGlZJOTjbQcrIoMJsRyiGW6+ZId9AoNQvmSXy7sLHAKE+D18wMPJIsMgiAkoaHYia5iWeznOBstASWRCPj7sF8YSpwKdDZXKpvZISXf6x4s9o4V8yXZcnClY6bzpkTlFZH0KN2eSWFlkaiJyS43aWucZmS7lS7ZuugXNzuQtVeYwIa5LVJlrb/Y3VCosA4cmS4d6MuMJPezjq0JSdViqDIpBL8+zKFO0JlP6eEJriqlemWNP53c7LtFNd1WV0lKjJjI+28WSwDbGVM1wi7pT0B3JJdNp41hfVhKZpU3+sbgW9PKSwBBCwj5hzvsBAo/8Khfw8D6Fm7lSIS/fXK0CAAzL9SrcaFyrCAj5ou24OJk14xlTN12WQYaFFYmNRaTGmFoZFOedp/Rs5YT98iMNAAAhxHHw+adpLd9OAICzc+i9MltbIS+s8/IsigbEVM7STSdbtCZThm66uuWOxbXhqdLItIYQCPn4qpDUUKVACDoGcrmi3T9eDHqFq5eGBR55ZI4/XSbep3ArWwMVAQEAODBZKtfZNy3XMF3bwRAARWJnn7GKoLisyb+yNZAr2ruOxAkBhJDynKuui10MDMstaHamYCkSiyAM+wQAQcgnyCLrumQ6Y0wkdcvGPId4DikyK/IMurDzSVEURVEUdcnRgDtFURR1ZRFZ7tObbj/Q3/tyd8ePa+v/cu318zabmCp29ycLJRMAcMM1y3bvG//Jb0bbF0VjUZFBZizqOVeqYEMg8mebbxMYZvvg0eeGOk5mJt+zZMOdbWvCsufyDarsez/83c03rVu1vIGdr24AAABC6PHwAR/X1TUdCbPNjWd0qb9/bDppVVUGGxuCl6+Tg7nUVDb5V7/7wVhuWuWUhzbc8Rcb33EhG65t9wZ8a4I+jhDws9/2R7x2KCB89dsvtS+q/NtPXj3nEYhuWy8PdB3t697WvOx9a669LCOhrnipvHmsP9dW592yogIAIPLMC4cTWQAwIWNxXREL6YJlO5hBzLzfLgIevqVa3bgsHPTwpo0vpMxLS7V6/w11qbx1YjDHnf6Yuy4xTNd1CSbAcrDtYEKAYeNcybYdPHtzxyWmjd0Lq1vyOkAAfQoX8vI8e2rAbXWe266OdY8USro7U88kXbDGknp9dP5vUwyCDA/rK+XVbYGS7qTzVlFzEhlzeFoL+wTDcjXTFXnUVuetjkguJkOTpY7+LACgLirXVEh+D4cg8Klc0McXdaeoOyPTWsgneGclgDMMFAW0YWn49o0xw3IdlwAAiroznTZcl7guKerO0b7s8FTpHZuqt66O+lVO4hmRR7p50c8qRJ6JhaX6qFxfqQxNlqbTxsBEMRaWirpjOXgyZQgcU1shh328LF5onR/XJYZ5agJYAIDl4HzJNi6+b2Uhn9Ba66mtkACA0aA4ntAN0y1qTiJrmrarGc7gZHEiqZu261O5ch0kv8plVV7iGUzIZMoYnioZpjvnqWdFULx5fZVHYoenNe95s+/LWqo9266KNlQqfeMF4dyZ/oQAxyGWjTEhHANFHjEMxITkinamYM28r0BRFEVRFPWHRQPuFEVR1BVH4oW71mz5r51P7T528Hht69KqurPb+AJ+yRMkgAEAbNvS8MNf1R7t6i9qSwAQP/6hG30e77mS3AEAjYGKj2+53ev3/fbknqH4xI/MF0zLunvRukpv4DKOCoChockf/c/u1pYqv0+atwFimFze+ekvjwZ93NpVtbNXTUzmkklzdDSVyxcBuFwB9+7U5H8feOGFrgM5VguGQu9bdv0nVt0ws1Y37ESyUFdzzqMvqFcAACf6Cjt37T56fDQcDixs9v7z/7ldls5I1bdcZ+dA55d2PB71h65fdtVlGgt1JSvpznhSn0zqPIdsB+dKNgDAcUnAyxd1u6A5toPzJat3tBDy8c0xlTvHMzAAAAQAnuvx3bztz2qsmc502qiNyhE/397sVyWuqVotp7Ef6ErnSnb/eFEznQusD35RIAQcA3kWze4VBLP/DSAEHId4HsHZ6cav1ZfKoLSk0XesP1v+MpU3O/qzQS/PsagyKIZ8gsgj08Yl3TFPJ3qn89bh3mwiawY9wuBkSeCYypAY8gpnn12BQz6VF3iEIBQ4hmMJAIBFEAAQDYpBL1/QHMt2s0Ww50QqW7QX1nna6jxvJF26KixtWR6xHTydNgAA2aJ1pDfDMCidNxWRqY3KsngRf5QFPHxrrToS18qFhmyH5Eu28QZeXIAAAAARAjyHWBYCCGyXmLaLMbEdUig55ScNjkMSGeOZfVNhn5DX7FTeqosqDILl64LPvMHg6at/oX2ApxrDM+6gUySBqY5IW1dFQz5B013HxTsOxcslgMqnFMyXvE9RFEVRFPWHQgPuFEVR1BVHYrl7l61NF/L/8/Lv/mX7r/7yprsXh6vntFmxrPrFg/2vHBoMh6OCKOUtmMqlHMcGANx+ff1rHqLOE3xw2aYq1be99+jBsb4f7nuuUMq976pt1d65M7VeQrrhTEyP7T80ct3mBWcnuZsWnoi7iGHz2eQt29atWBabWZVMlZ57vrd/MF8olgzdBJfHgfH+7x7ccaC/M6vl6ptr71+99UMLNs9ukMlqz+3sueGaRXU1vnPtBACwpMXzgfuu7uyplyX+3nes8HrOmA3Pwe7ukZ5v7HxCJOQjm266sY0Wk6EuvaLudA3nx5M6z6Gi7ozFNQBAvmR7ZFYW2YLmuJjkNadntFAZEuujyrnrPF0CpoUzBcu0XIFnGqoUj8x5ZHYiqU+m9K7hwvBUKV+yXfdCg5EIAvbMAPq5YEwwJoLEivz8KfynQMAykD1vk7OFvPyCWk9FQJQFxrBxOm8d688GvULQy0eDYlNMEXjGdnBRd2aSmnXTnUzppuXGZRMAUBeVAQCxsORT5k4WKvJM2MeXu80y5cgw4FnEMLCxSmmKqQMTxXzJLk/QOpXSJYGpq1TIG0iergiIaxaFOofzR/uyGJNs0T7Wn0UQGpa7YkFgQbWqXGTAvaXGkyvZpwPuOPfGAu5lEEKOQeUaLy4mtkMwAS4mmulYtgsAsF2cLzn9E8VMwQIAqBK7vMUPAKitkCWBKRnOG+zAeQgcEnzCogavX+XHE1r/eHF/d3o6bTgO0YzLUiKJoiiKoijqjaABd4qiKOpK5BWkj6y9NlfMPtG97+t7nv3UhjtagmeEwjeurusfbv/xLw91973EcEL/8MSihTWyLJ5rhzN0w8kXzGhEqfeGPrz82hWRum/sfWbv6MkfndiRc/StC1avrmoKzSrpfglZllMokG99+yXT1G+5oZ2ZlYNv2fjo8dyzL4zoullXG5kdbQcAdHZPjY4VXBe4mFxERuIFO54c609OfP/wjq6JEZVT3r/uxtb6hvcsWDunmSILXlXe+VLvg/e+Rlr6TVtabtrSMu8q3bb+c89vp3OTf7LlrruWrLk0A6CoMxU0p2MgNzqtCRwamiqV44+a6RICZmpSa4ZzcigXC0sbloUlcKHVQt4ITIhtk5Hp0jN7pwYni5mCtajeu3ZxsG+sOBrXtAsrOSLwzNkR6nnplquZbnVEDnj4Cyw+fuEEngl6+JZqdWRaG5gopvNWx0Au4hfqK5XFDd6mmCpwaCa3vcyvcksafEubfK21rxbLEnnGI7OqxOZLr4aDvTJXX6l45Ll/B3Es2tgeUST2t7sne0by2YLtuCRbtF88mnBdUh+V2bPmirhAHpmtj8oVAdEjcyXdyZfszqG8wDM8h3wq11ClXEhBoVn9Z+ujcs9IvvzlqZIy1mWvpuI4RBKY61dHlzad8UxUEpiwT7isAfeysbj24rFk13A+njH8Kt9W55EFtms43zlsX+5DUxRFURRFXRQacKcoiqKuUGHF86nr7jCQs6P7xMJAXcvGbXMaXHf1Qonldr0y2Dc8esummk1XLwkH5NfcbS5vdPelopFTIfXVsaaPr79F8YrbR44+cvLlvWODt7esvn/F5qrLUF6GY5lsJlVb05BKFWensxqG/dzz3R3d1tRUMpfJgbNe149G1HBYzWRTqleQ5fnL0bxuuwe7fnT8xX3j3UmtEA1E7mm7+mNrb5A4/uyWPq941fKap5/uGhxKv7468g52f7b/xZNTAysamx9ct/UN952i5sKEFDUnnjEmUzrPMUubfLOTwRsqFYFDqZxlu7hcoXt4ujSR0GEEnh3eveRsh0ym9J6RwtG+bDxrAABiYakuqiRz1mTKuMBQscAhn8JJAmIQLM9QOlPlfAYmBGOQLdrpvMUyUJYYdKkf1LEMlEWmuVodT+pTKT2RNQ3LFXmGEBDw8EGvwDLIxUQSGI493VVMDMv1KVxbnRchgDHQTKec2j+nGgzPIZ8896GCYbklw3VdEvTwaxYGPRLbNZzPFKyS4YxMlapCYslwVOm1a5HPi2cRz6K6CrmlWu0fLxZ1ZyJphPx8dVjyypxH5jAhiaw5ntRNyyUEVIXEoFcoz3Z79t58Kt9crR7pE2WRNS1X052RuDaV1rNFWxaYmWlLyzAmmukWNDudtwIevip0cd/hGQQEjinXRMKEAEAkgYkGxICXL5/2VNayHHzJb4A5bAdrpjswUdrfmRqaLCEEV7UGKgJiUXdGpkuX9dAURVEURVGvAw24UxRFUVeuStX/vhXX7unt237iyPLKmk3NbbPX1lbxte9YtHZV8+hEbkmbN+ATXnOHmuYeP55JJNIAvFp2ZnlVw0PCjSsqG7d3Hjk81Pf9Q8/HzeziyvrbW1aHJPUSDqe1rc52lXDYd/e71s6UmLdt9/mdPQePpGwi+v1+y3FSqcycDUVRsK3iiuWVq1a2xKr8l6o/xxJjhyf7Hz/+Sm98AgL03mXXLKlteUfLComdJ9peFgl7Wlqqjh6beB0BdwLAL47v//LvHqutrXxg9fxz4VLUG+S6ZCKpj0xrpo2XNHgfuLFhTtbzb14a7xkt5Eu2brpF3ZlI6McHcgwDPZd/2mTddDqH8x0DuYmkxjAoFpZaaz01FfJLxxK2gy+wpozIMz6Vk0WW55BpY8vBuZJjnlmuxHWJaeNE1pxI6i4mPHtZwq0sg1pqPKmctb8zDYAJAPDIbIVfUCW2fESBY5AKFZHlOWTZOJ23DvdkmqvVdZYr8Ixpu5MpQzdcAEBV+LVfTsqV7NFp7cRgznbw1lUVixu8T+2ZPD6QG5go2i42LWxYWODfUBZ5c7W6ZlEwnbeyRSuv2VVhsS6qqBJLCLFs3DtaePyViXjGwJjcuLbqqoXBmog0b+Z70Mu31XnronLXCJ/MmtmiXRrML6jxLG3SaiISf+bjTAeTeMbsGc0f7s20N/svNuDOMsirsDPd0E23czgf9gsrFwQkgXFd0jWSzxXt9UtCr/u0XAjddMcTes9ooaM/Z7u4OaZuao/IIvPi0YRzweWSKIqiKIqifm9owJ2iKIq6otUFIvetueYn+1/+xq5nRJa7qr5pToP6Gr6+JnKBe8vlzBPHcw31c0uQLwlWLwlWL/fX/0De+dJ458+7d/tGOvqmJ1ZWLbi5tV2eL937dXjPXZtuvRk88VTHz365+333b2ZZdLgjPjo6MT7NLF22pLoK9vSPPf5r88ChzuNd65YuPDWoianCo7/e7br2ww/dVFd7aUrMD2SShyYGnh04smf8pG7rVd7wnQvWvX/11qD8Gg8YVJWrigl79o69joP+pvPQv+14wqN6PrXhHTc3rnhdHaeo83ExKelOx0DuxGBOFpiKgBjw8HMC7vWVSnuzv3M4PxbXMCbxrLn3ZMqrcPVRZU7LkuFkCpblzI3hOi5O5cxMwfIpc/OpT5Upt+cP+9oOSWSNRNYwbQwdnMqZLx5L+lVuZFrTTZcQYFputmiPTGmVAbEiIM5JhS4rz4MaC0sNlcpIXLNsnC/ZvaOFfZ2pWFhWJda03NG41jNWyBWt+kqlMih6Fa6cQk4IyRbtRM60ZvWQYFDU7HzJds+K+WMCbIfMLMcY6KZrWK7AMRAChEDIy9dUSLGwlC1a+ZJdF1VWtgaCXv7U7JoQsAhWhaTGKnU0XtItnMiZe06kXEyiAZFj0VTaCHr5RfVegWOMWRV1LAcXdNt2zuiPi4lh4YGJUrZoNcbUgMpff1VUN93ByaLAM5LI8CyCAFg2numw45Ki7pg2LteC55hXa9+PJ/X9nemS4Sgiu6jBq0osAKAyJLbWevadTI9MIxfjCr+4ckEg5BNsByey5uBkqXMol85bAID9nSmWgQGVmzfgXi5Es3ZxCACw+0RqZLqk6W73SOH5A9Ptzb7GmOpTOAZBB5N03pxOGycG8+mCJfGs57wZ+raNk1kzW7Bnz6+riGxztad7pMCzyMGkZDiHezLl8LfIM4QQzXA88jy7dVxSMpw50wVbDs4UrHmrrmuGk85bc54H5Et2PGMYFtZMdyyhJbJGuVR9vmS/cjzJsahzKJ/MnZp3pKDZR/uyLIOaYorrEtvGhACMyeyZdSmKoiiKon4/aMCdoiiKuqKFZPW+FVdbtvOzPTu+sefpP5VuX1lR9/p2petOX38uFBTWrZt/DyurG2VZ2hJf/IuOl49MDP3i+J4Xh3r7MhNtVbW3Nbaz6I1WeV62pBYA4PGI//4fj5XymU98/F2SyAYDytIltSzL1lWzHJtlODQ2pf3okb0fvH9DW0tweDT56yf2DQ5P3X3nhksVbT80MfCzEy/vG+2ZzCZESXqwfevq6gUbaxb6xdcuyAMAsC27WNQu9qBP9Hf8y7OPasXi5+983y2LVl58rynqtRmWm8pbx/qzncP5BTWqR2YtB0OImFPhZoAJCXn59mZfImtMJnUAQKZgHezJNFWrqxcGZYFxMSEEIAgZBuqmmynYuuHaDnZdAgAp78fBZCptTGdMWWRdTDAmEILyKs1wRqY1nkO2S8DphQAAFxNMgOOSouaUo5nlDPTnD0zzLMKEOC6BEFgOzhXt4alSZVD0qfy8AXcAAEKwPiovrPfmNTueMTXD6RzOSwKzemEwGhTzJftwT2bnkURrrbqsyV9bIZcfDJSPksqb0xnDdk+NBRNg2G4qb6XzFsanFhJMbBe7LrYdrJuu82pjkivZ+ZIT8iEGQgShV+Eqg1J9VE5kTc1wG6uU1W0B7+znEBDURqXFDd6CZuspvaQ7e0+mjg/kWms9Yb9Q0p1VrYFNyyIChwqaDcGpM2Y7OFu0dct1MUHwVJAcAggAmEzpg5Olhkpl7eLgmkXBI71ZlkF+lQt6eFFgMAZF3XFPd9hxca5oaYZDCBB4JEssz52qbzMyrb10LJEuWFUhqbZCLgfcI36xscoNenlJYAwLVIXFla0Bn8LZDknmzMnU/2PvTn7bqMIAgL9t9sXOJHbcLM3ShCxVCip0Q7QSFRINcABxRSDBCYl/BYTEvSfUE1x6LEVcUomSVlVamjqt2ziO420cj8eefeUwDipVoaX0xvyO3/M8P8970kh+3/vGru87hh1gBDdKXZbBJxaVkexTTlZhBDkGn1xSclmmbwWOG9YCe7tu6KZv2r7pBIdHBYogL4i2a8ZWpb/xoCtw5L0zh8ZGOABAGA7Ww+PrJwgjx4vUrtMzfQRhMlFJ0Z65cXGqIGRE2nQCxw1vl7qVplXcGdSgf20uO57jMYZRBJICPoPZjGLd8DGCyemKJOj5UUtze6YfxSAMoyCMIIRJk2kHrY4zNcoHYYQOxqabfn3fsdyQIkjVBjcniV9ZbxAEXT8y7SDZ7+lbwa37msRT4znO8yMvjJIVaDqh7QZ+EGEE0ct+2UAqlUqlUqnUU6V/uKdSqVTq/y4nSJ8cP2PavR/uXqOu4S9PvXtsbPoF+jFNt7LbPHdurlD428frwlBhYagwLeUu3bm+Xi3Ve+rFm1cnleGd/fpXJ1ZfSl2Go4u5zz97++LFK998/eP58+ffOjP/ZxOEIDeSX1195+xJRRTo4v3q95d+aqj991fPvrryZGr/C7hTr/z88Pb63taN3U2E4FR+4sOlNz9ePJ0X5Oe5XNe9tV+bLdWYnp1/9qf/6rtfLu911W8/+uKD5eP/fuCp1HPZqvSv393v9j2aQprhb5Z7UQRWjmRmx0QAgO2Gbd0tN6xK02IoPFUQAAAYQ4qgPdW+ut4Yz/GWE7heKHJkcpRHEMo8KTfMtu4+rBlBGCeXSDzZU61StZ8RSLPjVFWbYwa9MTSutizLDdu6SzBKgoTAcsNc0hxFpucmJd0KepYPIVQkenkmk88yuuGX9oyNksazJCtRuSwzJD+ZmP84jODR2QxL46xElapGfd/pW8HanXax0hdYEscxTaH5CfGNReXYkeyQPDig0+l5e6qtGz5NUGGYDYIYANA1vLUNNUkbH84wPEsAAJrh3yxqvh9Zbtjo2BCC5IfIAlXc6Uk8ObU8jOnBBqTA4lcmJdMJAIhHFVbiqceTpiGEy9MZCiOM4e+P9ErTSrY0/DDiGHx0JrM8LQsc3mlYm2UdIZh8kcCRruE39u1a2x7JMEkWucjhUYVRZLpcN4uVXq1tX16rVVXr8Ch/ann49QUFAlBpWbdLWhgNZopjyU7DOjTMTeT4iTx/cilWNYfCsL7vOG7Ys/yV2czCYVkSBk8EgqHEk7lxsWf6nb5XULiMSNEERVFcUNipgjA1yrd7XlLAx/Oj+B9rpVAEFRR29fShsRF2/V6nrbumE97c0rZ2+yJHBI6IHIEQ0gRdOF2YzPMzY+KwTMcg3q6b93Z6/MGighBs101ZoDCCkkAlQZ7FfhDvqfZIhskPMSuz2U8vTN8odjbLenJYwfUjRaYncvzStDw7JoZRrHadStOEEB70QB7VjHIDql3X86MkKHKk0bEbHVvrC8Wd3oPdvsiTpCkG4FHNgBDYXiQfDENgcRDGrY7DUGh+Um5pbrVlAwAyIrUym80PMQyNb93Xbj3QAADjI9zchIQgSO6GwBKswCgGNIW6ff+3e50j42JBeXZxoVQqlUqlUqn/7g8AAAD//+zdd7gcV3038HPmTC/b6+296UpXvVhucsPYyGATIKGF4hACIYG8SSAhOBBCfQkOCUne980TeieAwbgKN1myeruSrm7vbfvuzO70mfP+sdJVu2puQJjP48ePdDU7O3N2du7ud878fl7g7vF4PB4PSPiC773udgtYjx4/IJL8/RzXGYxf60pMy1SUXEPDlYuZrKlp9gu+1+VXf7f/hWPzI+Op2f8sZibSczX+yF/dcO+L2oPzbFjfxjD0F7748I6n/m3brStuumnzpvVJAAAEhK3Z89O5UxJ48vEXCqVCfX3s/ne9pquj0Se9pLI2Q7n5nw7sOTo/djI767pO3B/b3rXh+pberkhdkFl+YvuPfzm06/ldX/nCe6t/LSnGwzsmh0atpobg1i3XNvif3PGjsYWZG9dtvGfVxpeyFx7P5VXLsifCXHXeMYWIgmIu1SpxMTYsl4BAEqj2eqm5Rlh6IM+SpYoVEG0IQU2UE880UK22ozRtV2DJpqTQlBQAACQiRI50XWw7mCKJkI8OnQm1AyJNUQQwHBIR7XViy5mngACSiCAR0ZwUHRcbpkOTRDTArOkIJsJcvmTEQyxJQpokIn6mISGELqqEcy6CgHVRXuIpiiKSYW5qsbKY0zMlozrBmaaIRr+wotm3ovn0lYYq28a64YR8dGfD2Wr1IR+jqDZBwFiQDYh0NUKmScJ23GqVj4BIUyTRWguqO06RhGGeFzTzHNlRL0EIJJ5qiPMXlFiBANREOJ5BuumIHBn2MabtIgImwmxzUljdHqiP8QyFTMvRDacpKYT9Z090FEWYlrv0ZCyNwj6mo96n6g5NEarh5GXTL1Ad9b6tq6LtdSJNERhjgoDNSaEuxgEAEAFpChEEdDGO+BmGQumCwbPkdEoN+eiIn+lu9LXVSRRJWLZbfTU5BsVDbFNSCPnoRJjlGQQAcCEI+eiWGmF9V2hisZLK6wAAhibg8ncgnIYI6Bep1e0BiScpkphJq6mCUVEt3XINy6wOb9jH1ETYTT2RxgRPUwQBoYsxxpiliK5G31JtHERAx8Ukgt2NvoY4vzQgJIKm5SICNiZ5SSAZmuBYVJBNCEHIx9THuKaE0FojxkOsolqIgD6BamOWrpSQCEHTcl0XN8b5mgi7NGIUSdiO67iYZVB3k891MQCAIgmWRtV3UE+T37BOv61EjiRJSJFEQ5wvtfhl1aoeNms6grURTuRJkSMRggCAeJDtbPRRCOZlMyBSPU1nL/SG/bRSsUyvsIzH4/F4PJ5Xixe4ezwej8cDAAB1/vCfXHcXctGTg8cwJN6z6ZaeaPKa1oAQqVnEk08P33FLxxUXbvGHW/zhpC+YKRe/eujJkczU48MHoAOmsqm4L7q6oW17e9+L3RUAAFi1smHdpk0t9eau/akvfvlrPd2J+95wDwTQNuw9L+zfs6vS3BS9557Nd97e29gQeylPNJ5PfePg06fS0ydy0zZ0/KJve8eGO5tXtwYTkUt3ifzB4/Nf+uojEnM28tN0e2A0HwhEelf4f7ZjRi5lIXB4jscudGyHY+kbN9d0tC7T0PWTO370nYPPbepd/dGtr3spO+LxXFFvs78uxmEXVHNKRECKhEsVTjgG1Ua5oEStbA24+Nw62AARECHI0ggC0N3kW2rzSEDA0ggAoJtnK5xDABCCHI1EntzYE+5qPJsbkgjSFOE42HLcpc2oCoiUwJJ+kQr56K4GH4SAJgmRJxkSBUQqHmLXdQWr8519Askz5FJf5UsRWHJFk78lKeqmY1iuZbsAAAgBhJCjkcAh8fzK3SEfzbOoPs6fWy+bJgmShLaNbcc9u4MQkAgKLAkAaK+Tlva8uuMCSzLn1LoRWLKjQaqL8ZtXRIKXuC4o8tT67nB3k79a3QVAwFAExyCRo1iagBA014ixIGucU34dACDxZLXh6pmxJSSefO3mxPWrIgSE1SorCEGGQgGR4hhEQLiyNdCYEJZeXAgAJIDIUT6erMbfN/RF13YEddMhSYKliYBIkwhatqvqtqLZoTPb7+PJuihXc6ZeOSQgTRId9VLEz+w/lT88lAcANMQEhrpCnTECQpokmhJCSKJ1y63Wl68ONEKQQgRFQppCfoGiSaJ6BxUB4brOUEe9hPHZ4wcCwNKIIIBunh0iAgKBI3mGpEmCRAQdIm5fn9i8ImzZGAJAkpClEUsjiScRASWe6m0J1MX4pcMeEZCmCOxiy8EXj5jIkVtXRte0B5c2A0JAQEiRpyvPuOesR+JJlkaIgOs6Q211Ejh9rwDFUARCcOvKSG+Lv3qw+QSKgMCy3VWtgXO7I9AkwTJE9ZDzeDwej8fjeRV4Hzs8Ho/H4zmt1h/e1rv+YGru6YEjkEL3b7ylM3gNYXQwyG9c3/yLx4cVjW6s5davvvI07Y5wvCMcD0s+Wav85/7H+qdHHh89SbPcoxNHHh/Zv7a2/b19N7/o3ZlPT33kg/etWl0cHKr56n89vO/wV3xsyMY2A5373nj9m+7d0NgY9/uWKRB8NfJG5b9OPje5ODeVWRxOzVM0FRVD21p67+pa1+iPJIRlkvGqJ3Znnt8/+NieVAX4//Mf71z6OU1TPr/w3O6jp0YXMkWiXFYQxBxXcV3XdbEksP3D6Xe9qXNt73lXQR547IcPndi7urXz4ze9vvvab0rweK6JX6T84iXbTiIC8gziGQQu7Jp8nqXp6leDpVH4WpanAeCZCx/CAELkyPg1FtMgEbz8/l741BRBU4Tvokavl3epDP3czZB4atm2nOcuE/bRlxkokSOrVdQvA0JAkUQyzCXDl1yGpojApQeEJmA0wETPr7peLJsjM+XZjLqQ01e3ByJ+ZjGv2w7uqJeSkdOvCAQAEpAgYLX+u4tBU1LoqBeX7Zh6AYKAAkcKV9q7c517z8RVIgAgEUqEUQIsfxSRCAZE6jKDc7FogAHg2n4BhahltvziMfd4PB6Px+P5tfMCd4/H4/F4zlqXbHzrxhu/vvvJZ/sPkK773k23toWuNsalKbS2r9ayqUd+NZ3LwnMD95/+ct+JkdKbtq/vbgv99MmJZ58/BVydZ2FLU/Kt963pCiUBALGb3yxrlYJh/PkT315UC09MFA7Nju46dSTMSFvbeu9dufla96WlOQ4hbGkM1teuj8Yi3//ZwR99//FEPP6hD/7+a29ti0XFK6/iIqZjf2XPIxPpuayujCqZsm5AByfD8Tu61ry+bW1U8MXFy2WNn/3KM7948nCuAhUcbW1qXrOydumffCJ18+b4jmdP7D00jegABpTtOC6uQMIlCRT0oen5VCLhr01G4+HTn14+/svvPTbaXxuK/f3N93WHEi9idzwej+cVlS2ZzxxJHRosjMwqb76lYU1HcGRWCYh0W52UCJ8XXhcV68REaWhaWczr1/VGupv8PPtSO2l7PB6Px+PxeH4tvMDd4/F4PJ6zJJrZ3tGHIP7u7h07Bw6XTe0D193ZHa29eMnP/cv+Qt51XILlOQebSllxHOwTA8lkIyQDLlaXljw5tPj4zvHnDsw+ezAbj4bGxlKKovStbOJNd+S543sODHS1d33kjzc1BeMgCFzsfu+NH8yq8j/t+vlcavFwecIlwK7UyLdPPu8XxLpI/DXNq65PtF3NvrzlDafbh1IkWruqpaE2fs9tKydnlTfe07tUQvrqfXLnQ0OpCdmuzFUKhmpAAwiYvbNt7fu23kqTdIgXI9zlEvzvPDz5k8f3jU9nt91wHUOJP3742ML47I8eyb357tOzSUkEV/eEP/iutR/7/LOmzdKcEIyGRYk3tHJFKRqWZshyfRQGfacTqL977Ls/O7avrb7pU7e9cUW0BoKXod+sx+PxvLwgABBAF2PddI4MFxTVCoh0V6PEs+iCLtmm5RQVs6NOXNsR7Gr0+QSKJLzTmsfj8Xg8Hs9vJS9w93g8Ho/nPD6a3d6xBrruN17YsXd0wHXBh2+4uz1y3gTqP/vEf2fyNSWZLpVVwyxhaJMkYhmWIiv2sX0Sb25et3Zp4ZbG8AMfee23fjH9g0cmJhcqFCnVt9R/4A9XtjVwlmm6rvtP/37oE5/b8blPvIYgIAGJnmit7SZbXvdHpm2NFdJf2vvL6fxiKj2JSETPjTw3cLiWC8YFf1Ok5u6ute3hS87sDgfPditFBIxHxXCoa71uX2Xa/uPje0Yyc+lSsaCqRa0yrRcUrJquwdNMwhe+sXnNu1ZskVguKvouv54duxd//PDRff3zBd254/Zb/vydLT4ByQr86c+e+MFDu9589+uXlmQZcsOa5jtfU/npo3uLlZINTIpOqmU5m5oDtrymO9bZlqAp+OTY4I+P7dw/Ndjb1vl3N79+RazmCr0FPR6P59ek2vY27GcCIp0pGoiAN6+J9TT6lqnPDiEAoLvJ39d2yZJcHo/H4/F4PJ7fCl7g7vF4PB7PhQSKuadrPUHR//XcoztPHoYs9Zdb727yna3s2390ymaEjEyYjs1ynIuRXlRJaNKkAd3s1o0dd95Us7Qwx1J1yUBno86i6QVNJ0Xy2Oj4g98B977mxntvkiQef+qvb/yTj33n77/01Kf/+rbqQ0iCqPOHAQD1gejKRKPt2gdnxv7fC0+kKoVMpbgg5wmSIOePf3/oOQagCO+P+ULRYPiDfbcm+MtVdCERIQrLl+59bmF41/xwppRLlfJ5tVS2tKKhOK4LXQpZhCXriWCkSazrbmr9wLpbEIF4ivEz3OWH8Yl92R/+Ys+hg0O8UEdAn1aYz07NS1xL2E9+5iOduw89u/PgiS99o+8v39W09JCaGPP+P+jiJOLZF05OTg5WMlOu4foEqqe36X1v713dE310evg/dz9ycmJoZWvXA9te3x2tQV7a7vF4flNF/PS2tbFkmG2K87EQWxPhmhJCPMTS1IUnrliAuW5l5FqL4Hs8Ho/H4/F4fgN5gbvH4/F4PMvgKPqe9tUYwG/t2fHUoT35XPYzd7+9+UwP1Z6e7mcO5h0q6gsEJcmHXaJcLFVKWcMoblnj/5sPbuW5C2cvTk1NFLLzG9dsaOpqOHxk9wv7Dhw/dPSZJ3u+9MDN4RB35/b7/v3fvrEUuC+hEEqIfgBAvMt/c8sKx3V3zo/88NTeyexsXpNTeglAsKCW6MwcAeCOw3sYgqQRTQECOK7IchzN+sUgjWiCIBzHUlUFYIwB4TjYtG3NtiqWoTq67ugmtE3CsYHtImxD7GDHcWzSgRFGWtHc8enr7hVoloCQIkmBunJ7uv1HS9996PDOA0cZlrvl1tvf/YbW2ij57r/61dGjx7/+w9o/fVdHyE+96+2v/cI//fdPH9l9buCOCNDZyH/i/pVvvr31V/uKcs4kIX39Bt+GVTzPkTRF7Dj0/PDCxObe1R+78fWdkaSXtns8nt9kPEu21Ig8SwYkOhpgIn5G5EiKXObEda29Tz0ej8fj8Xg8v7G8T3Uej8fj8SyPQeR9HWte19r71w99/fFjez+BvveFu99Z6wsBAL78D3dsuee72fSCXEBGOApdKBfzJNA724Jvvu8Gkb9wFvlTh0o/3zXrk8gP/370hs0hx7nr//6o+RdPHn1yz9GN9w3dfOutohAcnzH+4V8HH/hQ17IbQyEywJEAgO2tq+9s7nUxxhg/OnJ45/jJ2Wwmr5QVvaI4aokkXIhdCDB0oQlN20IkBRGBKIJA2LQ1iF0EEXag60IXQwAJBBFCCFoO0GzSJQK0kAjFmpMN799wY43ohwASBGJJ6iprCe8/Wfraj44fOTjk2tqGvq4/fsf6FZ1hmiIeP0CarK9Cosf3j7zvbS0cS//pG5v3vdC347FnP/MfJz7+J71La0AEFDlyTYdvZauEMQYAkggiBH546sA39+2YmJn6p/vu39bZxyDqggrIHo/H85sp7KMlLkAigkSQ8Cqzezwej8fj8fxP5wXuHo/H4/FcEkkQJMF85Y3v+xuW++W+596b+vLX3vUXNYEQy5AHHn3He//m4N59h2ylAgCOSOQ9r1n3yY+sXjZMOX5ybGh87vrV7cmExNIQAPLD7+j987ev+OzXh378ixd+9J2HIrUtnL/myKkUAMsH7udv0ulA/009W97YsxlggAEA1f8B8Km9j4xlZstGxQZOUZZVUzdsy9R0jABFIuhCEiKKRDTFcqwg8ZKP94k0/+bW9TfVtlfXAAGEEC4bZxuG/befffSm69fdc/uFjWQPD2T/+Wt7dx8csm1+68YtH35397oVNAEhhOBT//zcfz92BHAiz5P79hz6+39v/uJf9NAU8fUv3Nqz//BTz+w/N3CvIghAExCcaYX6rUNPPfjUTzTH2dq3rjVZz5HLF8bxvCxcjE3LNW3XcTBDI565qNi0BwAAgOti28Wq7uims/RDlkY8i0jiwlwVY2BYjmG5puU6LgYAkAiSiBBYtOx851fI0mYYluue2QyKJHjm1duMomKqhhOUaG65Q8u0XNVwLPv0KF0AEdAnUMz59VgwBo6LVd1WVLui25rhkAgyFOETKIEjeYbMy0ZZsyMBhkKErFq2s8yal4UIiBAEAGAX2K6Lr+JxDEXwLEkiiM45ACiSeHHDW9bsgmIGRFq69k7XvwmWfY9wNOJYVG0Ja1huqWxlirrEUwGJ5llEvwLHYUW3FdVe+iuJIEMhhiIuLuzjuNiyXVV3TNut/gQCIAnUK3EaNC23otu2g8891Fka8QxCZ44f28HmmTfs0jLLHmNLbAcXFBMAEJRoEl3D1R3LdrMlAwAQ8TNXf7g6LjYtV1GtsmpXDAcATBKET6BEnhRYpJtutmj4BCrk835rezwej+d3y2/lRzePx+PxeF5NiCC+uP0PBZb7xeFdb/jaP96x8Za/2XS7QDHf/OJGADZe8eH7T8hP7ZxqTiY/+M4NvR1+18W4GttA+In7uz9xf/ffPTj23Z8+TwnSs4eHb73fuGlD89++txVCSBDw8nO4IYQIQHD+Mp++7p6XsrOX4br4/X/3+CNPHpgvgrtvqYEQYoxnU843H5p/6pld41MTFCMQSKJp8s4b+A29DIQAY/DAPz//vZ8c6mhr+7dPbzsxKXzyi99/5rn9xp920BRNU+je7du+/d0n/voL+7/40eVH0sX4Oyd2/fPeRx2AHnz9/a/tWbvsYp6XkesCRbXLmq2bTkiivcD9UhwXG6abLRo52cCnr3uBsI9OhFiWQfSFgTtWDaeoWAXFrGZ5LE2IHIlC3CuddJ8bE7sYq7pTKJsFxbJObwaSeDIZYl+1wD1VMNIFvavRt2zgrltOpqhXdMcwnaVRBQBAACAELI0okjg3cMcY2I6rm062aEyl1MW8nisZLE0EJLohLtSEWTpEzGW02Yy6uj0osORsWtNMp7rC0yfPc58FAli9eokBBoClCIZGEALHwZrpOA4+d3uWzr74nJX4BSoZZnmWXDYMvSYYg6JiDk0p7fXib2ngbrvYMJ1MUc/L5tKrGfHT8RDL0QgDIKvW+EL52GixIca31UnJMHtu4H7ucL+U0VRUezqlLv3u5RkUkOigSF0cuNs2rujOYk5XNOv0L2oAmpPCK3Ea1EwnUzROH+pnfhiUqHjw7PFjO66s2kXFLFXObA8EfoFKhDmOQRcfYxgDw3RmUiqEQORIEl3DZpuWOz5XxgBIPEWSVz58MQYYY8N0FdWaWlTnsmq6oAMAWBo1JIS6KB8PMUXFOjFRak4KXuDu8Xg8nt81v5Uf3Twej8fjefX9/e1vhhT6+b6dT77wTDa18IW73+Zn+Ss+ynbwwUMDoyMT226+MRGPqrr91W/ue37PMMe4Ha11f/S2TYlYoL29y9SfbGgIJ6PBoVMDA0f2/vD7cPPGVa+9bdOd14dJRJAkcU3z1F45uivSQs3BgdKb/nL3yu7m8eETBw8cdBzY3tHxT//wrjffWfu9hyceePC5Hzw+3tVRs3GF+NQh9el9M5ZLbdiwQRKl7deD/ftX/vt//vg9H33sO1++h6GJT/3Zmj27X1BKsxdfurBd13Ssb+3e8a/PP+yPhjasWlsXif9a9vp3jW46J8ZL06mKbrorW/3xEPvr3qLfaHnFGJySR2bLedkAAKztDN20OhYLMstO1M3Lxs5jmbmMphlOxE83JoRta2MSL75ym2dYbl42FNVWdTsZ5iIBBgCQLRo7j2YW87pm2NEA21wj3LI2/ioUEK/OXt8/kDsxUapOq+cYtOxdQaWyOZvWRmaVaoRHU4hjUG+Lv7f5vL7QGIOBydLglDw6V04XDEW1eAZJPMXQRKpgHB4qIAJyDMqWDIxBIszxDPr587Opgg4AiIdYv0jbtqtodr5kOq5LELAuygdEynJwUTFTBT0o0ckw19PkY2g0NqtMp9TZjAYApkgi5KNDPibsoyu6nZNNuWKpmmM5bmeDtG1tvDbCMdRLShjLmj2bVo+Plw6cylNUTWNCeClr+/XKy+apKXlkRqnOvF7fFbpxdSwWYGwHHx0uHBkpHhstRAPs2Hz5jg2Jc9vGzmfVvGz6BKr634u+hmE7WNXtQ0OFsTkFAJAMcyua/b0t/mVb1Fq2O7FQHpyS5zKaYTkEhG+5teGVOw2OzConx0uyahmmAwAISHQ8yN68JtbXFlhaJl00BiZKsxnNtN32OrG70RcLLr8981l1fL5y4FTeL1FNSWHZa1rLsh23WLYODhZ0yxE4sjF+5Yh8LqsOTMijc+WpxUpZtQkChnw0QxOIgGNzZcvBPIM0w0nl9bu2JFc0X66ju8fj8Xg8//N4gbvH4/F4PFfrgZvfmBAiv9y3e9/AybdnvvzNd344dKWk7FcvpL73yLQgCHdd78sq+KNfenLfviMb+jrr6nzDw6O///7Bu+99z4FjE6pR/tAf3vz7t0s/3VHcu+/IkeOnntl19NHnhpKx+NqVnXdc33rrZoGkSJIiaBJR5K8hfFfKhuXgVauvO3Yio5p4z6GZ5/cc6a6nXn/XltffuWZLX9Cy3aKsl1WD5oWJuczIxNzaro5COkPYGBKQZEG1v+mn/2LV7j2H9h0Y/n8/KX3oDwI+kd37yP+6+OlMx/7VxIl/2/XY7PxcZ13zn297/U1N3a/2Pv9OwhioujM4JfePFXXTEXlyQ1cIoeVLDP2OgxASBDAtNyebR4YL4/NlAABDob62QEC8KMiDgCSgabsT8+Xj46V0Qa+L8mXNXtcZfOW20MW4otkjs+VcybBtl6FRNMAgBDXDOTUlD03LedlsSAi66azvCr1ym7FE1e3FvH58vLRvINfT5IuH2NoId8GtAAhCmkKOi4tls3+0eGpKBgD4BSoWYhviPEufndWr6naxbB0ZKezuz56cKGmGE5Do5qQQD7E0ReiGmyka2aIhV6ySakk8uV2p0U20byCXKRpBia7eQFSQzdmMNjKrmJZLkcSmnnBLjYABSOX1gUlZ4sm8bDYlBJZGsmoNzyj7BnIAAI5B7XVSW50ocaRuOKWylS0a6YK+mNct213VGgi/5Pm8Fc0enJIPDeUPDOZWtvpVPchQCP1mXHm9ehAAgoCm5WaLxuGhwuRiBQDAs+SqtmBAoEzbnU6pg1PywIQc8uuG5W7qCVcf6GLsOHhioTI+V26plRriUORe/E0DiIAUIiYXKrv7s7aDW2oFliZqo9wyGwwBwKCs2VOLlf0DeVm1EAGv74u+6BG4/FYxFKFq9lSqMjZbrpZzkXgq7KcjAaY+xoscCSEkEcQYV3T7xHhJrlhRP4MxIAiw7GDMZrTDw/kDg/naKJdfbfIsyVw0i39Zqu6ki/qpKVmuWA1xgWfIywTulu3KFWtwSnn2SPr4eHF6UQ1IdH2Mr4mwPEtijOez1lxaUzRbUa1SxVp1zsUDj8fj8Xh+R3iBu8fj8Xg81+B9G25634ab3vvtf9890f973/jCt9/6YZHj/cwy39sBAIbpDI9OLy6mt9+xfkVP89N7xkdHFnpXbfjsR7esapcAuOPbv8x+7Qc7j50cW72q9S23igQEt2zktq7ewLFbNQP/zVf6jx07+dwLx3Y88Xws7Ovorm/rrNnSF+9r9xOIQASQBIqhX41yH7Ksf/xzD4+lzdlUWVP1WDSR14SOnvCPH7xN4AgAgKbbz7ww840fHSzKqp+j51LlR5+Z6m2Pv+muxh07D0/OZ0ZHJzU9CHwsAOCN27d8/sEf/vgHP/jQH7x/2afTLPORwcNffvbnlq5v7lr5zo23bK1rfxV20wMAsBy3rFlTKXVoWjEsp6vRV6pYIkeyr8qR9tsFEZClUTTI1ka5K84kJSDkWTIaYFpqxWoQ/EpvHgbAtnGqoD97JK3qdlNCMEwHQiiwyC9SAZG6+tmvL5ecbPaPFTNFXTed4+OlkI8O++gLynqwNIoFGMN0yqrNn5l07xepjjqptUasi3JLJ72x+cru45mDg/mhacUw3Y566TWbki01QiLMERC4LlANe2BS3t2fGZ5RlkpyAwC6Gn13bEw0J0WeRUeGC4blTsyXTQAQAevj/KYVkViAWcxr9XF+Iae5LgiIVEOcNyxnPqvvP5XDGFAkEQ8x3U2+TT1hChG66ZQ1e3y+/PNdcxyDrlAL7OrIqnV8vDQ0rRQVayatjs9X6uO8f7kZ2b/JSEQQBIwGmdoox150vCECijzJs6ha/yQWYBjq9DKm5ZY1u3+0dHi4wLFkIsxeTQH9SwlJNNUg1cf5sJ/JK+blNpiEIk+21YoLOe3oaBGoL/5Jr4ilUSzIrm4PYgAU1a4G7pphp/Lu4aGCxJEbukPxIOsTqN6WQDzITi2qU4uVNR2BFc1+gSWXvfoytVg5Mlycz2oUCUdnywyF6mLLfz65QLpgjM2WC4qZl82jI4Wwn+5skC61cF42dx3P7h/IHRzMq7od8jGv2ZRY1xmsj/HVt2epbM5ltQOn8ifGSxXdvtR6PB6Px+P5H8wL3D0ej8fjuWb/9Y4PfPiJbz9+ePc9//HJ7Vu2/fHam5O+ZeaHjkzkDxweTYSZ27bWNNdSPEPR2MaGXK6YtoNJBN/xusijj7kTpPaGO9dACBwXf/zB/aOjC9dt6HzP79V//s+6EL3he4/lHnlkz+xUft/BxecPTPzwJ0IkEPIHGH8A/+nbVl639sLmpS+OqjmqYVumbZmG47jJuJ9lzyY7v/zl0MTQOCFx9969YeO6lWub0Rs+uGN+euGhp1Nvuzup6dZPHxv63L88v6q75n//3e3zOed//59dR/pHT400drcGtmzqPDqY7z86eGowhu1wTdz3wXd2Lc5vopart2A4dqpc3Dly4ktPPxRihI/c/qY3rb7uZdlBz1WSy9ZCTk8X9FzJsBx3MadPzFcak4IXuF8MQoAg5GgkXiL8ugCJIM+QIYmWeOolVaS+Oq6LZzLqifHSwGQJETAeZB0XQwhIRDAUoimCRK9es9aqTNE4NFRIFfRqtejaCLe+KyScP3MZIcghJHCkyFPUmVFlaRQJ0EGJrta90QwnLxsnxou7+7PTqUpZtetj/MrWwMaeUE2E8/Fnz10CS7ou1gxnalGt9oJmaFQf57f0RqIBxnXxdKqyFJFDCCSOjIfYpjgfDTAcjQ4M5mfSKssgkSNDPkZgT391IiDkGLJacMZxcVExY0FW4qnhGYVEBPHSxhVjoJtOrmROLlYWc5phOXMZbXhGCUj0b13gfvo9wpACS15cGI1jUHNSrLYzrYvx3Y2+sI+utsCdz2oDk/KJidJMulLWrrJh7SUxNIEQ7RcogSPlinWZJQkIKZJ4iRVsrhKJIIlQJEDXxfiwj+ZZpJuu7WDbcYamZYYiIn6GY0iJJ8M+mmeQxJMUSUT87LJzz03bNUxnPqtPLFZKFasgm0PTcthPX2XgPpNW+8eKecUsVczBKbmjXtIMh7qonJ3j4kzRODVZ2ncyd2K8uJjTk2G2s8G3rjO0tiPgF0+3abVsLhnmEAFtB89mVO8GKY/H4/H8DvICd4/H4/F4Xox/fs07PiMFH9r59A+ffnxoZvyBO/8gLPhi/Hkzwno7ox94942Dk8aKrhoAQE9HYsu61v2Hj33/4ROO05GICI7jzszON9RG77+vjiDg9IKx68DounXrGMb5wlefEjjmbz98x2uv4w4dCegVdev162xE7dx1fHom5S9TYq4ilxoBOC9wLyrW3HzadgCBKIpmHdsioAshJCmGJCnXdVzXxRi7LgYYYIBd13Fs27Gdo0OV/pFiLrOYT89bmvHFT923akXd0mrf+ta+t761DwAwm9IVuTw2YfhZcnohc+LoQXD39qMDC1/91l6HlLZe19XXExBnib6ehrGJiYefz/WtNN99bw8w3W//YNff/uPPOjsSX/n0veGg8OmP3XnxkGqW+cz4ia/senQ+k+5INrxn8213d65+RV48z6Wli/rYnFJUTMtxMQaZot4/VpR4MhZgft2b9j8BQQCGIijy1cifbAefGCvtPp6Zz2gRP/NS8sqXS6aoHziVL5ZN03ZnM9pUSi1rdsiHr5hsIgKeW1ClVLaOjRYPDRX6x4qOgwMS3dcWWNsRrI3wAnfelaGaCHfb+vh0Sl3I6QQBKBJKPBkLsk0JgSBAqXzJ7DUSYAIilSoY6YJx+bhwIaudnCit7QiGfHRvi9+y8Uu8kuFiXCxbqYKeyuuyamMM5rPaqSm5u9EHlquC8ttL5Mk1HcHGBL+2MxjxMbEgS1OEi7FpuYPTyo+fmZlarEAAXPflOXgpEjLUS70c8kogIPCLVFCiM0XDdDEAYGqxYtpuc1Lwi1RbrYToK58wNMNJF4xUXs8VDRdjWbVOTclNNVdb+n98vrzvVD4vm7rhTCxUZtJqqWL5eOqCtqu2gwcn5d3Hs0eG84t53cW4pUa8bmW4rVYISvRSPwaSJEI+emN3WNWd/QO535AmNB6Px+PxvJq8wN3j8Xg8nhfp49e9LkBIe0aO7U+Nv/0H/3LnivV/tPrmptB5xV63rK3bsvb0n/s6mfe9fUMyjA+fGPvMv6QRG8oWlNlF9a/fvz1XAqdG5v/Pj9KazdQ21L3tbkriO376SH//YJrniaGhg+u64p/7X62HhrSFed/KVt+dt69jyXJP+4Xhy+C48sDn/3sx72AU4KRkuZSLSjZEBMnHedFn6jKA2DRsU7ddF5iWZdmGrau2blkup5pWKODeuKmmuc4XDC1Tm35ovPj5/3t8cmg6Eo72tvjaa9vbW8IAANtxDBdDlrKBCwBorXPXrfA9uzc6MDA2PFzXmqx/91t6V7TF9x4dQbRL08t89jAdeyQzP7Aw/fmnfsJA8g2rr7tjxfob6ttejlfJc20mFioHBwt5xaxOKM0UjeNjxa5G37nLGJZb0eyxuXKqoNsOxhgDAKqRSrFs6YYDAEiE2MaEUBvlfAJVqlgLOX1qsWKdKetBQEgiWNbtXMmkSUISyM4GX12UC4i0i7FuOGPz5fmMZjuYIqHAkX6BFlg0NK0s5DQAQHu9tHVlxLTdgmKdnCgtZDXbwQQBSESE/XQixLbWiiJH6aYznVInF8q2gx0XAwBEjoz4mZoIF/TRY3PlhZxW0WyeJcM+ujbKh/20brrZojG1WMnJpqJafoGKBpjGhBCUaJZGEALHwYt5fT6rTi6qcsXSTcd2cEExC/Ll6lSca6neiO1iuWIdHi5MpdRUXgcAcAxa0exvTgoiR+ZK5snJkqrbtoPBmfI18RDbmBDKmlWQzVRB1wyHpVFDXLi4+MPwjHJ0pLB/ID80pSiqTSI4PKNACDJFY1XrefWUHcfNy+auY5njY8VS2UIE5DmyrzXQXCMsFUx3HKybzlxWW8xp2ZLpuJhEsDEh1EY4v0hdzd0PquGkctp0Si1VLNNyMcbVWeqTCxWBJWsiV8qRIYDw7F0BxYp5bLQ4Pl82LRcAwNFEe73YUiOwNHFBOE5TRECkuxt9puWGfUzIR993U11NmLtiAogIiGi0otnvF6lE+HINM1MFvX+s1JQUYiG2o16ybCxyJM+++DtCbBtPLJSHpuXqzG4AQLqgj8wqmaLRaDgX76NhuWXNHp5RhmcU23arDwn5mNoo15jgk2EOAGDap9+zA5Oy7biuC0gS+gUqHmIb4nwyzM1l1IWcniuZhuUAAGJBJiDSFc3OyeZcRvOLVGOCb0oIET+jm26mZEwtVqrNeAMiFQ2wjQk+INEshSAEtoNTeW0uo02l1FLFMkzHdnBONgvn1HLBGBfKZl4xq++1smZH/HQixDUlBMtxDw8V9p7MTSyUy6pNkcSJiZJpuxE/093o623x2w4ua/ZcRk0V9FzJhBCwNGqMC4kwGxApiiQAABXdzstm9YxR1myGIjgGDc8oln3N6T0GYHKhsvNoZi6jljUbAFAT4aonN4YiZjNauqDnSubSFHy/QDUmBJZBAIO5jFotFBP2M621osRTy1ZUJxGRDHN6o9MQs+dz+tRixXZwQTb3DuQQIgIiHbmK653ZonFkOL+Y16rnurJmj82V59KaotosTVDL9XCuquh2qWxlioZSsWzbdTF2bZwpGAMTpc4GH8+e9960HXdysTI4rZQqVvXU1JDg13QEw37m3O7HEAASERJPNiaELb2RpuRvcctfj8fj8XheHC9w93g8Ho/nxfvg5pves/66rxx59vDJow/v3bWQzt5/3W31oWi9uHyLsDUr/GtW3H5s0OwfKf/k8cHFzFS8Pvn2e+v+7QeT3/r2Y7ZLXH9dy5F9T315UfyL92y5/21bVN352ROnXBt0drQAALLp+eziyH13dP/ebTwA/MXr39wX+sO33pEp4l2Hc8/sHExGQ1s31VRU4+kDmdkjQ/EwvXVTi2tDjJlc3u4fLlou3LCyef3K+oUctfOFgWgYvPctWzasjCy78Q98ec+zzx2646atH/7APet6lKWf1yTCa1c1PfLs2OB46uCJKAJgciJDIzqdzz/x/OyqrmhzPbdxXXTjumX6zrkYjxbTE+n5L+z474IiN8Xr3rL+xt9fteXFvBiel8bF2HXB1KJ6YqKk6jaJCMd1cyVzYErOFg3Ldpdap1q2WyxbR0cKx8aK8pnYhaEICOFiTi9VLMt2e5p81/WGt6yMMDTKy+apKfm5I2lFtZbiY45BedmcWCjTFIoFmdduSm5eEeEYBDAo6/ax0eL+gVxFdxiKiIfYuigf9tGP7V3oHysCAO7aUrO+K1RQzKFp5Ze7509MlCAAJII0RdTH+K5GH0ej2hjUDWd4Rn72SFqu2LrpAABqIlxPk49EUOTJ4Wnl8HBhPqvFQ0xvs5+lkcCRmYI+NK3sHcjNptVsyYgGmOakuKUXt9eJ8RALAdAtZ2xO2X8qv+dkLl3QTcv1CRRNEZcvDL2s6jAeGy3qhnN8vOS4WOTJN9xQR5NEQ5xPF/Td/dn5nFatgMFQRMhHr24PBiU6U9DHF8oHTuULihUPMdevjF4cuI/NlZ/Yvzg2W04VdACArMLx+XJRMRdyejzELlXKBgCYlpstGbuPZ8uaPblQIUkY9jHO7Y0BkYoEGEQjjEFZs9NF/fBwYXBKns9q1cHc2B1e2xnsqJeqL/3ld7ai2UMzylxGIyCAEGAX2I5bVMzRWaV6CeTqxw1jXCpbJyfkuYwGAIAQsAzZmBDrYvzFU8sRAREBOxskiSejASYeYt9wQ91ya11eZ4NUHduL6pBgjLFtu6puz2e1gcnSjX1RjkZNSbEa6NKXzjevsHcAmLY7NlcenlZcF1MkYdluXjanFioLea1UtqgATZxztQBjUNHsmbT67JH0k/sXq8XrNcNpTPBrO4I3r4lFAywBgaY7sxnt+f7ML3bNERBCCDHG8RC7osl3Q18s7GPmMtqx0WL/WLFYtgAA3Y2+poSQKuhjc+VDQ4XGBH/9qiiFCJGj0kV9cEreP5CbyWj5khn20y014taVkbY6MR5kMQaaYY/Mlg+cyu05mcsUDdNy/QJFkURRsc7dbLliZ4r6M4fT81nNcXE0wDTGeZoiXBc/dzTdP1bMFo1qeZmhaTlTMDgGQQh6mn2Kas1ltIOD+dFZZS6ruRhwDNrYHVrVFqQpUSIghDAvm4PTymN750+Ml0plS2DJkI+2HaybzrUm7hjjiYWy7bhHR4qLOd203L72wJbe8BYUCUn05EK5f6x0fLxkOy7GAALQmBBuXR8PSjQAYP9g/tSkTCLY2eAL+WiGQpcI3GE8yFZj8eNjpfms5jhY1Z3DQwUSEV2NEk0RIne5r+0Yg3RBPziYz8kmQxOWjVXdUXV1NqNmS0bET18mcFdUe2KhUjr/CK/e2xQJMOe2lq3efDCTVicXKrrpQggICGujfE+T/+LVQggokqiNsDf2RepiXuDu8Xg8nt85XuDu8Xg8Hs9LwpHUxzbcnu3Z/OkdP3l84MjhzMztK9a8q3vTimTDpR7S10X3dYX2HySO2PJdt/axLPmrF54r6Ob1G9d+84vbdh7K/+rppwZGMo21gem58rd/Ohr0h7Zs6AQAFPN5wjHikWW+3C552/ZuAAAnZJ7ZsXv9qrWf/ct1RcXWHjzxq/Lituub/+OTd1QX23ss9+l/PTg8nt6wKvahd7TPZZl8ZmZifMLQtEuteeDkHEJi18q6vk55ZF6bnpq1VEsUuLbW5Fvv7ukfzO/YOXL0+GKQoRri0ua17c8dPH544GQq19Bcv3zC5WK8c+Lk14/uHJ2eckzrjRtu3tqxcltDx9UMu+dlV1btTMmwbDfiZ5JhVlHt6cWKYTlFxRqbLw9NK40JQeJJAABDEyEf3VYn5RVz9/FsrmQAABgKiTzZWisYlts/VhybL5c1m+cokaP8IlUf5RJhtqiYU4uV6sIhHy2waF1naDajpvL6M0fSmuGEfHQ0wAQEutrSczqlGpZbqljzWY0miamUqpsuAMAwHd10DpzKP7FvYXy+4uPJm9fEWAYpqjUyo7xwIus4eG1ncFVroDbCtdWK+0/lq8/LMYgiCRIRiIDRABMLMnMZNSQxG3vCAICBidJTh1KTCxUXg456afvW2r0nsycnSumCvqknvP36WttxF7L67uPZPSdymaLeWivduDo6OCUPzSiXG9lL0A2notsCS8YCjIvBfFZbzGs7j6blsvWGG2tDPvqmNdFfHUwdHysCAHwCJXIkTRJ+kRJYRJLErv6sabur24Otdcvcj9IQ57euipZVuxq4ixxZH+Pb6qSuBiniZ6pVs6sU1SYRURfj/AJVqlhl1S4o5vHxYkCkNq+IVAPfXf2Zpw6lUnk9INF3bUlmCsau49kDg/nJxcp9N9Wtag3wDCIuWxamotnDMwoG+Nb18RPjpbG5MgCgWLaOjhZrIvyajuBVDprrYtVwSmWrVDE1wwEAcAzpE0ieRRR5ydIvyQgXECnfy1cA3XVPzyCWVfvoSCFdMDTTgRDSJIEBBgCgF1s0yHFcVberBT1WNPszRePUpOxibFju0LQSD7ISH6K40+Gpi7Fl47H58qN75o+PlUzLuWtLTUCkH9+3sJjXd/VnQn46HmL9IjWb0R55Yf7oaEGp2HdtSTYlhCcPpOazmlyxfAJVG+USIbZSK+7qz1bfKa6L0wU9L5uZomFYjqo7qbw+m9EsBz91MDWbUUkEV7b4G+PCU4dSe09mF3La9aui92ytKevO9GLluaPpw0OFYtnqqJM290YGJkrD579HCAjCfppEkKGIimZnSoZpuRyDdNMJSnRng5SXzfmsDgBmKKIlKbbWiSEf0xAXKprzzOH0npPZ2bRaG+Hvu6l+OlUZnlH2nMhNp9TtW2sbE7zAkoeG8k8dSo/OKjRJ3LwmBgGQVWsqpeZk89z2uVdJMxyMwZr2wGxAOzSUH55RKrrNUGhNR7C1Vsor1p6TuaJiGpZLIRgLsrEgWxvhMABHhgsAgNoI15TgQxLN0pe7DBMQ6Z4mH4WIiYVypmjIZcuy3anFysO7529bH7+ud/kL4dUXy7JxpmgMTSshiU4E2VNTcnVm/UJOP3Aqt64zJPGXPPjzstE/VuQZtLo9cHKilC4YAIBM0egfK61uP++NWdGcdMHIy2ZZtRwHcwzyi/Tlb+bwi3RPs3+p+YHH4/F4PL87vF9+Ho/H4/G8DCKC9Le33svR7IHFyaf6D8xOT71j0y0dsZq2cOJSD6nI4zVB5wP3tQksWRPwTzE6x7IIwW0bw9s2vhkAoJvuwFhxejZ957a2jasCBdken5RrolJnW/yK29PZgAjXONP3FGOrYqkKe868yNqEsKorPDA4c2QgNTTVuHEFaohrgwOKbV+yqDHHCjTl2hjKFeuL3z46enKgXiSnZ+T333/LTVu73v/W9cdPDjmWHeC57bd3+yI1dTVmOjXrE5b/Nv78+Km8Unxw58/LZbUxUbd9xYZ3bdx2xf3yvHJKFWtkpowxaEzwAZFOF/TFnKaotqrbkwuV4Rk5EmCqgTuFCIEF8RAb8TO64eRlEwCQCHMRH7OqNaBbznRKXcxrednsnpYbE/yKJn/Ix4QkGgBQXTgo0RE/05QUaiLss0cykwuVoSmZZ8iNPWGBI0MSLbAkQyFVd3Kyoep2JMCEfUzYR4scAgD4BKogm4NT8oFTedN2V7YGNnSHBJZcyGkjM8rIjIJdzNJEX1sgEea6GnzHRovFsoVdXCpbuuHYjgsAIBHB0sgv0okw25QQhqaVgUl5z4lctqS31Un1Mf6GvsjQtHxwqDCTVnmWvKEvWtHt8fnywKQ8Pl9maNQQ529dH2doJKu2XLYqmn258V0OhYiaCFcTYcN+BgA8Pl8enlZsB6/vCoXbmJ4m/8kJGQBQ0WzbwQWfpZsORRIMRUg8iQjIM6itTqrWDLlAPMT2tQUODOSqf+VolAixHfVSb0sgINLnBu4YAJoimhMChDBV0HXTkSvW9KI6Fi73tQU0A+VKxrHR4nNHMgQB1nWFVrYE5nNa/1hxaFqZXqz0tQZqwlxNlKMvEbhjfHou/3RK5Rm0eUVYN5zFvG6YTlmzR2fLsxl12faMy3IxqGi2rFqq7lQrFHEM8vEUQxGXKQTvF6iXt92o7brFsjU6Vx6aVmbSqqJalu1CWC2s9JLKVSuqnS7oquYILLm6PTA+XxmcloEDDNMZnVFqwuzK1oB45gV3HFwsmxMLlf0D+ZxscDRa2eKvjfL9Y8V8yRibL8+mtXTRMG13arFycCg/m1YhBF2NvrUdwRMTpdmMOrlQmU6rOdlsTgqJMIcIoOqOYToQQt10RY6MBVmGJuJB1i9SBcVMF/QXTmTKmt3b4m9KCFt6I3tOZqdTarpghHz0trWxhZw+MCWfGC9NLlQknmpKCrdviJMIyqpVKpsV/cx+QiiyJMCAJAnDcguKyVBEtYSOyJGNCWFsrgIhwBhQJFEb5bobfTURjmfJdEE/MlJ44XjWtNz6mLC+K8hQxExaPTUlpwt6T7OfpoiQRA9OKYeG8hXN7qiXNvWECAIu5HRFtRdzOrjmgvBQ4qn6OJ8IsT5BOTUl52VTrljtdVJdjO9r9ddGuKBE5WUjLxs0SZQ1G2DAMYhlULUXek2Ea4gLIk9dZpo5AIBnUENcsB08nVaPDBfKqu1inC7oB07lEiG2OSmourPsA03bzZXMYtmyHdyUEBJhdiGvVwP3VF4/PFRoTAittctclnMxdhycLZpD03JTQqiLhkplq6I7muGUKtbEQnkxryuqzTGo+t7UTKegmGXNNiwXAEBTKHClilIcgzjmf1TjAY/H4/F4rpIXuHs8Ho/H8/KIS/6P3XLPM5NDh6dHnx098cCj399U33bXinW9tU2NgWXmpv3BfevSqaJPZAEAf/KWm7F+eGp85KEnBZ+PD/oCBEHmStZDO0YxwnX1CQDA8Jh88Ji8ZW2yqy18xY25eX0IYpehqxkTdh2HQTRHnv3eWx9nt6xO/PJXYi6TKxVLAAQQCVxo40unEfe/ff1nHnzywMHBx+rgr54++ZobV7//9bUf/eTDZTmfjJDvubcV3Nt67vJ/df9GADZevJ6D8xOL+eyDT/88qxRqY/F7V25d3dp1U337FXfK84rKlYz+sYLAkn2tgYBEV0tJAGBjDGYz6vBMua/t7GxHCCFFEjR1dk7xiibftrXx3hZ/pqifmpQNy0nnjdm0OjStNMYFRACGOpuoRgPM3dfV9DT5RJ6cWlT3nMhaNs7LxqnJksSTIYkmEVFtb2jbWK5YazuCt21IuC6uVoOgEJxYqKQLumG7GGOaIsJ+RuRI1XBoChmWOz5faUpWLNuNBVmaJJ45kqZJwrTdim5Pp9WuRp/j4kxR1wynu1FqSggQwrmsNjglK6rFUCjqZwISxdJI4kmeQSXFzBaN6ZSaLRmDU3KxbDE0qomwdTE+EWTXtgchALmSUU24rp7EU7UxblWrv71eKihWsWzt6s9ajlvR7IWc1pjgGxJCY5xf0ewfnlHysjm1WJnNaJrhqLqdyutBH50giYiP5phlAi+/QDXEeOFMGQqaIvwClQixdVGOPr+oRUii22rFjT1hy8Yjs0peNuWypRp2WbNtFxcU88R4aT6r2a6bCLDxEEtThMSRjQlhPqctZPXx+XJdjIsGmEsVUam2AM0U9YJixoK+Dd3hmbQ2sVBZyGkV3cmWjFReT+X1sP/05ZzLc11c0e3KmeLmEAKeQRJPvcQ+pdfKsnEqr2dLRlm1NcN5GXvgpvL64LTiF6loMLihO4wxICB0ADZtd3yhUhfjTets6mqY7kxKnVqoFBQTETAWZCWe8otUS1LIFvVixbJst6zacsWaXCjnSyYBYSTE+ARK4qnGhDCX0RTVchxsmI7rYpoiEmFuLqst5HTbcSkSvnZLsi7KTcxX/CLVlBCOjhb7x4pyxeYZFA2wAYlmaSTxFMcgVXfyspnK64NT8pHhQkExaYoIB+h4iE2E2LWdQQBAtmjkLtvqAAJAkYTIkdEAu3Q7AolgUKKrmXWmqI/MKIs5TTedgEiHfDTHkCJH+gWKJgnVcCYXytU55umCrlQsx8U+nupu9MeCjGY6uukUy+ZCVr/MNlyMgKCvLfDazUmaJAgCJsOcabkV3c6WjMWc1tUoxUPs9SujluUu5nTLxsWyOTZflniyMSlohmNYbjLC1USv3DagqrVWfPO2et1wphYqpu0alpspGgOTpaBELeaXv/+srNlD07Jm2Kta/eu6QtEAs/t4tvpP6YLePwZuWhNb9oGOgxXVThf1qUV1Q1d4Q3coXTAquj25qBqWW1SsmZQ6uVBpSvLVCfKO4xqW65ypyVNtLEFeqeOxx+PxeDy/m7zA3ePxeDyel02A5e/tWrO1sb2vsfXg0MCuwWOHZ0a3dvfe0L5iXbKlTgydu/DtN3Qu/fmmrdFg+DXP7Hph5P+zd2dBkl1nftjPevd7c1+qMmtfel/QWIiFJAYCSVnSSLNbkjWhcIwmQnaEIxwOvfjZT36xIxx+sUKPjpE8EbY4GnsWkjMckiIBEEADaHQ3qqu6u/aqzMp9uftyjh9udaFRXb0RDRIkz++tKzNvZt68N6vrf777fZutzd1xxsxhYhy03asf3pydLr/2/CQAoN3u9YdeLr9w/FkfglDMDtNzyAHGmCj0s7/3IQc8ioMwiSIAAEUIsISxk2voAAB//F8tjsbD//M/vv+//DuPc3On4bx3s/vVr116+YWZJ3xJ7x9srx/s/PuPftTqdynH//Irb56eW/xHCxef8OHCFyRhPIzYQS9Y2Rx/9WLx4kJWVXAYMUsjaeluqx9sNp3+OAwiJt1r3IEgSJtBpxvJmtJUWStl5SBKdIWkvTWGTtQe+GHEAIQIfXpnRcL1kjpd0ShBhkYIRoxxP0xa/SBtlo0gSEdDMs5ZAgoZ+dJ9oz6bPX9tZzR0ojR1RRBIFEkUUYIQgmkm2x9H7UGgKSRj0FpRq5fU/a43tKPV7dGF+czYNXfb7tAOz14oTlU0AMDIiVoDP4gYBKA3Dle3xwjCrabr+nEQM9uLGl3voOfvtlzXjzECsoQVCckSzhi0YEnSSa2ZH41gqErY0mkxK+sKSZs+cw7CiHUGwcCOZiGol7XnlnPdYdDuByMnavf9nQNn5MQHfb9oycWsrKnkxMpuStBRXSoAAEJACFIk9GA6TynSVZI1JQjARFFtdP1mz08YjxPOOfCCpNnzR26UpG0r+sFPP+naXnzQ8z0/SRjvjsLeKIwf3hc7Tvj2gZP2jp+uaDlTmqlqi3Vj7EZjNw4Zb/b8GxvDC/OZJwnc77n3ljkIIuYGcfK0ozA/nzQFLmQkieLdA3e/6z20nc1T2ut4NzeG9ZI6XzPqJW2v5M5UtVY/GLvRyIkOev5W0007MgEAooT1RmHazMRQia4SiaKcKb10Np+zpLSSvWBJGw271Q/8MMEIGhpJr5C4spwzVHJ6xjw9k6nkFUXGYy9WJJweyYqEc6Y0W9VPT5uljCxLOG9Jb9/sbjYc148xhuklJq4fN3s+4yBtj257cWcYNLqeFyQSRcWMnDMlmeKsIT3hOZKOU5YoouRwh0IAKUGKhFUZRzE76Ae2F0cxjxPe7PlvXe/stNxG13eDJIrZXtuTCY4TfjRbIh3YUMjIccKzuiRLGD390oyl00pOAQBYGjU1IlFke2AwDo96cF1Zzq3ujMnagDE+duO1nbGuEEoQ4yBn0JwpGerDGx4dey6NqjJ+bjnXGQYrm6POMAgZ32w4gINmzy9YJ0xPHbvxzY1hzPiVU/nFmqHIeKqsbR+4vVHghUlnGOy23f2Ol7ekY9XoXpBsHzgjJypl5VJWruaVM7NWaxA0un4QJlHMdlru7d1xKSungTuEECNw9D4SxtOp0U+9QwVBEATh14AI3AVBEAThGSurxu+fuvJqdfb5qbkfbtz47u0Pf7B57ZsLl1+pn39perFqWic+6uJpcPH0q3HCfvj2uuuFbiBtbo3csf38+ctfOZ8djqK1u11C5Vqt9oQvQzekTqcF0ggvwQBhKuO9Rv8vvndDUQ0O8Dsf7VMJvP7qqcWZPAAAQZjEMUse2t8WQfjf//EV06Df/tuDwc5wbW1v63TxD//JhdNzj5+H9mFza3V3589WPrjVXoeE/8srvzGVr/7+OTEc9UshSfjYixtdb2179M0XK+cXMhDA7jDMWVJ3FIYR6w2D3ZbbHYWuH1OdnjghkxIoSehYI28vSGw3jhNGPlv+jBBI83EAAEFIpiiIkijhYzdKG3Mfk9HpTPXTw2zsRp1B8OgWLm4Q77a9jEHLOWWqoi5NmQM76g6DoR29eNrtjcLNphtGbG7CqJc0CIEXJGM3jhMWhGx93+6Pww9W+42u3x2GUcS8IGn3/WbPbw2CdGToM0QxovqnUXicsN44HNghY2CyqD5/Kv/RWp/xURjzzjBc2xkP7WjsxlMVbWHSUJ4+6H8YVcb1krqxZ9//wyhmIycKQsYYH9jhyuZoYIdxwvrjaDAOOQCOHzt+zB8RuMfszq6913bPzljLdQNBMFlUz8xYd3btRtcHADS7/rufdCt55f6P+GHSSYwSPVy84QCMnCj9jD73DngKMkXzk/pzS7nlaetvrx78fz/Zf3QL+ye31/Y+vju4uJA9P5fNmbSSUy4uZK/dGYycKIpZdxSsbA4NlaSBO2Pc9mIniDnnBENFQgjBvCW9frn8yvmiFySKhIOIre2O++MwTrhEkSJhjKCl09cuFF88k/dDJlGkShhC0B58eomGoZJSVjZVks/I+Xshr+3Fex0vbThzd99u9nyJokbHCyPGOU8Y90Nme/HIiaOY6QopZmTrKRZRHi8I2dCJwogljNtufHN92BsFjp/0x+FgHBIM9zseJQhh4PhP3d/pSWAEZQkTDBnnAyfqjcIo5rmSlDXp5Edq+j02dqPVrRElECOIIKiXNEunTz5EF2OIMX7hdJ5g1BuF6XUzOy13t+1xzh8SuEcfrw9nq/qLZ/IFSw6jZLFu7Hc824tcP/HDZKvhrG2PLi7mjgXujh+vbo9dPzk/nyllZZni5Wmr2fPfW+kCANJrm1Z3RhcXDxc7CYayhI9W+MKIDe0oiJ7x96EgCIIg/GoQgbsgCIIgfCEmM/k/eO61yzMLL2wu/3j14x/euPbOyurLc0sX5hfeXLhY0U4efEowevOriwCATi9498ODakGZnyoCABqt8fVb+3NTyoUzTzpd8MLFhfXNtb/+0bJqlgdO4iWQY8I5b3X9a6vdja3uyI3+wbcu/qt//tx8XQUAUAkhQvgjGxBTgv7on12sTw//p//t7xDCz5+fe2za/s7B3Y93b//g9o27200Jyf/iyuvT1crvnf4KQY9q/Cr8PNl+fHt7vNV0vCD57rvN7QMXANDoerstLw2XOQCun6xsDvOWdHEhKz8kW0x/KlNcyBxWREYxCw7L0B9KlbGpU2ZzwAEHx1sapcWtaTfkIwkDfsjihCMIFRnrKjlhRiUHnAPOAUZwftJoD4J0kCDn/Nb2SFMw4LxeUuX7uuJwDgAHpkZOTVlnZq1T02YaVyUJz1nSTEX73nsH7X7gh+wL7V8CIaQEUowgBIZKJgpKJa/kTGnsxp1hcHW1H0aMEnRpMVsvaz9DZf1DnxcACCD47J4MIzZ0Ij9MEIIZnS5Pm69fLlk6DSIWhAkAoJSVayXtxLY2AIA44W6Q7LTcj24P1nbGH6z1v/NuszsMmz3vKN5tD/yP7w5fOlsII0YIfHQhMEYwZ0p5S07r9+OERzHzw8QPkyhmBD+rQvPHghBCVcaVvFwvqVMV1bjXvafVD+7uj+tFLb1y4sml3dv32m6z5//l2/vX7gwkitoDf33P6d7rVjR245WtUa2knZ/PgKOThQMAwMiJdtue68cQAIhg2v8EI+iHyWETHs7Hbrxz4NpeDABACEoUYZReenL8xZgaKWVlWcIQHJ7YnIM4ZmHIEgYMFc9W9dMz5vykcXSOVAvKQs14/1avM/CDkKkyCCP2zMufOecAAIygruLTM9abL1QwAkHEgpAhBEyNun58/8rBFwQCQDGkBCEIIAAQwomicnrG2mjYrp9sNBwOQBCynCXNVnVTfeq/uAsZaXnKePF0nnN+d88OIpa+8WOShLf6/sa+0xkEnUHg+rEs4STh6/v2XtsNIw4AYIzvtL21HXuhZqbrNEdsL17bGa/v216QbDacvCWP3Wi37aZrmRzwg56/vud0BsFkQVVlnE54NlVKCYoTnn45OF6STot9VmtOgiAIgvCrQQTugiAIgvAFWspXl/LVV2vL1/c3/3b1g+/devc76x+8t756vrownZ98dWZOl6QTH6hr+Le+OfXVK/qF8zUAgD22Pbd/4cxMrfyk+dq/+W9+43/9P77z7//vtydmzh90RhHAMQT1yfx/969e/5u3Dv7Dt69dW9ngAHJ4uEFCYRixlbvRS1dY1nzos1AC33jR2P6duf/933137UYJ/MbXHnbPd7fuvr99+/s7H99qrauS/E9feP10efbNU+dVevJbFn5RHC9e3Rl1hkEhI+91vEb3sFOwTJEm4zBiAAA3iG9tjap59fS09ehqTYyhrhw2puAcMMZPjIruv79EYNqchiB4LDqnGFo6eWAuHz/MnyCgBEondmuAAEEAIUQQTpW1/jjMmdJ+x4sitr5nBxFbrBmzE/qDE/8UCZey8sWF7BtXyodvgXPOOePg7Rtdx4/jhP0sbSmeGEJAlbEsIQiBIuGCJU0W1WpBCSO3Nwqu3x3IEq4WlIxBy7kTyl2fLcZ5GLOEcQiALOHJgvLaxeJ0WYf3QtgwZgCAhx0SbhB3hkFnGLT6PiVov3N4aDEGIASqjIOQDezI8ZNm1xs5kaVTiT4qtkMIGirJm1LBkrrDYOhEaV+L/jgcOVHWlE5YegFp8sskip+wj/YTohRlDWmqrJ2atjIGTQ+VZtd76+POV84V6hUtubcegBGUKKIY4Ye/gKEd3toa98cRQXCz6ey03KObOAAYw7Rdye1d++ycFyf82DFoe3Gr5w/tyAsSmSKE4NEY2zjmUcI5B64fB2EytCM/TNJEHpGTX48q46whSQ/eCgEAQKa4mJEuzGe/dqkEAOAcJIxxfthyZOzFjPG0SVR6eDxz6YUOtZL6+uVSxjhcNGOcxzFf2Rp1h+0v4kmPvQRZwqqMj1LmyaJ6fj7TGwW9UdjoenHCgjD55ovVxbqpP33gbml0qqw9fzrvhUl7EKQXKDx4tzjhOy0vXSId2uH7t3pHNyUMYAQYh4yD/Y53Z88eexFjPH3BnIMwSoZ21Oh6zZ7PGO+Pw6NtqjLmAHhB0huFOy13r+NNVTSZKqqMc5aUs6ip0bETRQmLPTaww/44PHF6KucgSli6QCg/u6VBQRAEQfilIAJ3QRAEQfjCLVdqy5XaufrMrcaVv1r5+Kcb62/fXcvrxo9nZpan5n7v1CsKocceoirk6y9PAzCd/nOqlvnjP3y5Npl/YNsP9drlEvrXb/S7XYbMlc18u7HF4xAAkLWkb32tFsVBZ9T5wVs3dRL/0R+cW5rPU4IRQxub0Wj8qMAdAKCp5Le/NX9zZd5QogdvvdHd++nuWqvX+XBjfbvT1mT5v778zVOT06/PnLPkpyv5FH4+HC9e2xlnDOm//d1FUyVptXLa2P37H7T+7Ee7AAAvSO7s2tMV3fFjRTqpJvaeMEo6w2DsRiCtXn/cQEvbjTrDIIgYxZKp02O10pQgSz8e5VCCMjqVKeKcu37ieDF7INbDCMoSIhimwW4xK89PGr1RuNtyB3ZEif/6pdKZGevB0uyRE61sjc7MHrZ+Shh3/NgPkyhiAIJSVk56j1lC+JwIRjlTzppSGiNijBZqxrl2pjsMeqOw1Q9mqlopK/98AixFwuWsrKskHTO73/UdL44SlibsYcx2Wy6EoF46udZ+r+VduztQJPTVi6WXzubTPvUAANuLP1jtX18frG6PvSDhnO+0vNWd8dlZS3qCBbmMQS8tZv2IXb87AAA4XnztzsDS6Qun8yfW2je6XnsQzE8axyp8n4m5CR2jSq2oJow7XrzRdH5yvTNRVF9hfGCH+x3v1tbY0Mj8pFHJyUd74EHdUXh1rZc16D//xky9rOXMT38p/MVb+z/4qO14sRfEe2232fWHTqQrx99pzPhW07mzO56fNI5CXoRg1qQ5U0qHW3IADnr+ZsOplzXjKYNgU6eFjNQfR2m/poF9GNFGMevbYcK4RBAA0NJoui71sA5Rn1+c8N447AyDdIKxJmMAQBCyg77fHQZf5Nl5CCGQ0WnBlOi9L7fpsvbcUu76+mCj4QAAgogNnEhXyWRRfTCJfhKqgi8uZIIw2Ww4d/ftzkll+1HCbu+OO8Pg65dK1bxaL6tHX8wrW6M///Hefsd3/bg7DHbbbncYOn5iqARCECdsq+nuttycKS3UzBdP545WDjrDcHV79NHt/ke3BwAA149XNofFjFSwJIwxQXC6oi/VjZWtUeQwAMD2gfvR7f6lxexEQb3/tTHOo4i3Bv76vl0vaQs142fYCYIgCILwy0sE7oIgCILwc3K6VD9dqp+bXNzutf9s7e0Pdm78p5Wt7Pb1m7fv1jMTSxPT3zx99mGPrZQzlfLJXWge4ZXnagDU+sPwT/78Ngw7Ejr8i93S0be+WkfkjT/59gfvvXfj9RdKS/P5qVr5K1fOfP2lQiH7+CCvkDP+h3/9Dfm++sfdUf+t9dW9XutGe/tmZ9sL3Eqm8Iev/r0LlZlL9dms+vjuzMLPX8J4dxjutt3eKFyeMl+7UMzcS7cTxtNxqW/f6IydyA9ZZxjsttytppO29Ti2KcdLuqOwnJO9gPXGkeMnAICcKVXysiyhY+WZUcwHdtQfhwQj24tdPwEAyBKu5pWsQQEACedxktbMAozgsWJeQyXTFf3GxpDzw641UcLiBMUJ44yn1a+aQjK6lMavaUC/UDMaXa/R8RjnAIJyTpksqkcxsa7ivCk1ut7QjvY63u3d8Y2NYc6QIATbBy4HIG9JmkImiurQiUZONHajkRPbXtwdBa1BEISHkT/jPE74Y9ropDshYUHEEgbCmDlenLZxkCmydFotKAVLSnslYwSnK9rSlPHBWr8zDB0/tnQ6W9Wfqmw2YTwIk4Oev9FwStmT6+LjhDt+HH62I7OmkMmiammUc+D6SbPrfXxnmCSgWlAcP7bdeOzGpkbYAxkn5yBhfLvlfnxnkDHoQs145XyxmPm0G7hEUBizzYbrBQnjYKNhf3xnMFFQLJ0+OAY2SXgQftqfJGdKV07lHT9p9/2RG7lBcmNjmDWl2Qm9lJXTAzitN+8Og52Wd9DzvCCp5JVnFbhzwMOIRRHjnBcysqoQgmFnGKzv2Wvb474dBhGLYnZ7x752d/DJxtBQyX7He+Vc4cTAPWHcC5JG17u1NXrpTOHrl0q1spaeCKmdlrvRdLYazsCOxm6823ZvbgyX6oYmk4IlHa3NxDFb3RnnTAkjaOo07bISxTxr0MmiStOvaw42Gs4Hq/044ZZOvSBBCMgU5S05SfjYjVw/Od7XKQVBerGFHySun+y23Tt79q3tkaHSKGZ392xFwvOTuq7iUk5OujyKeX8cpdX0za63deCmpzkAgDEeJ8dPEcZAzPgJBxLgYcx6ozCK2diNi1lZljBj3A+Svbb33kpvecqcLKq2Fzl+4vpxzHghI6vy4dkRRKw9CCiGMeOdUTB243Qa8BOepKkoZkGYIASDiDleHCdcIqhaUOplVZYOv0Dyljw3qU/k1Yxup4e3qRJLp48dBRzH3PXjgR3GCbl/9i/FqJxTTk1bL58vcAAG4/DYgBU/TLrDYKNh98fhaxeKZ2cztdKngbuh0Vtb4zBi237sBUlnEKztjAsZealupA1hbu+N1xtOwZIvLGReu1jCnwbuQcGShnaUBu5ekKxuj6sF9dxchmBEMDo1bQ7t0PXj7QN35EZbTee9lV7ekk2NavdK/tPpAusNZ6/lNnu+JpOFJ50+IwiCIAi/IkTgLgiCIAg/V0vFylKxMlMuNoYvu4H3px/8+Ce3P+HxJxnD+ptb7xaq5aXK1O/MXXiGz6hr+I9+b36pFvzO3z9z9MNCVvmHr08vTeujfn95vgwA+NpLs2fmK1OTpq49PnCXKFqYPhykdqd/8H9d//Hdg/3Ng1bkhhKhv3n2+RfnFjO6eapUz4mq9i+xKGYrW8Mb60MIYcagWUM66g2CEUQUTxSViwvZlc3RbtsNY97s+1dv9SSKHswNWwP/7t64mlfcIB45kRckEMJKTpmt6pqMR+5nZhj6QbLVcFQJmzp17sVwukLmJoxyXgEAxDEPI8Y4TxgIIhbHn4nGcpZ0fiFzdfWwfwLjPIwYQYkfsJhxjKCukLwplXPyUQ2vKpOlurl94H641ldlXM4peUsyVALvxUzlrDI3qW82ne4wGDvRR7cHnIPLSzlLI2/f7OYt6RsvVIoZaaqs7hy47X7Q6Pi7bbfZ8+/s2re2RmlFP0ij4SBJniDL80M2cqM4YY4Xr+85rb4PAbB0OlFQpspaKasgfBi4TxTU2aphaZRiFLBkoqCenc1Y+vHLYh4hitnQia6vD1v94OuXSyfeJ40mx5/9pHSVTFX0zL3w96Dn//lP9nZa7svnCptNpz8Ol+pm3pIevOIhYTyIkq2Gc+3O4B++MrlYM++v85UpOjVtHfT9H3zYAgBwxtd2xhSjK6dyk0UV0eMVwWHMBs6n4xlzpvTS2XwUs84wuLU12mt7K5sjU6Pn5zMUo2oBg3tHxY2N4X/84a6l0emqdrQo8vkxxh0/dvyEcaBIiGDYG4V3du3vvNvYarqVvJLRqR+yt250/u6Dg84wwAheXe0XLOnc3AnrpmHEGl1/s+luNZ3XzhcX6yb5bC+X6Yp+eTE7HEcDOwIAbDWd773XVKXaxcXsQt1cbzjp/aOYX78z8PwEIaBKuD0MKEGmSudr+vykLh2uQ/BPtoZ+lARRoilkr+3KEs5b0lfOFoIoaXT97jB4MPUGAEAAyjllbkJvdv1mz99ree+t9JKEL0waEMK3bnRmJrSlulHMyPWSNrKjzjDsDoO0CP3ancGPP24fdaKPEx4E7Ng5ks4rfjAETxhwvHh93272/FpRXZ6y3rreSW/abNh/+v3t184Xryzn7u7bQZhMV/WcKZWy8rsrh18OIzda2Ry2+37M+O2dcaPjJQlPGA+epr+8FyRDJ5YlNHajVt/3gkSVydyEsVg3tXtXVCgyylvSzIS+2XTW9+2sSU9Nmznj8SepFya9UbjZdDI6DR+Y/TtZUn/z1VoQspvrw+Cztw7G0daBu9V044TVSmolL99/FuYMenkpO3LCtOHMyI3eXenqKpmt6pSAKGYrm6M7u/arF4qVvHL/0WZq9Mysde3OIP2nHyZ39+xaUe2NQkXCukIuLmR1hbh+wji4tTVa37fdIJmp6sWMVCtp6YSPKOGtfvDX7zSaPb+clf0pMVhVEARB+LUjAndBEARB+AVYzFYXs1UAwGy21rfHf7ry3q29jb+5cy3eADnZeDv/01qxem5m/htLD615f3ISxW+8Mnv+VGmibN7/c1OFV84WASim/6wWtWrxScPxUeD/vysfbbf2DgadvXH31qABMKrlqr91+auvTM7NFssVK/v5X7nwhWr1/a2m+/5K7/r6sDMMSln54zuDmapWzikAAMeP2/2gPQgSxjngAADOQXcQXF3rKzKmGB3rztzs+FdX+/1R5PjxfsfDCEwUlKUpY3nK1FVyLHAf2NHbN7vr+44io9u7Y4mgelk7M2tNFBSJItuLmj1/t+15AQujpDcKd9vu3T27lJXTlFmVcCkrn5vLbB+4d/fs3ij8yfWORFFnEPSGYcaQXjidf/5U3tTIUdmmKuHZqjZT0UyN1krqhblM3pLun/I3WVTPzlqr2+PeKHD8pNnz2Vq/MwzKWYUSVMkpGV1aqBkUozBilMBGx1/fs/+fH+x0hkGz67n+4Rvc73hv3+wqMs4akiyhB4u1AQCUoLQ+vT8Kr672d1ruZsPZOnANnV5eyr1yvljJK0fdxtOWOPmMNFVRB3bYHYfVgjJd0XTlMf+NxwjOVPVT0+ZOyxva0dr2eKqsKRS1+oEXJJ1hmNbUu17c6vubDSdJ+PaBO7Ajzvlhc+eup8m4XlLnJ425Sb3dD9wg2Wo6ccK7w4AQlDNp1pQKGen+t8kY9yO2c+De2BheuztIP77NpqMpuJJXLJ2GEbPdqNX3u8MwSTgAgAPgeMlu2337Rsf24smCut/1VrfHQ/twGWPsxhv79s2NUdaQpipaRqcEk+Vp879IqpZOr93uN7r++r79l2/vf1zSSjmZIBgzPrKjzjCgBM1O6OfnMtnPpp87LffO7vjW1mi/e9iTKEn4nT07f6vn+vFUWStnZYRgnPB2399te3f37UbXS6u/w4htH7hXV3uUIIyA7SUDO2x0vU82R3HM8paMMQScJwkLY+YHSZxwx4s7g2BgR7qC6b1lLc7TYafu2ze6V2/1HC/e7XjX1wcTBTVvSTJFfsRGTtQbBbYXx/cqnDuD4PrdwfyEnjFo1pSWp8zfeK68uj3ebblemGw2nf98rZ3OlV2eMhdqxkRRxQh+/VLp5vpws+k4XrK+bwMOcqZECFyeMmer+tCONpvO2I3SGLo/jrYPnL2OkTEkS6fp0Thd0S4uZNO6ZtdLdlpunPCdAzdnSVmTTpU0TcGLdTOImK7g1e1xs+vfWB/+h+9t3d23bTc+CribPf+DtR7GkGDYGQS2F3MO3CBpD/zNplPOKZZOayV1uqp1BqEXxNfuDPrjsGBJOVOqldTFurl94Da6nuMnOwfuu7jbHgQA8GpBLWflSl5VZXxlOTd2oo2mY3vxjz/u6AqBEBz0fEogY3zsxHd27dmqPjuh5y3pxFMJQUgxUmRMCbq9M/7uew1dIWs744EdVXLK6RlzYdLImxK591EiCBUJz1b17Ql9r+0VM/KFhWwh86gpCwM7bHT8j+70P7o9uLtnWzp9+2bn7GxmqqwpEkoPEoWicla+MJ9584XKUQjuBcnIia6u9d652d1puYqEV7ZGlKCJgqpICEE4dKLWIBjakX9vkckPkvU9u5SV5yf1KOb7He+TzVGr76/v2zlTKlhy1qTpfvD8eOfAPVodSdJa9X3nb68eXFnOnZvLKBKuldSvXiopMiYY7rW99iD48cftg75fzSuqhDGGQzsa2JHrx9Nl7eysVSupJ+0AQRAEQfhVJgJ3QRAEQfhFOlWugTKYLJaHru0G3p9ee+tuY+dHjZVo/4a+Iv/J1YlyrlgtlJ6fXPj65OLP/CyEoGNp+8+Ac/5vb/xwp70/sEdD197qdLyxSwGpZsv/4tI33jh1VpPVSStXUET3mF8OzZ7/8Z3+jfXh7d1xELIN3X7vVleWUBq42158Z2/c6Hh+mCAI094sXsjWtseWRjUZl3LK/VtrDwPbi2/cHcaMh1FSysqzE/rpGWuxfsKBN3Ki92/1CIbp1E1LpxcXMleWc6WcghEc2NFB32/1fQ44QtD14/2Ot7Y9kmk2DdwpQZSgiwvZOGFhxHbb7g8/amEEg4iN3GiioL5+ufzS2fxRWwkAgCyhelmbrmrlnLxUNy8vZY8V6U8U1ITxj24PWn3/oOd7frzVjLcP3HpJ/d3Xp05PWzmTlnNyvaQxzjFC77Hefsdb//62ZUiqhBgHMkUQwvYgeOeTzvykvlAzCD7eHQUCiBDUFFLKKq4fe0Hy7kqXYtTq+1HCKznllfPFb7xQyXy2ep0SlNHo7IQ+dCIOQCWvTBYfH2BhDE9Nm51B4AXtVj9Yb9iWTiGCAzvsj6PhOEynI8YJ74/CjX07ivlBzw+iRJGwFyTtQbDf9WslbbqinZo2t5rZ63cH+x3P8eK17dHtnfHzp3KzVa2aV4qfTRUTxl0/vrM7/ou39ncOXMb5zoFr6dRQiUyRpdEgTPrjaLPpNLoeQvCo67rtxe980u2Pwwvz2f2ud3tn7AZJemsUsb2298nm0FCxqZF0/8xW9emKRgkCgIdx76Af/PU7DV0lpk5VCScJbw+C2ar22sXSS2fyl5dyx/bPVtO5utpf2Rq3+wHBCMkQQbixbwMAGGMEwWJGRgDECdttuyubo7Vd+6DnK/debavvh1HSHYW2G7f6fhCxNBDPWxKlkCCIELR0mjOlkRM5XhxGbOhE/XFIifxp4A543w7v7Nn/+Vr79u4YI7jf8d6+0XnhTEGWEMHU8eL9jtfo+t1hyAFI90YQsb22d2t7XMkrL5zOL9XNf/xqzdJafpgM7Ghoh+/f6k9XtAsLmZmq/uKZPABAk/E/+MqEqVInSIZ22B+FV8f9yaJyYT47U9WfP51/f6V3d89OGE+fwvHjnZa32/bKOUVTMMEYADBd0QAAn2yOusPwgPljJxq78c6Bu1Azfvf1+oWFrKaQ5SmzkpNNjSgSHrvt1Z3x6vaonFd0hUgUxQxBALvD4IO1fs6SsobUH4dRzBSKGONDO9pqOjMV/cJCZn7SODubWd0e7bS8G+vDMGKnXp2ol9RKTjk3a3UGQRCxdt8Po+TW9mij4VyYzyzWzemqXs0rAICvnC3oCvmbq82VzdG7Kz2MoCIhieK8JY+cKIiSraazvu8sNl2JoGOBOwQAQkgJMjTCOFdkfGfP3ut4GZ2O3CiO2fyk/saVyvzk8bZOFKPZqr47aby/2nuSwL0/Cq+vDz5c63+8PhzZke3Gb13vMMYzBkWIpgdJOvz27FxGkbHtxb1RgCDwgqTR9T9Y7f/gg1YQsbwlfXS7TzDUFYIgJRh1R8F+xzvo+36YHJ1f3VG4vudcvztIr8vZPnCjmN3eHVs6LeeV9OEAgJEbr2yNWoPg/nEIB33v+1cPZIpmqnraUuy1C0VLJ5zzd1d6K5ujdz/pfnR7YOlEU4hMUXsQUILefL7y4pn8wyYrCIIgCMKvNhG4C4IgCMIv3rSVB1YeADCVK7uB5yXh7qj7P//o2x/s3gE7dyVM/0ox6kbeUvVyJv/NM5dfnFr4+bywv165udvrNPutjtPv+6OVwZ7HQoggYHy6VPvWpZd/Z/6yQpWcbhR0MRLtl0y9pMmX0OKUObSjhPGsIVXyShpXAQAsjZ6ZyVTz6pVTeceL/TABAEAIMYKlrFywJCdIml3/aGuXFrOXl7LgMFMGxaxcK6oPG5RXLSj/6NXJrCGNnIhSZKhkfkKvl7W0BXDWAH//per5uUwYH7aYqOaVelk7HpEXlRdxwdKlzjBAEDAOEsZVCedM6fSMmTUoeqA30kxV/+2v16t5Zbaqm9pnQm1CYCkr/+ark+fnM7ttL4wYhMDSaSUnL9XNSl7BGAIAJILOzmYyhnR2zuqNQtuN8xlJV0hnGCSMZ3SqK8RQyULdMDVyVKV+RFfx8pRZsKSXzxXihCcJZ4zHjMcJ0xSS0elizTA1gh94oCyhiYI6dmNFwoUna0ROEDw9bZkqPTVtDu0oSvhMVZut6mmNeSkrO37MGEcIqhKulVTG+Lk5yw9Z2lHEUMlCzShmZAThmRlLV8hzS7n2MIhiJhGkKXiqrE1XtOIDkSLG0FDJhYWsqVHbi6OYWTrNWVIpI2cMCiFQZFzOyc8t5epl7ZXzxejepRIYQUMlGYPmTelMYL1wOp92AAf3DrxiRipllftDTAhg2l3n0mKuOwo8P4lixjg3NGqoRFdIwfrMUX2/xbqZzll1/DiKDluZpGN+0yM8PX4oQbMTRtaQzs5l0vb9R1uQCNJVEsfcC5OEHY7SlSnSVTI3YSgyfv25cq2k3dkd31gffni7nzOlYkaW72uYAwEsWPLlxWxGpyMnShhPO6KUsrKhEoyhqZHpiqbJ+OxsZuSER01FIACTJXUir6aH8WLd0FVyaSnb6PqOF6frYbWSOl0+vGhJV8jcpKEq+Ny81ej6QzvSFFzIyLWiOl3RCIILNcPQyPn5TDrmVJGwoZLJklrMfLo8QAmq5JV/8lrt4kJ2t+1GMUcIlLPKZFGdm9ALGRlBSDAwNXpxPluw5DOz1sCOXD+p5BVdwQc9P2Hc0qml04xO0wkKWePwjQMACEbTFa2aVxQJL9SMP3hjavvA7QwCQlAlJ5+aNss5BSFwbi5j6fTMrDUYR1HCZIpNjdRKar2kHa1UlXPypaVs1qT7Ha8zDBQJ5wwpiFkUM8754UOKaq2sPdiaCSOYM+mF+YxCEYDAUElarC1RRDGiBE0UTvg6So/8ck6eqmgTBbWSV6o55dFBczErv3A6P1vV33i+EkWMEJQ2wsoZVPpsV6WMTucmjDeeKw+dqJCRdYVMVbTffHXy8lIuYVymqJSVi1k5a9J02a+cUySCakX19cvlo25XAICMQWtF1Q2SkRPZXswYMFRSzMiVgmLeWzxI+wvNVPVvvFA5emBa7D9V1jI6PToeakXtGy9Ul6fM/Y7vBnEQsThmqowNjeoKzuhSraRWcspRmzJBEARB+LUiAndBEARB+BKZtHIA5AAAp0r1U6V6FEW7w/63b7x/d297pbkbgSTmyV/e+mlG01RdzViWoepVo1DUsr81f7Gsfd4adgDAd/Zvfdzabg+67V5vZI9Hvm/btuu6iANdVipGdiJfmi1N/N7FF2UqW4qWF/Xsv7TylpS3pFPT1om3qjKuldSHtQKIE77VdO7/yUxVe+V8UaZIokgiOGvQRwyozJrSaxeLU2WtOww1BZvaYflzeivB5OJC9uLCY7oSZQ3J0mglr9huPPbi5LC+WM4aVKIn93Kp5JSvXSypMtZVciwGwghaOn1uObdYNxtdL4oZhLBgSZZOZYqOms9gDGsltZyTF+tG+rx5U9IU3B2GAIBCRlIlfDSI9UGKhKcr2nRFS+8TJ7w3CoMoeXCPxQnzAzZyI9dPcpYUxgxBUMzIOVMqZk6Ijx+EEJwsqqWcvFg3vDAJI5YzpKNu7CeuhVx4yD6fLKqVvDJfM8ZOFMZMpshQqamRE/PEtLdG+jZP3JpEkESQpdPZic/77QEhqJXUSl45NW2N3cj24rEbe35saDRnShOFRyWe1YcE8cekK0wPmzT7aGdmrFJG1mTs+Mlu28ub0rERmhACUyOmRmaqJ+8KRcKKhB9c1ThGlXElr1xYyDS6vuvHhkrSc+qoqbcsobIkl3PyhYVso+uNndjQiKkSQyXpsV3JK5W88uiTDiOY0emVU7nFKaPR9eOYIQQnCur9vXowhKqMpypapaAsT5ljL7bdKO1v0xsF6TmlyPjo7Jt9yBuv5JRKTlmqm2MvThd4DPWwQ1S9rJVzyuyE4fhxGLH0JlOlR/NLAQCWTk2NThQU24u7o1CTcd6Uxl4cRkyiSJOxoRH0wOCBFELQUMncpF4rqYqEdZU0ul5/FILDEQvq0UJaOhl45ETdUaDKWKY4ipkm48miWi2omcc1cDc1amp0fvLxa9WqjGWKnj+Vd4M4Y1BZQrIkFSzpueXj122kMjrN6PRhB9WjGSoxasbD1krvl/4GmZ3Q0/PO9qKxG8sUGRqdKCj5k+YDC4IgCMKvDxG4C4IgCMKXkYTJfK4CAJgvTlyanA2jKGbJh52dP7/94W63sT/oOoMmb0ICsRxjhZP/pHxXI7KEiUJlVZJlTCRKKCWUSoQQKkmEkITxKIxBwhnjnu97gR+zOIyjIA7c0POiIGBRN7DHkR/xhGNEMc5oWjZnnD+1/D++9I8lTDDGFBMJk4wqRqEKxxGMyjnF1AiC8MHi7vshCGSCcoZkKAQhSDB8sKb7SUAEdYUoFGVNmg56pARRDB+c4ZlSZVzOyQhBjODD4jZVxmnfGAgAJYictDWCkakSTcZ5S6IEYQTTAJES9GBZ/bEHpnNc05STcyARxDh/cI+N3Xir6V5d7a1sjd58vpI1pZubI0unL58tTBafKHA/fEaEDJVoCmGM089RaoogzOrUUAlnPN2BP9tH9kVIS+MVCeVNKWacMY4RpATJD1/5+Llxg2Sj6cQJu7iQKf5Mqf2TQxAWMxIzKcYIo5NPAghAwZIzOiUIYQzhSetSj6XJpF5SOQcQAvmBCbcpgqGpEU3BhXvnSPpxPPYcuV+6hfT6hvtPWEJg3pIyBk0/a4LhgwtsEAKJoIxOVRmnxwMliHH+4NZOfCDBSJV4uhcLlmxpNH1T9z9RnDDbi6+u9f/qnf35CWNuQvfDxPHj2apWe4KmT08FIlgtKOlFPM92y5+TKmNKkKXRhMlxwhGEGMMvw6knCIIgCL9YInAXBEEQhC81inBRPyxdr2Zyr8+cjpMkYQnj/O9Wb767frvrj0eh67hOf9gNophzBiDkkAPIEUUAo4QlDACAIESIAw44RxDGYZRECYGEQEwAggmjiGR1czk/bRlW1sz+l5dfrJgWghAhRDDJyiJhFz7FOQ8i5ocJO2zFAQAACAJFwidOIOSMRzFL7t0ZQoAQlCh6RDH4k4AAEAwJxk8YZGIE8ePiqnSDj3leCChB99evPvYh9z/ws0938gNdP9lre7e2R1dv9QyVVHJKo+NldFo/qQnGUz3jzwZCIFH05axZhfCJPrWfszjhrb6/c+CEYTJRUCYKD71e5FmBEChPkMbK9PMuRRAMCX7MX5EIQkTgz3CO3O/YWXb/xmX6+KUChCBC8Oj4P/Gql4c+EAAADu//sD2WDhTdOXA/XOt3B0F74DMGciZdnrbqz/qzhvc6+H/ZYAQxgoACAL6ML08QBEEQflFE4C4IgiAIvzQkTKT7Yo7ff+7l3774IuOcA54CAHAO/u31nxyMexGL/DiIecwhD6MoiCKEMaWEA0YwQQARSAxZe3P67OuTS+kGEUQQQgQhhFAm9BE1gMKvOc6B68e2Fyf3Be6PkDAeRCxOnujOAgDAD5P2wO8Og84wfOdmN29JaR19RqcPqykWvlSimH2yOdxoOIqMl6fMF07nn8nKh/DlkSR87MZDJxza0e3Ibg8DmeIL85n5SeOLXlwRBEEQBOFLTgTugiAIgvDL6lj+fuTfvPgNDtLw/TH5JoQQQYRFsC48jSBiQzvc2Lf32q6lHy7MjJzo+t2BRJFEkCJ92vQ8jFhnEGwduAc9HyNQL2kAAImgq6t9zsGZWevJy05/rZgaXawbrYE/duOCJVcLyuyEfm4uQx/aelr4ciEYzk0YeUsmCBYyskzFF+2vGkpRKSvPTxoXF7JBxGQJnZ6xLi1kS1lZEqtigiAIgvDrTQTugiAIgvCrhjx5i1xBeHpRzBw/6Y2jIGJHgzERgrttb6EeVfPJ/e0X4oR1RmFvFEYJL2TkQkYGAFCCNhtOwZJOTZsicD+RpZPlKcvxYsaApZN6SXtuOVfKyl+ezunCo1GCnmTypPDLSyKolJWXp8yXzxV64xAC8PVLpdMzlqXRRw+xEARBEAThV54I3AVBEARBEISnoEi4lJX/3vPlF07njn6IIJQlVM4pukLQfRm6RPF0Rcvo5PSMedTwHUFICMpbkoiPH4YSZOnk4mJ2qqJRjFQF502JErE6IQhfLrWi+uYLlTBiAIByTjEUIhYRBUEQBEEQgbsgCIIgCILwFAiGhkqW6uYT3jlr0KxBZ6r6F/3CfpWk810nCupEQTSDFoQvL0unTzXHWBAEQRCEXwfiknNBEARBEARBEARBEARBEARBeAZE4C4IgiAIgiAIgiAIgiAIgiAIz4AI3AVBEARBEARBEARBEARBEAThGRCBuyAIgiAIgiAIgiAIgiAIgiA8AyJwFwRBEARBEARBEARBEARBEIRn4P8HAAD//+ydeYAcVbX/z81MZiYhgZlIdrKzqKwxIYmK209RgR9GAoQlhM3HIrKjokZERBRFZHk+9ycoi4gENYAgIAYBWYOsIZgFspGQFbKQScLUeX/cvepWdXV39aQn+X4ymemurr5L1alz7/neW7cguAMAAAAAAAAAAAAAAAAABQDBHQAAAAAAAAAAAAAAAAAoAAjuAAAAAAAAAAAAAAAAAEABQHAHAAAAAAAAAAAAAAAAAAoAgjsAAAAAAAAAAAAAAAAAUAAQ3AEAAAAAAAAAAAAAAACAAoDgDgAAAAAAAAAAAAAAAAAUAAR3AAAAAAAAAAAAAAAAAKAAILgDAAAAAAAAAAAAAAAAAAXQuK0LAAAAAIASMHMF3xJCFF4SAEC9Af8AAAAAAABAXQHBHQAAAKhHKhPR0lKAuAbA9gT8AwBdmiovYVyzAAAAQJ0DwR0AAACoI6rX0bKTRZQOQNcF/gGALk1RlzCuWQAAAKDOgeAOAAAApJI/Nq4y6C2ZUcrncmsg67TiMLPMK0+BEckDUA90pn/QO+DaB6AwajRURrhmq6PT+ngAAAB2QCC4AwAAAB6VBcYVr8+QkZ3zSXaRAp9KUZ20spbMhZlLlhOLTgCwbekc/xDMF5c8AIWQ3alINs6JXeyVmHFR5h9KBxV089AdAgAAUC4Q3AEAOzoVTztCh3v7o/Pv9U7LUW8OKmVZhfRzZCKKIk5T1sqKzzGNDoBOphP8Q4byXg/6HZ4HC7o0OQbM8li4M7amL1hKEd8xVJYB1vMBAADQmUBwBwDscBTe4Zag292lyWMVyV1KnvOM0DeYY1oEnt9oU/aUylpAVmOOF7KaSgEACqET/INzFaf6B+r0672QBjqZCFwW6HwKHDBLDpVR5jWb+MqOTk7HEtsrT3eIcKgBAACkAMEdALCjULsFNGPpo+fdtci3YgNlL8sgSZtuRgmrSFfTOG23agxY5y4nvLshuonbraZWcaUAAIVQa/8gr9xEm5UxLFdbzb3WrTOhgQadTv4xs3zj/cEZHnU0VFbPVLwwl3Eb6g8W4AIAAFAOENwBANs5Fc1cDn7F60yXXEaTENh3BSqYgJbc1/lWalTmK9rJCaqxdNJe5ymVYGa3AEIInYjcGsmiZmpqZVcKAFAItfYPsX2Mf4hJeJ2juVf0MFg00KDeyTNmVtmAmTtats2HyuqfIvp4drfsBbh28EMNAAAgCQR3AMB2SxHPmvO+FEqhxEqahKi+jilq0YakTp0R+maracEI3OyQJ0SUarurKTEzsyxk5JSWmUVynp2pS1mVyigPACA/tfYPRJT0DxSS3Wuqued+hmQBDXTGpFRCAw06hdi1mTlmlmbzypjdEaNtOFTWJahBH4+yhzcSOwMAANihgeAOANgOqWxKS84ZRhkraRIW0+w6pAhblDYBLU9SyTWRY6c9iiJ3U1oQLl/4Opr7n9JtmMiq6EIIjpTGzsYOnTJwUpAywXn+Su3I8TwABRJzOIX7ByJBgl3/YFonV3b3x+TC/qFiKn6GZMUNdMakVJMsPBgokLIuZIpfy5R+/RrKGyrbMalgYa6SSZXsDgEAAAAuENwBANsVZUnt6TsHtqetB+LOLaKUaS+EqL7OqHjRhjRCd3lTLPTVMplRtIkypTRfRwtH43KLzEIlwsIsrqC/I98LInZm2ZvlZVJtMk+lUjcBAMohJNIV6R/UR45/8FESXkxzz/APFVDIhNP8DXRCHSMsBwFqTYrdxi7hlMEzZ0f/64IEJzZnDZUVO062HZA9o6JkNw/dIQAAABUAwR0AsJ2QP5JP6BrZGr2vZjqU+9w5Qke8XklT2xP3epNvS/a2hoy7vOU5T4R2diK6G4EnXtq3bhliZXE2O8kSCWanRKpUUSRXeJfKmkrfsUoVt+eplH8MYdsAVEhJtb16/yDUr7iQJy9uuc6Mke0KF++2SQMdEt9TG2gMioNaUNa1HNvfTYZkR4LIv0+F0obKdvAGudybDJL7EFH+Ph4VfScQAACA7QMI7gCA7YE8t45mTGYJRjiZ813iEmraYpqENa/rj/wzSROfxlMiuyCyMLqPGYkxxhBFsWCMhMiIwF0pLS0yJ89iWZdNsJ4IJ7PRWQghiJiFEJEQQpZHhehqXztDVFdVZFcKhgxAIZSptlfiH0i6Be0f4heu8mJCj8MVrLknG+j8s03T579nZBgfLzRpooEGNSX3texewLHNepNOxJlNrcxVjZsJotxDZTuUYedR28vv41HGLQXF3gkEAABguwGCOwCga1Ox1J7oZPsd9HhqGb3prMU0yZMyvTLsOMFPPeOaT0xt9+eNhmediXiEFojHdGpGvCajgcdj79g7KX0T+zF6rLAyV1Kz5plYsFBz6tV+QpAgiljPbudICBExCRLMkRucp0yCxX3rANSK/ApdNf5BSULaP8TaMyXcCTlVM5fmXlntknV090no7Hkb6MxyWX+Wv4GGHwPFEr6WyRk1Cw+bEWltXcib1nSvQzbrrMw77bIFhqBTpVgfjyjezXP6eOZmIDv5AN0hAAAA2UBwBwB0YUrOm8uYsBzvYYcEVSW1C/I/EyS73fHi6FlHOW44BdUTlHIMaaFO6Fux6U6J8JfC5qE3CRkMOwl7t3g7OVuVx83CZKW0s8Rb+S8YjW/dujWKuHv3RtFN3m6ufkXM2kwFsWCO5AIzQnBk5rkzm3KqcjuVYuJudmJXvFKY5945ZBg5jvv2R1Btr94/NDV1j/kHtmslELGRpLM191hRS1/5KQ10ltSeOsyZ0kAnWmdKLLhBumqp4+JYEQLUgqC1M9tBd2fkzLmiyTN6IlJDZURCyGcwqGbd7qCv4sRl6xlyl7Pqyvp4iUQoQ23nkLPxvk6kH/yg3IYc4UB3CAAAQB4guAMAuio5g/lYJJ9QUAMTimIJm7d2zY3QYppmaZGQ7C5zwfyXaskOwNL2TBffKRZihSagEflBcBJ7yv0QzJQhWQCzX1xVswpaQGJbs3btI48+/tzzL86bt2DxkqWrV6/ZunWrTLB37979+/UdPHjgXnvuMX7cmAPHfqCpqYmJBUt7leUXclWZKBJCGAk+VqjSlcIcutpRmYUT9PeuSdrpDvgFqto/9O87eNDAvfbaY8K4seMOHNPU1MRk15dxlsaKa+5OocqwsuwGOk1qL9lAp7XO5DfQdjzBF9/ddtlVyggNNKia7MuZrCV7aru+mBNqsNxXkFTTTXutL1vbehu9PXTZdjGq7+O529PV9pDcnt7N892jfFu6O9SlTwQAAIBCgOAOAOiSlBXMp81kSUQ2sTkubhbCvNdTWfR9+iq2N/pkQHbHPafVkz8My/hu9rT3hLhlf5O2k+XLly9ctDiKogED+o8YPlx+W6UtjSJ9YqgWetSLKIrU/coxNc3+sqrarGefu/F3t858+FGjoMVYv379+vXr581f8PA/H/vlr2/s36/v8ccdfdLU45qam4VjrqpUcqKcLvmy5csXLVoiKzVyRHmVilkxTLpiqrFwstaFg99ViY/vpant1fiHeQse/udjv/zVjf379T1hyuSTT5zS3Nxs9nFFJVfPq+Cijhmz28iS71udt4Fj4H43loafYWoDbZ9p4e7tr/eFBhoUTnD+h72ctdr+6UOP2Lx5i9mLKGHaMQQR0WcO/uTFXz1fdzzVfxLk3quhrbfLWHFn9vHk71B4QOvXr//P3HmbNrX3aWvdc8/dGxu7m1OiPKSS24Oae5c52gAAADoHCO4AgK5H/mA+PIsla2pL2hQXJrJPnTNhfPqqMmnzXxDSl02VQqRLFEWkQ7IUg0iNyB559PFrrv/Z88+/aFIbOnS3U0864fjjj27o1uCfd1fMMXMq1Z3IsWEeX03TWpp+SUxvvrniiiuvvv+Bh8qq6ZsrVl5z3U/vvudv1/74+8OHDTOBolpsRhkePfb4k9f/9y+ef+ElW6khu51y8gnHH3dUWqVkFbr6NLq6okALh+zehXDPe9Ad1dQ/XH3N/8y4+76fXHvViBHD7AIzQpZDKUrmYneKXNq4Qg00xz5KaaCD770XNi0/T624ywXqWc/dl+U3uykn7PzGoDioLY7Nk3tZywv4jaXLNrW3l5vm2+vWccQkSP3YdU7k1aKmugcLU4f2XOs+np+XytHr4jER8YLXF/7oR//94EMzOzo65M677LzzUUdOPOfsM3r32skeZCu3U3AKQiAyAAAAsKPSbVsXAAAAyiMlmLeihNknplEQM3MURczMEevfETNHkdkk36T8qP3ka45MYpHNKYppIm5hUmpQZLCxnWGOYeY+gZ+SyaYl5fz15K3b7/jzqaed7artRLRo0ZJvX37lBRd9vaOjQ6bKzO4JT5x6s52seZJrqY4hMnPETz0z68hjTixXTTPMnTf/9DPPW7FyhbLRKIoiMjZ7x50zTjvjPFdtJ6JFi5dcdvmVF170jY6ODuYof6VABXSyhYMugecVqJb+Ye78U0//0ooVK530SV7uuiRekYLlzN6YVNudjPyXTmtqX5qG1m2tU1pn5wts/yVxc87RQANQEM6lRXY1qEoS8s2YybxX7bXZzftbf3ROC+hf465fVZuZePbsOUcdfeLfHvi7UduJ6O116/73hpuOPuak1avXen0fNm4y4EPczOv30AMAAOgUILgDALoSZQfzpnPs6eJeMG6CeaOgs43f7Q/rRIzirlNyVPukiGALgZC+PNKOkR93sR5u8X5KBmZRxKFISYZeJpxVW9asXfvd710lZ04lueev90+/c4Yb9OoCRGTFe/PWC/kiP2rW1qKM7ZHHHj/9jPNWrVpd+UEkWvrGsquv+QlRFKljpcaE1ry19vs/+HFqpe69f/qfApVyppvq45UAxp2TjANVvYWzVhVAfeKenZhwQ9pBJNT2GviHpct+ePV10uIcAzPrTCdH1/JWyq2X+cj57bSSvipuxrWdV6qFzd1Ae6lEtoE2eVJy+NApvFcPXEegSuL2xOoKKK0cZ6TpXzXuxUtk2o66Jq2EhfTxEr7IeFP93nevl37nyrfXrQsmNXfe/Ct/eE3cYVgfUmH1AQAA7AhgSRkAQJchfzAff+dMYzGyoY54iNR2Wr78zVfnzlu69I0VK1atW7e+fXP71q3vNjV179HS0rNnz/79+w0aOGD4iKEjhg1ju7i1WsOdw4+xsredUvxhVuzei8p1eZ/vtiIjDJN/86ThfMuuapqRi02cjWkpm7nvvgc2bnwnI7M/Tv/zUUdONOdZnXkikhZCgjkyS8zYfK2SHVPVKOLo5dlzLrzoG+2bNwdzHDly+NQpx+y15x6trbssXrz07r/ed9fd96UV7977Hjz/nC/2798vYpKrLAii+//2UHal7pj+56MmTTQPUNSVEk6lYLSVEzTyYi2c4Fi6DMn2i1QrZSTiSv3DkiVv3HXPfXfdfW9a3vf89f6LLjhn4ID+rtmpZSqIOL6SO6ctmJCngU7o26EG2v2UlEvu6Ihef33RvHnzl7+5YsWKlRs2btzcvjlibm5qaunRsnPvXgMHDBg0eMCeu+++667vYWHWfFOl1g20VyO9qEyJh1QQriNQNUodNm9JNf39+vfbsGHDW2+97U6szpFcTMRXhmzeC30BJy/bejDmzurjBecTWAerTwrPmzf/2X8/n5HZjLvvvWTaV3r37mX68iT7d/rJEf5RTXWSAAAAdjQguAMAuiQ51HYvjNeihd0i/61ft/6Bh2Y+8cQzTzz59MqVq/Jk3bfvrqP33/djHzvo4E99onevXkIQE9uFY9VeWqR0hPeE5g4ClCtEJvdPHF551mOL+Sa/zjoeZjcSI+YXX3olu8wvvjS7ffPmluZmueix1nXsIIyTlzDimpkbZXQ01nM9N2545+vfuGzDxo3B7A7+1Ceu+M43GxsbZSYD+vc7cOzo3UeNvOa6nwb37+joePLpWYcf9llppIKJSbz0cslKvbJ58+aWlpZgpdwDmC3DgSRJoy3EwillYAkOp54JTaY2DsEdjavEP5AQAwf0P3Ds6N1HjcjwD088+fQREw9LXMPOALJf4Hzjl2lqu/mrBxwTUrv5t2TJGw/8/R9PPPH0rGefyx4gNIwYMewDo/c/+JOfOOjDExoaG5TbUs82ZybtrpxBcQpo7rhuQJX44+tyaraZlK3me/Df/jqdI+7o6Fi4aPGsWc9N/9OM2CJvKUnbcTkSJNt09YAhuUnuVpdGXLs+XihBexCc2ejao6peHr/wwuzsMr/77rsvvjT7gxPGqVkHrAc0wqOSYScJAABgBwSCOwCga+D2ufMF814Y7wf2xMwvvjz7ppv/8PeHZr7zzqaySrJy5ar7H/zH/Q/+4/Irrjrs0E+fesoJI4cPl8G8iuqdfrYjtVPiaZNeNFSfoVEnkx6Jccndgp/6c47Cx9gJjZx4WIXHzEyrV6/JLvbWrVvXrFk7cGB/mScxySntWm2Xqo6R0siJBGXwJk3UPkvgF7+6Yd78BcG83vfevb5z6bSGhgYp3zOzNLoTjp/8z0f+NevZ54LfWrZsObMaGGKiboLXrC1dqdVr1g4aNMBUyjFjooS2iwgzJylqeyEWTikWDt9SX/jn1xPmnJmwRmav3D+Q9g9TpxxTyj/oUWLdgrmDbGXWjtwGWrfJ/jsjeHlj4Wpj1BE9+NDM2/5w55NPPZO27FUar7228LXXFk6/c0bfvrtOPuqIE6ZMbm3dJVSR+O1IieFwNNCgFmi5XSvvTCyEGDZ0yNAhux1++CHXXvfT3970+5JpWB/CemKHemHxH/9bFw10jft44WpGkey6cGx8U+vttHpN6YW53lyxQp4rUgdWTXI39/yVTAEAAMAOCNZwBwB0AdI63yGV3VHbmdlZHlYv8spz587/4tkXTj725Lvuvrdctd2lvb19+p0zPvf54y697Htr33orsnm62eqJTE4pK85x+yYoRCa1G0eZysLdJ5aJSVN/JKUstYMJ28ye7ZvbSxa+fVO7iubU7DUnLVt+vVlbil8J9eaNZctvvvX2tIxOP+3k7t0b7DecuW6nnjwl7VsNDY2shxCIOYqovX1LxZXy/oJyiBl5zMLJt9j8Fu4kayw8K19QJ3jyj3ZHeqivYP/whVOmpn2roaHB+ip3Eq4/sJ1ei6zhcLPRrYXCfQSsXoj94YcfmzR56nkXfO3xJ54qV213Wbly1f/87FefPmTSb264+d1337UPXnUaZ3216Nc5KgtASdItSA/mO/7bTAxh5m5CnH/uFw/68IQS6TtLuGvxXafk/ag8CqpWtSRLUmwfzx6HRI2jyBmf0IOaaryDaPPm0t2hze1bnLNnPAfV4XEGAABQP0BwBwB0MWJqqe5ss/9Ch/I2yGaOeMuWLdde/9NJk6fOfPjRosrT0dFx+x1//vyk4x9//KlYJO+H9OSGAbpr7nXR0V930Sc6qd3YcMvI4rGfxG7sHFv/nd5InoRs41Vm2mmnniVL26t3L9Lxl69RB8aCnKJazNP+fn/bHe3tYYl/+LChB31ogvt1R8WiMR84oE9bW/CLAwb0szE9ERP37Fm6Ur0zK0Ww2DKJHS5njEd9GnNhlNvC/cQ5eGZwsuqWhHOriX8YO+aAPn3C/kHfnWP9bQWFD25PtoZsFe9IV0zVbdXK1edecPGZX7rg1VfnlluMNNavX3/V1ddPOfG0pUuXeWXxi2S8vSm2rERRxQA7LCkXiJXI2Sjl2p+f/l8n50nW2q9R23WD4A3A1iu16+MR2e16i9vg2sFFecx69uxRsrS9eu1k1XxnhNGpCwAAABAHgjsAoN5xA4ZstZ1TiCKOOFq0ZMmJp575i1/duHXr1sIL+eaKlWecdcH0O2f4kTw5L8jRcMvrm6fVK0jhVatRUZNf9N9SmhBJZA4sBzOMSZHJr7sZOkMgUWLqkywDDx40KLvWra279GnbxSjTrOdSeUGeN+vKTpJyVDFm5i1btvzpL3enZfSRj3woWV2dCzc0Nh5wwL7JbzU3N08YN5bt3HQmpkGD+pesVJtTqWKlp/x2kmEz27Yw5ZaHwxYeM2zzojALr57aHZN6pqxal1V3dnyC7+XsLsYECvYP+wf8Q0tz84cmjHdKbySqCsR3CjbQ3uEk5oTmzhH/64knjzr2pAce/Ee5mebh+RdeOv6EL7z4wsvunHpnVMK641CNzOvUoYVa2EnhlFvOampR/wekpgch/Ahrla/uWzhjOux0B5h57/e/d9DAAZmFD1RAzdY2Cn58oncZx7n6IxBMM16FmvXxPLHdZuhdzWT7elSyj0dEQ4YMjkv2oUOaPCZ5jlL+A17BkS+QCspZJyUHAIBtBdZwBwDUNW7nzO2gOx+pLhxn/n3+hZfOu/BrK1aszM6ura119P77DR8+tK2ttbmpacOGjW+vW/efufNenj1n3br12d/dunXrpd/5fq9eO33m05+0W70lce1asbLcaQ9nq6ZLGvtuZcvOdkKf2D+z6rV53pQbibk7sBNNUTDcCWwVQq2TrlbpNSckVkvmyKYgpXMmJho7ZvSNv7s1oy4Txo8V3cwANjtrIJtszLNSXaGd3ReSfz3x9Nq1b6VlNH7cGHaqJ5iYyDywl5iGDtkt+a2Jhx/a2rqLKguRfHrgmNEH3HxL6sIURDR+XEalyn4sWCEWVYhtF1WYZDoZ5YntmWnhdpvaEkguvkEbNvnrUMd9S8DX5ChtWRR1jjqf6q2isro73/LbrvjrivyDsP5BMA0bOiT5rSM+f3hbW6sqQZlLEQcbaGPSrgjmDCBoud2p3PQ7Z1x+xVUlx8KHDNltv33eP3Tobr179RLdum3YsGH16jWzX3l1zqtzt2wpsSjEipWrzjr3y7+74ecjhg9T/pjtYw+JyLg100bnqXUFFHuNdEJjXet8k0nVbb8lO8ecDtYR29n+9nuto0aNfGPZ8qyMpcNn+4+ZBRvbNQULlCdWzgIdPqWcu3JawJr18dQxc4R2PRVm9Oj9unfvnuF/+vbd9b177ZkohLOUe7zSJVzptmpualSYKrPrQv0EAAAoFwjuAICuh1YqTbxOZrqKIvKC+aeemnXOeV/dsHFjRpof++iHJx91xPjxY7t160aJ7uCWLVse/PvMm2+9fU7mre4dHR3TvnX5e/fac9iwIW5Ibx9Hp/8nA7MadXlNsiV7tPUQt5uzacYknN+xl+p/R0f09tvrTApC0M47925oaCASSpBWKcsH2Jon47lpJQvDNqRj+vjHDho1asT8+a8Fy9/Y2HjyiVNMeCUTl2UxmrSvTZtMAjzy6L8yjtUeu4+yJ5QoImtYMvlBgwbGvrLvPntfcP5ZbHVyFd5/9CMfHDly+IIFr6dX6ng/ZnSSKIUx75oaVX7bju1fI3KWJ01rSLNwIlr71tvmtgkhqEePHi0tzY6FS18jfAsvT3Pf5v5nW1E7qwjWPaYAxTayfuc0YOROyi7LP2hTIOMfBif8w/777fOVL59r3lZ3kjxPrv+yJyS6E8w1v7nx5quv+UlGus3NzUdMPGzixMP22nMPmWpsh7Vr37rrnvtuuvm21WvWZqSzatXqi74y7bZbftPU3CSEdoVepdVzocleKepvJ9gJ1Y0r2+bUf78ljezyOINrJO3PrARDWhCWInC/fruWzkhe31JmZ0HS8csPEnM4hBCxMfJO8/mxjMptAXP28dzL1umGJVvASD0E3nbxqE+ftomfO/SO6X9Jq9QpJ00xD7qIj9OVQyc3N9ukJBVQ//0EAACoGAjuAID6xZdiiZzZc6TFWTYvDZEX2M/693PZavvQIbt942sXjjtwTChX9bd796ZDPvvpT33yEz//1Q03/vaWjDJv3PjOd79/1S9/dp2a88JCTkOSGrIJNNLCnnQ5LCNPS0ZnNa1HW2y3u8pyumc5dljciIycYj/y2OOnfOEsN5G/3Hnrvvu8n0gPdQhjJXYicOyQqxni+j1p5Uv+bWhouPqHV5x1zoVvvBGfcdbS3HzJN7+6/377EBGRV3kjVjuhtDeKwHrJVWu3zM8992LaQRs8eNDOO/eWX5fzVh1hm5gjIUSPHnYp0paWlqOPnHjWmV9obmr259wLImpoaPzB9y4794KLlyWm0TU3N18y7St+pRLTt0pNby9pV6HP3U3x1Evadv4J5jkKE9zfSz9/eYJ+jBxLcH/7fo6JaNOmzWPHf9x9euS0r1/0hVOmkpy+TOb2CVkqwXaWHwXvoeHypzfWzv9sKwqstaRc+0wO9RmPoAyhav9gB160TNSjp+cfjp086Zyzz2hpbo6Ztv5dWut0jNyviG2VS6jtv7v5tmy1ffy4MdO+9uXddhtkskk20K2trVOnHHvYIZ+57Ls/ePSxxzNSe2XOf2747S2nn3Yym9oJduoZUOkqcmVZVOzKqmmsC5fXSvn/otIJH5Aq+y2FHI08JXe9ccp+/l8mOdrW0tyclbhMWTsLIQTrNln2M2R3I62ARXm/Cs5dRgtYdR9PZSf7Ws4lzFFkimpS9hV3pou/cv7ChYuffubZZEWOnXzkySceb8pv7iCIDWpkOMzOb24o360GZVGUD+lC/QQAAKgeCO4AgK5CsmtO5CgSkfdHsXDR4gsvmpahto8fN+bK731755139uN4m6P7qrF749lnnfaePm3ZAsGjjz3x/IsvHbDfvkq0laqYnF5EJCUy2TWPokh3KwOCZrIYJVFii0wxVdR2w5I8CQY25y9SZrLC6V6HIzFvplPi7DNRco525OyhRUkbh7qKpD74EbPRVlzl3b7ec49Rt99240033faPmY+89vqiKIoGDRrwwfHjpp5wzKiRI5x6sauzyglovnQjlSfz2pOk1m/cOHfe/LSDNmjgABNGyxltWsK353zIkMFHfP7/t7W1jRo54qMf+eBO8smoSpX1FDRm2mP3kb+/6de3/P6PMx9+9PWFi6IoGjRwwIQJB06dcuyokcO985WpvXFIwC01blTShBJXYynbTgnvUzMq/xLzdstZnrREwlqDq7rrXwsWvOaq7WTMSGkKSnRwLmhl52RPDQcH8go9OOZbef1P/mSLpfBaO98tYQ/+abBewMlS+YfgujJl+weR8A+7DZ50xOF9+vTZfdSIj3/0oF69dhJCOOuelRbZ0+vuaWSq3Kpa7FVHNdQRMT3495lXXX19RspTjp98/rlf7NatW6KBDpyqtj6tP/rh5Zd++3t/e+ChjDRvvvX2E084tkePHqSPjyO+kzsirhtoz7k5657FS5KTClxZRY11QfJY3uyqTKeMA1LyaHTOoShVcpG8xnU/J1Y4c+mrVJmpW0P2U9aUXxBCMKnrnZjMMlIyN3Zu7LNfK1Edyn+48pw72XhlrBYY0tsL6eOZ65eJKGLXtZlysCnPTj17/vqX10+/c8Y9f73/lTmvvvPOpve8p8/oA/Y75ugjPvyhCXJIQ1VRe1TOsapednvn+f5ycI98zqa2fnxIl+gnAABAUUBwBwDUKW7v0O0F6u1u8K7f+Gr7pk2bLrjo66tWr07LYtyBY3581RUtLS3B2DGtp3ncsUctXrL09j/+KaPwM+66d/9999HxvPCnUAtTel+bjdU0nH+y05zokjqRSnp33NH6k1mUKENR2DXTlSRDpCLSQCQmkrokETHNm78gnmzEEbNez8XM/lXr+hj7IfdgciSjU5OCTU0L722treeefea5Z58pz103ub55UB2g2CcsJ9Hr6auqpslFIxYseD0mrbr06dMmVVbBiZMq1P+9937fvnu/Tx5Hvc2d6KbsTOhytra2fumL/3X2WafJUjY0NJAgEXqgOofr6u+TNj6TGVVmx4G+lZa2bROn1aIwiSKVUR4n64DariVWtdlZZYCSGiuzHCOSaopz+7wQpJZLspq7UxC7wRVBYinHqhasTsrRyHtM4qXpLEqZBAVrXQv7jF1MyvulT28vwD8IQUT77PP+/fbdW2ikwC5I2NE4uUWQ1pmNLJI0lVQLsZeY2x5H7suImefOWzDtksszanTS1OPOPfsMdYCSGYW+0tjYeOm3vrb0jWUvvfxKWrKrVq1+aOYjhx5ysDxURCSEuTKVWOlnaJ1fXbkyynHBZpPH3bkUtU50KJ1cByTDbxTbb0k7MiVLbr1xIkGRXjJfhCbSInxWCYlZZsdqfM0o8HolO3KWtTPmlCyYV4RgyWNb8vt86wtiV1SK2l5IH8/r2Tm6vFuCKHR+Gxsbjzl60jFHTyKijihqSO/j5SHHZVu2Gwke+TxNbT34kHIdIG2jfgIAABQLBHcAQJfAk0etTumsdUvMvkIRXXnVta/+Z15aigMH9L/i8kuaW1rK62MykxDnn3vWk089s3Dh4rS9nnnmWWeOIZs5dEIuHRmxlDtiCZuaOhtLly4zHAp3x92YJrkmQDVaZFkktEgmoihisjPfbQAWyRfC1aOIiGfPnhNIN2KlnDhzBFUspoUlk5z+ktnRTSrwWiRPno89+s5NzToDcxe4roaxXubFi5ZkJPuePm0qJXkLtRGJTH6CTKxNsfDGRqVJvU+UVanAR3YBk/hHZVl1UJGJ7Zyw7XCoFhxPyl+Y4MZgkbLL47ssT/gIKAzWsD0Lf7mEhbNyK3p2X0xz94xQj/aFqpz34CTLknagsuWAmP+pNcXWOm3nYN1TtNSYc5FugdiX2mVjVpl/cOeuyxe2IFpxN/sIJb4nr/QSJ8hqhK62Zb1arDJKbW/f1P71aZdl3Hx20IcnnP2l05NnwphyWmmampq+dcnFU6aelvEIxFmz/n3oZw9mtZiMkE2Bc3WSf+GkNo6FmkqqK6OEDVWj+1dDUSlnO9i0a8d4yvxHo0adlhh+yVkr73LgymqdxtkTuV2PUC6ly6FSpPgMdzXN3YwQmd5UNQ1i4oslfX7Q4Xt5+S2ffZFsAcvt4zHbPp49/myaP9PnU6+DgxsN3bLvMChB0kop5YBTOVaap7mhxJGvEx9SWeE7uZ8AAACFA8EdAFDvuJ00E7DoX57ebubQRRz985//yngCUkNDw7e+eXFb6y6kw2vzUXjqjk9TU/czTjvlG9/8Tlr6C15bGHVEolGoOXRqhruIIhbdPN3DVNBOskt0TPP3fc06Eu5bUw+9cEoy8bCIkZFvgd1xE24Ju8C6mX7kiZHMxPLGYP2VTe3tc179TyzBSIdrOrySUZie++Tc1M3O01Njc55sBXNX1AuxtLzqp0naYhOaGjMzZ9yNQUQ9e/ZUj8hUyzPb8yuc32YOu8q6mxLTEgjhHQzvg5IkdZAYseg6tltJ+0kL6RO2HQ/v2Tcdf2p52ZeY6x6CRSpZnlgmbi20UdtXzi+lyTLRiy/NjiUUETNHpG+c0aKDZ+FBzT2KArMvKz44SfL4n2Q4XetYOt0+qZBaSzLqrqUEN0EmawZa99HvPM2pUv/gNmVC/8iSeeqFIDPXXdgd5dt0x5E4OI4hm+poa3ZEd6m2c8Q//fn/zpkTd92Gfv36fmvaV+2lmyiHZ1gJRo4Y/vmJh/3xjj+npf/6osXeiDiRHsBUlyg7i0UU2ECrwme5Mrsh5jDTXFlGGQpspmtKyWsnZnJma37JuEaHopTHC3xF97gyylO6qOpiE3LIlYlNp9Lp96gP03x+1kGr2ucz6ckT2phtqd0yxJpAr/0roo8nmzzXO5kj6FmUOxuhdJ1N3QMf5mxuYntWYJ+h7gfl6RHlv2oqK1geYpPuS3afOqGfAAAANQKCOwCgHvE7eexv8QJ4Q2RfRO9s3PSDH12bkf6xkyeNHTva0ySIyHtrpEw/NNF9vv/3iY/279/vzTdXBNPv6OhYv35Da+su8YVFVFwg0zP3AIcr7r+2hyKE6qHGurDJKEgGe36OMtnUVT4zOtwZn2SUM1lU1iuNyohIR3Csb8L2gzGluRMzP/vs85s3b4nnHXHEkZ7Srdfy0Yokef+FL0GaHOMVL32Dd6yG/qEwybJKywaV5NRw7dq3MlLu3tRdR5jBHJWOZgxXOJ9wZCU3p7pETmCjDSAQ1WQEOslASMvKocNYhkkn8w/YdixOS4oLUcRuYdwy5ClMioXHL7dgeeRSGY7cIMsTmdyZtWtLuDRZOiZu39T+/AuJ52SyeexAQGpxNff4LD8if2GZ1IOT8/ikHRD3mFDiNHXmFLak+8qW2isy0VT7pJDvdUukT7fMzJOerNpeoH8wLkK/s35CK+3Cricjy28r5aVHutTxK52ldyayeru32FvEc16de9Mtf8ioy1e/fF6bnLCfVhe7JdxAHznpcxmC+9tvryOtuLM8Gqr86gT5l20J7xE7DpnEteOE6yDdDMXhkFCbZrp+wbwNOQqZkzwXbHZ2gXGT4LXj+lL1hcy+U/Kt+Vb5hQyS5fGky3V0XnJPnBAURWpozG4svxBMJJissaqrTsnsWopmPf6udnFmXcT7eyGTpsp8frYxu+K7r7Y7TaHuJ1Xfx/Pr5b0LGkmleAMPXmk5dbiu4uYm2P2ggHIdTy1/o58oWM7ilV14k2/JfgI0dwBAV+T/AAAA///sfXecFkXyd/XswrKwS85piZIERVDAgBEzomLW01Mx60899cw5cXKG0/P09MzhPHNCRVBUJEfJQbLALjmzwO7U+0d3VVdPep5d0ePezxTL88wzzzw91d3V1VXfrqlOAfeUUkppr6YQNgFIwYBRqLvx519/851l8U/fFxYUXHThuWFsQrkv8rSSNjwAAOTm5vY7+og333438hae59WoUR0YD0PwAT3H85FWuGOpiwPzDhWwxQ3PbNEG4o/oDmz12jIT/NWKwJHJHGLYLWE8kOxp9H32IXlzLNcf8zXf+N0PoyPuYRJ8ogscaVKAvqL9r4RfxvzIA4EgZSIMQb2ue8A34To4VdL13L59e8ItquZW4UQRzJGWV2QwQikE5bEDrhOys6ijPI+8i1jl3JiQa50VPoXBJo9w5hK5cWTbFXIfXD+NGzwwCrJhxh0wCSzF8iOcXj7mV2VubSEG32INVkRg1I9jI+AGLTEKVYQHqsBG+QGIB0einijP2Dix7ZNI0fpHQM9G/wQqtcfd6TB8EABGE0QCKlJrAaNn1r2IDuIAtGszIesQzOBeKf0g0HGTOcY0OuPsQLA7mDM2w4ydCBVESE64VW0zCjGOmaARn3jy7wn5Xrrv3/Xwww521pKcugQuV2CGp9O17dq26dK5Y0Q6JgAAKKhRI1QFXynPPRMNk8WLSkWhqCTVgYT+S34AbKasMD8QJbGVAMsCF8WPyZAJlaGkjCU4qxGBGFgQul1WPXBZqDUCJVSUwywpOgZffFKEfio9/5rldr3EhSr7FX0uk16VfgsMFz0Aw7NzBUUasm6ioDALfY50a2tRaflGo/eslhMTonmvjI2ncweKpU1569CSYbYtb+4VXvQTRYkG18of5E3jx2wlJllzl4SFfzRxFpbnjJN+JBvyy4rwlhX/XGaUDkwx95RSSun/B0oB95RSSmmvo4Cv4p7RngUCICddMMa5eVQd16/f8MZb7ySUf87ZA2vXrh3wUNiZt9ac9O0IdRfeCvTpfVAc4N68WdPcXKtgXTMRUWMESlrhSE962gOQtjg4BrB7N+PCRcGCwQgXNwJXsfcV6eVmCUfGG+HyCwE9K4Lc+CLjfymTTEYB+D46QDsA2IcYdMG7du36evi3EXflaxRDRhHtocTmeBLW8FEC2hUl06FKeaZRSaIs1spomnA79dGuXbEgFADk5OYApW4XcioTNdve9aRfiCCuAYP2qui93eIq5R5EeD7J+FSiSCejIBahCHEV595zHLH5Dad0j+UqihnHXY++ebb8gKtOaG3ABRcM7C5gSsAvvhoOIUJEH33lAiwAnlGPDuJgeFA2sQxyY8imcA+oSfac/hEMcOG/rTsdQFICSiyu1vKyBBEVRPmdwudJHsCpGgNNeg4zd/GNSMBvqB8yhbcT6M44e3BRJEByyAdmbTM9o0M++ujjj6PHjR0/MaHYyy79I4JcNXD4t8QjysDtNEkT9e51YBzg3qxZE5dXUTaabRc5NJhgIB4OKmJ0uIcxpJPrR50XqkOct6pDDEmrW8IDNnhsS4o4SiBGSON/YAdy3Iks7hir2wPobUCXyh9E6XYIdFCQj6wslgSeIYbtMOdcJpKkur+ptKEBRlCNxkcaMQigwEf03LGCieEdkS2WqP3iOg5AnOV20J/Ew110M8oeiDTzyUdhACtr4/kAih93Q0SFIMPsozZMpYTxlSa6nTwDlZ1k98CQ4ekeaKrNZBFJbkOsuHNpPHtZkGOEA8tIwngPPMiSYu4ppZTS/xalgHtKKaW095I0iwmQMo6LxCEc2Mr333z7P5s3b4krs3p+/jlnD3ROafNNvtJ5hxmwYXSaunXt7Hke54iQdOghvSXnTpyR9o6EM+8i7NYED9rgsf688bUIFgx79caclSEkiKADK2WAjHZ5ogGFsAtfMRNc/NC3CCYa94jvpREmIKDJNAmi74d6/PMvhhUXl4Tv5KNwJ0BHAVswxdxVgU8xwIDK5oy37aC9V+Sf0AUIDp6Vqda2K2R1kDOISuHdXVaWsRElqMxYGYDpZFo0MjHvwV0TiZSycKdedbH4vJKXRVcz7PMk+JZB2Zb/g+IdwaeuNPloVrbZVdNNGPDTwotJnDsoboi5DnCgvoHG4bW6aH5CreSDTV5kFRYYSWMR8H10It2XL18xfMTIyPandSFUqJSnFCgPfMLcQQhFsHF0Y/AF6Nb2d9M/wRYSDOwRdzpUL4d5OxSdjwAxIuGWo6tkz+l0XHF1D40LJT4ZZaev8f0QTF1Z/cD3BsajuFnjw9uF2ABIveL8WjaCCrQqM0uiDXI5XJ/618uvJ1Rh//269uzR3TmV3QQt2sBQt66d4+5y6MG9meegKhMTtJwZuct4xkwQFSl9AVHhdiVRscMCAp+pecPaLMCY5dC2QUCvRk/QkVo3+VurA93TsvZJhbp3CC2suLdSZioXdgvyahBE6HY+F/zv1ih7DiN5Bpft4KhHmyIPWPWB6DU5bJwpBMLfJ3Oiwp8iZ2c3vAP4INPsDDGcYEwLKHpaEdi60KabFmZbptVq+uaEtjvJp7K18TwQz6ageVX60RejXd3HIOzqhDOamDmuVVTdg6RCbY6mPx1LIFKZQKCtY9RIwIEIm0PMi2vPOxaR1l323gk6xO36X6NDBGdUiNCB7kJIpJ2geXIkek8ZCSmllFJKvw+lgHtKKaW0t5Owhi08IUAJkAb6tu07Pvjos4TSDu97SGFBDeMqWAcnyqUnjyEIpBEVFBS0Kmq5aPGSwC3y8vL+cP45wL8J+ETCL5IVZPgVQsav6ymEPV0qmLKfh9FAclONFSsSl6PvQ8gKNxeHPIKA/W1Ziv4QIoKarD+mPR+fHVN6Q4PVGH7IE9MMoo9YXlYWlwUYfd/Xj3B7SjeB9cfIsWXsS9SL2hn5QPtesvWtv5jsjGEwvaztSkbygcSXaxtw/IJlmh8qR64ciIy2Q1SowFPsnHHL06vS7a9AVg8BnfwzSVWLRNutP49B6Y37KH5tGQSuWAhDELJthNnkJHV9WsVZOuQ96Pl1e8JlNYEZwxKX7rSZy4+EIxlz0cLk+xKsMmgDqS4/DDe88tpb5eXlkX2g4QaDnfoABm7newOYVSUwW8kpBSFkigqT+xX/JvrH8kTN8pti7kEAxa2sPAhLAwRrHS0RhPtZnVaRurs6n/SDfcIBAl/scf0AHN6u9YCS4e3utS4FQ7CBBNhpb+Y6MEv7/uQp06ZM/SmhFiec0I+4D07KQcg90wTdseM+kbdo377tMcccAe7zbFwfwhFZpYA7LJzZMKA9IFJUNLO2dYyoKCcc39RDKaWX8IVOg8DSuH5JHrOCqyimgnKUJFeSRxCSLysVV0LsHe3YkaqDvhNjh6sj0HYfOCVXrG7nb6Vmz8BUNiQlJm7U073MhOiuqKAJ0ldma09E8XSMnD+yJGlOARseDvgr0XYR3qEgs0gDSKmOb4GAMNNXdgYkfBxJu4HQCwgQRNt9xLKysjezs/HKsdxTUTYe2gP6EqkAc63WVXbv5LBQIIT0RKCmGNXg/BWIoQpx7Q22zaU6sWVWerqhMybhnhw1bhV+pQ6JPkV3d9RgUGwc3Z2VnfDrjYSUUkoppd+NUsA9pZRS2rso7M+DNc1dCIKdfd++fj70q+Sd5U44oZ+DRRDAoAhgcMw4coKBrkfXI2ratEkYcL/1lhtatmweQD0MAkZnQp6Pgbgdi9wx2iOscHuC0va6roE2Z7UtjuzPa/dAtrOIIaMXBdLydjyBRHAhmkVqTbKtdaF2ozoARB+UEv4XIAD4PvUxoTc+uWYvv/rm/Pk/R95GIzugFNBOoT74BnP3EZTyOeULR+UGPZCAi4bkScvGtcmSXccAyLE0iI7sR1pFcNEoRqWSEQA0flfAtUVE5SkE8DTjHkNJih0dh3FRoJZwDtDVlQotJ7BYRbieYfcS2cu1Ai2+DJ4Q/wO1Bd3oujYuJmNIiVLYaVM607F+VoMjDcH41eDwJbxL6t8YhrR/qJlSbp+7/Liv4I41396Mu5yOGG7wEdH3J02Z9sGHnwZrTKVwtQ3MYOB2K7S8FKElQYscYzGCJT26fNmYv4H+Aal/AiFse9Z3dmcQV2fFiGC41iwMYTVn6yiEIVR3o/AJB7EIAgChbKCMAPhgFA6rv1+vHwLtSTOMAWcM1K6FQ1FsO38vrg1g3G7DhtYUkapGtQC3LgDvxm9kCgD5+flHH3V48CzNyxHMqJBiEBN0wwYNqlWrVlpaKgsrLCx48L47c3NydSYg5dmAfwS73oh2xmTBSFBlzkGopfSLCgwTl3GLOZH+RFoaN7pXz2l86wxjVnJlmYobxBkki3hE9x2cREqBGSPqAyto0u5B1aEbnGE4NIupvNigKIs9citRtR3dHTWWw61R4foT40DTaKTGc6RAMkndg8bCkpA3mYPhtqwMGe2i5BJ6QICVihNpV/tBsG2iWiCwXbkUZov68jNeYjCxarBPMOrEU4j48itvzqu4jaeQrTfTXxTMDraB5QGKCkfaeEBtossM6j0nU76wRuInmuDZwKHDYni6AWPGqLDgyYYPIdeaPX64zd4xyiiSzGStQ+LOKjvaMVIHIk04dtRYOyFhbT6llFJK6X+CUsA9pZRS2ksJg6abtotRm+mMV0lnBhE//eyLhDIbN250YM8DACywYPAGeqpeYgzACHsUN5oaNqgvPxYUFNx6y/WnnXqy4dcDoGf1gTFDCzyRz8OGJnlk8V49RJm0yngDSm+jKO5EzoQEAbUj7/ycn9tmHpDTbQrvK2iIy64B8V0EMfRrCtZmN0quyJ/W4WsEQmnM3UcfEDjZxsxZc158KTYvga93lCSnx1MKPOGPWctf+x9sw7voq5E2ckDDuXeFq83OmAqdRsJEHKTVYlMkxgRRZSLdGujJ/f2UiGJXAKgopN/4wvwFaABU9p/TYa47Y8TKqZR0evRP9SISGvyUOjIow+ReA7pyTf9jKo66fLMOYJOSCv+WHh23+cp9HSXK4XV0odEdDgQvUEELEUTDDOS9a34AFG9+GWo3UR9G/9Gg3mI0uXiDTweIvr9x06YHH34sMl2VZoMj3H2llOd5AOADeqYXAPXSkhK/MCpNtIhoISQ5DWueX61/DOxuIYAAEBCBuVfat0ZXkhy+AxIpsY4sai0LtqPdqIZw3c2FgbrrNqcSfcsi6wcrEZIqph/0sLfnxIwGHNjOFzjh7SBWn8OFK7ncTB3HPPEc5szQtgqI69dv+HbkDwnc9z3s4MKCAmZMLocz4J5hghbNr5Rq1KjB0qXLufyiopaPPHj3vvt20jLrKc8uNjAShFY4nTal2oGYFsPaQ/IiGs586Si0iAZQYp9DVhpWCThL44hmBs0svbGM8VdJn13Iz70AAzomXEb4pjR8dFPK4WNaxaoPpw5Sl3JriOHrLPQGuiaiNeLYA7BqXUi7+BXNBeFRz9KnG4Oq4OhWOUsa0UPTywZ1VFF9ECI5D1JdIrMXhkWajBFXZuJbLNyFBvelrGYol/nQruyasvnWvm8MYdbApPFAT3aMts+cNfvFl16Lq7u08RSYtTJt4/k+KuX5iMqz2K47PDFcKRRB7u5ZEYJgawhkRgUzybhpZLiFrYlr55zwBCT4TJhuTMsjJ2a3gscWvwIbSqHXOYSCtBpb3zlsFLlKxWEkzlRLEtmQ7QRytBMpAF6RB7HrDMZg7pU2ElJKKaWUfmdKAfeUUkppryZpeFpfQfhYwqOHefMXzJw1J6G0A3t299hGI6yd/9jB184Cp4oAMKaiQU+F9ZpfPV8fFBW1PPqovueePbBJk8YmdtCC7Ur/3FPGP1Qy6NWYumTxOv48fxRuEoQsW0ZUtXNhvR9phJsqI21ZyjF05OH7PgfMsa0dxODcg0hmYsia+9JXI5hPLA0YDwBtRxNcQ5tqLV66/Mab79i5c2f8vSj6SSnjAPmgPA2ZU2v4FkkOQ63kixJLgGAz25uWZJdHRkUh94Ngh6tvutW6tPoDo2nxvowszHUxlD1AxlSViXLXfBkIg5CAiJuYOwcj88U9k9zLqMelGVV2nHnr1bt+HbU0HdPagbJ3oUQZYe9e+2nMrogotDWTnm2YpWhmQqNMs6RBMEWjyx1rfCvpN/JylgFY6bFugh3ERqkabd+xY8efbr5zyZJlEQJAt/AR7ZKL76PngVNxC0WC9mPB9hQB7VRd43bbrRR+O/0DtDQi9M8ew9wDAygMYAQxBTuJZKp11Mg0GlJAIPF1txLK6IZzCzFqLBgFe1Y/0KuNcAcOcuc/ZaFsZwE65mbArcp/dvoKTNCIXw0bsWvXrgT2DzrwAObWMEzL4Tw12yUDUS8RbSv2wgbIz88HgJycnE6dOvQ/6bjTBvSvXiNfY2e2XoqwwSC4w1ilFX2p2VxVBplEhXi0Co1GgBusKkTFLI2LYeKuJNpNxrOVXneuypYwcOjq5+gLgyU4XxlFCtQsFtW0rUEmiAWheeCYMqKMlmjFLjsoi7q7ne4e85APajwpOjz46fEs2yl2BQWdBwSyGt8RjNppJxZtF8EUIJehk6bC5BajXkOwwszdF5Y36koEAPT55nbvcB99Y+MhIuLipctuuClbG89sYhKy8czjcSi2NrGiAnbGowbw0XfMObsGB3zGKlgkc9rBf4HMLdP8XL5dfAhPNwAgWz7c2rIn7HgBkA3vioN4eIJXj+RUK4ok7R1mac/pECSDOTje9T+2TM0jwMKaAwhg7oE2STH3lFJK6X+AUsA9pZRS2msp6M+TCSidK4aqEBG/+/7H5BK777+fPlCBP/LkybG3/jyTjkMylizZ3Oefe+aAk09o2KhB/Xr1QCAUCEgQgbHy9Vds8pLtb3F2rhobwcIChm3bt40fP3nuvAWLFi1es27dtm3bd+3cWb169YKCGi2aN2vVqqhnj/07d+qolGJ0EoGhH4u2yKeYFSVztx4gQYLm1r65nC3wABzpgKTxtPyXFd98+/3s2XNXFZds3bo1Pz+/Zs2a7du36XnA/ocdenBOTg55nggAPrKngDquXftCmo2Jk6fe98DgNWvWJt3P93X7eboynkeVoq5UBJbpBDPG/2eMCwhvZ8+MGpMdLgTdxRqLV9Lp1UV5FHYt3Rog/J7EFhz5zdCMjN2FZFNUDMhLtM//8zdOR4WcNUVJ9GltyUWBwpUiED6Y6Zi9a+vL2gMp57h505bpM2bNmjP35wULN27ctHnLltLS0qp5edXy8urUqd2wYYMWzZt16dyxS+eO+dXzFVrZpn4yo0mZ8HaNRbGTJsEYhx/6AHKIlfvlP/+8aM7c+YsWLS4pWbNm7drt23eU7tzpl5dXzcurUb16w4YNmjVt0rHjPgfs361Bw/oCYbVjzYHe5aKFA2NQ5Dr1uxUB31+1qviuex+ePGVakiDoawGUFnKNC+oIdwWICtFXnm4KgwxYZNIkiWaQjl1uyinsgi97Qv+osP4BASPinsPcxW9BziDg9LgEGlBUM1hrBFy1snjSlGmLFy9dtnz5unUbtm/fXlpampdXrUaN6vXr12vTuqhd2za9evWsVbMmipUhWXdAtOibST9NDxfwcDEiIRB33/8N9YN5JdzUhrfLC0M/FnCnRJrorubPtCgPNiHi3/+QYYLuccD++l5iacAg7kAh7pETtAF/5QSNAAAP3HtHTo7XtFmTwhoFIBYPJIZPg0QRLGWBd3QkiNW3clQZgJ6h5s37ecaMWYuXLl2+fMXmzZu3b9+xa9eu6tWrV6+e37Rpk9atijp36tijx35Vq1Q1YB2l8mLVoe/lTtPAK3Y0bCXKrNvYj1Ro4fmauioWLysrK5swccrMWbPnzVuwfsPGLVu2IEJBQY2mTRp36rhPr4N6dujQ3vQPBLsgQuqo/OW/rJg4ccrsOXOX/7Jyy5Yt27dvz8/Pr1unTqtWLbvv36137wNrFhbKZjcDR9gtPsF1FCutaOdnAV+j003odlBFjRZNixYtmThpyrSfZqxbv37jxk1l5eWFBQX16tZp06Z1584dDj24d7Vq1eR6MK+0Cf3DEKecAgjKFGmnGCg2cREVoQhVKRqUD8ls1l9byyQ4OwMAwuo1a8aOm7hw4eLFS5Zu3Lhp27Zt5b5fo0b12rVqtWzRvF27Nr17Hdi8WdMIYbZWEvD0bG6pWM060x8g6NB2QJw4eeq99z3y62083wflaRuPLAD5wFjAGEJmkbqNbTyOq7BgsBE807Ygxy9bRLQyZicgoPZnzUhn6N+WzVsmTpq6YOGiZcuWl5Ss3r59x/bt23NycgoKatSqVatVUcs2rVsddOABzZo1FdMNuitVcoYFmoAU6RAkRyTSKApMiFnokKj2LFm9ZvyESXPmzl+6ZNnmrVu2bdtetWrVWjULW7Zo0aVLx4N7H9SkaWNpzuk3Zt6adMauSzISUkoppZT2fkoB95RSSmkvIunPB75hZ1548Y5Lj4hjxk5ILr9HD+HPO7Fz9tAJ62PDzuWH3fuWLZvLMwwEcKkG7PLIiSR3Ub/rV+MoKlMdCUr66I/6cex/3v1wzJjxpfHxPpoaNWp4ysknnHXmaS2aN5NQoIRgjC9B91UKfF8+iQ2I8MK/Xpkxc3bQxDY/D55TSg0Z/ICX40EULVm67Mmn/jHyu1Hh5Bg/jBr90stvtCpqef11Vxzb72hOaiodFH0730cEXL16zRtvvfvvd96P3kZS0N+fe7GwsNCwB3YZhA8B4JqrB3Vo346ikLhW+P2oMcHE2TFIFyM3AHDoIb0Hnn4KndTOGIUgAdj/CIj+jh077rj7QXa9pGcTl7FU0xfDhk/9aTrdVkW/Apx+Wv+D+/QCsEs7P44e99Enn4sakX+IlEETHYxNF3foIb3PGDhAVoqeSzALFFSAss8sE76N6NNSEoMf/Aa7du0a/s3IL78aMerHMTt3JkW8aqpWrVqf3gcef+zRJ5zQr2qVqkagSVVI354UhX1uA6wTbX1dA8EgIqBf7o/6ccyXw0aMHjM+g5NP5Hlet65dTj7p+AH9TywsLJBjjXxucTXlTdLgCsX3+XphyYCr6CPi9u07Pv506PMvvJy8CwUAfPnV8BkzZtNSSlAG9MHxxx590knHKVN/T6sXDo4lKMBxuQkq3cP6J5RSXMU/Nl55d1oOUwGbRKHtLswkxMJiDStXrPrw48+Gff3tzwsXZbx1bm5uzx7dTxtw0vHHH5NXNS9Yd2JJIx2KMioAw4BGJtD3AQF37Nhx+10PGMadcZOtfohUDnxw5sABhx7SB4BwdqB5CgjOhgiJChB1lmhzmj4crSZoy5atU6ZOT+C/qKhF48aN6AZgw+9tFegcA+4JE7QCBOzcuQNIaNiZoA12j9QUYLE0wtusEBk8ysJmVM3p02d98NGn33//Y8nqNQm101RYUHDYYX3OHHha7949zQ3FCmJgliZMGUDkv9aiQsG58Ozz/5ozZx6AOwBiZi3P84YMfiDcpwi4YePGV199+/OhX62O0YGffv4lAHTs0P4PF5zT/6TjPc+zMDEAmRpusYjDhn/73vsfjRs/Kbo5vodXXnurRo3qJx5/7KBBF7Zs3pxXP2wb8NqDZhTl/hxI2gwQceKkqa++/ja1X+bWAICBp59yyMG95BkWlR9GjXnltbcmTJwczTkAANSoUf2oIw+/+MLzOnfuiByfa4e9I51iv0rTbmJFJwOfFSWpRi3artCZpMnidLU/7NhZ+tmnX370yec/TZ8Zl9OMqWPHfQaedsqAASfWLCgUwozIcmGDu30AQLNtuMbWARwNgatLVr/+1jtv/7vyNh7HmAPANVdf1qF9W+An8KhtVq0qfnTIUyBOJTQ8m46NGze67ZYbEHQkAvoInhVO0fFWP5g5XugLoc5dXHvLlq1Dvxz2+dBh036aUVZWllx3AOjQof1JJx478LRT6tWt61gdTuMDiNYPGvxCif3zRW3wk9bj30bh6gDQ+6CeZ515WiRjY8aOf/Pt90aPGRfZg6NhPAB4nnfIwb0v+eP5vXsdaMa7FhtjKHCzGuAdIMlIqLzFkFJKKaX0e1EKuKeUUkp7L4X9ebAgBTgGO8DatetmzJyVUFpRUYtGDRvYQAq21EME8p8mylWpD8JmaABw1weEcpi4GAqTUYrrIkxhQpqtIzRhwuS/DHlqtnans6CSktUvvvTaq6+/fe45A6++YlDt2rUQOP6avECUcU/6gEFAY4LPmDH7q69HZHlTAPjT9Vc3adokfP7zocMeeuSx7dt3JPx2ydJlN9585zVXLbnqikssBwDgm3Zev3792PETfxw9bsQ33yWnI2CaMHFKxmvOO+dMnx9+Vtb1WvHLyq+Hf5vNXSQ1bNgAjHCC9hSk98X9DACIsHt32fARIyt6CwCYN2/BvHkLMl7Wq/eBACYOXcv4ihUrK3HHRqJSOmLaPkLvs1tkHUrznfUn2Zm2kGF5eflnn3/1/AsvL1kany8lRKWlpSO/GzXyu1FPPv3c5ZdedNbZp+fm5IDEFPQAVcqnlPz03IbFOGweVXqupKzc/+jjz17812tLly1PuHuYfN+f9tOMaT/N+Mfz/7risovPP++s3JwciZ2xz0j/geAGcMEjBIQdpaUTJk4eM3bC0C+GrV+/IRsG5s3/ORl7BYCOHdoJZ1TDUoy2g1124HUIGnncX3tE/3Ba5gDwHhW8pmlPutNCDundQXlsxZFkdMWKVU///fmhX3ydEfRhKisrGzd+4rjxE5946tmrrxp0xukDcnJyZN0NSCP3T7DomxYMpHH2m+uHg/scBEDB7sBB5HZEx4W3u2SnDJq7QGJKFm2ny8aMnbB79+4Exrrv143uxriLXA4HfhHTKmkAZ0u+4ARt88+QsNnqoylWz7zOtubOY09WWni5evKUaU89/dykyVOTG1zSlq1bv/hy+BdfDt+3S6ebbryWIScKEBZZKQCUSUhleoQPbJsrnDZt+sjvRmXPwE03XNOoUcPAyY8/HfrU089lo3zmzltw590PfvzJ5w/ed2dTPekbjoMm0Zy58wcPeXLKlJ8ylrlt2/b3Pvj4s6FfXXXFJYMuvdBTHq9/EIgo9SmQ7JkH8ABQw8LFJau/GlYBuwUA2rZp3af3QfrYIMGAW7dte+iRvw79Ylg2nH/2+Zefff7lKf1PuO2WG+vUra3s4zzGuBIM85qKs1hl8FGlN4tV2sKFiDEYSwElyR8lQGmezyTtF9b8iOD7/vsffvLMsy9kufAMAHPnzn/40b8+98+Xrrry0nPPGpibm8tGENDqPFoE2EGZTS41wPXrN44ZO+6HH8cOHzFyz9p4KCSTlhpgy9ZtX39dYRuvU8d9kOOxdYF2UZU3dTELLRxtQF0dWN6wCnL7tu0vv/rm62+8s2Xr1uyZ0ar+H8+9dP65Z155+SWFhQXcxL4VBs0YolJoElE5Bj/zNWPm7AoNnLKyMh2KIWnN2nUPPTIkG13k+/6oH8eM+nHMSSced8+dt9SsWdMuswni8HwQejt7JlNKKaWU9h5KAfeUUkpp76SAP0/oOvvxMjQGABF/HD3WJ+A4kvZp384cKYs0kHMUibmDNAHZ3xO5ZVz7T6cppPyeFhZgvJucEArZ4AqSOW7qibt27nrkL0/8590PK9Fwu3fvfv2Nd7755vtHH7n3wB4HUGPKR175TTsITuCVdQSzphUrV9nIRKI33353yONPZ1nCs8+92KZ10bH9jgQKLOQFiaOPG5AxzKpShIA+cogjuWN+ZEhPFqUhUr5WXbZC3qvLYjaVLLxiRHe2Sz2VIyMfTqVA5DR1U4LSu/Ap2aE3Qv7zwkV33fPQT9NnVrpqxcUlDzz82GdDv3piyMMkcgKHMWwrWrfiI1rTIqXhIy5duvzW2+/9NcwAwPr1Gx79yxMjvv3usUfvb9yokeJH6w1p9ISy8GjuAHy7ugaIeN31fx4zdvyvYSOSjMqUz9X7yK6ruUTA0OZNAeIe1T8BtN10lQle05ywJqy0Ry2VlljcikDbpRjYioMRi5dfffPv/3ixtLS0cmyUrF5z7/2PfvjRZ4Mfua9VUUuquyGSUrPawrrBl9GO+tNvS5RUBhz9oCwKnzm83Z0lLH5HFXNaV9PoseOS2WrXvg1zApIJMSsbMDY0Qesl7WwmaDHxE+6uAMxyOC3dCYlC4GHB9YGt27Y98ujjzmNDFaSZs+ZcPOiaAf1PvOvOWwoKatjlJu4IqTF8i6DyfIL0UiFa9suKBg0b8A8R8ZlnX3j51TcrVMjESVP/eOnVzzw9pH27tjJ5CtNXw0bc+8DgCo2j0tLSJ//2j1mz5z726P15eXmaO2uAoc1xxq0BoHxptFS8NVYVFyNZF/rHa9asveramxb8vLBC5Xz62Zfjx0968vFHu+/fDVjfAejVLB71tJRjDn2kNWvBeMXsr3iFiXarUsWZyY1ZBYj8yAbJdXFxya2335sNkB2m9es3PPzIX7/++tu/PHpf48aNVEhzoJNqXrPhI6UKPPzoE38jGw8ZfqaFDH22suWBViuAqJQHbOtjOHsPWUWsCOWsQ6uSo34cc8/9jxYXl1SOndLS0pdeeePzoV89cN8dfQ87xMqSEnpRLO3SdMPGGjVGBQfOypXFgVlq3rwFN91y5y8rVlaonKFfDJszd97z/3iyebOmeq3JozHvWe6NPg6vIaVB7imllNL/CkUnAUgppZRS2puITEO0rpXBL4VfH/vYMlGb1q30gXGy6XH1uBh3pTz3pOcpz/OUUsocuH8egwJ8CDrsxd5T428ocrcjog48MeTjmtVrLx50TeXQLqYVK1ddMujaDz/6DBF9sxkj/QEiou/bBvV9nRLTvIbc5wy0clWx79LnXwzLHm3X9MTfnt21a7fvI/q6iZil38ITA2Dcy3rqFGZaybJIIAlax4Ajg+Y56t8Bdqe0CbzXwK8gBN/3nUpReJR+pdwourMkwO4sio38btR5Fwz6lQC3pqnTpp9zwaULFy3m0e/7PgkMimBhkwfbJMPmHdkAJ06acta5f9wjzADAxIlTLrz4ysVLlqJDti3I1zVDjBQXIOid4n4zCScoFxFEpuMY0Pn31T/MhmBJoACVRaDCaDuVYavJjNAnRB83b95yzf/d/Ncnnqk02s700/SZ515w6Tfffh+su2ht5z9Xk4fZb0zKnQMdhCYCuFD2KQnDqvPROWmwJPrWChqMHTcxmau2rVuDXQcQkL+dWPU87L44E7S9JHKCpqJNYbTqA0C5xQiFBDAJOIyM+L7pQABY8PPCc8+/9Neg7UyffPbFeRcMWvgzqzJfIHTOMKFjva2yHtg++hVW7r/8stL3fR4Cz7/wSkXRdk3FJatvuPG24uISO+tTmSO++e6Oux+s3Dj6evi3f7rlzt1lZeXl5c6gQSQ9rxeldKP4YrGnMpP3qlUlkvl169ZffV2F0XZNJavXDLriupHf/eCzrEjWQaEdF87A50EINphfZkaJJblqyiT1HiKPVOS7O2vgxOjUqdPPOf/SyqHtTBMnTTn73EtmzZrLwswNq20ftGanngbM9jy/h40nFwIrXxq6+o2PjbHn8y6sAYRdNLU+LC8v/9szz115zZ8qjbYzlaxec9W1Nz3zjxeMvSNuQ62uFQfLAYj9QSpjj65YuVJa+8uWLb/62j9VFG3XtGjRkkGXX7d69RqtO3zkCRmZc16kkbL9K63alFJKKaXfk1LAPaWUUtpbiC3hsEUsYnOA3RUE+wNEnDV7TnL5bdoUgX2k16DtAMD4unTdjS8fcNqFwx/26JXyAEB5SimwF9soelNBCtQI2OLGwly/YcNlV10/ZWrmB7EzUllZ2d33Pfze+x+7OJfA3I0V6wP4Gju1PlpFqLi4xNeQhI++jz8vXPzI4CcqWsiKFatGfPO9ccoQ0bL0GxFHmCLh+zYIqOJlCYzZZ7fMJBCnpt/DFYglhQCoY60ozK5SxOLJjqVYoEDQ8DpIdwhpaLL75CP6vv/1iG+v/9NtGR+arl49v0mTxjWqV8/IWknJ6muuu3n9hg0o70qagTZUoz/T+ubCuXPnX3PtzZs3b0m+hed5derUbta0SUFBjYz8LF++4trrb9mwcSNhLT7DQ1q0fIsva9QMrLuesfRfS1x9ui8g8abfrf5Zt379ntU/78brH4lAQQWB9UD1Es6TgABNI2Kkkpxu2LjxiqtuqFBqjmTauHHTDTfd/ulnX/rlQfRNo6UooQT/94USzEIw0FNeMp9MOLw9GDsoPxPbQivYqdmp9fJfVqxduy6Zr7ZtWxv+VJCPwGq4hd+DszMthEdB7uIlGD0PYjkczIBB0EtWPomNj77vz5oz95LLrs0ms3+WtODnhZdcds3cefM1XsbDUS9zsrSYtRgazLTBpF9R/bFixUokpOzbkT+8+NJrleZ8xcpV997/aHl5uUaYfd9H31+4cNE99z+afTqmMH078oe/Pf2cURQhzJ3+fCTQ0KLvFR83xSWreZIq2737tjvvn7+gMmi7pu3bd9x8691Tp07HKLIL8kLjse6SOqzSmlAS6RJ3NNLs7PtW+039afoVV99YUrL61990zdq1l195/fSZs1iYQVTfSK40LCr9SGFWpMczbXdg7v0r9CvK+ANpEfEyv2+rGpRbK8vl5eUPPPTY8y+8sqdWGnzf/8dz/3rw4SF+OQ8X2fbc1mzwkz1QKRt7y5atmzZu1Ob+tq1bb7n17nXZpcKLpGXLfrn5z3eVlZVZrt3FaTZawB0av59FnVJKKaX06yhNKZNSSintpcTeiHVPbAgxyoAVRNywcdOKFauSC2zTurU5sgF+1od3MXeG4S1YieAmQqDP4g78kL5+wN1mHjS4p1KBMA3k6iAiYumO0quvvSkhD2/NmoWn9D/xiL6HtG/XtqCgxrZt2+fNXzB8xHeffPbFzqgtDX3ff/CRIU2bNTm490E6K7phydPogmEYndUM/567/nzNVYPWr984b9788RMnf//D6GT/eVVxCYoA2sf++tS2bdsSro+jiZOmHHvsUSZbPpqgsKOPOlzzZpAFBAScOHHK1vhb9OzRvbCwwCYdsICKDR2rXbs2cOchPdkNMKD/iUceftiWbVs3rN84a9bc70eNnjgpi7AvROT8njqunBL+I4CT8gRBAdSvV9cNSzN3375te8LWlDVq1MjLq6qPg/kgiBRAXtU80OkvlUnb37//CYf3PWTbtu3rN26cNWvOqB/HTJyUOe8wh4XpFA26Uj6gpxOngEfpL5RSOs6dXCIfhXjjT9Nn3nr7fQnpm5s0aXTu2Wcc3vfQ5s2a6jMLFi785NMv3v/gk4RfLV22/PEn/v7QA3dRhhuwOyQAUMZ2kZoBARF379592533J0P/B/c56KwzTtt//26FBQX6p+vWrR8/YfI77304a1bsqt6iRUseGfz44Ifv8z3fM89GAwCQKtA4t73ep6G//35dCwsL0KoGQMAFCxYu/2VF3L32ad+2WbOmLijpbgcJUNSyBQCiD3qw0zP9PkOK8Pvon4cfa9a0ycF9DhIbQNKII7UIJEaaJVXZZ8ZRyCCfIejUJYYjfNxRWnrVtX/66aekxx0KCwuO6Hto166dmzZpUj0/f9v27StXFf80feZ334+K26OirKzsjrsfqFIl97hjj07i2cqnrz8rpfaEfuCVZX4356pVzQNG28FeIBJnZ6QA6kEgFs3KYp3LzN7z5s1PLrFpk8aFhQUc56vHsTM/C7SdQXJngjYRv7ETNCKYKHc7NZiBYZY+OCmDnhMF3KNp8eKll195fXKu82ZNmxxxxGEd92lfv369qlWrbN68ZdHipZOmTB0/flIcvrZ6zdpBV/zf6688b9IQ8XNJStRAIOvUqICAD91/99p169auWzdjxqwfRo2ZOi1pW1oAWLFipdbVW7Zu/ctjT/5KyG/8hEmffv7lKSefoJkr9/GBhx6r3Owv6dXX3z7yiMP2368r+ACeLluZuZMTdKFoDwBEPPKIviNHfL5169YNGzfOnTN/3IRJmU2XVcXlZeWepwDguX++HNgitXr1/AN7HtCsWdO6dWqXlZUXF5dMnTY9ecOP7dt33Hjz7e+981r9BvXCGY0088Ys4A0+fsUyW0Axos1qAlSwMT8ZfrdGtA+IuHDh4muuu3nLltjl56KWLU4dcFLvXgcWtWxetWrVDRs3TZ8x85NPv/xh1OjI6zds3HjDn25/+/UXGzVqCArMriU2hyKAeZQQaREJ+x1zRGBWAoQJEyf/KhtPKbbxrLwgAGCb1kXfDPukdOfODRs3Lvx58bgJE4eP+C7jVqVImgFA20OoQKGP4JFM8iQmPRdgrBsYRn70L0/8572kB8hycnIO7tPrgO7dWrcqKiws2LVr95q1a2fPmffttz+sXhO7M/O/33m/Sm7un2+5XoHywOMtl1EnwLEfQRvXQGs/995963XXXLFp06b5C36eNHnqiG++j5zNJa1YWVxQWAgAz73wSsbtZDLSpMnTXnvj35f88QIA0EOeNm9FcMZ8bPa5LC2ElFJKKaX/CqWAe0oppbRXU8ifpzcZvgEwd24Gfz43N7dp08Y2ts9G9Umo3W7OZjAs8Yi9Rq3oHKdBdr0d8ucRQG+/ppRxE5Wwv0G4FiY/h48I+PDgx6fPiN339fC+h9x528316tVl36xGjeoHdN/vgO77Dzz9lD/fdk+kK1hWVnbr7fe+/85rYqs0BbTdmG1VU6SPCLVr1apdq2brVtjjgP3OOeeMn36afuNNdyTEsBQXrya/XX0z8nsJ5nbdt3PXrl1KS0sXLFg4Y+bsuBI0LVq8hOLUdKv4CDD4kXsRlftArn/+hZcnOGNXXn5xp04ddE+aNECe53meAvAo6wBwFlgDXJj3/Pz8avnVGmIDvxV2777fBeef9cFHnz748JBkzgF4Ccig3Eox9A4SGwCAGjVqjBj2ie+jj75f7lOMse/7/sOP/vWrYd/E3eKySy887dSTQVdKV8njqE6O3wROtK7IZcmvlp9fLQ8RWkNR9/27XXDeWR9+/PlDj2RVKQNc6fYBX4HnA3pKIfpuqgn2aXlQAiJu2rT5ltvuSUgvcOYZp95w3ZV51aqBwJTatW1z043X9unV8+Zb70nYRe3jT4deeskfWrVq6SmFvglSNWiDYrFGAPB9A6J9NvSr5I0lb7rx2vPOOZN+bEJe69atc8Lxxxx37FFPPfP82/9+L+63nw8dduopJ/fu1ZMwd0NKePsAFGVGCxpXXTkIsdz3Kdrc99HHwUOeTADcj+139LlnD9R97nki1RURQ5Kgc7YabIDZ+V31z59vv+f9/7zeWG7V6AN4BHsi52kFcPZQxWyezUBnbDnn7dwRibaTRrn/wcEJaHteXt6FfzjnwgvOrZ6fH/jqjIEDNm/e/K+X33jnPx9E4nrl5eV33/dw8+bNOnfu4MU8UWrXPYjtgpB+4GDnbPSDEQPSD55LSv8DAPGwV7id48CLqPN2bUMi7gi2SoCYEZRpphfblIXCOaO8i7O7UemCnYwTtFaIVGvCzsxO5mY5XAP2NjO4ANy3bN36p1vuTEDbGzVscM3Vl59w3DGe5/R138MO+eNF5y1Zsuypv/1j1Oixkb9dt279DTfd/vrLz9esWRj8joBbMU2TTgOoU6dW7dq12rZtdVDPAy754wX/fuf9wUOeiuMQdP439AHgxZdeW+M+c9CxQ/uePbrXr1+/Wl7V9Rs2zpo9d+KkKRk3sXz5lTeP63d0lSpVQMEnnw4NKJBq1fJ69ujeqWOHunXqIGLJ6tVTp01PUDKaysvL//rEM2+8+k8AAB98zxHQgF5AYylAXl6VRg0bNGxQ30d//25dzz574MRJU/508x0JDzPt2rVrzdp1DRrUmz9/wWtv/JvP169f78rLLznu2KPz86uBXChEHDN2wt+eeX7hosVxZa5es/a+Bwc/87fH9Bp8xEQgmUeCFLlvtQas+GNp6OYQDyWCYlUDLNY7duy45ba7N2zYGFfmpRf/YdAlF1WtWoW5q1un9hF9Dz2i72Ejvv3u/gcHRy43FheX3HLbPa/861nP8/SikcBPDSsmXsYHRBwy+EHkBDRkC513waBsbDydKSrCxvM8C/CDCYXQze95OY0aNUTAFs2bde3SZcCAE88796zrrr9l48ZNie2rRx0qZfB2PXEZ0xF4kUPRepgi3SHC3n384KNP34o3IQDg+OOOvvbqK5qEdkU66YTjbrz+6o8+/vz5F16OY/X1N99p3brozDNO9cFXoJSFoXXz0/oA2FkRAGrXqlWzZk1A7Nq1y+mn9h90yZIbb7ojeVv7VauK92nf9uefF7373kfyfJPGjQ7uc9A++7SrW6eOUmrN2nUzZs76YdSYrVszLML988VXBww4sV6dugAAPqAHrKXJUtcXyt1TU5g9pZRS+t+gNKVMSimltBcSho8dfx6tP69N2rmJIBoANGzYwLjB5M9zsLPdSk3GuRPqLsnzbJpYmWPGXmB+amACMGCBtvQV1cJ4WQ7ahfjFl8M//OizOP77n3z8kL88WLdeneAz1oiIftu2rZ995q8N6teP/O369Rse+csToV8hUCoJQB8g+AQwAvo+AmLXrvs+eP9dCW1bXFKif1zul7/2uvFa8/PzH7z/zpdeeOaG66667c83vvzisw8/eHfVqlUTytm4cZPtWfHULnBad6SsGIlkcTaJc9qYI1s2X+4s5vCTwggIcNqp/c8YOCDTPQXCh8w4A7YZWc7qkihSEB4tRq41U6D3b0VUQDv6IsBpp56cuVIkDRCqlFleiZCoID3217/9Eg8cX33VoFtvvj4vLw9C5QDiwX16XXPVoAQGfd//5LMvGN5zFuJ861FSlnlAwE8/+zKhwAvOP/vcc84QMd9OnZRSN/7f1cccfURCCa++/hZieIwGEiCQ7jLiza+OECYS2isQrSwLgBnsegnFNCKI6oBl83fQP4MfD/3KYYWXRtBWJQhOZWyRUAlSmuwHibZ/+PFnCSJRt26dvz895IrLLs7Pr2aLEeUVFhb+6fqrHxv8QPXqQThe07Zt22+57e5t27bLNODMFNiONyUK/gPIXPYtoWKO5Tmxb6o9DmHYUQB7uFOscmXFTTWjDob5CzIA7g0b1Lc8SajdSfvGj6XJV2eCdubiwPcgJmhTsmkLuRzOEiM6BBFx8GNPJtSiS5dOr7z83Ikn9FOeihSVoqIWTz7+yKUX/yGuhAULFj748GPhYcKJmVlM9J4rxg4y0mS4POus008/rX9CO/+yYiUirly56v0PPuaT3bp2efnFv7/28nPXXXP5uWeffuqpJ19y8QWPD3no3XdeNU+YJRb4zcjvffR37tz58mtv8XnPU+edc8anH77zxJBHLrv0ooGnn3LGwFOuuWrQv/759Cv/erZjx32Si53204wfx4wLt4ZtU9DqlPYUAam2Te/1OGD/u26/OflGxcXFvu8/8dQ/eM3sgO77/eetVwb0P7FatTypMbU0HNznoNdefu7QQ3onlDnyu1FfDx8ZxXxIHQFA1JDnrypOolDnjqT2xBdDHn8mwXK+8/abr7ry0ipVcyN1/tFHHT744fsCa0tMk6dMe+Ot/9C10rI0mehoixPzgAUnWUPu3eRKQqyNJy+hNyTDj6YI4UoAwr6dO95y0/UZbsktaiWNMtEDT6Z8DZkhnBbJR/Rx4aLFDz/6eFz5nufddssNDz1wd+PGDSN0CGBOTs6ZAwe89M9nWrZoHlfII4OfmDN3vpuOSY4LTnmnt0MANk0oAR62Kmr52F8epI2Lo2lVcYmP+NwLr/CTAXXr1rn1lhs+fP/NP99yw6kDTu7b95DDDjv49NP633v3bR+8+3r/k45PbtutW7e+/fZ7Iv+amK9dTcp9kVxgSimllNLeQyngnlJKKf0PkDWXGYoik1ZbXhn3uTLxleS+65OK3W8Br7vPsruJZuxHkcc9ytunH4IGOunBXtSRNiB41xbm1q3bnvrbP+KY33+/rnfdfrNSimE71/kB9LFRo4a333ZjXAkjvvlu5HejrLdkfVPixOKrCGB2oSS3wu91UI+DDjwgrvBVq0q0Af/ddz/OpdQB9959a79jjpTWfr9jjrzwgnMS+ignJwfA9aXoK7T+FLrfRJNzQQLkLVdz6HdcPLf1hRec43lJgTSOl0U4CBeEqCyg6kCjgioap6MYLhOPbWjwDDWKZMpXCpR5JNf0qF75ufD8s5MrBVoMqFK+TnLvG2HR+/b5vk5Qzk0lM7TilGk/JWwteNKJx1580fkSDnCgCAQEOOes0ymzczRNmfITXeuTq66FxRf9brqmtHTntJ9iUy40bFD/yssvDnrMjr+KiP4N111VPT7L/I+jxy1ZsgzBQOw0hjQfzhaHIneqZNTnqzOSFVSwr4FLhFsqoP1QvX4H/fPtdz/IXwj9Y+EzZlfyHXcm4TJbMoBbX5DQ0fr1G556+rk4nqtVqzZk8APd9+saBX04snp430PuuuOWuHKWLl3+92dfwHiSCsqpkazcntMPEmsHiil3QsWjggYxlLyCDhjDAsKvuLHtKkryYyUA0KhRA8GRnItFwiQxtXLge2CCVu6MzJMyANgJGrhkWzmnDqCMEiDhGTd+0sefDI1jvqioxVOPP9Kwfr1kUQGAq6689OyzTo8r54uvhg//ZmTUMGHp1ewRVGjUsc30jogXXXBegmJfs2bt9m3b3nv/4927DVLW75gjn33mr506dfAZhyNq1KDBQ/ffmcCwps+HDkPEr4aNWLWqWJ/Jy8t76P67rr/uylq1Cu1eCUSdO3V4/tknehywf3KxH374qVwRpPmLMlCThQJAdhTYi9h0Ofqowzslgvurikt+HD2Od63o1rXL40MeKiysERyj4i8vL2/wI/d17twxodhnn3uxbHcZYmAisOYBz0xyyFcIRXR/aAchSIbBvTHafpg+Y9a7738UUzZceME5pw04ia4P6HzzsU+fg84/98y4Ev7x/Etr1q4V+3ja3Qh0J+psM1onC+OOjL+M1c9k4wlTS0R507WO8CAe1+/Ili1jUWy6oe1JLo4rZRuaFSA3l4a/ff+RwU8kZGu54f+uOmPggIzTTVFRiycff7ROndqRhezevfvBhx4rKyujjg6YVFZfawUi3BFrv7ZpXXRcv6MS2qK4uGTRoiWjx5jndZo1a/rcM0/o56swRLVq1brrjpsv+kOS8Q8AH38ytLysnGTFly0JgvNgp/BRhQZPSimllNLvSCngnlJKKe1dJJxeOmNerGFLZqQ1Hpct+yW5WA6gkyHuYNF25UTR8YlgancJywsP3yPQwoIBAKivQefJXunEC+zrXy+/tpKc1QBVqZJ71x23eJ4XNmQDdNghfXod1DOuBf754qvlfrn1fdgnIPfVpJXWG7URl75xhvDgPr3iSt6+ffuGDRsRkR+VPf3U/ocfdgjfgnGYgaefYlD1KKpfvy7KACRAQJ1cRoCF2ThjFTa8jWiQv0p4hnFAoGmTxu3ats18TyS/iz0y45fRU8fZcJKJUUWv9nJlH9YwpymIVYkFHsWVAkCAJk2aJFfK+mBupYyjDLxRWAAVsvTMsy/EFV67dq0brrtK/ML1KwF0sZ6XM/DUpIDNefMXmGsBWDqQf4/gG6EGAFizes3OnbEZEk455cRqeXlcZWRQy6kTNmhYPznqc/g3I/VehrJNGAQBC75ZskJObZ9QPrjwAmMs9lsJvjhoC7hVsargv65/AG3tRV0QM7QEXwehn1vJBNuJTuDf3597cd269XFlXnbpRd267ZuIfpBSQjz2mCNPPeWkuKLefuf9OXPmI6NvyCtT4EpFFOzunPk1+kFF6gf722DZkcC7w5LDph225iO30aYtW9Zk2jG1YcOGIuzesq/sHM0cixVxiJygQZ7gXVNFhDwnluGiUFltqZCDUhERsay8fMjjf4vj3PPUPXfdWrt27SxF5YbrrmrXtk1caUMef2ZH6Q4WEkpuQ9YP6RJa2ATnHyIiNmvWuG18+QAwddqMz4Z+pY8P6L7fPXf9OTcnJ4zrEcG1V1/Wrdu+CQVOnjJtw/qNckHixuuvPvLIvpGNoOHnvLy8+++9o3btWgnFfj9qzMZN9NCbZUdCwCCMKf2PYwnsKsQhBydFo5eUrH7nnff1cfXq1e+685b8/HyeSGx7uPWoWrXqvXfdWqVKbF7WhQsXD/v6W3ciQDGvEL9E2Wq6DMSl2Kk5cnb2ER97/Om4DP6tWxddcfnF4bB2h3xExEv+eEGd2tHI77Zt215+9S1xsb27aQGzjkJ7r/s+MZxNRTM2ROgKztwTGDH6tFIH9z4oucxg/AE9PBfoY2fC0YMYEBG/HDZi3PiJcYUfdmifc885IysdAlDUsvkN110VV9T0GbP+895HdG/SZFaeWQ59anj9rS8fpkkeNct/Wfn2O+9pR6GgRo2//uWBli2bJ4oLXHHZpQf26J5QZnHJ6nETJoWkjhl29BP/as+Mm5RSSiml35JSwD2llFLaKyhsH7OZJbA0iPTnEaFk9erk8hs25AA68rNFPhkR4g42xl080e44+dLFh6g/iwYAmIze5gBAkcsMFK+GmzZt/s97saFGp592SssWzazxaSGaCKfqrDNOiytn5qzZo0aN9a3rA1ykfsjXJ0+e+gNBXNW+XZIPv7J41Zy582bOmg0AtWrWvGzQRfxzi/gC1K1Tp0t8XFj37t2QO1eQcWogJsal4mSRJyYE642BXRcBwp3btUuKs2bHH2yFTRnikhD36KDkWUSxCpiIkSebGMIKs/lsKiSOlNkqC7KoFIQqRRiHTjUUxBGMe0kO07gJkydMmBxX8B/OP7tWrVrEScCdNE2oW/GoRHR7y5atZmNVBEo3RHAzchcYDzluf0tNfQ892Ol1ieeAYBHxyCMOTShnzNgJKKFVwhds7XhNgPcwNa0deP+VpG9N632gEFBnmKURafzt30n/zJz9ww9jMj0zHp4HKldzEqZ4QV1VXJIQs9y6VdH5557hVtmRUiuuVIWrrxpUo0b0ow/l5eUvvvSag77xNCAbUjMvlAbCb6QflFCC4gaVSYiLPGZAtoio1eqSDLMzADRsUN9ywyH35oVWDOyzaBz7Tqi7M0EHIXhACEzQ9GMwCa9NSLuD4OpDH3H4iJEJOehPPvH4bvt2jhMVlhZumNzc3OuuuTyutJUrV73/wadSezjC6yMg4ZJ6FMtMFgCA6PvYvl3SSupNf75ry5atAFBQUHDXHTd7nhdmWqJzSqnLB12UUGB5eflTzzw3a/Zc/fGIww87pf8JINkWo5Dtgnp165x79hkJxe7atWvs2AnhNrADx9Ybefb2zeolVyLDNPf+B59MmjJNH190wTktmjezho8FgJ3W0dSqVcsB/WPX2ADg/Q8/QWciAHEAEioUWi9iOsiSyHaiFpdzllSBiIg4ZuyEqRTUH6bLB/2xSm5usPsCCh8QEWvUqH7SicfGlfPhR5+u37BRF+OKdEiT+rIxHMupcqTVW9Tsaj5Ya48YSn6WDkJmnhYQP2RpuH2N2jLxff/lV9+MKzk3N/fG668O2EKRmoTvcOIJx+4Xvwz2yqtvlpaWyn7nQ1rq1QY/76LOlUCt0NslGvyjfhzz+dBh+vi6a68oatlS9CuE/xBRKbjyikuSW3j06HG20XikY7hQIE5TSimllP4HKAXcU0oppb2cyJ8nr4pMZfoOYOfO0oStzDQVFhaADZ5zYAVy3t2oN5AufTSgLhx+edLJW6OD6agCbESCsXB9RMR33/9IO8BhysnJOfus04PeUjz17t0zIWrs408+d+EnCQVSvgu2zd0EkPVjEjRrKi5eM/TLr/Xx6af1r1mz0BZvIWgAwHYxXk3VqlWPP+6YhFtUnkI9zp+dJ43pEgy8IgJi/Xr1km7B7pcOJGen0QFX6S4qGO8uILZs6sFyauM9wZ52glZJrBUAx7obvzBjpVBUih4H55QG9A3DKDI+CtFHfOc/sTuD5eXlnXzS8RY0cpoi2CT16tVNXuwpKytj2JrTtCCDgIIKwxsSElWpUmWf9m0dP1y4/uxK6sOu+3ZJSNowc9acnTt3BQYaNVoACtkDOIvGFezCDaKyu0MqYgME7iJwn99X/3yUpH9YFizomdwc6IwrdM/wwEMrsW6HvPHWfxKe7j/vnDM8LycSO7AzkIOFYO3atQb0PzGuwOEjRs6dO99HHywbzJTAxQA1quzohOxg8Fj9oCL0g53s7IpyYuFWrwSb3TmyrWRbZ/XqtRmZLywslJUQALv9IE4rO83Gr3iHIXguQf8YzVNomm9WkkjK2/TTa6+/Hce256kLzj8bY+TENElIVPr0OahTpw5xZb72+ts7d+6OGl5mKvEBEHUuL59uIaZrwAb162ZscAA479wzGjZsQFhbCN0j2QSE/bp1bdOmVUJRXw//Vh9UqZJ79ZWXgpBnoewcLYqIJ57YLzc3NkgcACZMnMIjxY4Y4KZwlANn4woMsLi9JTStKi7RB7Vr1zr9tFOkxSJvE+pVAMQzE/dBmTR56s8LFxnmZVYc4MlAKjouNaFIeZ38SUBVCu3nNJ/N0PPGm/8OlWioVVHLIw4/LEr8ounoo4+IK2r79h1Dv/hKcED1jxgwsiIVngSTbDypR5VoXmRz13xKNnFFa5pacNi4XvPyfQ4NQRSRB3qlYeR3o+bOnR9X+LH9jmzerFmsGqHuFYMTEPCC886KK7C4ZPUHH34aWraTsufzZMbf0X4IiIgNGya1BlOXzh1POuFYoTFA8hhQKZ06dUjO7zRh4pQos8mxnUx3RNpOKaWUUkp7JaWAe0oppbQ3U8i3R8LSkE0wLFm9JmNBhYUFFpZkMEIJ5x5ARrgr69JHBs6Z3wT+qCBNSlj72pln98oalL7vf/hxbJ7rXgf2aNqkMZnxwMZxDEFOTk7vXgfGlfb9qDFrVq8x5nYw8Iq2sdIHDIbq+HfAatWqJTTvwkWLv/nmewCoUiV3wCknsjVM8KX5qJRq3LhRZAkX/uHcZk2bSDTItmNFwy45dJN/ST2uPHGRwVkIaAEX5iJvSjd+fsymiOJqiewBYSOAgEoBokKBhbP0yODTzLVUAKA8T0mQTCnwOE2CDGflm5imMGxqp1PzVplKkduGoHc/E5imkM3VJau/+350XLlHHnFo7dq1HF8skVq3bhX3VfXq+Xl5eVJP+ELeqM5GeTRq2CAODi5q2UJAP8i/s9Ir/MeCGtWbNGkSx1JpaenPPy8UDi43DpCnDAHohu8GQRw5mmiBMOJRDb6Ahhzq/4Z97tP/iv75YXSS/okRh4wtI0/boqi7gqATIiLu3LVrKAXohamgoEa/fkc64Eagv9yuYyzkpBOPiysTAD74+LMAG2aI6eIU2s5EBBPMzQpKBdslTA5KbfWDgoB+UAH9oKRqIp2UvdYVcB/pe4sRAQCsWZMZcK9ZWEBVELUBsLMxI+3OcrjhNcsJWv8hIq+jC3kjgJYnLR8RcebMWTNnzYlju2eP7kVFLZLkJFpU4KTjY+OCi0tWfzvye3dgibnIsOizbkLSVDxn5ecnK3YAgFo1a55x+gDW6g6r9pQF0o456oiMZQLAkUf0bda0CQNwEiUMt1C9OnV794pNQgUAs2bPcdqAm8LWFpBT26MVQgA7fSWbLkz9Tzq+Ro3qjqomE8heRJXR47aoVcv99+uaUOa3I39g7m0VeAaNmQIqTSHtx+qPTTtExGXLlo0eMz6ukBNO6Gf0Tiadr2vRsUP7OKMOAD77/CtEDD7cQ6zKJsAK1T+snaRVD0BrjfSloidMKfBA3lr3eLVqSduE2pGGvH8A6wo9Hn2gDY05cT+HKiRsZgMA/U86IWm6cXnlQXXoIX0a1I+Nmfjw489ET6EVWxYSO/OKAUrLVlVyqySkf2S66A/nAlmUwlKiVgn9HZuYGn7Bzwu3bttGwwvEO1fcSk5KKaWU0v8KpYB7SimltLdRDKoS9ZX+vDoLwL2gRgEAyAA6xc68E5IObMuzMy/L4Y+RTr4b5I4AjKFos5ZQT9Q+CCLi5CnTfvllRRzbRx3ZV3gpiOHGEbastkX79I4FvMrKykbJZzatnWx9NC6LvUp9YU5u0nzxyqtvbtq8GQB6Hdizno6bZp/VIVWzsGb45wNOOemKy/7I3pIMyKwcERop0g0wbqVk2V4gcFMZPBp1/zOIlByIR4CmRGsYfbLgJ6IFzpgLjrvMprIkfGZBKLDIw4tIXHkJofBllauUz9IBPmc2QDSwu9i2DxBx2PBvy8rK4ko+9ODeJFqRFbQdpeuZsJtZu7ZtlFJZyonneYcd0ifyq/AtCDFEepNuKrRo3izhRouXLpNoBw0wBFRGQBIYrvDyklBmAAzMKju4QQEqo44sQ9qz/p31zw8/jk3QPwGsoUKOtbjYuvtIiHaARo0as259bPb2ww49WEKWiUxY7AYB2rVrk5DNY9jX35SWlgroQ5MiZEyzrEz3ybEANKwzUXb6QShH+dsKL2yaitM796rARRAQYHUWgHtBYUFg3hX1AbFIYA84mD2yCnGTs/xJEHZH0teCvvxqRALbxxx9ZKgp4kiKCh51VN+Ep2QMTCmmZSE2rJU02z4hgVpTIfL244nUr99R+fnVGPWVYBnKXqXPB8bvmi7JhLtKAC7YClKP4oE9k4pduHBxaWkp61Ia2aQ5HFTPlu+7FcimNQDgyCP7ulUXzJu7Mexnb9b3sIMTyvx+1Bg7EKTiE1MrKVapvipMKHmy2s/KjtQ5Xw77JqGoY446IknnBxQ+IAAkZD+fN3/B0mXLGd4V6gEAAhOBc5OMlI2N59FiIxWLAKD4EUPUS9OmX6tWqZJ8R5JCroiPOpe73gQWQYxFh9atW5+wwtG0aePu3btlV3dnuvFyvCOP7Bt36fwFC3+aPtPpeNHywbGDOoe+mMkBE7Yo0NSsaZNevXqyqQQxQx7EqO+VuMDm+/68eQtcw4lHD3MOgUZi4amQwZBSSiml9LtRCrinlFJKezUhuznkltAfO4Owek2GDdmAUsrEU4Q/D+TAh8H0MMLO/NIZ+xUiINqQIcf7Qhw+4rsEtnr3OZBc7pg/xwFCQDxg//0SChwzdnzQ/ULh+wjHjz+DNHQzUd++hwQvFU4RKKiW74Sbdey4z0MP3H3vXbfmeDnmYrsCAuBEaFoUKpmcIM7AowfKCZm0ABV4gaJD3nYmYrwCkaVAL7EgACi9b6pB0+ytKIwzCgGLqhijRmJBSJw2Z6hmStyAeETyMrOuFD0Nz4Iha6oxH4knICKO/G5UXJGep3oGsBsLCILtIeBeUs2bNY0r7Yi+SenUw3TJJX/Iq1o1fL5+fKQYAAg8yoyKevXqJFy9YsVK6eQCQXnIWoCu1P6+rD9kJ+MO3CAD+/Sajm44fR9lhzYBRxZOGT5iZMJt9rj+GT1mXIT+Qal/DAnnOaOoCpVlMCbmLuJeiPh1cq179aTfSxJPRFlFRAOc6KCDesQVu3Hjph9+GK15UKBAIVLfiF2VEcCsx9B1EBjMsZSNflBJ+kEU5H7mtToL6tJHniCYfadFEBDWrM02pYwFwkEoMoG9h0PyQczI8pjJ4ZabAhToJz9oVAjQxoqM7/vJA6SPFpUwZRKVevXqduoUu53J2HET1q5dFxDbIEyJBhzj+dmn6Tob3X70UX1B1jsMlqHsTGzXpnWN6tFbFDDVrFmzW7cuCQCc8xEBEDrHNwIAlJWVLVm63JlaAAgvjamn0yBWAydTUVHLfdq35QKC5C5cicpgz8QFg5kzZ69bt17yz9ghz6LuhKArlplhcXF4yEnt56o/QEQcPjxWpNu1bdO0SeMknR9S+ICQHObPibmpBRBJ4yHKwWGsZTne4ygbG8/z+CKwii+y+QJKLJaQLxTxB6ixd5pXfQQOgDd9/c2335udZqKo10E9qebBKkbqEEkHHRg73QDAl8NGOGPHOQYA4D1zSR6FD5BFcxze91DP80j+spLali2a16ubZDst0cEKjs6jfzS5M2Wn6lJKKaWU/suUAu4ppZTS/woFPBSy/hG2botOQCypoKAGAFnnYE1zfg3789brT2YLHZBdnNZ2oy7EuogSmgSA0WPHxZXcYZ92devUCXk5MX8EV9WrX5c3oAvThAmTy8vLHXPW+uimPV2siT9kZdr2OGB/PraoiGl2pUC1bNn8rDNOu+SPF9xz15/ffee1t19/8cQT+oEC5QnMGFyYnv0rgowyMMGwje3WIIIjUSedZ4azzVh0CYQXlKn27EzKj8qgOixtyNg6WF7khwxuJuOsJKBKSrJHrLP8BkTYHGnGKl4p3+RpZ4+NXlzatHnLT9NnxpXZqWPH2rWCeV14xcFC7SLCvWbNiKciAKBli+bnnD0QuCeBhSO2Gdu1af3gA3dVCcWyVdcRzeLntohwKyHUqV077hYAoHeKI0jMIqjkN+pRpizwAsBPI2SBtoNlVSYasXADKJM6SPHzFYHRzjR6bGzk3W+ifyZWVP84xM0lDsIXWN+cCxcACJb7/vgJkxKa9sCeB8hSLYoTAECUvIB+26N7QsljzCaQNIIQlULzoiXDdKpentODAPeUfmCFTIuYYMcY/94cJN4HAAItjzw9y3Pm5Nat25KLql49X0ZTKueVF1+DU3GWE3QM/k6IId1KBaZnRAScO29BQsK69u3aNtCbsaMrL/GiYgmxp5grA1ReXj6al8aFwUD/IQTR2tWqbMCyevXqdurUIYTwKefA5TknJ6dDh/bJxe7XrUtuTm4CABeeu9u3b5OXl5TKY1VxsaidstigvguCyMQkADgHmctsunTfv2vgQrvU5QpYoALt2raumwggTps+IzBJinkzyFyWqGUkCRmBoPazOgd+WbFywc8L4wrp0WN/i6wTpJxJ52O79kmbrEyYNEUPNjvE6J8yIQhK4+yi8pnaQSgqj1faAKzSI0jeToqiJ0M6IyvgVjdnIP6AWdUB4kGLCBARx46fmFBszx7dI6ebgBqJVCU9undLeE5xzJjx1PeBltes6qerApUnucxCFA888AC+KrNZri9TqnPnpDW2latKXGuANFrIQsCsOi2llFJK6b9PKeCeUkop7UUUQk8CqGfoegAA3LVzV8aSq1QJhbUKzFV/zlQGQ+rhP3sNGreQkV6ugLB4jd8FS5ctX748Np9D504dY30dpsAZBEDYZ592cWVu3rJl8dKl7BcAJzRwSg3cQ2d1z0ytWxc1YKzNekTUZEopBd327XzrLddfe/Vlpw04uX3b1rpBzcP1FKfoKaVMyHkQstDoeEbjnlEn5Xkyjh3Aorkeh35aB0xIAx2i+zGaGDZVJpCd2gupUAUK5YIBQ8xiGSFjpcxVnufZ0GYjlMrzPFM3llOwGF2g8Kw8FTHsfBFjZD8h6J3DAtDppMlTE/LJdBa7BQrAjBxlE6ArD1WNqFzz+3bp9NyzTxQWFlif2gGK5KvTsSccd8xbr7942CF9ZKqB/GrVEqA7B0JCQMDqNZKCPTdu3GjxYAvhcYw7GPxd2Q9gtUZApUQRL0sAiABmUErpTTdBA/GKU9gwuojkzSLif0P/bN6yaInUP1JwIks0rZhMId+bgfcAiAqAOHPm7IRNtouKWkgEjUePEDIefCEEBLFLIpowdtwE3zf7pjJ7GnMHhQp4hYR2wVWgV2tprkpqCCXkIqwfnCUsgcPb4RdXrAgSFxUN4k2EjRBaBzTtAezalWGCrqofOlGB1hQs2C+ccS3YtpNM8gQNoGiPYbsiTOMCZccoUOMSkbIuXTqa+lsGM4iKZKVz/L6pADB+/CSJ3UmYUo9ui3javvCzQw6h+37dPLfLre4U84WrQ6FJk9hU3ZpaFbUMFphICJibm9skPgM4AKxaVUzwruwcBCT9iQDu4mUlyATai/mDmkBAncDmjCWlVKcOSftATp8+izkHkjBSaQyGBvqxYhUR9UZ7gm1OVwVOmDg5oahOHfdxFHCCwhfMtmzeoqBGjbgyZ82eC4z3m2d6QAFPh/ojmFdhIyVTcGXRnDRfefIKL3pODS3gJd/QzlTmM6KPJrseUoY9nta4xrt27Z40aWpCufvu2zm6ZkEdEqEfq1ev3q5t7GrHsuW/LFq8hNWa5cwZK7Yv7dksVn5ycnL27dI5wI+jRkSjyw5t1jT2gUUAKC4uIdvA8ZbE+IgUypRSSimlvZdSwD2llFLa6yjScQpiwsIjyOjPA0Bursjj6bjpwlcWqJx7ocGyCJsI/zFJC5lgLzLV2enRpSDixERDfJ992llfzA3ZCtuc8rIEExwAZs2aS46riIcyKFzQ55AmeEbqvl83ai5dRYY1BHoaIgMfC8SVwRDlUSEMDWWHRjLCJDwyLtkWFfBgXPgmshWiiZvQ+GNBXwARhS9vYQwGfixOk1Qvil+1lbDN6lHF9UoCw0kOVuAcICZ3qmbcZyfTrZQLA1mPDtGfMXN2QrFt27a2oDNHpSn5KiTFU0qpfEplUFBQ0LlTh4GnnfL0k3956/UXi1q2sAImGhJY9gB0HtcAdezQ/u9PD/nq8/eHDH7gqisuOe/cMzt36WRbx4Fa3J6hZYf8vKSN+LZv3yEAPGo4XoaRLan4powVZCPhzBnBDQygCrlWoAjE0KigwTtYGU2aPC3hLr+R/pk5a44RFoIAJFQRoOxBNCmnrHUFPGfV7+QpSbXu1JFgUNEjKihktM7BEkw/L6xZWFTUIq7wktVrfl64GIRsmN5Qmj+ll+UISAIgbNiFQKMpUT+QwrP4VBAUYe2XCXiSJHF1PkFIsDmAnTt3JpcigjSzuXcUdKbsGIqfoEFeBsqw7yBlQswRccrU6Ql8dOywD3OjmI14UQn0YMdkwH3iZBf/t8tHwEsbQeDJgoEJJQNAB7skpmwF5OxnFZ+tX8MGDZKLDUt+EIBzoTd93LBhUrEbN23WowABhMYAAIsTxgJwjmgmkbv4QQAuLU7xgBR9bSlhfREA5s5b4Ix3YCnDeP6zJVKPIRkIaFix5DhpcpLN2WGf9lkqfBA6X3nQvn3s3hVr165buXIl2BYAQt0R0BhCXHpIRqIpzsbTYQdy/vbYerRdSmUEKJsesFrNWNBAE44YoCibf/bceZu3bIkrr2HDBo2E/NPEDaQypA6hSgkNjQAdOyY9dzJh4mS280krW9FzBlMF16taNG+Wl1cV7PwhTBIAq2hDAz95vG/atEmOFztGYiyElFJKKaW9nzJsiJFSSiml9F8hiVMBSHee3U3rXJZm8ucBoEpulQCQFTS32WyMMvazwyA4TsQa4GSHk6ts7HXjAM2ZMy+huKKWLaw5rPQNMNIXCcSjNG7cMKHYxUuWaL4UKPAATVgl8S4Rqwqat/t26UTuAWHbEvFh3IfxD10zhr1NWC6Yh4+1k81evwIsVwCoMnWGEjY+CDfLQi7kfyEAeAC+uLlSukFkk2Z3R/K86GIEZLSXqohK104BoL4XO/IijXPyjaR/GWhHqrTwWJXpRnMzZJwpWzKVAuMoK1SoFKBSgKhbi+TEOJqQWapFowShy6i3Lp07fv/N0GrV8vLz84FubCAstA2gi/WoK/Rps7ylRZ341NSwYYN+/Y5yFguUEruaYriljFQg5CTuN7t7d5nRAkohObi6hlqi9QqMHHfmpspcmQXi4EJB5qRSJsZdAQJ6FAMqsGcA+z77v6J/Fi3R7rRCwyYitwyiHR30RQayt2Y0waIfFhohJx5g3vwFCcW1blVE1eVGdtZgmJQZF7rXrLC0blW0dOnyuPJnzZnbvl0bXbpCT+/yoHj0m9zGuilYfYFytHQshfWDrYvUDy4qHSwjWwovj0Sexp2ZHkGL3q7QQTdZy5kPWQgGgJjC3KnMAtYMQiGNUjs8EOfOm59QeOvWRQ67ZnJz+DXfoVlMkVNLo4YNatWquWnT5sjC161b/8svK5o1b44kYbpURDMyQjCrNZIyUvv2bVlYmOngwiIPQzDPYCSkitLUqlWRLYWLF+VqETZtQDVokFjsls1bjLogPk1T6HwkpDr0jSqFWkOV3NxmvE0IYZx2uBD/CCDmPdsDLVrE7ukNAIsWL0FEzakxuvQoNxlWosW4ovUwnW+7DBRBrEqg7YA4Z06sSOfl5TVr2kTqfNPUWej8Ro2SUNSFi5c2bdoElDGvuAiztbexvwz/aFOLx1Kcjae/8njxXp+h3XQAABR6oHwM8p95xgWaoTS7xLf+sZkKfFLlYsaZOzdpumnTuhUVQsaxeHU4pOnGET5wHisJ05w581k1kLlGvUAPiPDyqKhoZmrVqqUdILzUSGeYa0XOBpeabB5s3rwFUVfWNCRZZiQgGJ6zok+mlFJKKe0llEa4p5RSSv99igd20ZppHJQhLUREQNi1K3Y/IqbcKjbCPWSYBU21wOeKW3LMNiJaR42+s+EbCck0AaBFi2Y21CjYDPJmGPjcoH6SB7tixSrjtZtfkzvpxJJUxgQvatXS+kEWDzZAt6dC5Kmo06CUUh54OrcMmfIAoDzpRiWSE/1Erxx7Y10085XnMcIL/FqhbpdQLrs3+h2FYxYoVYm/bCoWjOoC2cjAwHXAXVM2yLtiohyulEGGAXyJUpE866OFixYnlNmsaRNbHUbauY90l3ueftWfcnNz69SpnV+9uhQX3Y+UXYcEx21RagUDJ1HnW7jRuRREKwnYKNwoCJCTk2Q+7d69m8e4cgaoHmwmGYKFyPRqhpWEhLJly1FF+MDgWXSJvInM10pLI/8d/bNyFXEBGFI7FdI/oXnD0bqmGAu7G8U7d14SAlLUUkbpCiTSSIuAqbkHXETeLSFI8+YuoG4h6JUT/xBUwzgUiQR9yEQJ+kHUIahoxOfgPbJStjHdw/B7xgnaTUOsIg/5c3iF4P+x920/miTZXb+Tdb90V/Wlem4942XGMvJ/gIyQ4AUE8iOShcwDvPECfwGWJbx+WfDKWoF4RraFJT9ZMg/GAgkkFoQtECu89vbM7Oz01lT11VOXru6uqq++w0PEuURkZmR+dZmuxvHTTHV+eYnriRNxfudk5PgJ2q80ODutbiqRk0ePHj99Wvrc67c++sjyJxmTplgSUTFBcrUqk2U//LMfkdesUk4R7GydISmPaI0P7r/v2GSyI6clE4cNAaC1/m1DYrIfvO/ThI4OTc8GlOUfv6/TgxdHL02HqcbQr5HLebj8YAT0KMn48MP7C/Pzrr/Uu6PzTDpLScohsw/vf1BI/OnTZ3v7BxLyLPJlmtlF8UJ+zwLnZunxNYoAMXB0dPTlw4f97fBBM9fMrPN5WOdvb3+lRQsCzF59crL0upQ1nvR9GJDhXclE8Z2Hn42fQzWrhEOdxGGvRHt0b0+nDDwo+neDBtAViNMVXdMNUTp+QEM65M9/9MA5HWPPsjirYiXCvOMaZIwM/szPfKRjG1IY+AGjoz8d9eXxfnT0EtrEydhgXXxya+1UUVFRcZ1RCfeKiorrDiFnwo+O62P2cC98WSiBrXxHcZQ9AXRALKkxHWbBCBU3mZw9+PSzvpRXVlY2NzfVpC7bP5YlA8DdAcJ9Jxo8kLDXpMwuoVkwNzf3rY8+VOrTTG0yHtXQEDUZJy/mEjUUqfYGwhw1wo2OohNIDTDHSMqVxtHbRD65pMftxyjLzPok3B8JNJcwebvEF0wMq0FGzVM6CTmgf8RU7eGdxfocD8+4Axz2CDYqUwXI4kSff/31s2fP+9JbXFwMwmnMsnEZiXS4H03wy3R7Z0RsYiM0bZYrH8vCKbnm9rYhvAXZ11gDo0PbA0KESBQ9PAMOsuZUxQPSFz36oVYtyxCD0FpKu0dNQxIAGuPJlRqYTCafvgn9s729481poQBcywzpn8zGzlhUdgV2LFTsgaOjo4cPtwuJvx8cQm6gqbZQgkfO6xBOVNP7zqXUxqeffQ7W2HhzyQKQb6UyGUHriYvz6wfArqkmSPXDkMgPI+0Fd2pwS5k5v+FbqxBaNKSjYpxmbpWShcZhTZyIjApVcXlQdEdtbmxsbOrHnBNp6RMVlRXloN57791CFg8+/Vyo9kBBEUztQl6QYXsTAtafhWSXlha3trYcm6zTT8Yse31CBCwutT6E49AQra2sOBVKom4dQ9hi30Cyg38PovOym4Aj+f6B6e/YGsmkP4APPngvGRDSZb4BEm2gokhA6kLuxMOHP+3WeCy6SsXyouRhqk5U68mU9KMHn0+nvXnc29qCtXWi85M8MrYdAAYI951uJ6vRp5bv4NwXUFzjafekV+JV03uyHhqjSZKlkDUrPP3rF/lCu/Onn/24kOz7ogGszFqglg6xk/IEgPfeL+mQz3/8k9evXzPbrEjWBWyNLS0gw2ewPfDRh/f96LZCEvmhlOg7gEDljySH8e4HQ2uFYC75yrZXVFS8FaiEe0VFxduGNrU9ZtU1tKQ2Tk5N165H+gg/of2g/B8J5QU2w4odvtrdff26l4m4d++urTr7OS9/Ss9sbd0p1PTxk6eAmmYWKqYZSVvMtpa9f//9xaXFaAp0UekRTUNNpE8j7d4kF8N5oFGzw4wnxCD3IZD+tYfVDDB7TG5WW6dR5rYzwQE4W9U9mVhH4oQQzldsKF/WUrUSTsQZNY4WEbunkUorHZENgrYxOq5SSYCXk+1wtN3/EU4AW1t39QO5WgI5cuMoSoH/66VEzsgbEMibBBT3lskHcUeNvZAZL9bTFjJMBscGq0GoJJFajNETw+HI8baO8i9CiSxjfQDIFyPCOY5NbNHeYrPG2MednTejf548eWqMk1ItXv9kKY6AEUvxQbZ+cj5FZt7e3plOS1sWuB11PR/jR5jx2hmRGp4pV//hT7c1IpLjq/aBmiHEjzqYEBAQeHmwu9CHUfpB69OhAFo/R+k9j04ybnC4dNTMWHZPLnU9S/64NDknB1K7SN2w9oKRltvbO4Uyv/POPSuXSgqUJqNuUUnrU95NJbrGlaW1UPe06VLKbBB3bt+ea3z7pkWEzSFenkADTNna+ho1SSKWgueuyQQrFH2pSLjH7287do3BSHbVsBGeTKHhaMTi8M6dO7BJOZlPkqFCnvG0wbN5a6PcMo+HNV574TBcbJl523eqU8am5iA+Xz7s3eoKwNbWHe7R+c5LlQ/wcOluUek9ffYc8sKVbp4VpyPfZ7Htx6y3xq3xbH2hOfSkPVrVuQnPGHdxY7tFvhxvb5dWRHFDcyL/f9RVcNON11nQ0QoA79wr7dBydna2/dWu7gkovgII2y6+u/B3lvbY3NywtaXXGInS1bEE1eXLi6XBMjmbON9Ma7wYugdIpeArKiquISrhXlFR8fagZ8G1sDAcvT45Hd52ZhBjCIjMKPZsl0S5Rnt+d+dRIZ3NjQ0fm9TJebWJjHBmfX29kPL+/n5OOSnzoEtuI2NIK1LGh/fvq3EgFnpKdFCMVpZg5aahprF9ZRpnaJAzNBw3q9xWGS4Z95TjDqDpqA0db8gSJ+r45GYbrW7wO7NGJoBZNtdOOQHleeXEUNXMylQiXa64utjZ0LA+cRK7drBe3qQXUgoAwqvV8Zy3MPnRoyeFBG/fvqVV0J5tQ4PZ46YyjZ63YHczOVXMjGj0ZjcA3VSno8p5lydXpB1gI1CbY6jtgPx7AxTOyx6slrX2m3buYN/YI2aPE+Lb+bLdqREutp8Mi3Nkd/fN6J+9tv6xR3vt5XF2tOulNovKzMBOsdarq6sbmzfdEFP6o0NQE+rNDewyi/rs2fOjly+VqQnFIy21jqnkISEvBjGrftDRE25Jz3dl0Nc9/tBYu3C+e4t2h0iqpkVoD4LZ+f8+KPcE0Wmpb4YZzGVRuXfvbiiTG7ZOUmz6gxMVqYZMP+Vd0Xd2HzlfvZY7CAz7L5xLyjboC9jc3IAjwvMierkWeQpqdXGx1I9ra2tWMZE3ckPD2DdtOABDyZ6dnRkDHENy5aWd+DHomKFy8i2VPiA3d+/clhUAycBxvWmMu60XtKKhtco+tmfPngk1m/osc413Tq7QXLqWoI5CF+QO7D4qifTGzZtsBc05d2Rse3pmbW21kPL+/kHypK0zkTQlAC9DBYxa46kG1+FojysnPyqEowXRHDxl5ikQp8opM09lvcTMB4cvvt7bK6RjGsAVyZdX1Yhbpcr6BgSi5eWlzc2NQhZf7exK8djJBbzvwPTGqNYHgNWVZSm2TYFk+tCt/GFsPGjgRZnJ5Aw2WLzE+XmxPVIqz15RUXF9UQn3ioqKtx7lV5IDTsWkLy4lL2LQc+tYmHXlfdwVMO8+elxI7ubNG3GRDDF6WvZPqwTxQtPQyspKX8rTKe8F+6eDMQM80+Gt0CHcuXPLFt8pJ6XBye0dQWSbbg1btr9xDd+oaaUWx0BppLgZFQJANpQhAE0Ix4OFQudEgKecRjRA/4o/2jZpcsa2CiUxaPiR1sWqJoy6sBmNlL1NO/iUxLQbWSml1+2kWvN2mhl4/KREuN+8cSOWTsmKRF68JDTuREMJ+Y5UTNS0UwpaTdfeVh0pS2lbGPEzwr5z7LYY5+w7Je2BhGnEiL5RViFmJkwTy2UGQCGgMHwsTTwkYVt53tl9U/pnure/X9A/s6BX6xpNGeQ03sI7u7uF5G7f3gRUekRMZXA6NkH0RUK1R5G+tblZLvRX+aY60EEUOi0kFHf6J6fPylLRox+U5SSTF6+AulIaPS68I6SvOwcn6NMrdocXvDUSt+sobfHNlD1SGxtKcpkqE2qJTFQcG5h1DYCNjZudiQdsb+/oEIxjm4HosYMQaCIdBW9VitXVVUrcREqGeU1spz3tXkx2RRi3WEnz8CgrStpEUNksl1apQdF07kr6M3vQjcoBhFEvbSJcoc4f9ltmK2izxOJv3Cz149Onz3X6NIXk1oOXAvEUAV6ezbPHYH5U1Pk3btwAayh+62WKIlaWlwtX9/b2pWgk5ZOeZ9O00N3cxy2FhtZ4un+gdl0D+QWItLpEyyhoEe+g8B28s1N6SwbA5q1Np6thnh3AxosekgydtLi3b90qZLGzs2u9CvXvBpWhNQtdoqOGB5tjdW1NBoepQJuAbMjYfDqiY83DmJw0FX4JDqqKioqKbxiVcK+oqLi2GLWcYqD8Pm+AxdCdF+M5iBRuFa7h7cwctlboR2SsnOUzaP/41ezKSsn+eXl0lD4IFlNTiUBblCf/9uLW5qaPczFONKPU05hlY1R1oW7L9kiKh9+NnB7uBjHnnckstG5aF99iSfST0QTjKp/ln5TRU13G0ZnFPpoX8EmHz7xKHZxRAwIal4GrqjPdzlEpeyU5Y0o1dAoA897efiGNSLhLeXynq8A01CEwuV8m0O7Jtu4gko1UrEF8m83ErkNIcrFG0yvDDwvHERIhkD4VqXEPk71RRmkil+Q6W4dvEkKIEBcqxG74RBqePH1j+ufoxcvszHjTeRyraES2PcbMwPNnf1F4zBFnIp02fhPPkGdDTJpDIkUWFcCzv/haogxJSThlP5SIIs+AjJRdL+u9+sEUUPponsaFERt/mHC/8Ow8BhlVk4i1TtDujufPx4mKtqSqM8CLivJlNqsKQVUWla/39k5Ojpnk48fmEYgHWuggTZZ4sQPjCwdecHXKdvImMi8T1ZC/Z35ONuK3J3XydRKXsW86AfajW/PEAeOEtXOypsHkcWP9hroUPFfou1IaRAdPkuwNnde6cHBwqDHmHUG7Nn3ODJtSJPlEnt1LleHwybPSR4BXV1c0hTidaymHyrdcVvgvj2ZQKiNmwPFrvCZTdKb/ZlZ5rCMteaVAr6ZzE4OZnz3/upzmxsbNxGsApy6y6caWj7kEltXI8+fPkcqeCx2Ia4MWhvtgbXU13GjFhU2TMnx04GiCwy3tGXd1ElR2vaKi4u1FJdwrKireeiwMvbEOYHIaTfpZl23nIx9yq9jnLbbM/n6JmlxeXnJvVHK6Bu2thK5qywFHpyenfYxfx8lkg5Re3Lq1KRaP2Ayp5aBEajPXEPzu7ZFYlWU6iBpqoJt9k732q1bxYHGUX2pVVOmEmErTYV2cm3LqZgNTpiWhwc0MGayWWokJeW5PkhGwjiHMnj5vpTRyTk+mcihxxHtFqQ4mvW8Os5DNtkRrl3YVkq4fjixyPpkYHewjhzur1u6w7tElg2+0AslvFJMznu+waEn/DIGsw91/SqLa9sae5ieIYmIG8/7+QSGHK9U/J6cnY/RPzK6nydun21xki0Xlg8PDQsHWb8hmONq23iGUFdjxIXIGABYWFlZXyxss7CfsW3wyOGY6q0vQ2M9+zKIf5BGvHy6GwsAYJNx1dv5moNyn/mR710D3fOODg5Ko3LixbjwZ0pGYiYpxZLkj9EZx8yUAe/sHyuR5F5I1dhjVnswa4srmFuYTDs9ocWEsPVMGK/CgiAjTFsuiHJzx7sInQiepoTQFojajDlWFHscL+XaYhd0DsLq26lYWxhVaVxppaOPJK95yPx6F+Ab/Mpj3ZNoJqer4SSaFY8k5Ox9Ep6zzl5YWbSAkf3uhDb1cjHo5OT7NSe1umcrVbBGlNR5R0zSafrrqsvsuBH1jgRNlkrz2d1Bs8Pn5+bgVj002UC2RTTe2tG79N7CH5MGhTI2Uaj6y2b3VN4ONs7Ky7DSaTIhCrbsKOU1Do1KGSWzH+YqKioq3DsMbH1dUVFRcc5Q/uhVwKS+t96GPEbIANKQbuDMYODh8UUjzhz/889/47r/2dqM3GgZXrS9eHBWunk5OAYAaS5S6F7NhGc08bBrfvnXLmdEO4Wcj5nxDBEKjnHfIOCTegOPnnShsdE3y9ryWp6ecrTLHg2gGuJ3YY65miGn3EYipAaYExBK4wg1Uv8tO7OC4u4vfqmYpH5j5lWWjnyN1aRE14CkTE4MJRGJwjaNQkNli0WgjBsik210+LEr1ysqy9YwJhyfO8xNi/qmpRiAmK75WhciiPAlgIuIpj2laz3W4F//x+vj44ODwxYsXL1++evXq9ctXr169evXy1avXr17/nx/838Gm08Il2RPC2/T+DXtiYnJ6ZBTnQD09KC4lwLlK2GIgKfbZYZF6vlr9EwhWGmV8lxkYt1uMnUtaXCiR8F+ZRV1dyR1CUk7nypFUvWARwviKl1ZXll++zKP4FQeBAZHRSLHERGTUqTR3vE5jY2A7SKhU27UfuCDv5DLuKeJScdNeACenJ/Eop34uhPbAl29NWG72x/tmmAGUPeLyDkdUZeqZkXHpRKXLYx2mlnJcMID9vf1797aCsLlhJ16a4J+hOGXqxFlO08a0o/CkwBREOYhz+FwvjXK4S8JDybJ4QWW0jFACcbaJh1akMII4DD7fOjK6xg2btdVVgjCDqafN+pGk+HBZxX7gpeWShB8eHcUOyspvNZJj7hDaGaDaRMoqG3REJ+thUfv94R/95x/84E+9olchHuyk169fF67KglOFwdXR1lh+4TK03IITN3Sv8eynS5iAhmja0cgz6h3p0PhL/+hvZgbK/l3d+J66/oPTIpzlaAsLxpB7++DgMDyMdMUUC0xMTFNY4sxTAqaDy+yE/k/CHlw7MMXpKxSYySrXDz8LMDsVkRT98iaKioqKiqtFJdwrKiquLfot+PSmldXe/YIVZQJIcKFVXEL9JKY8vLEYLw8ZP599/sVnn39x7sKUcTo5g1AFdlbJ2FENn2NpeSmLBiX9TUSQcGVE08ivzdlRTwSaBjuZGuZpeDrSCoRAww8UxVOOWs0WiyasbEJPCyfpQwiTO0rZdhXMuK4sDRKOilLydahqUqOMr5Q6C9vjo67ivXyeSnUh3ZoBRmgC/OrVq8KTS0tLsR+T8qrYBMO5EXZTxcjZ6r4brYcj1ySWKXsOSg1LCT1jJZ1jbZgBfPGTh3/6wz978OCzL7/86e6jxzu7jwqc6XAbiXOCSRlVX2KOrA23Hhs5/FSupGESezxyGuQDFmOdhXw5OCi5Rq5U/4QNvlr6B+dWv+49BmGYMm+Q9HLZzbC8lDiEhIJzsqpahZnlnKj4qD9JN+TpQWBAoG6r0A56QpRQIsJagDLG6QdH6cjlK2EvYk2Wi3wQgJcvX52eTjJenkdxseeDzdAJUyY0GQM8nZZf1llZWfY+L+PIkIoKs81fgESTRsK1zJQB2D84DD5oo8OMrOSgRFjfaHEcXBnqIkAsp4SiyuU4IzMQv/8Aq+pAsvpDdJMTOtl/npR9G0nnj1iZmdqk+EQ8HpSi1ZUVaQC4tqGOIU/Siyy9yMBQfHeYR1gScSWKfZsQoOeF0/+iV2zBGQ/3igHXf/zH/+siBSggvFKp3UBogtgGd4nVW48HZWKWNR6S9U46vRKday2khDexvDomno3krsMX5fiDFSR1tQUzZP0cL3DUI3qjKRLC8nJJ/A4ODtT/EuazqDFklRA8QJx2xbi5OGfd3SRFiANE/FOhgfKZpx+9nWLjMLv9amaxioqKiouiEu4VFRVvPe7cLn0yKGD/oGRpFFBYxg0G0OX2fDwX/3tZpCavFn7FKvRM/NXoUl7NlDQiqQdLi4ueG/W0ewfUnJAFP2KGatWqiRHYUjPWx0GoBDPJzIC2m+JdRMA0xiGOjiXtzraw5Cdy3EhfkYuJ95xULoQ67iOA0DCmQ6kX8nUJ9rEDEpv3+vVxIaWFhXlXPuPVQdpBIjip30bvdiXQQHcltYTHiVIUorQiN2IDT2kI5rPp9E/+5H//xz/6T9//7/9zp/iNxPMgjqOwCXO0yjN+ifR8zgSUEX0LjRF8BILGjwnpTOJTMqnWNii7Rq4WBf0zNAra1navUuDQ7d4/xCcnpVedlpYWMxZVy5RQh7FZY9YkuSkJV/6syPHxsbFv5Bk35eGzirBQLEWcSz/0P9mXR1IMMuonZTbJ7hw5Qd/buht/RO/IJdIn3D52TprsXgbjdDKZFoM84z45nuXLnM1yUgY/y0/zzZSJWgDHJyd6LC4Ccoytsb4mhGPaTUgyV+KUwRTHtnB8I1YAMVk/xbuGUHKVSL0GhcmwF23CGh2JaJvY+OzH3Pyc3BUnG/0vH/KiaxI/B7BQfMky7pgUeO9MwV2IY4/LUzdUOrhIFtGbTM7elM6f8lRne21AkAVAEzfAdMbV12xrPIAY03PJnKFHK7E/VAc3wCdu/LaxtLRos6C5fKTAnbKnbrx4HuCBr1idpDqEoe9iSdZeJTKPHDXiiJYuaDmogOhPiz62mNUsjZ+9RsCgng6oqKiouM6ohHtFRcXbA8p/hbXb3bt3u+5OcHj4gr0N1sKlLuTYMnEbr8azEmUbX7N9E7CFcSQ6pbBxVRze0E4iLAcbZ3FxMUaEeu7URS4n50I+0f6KxZlOlZrgcJOat0TsCnIRIzUUpqFifYgybn+MaIwWn0iyRqYtfBoxCV8q55FFdbkya+pqxbW5yIQ0GFNWBzN/3EvrCRhlC3NuXlYd5nUxvliJGk+8p7YnJUV3Ww9JAUEUBUmCnAk8hY3BGN5+fHL6+7//B7/zu7/3xRdfjmiHc8OTIa7c7fvUseRjWGdEaCd5B0QZDUc4yz8EeoP6B1m3Kxt8IRUsWrc/bBlD3+cM1FvOogJtJkfifoVXVgYEANGcfkCyC3F/syQkVYvsvQNO2Y1TewX9YLek9Eh++cJRgjEDFu6XcffuncGnDoxwT6ZiDrOBeBwuO4ZR5+W8cQf3oAtd7Pky0b9K8sk1TZ2yiN4BOQEwOT0l3Q7Ccc16ktOiE1IyrQciAvKMY8qEbosbycncb1xfMVn/g3ScuzNIkuVZXmLojGst3Q8kq5tezM/P28ssANojJPEWaOphBygGMNeUvog2mUzay0vXb9nXfEfBPey0iHaVaXrZS4z5SrdVHIIXsA53UfIzyN75R3p4h3JAWKghniJsGxgyHswwY5MhQpD0AESpMDNwWvTvyneGdVDH4rvsJGuGd4DJrB5bLk5bPTg9nYCZw5b2zpGZpuGPCNSxuGtBVvRemaQNFHd7IulZ7puVMuTDJZhMfQ92R7xXVFRUXBtUwr2iouK6o2Wl5tfv3Rsm3Mtb93oqjEcYlmPA+WKWdVuDcGIyObuEbM6L8GFSgu2Gqq83uw/5RYqbeJiIWVpcjESVkPjB6FGmXZlTiaUjXdgHbj2aQISw7biVdIbA9lAXo8yELBvXJDNmlOTYkdzsNuPwAyRJp9xA2xbsLtLsNcxj6OLZlBQzdnNyVpLqxnwt8o9IRuKUMY+NuyPmEKuqZq6Re0GM4n4yrIYvCDyNH1IIBf3+9//Hd37jez/+8U9ma4qLwDWY0A4X8RvBt78wfaX+D6RLaKBw4k3qH/XDyUDViNhwWceue2KW9NtNK10/KRLuTUKcJSxqxhVx8BSyvtmfUMxzc2UCLu7oJSVlapMJLKWebcBeVD/Mkldn9i5GVSbtUYT7ftcEzdmPKwtwzN6EGDE6mkY2jSbKxl4uKmDlmjM5aYpyAuD0VLjaLsq2S9Cp62TXXTohm/tLyw5o8LFlkg/JznRt6ofd7llq+z3D3nV55aNf9kKud8Pc/JzNSKQ6yYhJHeAJmQijiJsBwv3M1yIO+UsV5MQX5bc3cS1UVn1XDe9bj5M2ey01W2eOXuNl6Z5/jTeEbs10Vl4ONXNe3mIBdVy6OT18hAdSGUoPynr7VD5JTbnUcc/xOGihvTLx07jTeATEZf55lsUVFRUVbzcq4V5RUXGd0VqG20rTVm0bGzeXlpaOj0t7Weynm1dykm73WjmLmxgdRtFauXKeXzj3BgOOzMB2Ee5mUUbWRCzKkYnKztuAcDyytrZwZVJTQsPpAp0LDVVO4q+J4kbuTBIJfllWtoHch9euCEJdyPHlkQW9OQbjJnwx9SIbtufwAeWRqIL8AjA9K+1dE4kJFTjHy8ibEBZcaAac3KB5+4gycdhYzLF8mjjsMsNT2bqdwdPp9De/92//3W/9++l0eI+dzY2Nn/u5Tz68f//Wrc1bm5tra6tr62vra6vra+sPPvv81379O+V26qAHW8RRZv07JuqcyN/LIPAUrZ2M+HroH8r0T7Tdz1N7EUIhmRhoj2cGzopEapBPzwKlxab0OBtV1sYDBNzZxPxYQjuZjF+9clCMZeLHJdamZsPfeyNeQTs4PMiHDCufhPbIuRQkmgvwb0KMIdwBJMSyKa9UdsS55iJI48/hCPdJ/jJEfNan1ZLCGdqK/ANkzKdNtnp5hFoS6k3/MR4/ppVsRc2zlLQnv+hwNclTSSHq0gFdqWQzUftanMF75lHxDPfh7OwsxkL7xK96iKcLXB56uefK4eby6HGK8xOayL7H+66AESfzj+BSFQmnItdCmXD3H3oFkneObN0j15wj0156CQI5+IKFFdVnp54ZuFro33Egp+3bw0cHu/dOjU26BJs5a3h7RUXF9Ucl3CsqKt482mEnKfEq63OGmLMW1ApiInrn3tbDn24Xsnjy9Ckgi73kDV6xhLylHyzOq1nGtbj3bvzDX/6lX/y7f1sCwpWAhPGQ8P9DjtOlr8WQEhjhq6UN6O7dO5pKvCR0dywioUHYAnuW5XfK3xC0vK4wIMkmHAuhYmy70hfcwWkNbgcDLUFSjJRZ6H1QhS0mQ7Y3+BWCdCPkgcJpPWI7ZwRgd6iTqxSfp1K6sVBHpLveYRxKSVhYaG6jqLR3TGi9lLsg97R2LmY0iE2kh5inFt2uFBoDjMnk7Fd+9dt/8B/+sFzfzc2NX/x7f+dv/c2/8fM//1eBEDQfKXyO+9Tg0eMn5UQuiHLXqCRYLLORkurlAme6Rgb3G9E/hDB0qSFsbW25TrZehgi1Vquj7hdTy+XYc3PDaC6ORdWKAV2OYDJPWtmdE2hWG0spyWyxi7D3rcZ8LHqkfrg8VWYzQ+ccoezN1tYw4f748dNw0CecHYylkLehYS7KvKQEZZnDQruLJejaN3n8131BgZC8DHE25PZrMfJ+hwYrd/A0AmAe860O8nHoMmzNSxCS9x9LnZklyxqCdICQl2+0J/hZET/86ARwdvfy2dmZqEw3MZkbDBqMoO2cbaJd5lX9ePc+tliDmcraiSy+XRNN3TyDOf36v/iVTz75lmiJYZ3vJ3E753ljWa1JWuFcXHCGsO3zisC513jxAUr8J5TplvOBs0SYm6JHjdOvRHSv3SRpa/dka0UicFmNzM3NZXUj0nVaa+CMHj5u5UHuH0rvcc6VmVzJItKt292FK9lkrKKiouLyUQn3ioqKa4pk4Zcu1GxtJ3e89947ZcJ999HjeKRrSo7bArIuY5VxviRSory2nJ8vaeDl5eV3330HmckTDRcziOAYKDV4IO3j/4bDxkynmAYnt6QRsrPs9232FCBl1MJoLdwinSyLGPcUt+AOm4Z0LPvbjpmKK8TsTc3AXFOyMCdnZ6mRDDn2XhllflRsIRJiBzq8gvlJyTYyxv+zEubM3/3Nf1Nm25uG/sEv/f1//I9+eX19XbaAv5C89RnxVyXEuQHK2b8e37D+CWiEeHcawTwrmfHs+NPzK+SUR8X8/ELhZmFRHdfWyt6CDf1dqZyUd2+Y791yt+UeebuQU87x7Na9u4OvoO3uPkZveGWyS7L4IM4PTrqru53D551LiUynTlElcI6mPgdkrOXgLh8LCyauLWVSGt0DIKWXlRttk8thfcDuoWK7E9o8vh8i5Hn8vDSzQUJzycQiT3Lst2cATCfTpBRJqW2lUpgQhxjPlvPmEtjdDpT4Ry6onYgbN2+8++47Rrar1nZzgEzUacca1679TqF7PM3u7ktuj+WTQfE2LvOYuz+9Ml8k3KdT21ssZ8Rd43p3XcwuTafs7xFVFmVuUPTC1UH/btQh5JVJi3N322eNJ9szxE/NX82QqaioqPgGMBDBUVFRUfHNwxicxB5EtuAi+UvAxx//lXKaOzu7APIln0a/5ugmPi5uBvjnF4qE1+npaba+DESkRl5paCjJL0VDORr5T9kue8QMZUobFdC+GMdwkPtfC6zGt1zSaKc0i+wwT5r6r1V80+geBgwM0biBYErGMiVmuLskku4lyjQDOSIX0OBzprBpaNhXJtLtYGb+L//1v/3Wb/9uoWyrKyv/6jvf/mf/9J+sr68rmT9c6+uI3pJea/1jTF2ncjgP2uRemUiVWNes1uHAEUp9pr+UdoABUdL/LeGVCnrZWFXyDaWeVQJhbm7u44+/Vc5i99GjbNLNm8Z7Ti7sCeuFvKwzv1ByzCD6DodhDqiuNizLCYD5VFxzeSb39wLoIJfTszL0RySU8fjJIs6dk7OXNqm33HVJqYo4OztzDyfzTTuBjrXpUD+W58RLwvBwKPsaAUxkkzEntNpNfpK2oApV502i07Njp+nTX0ip2rcLfRrIWxVlNdKhQ1K3sw9DSIZfKuvjCHdfwiR86YJN75b7+SyeFbVDFVRUVFT8JUAl3CsqKq4RekymdMnmL4Q/RD/7yQDhvr9/sL8Xt3HvWieXzPfkY2rpjTyE5OY0+8XF0lr85PgYKXXt/nN0Y2bXGNfVNHqiMY7Lc2E+btUxZ9maH7MsknXFndgMnpBRs13Dlu3ZrnzyuyquN5aXlwpXyxGdJihG71BbMIion1/gsAeshKfHf46PT/7ld79XyLpp6Nu/9s//+i/8NY7B89wit94OblQxSEi+cf3jlZDook79c5koE+7HxydjEyqWsMzGxrDlt0ygEogE6G/91zgXz1f+7CcflxPc3X0ESPB5kF379EJ8cUWOMja+5BGfaYL2WJifb5pSH5+cJKIywxzpjs8mAzvALCwsXKFXhmyyTvjmK8Plcuz9ucyWxelk9NcssuB3wetXrwsPzS8sXIfRXlb4iCJNqdIHhBPPNbcq8D6d3zTZjXoAp/AhMthaEP7/gMUi4T7DdFPEEOG+OJhC15AZubHM8A2VZ6+oqPhLjv8HAAD//+x9Z4AcxdF29VzOWTlnoYSyRM45R2NswH7BBhuTbJMzQpicMcEmGYPIGSSSCAYkJCGUc7hT1t3pTrocdvr70d3V1TOzvbt3J1n4m0Ls7c7Odqyu8FRNdwi4hxRSSHs1aUceH0plxEJXhuLAAQNiFrVx0ybcckJ57cql59qlN1z5IF83Hnc98GZPulRmZqblh3V19Tq1hbokGsIO8mbAyDgSPg/6Pf7MU41vKhgcG5Co84OeqEZbaGFAoHdSkaoloDbVwpB+TpSRnm75tt4KTPgJ5x85gTFmBsAEts4ANz9Qu62D3k0GPvx4RmnpBktFZ591+v6TJ0pITxUUiLt3JP1XQZj/MfkTJ+Xk5Fi+bWxMjD+jUX19g+Xb7OwsgJ8xCEEWo6GhPV1iRBfEjIhv3LTZdc2FDQa6Hn9EvM0K2mg8Y3m5eZYfejDW+JcyvbOhwcYngKwSnWI8chEvidljehEyzDzW2egJFIZxUg3k773sbl+tBtG9zMhMNjXbtkvKzLDpxD1GjuNkZdlkfk1tHb7XoVXD2jaCrIFZ7h6ZHyTyGSNqJfARiP8ZysnJtnwbc/nHSQ1WsyqmDEFilk/W+6moN+/4n53ZkEIKKaT4KQTcQwoppL2dqBcIAAT30c5gv36909JsqbUAsHLVagBE3CVQR7LllItvwPDqq46Axjg5WxIAcnNzLTfX1tbie4bQhu4zejwm8qV8HgdfmfaCfL4P/auwtSD3um1Ws/aq/N9YfoWOWUg/Q8qyene7du1KtEDKCZQtuA9mY0ydzIBgu8LT3njzXUsV2dlZvzn/XCUYUAzsLtozMHuU50U07XXyh0WXP22VBn4gMi/XBrg3NDZ6ZsfIptZIWxT+UDxZS6ArP2nQ/+cm5qyPoBHIneFlGZ0ZMCBGhntdXX1Z6QalngG8y4RbI+IdpqA56E7m5dsWSKN1S3pdJoYLgppYV2fjEwDIy821M0kbBBUz//3vU6wRqq+vJ7NDIHV9ErivMHM26+ttiGdWVtbuH+m4yi/Iz7d8W1tXq5NCGFnLch1rgS0+GDKdynzE3B0v9K4irEw/zITpGKI2RiXIXk3R1iUdvFyruqmrq/deMn0ETlROYuUQ8oP+7Y7PiULMvyGFFFJIIUWhEHAPKaSQ9jaK4tPTPz5AJjk5OWYO3YoVqwEgyl4LximMJgyfkEvvTfELqkma1Hl5Nn9+564a5Z2gR0Ie7YUgtAvxLtMR0s5PIOmwBdO5TKL9CeFBGmQhn/SDwgqUYfQubz2J1Rgf8fbDp7F+HysFM+5qYn7tCRK1r7YYhTAWrR7LErVzdc2uWpK82mbCtakbwsSZdhKVUymrHDjnmzZuXrR4qaW4Y44+IjcnhyOaR7MYfcQ6xl1tN3ET+hEf5JTRzDPjL/3085E/7RpuZr61hxlqdukwgwdl4yRUa9xhQiQAEIlE7KmL0UeeRXkv+dpSJnS4fIiPNIepJxXEnGKCs5jaQQMH2HdoAYDlK1bqR9Awdqazzy0RcUgIc2eGAvK2Kn4FHW2Y8dGY6CJWXq+LlVudZ7KrV/TIVb9b44O7kXaTHE10NGpF2IPkV9BPuMGRpYSamhrLt1lZviB0zJ63KYTEfILfqJFBXr7toY1du2pJloSGxFFOM0PkgxDvfpmP0t7xwu1E5JsRHzQT20YdYOPFV0s0YoFmAWN5VnXT2tpaV1cfFNWhSoYT1aNkuzfeYwPclcozLHMPqSpCCimkkELqeAoB95BCCmlvJm2OA+j/PUkyArAZPXqUvawVK1eR3SLwn/LnObr51PPyuPTqhvj+2brEeVFhgaW15RUVKmVQZRSBtusNT0g7OY73ig3q8jhVAAyAKxeoTc5PnL9RXWHtcbGsFATpKhTK6lQEQGmJOSFk4gNAIV029/6qDWTgORZ/s72dYsCBc7EGgztFUNLCAlsO3c4aneGuXUdsYJDTZ22rxMg5B9cF7JsGvDjnnH8/6wd7Bw/YfzJJRI3WEHOHhP8qecGgoK9xZDQxfAEG8N+WP4wKH9ywQP6JmkodzwTY7im09rp6504AUOCGeEsehwIwXgHIYtcL257eDgAFBVFhL84BGLIi0w1oA8UrH9pLvvx2/Q7h+Jyc7H32GWovZ/nKVQBmuIsyOsdpMWIKngfR2q6dPVA250UFhZbW7ty5y2gh50azQLOKd+g1a8XIcM/IyKB7gPjxPCxHA60/q2cm9gDAF08Vu3bVIKauo5hGDob5nnChuGoH3HM8T3150g1kWRxjNHEOiwZeGdPWLJX5psCHWNq5oqICG0ghcYaZE94Aq5fI7mGOcdVzdhCoP1E4Ng4ubrONh/A8lQFxJwGoZa70q/EjP+ZuVzegNU6U6gOVjvGJc4A6K+Buf6xhLwzW7W3tCSmkkEJqJ4WAe0ghhbSXksJjEQIGlSitgS/63cQJ4+wFrl6ztrGpSaJQHhgF/R1tjOtNXc0NXnmsf/oeXQMD6hOLBnft2sXS2u3byulGl6rn0mFhfsSLKXfIcUy4i7hAjvduBLqip5eKK3HZwD9TQ1m6z3Ft+dvGGhQavJvK1xVpYFB2quPrUHwh8suNChhAUVGR5bfbtm6HoHaRNC6NdnLQQIcrAXXPHHEAF7gr7nUl5MDpKwe+ZOlyS5OSk5NHjRiuKvNi1FEpDlxrjy8HKR8914Tc0FyhoJRu3bpaytqz8ofFkj9x9V3frEAi/012qbtjR5X+4Js/8gCEbWlVVFba29qta1cgsQXRTFHqboZLvVuytImY/70ORknlFhARnzhhrL3clStXI2BI/mn1yynSRUJ/iWhn/Y8gnNgbrQ6BQZcunSytra4OQsq8EXvAdnugM/GmsnKHpYru3bv6BA0HYMAZYyaqmgj5cMK9nXCOkSVIB2i8pY3l76hSq94Pu5IUDVqB554K6zwWFxcBUFGqOrIbV7uhndFaFpInGlVUVDLQNiFZvUHynoZXfTJfpcQooa/yK2jaPJH16m9HPNIUOBrqT0fbeKq9yk4BD2t0typZAKiuqlZvvS0LUDeeaKF6U1Fh0zhdu3b2ChGOrMjbmFxDEP82/Tqu8rW4V9fIOIcUUkgh/WwoBNxDCimkvYKYafUZaIvGkbRLb6ZZAgPYd9SI7GzbCUUtLa3z5y9UmJ72uTHFHSE6UH4/J+6+/1y1WD0Sf7lyuDFJSPbDbos3NjWVl1cA8VB0eimFNBC+0i4QMP/DvB5kTGJjABwY44Hppcquj9saJ0Bv2yjgmdw2E00/Csj0TDhxPa47aLqrp1q8jeJEapB1i+KrhzpddgDN2s84KwMAYPq9J3UVmHA3FVLdtWtnS4HlFRVNzc20FyaAQlB3isCTlvogNrzMgXPXVcsaFyyHtevXW5rUt2/v9PRUnIggr1l1WEf6oLm52VKm0bKYF9pIXvTHQCDlBX03yg3xgQO3A+57RP6QVEef/CEN7whSuLZd6jY0NFRX7/TiGUDZU0GqHhQVs2M5VFZWecsllJmZWVRYAAZiGl3y4U4L8XJNB8qHOElHvQG5JCgiPml8jIj44iXLasUGC2ZEHPWwEgp6sVLMvU19IYueE7ZjjAHEiEiVl6tVZgQ5Zbkk2x5UjwxZxgEAduywAbVdOytZyoI4hIgjrCIh6cLjZ6u9n1QYRn1MoGc7Kqs0usn10lZLSE0mZRey8hsam+TjDlGopLiITlRgLFCVpv/EmhuNx3pvJDnpIO0QcaI469bNFm7cvGWrjrEyHbRUy1pH0YTxiPJcIe3kzA79CYiQl78jEVa08xOX83HZeHEZOdr0iHkraFPHJNp+HdfMzs4qsD5VsH17OTF/OKmBiD6lboyGqNlvaWmtqrJpnK5dOosGcmB+VqGtVm33WV1RyKMf96ww+Z+SXiGFFNL/NoWAe0ghhbR3kd/wZphAR4AfmhspfpaSkjx+3Gh74d/PmiOtZYQk0M0ykTrq0gMBJng8RIxVptEUjdCIZvfs0d2+rW3phg30wV4AhLlUuEH7Lhq+ol6Odn6Ma0Bu16lG4q+289tHHWYLa5iww6rWeLd5Kye+Wjvbb2bhBXzjqqz3BAsNvizQZs3QxrfgmpGAthMjPEzANfI19OzezVKA6/ItW7fRtmlISg0G194lLiXqjYJeZkDuU8PjqrgZLuYtm7damtS9WzeaPBkwa8z7kQFrinVkYsyhVoJLhRxYomzuqU4zB0nTBQacc4ZDR2HQnt277YXypx1E0F3dV0SP5Ofu3WOkHG7bth0o1qa5lOBbmlM1ioqXK8orLOX3MNOWmX7jC2UlOhpW+aBXif+GNskFNYUm3g5A2YJGxIcNH2rfYKG5ufmHOfMMZFPFzFAAKPAToXb8qOR2LN1sIvPKsAAgAkaSnVW2bNkGPsgJDKOBaBR5kwcC5OUVNsC9W7cudERNccvwT0eEpEwrp/2F8Y4rLf5K5RtScXwtqKzcQZItADTOaXRBywEps6V22rZ9u7384uJiAPBMlFrf3ESb451MZAUdQgVtXhL2UCE7Bhx4D6t23rhxc3NzC7KZjq0igh+AtgfLfB+hnMf/sXWyLzgK8cg9+8SSiYwq3LjbAfnuUitq1ateVQAZGOvRo7ulBKFuSLPQ+1CoOlE3nOojVWllZaXr2vohAodMPPPglyFS+DFkonbRnl30IeYeUkgh/SwoBNxDCimknw1pNIVkWEqXHoAxNmnieHsJ38+eAwAKyFOv2hNHqE47XKajbvrupocPJmakMQFN9APLyMzo06e3pbWlpRvQL5Hejna8fd4M+js+r8d0hIDrAkGnGqHdzYjzw6URHo9V68ES1EX/IFhtctk9wI7HUXPU5ngyPaPl/3LO3aA2EZwHYo8BwVjAP+uuLoh8YWblxek7UGcyENY3Uiu9v02gUxoKJ51SLmXgdANA586dcnJyLKWWlpbpBmhwDVNXcRWC8jw5mTnOuYtdcV2yEGUZLnDOXXDJ6rY/719SYtsDB2R3GeFMAICamlrL/X7yMoQ5dG3gcw7AfPyGu3+DkEaMm/ALgN7G4L8mf0i+I2j5gxgMlT9m4qP5lfd6ACFiRG7NzMjo07uXpdebN28BujYI/IF4B76XN+ibAYDbAbj+/fpiY4i2MNkLCwOlV+JHMuKWD0E/jVqJBw6jY26ic4pbaEScMWAsyXEmjo+xq8ys2d6IOEoFFAgUN8dVDqYu9utq0jWmeso55+aY42gDAOvfr5+lqTU1NWRXGa96oayCGL/6iD30wW0m9evbx7N6pSBiFukdn7ZSrQ68kSiIdhOWopdJ4gVz9epVbAGNpHo9zuI3btqMbcP4DlU8VGl6/gHApk2b7eUHwNxctdS35OMcfDmSTOQta95mpHh5Sb0ygEGDBlrKjEQiZWUbGdB1TAW+P8IaKOGNa0rc6/8dBy12wMJ0I1j8uIQSkHHYeK7LOXcDrBb983i4JeBOjGbIaWOeKCT079vHUuLmrduwnXQ5evmNqhtTmNAMBj916lRSkJ9n6EDlQ0VlskQWaBQRgl+3SYxwKif1Nf/s+doSUkghhbQ3Ugi4hxRSSHshMd97hc6QvFriSEgL/uCD909NTbWUW1a2Ye3adcQgR3ec+PQkQ5b6zup7W7vJTRxbKDw4hTIBAOMKYRts9X+WLV+JuJSONjDddzOF0PR8NPhleD7epFKZ12LCPR63goP5OQZxXQA3L8fz044nD/BErXbOuevSW4VTRlw2VUQcLTNRewoKGACBz7XSt8RTCfm1ialrPIPmioPuv/irWxNfp4I+qagNXmUcnXPmOAP694XotHLlauVQqSYrtFw6mBJU4SroBQh90FVLOuZyrvP7OV53OQdoam6ORCKW9mRnZVkiFN58MPV/uTWL2UPelRTwTaKkJxFnWa1fDhwYch0DYJyi3FxLUBiyd8gf8MifxElhpPhW1YvTp9FtNmSIrdelZRs0AkLQN43k0PiPBuYAxf760g2W8gcM6IfjqMAs3Q9gXMVEvPLHgpDQOyGWfNBXgsprG0Li4REaEZdzDwwYO+zQg+zlfD9rjuu6oOJsSgToJc9RPODAa/zdq6A9kZgA+J3pyQTFobJsBl06l3TqVGJp7frSMqAcAkqmKTlFSqfiTE/F+vWllvIHDuyPw4p/mbHzdywMKh5SbBzwDZA10IFEODNexWcrLRoUF2+xmzZvaWluIZpDT5yeNWP5q+I5AOebNm6xFJ6fl1fSqRgAY4u0WYxz4Iwr6J3MbMK62RezldC4OlGXMWCsuLhQbjAShZavWKlhdRICJbA7BtTQHg/A28FUByj2yTKLKvPboAcsNp5PpEXNrog55uQeMY/iVUTpMEah7xWycPBgq7oR+QdaqqGACFY3qrO6QaVWdTN44AA1l3LQOddzKy7gJzVJbZIqaIoEfpNoadaaOigYGFJIIYW0hygE3EMKKaS9l6TprlAvTLhBl55k0wAwVpCXd8D+k+xlvv/hDOVKKTsW/Xjikpvv6YcAIt9rmxPLFy3mnCtHRhxnxRhj+wwdbGnq0mUr1ECoF+3mIJChBwPoG23+M/3ecHvUtxgYUI6kgVMkZttSgIdiP/gdzT8j4G9iFNsjo3AYIBqrG6AmHJtIXQw1n1Ew2Cg16v7SunQjPK3z/zy+qgjLcrNM3V6NRgH2kSN0kkCndHtVXYxeFC6ndME5MunQITauXrV6rfaODVwDFMjOycAhm9CFBkCXHHZSJL+TkeAub21ttXcuNTUl9ggw8y2DrVtjbCMQjTRzRHVO44Mcgn5uZOsx+UYlJgJoESQFxdB99g75QzB88OGkdsKbPTl85A6NGYnahwwaZClw3foyAFBjqeE2AC1SNGaLESG1yDlA2YaNlvIHDRqIyIcSDiptmZOG0wWrLsRBWj54rlMEyldYohKB+d5LkE3FEsiMkpDM5MkTxAGS0Wj79vJvv/1eSQTf+je0crCytutq3WgmQX3VAw568DlTUaahQ2yssn5dKRWthkTysYrnH3Cora3btr08WuHJyckDB/SjUSoP8q6eRgPwlRybZN99nNBWlRy92OgFJlATKteY1QfUGbNPra2tGzZtoppH9cNr26lp5Yp7OAdYs3adpfC+fXtLOaetKxTJOngiimLATeEVT4+JfFAgqhZ3WsDKK/vsM8RS3tJly/WvgFHxynTxunBUBib4DvQKlc1YCtEC+pVQB9h4eBf4PgOxkABsTGrWp34IwBmTVotqLhXeCF3HlCFr15WStkktoxF2xYFaAXGqkjgAlJXZAPdBgwZofsD5U21Un5mM0guDgcUV2yUaynfZ8ovY5YI5g9pAj5PaKcNCCimkkDqcQsA9pJBC2kuJIikaM1HWvXJadDKl+O7E44+xF/vRx580NDaB4SBTjx0CLqqdK1S2SVR3XpjHra2tyuZj2vxjyiPSHYCxY/a1NHXjxk0bN2wKcH6iuSPamdGhCfkjzg2kC/EQsyBPeouyj3n8NqwB93DzOvlEi4uGrykv0esfAIBjfe7YjbjU38fKKBxJGmjvWZyuPo6a6eqTsAOBQoOgr/jGGGuhNxtRHuqk+LphfkqoU8RXY5wrXM1z0qCYreHD97GUuXDRkojrak5RrabLiK4zIO9cbnii5L0cYZe7XOElwgVPTkq295GB3ro00K8zgS45DitWrrIXq4mwH72KRSI6aaCYjpXDVRYwHUaa4gcyyZ0xzYIc0xIVQgLj9pT8MaWOXf7ES/57KbRkBAfoHQD7jh5pKXbZshVcDyn5pyAPxLQNmFfNREtL67p1pdEKT0lJHjFsiEZRBXE1cuphIx/FiyBYpRCYgtciH+IlMyKu+ATMfFeccwYpKSnHHXOkvcy33vkQ1Mr2SgavhvZcgajaWUsMDsAjra0+tSDFgGqy1JejRo2wNHXZ8hVkJInkDWIV9U+hVACr16y1FD5snyFpaemyHCUoOAAwjnAlNyPF8bMJ9084N7/vUApSfe0vUw+uryrvXTFp+bKVCOyRyC+qGqVSQLElKXi1FXDv37+vnCoAkBKIS8BaLAwOckcpLbtZ3COlYFdVONdvVZ0oDRkDBmNGj7IUN2/eT0oCMfLGtMFQjwBoQU/wdX1Z4++OgqC1hCYhJNVO5mBV7bTxXPXwIvews9aUwOnoxYvpisXIQe5GxagJpIPOoAdv0MD++Xl50Yrbvr1867btWLtHVMlL2Euij1RXYsR7RowYRkMeqGjUJ2HckadmOOUa+0CQATPYULetI0mV2MHFhhRSSCHtfgoB95BCCmlvoaBcRc8NyqjXsLv6oULcJ00a39+6o0V19c5PP/tC+VTKsfJ46i55Nd32II8e8zw4AC8t3XDG2efX1zcq41l4FVy2lgAqHFi/fn169LAdY/Wd3HTel7MJ5keKTVMEVMOkjP6SK2+BAXC6fTBic5wrt54ACXbSzr//VmopR/nW06VAHlAdSk62oahNzc2ehqCTxV2OnoI8NYuD+KsOntIPHCvcJA6kgPhG6Jlzc0QM7IVAYEBGJ1Yl6JRRj4tzl5MiOC2K4O9BZcXlu6gSBTKgWsEEL2sAV+eujRszKikpKVpxO3ZULVm6HAcCFIrBFd95YTTjs3ELhUPUOwDtMwIAT05JSUmxcUtdQz12ykIUdq+qrt6wcVOscTPJjHEQmBKMaVBSzR4naGlpEb/jOOlcd0FVxRhTU6VQE5RCoq6+ffvYj3TrcPnjwSYo+OKjhOB372813g4GiwJj+wwZXBI9z7q0bENVVbUCNnQ6IXIb0RpkFavxX75iZUNDQ7TCR40ckZmVhb+jy0bvCcQogIZTrCqKTtHkw26CKnwRcSAAm8KdCOwufnDaaSfZpfes2T+Ulm0EzziTdy4XMk/G1jgHdZZDdO3MJU4GwN//YPrV193COTB5lrCYAKmg5dRI0J1NmjDO0tQlS83YjA+nNVqF0wEg3i5cuNhS+PhxYxhNMADgajco5llnegkmRhS8Az977B5kq/2lkmHssCqXLluB5h3grEm15Fn5tBW8qbFp1ao1lpKH7zOUhqFwO0HOlQKlEKgsm8exXmmIngkRwfE5M7UAzYQUYAATJ9pYesvWbStWriYiXVWAd/iEMsHc9fcM30blyxjiPTk5qgkBVhsP1FiAOEHdVRJAbOMOAMC5ClgruwPi4RIaBvFb1l6bVQw6h6Tk5PHjR1uKXbJ4qdIgWtgbcgN1DVH04t5IJLJ4ybJoJaenp43Zd6QOk+jGS9NeGyCo7ADiHxB1GzeueEJcbY3eaenEA5a7vVTe1kpDCimkkHYHhYB7SCGFtHeS3500QR3Do9D+jOM4Z591mr3ol15+rbm5RZnb1KNH09ZE29HV90Hw+hYA4Ly1NXLdjbcvWrz0rXfe18YzB1DPbEoMDP0fxiZPmmBp6syZX3ud6fhQKM/wRSKRefPmezw7YpMSi5laqgSvjYl+Ubgn4HoQvqtTPNFx9PgF5Cq9bN8GpLm5mQLOHpNdOS4ucRWwm3LCCIbivScKGZl0Ro2k4/ShZ+XqcYXNxwdFoCehHTBvGzzuictdb6d0d+z4nZ4Y5UULjx4DXTKWZECsDPLy80aOGGYpefbsOco1psvLj7YDJ7CaB72qqal59PGnya8AACQapyELDpxnZ2dbGtNQ32j51kOip7N/mBfX3YjdGWvCu54Da0m2Bgkam5o9K5YpIF0Ah2Z9XFcrH67BbEM2eZLtoOkOlD9z53rlT0IURf74R5LpRGsNuit4X3zpsAlWIHXO3B+1s0+BVNQX6lUFgTT0sGjREkvJ48eNMRUXB1O8iT/mUo1PAsk77fIBvNcSwSYSiIgr2cAw1KEw965dOh91xKGWWlyXP//Cv/XYmjraq5NdzlXg1KKgMWqybdv2O6be++57H61ctYZz46wDLvFskrXPYED/ft26donW1FWr15SXVxBVQYIEdBL1XCiOAuAAFqQMACaMHyOaBCDZhDEmzscUUXy1qul08ASmk5JWc20HyFQLDKQsXr0Wq0wNpRpX4/ttHLRg0WK11FH14FwqfkOMVsGeHGDRkqVNTU2WkmWKsZDKclMvBX5zOo2ytcaSj5OkCgCJoMpiGeBkErHfo1u3AQNspwF/MfOrROr2k+zM5q1bN2zYJKtHyc8AABwKVAMwh2kprcpISbGdxmSx8bheby5hRheCbFMdUoHYY+65R0lljjoWAIBxLUNAqqCJ423qZt6PP4EhLpTdab5qBUSsuZWrVtfW1kUred9RI9Mz0jHYiYEX1Cc80N5OhAyTVl9trwyJPhnEkqdXQ4Q9pJBC2ospBNxDCimkvZpUig66ljpfx0sytY4df8yRvXr1tJS5fn3Zq6+9SdF2kM678teJ3+7qL1zuzXoHEyXkT//j+dk/zAWA72f9YJiD0vsBQLxN4S129GHR4qXeB8/9lqXHEw0yV99578Nzz/vdtFffBJXbrjFuxtVH05JFd0YWGIdFSwB69c9wUjygtIUM/Mm4yAAgKyvL8tva2jp00XXajkAjApwrcs3FDB8NjsRPCHUpiIV85WK1fo+Nm59jVcHVT0i/1CeCdQgHk5MELjIUcRLGh/C3+mFpdO+ZBOGVk8kA4JCDD7QUO+OTLyKuq4BME1MLwNa85LocOH/2+ZcefvTJjz6eoUAmrkYF50G+sR8TV1NbI8fQz+dRgPFZ3/8QY+CQuDHdOsIEvpw4I9bEcqxBgjrpY5sQnoZ+Je7CuYJ6mJI/EvHRoMAekj/vfnjueRe9Mu0NAG/eoz0NMkGiuZZSHSh4i8RlAQ4/zHZ65+zZc8lC0hiIlifIcVzBH0q4fD9rjqXkQw8+AGTiI8aIGTDgnLCD3F8C1GkfKIhiy+AE5IO5WBIUdeBbGx4NTbJrQYU6FMtdcMG59iT3j2d8unjxEg1+ekSDq9Lb/VoZqIL2audIJHL9TVMqK3cAwHffzQbQkTBOtvEQYg658rDDDrY0ddasOWTECVJGUH7CKsg/0NjYJIC2QOrSpfPIEcMRJtMPP5iBJxHW4PQzmFeiUSBO1k7Mikdn0Lishzgr8YogQ95w383+q0G0evXa9WVlah0j4wHOIOEnwGAxyOBcVOrRo3uP7l2lsWc8RSininOG6emJGhy42Bnu5IICToa61FLUS5QxBkcefpil2E8++SJiOfgktgkhb3j0sadOPeNX1sc4VOIJvaS6kZ3dETaeAqax0S6nmRaqR4kMOyMylEthzQGYODpe4NmcE8XG2EEHHZCWlhatwFk/zPNoccTcqQyhCgjl+Pff29TNIQcfoCwALUZ0NFSH6dGq04omfhlijCaONLU227P4g/mNB34Zou4hhRTS3kkh4B5SSCHtvWSmNascHdAPWuMXTLk0jLHklJT/+82v7SU//+Ir5RWVhi0bjPa53u1l0NvHq8oPm/nlNw898ndR/ubNW4QzhY1Xe8sQX54xxtjIkcP79+tjaeor0970XopiDfvNZGGA1tXXP/nUs67rTr3r/u3by6ljpwBme8EAAC3NLZZGYlm6XDS4OVrxWIulDONL6RZ4noYFyMvLtTRk27btnno4Dg5XuKTyoF3dWJfcir0AuYOB2BA0CjW3tBhQl65XIy7ap8aB4YZHwgFampsttbS2RGiPaL9wHxyuGg4g9jDl5D75nYwrxOpUS5ROqeKFh6lyiLkEqsQXRxx+sGUjl7ING2fNnqPbY669AJjN5SJ7Fb/YXl7x4r+mAcArr75FkEM1oCZ20a1bV0s3y8qiHHEZCAIz2LGj+j/fzbIUCACRSMR/kUgzczy1t6vf5ubaAPdt27cD4QHDuaVriOHsMyl/EPbke1T+/P2pf7quO/Vv928z5U9HEQF3QSFLAJo78ZkMCUbtN3li586dopX2zbffNzU1IedrzvKwpQLKcJQrK3dYUNSRI4b1EScoEnAaKPDBgVzWXUP50NxiE8IW+aBXv/7jkbUUKklgdnDkyVMToAZdg+z0Te9ePU864VhLma7LH37sKc5dUKCnXy0rHSzuUdg7QvD0r1oe9z/4+JdffSOq2LJ1C+fAhWZGcMwXmAHGjj/2KEtTv5j5NYX1AlkFpRoiZQD822+/t6SmHnXEoUlJDu4nI9FaxmWYkwE+V2QWK8l+UjRH5vB/5XsTP7VGYhxP3TYy+hIA4VFd7aWEALivvvqW+1Y4XesEb1cDzuE7a/D1wP0nKSmspS9XUl6HRziATjyWrW62WlzNzS1SMsiNw9SvmdlpRkN78v5jjz7csufb9vKKj6d/BqYCNO1FjOwqgNs08ABg2fIV77730c5du269/W/B1WiVRx5JIl/m5uZYum+38ZQsVYtfN5yYYqTNwvaLuAFaG0lu4wa6CNlwLgYVtFAXS1ZpWAYsPy/3oAP3i1bypk2bFyxcrC0t7nVL8IIWzYrdv5j5dbRi09LSjjjsEKXzANsnuVEG6xgA40ydIqIAeDE0zVZzFHnAuNJuCl7vhi2NF+QtCSmskEIKKaQ9TyHgHlJIIe1FhLah76H16Dl0XgLG2DFHHz5urG3bxJqamtvuuLu1NaLNWp+P7Oon1F3PF3gJQL5buXL1X66+iQJtnMvTJUEZ5xRfUdAPAIeTTzre0tRPPv1izZp15jUjyYV73R58L83Qhx7+e2nZBgBoaGycM+9HWohZqJe0d8uhPvrGxIKaxDYXHnw2yD42qiDoIF6kSa9mFrB8Xxx9C2YA2LpNwZHaMSaDw7EVnAvEXYDqRrO8jWxqsvke9fUN+DOXOHWkJA0FSwdQ9Vy3EGIMcmOjrgXMfukiZIYe982E2SkOHCBGp+rqxa0qZZKhh6VT2XGaGGbqMsaguLj4qCNtaXT/fvk1hV6omfLhHOKjf39mYHDzrVN37toFAAsWLELok7qknHOmPvTp08vSkrXr1gfi45LUksXX997/KIYjCiA3GWBUkGkwGLP4OEc4mMLFDBiUlJRYyt+6dZuYeunYA4AEbcgq4xywfsZVujdwld4uEQHYg/KnoXHu3Ph247ESM9WDPy4LoOKymM2HuoExBiw5KckCpO7cuevLr/6jRxE5i8A3EnjD8QDg4tGN6Lx07NFHMNA4jICZFPqmUFUVugJjeCUaZ9kdHuKWD+Se9uIUnokAULmUavTBp6aF6v7dRRfk50c9SBAAFixY/Mw/X1TQWFRy5TYyLo2Ik6C4fnn7nfefeuY5LJ9zYIxLgQVkmSuVrfoBA/r3Hb1v1FN2Z8+Zt3XbdhMsI6zCkX+I5uHAAWZ8+oWl+8cecyQ+CSGbh4KCaSbnqqWgS2YAvKnRtsmJFl8EqG8/ZGWvtM11NCZSrA5oEMMizmo/+HB6a0srKmetc9R0ahhUzfPylSvtG7gfeOB+yl7FwJSCmJUWkIqFE7STAweoq6+3lFxvfqt4jzPkGBk9EgA/QsSMAevcudPBB+1vKfxf/361qamJ2G7+WCqpGJusGhGJRG66ZapAThctXlpeUanuJtFGoxQacJb3lJR0jI2npLM016lRaxhELrdvDVRbV0cHQS5DHaHjovkqsM2VhS+/t4cYp8/4TPWCNI/IEK8aAgDgy5avWLU6KvsdfND+eXk50iQDIIEfxrScE1fUysG0IICGxkbXDZ5zQU3NarhiLjA6vbHubWiIucVfiK+HFFJIPzMKAfeQQgppryWC5QXl0DGSAOZH3a+64o+WpzgBYPYPcx957EmVtqS9ddOb1xelY68uIU7POV+5as3Ff7xSIICCevfuCcL45vRkLMQiNPTDGDv5pOMtCHIkErnvwUeF7WvAJIY9rv1M5WJI8/zTz7548aVpWFp19U6zeI7YHPWdvGA8wPbt5ZbBBICq6urA68oPU59k4zAzRSXqAVB/DMMrshTi2QBjXbtE3VcXAJYtX+npoqjA5a6ox0XvRVctX9Vl4yBSACBOYwB5BocDyC1dXAQgKeLOTQdW45Nbt2631LJtezlCex6EB+QepQAB3ogGHzSbAI/dqfIKb6dApbBzCQaB8ijl89R6acI5Z59uKXzuvPlffPk1soJaTEDXoMtdCqThba++9tZnn38pymlsampsaERnlLRUEQP7hvJNTc1r1q5HP9P7iLtJVVXVr77+NgAUFRUO6B91J9zqnTtjOpaiMt8VOaxdu9q2wVmzdn1dXT3o2dSIg3SaZTFMAIoa5lFItASBAPaw/Knyyh8DBk6UguKygJICPyihSxEQdvZZp2VmZkYr+dXX3lLt0stMMyvi7biWOW9ubp726hvRCiwuKjr++GOIAuMEYifQKgfgOrKF/WqzfEDS3QkSEDGvyHZEiYirEVc98upjkuTOGGOssCD/Dxf/n6UvAPDP516cOfNrBJi4j1wzpd2T3Y4wKed8+ozPbr51Ki28V6+eoo9Mj47sCLYfIe9fn3t2tEZGIpFXX3tTDjb3sQpqUiWfxCpZuWr1V19/G63Mgw7cb0D/vihIaZtkM83gHfPJrModOywDu3PnTg1P0s63j8orKg228ZfKAj6ygC8MqvAoKRLk4kq1UU3dZtq0ecunn83kev60StLAu5pNAOCcv/PuR5YCe/XsMXrUSBQ4gHETEAE0BmrDNoIz68Brual/PSQODzD0uorFAGLuXMdytbHMABhYWBoANmzc9OxzL6lPSurLgTFWovrCsJbuue+hBWQnmarqKj1Lqp9mX9HAU+KRQdtsPCWMyXrUJqgaLVddcPFXakijU2VlZUtLC2O4Pb4mJb3pA1X6cRnRn0kTx40Yvk+0wj/6+JPKyh1ab2pmCxIjymIUD/lFo3POPgNNMqYjPZrr0CTw6HUAAAbbtm2zFA4Au3bu0kFn67pPiBoaGjyP/uC0BhXdMbIrpJBCCmm3Ugi4hxRSSHs1Meb10jCHznThvTSgf9/fX3SBvfCXp73x8rQ30JkSf1ydJKe9eldvFQvquqS58+aff8HF6ngoSZMnjgcAJtKNuIIp0QLHrjAAxjLS039pRSd/+mnRM/98XrxH25i6y+ghgun/LFi05Jrrb6U7h/iRNRN3pkAwrYivXLHaPpgb5NYc2ofh6OqoVlusY64AXfSLNKqg0UI5gvZNMJYvX1FXW0e9CAOOVPupi+M4AbQP46JHbbaMA6xbV2qpcdXqtW4EcU/l/rlYt9yshuARCoMn0Httba1IBLbUQvxa6h4BBxpLQIjd0ynqFXEAWLc+7k4BUztKg4p7aO9NuvLAyYqEgQMH7jfZdiDww48+VVmxA6MRFNpQixHI3hHym5lf/WfK1HuxkJSUlLQ0ebqaaB9T5xNw0VbOR44YlppqO4Htu+9mA5hedCAExOCxJ56ura0FgCsv/8M5vzgjWoHbtm23ZMFjnpeBOGG4AgAY69u7l2VPnkgksmDRYvRDJSMxxoEDFznS5Pg8ySKM487tarNZMW//XfnTbtJTpVM7CeyLUBONMTBgRYUFp596UrRClyxdPn3G5xpa06vViBYijMoBXn/z3W3Ro5JnnXlqRkY600iuDvDIgxJkFxC3UYmHaqDbJx8MRMxAW6lQSoyoSDZwQx3iCYbfZZjHnmbruvz2O+/58aeFhlBQFKCgSXROKWgXAF56+bUr/3y9J1F6v8kTgBxkAiqWr9ekBsvgwAMmDx8WFSx7+50PN27cpFkFgllFYYHAAf7xzxctHf/VuWdrfBabxfSwqsMzOJVSjDGc+NJSG59s3LjZvpkYeOQf83wOpubm5s2btkQpwlqB9c6NmzbXW3O9PSYMjneclJ2dhYeIPvvCSzW1tTqMpnF2JfEIzLxh46YPP5puKfmkE49zkhwKMDMmHnpUIRKpUREX1j1iAKtXr/WWSGjtulKpYpR6RsQeFCcwuUc8CkLA9TdsnyEHHhB1kxMA+Pcrr8+aNYdrASL+GPYRNV9w0F6Z9vpzL7xMiyopLiY905acfPUYeOq7fm2y8bjaeA6vuBqvVTYG6F/RvtltPNflK4PTyRlXGzzpNYqKhqjc31xwbrTCGxubnvnnC2gvc6rWqRjhgJ1bsnQ5bpDlp8mTxg8fNsSIHSLIjgzIFZd4VzgDgBWxDP5Nm7cYn+NddPaUBgCA9aW2iQhQbuaXIYUUUkh7G4WAe0ghhbR3EQGdvNel0wCMuPA6b8d054Exds4vzrQ7FQDwwEOPP/bEMxE3gl46cG5k1vrdekWtEfflaa9fdPHlnoSy3Jyco446HBQkowAuLpAV1Uij0WeddXr//n0t7Xzu+X+/9fb7CtxC+1s6hBpNJv7Pj/MX/O7iy2m2iOM4Y8fsKxFnYrd6LdcgePzb72fbR3Le/CibFyNmTy6pZE5NOt1JTjEg+qTThSRzsCGDBzpOVLO9paV1+iefy5plFhMBxsRFV73lInmaJEARpFxcqqjcsXzFSl89mmpra39asDBK5wHrt7skX33zrX3v3WXLVghET3mRxDuTnhjxK13TO1bOGrapvKJy+fLYnWLMP87o1DPGuPYwCUQlpu7SSy6yoMZbtmy98ZY7mpoaEWhXXSBBL4K1uZx/8+33V1x1Hd0JZ+jQQQAODjDg8b+aiyAzM/PAAyZbevrhRzNaWgM2zKXIAAP2wYfTZ3zyBQAcdOB+Bx90QLduUVPwXJcvWbbChMMCb9TYsOy7WgapqWkD+ve3tFlss2uQhlGNOJdaS1wltWn5g0Joj8mfcWNGK7aFjnWPLbCvB/pFnfGbC37ZqVPUrXseffyp7TqNVK4t+g/0ouZr161/5h8vRCuqR/duZ591KqMQKoo2EiSQHfF1SlD88kGMrlc+AGjGwNkyZ4B+jBO1JC3E/oFnrJn3raTrrrmqe/dulsJra+uuuOq6Tz+byTmVBCry7cPXPQp6V03tHVPvvePOezz7/EyaOL5P714gEEnZdKGaNbeAqaAv+9Pvo2mchoaGu+99qDUS0XCZh1U4nQX+/gcfW9Lbjzj8kNGjRnjDRTKgSSSsZhhG54kBr6mpXbHSBpbV1tUtXbrccgOWBYBRrLhQ9/kLFkWTc5RLaJnRJCNSJBKxnIsgiQe8C/oYQCkpKb+94Ffi/ebNWx97/GkUagpzJ6ynSo24kXvufbilJep6zMnJOemEY5Q1CqK7yvyTn8mKZ1iyoMWLl+6oqrI0u7m5ec68H0lZmqRmNuQeMrN8w4FddunvLc+ARiKRW2//2+IlS7FRBldzzeU0wvrytNdvv/NeWs7QIYML8vNp2yhxeYi3gt2JFTFkULw2HtH+2sZzqbnHUdwRoQggQwaKZs+Jsd3Z7Nlz5a/kODD1mAJ5SglHHxWSCnQfuP9+++83KVrh77734awf5mobzadudCeBNzQ23XnXfdG2fElOTv7jJReimlMGG9rRAMqoYUw0HU06wOH8blaMk+EXLlpiv0ESI5weT+AOYP78RTHvSSSmFlJIIYX0X6YQcA8ppJD2ZtJ+L35G69DnFKvLjvyUlOTccvM19mxoAHj+xZcv/sMVK1asAvTclUeBae3KZNcu/bx5P539y9/cdsfd/vSrX517Vk5ONskcIS01nB/d7tTUlKuu+KPFwQCAu+996O9P/bO1tQXAb4t7/Z9Xpr1x4e8v82wgc9ghBxUVFgBBuzSyHAV7FzT7h3kxzeu58+avxP1MqYtGL/kgHkHG/KKJjq80AYoxxiA3L3fI4EGWxkx79U2954a3twhHYvvUG67S0tVVWdq0N+xQFwBMe02fLUm7yAFLJCCoQRw4b2xseunfr9mriEQiL700TTfLl6vFOQC4WAUyRCDskFCniL/EAM8JQ2Rdhbg8XD1wYP9fnnOWpfx5Py649PKrK3dUg4Fq4HsNwzc2Nt3/4GMX/+HKxkZji88D998PM0iZfFha+L6KiRhjAMdZTz7csnWbGHyS4IoJeJINv/zqm3vvfxQAsrOyLv/TxQygezcbVvj551+hV+vL3pOXRY6q2vUVs1klKDN6dNSdowFg5pdfL1+xCj/qGWY4/wLEEYntuHG7SMf7L8mfQw8qKgqWP+0kpkeY4QXNmVrqGqHa3NzcP1/xx2hlVlRUXnP9rTU1u0gQAVEQrqJEAMC3l1fceNMUywbrV1x2SWZmJtYLpEUK3mWM4YB4sE3OoAPlgwGqt2HwtaymkKHqmYZ4CFhMlTIOAmOssLBg6h03WTb2AYD6+vrrbrjt9il3V+7YYcgHtcWbOk1FI+8ud13Xfeud90846ayX/v2qv8zfXXiBgsGluuEaAFXNU10VH0fvO/LMM06N1sgf5vx4z32PuK4bzCqE3+f9uABPVvdTTnb2lZddYjAqiOIwCkDAasXSdHIA4IMPp8c8ZOKNt98LTDRlQR8N4W+l9z742LjPbB3z/B8Xhg8A8Mab70X/0lgpAd/HYvDGxsbJE8djuPGDD2c8+dRzKMoMQJkDfnjw4SfmzptvKfbcc84sKMhXwlzMnghOczRstHGDZ+CqTr36xtsx2g3w6mvyHnOCGHJLAOaOfxjr3avneb/6haX86p07r7jyuk8/nYlsrLOtPWIfoKGh4fYp99w+5R7PwxMnn3gcAIAKFuF8qOQTHAoSlGGMQQI2nkuapJafq8x13Vg0vjgRgfj2P9/Osm/HDwDvvvchtfZRsStIG2PbuL8eWkgS0L7mL5dlZ2cFFu66/JZb71q5ajVgdM4McaAYaWlpvePOe3wHq2g668xTBw8eZLSAil190WuV43pds3b9zC+jHscq6NPPZsZ49IRY9XJ0jGmOSh9+PKO1NdpRKDHWM9F+ISQfUkgh7S2UlFnS97/dhp8HleQljR0YLReADRtjOw7FT+tXfl9fF5y80G/wfhlZ+YFfRaOq8tItG4KxsKJOfbr0jPokbEgh/dxImbeGKUVwTJ/3mZqauv/kCV9/811Nba2l3C1bt7397ger16zLyszs3q0Lc4xgpIKgOQDU1td9OfOb+x987MGHnwjc1nxA/753Tb0lJTmVAYisUmnLKkdI25tm1ke3bl2bmprp3pd++mnBou9m/VBcXNSzZ3eHOQTRl8Y+5/zb72bfPuWel195vaXFm7Q7dcrNXcTe0Oj+AB1MgcfIV66ck7KyjdfdcGtdnf2xbuAclixZdvhhB8udE0yEBZ1OZtr8gPlYRlGIg0swXCWd6fZtL6/48ccF0Rqzc9eu0rKyAw/YLyUlGetTXg9FuBj2nBFchIwAn/nlN48+/nTMZ/DLyjampaWOGjnc12ntaysMlPp7HACaWlpvv+Nv838KzJE3aPmKlZ07dRo8eKBRBQ1L4LiapJMv29CpUSNEPY5DuoX1opPPyGAqT3TE8GFffv0f38kBmrZu2/7Jp19kpKcPGjTAYXrd4eJwXffTz2Zee+Ntn332pceJSktLvePWG3NyskFJBenTy5UGnMsn2Ht07/6fb2dVVEbds37BwsXdu3cb0L+vGkvAtdXS0vrcC/9+4KHHIhEXAC6//JJxY0YDg4yM9NfeeCcatrV6zbr9Jk/oVFIsx8xxGAOHOYrnBWuAHCrsltyAinOAJCfpw48/idZg13XnL1i4/+RJeXm5YMA6jDEHHNBZazL8IPF3NUZesGsPyJ+77ry5a9cuQBqq0VnCuIqRDDb28DR+9LC6HDtG1zEQyNkTXYS+fftsL6+I9vxKeXnFd7N+GDF8aFFhUQBOwAEAFi9ZdvW1t1h2Zzr5pOPP+/UvqBRiTDACQmJqIUme4IqNZWObW1puS0Q+DDHlA0ohsnYNUWxKYz2kAXIkiMhtuAp9YIc6o8/EcKG4uGjgwP4zv/zGdnAxwIqVq996+4MdO6oKCvLkDhWetqkKt5eXv/feR7ffec+rr70VqLNOPvG431xwLlEEQHptqmQmG84YAOejR436fvYc75biipavWLlm7fpxY0ZlpGdEYRX+8YzPbr7tLosmve6aK0ePHuXXnAwYc1QjqZzV5UtWWbN23R1T740JuK9Zs65TSfGQwQOVntbBBSSGL2p0tm7d/v6Htk1Utm8vT0tP23fkCM3r4OUPfwULFy75wZpcvGnT5qzsrFEjhjGhgUjBuHTUOIBe+Qq5rK7e+eZbUSH71tbWC84/t6Sk+PMvvhJXFi5asmbtun2GDs7JziGrU1L1zp133nX/Bx/OsDS4R4/ut9x4bUpqipo6Y+WBseTNYCnnAPDGm+++9HKM6BoAbN68xeXuuDGjtYahq9mL6ctBU4KfMYBRI4f/tGDRli1bo1XR3Nz8xcyv16xd17tXz6LiIo0xE7Hf1Nz8zrsf3HDzHd/853vPzzt1Kpk65Sa155uPbZlYXaLjAvZVWgQAON9e0RYbj+mVzOiiFrLfpc/7KCt3fVnZDTdPiWni1tXXl23YePDBByQlJZHhBgaOGhhxBffNYcD0MaTAWE5Odklx8Zdf/Sew/MbGxk8//6pHj279+vYhA6aIAwCUl5ffdOtUyyMygwcNvP2W61JTUomEdxytAkCe8aIYw/eQE6+srPrrtTdVVNjOgQCA+oaGbdvKDz74AEepM6LSPWg7lSasunrn62++Yym5unpnU1PT5EnjKU+b+gsCrvvMBkOchRTS3kqNDTVrlwXLhIzMvH5DbDvvBdKapV83NQYjHgOGHZyWHhzzC6RIpGXFwk8Dv2KMzZgXQ2aGhMSKhx72327Dz4OG9ky56NicKF86Z174SEKlzXz/gYptwdvzHX7SXwo79UmotDVLv/7xu2DjbOCwQ/adHHWf2ZBC2mtJP7yrcEJQCTVImOHmiu1aXVefoqbS38Rv1peWXXHVdd49B6NQXl7uiOH79O3bp0vnTlmZmYyxhsbGmpqaTZu3rFtXumTpcktecG5uzgvPPjlk8ECmfHVlz3IAcF2VegPkdDeXg3o4vrWl9fKrrrU7n4K6de2y3+QJgwYNKCoqSk9Pr6mpqa7euWz5ink//rRx4+bAn5xx+slTbr+RyQiA8ATk8aHSM+Uu56CGzo1E+KrVq7/55ruXXn5t585dgWX6qXu3ruef98tJk8b37NHdYczRxBiTr8IDAPROOGdq63adwwjg0kkVWYsuXuOlpWVnnH1etIdqBfXv1/esM08dP3Z0SecSxqGpqam8srK0dMOixUsWLFh85x039e/XRzp7TGx2LlO2XJc3NTUtWrRk+ozP33nvA3stlA46cP+TTjh27Nh983Jz0BtjEnAX1ajcOc4551u3bps1e+4rr765Knh70GA65ujDTzj+mFEjh2dnZQmHijlGKpu4jUQqxMKAxsbGRYuWTp/xWUKdOvig/U883tMpWRVnKkubVkhmUay+319yxY4dtgfkAaC4uGi/SROGDR9aVFiYkZHR0NCwdcvWFavWfP/9D9GA8l+de/b111wpF5gLItdNLjLuinmUj5G77n++m3Xln6+3t+GE448+/dSTBg8ayBhzOS8tK5s1a85b77yPa2rypAn33XOH6CsAXPj7P3lPbyNUWFjw+wt/c+wxR+Tm5ogRQ8cUPXIZLeScgyvGyxViy3UjEff0s369YeOmaOUDQEF+/plnnnLwgft369YlNTW1pbmlqqp64+YtS5YsW7Bw0XHHHn3aqScwBYNyzJz7b8ifM08/+c4pN2vYqX2AOySuIzy7gonLnENTc/Oll/3lx/lRkZ3k5OTjjj3y+GOPHjZsaGpqipj6lpbWH+f/NP2Tzz6e/qllKY0YMezJxx9IS01jDITUkwtW5aACAMM4nBJDuI62bN02a9acxOXDESeecMyoEcOzs7Ok8HWYw/QbxrxQRvzDTkce36PQ1iOvtlh3qUZ2PZclffnlNzffNtWzzXo06ta1y4gRw3r17FFcVJienh5xI02NTZVVVZs3bVm5avXq6ImfALDP0MH/ev4p8bQBiclgR7hLlaFkIVwffNOmLb/93aWVlVGhqIKC/NNOOfHIIw7t26c3Dl1Nbe13381+570P7VujnHP26VddeSlDCBxAqUmB6GEUkZEBV5zMeen6si+//vbFl16xRDc9dOzRR5xwwjHDhw0Vdg4uP1DjonIZpISa/9PC311yecxijzv2yBNPOHbUyOGpqamMsBWQBUsSx/mL/5r22BNPxyz2pBOOPfmk40aOGJacnOw4DgdgjtjSjIPUQcap967gtwhfX1p6zq9sJ/R+Ov3tlOSUG26Z8u23s/BienraxAnjJk+a0L1718L8/NZIZMvWbXPnzZ8+4zPPoY4echz2+CP3jxu7LxNaWSDuKpzG1CQKkwftLg5uQ0Pjj/MXfvjRjBmffB5zNJD2mzzhlJNOGDdu3/y8vEDtjHndAMIS0CPPXb59e/lvLvpjYO6Ih/YZOnjsmNH9+/cpyM9PSnJ27qopL69YtGjpj/MXVFVXB/7kb1NvPe2UE1Qsi+l4CGfylHfVEimgibx2OS8r2xDbxuvf96wzDBuvorJyvbbxbhZPuMohcAEFrOu6kUhk5crV33w76+Vpr8dv4g4eNPCsM0+ZNHF8ly6dUX46Wnhyrseb5Nqr5QqcP/zok/8KevIGaeKEcaeecsKEcWNpOvzy5Stnfv3N62+8Y2G//Py8Z595rFfPHiZADSKVgQhzsWqwYVxY/qXry779bva/Xn41Hn4QtO+oEef84ozRo0cWFhQwhnxOzRutn0WF69aXnvWLC2KWfMhBB5x55qljx4zKzMhA/UX9iCgqLATcQ/qZUfWOTZ++dVfgVwXFvY445epEC5zxxpRd1cFh1GPOvDknr1P8RTU31b/7r+AGMOZc+ZTtoOmQKIWAe7wUAu4hhbQnyQOmgPbkibOgIBNuuvQETNHexdat2/589Y0rV8U4CKg9lJOT89gj90wYN5aJ0wt17qp6HFS2HMQO4ugWUj+xrq7+8iuvseeZtoGGDB74ykv/yMjIJNYoMABXHSCqAXfuXnfDbUuWLK+orKypsT0WYKeCgvzCwgKBCB979BEXnP/LOAB3iQkq2EP7Xn7MnXN+/U13JOSaeujtN/49cGA/9VAtAOeRSOT8317S0tIinMmYeYLRKCkpqbiosKAgPzUt7YF7pxQXFzPQgPsXM796/oVXGhsbd1RVRcuXjIdSUlI6lRTn5eelJMt90n97wa8OP/xgBiB3EQEOHCKRyHm/ubilpWXXrprtHdWp++7sVFIsH5GXGeWcu+KVrFb15sf5Cy674pqmprgAtTipb5/er778bFZ2lk5fVq4jV+sL0T0Qj2zfftfH04OTNSilpaVlZWXu3LnLk3VbUJD/7D8e71xSAipd7uZbp2JeZDRKTk7u1Kl46JDBD953F42LACjsDCFw0XiyVcYbb77zt3seSnhoFN10w1/POfsMoL4vgF3+1NbWXXHVtbtD/kz79z8zM7M0CMAM97z9gDv4dISefomwe8OxXKoJqN658/Irr1m8ZJm9F2lpaV27dM7MzNi5c1d5RWXMpTR40MBHH76nsKBAoO0OyYHELuuNkFQXPv/iy+dfeLmhsXHHjg6QD/n5ecnJyaKuC3973lFHHeYwL1qBrQKAeAB3iDn4ivC4cRc/GBf0b+bO++m6G2+LHyxuAw0c0P8fTz/SqaQEFKrMQT2AJjdukArRJAPHXbp85RVXXRszfJiXl1tSXJyckrxjR1Vl5Q57/j4AHHfMkbfcfG1SUhIF3CVUy4CBA2qTLC4fgeEc+GNPPDN79ty6urodO6rtW35bKCkpqXPnTrm5OXdNubl371443wZYBgCcz/9p4UUXxwbcBaWlpXUqKe7cueTpvz8cBMBpzP3Fl1559PHYgLugzMyM4uKiIYMG3nv3FHDE/mGctw9wn/7BG2np6ZWVlRf/4cqK6NGUOOmS3/32t7/5FQmZKDgWg+/AcBMjl/MLf/en+oaG6qrq8opK/1NBcZLjOMVFhQUFBWnpac889XBGejpgajWX0kWZeKD/ui7nsGr1mj9dcbUljNQ2Ov3Uk6ZOuUmlVaM1LMIAXKHScr0psw7kAUquVEwdYuMh0i9WzR1T7l2+YuWuXTWVO3bYYyd2KiosKCgoyMzK/N3/nXfQgfubYQUwOihtWpnU4Ubcu+5+4O13P7CX7zisW9euOTk5DQ0N5RUVMRPw8/JyH7xv6sgRw1QQwAEAnduueA/kowUcOOOcb96y5eprb66tq9uxo6o94rdzp5K8vLz9Jk+4/LJLqM7AJY+6YV1p2Zlnnx9nsWmpqSUlxfn5eQ/ef1eP7t1UzDgE3EP636EQcP//gaKeZhZSSCGFtDeQfARSZGVjVhoXBjwnD4KrA8UcBi4wAHAccF1H/aBL187PPPXw3+5+6OMZsRG3NlCPHt0fvG/q8GFDMW+OPizM8H8OwLgDDj7WysgrAGRnZz1w/9Rrr7tlzlzbDqEJ0aCBA576+0MZGbhVLicVBtD69WWWHRLipKqq6qoqmfe076gRnm+F/yOAA9oYMWhyr1P5gABjjMv/TGDuj5dc+N33s9sTFSCPN0uPrEOgxkgksm17uTjAsKXZ60JXVe1cuKgDamlpadm0eQt9bsODuSh0teM71drcAqCeS8Y1iP98NGb0qIceuOumW+5sD4BIqaSk+MEHpmZlZantN0ACUvgkAeMMmESnVOLmX6+6fMWKVWvXrbcX3tTU5I8NJCUl3Xzj1V06d1JZegw4dOvaNWZTW1tbN2/emp6WDvhsv8xTdcQJr4wrbEQ0njGQ20/BqSef8P4H05fEc8JhVOJqewHZZo5xEgDYU/Ln6Scfjl/+JEokd9bQEcaWIKrXHDUF/hh4fl7eow/f+9drbrLvy9zU1LS+tCzOVo0Yvs8D900tLCgA4CKfXOMBTM0JpriL33AAgOqqnR2yYOOUD0BymttJjOo8cUX2TWplcysNcESaKwAAjBs7+p/PPHbzLXe2j9uj0qSJ4++/d0phYQFif9wEZAT4LuKUOC+yfYxhQ4cNHfLYI/f9+S/Xb9m6zVLdzp274s+ZPeWk46+/7s9JSUlA4jGg8HbKJYiWCdq8aUv7WSUSiWzevGXz5i2NTU00w11D+yoqnhCjNDU1bdi4qaq6GoMHtEwhAjkDlqA0qK9vKCvbmJaaBmTdtJNaW1vTgBcXF11/7Z+vvu6WmEebWOi0U08UaLvotS+1HWWPtH0YwOIlyzwHk7SBXNfdXl6xvbwCAHhEWMva7lSGlDSVAZgjAFDHAdcdOKD/Iw/e/ddrb94c3zOg8dBxxxx5+63XyQ9kpREwFADQtmdMni0KAOogds6BsY6x8WgEEVhpWdmixUvbXqCiyh1VlTuqAKCqepeQ5zooJvvCpSrnZAoAnCTnhuv+nJGR/vK0Nyzluy7fuCn4cTE/FRcX3XfPlBHD9gE8owWkNAEhSXDwOV3l0NTcFO/xp1YSxmGvXj1wplWABTfJw4N1EqCm5uaNmzZv3LS5qamJOgrtb3BIIYUU0h6jEHCPl0q3t6am5Tc31QR9mbDoH73fWS3Nwedr5RR0SbS0br1H5hYEu/0ZmYltBx9SSHsJMXwy03eFJEtpHBuAMQfQqZeevOOA3KWaAfCszMzbb73+gP0nPvzYU/E/MhkPnXD80dddc1VBfj42z5Nlod1MZgBBssHgauiBQ15u7qMP3fPQo09Oe/XNwOoSosMOPeiO224oLCyw34aBjY5yYuMh9EBAzq96D8LNl2EV4b1IN4wcttW9e7c7brvx2utviXMvgmDyYkQdT4hpqk0Bdjsx3Ml6N9agd+uUB3MqwD2w5vHjxjz7zGPX3XBb+wG1Af373X/flAH9+2m3XXyByBBi7grrERhDTk7Www/e/YdLr7Lv0+Inx2HXXXPl5EkTFNIuxU737rEBdySxQb3ye/XGAuKCyxmNNjEA4DwlJWXqlJsvveyviTZYV4rwPa4vyYKCQaR0cjSi2PHyZ8rtN8aUP20gU0cwnH71US45jfNxBVoyvAPAcURqbG5uzuOP3PvoE88EHrOZKJ15xilXXf7H1LRUkLCpBN40/MaQC5jcZEGFh/YMdVRdWnFEHXxAbFVrZ6WaHcwtZ9CrZ4+nn3zk+Rf//eK/pnXg0zDp6ekX/d95F110QXJSkg6/GGEGCYDKrX2AGBgMk3J1gYMHDXjhuSdvuW3q97PmtLttaVddeenpp5woBIHeFhpAbdruC8woAK/DOYVRuwWU2MSP3HvUStzl0pGWZaroH2u7wUFgfJsSj6N0cTgHcBg7Zt/rrrly6t8eiPlEQiCd96tfXPqHi3TIhOlts4xgExgvu4F82llmN2NsXMXZXFcIwMGDBz7/j8dvuHnKnLk/trNux3Eu+r/zL/vTxclJDtcSQFRIOyzxaY5ZFgqhlbEKx+Gcd4SNR44R921Z3iEkQ6gyoiJ6ZAgXqqVQz/75ykuHDBl0970PxUxdj0njxo6+/bYbOpeUaJTdl/rNVFOlfa3a1bEWqen8yI9ajEhObPOKTxivDymkvZ+yc4oPOT740bHklGiHR9po/MG/jrQGP3+ZmeAhkckpaQBJgV+lpOUBhBnu8VIIuMdL9U3cSUrtKFGfX9SjQ8oRlJGVn+g5qyGF9DMiTwIjp7iRNuilWeeA4zLpybsAzHFcuVOm/NHRRx0+efLEV6a98dobb8efgxaNJk8c//vf/Wb8+DHB/p5h5iqUTpqfjjB6yWdwQZrnKSkpf7ny0oMP3P+Bhx9ftSqB3XsplRQXX/rHi04/7STHPAPWaKAj9rpBH2z3oM/oFccWoRqsAUTRBGSjwFQx2+LbAw+YfN89U66+9pb6+nY4LWqr092EhjO2WwbVUiEgFL17/BNMdsTENfHCGLgU/TCr79at6z+ffvTNt9/753MvxdyTIZCSkpLOPP2UKy6/JCc7mx61i63gCsImX9CoDnTt0umpvz988213zo07gzsrK/OmG/566CEHqS7pCrt37xZ/46U7ThA05oA6S5LADSoD0WWMc96zR/cnHrv/T5dfHX9udVDVZPGp83sZd6X88aUbd6D8OeP0ky3yZzd5z2ZMFrS8ABx7o7/iy5SUlCsv+8OBB0x++JG/L122om1VDx0y6E9//P3ECeMYiQ4KolvKYKork9KXKLPdjiho+dD2InwRcbxOnjBASSCXqgOO67jgEsxdoH6K0lJTfn/hBccec+Szz700fcZn7ck1BoCUlJTjjzvq4ot+26tXD27KYEfC7swcby00ubYogDPRVGFSMOC8uKjwkQfvfu+Dj5986tnytj61c9ihB136h4t69+rFVADGwMgEZqrkLAOuwhOipR2vrzRbItEk97aypgeDM6ntMWj1M+Y1XxK3YeTh4QwA4MjDD01JSbnnvocT2mykqKjwysv/cMzRRwgNhJPoz3DHZqK6SqytcZBHO8vUdoZWsE5VcUW4EQA4FBYVPv7Ife+89+GTTz/bNu0MAMP2GfLXP18+ccJYa7+YzGjnCv1lOvDCwVDhHWXjUabYLcaYWB8OSnFmxDQJ0K5DjADHH3f0viOHP/L40599/mXbqi0pLrrowvNPPfkEJylJch1yoINyRRkdQvkzGeng0Zdl2wmLRE2A8VjfLQmWLH4r3++xyHRIIe1uSk5JK+k6sAMLLCzp3VFFOU5SNDPdSUrpqFr+f6AQcA8ppJD2UrIkMEpbzrMZiUJQmErXFKYtGri4FURubs7vL7rg3HPOnPHJ5x9N/7QND2UXFRUedeRhJ5903PBhQ82ESVDZJBzdHZmrpusXhDg748zFBoM2x9n48WNeeuHpzz//8vU3353/08L4m9e7d6/TTjnh7LNOy8nJDvo+UH0K1Hm3wD0erF0mBDkUDCM3Mz1MMiSBSe4SieAEQIP9Jk147ZXnnnjyHx99HO9mQbm5OQcduF9JSZGnlbsj+0mDaNxhjCvsc3eRdyzNJMUOrcYBRpFMYIy4cMrDZMS95AApKalnn3X6scce9eab7348/dO160rjrDAtNfWoIw8779fnDB0yiDkMuHgqXrdGptoy/RCz+oYxh3Oxw7wDHFinTsWPP3zvm2+//+zzL8Xc4mbyxPF//fOfevbsoVavAef0SARwF6zsqMESDC4ZmjOEHzVWrBZG925d//XC0/96adpLL78WJ+iQkpIyccLYEcP3AVKOElQcxSlIDFQiMQ6ZqY6SP0HetY0h2+aN0zxrALJRlVh5ejsFA2FFzJ1MKh8/dvQLzz75+cyv3nzrvYTyPSdNHH/qKSccdshBThIejqohdnISprqomgdSNzBgXHRj91EchXvSmmNjgiwoyV0C2hjxUGNNI+JchMMdBzgXv+TAOPBePXvcetM1v7vw/A8+nD79k8/LyjYm2s3+/foee8yRJ590XNeunf2IOpJSQXrUmeYNpk52JNCk46IISEpKOuXkE448/JB33v/47bffj38TtvT0tCMOP/S0U08cNWK4wmOBcArlE3IWI4kdcc6YOCG6Q2W7RrGkcNJTzzxskUipGDMQ+lXBkcYdbWgraN7yYKjezzEpEonQzh1y8IEDB/R74KEn4ln+2dlZJ5943Pnn/bKwsAB3jdFBNQq4g5Y+XLV/9yRcM6qdHRJCEo9UcibOFScPNjFgHFhS0mmnnnjk4Ye8+/5Hb739ftmGBNbdmDGjzjrj1OOOPSo5SadDOg4LTkSR7QTGmMuNrYXUozDGnW218fYvKSnWJTHOZV5FRxOTal2sWwG6i0UKAHL4PQFeRT16dL976m0LFi564613P/v8q/iP2Bk4oP/JJx130gnHZGVno7oBFCMO0welMroIdcgOmAucsbYtawuZmLskGn1om4rXbkS8v49HeYUUUkgh7QEKD01NgJ64YkhjffCpMmde2PZjzUIKKaRoRHPo/Iez6bfqjCw8Mssl7/B2PLRHlwQAAOUVFbNmzV22bMXKVas3bNwUeHhUfn5e1y6d+/XrO3BAv3FjRw8fvk+S3JZXWbPSnsWkEtyQkoHpVqm2cA7igEQA0Af66V7Jd/LXGzZu+u672fN/Wrh23fqyso2e1L+UlJQePbr37tVj5Ijh48ePGTl8nyRMeAGgTURAlDEcBvWfPO8SXDp+ruuqQ2rxNEKcGIIc6awaxvTxqPgf+awJVFOIR68nFMQRnOR/z+GHBgGsWbPum2++m/XD3KXLVtTVGelpaampvXr17NOn15DBA8eMHrXvviNSklNkD5jMj1PTAhxc4KAPk1QnuHIPOypUApjRJXEgLJ52h0mDXA05VwNunl2pKpFZaIYnTpE7EDsPqDMYHcdRdapAFHOEt+eC8PFUsebMGuOsKtUAOpkjXR0DR5776RDgWDtxgqXFW5fjiWhedkauXrhw8Q9zfly6bMWyZSvKK7wPJxYU5Pfq2WPggH7jx42ZPGlCQUE+eo+yZu7x3jgAuFywtBpbUIfz4V/xyAtAQ2PjzC+/+fKr/yxavJTuMZWSkty3T+9xY0cfcfghI0cM00X7/uD8AHqBzCA1etL7FaxBHGAVhRMjps5VU4znclMgVFbs+Oqb/3w/a85PCxZ5khAdx+nerWufPr0GDug/ZvSoceNG5+bm6BCVZ8GrCSIjoxkjcKbaLH+Iw888Y+P9H1ED5Cwc3+huMy4UqiD0oMnZVosM//gFiNF52e1NmzZ9N2vOj/MXrF27vrRsg+dIw+zsrN69e/Xr23vM6H0nThjbuVMngQlgf0zRqBaxo7APCkeAOjNVTQx3BT/EkMA4Pl4hrI6Uk5JXvspLTJ3mqCYl6sjHOfh02HEIsamucTKvG3v8zaLXrFn3w9x5y5evWr1m7aZNm/2px47jFBUV9ujerX//vkMGD5o4fmyfPr2AsBN5Y4yW6iCQpSFOfwYQJxySI6BdbJfJKmLKli5bPuuHuQsXLl63vmyTb+floqLCPr17DRo4YNy40ePH7puVla2ZALk/AHDHSWGknbg01UmMyCgGu0MAn4DJnaQ+Y0xQtYGnRs80y5lH/BuL8HTKyzakTF/JWK6aL0aTdmm8EivlIl7DGecRrhhOHZrq8vXrYxya+torz5WUlKCswljZ0qXLP/jok/nzF/h39CopLho+fJ8D9p986MEH5OblYpdBsZc0A0QHHA/gTkwv7plBqTklX3GOY6Sm0FjpkKB2Rp3IeZB2VlPAgbuuu3TZiu9n/bBo8dL160o3b/EewZeVldWrZ/e+fXqPGT1qwoRxffv2IoJE8zXXq0/977WHXZBrTY4E55yaRlQ4JG7j0XwYrmwDo2gX1zCOgGqZYQ4JWJ0DkaKG9QXqGSYueBb3iATQIkP3RQRBDKG3s3rnrB/mzpn746pVa9atL/N0MCUlpVevHn169xo1cviE8WMGDhjgWXGEAxUnEKTdIasQ+c91VfOIuqEtpTaAZEAcDY8M8S18I47tkR4BYsQrQNSSx0NS6Rv1nYfh9ApRRYaAe0ghtY9e/8cVgdfTs4r+8OCyPdyYny+FgHsCFALuIYW05wkN4CA8haAPBpqClrSrkKQAPxn86BkDAGhuaqreuaupudltjaSkJKempeXl5qRnZBjwsAm1G09uqv/VvRxE1o6n/crCBwBsJ0EEo1ulAK2R1l01NY31Dc0trRnpaekZGXm5OcnJyaDNbgr9g8f5AfRCaNhBjpD0+CRCohxXOtCmY0wwZWUCS1vY0eZxINqObVNDzxXgrmISAMp35gSBVJgxhWzInApqbGysrt7Z2NSUmZmZmZGRk5MtGkG8X4IREP5ysXoX/T+cDM7VLvyq68opQ/Ofgib0P4kbkKEmfp+L6IiLgLtsko/rlI+tXD5MhBTfkE4hmyn0GYJxLsBMO46/pT4c4IQCVucgLKGGT5dCgDbiYWrup1yNjM2gtbW1pqamprbOYSwjPT0rOysrK8uDwpqcQ+cPd+1RMAVOqZ9L9ESqiwC7ampqdtW0tkYyMjMKC/KTk5M9jhoHz2eNgKgWeH1F4yPCZwbergvGoXPVqAmOJ10yPN/W1taq6p31dfXp6WmZmZlZ2VmpKSl6aTmK11ULHQNVBABwXWNCjJiff6baKn+MwTA+eUbIhPzidpvpqve03Tv/Wo7w6GvBCw3gmLW2tu6q2dVQ39DS0pqenpaZlZmTna1G2Aw9mvClOQr6P3+f5NRTCcylFAapL1wPf/vlAwuMekq03QNYMPN37QTc9eCb4+6bA+5yDP6RidC/MkeeNAUAoLamtq6urrG5mXFISU1JT0/Pz8tNTkkhGKOSDcZ606oQgVFQB6gqsS7rIwNudCXwA3iWCIempqaampq6+noAyMjIyM7KzMzM0nziZxXZLK6Xho7KqJ7I+cbYKImXuUD5GpsXwCeEO82FaK4+bR0YMwpkdXhmBn+kx99TJmUbUpqugrwXPwYlVMUbXEGgJJuWoWK6wADcOeeR+AD3V195rnNJiSGzqKphbMeOqqqqql01tQ5jWdlZnUo6FRbm+5e8Gj3yOIvCaUUPiOElJk+PqEvNVT19HE0FHGUqNUEZA1Q7OzKzWQ+8XztzzeF65HGtqonQQ9TY1FhXW1dXX88BMtLTMzMzcnNyHMfxqrwADFYGS9BQAhnWAkxAINWqqBH3iWjCJLJJPhsvSSbXM7RPAPBAcsUpcoNJbXL7w1SMmLcAZMBBRDUkiYEmIy+MPIPfxUwCMJdTS1JJTto15GPBH5zX1Oyqq29obGxMTU3NzMjIzc1JSkpWPAAG95kc6JkOeath9Ou2qTC/Ggo/4O7lBpsMUYPkW/JButUjSbRspExlqiytxRjF2z1Goq7X+BBSSCElTiHg3iEUbikTUkgh/TyI+Z5bZ9p3Qd/M2JrXAYcDF6+cWHWcFgfEFwEAxtLS07ukp+NHw2VUH4E4T0zht0w67ejR42+EZw/i6V4mnqLVLebYTmDC8CVb53AFiJJGpqSkFBUWskLdJGp5iyZhq0BXxJh6nFY0T7ZCAsFiW0fhIXE8oRQbDVx7fbI9etgNp4s4W2j3k9HSr57J1e8BgMu9WJnaFEWfE8dA7WerJlr6cMqBA4CMzMzMzEyuHHXDR9A/0CyEDMHQPxM3Og64umXi3EnVbVCt8Xk4fm9H/nE56GPCQBwbJx5CFlcceW6f5HQyPp6J1j6Jid4xnHS1Wwk4IDdWx6arLYzIcHs6FeC/gQDaZZo2KH8WnRwO5qhw4I7aJ0LynUJSNFeT3wiuLiosNBad5B7ZBvS3yZdcgRCgJ0fsCy1LVmia7rIcW8FRHBjjPD83Nz83F6ITdg1b4P2KNljiLMYAOmpu1JY4YkyYwNFUcdpfl/tcA6CkYrgSAVJSUzt3KgHCb8rfpM41ygLdQFCgndkD7oDDHYkKdKT8UZ1G3hTvkHna6REz62biXO3dQDhTiQ7HwxIAXPOQr0SekpJcVFgIhcE14RtTCMjKmeIAnHdcsgpvYACu4zCxVbiWwJwDY0mMuVwc6alERXT5QMSvRz7I0Wbe5nv7E3Wsg7pOlqRfQaN49ZTpEH5zmcMoqiYL1cUR7QwAjOXk5uTm5vhHHjsjx1f1VbxhDM9OZDj4Ku1T7wJhjIllJFBjMTwMHXcS5+npaenpaSWB40X+GsIctaSWFXi73N5GXBN5yYw5jHG5+73DwZV8zZneE1+NHvgGx2AVbIOukXRcSx56hZHBitZBpR/86Bs2jCp+5t0OTBfIzY3Ria0FyhqQBgPgmiJ1xSZlDGiZRUQVY6y4qLC4uIiaEYArC0eP9F2PJ6a507YwkAc4M85BPImmdvNTe/pJgURu1quITB/o2qNpZ3GPVzu7dNdFpZ2ZxzYmSy8jIyMjI0PpG2yFV6ZgY8i4y3FUSfdSIZv6GlkMpSJnnCVs41EeduSQOer3RCZxKWE5A1kJA3Blx7maKiJevQvVw42Kd/CaMd0gRtpx9XzKYaUuiaF0GDAOeXl5eXl54CGP0DMXsK+lik/pepFLjDPGXBcch7ncZdwBxuWmgIxxsQWfFB7kXIRoMoTyZNCSxxJiSBLfIiJjq7QYQ/shpJBCCunnQSHgHlJI/4+9b1tyZNetXGB/i8P//02eibFfz4vPRHjEecBtASRTqapquzsi0XtXSarMJAjiunjRQ380yaGkh5dhALKk1998NG+FVESPipVa0vujo0nU2gb8OvLarLcoA/QiLYpCrxC8kJj88E1/Y3qARRDdLh9XDjnr9ZotEIfgaJiU/BEClwTiaPQ8yT1Ow4/yb1qKDGlP4RSZiZEPRMkFStpLhyQhPmNGG+dT2+2b96bjJJM0xKVkz/VCPUuOqKaHpNpopQ/IhAzooaIydF5k9tReaIk7EIska4UTxViCDnMCGA1VkKXAThSHmi2KR6L2r6OMIciuI0xEuZx2NuqkRovQuFOCtVM8pH60sG+VF63OBfXIVq8tfaVlKSkZoiKWWS1Yn12cVEvGReYEzNYgwIxvgxP59ZovAV72DQnabuLJaVkNt11LukAIGtUqdI9nueaVpaswK9Wpnhk26oyUL3VY/EAxfImhsKZU1fgQaP2dyNTe/1iLpXff8D9i2uRuSKjhFNuGky8QB4g+KRt8Rj9f5fs9EgchKGhy33ewfoc/qhxEZCKxwiEyHZfLwwcidk3VWz3UeMiwSKWX6Ynnvgbzyj9cOeEc+MPw/xyFJ/ceJKdMGu/yj5PneKri0cLnfBB5AnK/EHcL6T0EAwOsigX4GSIxyKJh8XTssnZt1l59XVUqtzZg6Ui8RZfiEJ0itPSnqJD+pjPx07d7lCEjXV+gB4bsXvy87CbzLfTvQPzgwxXkQMmzLIyWx0idhHuv6LQHwH1W+C6WUpdU8fB2bdmmoGKg8Tau1B3p7BoG5ktvmK85+DuEvSfioHhIZIkvksKO6Kwcaf6JGp3VFl54ic+/RpSp0133fD4NDsLzu2bn3RaiRqiqXmernCXzol/yS9dcf5TjpSKYicd7AV76dpruTEBkeJiAHcRnGqDioGfJVuDI3QQu9lB/VkVl56XH6k9WdkHM8lrT25KE9WH3gnlbdaNboXrkiU24yUP9/QtdQj/Y8VYprH6sWf2MmsIHROPitQORSogoRsLzoPbQQw899EfTA7g/9NBDfytJL+mp6LQ0HdNrzxl7ST2DjKQ4E1x+eGspf9Z/UVxF6eGJoFdJIpgyxPEUBUGHc75dnakpqVhN7ZcoS/x6ZS/S6yDva6amMiTWr3ptMsW+QUmo9qtfXxUSnwbOs6Cy/0qDmABVZA64ccVEj+8vUFuJGkthmiwXJUsyqrm6TLL8458zhspBzwTBJ/BLxks/dIjD6jMfjip8xKK2VBkv2Ox6XsM3fo35qpiDlWtWqPGHJsE80Nb4DAw3Sk1tKGZQIEIrxXRWwb49DYb6Te5U1yiAD6GAd4nP0yXMLA2zAymh1dX6NnRQadvN4tUezb25wLVQ1uVavnVjYExgyAvTQVU1gVmhS/cjF1xtP95wTZ4BrR6WmKNBmFfUngyfpSTFvRkV5HWkanOmCt6GC5LW0ZOi7HvyY/6HPKI5RclP0g8Ue2GU5gad3KiIhMli0hJYffiwQDB9WihuWfEOYeyJDFi4sa0QODrEX33iJpyyguvToH8DfyamgvTlJAXXiZN/aE44dCP0IkeiKtFJtveFLwnTheRpWhxgzSXJ+pzHtC+NZXwtLrkI0GFZpv3sfjnySExnikD0eyVtbIe5gTGo6TnkV5zornFzJm9kI19QFfYMCCiyetm4pk7MxJ/Uk8Vp0fhFMwFhuT7DhvJEYqMxUIXOAtdFwblq/oDG0r94e6ZQlekb7rhZG9BZGM/W1GHnOW/sohpbVzQdkCbDCNPNV8Wbk7kVSZL7q3OrKZOpXwWPlytbSshig5u4J7hX6RYAOmMjJ+AjOuvhO7ScPKPzMt3V8OCjzy/2xXEnvL732fUqeuE7KSU9WQDM1Mw3cjwXEgCYQACMfPyyZWCIHySYUwGUDi2uNbSA37koVBVjRjVoiKDEKbnn8Wga4H24iSneGJRRDs4Sh9pF5OXhxhwLesKvA6TGuRv7nQ/po8Adpbe+T0s3rhYFoyeQjKMNtVBZhbHS6fOHHnroof9megD3hx566E8nuVvSR6ocJXy8Q7wU30zKaFJedAWmlFSyprl6uZdWBiWJH6k9kEtuWxK4QR8cYaG5gR2idC6iMwPWVDcqwSxqqNyIdLp221HnAdHlfnHeQizS5uajJqEfwq8yS47rG//W/ywze8US1Z8tvoly0TJ4BWSpNpXJzy8VSl0KBS2wpqFdJm0FaiEjhmPA74w19zGokqNf6o86XIIpA8jKq+6bpkq7AUzBOpVTwqJrais+3AQ0+nhi2mpZQv5Kp5YBzX6Jl/Cl1ak72Ss2S13XgZilchbaHt6JLC4b0l3z0z/0Gh8TdvKK+BL3RNEnLdVycEFMYUq9RwvoPiaSffuX3oFFZyerS+u6dWhUkahPWNAuUIvF6mHoBnzgRlEk0Tm/LQPZ1g/6n+DLTN81Ns3/rnTv0BogTpOy0gJEhA2EQzksxBMWP4ugjDscfWFPaFeP1iNdqzxFxvTDbozHBlBTr07+4eyEfUCc84bh/AidAjTaQLu0+5yHsJfYCf9mgOZRIMuIk5b9BvHjyWagnzKiUYuAyh9IQUJr0kZwpSpbVruxADxkcW2GA7GpxWlLgh3zPo9h+vbClJC2LP/igWkZHS/TaCndJYCfsL5Imv2Z1ksO3/RA26ASFjRDsDoT4VHMZBIymzROV2Q8ihmFm4r9JOtNo6qeLjUM5Y4RU8JwVaMoNebLDB8iusTBdu+BZqZvpFv6dtiZ1pvorPxcR2eKMptppHJb4aEHO9dI5Q3+GI1EmNXW7MXiUIOtb+Z47HPolBwRkTwqkK3Zb3iTDukjRuokt6/fjB4Tja6KZIURZ6lrzeOl4p7CTZN/unlSU4lDzKbvXoMr1BwebuzEMtjF9p0BdMDaGqSb7ypcnEN2Wr0UJ8A9LK4wlcrVifRK1Wzb0EMPPfTQH0UP4P7QQw/9ZXQq6Quk4tfGSpE59XjGOQO5CuyiZPBLAneoISPRLNWrVRieEWa+rmWGLmwfMzcIJ5sCLYm8DPVsdM9n3Mg4A/HGeXDUjZr8i8icugBKFHQcBZyyR9cjjvO8BT6FI8sjgjb0l5d/mR+7TPK+mpeXnuXirxwTfUsnbkjOT6QMBaWM4bIkHuXFQkyzwP9+rM/FUY+GHulECvUd0NNUyyEWARTk4bV+lL/YZmPbh6FC6eUul5LRo6hu7YhWv6R36kzaFtA75VUzDyjBDXqJF7UOBUEPzahVvZkeAF6nFlq9rkoMLQ71qGwYmyRuGdmUa9gMHCPw1oBfYl+HbmUw5Egq/JPs3KvoJK/MsWImi+h8SZfqoBnWsGktrYLjsTPXX0c7oeHcepbY0xuEmpxhPGK2w5BitpyQZ236m/7HBBAlc3jLVOcGD32F2HfdCRCrnUvAv9Fxn+RQ3djAizsJcMczBFDnkSbuZyn4d3todFDcRd2v/JI5J17WwdxzcOEfQvhEOgSBh7B5fp9q4ECwxvJHO53bF7bmXIe0meaD8G8E6B6Manz2YRMRPwpfzAbiOCdagNvmPIhVtkpnss+HveOzactMxyaSZhs+Lo7dUM58p1wbBYmYKOnb46JggP4FG86ej5I75xwQdpPNipYO7p/ZpQjyLR2FX5n04SgoXZt/iGX+d8n4DBN1b53mw2/Yi7URLOuLw/ThPj/8gfn8MfSsbI0CCi7/kl/FCrrlfC06A3rI2GV0DuFL7KI5TIHwi+7xqq8HxM+9E2+4eXtBHu7SEvgM2V/K8QarqOVgfnweqH2AW1lyPPKv1tCIoU2h50bDCfjBTvQMn/i3VESDbnatebw3boRHwUc+1JiFb7/N509XiUyN4EmYRLhx8H+6Bu5izdmHBGdtGMPqPbaSjm/61/SKbdFVKIfIBc0Cf+ihhx76U+gB3B966KG/gGRT0h8hlVKdSCxLE4fhfE0FrbOwDH4t0SJ7pNeRfHs6WCswzSGzuo/UncoMOyTc1jDBOWZUYUaBu6s0kiMSUefKir0ZZSRl5FbYxLr7Imuvu4bXtXnegp7GiGSjVF9UeWbS76l/1JtZefVRzmH1HjliYM1swA8GaGKqoo+gMuOlhhc+WqpL2dV8+Cq4OZ0LQma1oVn77o/2AwtMO62DWXnYiiM99wgMOUW523vhnEiS8Tdcr3z3ucQKcr9ltBV/3gqyxrsc0IChsrJWFeJyLuudqOUQjR6tb68OnQd7MRLUiJvdA4yAmKoLcNH4PgVMzDlLyRecfETsG+owsRkCKbaZQoM7JZpD0g/rotpQjDcanm4oq9MweW/RMHffwJJzWgl9/qj/oaq/eElyjF2mP1gzbwMEaZt1DBMOvpqKimOaObdR+47dKCxCSL0IUXivww/7iORKfGMxQNap21HSZq/8A3L00wnHOyRO4SqYzhbAF0UvfQ9EKFLB3OGdE17HqdZXt78wvCsBytwJ0NUcsAA3qXi+GFjvjulw8w6khnqDAYKsE9Uqg4U1k7hrKc6uCBRkH/EAVRJdJsyTiE3kLkmJiYpqTtGt9KD8D02tUuoauGiS8uC30yunZ79+ZnfCsjwwQixm645LgE/b+hJJ5ilsMbFqIM5UA9kXm7mQlwurg3v+yDOUZzq5KLpTo4AsCGxIN4S8i84ZAzLQqKpsorMtFYig4ktSNrkx8UWvurlx5/l/2ztoCRAixzNmXEvF/pTzSOQgbuV4qSSU40lsYpOD1ZC8gbPAeehJ4NEv+9zObPTFGJyKuF8sjbvkmxVcuRHpnQ7ZaxbmWuef+WJ9X2qTO/rUsZVwQ5uN4Jqz8FGcWHVl2UG+J/cNiaUg+7yLnZE7RgnjTH/CMn/ooYce+qPpAdwfeuihv4OWkr58Xkp6rpYt9/YqmVAVTyV9hela1XPZiIt6PksMfzWowIDVlcFRLgm2R0cqnOVybH9NkAWxCmwRwbYMQ+a+XPlYuptrKkXGxPTVT7bKLpe+RLvT0PZNlrzP/l0yWZdkVRVJ8vWweh9mfOtSQXIdxQ54JquUmeBH5u6O1QYDWn2oQBTI0tJUYv0RAFqChKhCue+z9D0KHtc+AH7miSuaMe1rWq3mmczerooQCGQM3SGRErbrp0I0toVBBIAu26T7udrxhfk3B7QV0tqk+IrLHDKbwwkJUOOMafJ47XC0ykVX6ei+ilKfOQyhMmy9HMecha6vcKN68lTfohX2F1RskPh0sbkHsBP+CTgyBSm7XgIxIN7Ta5GGR4MBBMG+vW2GoCpLPhsxy+eBfuri9x/0P/3/9qciqZ1cb5fT7EmE0DfZYe40xSnpS4qK5o2houYP4rit2n1yLBUE8X6Ibi9yTYD7YcDnP5GP75Cq1GWeZ/+w98B1GOAmtBPjTXn/Fvm7D6T5HjpuwWS0DdBVCbtmVQ0MCfrbfKg7ZlcB0MgYh8pHWMfGm4V67FUl/yFVxQZmBl/uxmN987BG5/StRInYmng9gbCJ2+3q0SMb/PekHCGkOuq1B7cdLOUIXT4ToFi0fWbBY8kz+grdl8/T+xJ/49R+vcXgLbr5f+E1dUzo60uSyMTc4NXAp1sWBU79g9ipa2hf5GOnu8WFiENdPkq3hoWNjM4IP4bYMrhE58SVD6bn8llFtpobOb3u86OD6AmDTXXZhgyhBr6S4+lDyBXbAgR/D0papq1kp7X9NARrZ9u4z3CueQWkn5lTyhEpAqc8X3qCHWI/hZuqBq6DYoFdQjnsQCH1HKZ7aiHhm5FuTnL6K1Yk1M1/Bx9CQZy9iFTzq55kNfkY/XBHVYtcrTOOPfTQQw/9BfQA7g899NBfQ29L+kxtI3+M7e2+dsMr6pn1tGe49xdttXSww0d0SK+n2nzGSMA4llEv6IME7N74zGKjcbfwxlxlEWiFufMP2DGjhPgQ0uA1EpfxXvPsRbRk/4dEmbJzZJnahpVHtmLuyzwK8pV4zaAPmHH4jVXSiB9zyjA8YlAZ5v3hgsexzl4/5LVUeY6EU70O0VGXMaa+qBVOrydXELoXOQTLey0rvpJLjzk3XrWqZ+hZcg2vdnwPeVPtlLqExIP094Cfn843lfXl+gdflunPMDjopNXX5qbVon44DKfi1WQh0ja5Qo8WbXcW29ttbsjxvfo4NDnbSBU30aUctYYNIRkPE1PKHIErSKw3dG9QNZxFTxZmmILbXUpSBAS8IGUZGO9P+x961d52V1Befk5vA0RivnUJM6LLqKLedZwd4J24EIIFHeGfYwLzDhN5ogmmpMlU/zAxV4s9QzDb/+3HTv5dnl8dirfyp9hylL9aqAk/zfMUfdAH4qhxEsc9RBfzzLcMBMbkjO9VkBqd4YfIGHLUlqbW9dp3zKR85ANJgxCnmpXBkZwTksDuYs3s9fwEaWx9kTdNxPRC/MXPoFjgNO4qP/DymS7Z9KCdaT/iY+Yl7rrnpNXtQhMRH5B4wDSBZ/ZyQTk+Nm4iEt9R6SbGdimSaHsFvgsnvuCbF4V0fvfROd642/9mdM41DjtvgxzeJfpg8fmZAI9RzshJQ2iY+/dyvPAyPimPrAqoJ3FqUggcgk2Ku3Otw1Mv7SkvdGBnol2pkT27ZnHWonHZROLdS4tsPsSlTL4ijCR9m4UbX4JgUy8t3IR+Im1x2c5SB725MvpXdMQ9hnPBnqSYfJM2qBfdn1dvGVb0nXj10EMPPfQb6QHcH3roob+VtiV9BVL6ZkjPqm37JjLTtQz+5qKtXs9TdaHPkgIi6zPiDEdP1B19IFBmUsq74ROZyc7CXaucO8pADGcyyzISqwLjlBu9RJfDzEi+/ZSFXhCXh5fs/1ai3Ie1LsAvmHswz4JidMxxh+SPa14rdIaVH5H1e4sBT+dfxGdoovhHKd1iOLIei0VGhOcquJ/rr70gjEHLBcWKqzQog0oshx1Ywsq87QseObB0F6CbGbhTvql816lSxFpzI3kMbS9jOJAzNWl9VF46ribYafWqCXtz8zmH0LqymqyJnQtds73pnsNLbvGR3dG7Mk74oqw52eiIK52NSw1PACIQ7xhoW0zLQPJbDffxSiWB+GJZZyjQTzuEx+Qt3MgP+p/Nz3jFcmwffLOA3gaIVPPZpHhSUSSWqrdJ3EEdD9Fs+p5D7xcX1IuXeS6HITHeFF7mjX8gY6ncsCfeGty35E0BzCVzlr/POpvXZvmDbTMnmWrcKUJqY3EMgukxZOwDtCQqytkE+yfbXxQzBB53OHxnpEgeu6p0/M7/xMPT4iDMYaiqBJpnziPwO1eS+YaNIi5+0QWcC3HVchylXC6W/kP4D/U6yedYfJguYL5+Yg4IW9dM053zJeHRAdGvO/DZkfvIuwCigwrP3zyBIRrrh82k3H3T574HK1MLS7MUm2cmhuPreahV5gk/F52Vl2103pieD+O1MluzXaXZ8sgoLcXCTNDXI1J8EiFHvpbj+VaVcC2egWcOlg94k+O1LpCMaVabJ1N9uEdEdutexmSf4Ohx9k24qUO/kbPtrw1jmaJzAZLJxibcDDoyK+bseBKxRfydK0s2Kqs+mZCS3pr8YTTJmsI2e2zb0XeD2UMPPfTQz9EDuD/00EN/E90r6RFYtmXNUlI6Sim9sAHhbsAKJ+m7XitT5bNWF7yZ1CrjmdcHf179ECzT+fRaN3ZfXtUbWFNVofXUDfGJ8l3B9ZqlOv4nvvnWkcCsAoJRLqdK9i/1020abLJah5WwhgrWtEIyatRl1kRml0yIhUoqfmYUDQKt7bP+xKInXozOlLi4jLzDsZSe6z2BLyobUUnmURNRznRQ0DmcXarwks+7Ayv0QF+QKVFaB3S3U/5Fo6JTSzm30dpmNfk0ZwusUaTVKGYndPPO3IRVOoBjVWaHsCXreCt0gw0usedSw89tL1aS9rL+4AEybaJCkRf9aRdGHLNPDM/phiixAnDdhV3LbxgmpJ5DtYq/wy1N3tTaJl9iJW88+Uf8T+WrOwJ/8TPl8Z0A0SZlq+KvKurP2XUcTf41BLDv5whRvyUVOSBigWukf3B1TdD1jn/Y/Ww/Lj3yl+lj+e+mPdw2q4u4DtCB7Rb/fVRCnAO0LwoORchvv/C1y9Nnnr03WLwZq8rRoWEZpjI3E8tQXT8w68LZCRnkQElVXPj68Vx4WW3W3WMXbBmaGFVgCbW9w+WB6zNn/N3VHBRgqdGQpCDHXSCYL0LbE7acL8xYH7w9J2zpmgLT4qqi8U7E0ycR0W+BHxAMGfZ3+2P3au7P/C/V6yriacmEn98Vd1Xg+/dF52L0PSy2/MsEeen31szv7GQ45OXwaZrkJ7F8lOMN2yuXLLk0wp2HokkXpNpR4N2HHA9A7x9EpKzWF+GGSjc1sp/sS0o9Ysx/WexqGulQBBFu3FuN5oNdUJ40boP+Ko8rH1L8iWQKmnkpm3x1UeX2revehayfjWMPPfTQQz9JD+D+0EMP/WV0KOnBIDKl2voXz7SjpLDPZPK6krh4j6pgyXSBTcpLsAoVx/R5nx7o6EPnU5PgCYjEIpRFKmvWW3gqSywRy+15E/0I6NcreYB5iDWyxsAK9hwz5FaSFmnk2+1e8AbT0FpgFpQvvEdUSlmZT9vni6h/vY5JBDyqg5q1O6riiLrqSZc8EPt+qdMDmMN28pa2aOF5q0MDQz4VOSHnOJw9a/8YYh4ZUqzhbVmnRizMPHZqHdANcEyr1UxhRsC2DuubzjRgKGagHMvsdShVmBtzm5uqEqnSiI37KWSvp4kN/5SUZq2HF9rXdguqgGIXy6La8A2uJBLey+ZxAAf4GsNIDa+t19HKNY9ARwfc5MmgtNnf4X92fpJfVOn1P31EhwCxYr4svT7F0lTUQJ6rjq/d2gcFd2LH9dQ+9Ks8guu3/iFGQQ4/V+iiy/u3yh/AKvPyEJb/5Qpo9hKfKmHlZxOgd4fMGOye3qL00m2z96x41M5e4a+4tZgEv1CV/QiAvBpHg/pja4jrA10mAOrS4OXS+Liqz/GZMNldP1PEkblYhB1NvF59wfKig2/JfZ+6TbHoxsRou0Ucvyrv9PvVc+snu5lOmVPi4PKYyFHQk1OOD6OzBhkS2XJ+yyY6S1chbftL+mxdrrx1n5/tEKuRpH0lxwOCUVMVtSMgsjtie+92BDGDtgp87ZS/sKO/uPvgqfSYo7N2aV/BEmeNh53lFjZS+iexH7bvkNiZn0xKa9Dn9KxK+40PyT8n3+5CwpM08+yXS3+5hlH+YxfTV4PXQw899NDvoAdwf+ihh/4+Wkt64EZVrxmmp7qRXMK3IOfm9hXNipq1JZelasj3mXrbstX8jPmkPt3gc4dKNiEwJ4EEUenOvA0SVx6B7cWfBN63ApRFIp2BW0VXqe93ufY7mCZl1ATVhVlLAhgGaWgzrV6MSswXGVvJZk+M6Yddcg/4lvboO2A1VxS00ZZ3w1CkKLpiLEKjuZGdkItgCYMo5aVBNvGSah5W/l2nyoBclHNa2hO2a/V6TiH4ODWpXmv1wkMxt2VxWeIaodKsKmInBaW+VJ05MLGhC1n5BaXkTBOQWE0OoM9VNJ/gKlAXKa6V6qrhVVSDnxwtIlf4mpR0daQ3+sP+h3+3yrlccnr/Ia0BYutMlo1FRTfsXv/Ddzqey1oB5CjgMAo5AIt/wJf9w/p2g2r8EB3kD8Kh2rQHeexF/oSy2ct4tNTfV15rL5CNEFqAPiQSkxudzOLOnVb2CJlaYFPWzwjcSqEq7loDTPyAmY1TdW91qQIChrkJO9teWR3g1TNhYYPnUQ748ozzLiKsvVRWr1eaNjyIrw+6YkXYaAl590FBQds9skeEjxuMV6CMKWdfus7dolVNtzI641KdrvV8F52l+fwenaPJeYuBysaVPhcu0y0YY5fJ8Ac5XgRQvXCX46EueoCwsdDM1rtsZONKMynJXtixfj76GWhSCIeukV1dsLFKl8WM8LQudnta7CUlP+PBhJjh5ldm7vmQhXnJob80+faoO657zcEeeuihh/4gegD3hx566K8kWZYwren7djGjALNVzJl591yTHw/KubmoXNO/BmdUTCf5jAv2iy6dx8YngNrv/Dx4O6Sq+xQcm0qes/AOUDrPa9P71k9lQX+5jOklTBNpupTBLEm8P2fY4QTZ4oSf5s0zIo5fJPZI1ZCUzq4LUNe++3IplrM+dyp0EN/Z6uVfO130qswm7K3Vf+WWcniGqxsgsb79005Fhbnuz/AFUQAWZU6GukYFA33FE3cWWYBxfxsbDZwCIar03XGFDS/81qqvCuHdZ9fuYi3I6QViZ70zHM9jl0WMr0oudPWuEX5PLRY/6Qz/Pv+z9wD19h+jm85EPwFPa3xFRfFpx0UkdgwFq3U9dcObgA45XfuHjb1sOdmqt3x7SFb5o2LZbdoj7zwEnbeLoJES+GwsaK7UWL0VoFvj31OViyhJWhpyQ0zMtOkicmjFt284Lk6DGzySRL9qXDtce9uuCxC3Ppb6BQTWDryMDzvHfaZhiCV5fv074N1FIQRfvyPlwV6nc/VYNCk6N8n69JulW3Wm843nuaNIh+g8mgpVOddUqjKwld/XfL74GSWRrlDaoHx+JccDzQprUwK0g+YA0HSmfuUNCz1Zck5uCXw1HJY5e/gw223XmpPH5z6EOVk212INNzUEXCnAgd76kEXB+B0uTL496iqDupD/Qw899NAfQg/g/tBDD/2t1Ep6UPp+qOrBBapcwVj8WOHf/OYOoKbv1jPKvco68pl3L5nqNp88ZL09BY+PqNQ5lWGt1eSj8XBId9+LZe0Iwd9wJpE11gVMk5xhQU61Jo4PxXdV95oQsL3eXnskG9wCf0JZPwPWWpAXvLtK2IofXlOb+hUPrcVIE7l/H2gZbr1tJ6LWKWkDuu1U9KW+MJihDQG31Rj4mlb3/t5gQ3JyqxW6e7xMEDsaZu/3nvo1h+JO2p9OJgCb7jppONxlOXsF8Do1tzG9wrIE8NEK79/of7alMnZP+6mCWd5hvlhg93L/pdPLDmwY3/S6erb0D8HMBmaiViZ/eNM/3PLD+yH4EboO0PdcBBmnxMQYTgH6rcEd8BqpD1SBjGjoOpForOK9qrwZnVVVsOgtcVWYcYd2x5tt0LFrTdjNyB4f7m28ua7vLzlex+zNgGVR1EwmJhpALPLPf/7fax7+33/9l2Lser1oQ5YmOfrubpN/mvKIRXTsBpHTrV1gGteajy+lW0t0FmqiJ06bVKqp0GFYrg3rfjIcjGFja0vb93K8loBVq7Ecr66Dydu/kA51JrOnG7Pdd63mIR+Fm8LtwclvmbGW3yrAkZrTuAjdn8aY7o5O6vSbgtdDDz300A/SA7g/9NBDfzFF8kqfALhYzIjMaGdJqWfJ49ckbi1H31by5S5GH7gGO6A/yefKx/sFR7v8e+UtcOdzFo4TDziW33uxrK2fgLaPYLKrVYed30JxqgOzEeeQMMTJe2yvW2rAjZbldGYIHOXsrcypR9a4esQQ9wJraW3zRmhAEzPi5oKNO526GFA+LonZi8EaY+DeYK1avajH0dwYcBHZKExDH5iNTyCkPec7Vg9M01s/+iCcw1FoevlNDb82vYtG/0f8z1ZuP1tAyyXmi6Xjv0lFiZlyo9TF1IwhMjNNS7/jH07h6Xjn92grf1xNe2CrePJxgP5UCcNAyqfv+Nxy8lZVuti/oCo4KO2nmPgdGySxlHs/olWpXNU/e2brvky8bDbKv1Lz5aL33//4xz+un/mf//nP4CCEIhZO/J8I/IX4Anhnh38ebW1Nt2Q3kbPp8i159Ka3Ph9fS6XeOHx8am5rMvxFxjoDLXW0BOyc48XNS2fODd0IstzTXozc7NqXww2KSCf/RXb7CVAEvmfmTB9HkE+t/kKXPm36oYceeuh/ih7A/aGHHvrr6WZVj9sF87YRfjI3vX29TQelLztC4Cmt0qhPK3yeKurr1PMC6cM7QZ0S8YvM9oQzRkfecvsRTFb53LCqH7brxzCEIiRM55Cg4hf3k/h+5RhCnGcTyLoel2zTo5e/81rIKor+2OiU0LrI2506DqjBEMv6UAVDToP1bqTyORds1NeDnpk8xEMOlgXi/Lt12kWlt/wphcMMo0yWbBi+I7cL09Mziz5t9Gf9Tzzq8JCfr5bfRgfgQkU/009c9RpYVnf6Q8piarwbgvv8XDPz3zMEFYeKD3Ev8H3meC+i8/L26wEa71RltZEPVUV56zDnSVU+9asXbHztgq/Rnceua29ZSV6vFJEIJA6VmdOxbZmY//a//vd1K//n3//jX//1X3yRu/4v7hwTb1ekHRby4ioJflaofUU84Z6Hb/nU8zS6MPOtz78Xnd8z8B1z29rat3O83m5g7v7YluMBBXm/K/PrILumIgB+xHI/9fBjbGPfRsh8+/fzwx+58vKufQrxoO0PPfTQn0n/HwAA///sfXeAHcWRd/W8HDbnoF1pd5UjEkECBIiMyCYaB8Bnm7PvbIwJDmd/Tmfjczgbk4wNGGyfA9hEB0SQARElguIqrvJKWm3S5vi6vj86z8wLGwQCTSF2982b6a6urq7u/lVNtQe4e+SRRx8GcqIqYOyWIeXGfmQ71ZT7CkgNJyXj07nTSMdnesZceXMifYJbPRo6BUCpGEtdtWvtkFwyzivJYTJIKyhXImYAqSwW0QIN4NDbzkB5nRxcuVSaBLXhBds4dxVvsqZk0MW2ay5wfNoOTSbJ5B1q7yzhzHDvrCQYSiY1urNBiIvCaA4VOw+Qsc6MjpIXqw8Bp4anEtqIuM28p0ZU6djtD4yko8eLRjQ7wJhVNHWriSMMU1SRab+PyD6k5Sft4+NC4zfxvf8TtCxz7L2Tkjd3PQE3XxG4Ke1IKfPHnSIaS2mZlGnDKI2b0bXTQCKta9euT131xo2bl5x6Mtcsov7nADtfNXGwXYDvErvkDZXt1RruvtwyffBG68BNbu/77HyYbL4tf6C87XCs8cQCzGXUjG6N53adt9SpommN/LiviOTjY59uMqfDMeSdl+H9WEJ45JFHHo2FPMDdI488+pCQy06MXwdIsr6EMSwxXYFOSLIW1O935VPbY8PY+UzHmzvoBuAOK9h4SM3GSFfJKUpLDpNlyqezCkeZBNQBm/YynfJPzW0SzuU2zKUWSzvNMxPxJrtBPGuXczK1H0WjbN/YKnKFDNJ2VuZanclwy4AHdzZ0ZjKufURkMDMShjPldlx66r2yP5ncP86U+ewAo2r4iOwecUR3Zs7JGJhJyk+GxY6R3oOJz1aX8zJk0Pyx8JkJq5nzZkOZTWYMTpIxM0IeMqXDoSqpy9RbhAioMqQBIUCpS2nskZbWthWvvp666n+9uOKzn742EAwSUFg7L0ekGyFEA7CJiIU3Er/bmkA0nbEjniNaxnwwZ2cXNpyPvGdrPKLOzAC92JEuwEY0eJNA/+/dikjnZKTTDaQzI2M3AiMpwX0FNY7MeOSRRx4dPvIAd4888uhDRamBldTbVJ0y3z+n3lckKyEzACg9n6PjLeVOHjQpKQZGxUOaVXLaMjPuTcicT0KI3AObm1JVpihh1G0nRGVuceFcZDshYxMvf47XR1IJSvbFWBpllul2h7uq89/OzhpVk9Ow4Yyb0292jiztntHI31GXvRCmwikKT8mwu4ZDem7Tb1AzADvgMNkfnY1RFTtKGunsAGNQ0dStdhU+JJf/aDmBTIbtGAofMY3vBJ0Z26OcoEfUQYdvgLxXqjKKR5LhcWPUJWexOiLJLSoQhrzLZwxPOZMYIv7s53enPTR1b+O+3/3hkX+77uMcT1cYLaubY+186cAvynudaLtd/MkRc/57PJZbR8jsDCMdbu/HGg9EUp0RlOlaD6RraYpJdnynmxScpLUh477gHyGlGu+QbuaC93wV4ZFHHnk0UvIAd4888uhDSMkW8eC+xIQRom9Euy09G2lvSIEPpuVzLLwlW4U7GXDclgpkJCSjBXDmq+QMehMcgkpRGi8zWdu1V4xdy8wEYOVVQBK29SoAwHFLipak2ook2d3ZOBxTo1KQM1AreSEj0upMVVrykKHCgIvkM6JkqR5G8UgmDMvr8vt0cEMaZvRgQNd63xv7k66ow0Ujnx1g1EPSteqM2YDxtQ9pWXrP6AMxQY9q3hlnUzYGTjKlMfS//UnBYaZ8JJE/kaWxGyhFUSaH0RHQlfi3iIjY3z/w4/+984XlL2XCyf0PPBwIBD75savBb0kmONQujtQk6rKGyadD2/WrGS63HHQkz86QuVanGG6HaY2XrMzxWuOl5CHNJKuV4zTy429GxqaBaWsZ8SP606N/0oPaPfLIow8CeYC7Rx559KGljJeYkCH6lvnqbkQLwZHyyUhD3zKvys6b/NtZuwkR2stIWYNRmFMUo1slp5YSjFYOqcFT15iwsdSSMspslFUkqy5dYN341OhaUQq9cuNhrLumZDGqKRhwYyMNaZ04gqdcyyFuXimBLjnyI6gbVBlu36ZnaxSCOqz2532kkbQaDpOKpmVjXJhJ3sZk7pbx6aC0GQk+EBP0e2zKYAyq8n4NrLQZbNI+6GyyBNBdnwNEMENxCZChxNDWrds7OjoONB18d/Xal15+taWlNUNOKMW77/n13/72zMknLZw9e2ZxUWE8Hrd81sSqqng8JhgUIDsXtVPcLl3nXG6lsPDuRRwZs7O5qBsrDylus3E1xsQmaRdg78FyyMmG2w3jxkAyHjJhw8HJEUpHyCrCI4888igT8gB3jzzy6ENOaUN7tDvHs65RP5vh9nV89zzy29S7wVGQbI6eLnPUNFIpZVhgJvuQsZBs++GrQpINzD18NY4I4T1MbGS43x47A2Pn38aq7hRx9fqMtMZ0Tp1xFtQHFGe30fuun4ePjdQ4e4YPjrTXMuffWUvaZz9YE/Soy39/2RgRjRcPyYxhauLzHEFEIEDaWtuvuPrasbCxa/eeXbv3wB8flVceeuDehSccy+F1Ymig/Fv0SCq0PdmYShfoMEp1PRy6NApeRh1aIV9WSHtzhuJK694bO30glkPvDRuHiY7MJYRHHnnkUVryAHePPPLoKKLDAUSO+ypwHJkcEW+uYdGuDDivudaTrKhxkdjYpZQ29H7Uwk+98RuXKjKsbhxrHGOvjZdWjxcGMTpk0O1b9/LNqpM+zvxbaSHyEUlMDuRR4x2jqzd1UUc4HSGtHvtoHd+I9dTvyqSudyy1jCMSdMRO0ONoUd97TmSX2eodo7LZgFG30hCAoMbDYSVCQCRwl1HH9oj15M9mEk2cqhMzH31HyOw8dk4y90wke9b5SkEK9t6v8XuECNz57Pu1PvTII488+hCTB7h75JFHRym5LhBTvvL5Piwo37NK06UdMO5NAS1qD6apaxybdpik9B4I/71XqiNhX/RB4SGFomo4uxwbSU2HPNhQL0kfceg4vthWC7i9Y562BcmKzZyOhJ567+nIafXYPabjQmlLHhfoU1fXZHUdtRN0Wnq/lgoOBDOjQmzMyjJdnYWyTBS52wERUH6GNBloxkZE/SQgD1AFu6LaWjS6eOpknfheqtn7qNLjNbozv/lIGL9HAg+SjihmPPLII48+HOQB7h555JFHio7O5WayfY7cBWdekvksgeSw4NjRwA8THb5Myh8actXSwyel8RsU6maGvBPiUrgcDjbnVkoO0/u3vFE2FvoAjcoM38PQrwGA05GT2lE6jhGRyaqAkbwh5NF7TOmsImRoGHUfZDJjaJaJWuHEqIgAIAGC45E/30EivF1fzLi+j2R8SH4k++jo8PnSjhDyxOWRRx555NGHlTzA3SOPPPLo6KVRoIojiUJCUZQ78n7U7otGmpwUPCllds94SSllJiWXt/5TkMkSi8R0GQ4sWJMQMlr/VlLnloe5Z0ij0Dc4AgZmCrYzgEGdWKd7xK6sa0TJEJJ9n1pmnsYemZS5VcykMPaLHRnjagyTlYmK9Jh3iEUjV191GSD7T4S8848EAXlFslQRtS7GMCGE/RB/ECgpKiYCbyfy/gwUOE3jvXGhkScujzzyyCOPPsTkAe4eeeSRR0cpjSOq6HqbttthyHtS2P0o2ReNPc0xaFJ9H9MHH1YaXymNCwPOQZHcU2X3Ieksib/5cGB3pUasUud60m+EwzbEPqyaxmiMwZXvr9dwXN/DMB5Jq0uZAf2uPKjgZe/NjA8KJV8tuMSnpy7KOYXpvS3L1HXAJXEMAQKAyAPcASErK+u/vnozIlBKERApRUQqgXeB4hucALEsi0HshBD2gf9kvy2WPcZFFzPPBq61wnjCeeNROC4+KGbkSEtm5ZFHHnnk0QeFPMDdI4888sgjTs79s77NyByZSnLumYEzJqvFWU4SVkeMJaXeF40wVHlknIxLILYCDsa8xxtFoO6IMrqMDsQc9+1x5onaXT+aOV7QeUNq2N1WjuN8VKSU16A/mGE6giSuBfsQ0yAtu2wPd0ruZEWNS1qScVG8w6dvIx1fI5VACsg7GdSeSRWpdUkWksJcZwb0p38zg78Jon1xONR1LJ0yCtuS4VOjKNZJSc6EGMdxzX+nKDzZrCe1SDeGiAQRbPaQUqrnlmEh7bxejqSLNQsB5BpICQE5HImsEZEnsGHMsB8EEJDfpePiyoACWOwTUc+596xohpt908WVXAfs48J1HGVitd4D5RzReiDZ/Sn8hRm87GWIC9H9bKG04hr7SDlMw9wjjzzyyKMPB3mAu0ceeeTR0UhJwnhd9s8ORJL/dhSpoBO3qF65CcFku6O0SNw4BuqOIsuqDWnNkJO0+0y3zN3setLH5fVx3NfZuilD4YxXB7kqm5s+GB/TVpUM/sicK9cQTrArA/9t3mIMBz0uWOtxNLCd5NC/k5zYrtZx7v1guzq+gytzcoPbRlnIWMpxxY4dUav2p5JhOvofhxvrBKFRgiW9TwGSe0xdryR7G0NcoU5M3LWZ6EgDklm/ICTJKwJm5x4OdR3LjOAU44j8ZPqDo6gu8/vHLii3lkIyqD0Fn8lUUTNcamGga7hWHRIClCIiT+su9BWAAkGgAtEmgECAUgSZ2p1YCEiIpcdFc80mhFgWUYHuBAiIn9xIs1+WDyFl8i63i/y387aUhkL5BUbxxpLbQB6Tch6O9UBqcaVeCTgKYcZ8NOIaX8tsK9ND3j3yyCOPPPIAd4888sijo45So+1O9NO2acwsjJEQ4txRqwedm6Bk+yLX/fwY0bpRl+MUzuj2clrUHgK4NJyBUKKKpOUT43C59JS6uaOTzBg7KIVTgX0jXTWOGwC00+pSgCCjg8OSDApg/WV+qx4SLKEMp2Sous6JibMboXyUGr6otJ4YObjM4ZMR5u5oWmokyHktFaXFpFLA02lpLCqXQhMo1VlyxYMUApV6VGZe+ygk4NZ8O8+jgEElJ+bbGAwJtSueiYaDU1yOVzpSE9EHhc6eA9kfgQXOhHTXy2GdDlKXMO5+mnERlNMk6hOWswpIogyCOCTqhNoBAIAC2O0qoryoo6ssfTtouDubDAgQoEi18hGRQ+csjzuxLMUKcIydpZWxBOBOQPwHBAhhKLtc0Egxan+kgI/d3QzgUDk3DcTMx4Vb7aNf5zCiYhUy6uD3ZAyMSFwp/AfjIq5xsckpSvZgd4888sijo5k8wN0jjzzy6GinFGi7/Mq4x/gliKB2USKcfJeqb3j0UPfUmHtanChZeLjBlyM2M1k5qSkFLgzGVtB+v6ON/HeyQtyYNEK3zP3syAIYJVM23kYtmbRiSd074jZXJkHoXgpOdFm4BLhJNG2kDUk9KBAZEqGwcu1h5F8YaDvoiA0rSRskRo0p8gmA2YOEGLCmKaj0jR5J340Y+LO5Q5I3x334OCmFrroWlaS01FJNr2+aMtgHkX5TCsdGsusphJCuHxnnaWFQSNJ8BYPaDJEr5p6kdpcWgXunqG91FxEApNbYTASYCUA9dqOXlpmxQNvJZoFRFJWCt8yKd5pEkGMEzfxXNqDcTdMIiBB13R8vr9t4l8aWEJSVo8glg+w0VEB+DYg09dy0SggekDDttYjROyLCndWs0HZFAICARNwi5xdehWipuzx1IdicVeZtxiTu0B8EAJF8LBWN1zonxeNpS8hwwQZJ1S+pGZFXbL7zMYprvEZK2nnWw9w98sgjj45a8gB3jzzyyKOji9ICi66YuwQDtads5QIh7GsRS6YKUbtrtl/SMUEnezbEwQ3P0gtP+3o1ABjIpts9agvt+m0yTiQztvLdoC6V4DhZ8G/yXTHfRgIw9MH+YLLwseSSUf3I7k0hGRM2da3F+ZX8I1WUqwnW2O5JtdlOAb7rsLttZ+6Ggbr/bX40B4A2Rhjm496bAAA8NFJXfAAAoKaGs2Tuei1S5sn2+oQHygthuOKkJpJjl0OyEZFh38nSJEOu35u3uXpE1A1pYWVdG5NxnqIoTR/ch5jzZl3lHOgMbxSq6G/jcSfKnMKAiHuSveWjeEYzuH6EMKizpXYYFEwl0W214/UL1H1OxBHnawNPtTvd4cUUGpuZADOKqUeVCjy1nqSyWikdA2kgtrTwXFqELgUImFZQmUya4C4E23BmOqN0wLFK0B4lAMIYMgxdt13MJSl7WetwFLXIKlDpkkDeWcFCh9EihCICEIsFp7OyCACCZdlnEB1EN2TCkrsTER1PWKZ3eQMfC8lwW33cgfa+ms1Q6GstXov4qC1I0HX6clgYyGSdk0yr9btSfZd8pZT5MsnN2II26yUzcVx1ZRVjFFcKIyC5zRAn1+1zMpPiYe4eeeSRR0cneYC7Rx555NHRS8nQdsef6iNo+59kpRIQMWlEB9Tl7pptVjn46ERI3FCbVGhsShCW3UBtRWnIuF5MmrhUPabVBsjK0tyAOVmOFLU7nCq7wGRDbSOBgxF23pJt51w5AQfgBQ7JmK1zEa/DozDiDnLClxogmBQ0B3fo0xnjljTuOEnHOVVOKr2e5cCA29lfEm8dTuC2vT3tXYP9gzQa9pXmh6tLIzqsJMECE/lF0DF3YH2sA1e2pgIg1YBuhTVIPEVHCtDhEhhp3yVT6WRlprhL1qhxZR8+6aqwDSJ3zp1FmRzqas/JFTuTI4vqOZ5MfUME4eZJIzobLuOKgCeHZnSjbAN3DBsuYXGbBXf8UjAoy6WjN07irRo/hgSAC9kFVdQZZjScwMGhRCTkczhTiWBYmUSbxuooYVp1hQywLadJd50OwA2VdhpMcLeZqWal1PBcklnAfcbJhD39e/3OzBBANWZthWgLBtZBDrxdH1ziSd6ZwpDzU1ERCCHaEamUUlmgocNSpRnGKhz7CIB8licWICXaYoMfi4oIBKRVYIllGITOcreDSuEutUH8JkTejEDAbl2dSmIXtbxumwWGEzg0TCMhny4uUaZ9QeK05I56M1nnJHVKmbMSJHk8mXLax5StbNvNDleBsu3SxLEipYXRxYWGe2Y04spwEhQ8ZDpSwGFSbDV6sLtHHnnk0dFGHuDukUceeXQUUTJczLH9wCQ/wdgfmTFsAhchchNOAOTOSABM/GA0bXeEThDZsS0xGHfAMY5SzCfN62xDLzdF9q2gXrsTFAa+bXbhhFEikXACJWxDqF2RCUkU7mZDli11upuxQ3YeYygfz2Qrp8U+G5iXbF0mcfRuWuTeQbZGpSxBd0IwTmxF6eUYzQGz4+SO3QE0q2amIBtcItAc9o1ESQ3/064Dvb98YueKNa19Awm9qJL80KcvnHjZaeUoXvsgRGEuwA7704I3RYmKAZucCAGk4lkGIyGHliQyLJot5emCjNhGROq+S+HnSEHO+0XvgBCpHZiQapkCzbEh3U629aKcMeZunHBKoW9S5dxiKqXGuiRdoS7ZDRRiaAPFknEODoFI/aEUBB6odBQAmcPJoVB2peIwFfuTqxN/UFcn3XMgWZOTgg1D120jIuxr6fv2A/VvbTpEKdZWxG77+NQTZuTLEqRg9ekAHCnjTYGoqhyoYpq5QN6TxOgpEbmWk3w6IJD8vaUU7hPQwD5X/6KmqHbekjUt2QXnpJnSJaBmB30aYkqLKkRdFiSNG2zY0fGfP11rY4XVcfHishuvrJWrAorKgrGRwnxF5rJD/QkArCIxgaJUXykjAohgsReAwCJIqYh/J9wGo8XXJRZLOCNWLQJ2l7on4XeJ1gNTV80UICKlCWIEp4M510vjya7zRu092P/dB+vf2qzGxfHT80SPo9b1cui5WBjblJp8nZNqNrf1uHwWuEkcxXpAdhwnp5E3dds+d4s/uMFhZuQ7D9jFpS0g7a9FphCX28rHNjvYxZLCnjiLkmzbivLII4888ujoJA9w98gjjzw6SskBLILAu2w/+WYEtf8M/IbvQBGQiFgyR3Ad3+cQwhEcGx6HGo5j3+G4AdZER13lbbaLGkhkbLFcIT8n0uGEF7Vts+KEGAHLZmPEtlMLPbNtUzFZtLsIF9XTgxguCtTCSxXakDQomvHvArVozLPbqGxXhmJxdpCensKUAzqLlVGN2kfVLh6k6F6js2cN1MAGDoKL/MHtb3WzfoUhmbIh8vZVmw7d/Iv1vSbUzqipbeD7D28OB62lJ5YClWi7HALIf/Im2arlVQ8M0i17utu6BvsGErGwLyceqCmPZUX9HOPiuBUBoFIbUw8unVxVWh9HNtHpcnK2V9c0PSRc02EbSO3+LoKeusQGC0oYLjOb4ARiQHIigR79WxtEpeuAa0ylxhui9rqDs1JTREoCqTk3W+0UBceVNJCLc8XCxrWr/J6hYbpzf19Te393byI37i/MDdaUxwjLdS1BdyDEoU4K2uTXZSvschZjBADgW/fXr9rYzm5raOy5+Rdrl/3spGjYzwSvCdMOlqUUoH6nu6fEKVKbeHlZmvFxODJ1tTc4ceDgBsSWYjqwlaC3wlUNROy/0wCmuaINVdlHGU2aNoblSDEnU1TB6NqagWnO0DB29AyBG/X2J9id3KlDeLQ4MwICbWf1srNSqVYH0UB/PjUwHqn0QWrDihACSIFYQBDQ4nHuBHmKGI4jy+NRCUPUCXAg3nD/EEJQhrkjgKVPmkyNzbc07IaFGUPdbnznQfu4eOZnJ0VDFiKxLDv0rA0Qp04jOqycw03iss5JNhWCXXmS6nay9YBp4tidSvd0BrSbQbMw8ineBET89gPu4mLn3YLp2kwhLj3rlLnyMbh1jjhbNi29IjAlL4txdcG6WgOPPPLII48+xOQB7h555JFHRzvpaI7+CRHvfqzh0eX72PVkj/t9VizsK8oN1lXGF87MWzgz1++z9J2OgE8YtqhgRbbx0MA42z4HbXt6MIpU+22zLWrP44T8xM7cyGDghPwQ2f7NeFYACgjGhg21vaguQzR3rQb6L7dheuuIKTFAZOF1bCMq+Rf4CxqbWFFrJjs5DqjZE5uAHkqfLI5eFwuonbmzg4CBMmAGx6H2coAsXCQCln1E9ZJdy+GNJRY4cATJmOSBNchsvkG6njjQZ5CgE9HgJ6mrHd2DX/9lvUTbCYEffX7mnNrs637w7v6Wfnbx2ZUHz1tYzEAbFtLOcHYOiUp0UtMWSiFB4e+v7X/ylQPrGzoTRsYPsCwyvTp+wUlll55aFvD7mJSEYtgj+GzwvS55p/ClhssUN7pMTAgjqUEwhaw0TQBtdjRKU1tD8uY9enUK7NaKkoNGR0LdQVuJIYLR+0QCTCLThYvKIfeUGBqrYShERJfrwJbeF07HEoI64MHgXIdmbOCOjuxo/aIU1Og0QETYsqf7j8/t+dc7LV29w3pl+dnBU+cV3HDJxKLcMKtcc4naRa0LkP1NpbAUgiaGLuK6hk69ru6+4W2NPbNqsiyu+YQQO1imDTFFmsF08cwJsdtNjVasO6rINCf1dOB8TUGHobWLcmhLVtWXDgE6rxiPixIQkwOjoPeuWVqyce06aVJqMGZqr7TS6pho1guU6gNRKVxNeeTH/zmzobHnd8/s6ekz3JCodJWbQAWx87LUGgARe/oTF9z6OmRIaACnRXnBB78yyyJIqQWEWjx9ElMvgbITNccRMeI4rq7kKRwCypRRNvUgAiI1VUNxIA2LthhAZDMrIc5x0dDYPasmmwAmElTiyMLzJDUQXU8E1RWDEGLrfTAWEeyzZCyZ8oCu3kmUM9l6gOoFmrqnNAuEEuhN0J2ajAHmckkmLuECl12TSlyIaHNm6Ayb3Ooi1seC3Q7obddbobXR3l/ovOSRRx555NGHlzzA3SOPPPLoaCF9e2ADFrWL/Ea28ejrp51JotV0auuEPQf73tnS8cjyxryswMfPrrzqzIqg3wIQcWk83wyRcbhEe39c7lUM0BkNJm3wioDGjEBvyb3tZgFbsw/8Hn3b44Rl9U2XgpJMkM4Gu9uipiSyoAMWGn4BYvsvQXrCcszqe1MNk5LlSJAdAWyBpiZsr7dFbAAdkI3cGaqmabt00APMNdjUDutAkg5CR4g6FxbvFAMC1qFPLesOsjrVbl/8hUgFbCfvBE2X+F7aGd+dJC7PFJkOJBEARCqiQREBgTIo7P+ebWzvUgNk/pTcU+cVIOLZxxU9/M897GJW1C9qE1Hu4gBVo/c0Ia1t6Pzebzbv2N/ryhuluGFH14YdXX94ds8dX5pdXRoDInFPGStKNNzBPt4F4AJOlRZ3Mj8HU0rNNLD7kwpPaprTthhS1+AVEHl1RAnGU67qakCuWl+DFuavSjMBDmUxUBtgYhTLAYRUAr7CcCAAQZlbmkiNJepQCmWUzIYQqU4622AKXFgqo/mEKO3V0Rw29HQ3nv4Uu0SFulLEXz+188G/7RpOuPRcW+fg4y/vf+bNg//92emnzitgniFCUEDYNq4QuaExhocmKqqbzqyov3/QQF1zYz4uaSJ4FBprqqgxHSQS6gY3fB/B9BKBaWqcSeqlAKVstcFiaKPjW1YE2MQupWHjHDSbmQyhM6uTAjcMr1mL+0cdrASumfpgAd3hZ+PQWZ4+ZkVHU9TcZkg5ZqpZS4yFfafOKzh1bkFhdvC/H95iYxVR+NxFohYmTmasGLArxU4pdvYYzqHMKRS0eNA6QYGPI0EgxJJ+agWuq/fyCLDHLCDsLQ9gj/Nwe8uy5LQi4F1leixigRoXIJWBKZvsUkTqNi78INoP6lQP1EyEEKP4gxiR9bpXxuXNHmkp9Uq1xw3lcRsXbDbXMfek6wG3OQWk8oAwIsDsLFFDRl8mIQBNcEA/hbhYhiApLm1JYxcXANrEhagYdsyAOqmR6MDKjdWFvvzQBO9h7h555JFHRy95gLtHHnnk0VFNJl6jds7s2lVnlC+el9+wt/u+J3fZ4iKrSyNz67IpxbbOoQ07ujrExri9a+jOv+545s2DP7hhenVphEEeonAGtTNkhOVsBbHNZndo4Ugg9stEsaVD7ZxJEFC1W7u03TsAj3O03SOhYQOJA21TxHZSwN+AV7CXhnmB2MupwimD51QcpYxrBv6Utp8EgL/8q3Hjri4AmD8l9/wTSzhPxJKh0PJBqlBNRAX9sJ9u8W8AgBJWQOC5bHUh27BL1DbGapfuAHpEAYoXZwcBy7grmeI5AgB5yCEvSO5+ibxLyp77FwAQyU/+uJXlSb/01PLZNdmCISJP35W9pnUH6lGrcjstMVlUf8mv+A0cTqJqZ07Z34Q37NmVB3WZzK7JYvv26dVxdiUS8l19RoXsK9ACOwFkrDQR6oaI8OzKg995cPPgMB8UoaB14YmlcydnUwprGzqfXLFfwqZ7Dvbd8KM1f/3+cdGw3wbS6c0BA0oWn3lSBWNw2f0cKDrAgP+MWuxkvKfCNU0Tt/GtQNlAOeWI6hhHZDE7/1CVY2Pb5mIRAKA5lsHoeBkRKevQBhcFICvr25etbAKAgpzQ5z8ySciRCEXmjwtgUsnNTdqow/QOgSvO+VOikfrokFinvCiaZtNigYhSAAI//r+tjyxvZF/Pqsn690smTiqP7j3Y9+Df9rxZzxM19A0kvnZv/YNfP2ZadVwKTEYcs89GmhphdrRAeADgUJns8ytOL7/nsR1SFEvmF1YURRAAKTvrgkhxCSMphWmfDgANASoTIY0VY1PzP7KL0g3E5CaNsNQiDZ1U5kt4BA2sTa9UJ63H7bik/rjGg6MICd1pRyjrNekOK6ft0jkBMSnoGKKGZSMAm0Q0WyGcN7qg9EM4hXeETd/KbiAShkrLdYTU2Ll12eAgpb28o3mTOSrNcxrx6TIctO67dU53X+Lvrzctf7vFVtTZxxeG/BaIjqYUdx7oq9/Zzb5NUPGKFj+xmhBhXIjF1yRyNBMgLB8e6yYWBy1e8rKE8ScMlpWYO4AFTLeETaSY0JFufcY3TQ25Ykn5PY+rcXHa/MKKogirkSIAQYsQ9Z4NIdocyrPjgFMLZc+ZL8bpyumqWlrvGI+Duc4BNScaz8qhkcLESSW05bchmqz0IgV0z0eT04yUF4ZZWQnKvJIa5u4mLlO35cLFYNi5qGPKAUnkbA5KNajlVc1X4QHsHnnkkUdHKXmAu0ceeeSRRwDGhofvthCxvChcVhhaMCWnf5De9dcd+v1za7O/8rEa9neC4j9ea77zrzt7+nkU0ta9PTf8eM1dN82qqYiB2HAIqB05DCfimDQ4Dw2wDFg8mg7VSXjF2AJR86KA6gjbDyOCjuqau1ANJmOhqRr6pvA1pAJ/kV9JMF3s81ALphb8y9/a3puVxzeUEgv+w3N7dx3gEc1LFxVzeJZSIkBavTpqbnFlxxm/AGxbPIFBiy0ox6lB7IplqCnojIkz6owNtum7cOkgeYweaLt0/kE8I0E0Fj4opcQDbAVMRkXq27bOgT88y8PGF0zNnTUpCxGIRYBv6dnjCvo0PyqkWDVNnb+neg1A4rQgIST2UXUpRQDS1jXYKPLGMCrOC7K37KtKIuctLK4ujZ63sKi0ICygSKZevHEi8pHzyIbEa+vb/t/9m2QOmbyswD03z6kpjzIBn7ew6IwFhV/42Tp5Q/OhgUeW77tu6QSKhB2QICEV5KomMX1F+mftWyr7Tusr7ZOQiQGDir4H8yamaQQI5W3n8CWDcUU0ImjMGZpsA8qBIWLamCIE7GwrtUTu5jMGLKuVsqpMfFwNJkKEHw8QAJ9bdfCJl/cDQFVJ5HOXVOugP4OgDcwddPzI1XfI801rEhAYKNdIO+auukwk/Zetll/JcS1tqY5+PrXigETbi/NC994yJ+gnAFCYHbjjxplfvqv+tXVt7NvBYXr/0zt/9PmZNrdoImEEROuGAPjLOizSVH2WrHzq/Kpp1fE31rcPDeOcuuxzTiiWw4ciWvKkbalGZjovVSMb6qYA5UCWtgJEyKzGo/6ZiCO99e5QoL82MqhyNuhFqZRNRPFlN5gAusWzkwtIpwfGMiEKh4ccD0oM2h92zFRnV7N7VH0vBgjH3DVBUeMFAeaSVdM0pShlLutFBAR1rIVwufDXmiIhy950eYviF/mCgL/yQ0SKEARAi8C8yTkAeMKM3FUbD9lc/v9xSVVBTlDvDkS86/Hdjyw/AGJQ8MKEsFnB4iN/A0/g7AA8mB2EN4IQi2gmi3eQEJSYd+ScpnBquRah2tqD6jbn+vMnTKuOv7GhfWiYzqnNPuv4YtZNFLmTkmquLGKbQ5UrThJzGMi6VK8xCdtmc1O1dGekMtSmN1GtcwDAth4Qz8qhJHsE7K9E8IdlddxYa/eDtIqIclTC9UsnTKuOv7G+bWgY59TmnH1CEVM0+TYNm1ZNcemW1KZ2/Pxc0XzQRopoghwpYiqRGsyUhEldXDcwdtuIlizYvLAeBu+RRx55dDSQB7h75JFHHh115ALMAAjsiW/t+G/xg0N+eiFqZwUWgQtOLJpaFf3Cz+u7RdrWts6hW+/e+NB/zYtHfAIMFYCCjHoHtUFzBjMCARQ5HCRIISPsQO1hUIIjWnNAQ0+Ao3kKXtHxGlfIT3HHt5naLlQWxxjSw7EEZCnRKEqIhQBi8wuEo+0quBURDrT2S7QdUJwCx34I8Nn2ur3cvQuwSSGGWh+xGjj3AERvAI8xBIKghCwkYISJSVxY7yAeJAgyyYYCtcSW3sAytWg23m4iUXuFUfKX79EUAENPVqxpNXsGiOxTwp8XYqFyx2v0i4FZSWhVtkn+JCjRNRScA0rZAxAEuvtAH5gUCVkICEgmloa/df1koVYokBoVi6x5X8RgA2zvGv7mrzfpGdu/ce2USWURibMikAXTci46ufTxl/fLe7bs6eKcEwY3IqIeKWzPn8ObbwERPSvGvhoUlN+kdRnRItVZKKqtTAAtkJBpGo9+VQ4PIhwOlA8TInXYACjQhWep6KyD+QsfAlri0bFaGC9KBZB9bAHL8MDNC8ouBwVRSdUiAPj6hjbJgECdAAGAWMI5ZcPcbdiOkDbRvUoMtdONjwz4lbVrbWdeJZCAjrKEQl7ClCHKN3WYzg8l6F1/3S6LuuasioDPgOpuu6b28m+0y3cm1m/vkk49QggF8WYNsPcyCEUq3C/KFjHnkcQEzXzfuGhm3qKZeSi6n0pd5scHa+mh9SQmNgEyU8OthRIgMxeEvffDB7iRVogpAItZ5grG9U6fDvRpRegiTQAoTAx1dtS7UBKDNmBNXT5GPxJiA+lE9ifetc73cqQ62T6yEavXIDhzH9dSzfRJU6CNPOUOc7QAgHSXsrsFwCpMlqhKrhzEfIUghxSg7suUj2mYKGhzEVdoOVolrM+u+CyoLA5vFNHrmkh5XXJ4XHtuxV9ebKIUKZWWgR+XSkTPaoOLm0cJyaN9aQKyl4Uc5XwkpwsD1ZXFanMKYe4x8RTHZBfOzD1hRo7ofSqPKmE2DHmMgl6IZkiVDjH1lQaCiGGiVjJ8POvvmVFDOVkJTHm0dQ4K+ah1jk1blDawVC0KxWbOSDFAkI83aeL0FyxUdXIlgegYlbBwRu7CGbn8W25KuWjF2wkgZgQlf11cYtGIwBwp/HkUhguFIbFNJYDSMvACE/z8GKG4YlATvX9NPB01j4JHHnnkkUdHEXmAu0ceeeSRR2zzzP8U8IaBuwd8zmfUhh8RgUBdRfSLl0/8we8a5C2NLf13PLr965+o01BoWzgVaiiD2H5LqIJvgGRYIg/aIjK5AccTQW7PQIYm8kAk0RYQWVoFziJ3V6JW9hA1GeRgmQTpWHwrYwRUDK2xmTTRfy5SGecrQgUl4kaBkEf/tU8KjWpABgIhCYrEktAHAMe8ZJMEaKB1jL2nBPLIooSJ8DmIJjMhM7BbwqPAgTAdAlMqwlBA5PCl7DqxvRZJq/Xdr8RkNK2zYfA2rFJeZdFr8PhL+7WLEixFy7IABfgq0HatWKKqUpXogAgYX4ndvvgBImO7vI+xBM7jDXzaRh7FEalayCFK/WevsANBIsP0EO54tEHPWTxzUtaJs3NRQFNcrxCWLirSAffceIAiEKAECIezVIoHI5hR9R0QgqZKizcwRFwk9zGoDtLhEVBBihoRZhP46xNIkMEQEuYQGIsA5LhCSGwUOMTG4S1ejxzYqneE54c7GIjAXlEgHVqNOq5EjYQPavQIgFLYEw7Kv76+XZ58CyLymtlFy6IsBJWqOHepQaxUNcKAjwwQf6izD8SI0XEi0MykIAkv6e8GIVMk1NvEoD1pvN9c366fMTB1QgyF44gBiyV5wQVTc96sP8RuyIn5WWoGhg2yHCpMIArC1iy5GHBshHIEWXFCCChrBgJWBpWFn1oUQLyZobx0ov26LRU+W248peXnWiO7j1XNAEAOyxFIULRkVLKQsWHP1XTg7vxA2XLRq/qQQemmUCchq2elAgJYEqTT4+sZsi+DsqX5osqSIYJMeC3YEYdbitKF0TGaxrwc+gAxhoYwf7x9DHKXX4gpXrfMqlPkU2I4S+UCRImJGqSGnsJrCVscqPuJnCdEoYj8SBijKMENLwoJIfGwvyQvuL91IKHl7QLjhReuNjrIjgjsNE0QXlbNGSAgYzZEkYi4AdF6NhfyflHaTlQ5rHFIeIfyIav7WkRDxNAWkdYAfFgJ9mU2HyBEjAn2tDoRB6QTnUsT7MrJZjYdMSeYYCKhYkiLXhJNULZRvCQibRrvb2XigL2owAcIN3FynLI6qTY38YqQdQf3y0m0XeD1miVn9xMO9CMV7+xJcfEqpEOM65gQB4sg0GXOj6yQ3GpTCSqfiqZ9+gfmLmCC0YewAuBtquqRRx555NFRQx7g7pFHHnl0VJC+XXG7jvJPFGFqEvtQ6Jf+oLZDZttyJHDOcQV/fGHfjn0q8vcfbzRfdWZZTWmUx4zyQGkkhO14GPAMIGJyQUE5DJRRuzq+4RMIF6L4qSIbOSIpgmwTLCONHoklYBAqUWpz66WhPRJQUBAeiL03yje+xb5a30wasqUULYtvpKnIgptIKJR+e2PPI8v36Q9qccGUIrEsHlmIIqpXRRSyeyRABAzmMnd1PO6Mb0g1JBS1razQA7NdQiZKcKJdsoMklirEI9+FZ3UByzCg4AL+FIuSs0RDUTyHqi1EHbaLT73StG57p0N5CXIk1BI4mQLLWBkKvNJCRE1YFiQsyr/jiBLKvwWSJPQBACnINOtGjwvMiQIVZ8OKfTuP4pUoNAUU0D/Cvpb+ZW8266Wdt7BY7usZFsE6a1pVlt9HWFRyJOS77LQyhrvIZMoKw3GgcrKViYSGNXCQQ0EEQKhgVXaPhD65dG1B7uKtAABk2dgFXC9hIfGeCuGxpkyYhCNHCrWmCaknMuIUKfB4edE1zAnDIV6iXs6QL1gAj8hVKocIYAmHnNI2KmwCAgFMMIn0DdKfP7Jdb58CFpXbTyE1oCLY2QBE0B1NSC2LaEqm6ZyGQJoBtrpasXBXABQH7wrTBSoUWmqv8GsgbNhpDJncuF9+L8HF2TVZEnC/9JRSASWrNC3MPkiDqQ0cS3LPUTbKX7hBAWzp1oRpCWigG4sV1TB5oEjlmR+mCKg+eJnd0xAtZayEYgmbJEqiFqh0FjrQJroehaOFEN2kEr3LgAlNvu5hen+VoeRNMKKn3Rqli0fNfVrtqDUZbFf0SZlxA6Cj9mIGlV3EoVs5Hpld1JxSbPK0eB+x4caci8pzJCF9zQeBKF1twgC6LTdQ9R2qkGfeV4oNGb0sTZm0vS6lcfwZCfDA8/zsAAPcWVXCKaTmL0387D0GS7RYDVg283CpEkvJVwiTiNh55jJMJNCIRieICKvq2+97cvfelv7Zk7L+69q67GgACNVyiklDJsRKLcsSbhjl3ZGappot3JhSIxPKjvOmaobbXMxorik1TyAYNkRC/9z7JpkkkKD2EeoojfcZMcMjVEY75dqUPaF8vKwdbLUgjTnVlw7MCorjPOQbAWLKUU3gTVPVAABQQItYQOSLhuKndJ9S7XaZn0YsToVmIrFI48G+n/6xYW1DR3lh5JvXT5taFefeHT41AWoWymU4eAC8Rx555NFRQB7g7pFHHnl0tJO2bxebeI6wIGr/nI9pWzh+hRCydGHR3Y/tlndRin9Zvv+Wj9bIV58ZsmDxJ9ir42TDzq4Va1v3tw4c6h7KivgriyMnzcqbVZtNABEsicOyLdKG7d2JBFW4DgIQMr067vdZADgwRJ9f1bx+R1f/IC3MCc6fmrtoVh6RYb+EQz4MW5B4BxDS3D7w+ob2TTu7WzoGe/oToQDJjQemTIgvnptfXhhGcZ6ZBN2QYmvnUGPzALAoZQGs+H1kenUWq65/iD678uC6hq7uvkRFYejCk0qrS8MUCQIFCoTgyvqO7z60dWBIQbftnYNrt3WIt5TJzEkxhrZt3NU9PCzOlhTYeTzin1QWAYAExZfebV258VBT+wAhpLIovGR+wbzJ2QDAc18TXFnf8dr6tgOtA4hQVRo589jC6dVZPMQYZLSqBH04mMAgsMbm/hffbdm+v7etYzAUtIpyQ8dOy1k0Kz/oJwJnF6G7BHbu7+vsNqO/CSCFmTVZFgFCYNOu7mdXtexr6R8axsri8JnHFs2uiaNQCYUnIBICw5Q8/vL+Ox410M/dTb1rtnWwbW0k6JtanaXFXYIIcgczaYPKAsCgNESaQFi7teP19W37W/sPdQ+FglZhTvCYydknzsoPhyyx79c1HQ+2Dza1DTAebGNiz8G+dQ2dIDxLU6pi4aCPoepEQyRAQ49kIORjLx1ImDGhx03LUYOLAEHCQHy/D7Jj/s6e4XmTs79w+aTqkojAX/UhwWvasa/31bWtOw/0sUjnguzg1OrYqXMLC/OCyNOnCGwSCSG0b4Bu2a1SNwjgAIryAyW5YSDY3Zt4dmXzuu1d7d1DoYBVWxE9b2HxhOIw8EEFQwn67MqWDTu6mtoHIkFralXWeQuLivJC8oUMPpQIDAzSLXu6OYYp2hkKkMmVcaYALR2Dz65sbmjsIRYpyw8tnlcwdULMgHkIIkKC0vod3VohQrQAs2qy2IeGxp4eke1Kl1NdZSwSshiixSBjQrCxeeA7D23ZuV/17+AwXbetU2J3VSXR3Cy/iRnxIdTVM/zy6tb1O7paOgYRIT87MKc25+S5eflZQQkU84EGMDiU2Ly7R7KLIhRzWlU8GPAxNOa19W0r1rS2dQzlZwfOOLb4+Jl5Ov6FHI5TCKpAQQER9fB2AGg+NFBVEpbGnN1fmh/KywpUlUSWLiy88KQS4baRAZusBvYB6nd2v7aubce+3q7e4XDQlx3zTyqLHjstZ2pVTCQ7RgrQ3D7Q1DbIWNEhJQSYMTHL5+POGCBgcdycCmFiZ+/wS6tbN2gCnF2TvXhefm4soGFeHOLvH2AqZO/WotxQSX6QEBgYok+90rRlT0/LocF41D9vcva5C4vjYb+JYBN5LoZA3BARu3oTL69uXbe9s6l9IJHArKi/MCc4d3LOcdNys2J+EF5L6f1V1RPo6hl+8d0W3gqK+TnBObU5pxxTkJ8VBBHeTgiRILXSATu2rj6BNiW/tal9bUPnjn29Xb1DwwmMRXyVRZG5dTmLZuWy92zEIyq6tn5XZ4L5CMWkCYiRkK+2Isb6+qXVras2dRxoHQj4SV1l7PwTi8vywyzcWcK8KFFwwWpimK5Y1/725o7WjqG8uL+mInreCYWhgOVMKQM6+indIsL/q0yAwDhFC5QL0ShMloaKGQBSnBdsaLRCQYsB6Awl37SrZ1izrkwokZCvpjwCABRhxdq2tzZ3HGgbCPqtusrY0oXFZQVBRLCIpbn0LCK8fswrcKBt4NX1bRt3drd3DQ0nMDfunzkp68zjinKivj++sP/uv+5gda5Y2/brp3fffNWkprbBg+0D4j0kgtq8O60qy++nLBMOENrWOdTYPGARySy3w5PKo/GIBQAth4aeeKVpT1NfR89wUW7wxFn5p80vsGT4Oxec1B4t/hqwq2f4pXdb1u/obukYRERmoxbPy8+LB9AAygEBiR0cx+EEvrGhbeXGQ82HBnv7E3lZgbqK6OK5BdVlUTEo+GzLZuD6nd3DCTE9CKy+oiiSlxVgjdrW2L3szeZ9rQORoDV/Ss65JxQSYgHBg60DB9sHzb7nn6ZVZfn93IENhO5p6uvooWJdBESIa2ZNlkUQADbt6tGXHGcdWzS7NkuYc0qUy18ssRCAQE/f8Kvr29Zs7WRrwqyIr64yfuaxRdWlkbc2Hrrt7g3sXIH2rqFv/GrDI987gcHt6ocdTvcwdo888sijo45I4fTT328ePjB0z5em9fe2uX51xad//h4z45FHHnk0ItLD4Qz4EFFsXFnQHFLjF/uTvrWp48Y76vUCz19UdOvV1SBSuDAihOxr6b/me+v1O+MR31M/nO/3ER7irkLdAYBs2dN9+++3b95tT88KADMnZd12Tc2Uqizbfvucm9/UM28wuufmWfPqshsae2+7d+P+1gH9q0ll0f/+zNSaihgPO5QpLESkXWfP8E/+0LD8nRaZy1gni8BZxxXdfHVNdjwAIpMAACCQR15o/NkjO2z3+yzy4p2LfBbZc7Dv1ns27m5S8f6RkO/+r8ypKY9Qiv/33L7n32rZsqfHWaNOz/zk2KxoAICcd+tKZ6snFIf/9O153f2JW+7atG57l+3b8xYWff3jtYRAW+fQ1361ecMOQ8iEwOWnld105STCEhyLd7FF7B3v1fauwf/90/bn3mpx8lacF7zx8kmnLygyMrgAfOWXG19e7TJdPvq9Y8oKIj/5Y8MTK5psX33k1NKbr6oReSmAgSgU4AcPb3t7SwcDuJNRXWXsT985TkRc67k7TPRZgxlZROTytw/+4tEde5vtqdgBIBr2Xb+08qozynwWARm6jIAAv32m8f6/7U3Bj6SHvz6nrjLOXubQdtk8ZlteYYjLld98e89BdQRrPOJb9tPjtSdEfmECgNDeNZwV9QUCLPTSveMaGnt++qft72zpcDJmEbjgpNLPX1qVGw9y7FJ4pLY19n7ie6udj1x0UslXPlazfV/vl35R39ppwLh+H/nSFZMuPaUEEdft6Prmr7e2dAzqN0RCvluurlm6qEgwCax/tzX2OOsK+K0Xfn6C32c9/1bz7b9v6BtI6N8unpv/jU9Ozo75ZcciQGvH4IVfWeXkOeC3XrprIUPeP3X7mo27XIzMQ1+fO2VCnDWfUnx1Xfuj/9r/9pZO6pYQQ9IPPjvltGOKgHDYmIl9OIEP/XPP75Y1Dg7ZocZw0Pr4OZXXL53gswCVAwi27XWRAADc9eXZx03LGxymX723/tV1xlD61r9Nu+ikUhW9qg0905+EiPjzR7f/6Xn19sxVp5d94bJq+VFilAzzJVxTmSeDMGWTQctb9/b86A/bN+ywGxlG8+qyv/rxuqqSMCv4gb/vfeBve1zvfPL2BYU5QWl7eb0EAMlwgj78zN5kAvzY2RWfOr+KCVDC7lsbez/pJsBzTyj65nWTt+3tuenO+jZTXYtygz/+/PSp1XHbywTyxQsESCTwwb/v+cNzjTb1YxSL+K49d8K1500A4dwQwbmACEwNfvvMXtdWfPK8qn+7oNrvk6mSCCEcfOXveoCmH6D9FpP2c28dvPPR7fvM45r11t18de1pxxTY1YPAOV92mTdL8kOPfX9BT9/wTXdutHVuKGDdek3N0kUlMihZvjzAnTAA2xp7/98DW3eZp1kUZAd+eMOUkvzgRV97V79+yeLiW66u4RO/RYS5tgGQwh2F/DgP1tWf/+n6NQ0Ge4/997z8rAAQ8WoTG+cKtidSfITABV95p7PX0fa84KPfndvdR2+5Z3O9mSA+FLBu+WjN0kVF0isPAOKwTEIAh4bhZ49sf/rVJueaIRy0Tpmb/+wqY8acU5t1z5dn/uYfex/4u/vc8eTtCwqy/QjsuAF8ZPmBO/6y03nb1z5ee8FJxX9//eCP/7BjyHzFanZt1k//Y0Z2zM86x3VSGE7gQ//Y89tl7sopbJRy0jCnAPBIb0IIPLeq+eeP7GjtHLQ9TgicdVzRTVdOys0KEvPxc778hlPxrl864TMXVgHAr5/e9fA/9+rm9ryFRd/4ZB0APviPxhRmpCA7IAYtfvW+LSvWuCw5HvnuMeWF4Z/8cbvbkqPslqtrxJjjTZCNBSB/fXHffU/tdnJOCJyxoOi19W29/Qn94qr7T7MsS0z34n8wftqXAh767pFHHh3B9Oj9X3K9Ho4VfP5nG99jZj645DhB3iOPPPLIo6OO+A6ax67pnzger9BK/SkJy2vgPJYWhAqyA/p93X2J+p3dgICU5RxAiuxPfGVd22d+tE5H2/OyAuKAO9iwo+uGH69fWd+OSCmvhSJSv89ll1K/o7uxue/GX2ywoe0AsGN/7w0/WbfrQA+liEgpFaVRiki7e4ev/8HqZ1c1y51zQXZgalVMskERlq1s/sLP1/cNJCilCJRSdkQglffolKC4u6m3p2/4y3fV62g7APQNJH799O5EgiLiy2va0qLtAEApS0RDS/JCztr2tw4MJeh/3bfFibYDwD/faP7D8/uGKf3qfXa0HQAQ4dF/7f/VU7sppTTBJIOUsn5CJqR9Lf3Xfn+1jrbHI/5QgC8eDrYP/tevNz/8z91KpEgppb4k28g9Tf33P73LufUFgMdeOvC7ZXt5AciOvKM0Qf/xxsHUaDsAR8Kl34hyxJGd4kgRWd58m57ivY9vv+2eeh1tz8sKSNXq7U/c/diuW+/eNDCQ4I9TLbozMxKvhiBjSqBBFJAnhee8Ae5r6dfRdgCoLI6ol0tQeAl43CfkZfv9fsJLZS0F6TJDRHxlbdv1t6/R0fasqD8S4kcxUISnXjnwqdvXNjb3M+2SAyPgI/nm+GW0+2Bfe9fgF++wo+0AMJzA//3z9rUNHU3t/bfds9mGtgNA30Di+7/d+uaGQwk+6iilQCm1CDpVemiYbtvb89Kalu/8ZqsT7lyxpu2Ld2zoHxxm3FLkwvS5jURg2kApIvrcjAaTnTQGFHFtQ+eqTR2p0XbgBy0kQDNMg0OJL9+54YG/7ZFIVihgZUX5i6T9g/T+p3d/9d6Ng0NsbLGuREscU2mjnft7Eem3H9hkQ9sB4M5HGpgdY10vjrdF9iqG+Mf1LS9udOXjK5q27e3hg0GUwn+wYc8vg7TsiUQCKX19fftnfrROArIWgdqKaE5MvSa7elvn5366jgXMIkLAR5J0iBitTOvkiKQ4ODR88131KQT4wN/2fPXejQODQuJIKQVLS0WtU2Nzf1vHwI132NF2AGg+NPjlu+q7epkKialA2BxEHBxkXblbql92zF9XGZMV9fQl7nl8531P7mTNUMKkODiUuOnODfc/vTtZK3715M5b714/MJjQ/CLyBx/elErbhQCG3XpkeePX7q2XaLtlkalV8YLsoN66r923cdmbB4U1RjHRUdcx0tw+MDg4fNu9m5yulIEh+oPfNazd1oGY4EOEAht1gBQpNrb0ffGO+l2Os6NbO4duvntzmwOTFR4yactALi+0f4DIlgn8AjfsDt75Rd4FANIIcieGOEyAIID78G8+NDg4jF//1ZZ6x3GsA0P09t83rN3ayaXHhhizEZQOJ+hNd65//OUDcs1QVxmbU5vFpo/+QfrsqpZgwPrBZ6f84IYpAT8BgMqiMLNCycYFUsY+N49Wkg363oN9K+sP/fD324ccCc3WNXR98/7NCTHZyVUKKxGRDg4lbvrF+vv/llQ5hY1KUMpsFJ+MUYyOXz6x45v3b5Zou2WRvKyA6A54dmXzZ3+09kBbH5V6l1zxdh7oRaR/fWn/b/6x12Zun3mzuaGxBwD8VgpxMYcMW4+hL4m49jT13f/07iRLjv2/W7aXz3sg2BWNve/JnT/+43aJtpfkhxZMzYlH/aylz7/V3NufuOHiiQ9+fV5lUQQAKooiysXDbfKIFgseeeSRRx59OMkXLZr0fvPwgaHzFxYOD7nEwQHAzPnnvsfMeOSRRx6NjpLuAcQmQcLtalMMuK954JmVRsTWlMroopk5VIYNA4DAOFdu7NzfZmy2K4vCsybFEInacQPZvq/ny3duGhzmJYSD1g9vmHLbNTVL5he88E7rwCAFgOEEvrK27azjC+NhS4CqcNXpZcfOyH3x3bahYdWYrKjvxdVtDY29Hzml5PqllbUVsfU7uuR+eHCIrtvedfHJxRzlAJ5zFhF+t2zvS1o49uyarN98fc5HTi2dXBl7XgOaWzuGIkFrTm1cvOQOiDC9On75aWXDCbTB2fOnZC9/p/WVte1OMQ8M0SuWlCJCcW7whBk5c+uyV240YpDnT83+9AWVp87LZ/8mT4haFgDCxScXX7K45PUNhw51q5ArihAJWU+9ejA37p8xMd7VOzw4bHTwtr09WVHfk68cDAetWZPiiNDTb4CYG3Z2n7+oKBqyUHS2DOUeGKQ3/Hid7sD4zIUTfvS56VcsKVvb0NnUzrv4rc0dkyfEqkrCTKQAePr8gqWLinYf7N/bbIDIBdmBP//rQDhkLZiSY1nQYcaO1e/qvuyUUr+fSM0DwAnFkVPn5efEAptN58Tlp5VdeXr5kmMKl8wvXDwnf0JxmEWlocgtLt9jkGkoRKwkIsKj/2q86687ZWkleaF7b571hcsmXn5a6Z6D/RJCamzu33mgb8kxeQLz5ph2fnZgdk08Lyuwq8lo4Mmzc0+emzenNmtuXfbs2vixU3OiIR+qdDIiCB8YHyw3EBIgb6w/9OK7rXpR0yfGz1xQwD+IZBXqeQRxuoGIXtS6fcuenht/US8RGb+PfPtTU/7fdZM/fk5FKGC9tZnrW1fv8Io1rReeWOTzWRLVyor6P3pm2Ymz8p5bZbzwMZzAQ93D72zprCgK15ZHmg8N6ZYEAQ51D63f3l2/szs/OzC9Ot7ZM6wPTwTYsrf70sXFyocAkBsPXHNWeVFu8PX1h/S2VxSFfvXUHgLw6QsmXH5qSSzik3lXAKC1Y7CvP3H89FypJ5GQdd3SyikTYsvfMWTos8i151awHj9vUdFp8wpeWt3WP2gAVRedXMSSvbCycuOBObVZp87LX7OtS0/0VJATuOXqSWJUFsypjUdDPpE/BBHgew9vW6GN95Pn5P3yllnXnjeBuxsBAGB3U19vf+L4mblypOXGAx89s3xSRXTFmnZdnuWFYZ+P3PP4LnBQ3yC96OSyeMQvkpWrJAUyIlhgj9DTP/ysZrcTFF9c3TavLrsg2w9gJEFhBaCMbWW/AAjggbbBG++ol3LzWeT2G6beeOWkCxaVPPdWq7Qn/YPU7yMLpmYDwOy6rI+eUTqhOPLqunbbhHPV6aWRoB/UgOKpL7732wY3AVZ29RoC7BtIHD8jV6gr5sQDHzurfFpV7OXVbTpsN5zA5kODaxu66iqiU6tiTe2DuhOlb4AGfOSYKdlSYERr8x1/2aGHJx87NeeBr865YklZKGCt2qRs9cZd3ZctKQv6xWmZAAD43Ye26pG2i+fk33fbnOvPn9DdNyzniF0H+noHEgtn5bGPIqc6O+9B9acKbRcz1tAQ/fxP1+ij8n8+N/3GKyZddlrp21s6DrarOffdLR0fObXEx49oZUYLrjq97JS5+Ss3dnT3qSmABYY/82ZLSX5oXl12d19CHyCI0Njcf+7CIgZtImF+R26cv/Vgw3btvBa/j9xwUeV155VPLA2/vaVzx/5+m/N7alXsxFm5/AUfbtDEaxRKB3nhqH8C/PvrzU3txqLiqtNLoyELUZ4HodY2AnRXCUyuWFJ68uy8tzZ3Otu+bGVrSV5wXl2Ws+37WgbOO6EQiEhygzzj/O+XNT79mjpv4z8urf7GtTXnLypaMCV72coWpmgJijOq40sXFm3Z0xsJWTddWR2L+ObUZl19eumE4vBr6w7Zx8UZpZGgJft6enXsslOLA35rzTbDEZIb9z+7sqWrd3huXXZxXtAmk8bm/vlTskrygmoeZwUSAITvPbTVMcRmX7e0MrWNEv/Tp149ePdjyiJNKA7/6tZZN1xUPak8Kievzp7hdQ1d5y8qEsYJAPCqM8oXzsp9fX1734ASr4+QJccUfOW+TUPDNkkAAEyvjtVVROfUZV21pLSqxM2MnFEaDfmEHxqWzMtfurBwz8H+vc2GyhXmpFxy7Oy+7NRSv1+e3sMXduu2d/3gt9tkjafMzf/lLbPPP7HoghNLXny3rUu8KhEN+z5xTiVF2LG/92ufmDyhJCKC20G8vaLC27Vgdi/I3SOPPPpgUP07z7he9wejf3/D5b1nj1zJA9xHQB7g7pFHHn3ICA30XaHtCp8UUWaNLQPLTMB9cmV00cxsswSejHbdjp6tew1rWZQbOHF2LhBkACMr+ju/adB3R9cvrVi6sAgRc2J+y4JVm/hxf4PDeKB1YMkxeaBC7bE0L7j34MDWvSrJ8t7m/t1N/VedXvrFyyZOKA7PronnZgVe04C81o6huopodUlE7iRZ7Nsjyw/oceg3XzVxYmkUKVYVh19bd0iP5z3QNnDZaaUSv2AuiXDAmjc5688vGAm4q0rCj7/cNH9K9q9unTl/So4eIR4J+a5cUgoAFYWh2vJoXjzwl5eM8KsFU7M/cU55TVm0tiJSUxa1tNfkw0GLIrxZbwD0b23qnF4du+/mGReeWHTuCYUvvN3Wq21r+wfp25s787L8v7x5xhWnl37klOINO3p0HIRSLMwJzJgYF6FZKAIG4eFn9r60Wu3Pj5uWc9s1kwig32fVVUSfevWg/GrNtq6PnFIsTg4ERIxFfBPLIk+9ou4BgHXbu/OzA7+6ZeYli4svOaVkw46efS2Kk6FhrKuITCyNcF8PICCpKY/WVkTbu4deXWd4L644veyc44pqK2OTK2NVJRGetZWI1CgACobhek5Q6HvzoYHb7qnX9/nf/+zUWTVZCBjwk5Nn5/3t9WYJDew60DepLFpVEpYOqZL84IIp2fOnZFsEXlxtcHXd0vLLTy05dmrugilZx07NiQR9AAIjN8F2+Y4/K/O5t1pswMr8KdmLZuWCTEDDM2TzdOfq2DoJzvHCEQG++stN+msBHzu74orTypi2z63N3rKnZ7eIpu/uS/QM0IUzcgTKxZHHwpzA5j09ujuhdyBRv7P74pOLfvTvU849oXDe5GybQdjXMrBjf9+8yVn3fnn60oWF55xQ9PzbrTrC0t41fPKcvIJsvxjHiAg+i0yrjj27sqWrVwFhq7d19vQlvvtvk5cuLJxQHD5xVu6e5n4d2tvW2Hv+wsJw0JLDkABWlYT/9W6b7o7yWfDJc8uRH68JuXH//taBTbsNz83FJxXlZweAxxGT/Gx/bXm0pjz6+MtNumuqIDt420cn1ZRF6yqjNeWRaMgHIM0RvLO5624NHM+J+3/xxemxsI8AHjM568lXDw4IIG/jzu7Fc/Ly4n4Umav9PqumPPruls4DWpfFIr7127sQ4de3zfn42ZXPv92ipy+4Ykl5TsyvVEjLsKzBloztwJ9f2K+bpv5BuuzNlgTFmRPjyhPEhj6IIyy5l4oBo/g//7dDt7QXLCr+6JllABAKWAOD9O0t6lzWSMh39vEFrDSfj9RVxNZt79bHOABcfUZZJGiB5uElBN7Z0nn34+rkj5y4/84bZ0RDFiEw3ynAuXl5WX4ALn2fRaqKI5t2devviPQN0C17ej55Tvm3P1V31nEF82qz/vmmoa7t3UOXLi4WRxYz2BYBYNu+ntt/1yDl5bPIXTfNyIkFAMj0iVmP/mu/tBvDCTxlTn5hTlC0A9/Z0nnXY4Ya3HXTzFjYRwgsmJrzxIomiefW7+g69ZiC/OygLeW0OlUSxGHNIA55ANze2Ptn7XjtaVXxL1w+ERAsAnlZAX2WGRii1SXh2vKIHkdPAPJzAhRxleniXb2ta8HU7Hu/PPPs4/PPPaHw2VXGsD3YPnDxSUXhoKX87wQBcePunl89ZWRHuebM0o+dVVqUE5gxMVaaH/rzcntY8bSq2KKZufwDkZYNxDHLIKODpW4IzYR/vGEH3K9cUhIJaYHNhABBApZA8pnMlI4VsLZvMo4RXrOta8HU7Htumn7W8YXnHF/w3FuOtp9cHA5aIkgAAXA4Qb/14DbZlWUFoW9dV0sIUITivOCO/X0793NLtX5790UnFZ57QtEFi4piEXY+OPh9UFseW2/OfQBw5ZLSSNACLf9LKEDmTc557KUm3fO3q6m/szfxP5+b/G9LK5cuKrQIeXerMXEEA2TRzFy1ShGOLady3nnjjFjYAoD5U7KeeCWVjQKAQ93DX/vlZp2T/7lhSm1FFACrSyKbdvfsFaOv+dBgTsw/vToulhOEABTmBPoGEqs1Vnv7E+Gg9fbmzts/O+XWqydt2m0IZOHM3CkTooDE74fJbmbkqtPLwtyMIBNZLGJNKovpyxIwlhwll5xS7LrkmFQa4fOIOOL9Z3/eoc99P/78tJy4DwHCQSvgs15bzyf93U19s2uzzz2h+JqzKicURwBYz3G4XYDs9twyHuDukUcefVDIA9zHhbyUMh555JFHRzVJ8Jl/BGPHq7327YxCEoFo4h9FCogUICfms926v22AvSYuXtunaxu69I2i30cuXFTIX99GXDwnT3/8lbXtzR1D7HlEioAJiqX5Qf2eoWEM+MjVZ5TKjAPnnVCgJz0AgH++0UwpsletKfKcFMW5RjmzarKoSEEyY2Jc/2pvc3975yDPisPLAJaFozDHSN3wpxf2Dw3Tr32sJh7xHzs9u64iKr9aMDVbNhMRKbidLEdFigMQ6Q5EJo6iXJd0H/9xaWU4RCiluTHfxScX2b4dGKLXnVteWhBESi0C155Xbrth3fYuBFEDZ40ODA3/efkB/bZLFheLxAZ0yoRoSZ6Rx2DF6nZk73fzBAb2DmJ07bllxXkBSpEgXnFase3bDTt7kMlUvNvNc36AQ/1EghcBK4g0BwiUp9bgqQYoT06AIvgXH12+T8dSywpCx07Lpsjy6qDfD+ccX6hX9dtl+xR8wbuDpnhdPMlQMaBNOXLYlQOOtDmxsI9jyaA/rI7tFVHMaoCy36s2HrJlSLjopCLxej9SihedbIj9qRVNhzqHeNoBKtPvYHGevfuyY/4bLqxgpcyeFJ0/JVv/NkExQfGmK6qCfoKUFmT5Lj7J3r9rtnVSPvZEJg+giLQkP6TfNjSMdRXRRTNzEnwg4FVLSvQbBoboC++08nQoQlsoRWcyHCqKoAlEigXOGyjox1WIPAwunYuICDSRYPchpUh5+gb622UG8njWsYUs9pZS9PvI8dNyVHUIT6xoQkBpDymlgLSswJDA2m1dqzYeuvGKiVUlkZKC4BnzC+RXFUXhiqKwxNEE6M9OmKTSC8CwrnDQunixIToAGErgQ8/s+8T31z+7spl3hxhDvPd5UhMKSA+0DbxkJkc++7hCRD685tZl6V9FQpbI6MRwXjqhOGwXuMrmhcgFgL99ptEUYEEkSIQAwSlAKjJByHQZZYUhW0Wl+aFrzy1DijRBZ9fEbMZ814G+3v5hMQmA7NM/P79fj5SfW5dVnBdivey3cFq1UUgk6BNtoYD40D+NVpx9HFMDioh+Hzl+htGKx17crxkl+f6M+Ft/30hYr/zsgJ6dY+akOPLm46xJBmMAsG57F2saT5wjxlpZgX1cWwS+dHmV3wdIMSfqs1k/ilC/s5sZY5U1jNJlpgPDZ5FLFxdxA0nxtHm5TvvPwH/KT0rXLRsCAjsk1UDb1fLChVCCykpwgEhVYDeR4mMShPICu5IQAjdeVuX3EaQ0N+Y757gC/VuKsGFHN0skw1QEENc1dOlnES+Ykg2AMu/YnBrVEb0DieXvtINaKvAyAOiEYjsnCBSAmRWQOgVudnjJMXnHTslmcr5iSWnAzJazcWcPFclRqEongw8/MzIbRdl8KpZKj798QE+CP7kyOmNiTC3YZhsLtidWNIkERMwoUUC0mbiBIfrbZY2XLi5aNDM3ErIuXawmC59FjqnL4mYNAQGTiCuBPNEbt2Kl+S6ro0/yJUeCIF65xG4M63d2C83m5m9wOLFSe5GlsihcVhAU/Wu3eE+/2oRSDWWoglhH66rskUceeeTR0Uke4O6RRx555JEW3C53CCh2xAruczzFU83KjQanWNgOuHf3JiSWx7aCz79lJH+oq4hmRX0S6S7NC8jUogCQoPjSu6088TXyPOPOTO61FdHcuA8xwRAGi8CcWgOGeGdrZyKRQJVIHijFT5xdJrGYUMCKhYmE35zodlPbgCsi7Pcb82n/ID15dm5u3McyoZYLMGh2bfxzl0yQGIHEHMy+YFAXGjmOOccuuUpL84PTq6Lyjjk1MdsNfh9ZPDcHKU1QShFnVEVDQaOUXQf6KYfBRApTxBVrjTPBLIscMzkuN9iIOLkyqheynHUQlQpBAw5WLYucMidPIr+zJsZs0V17DvZRjjdxdIdSoEm8EgLU49tdpFKYlKVClvtggZXwK8+tataLmjc5W+LxjOZPNjbV2xp7tzX28nTgPOm3wLtdyRFvzK4JGNTYmLO/dQSHUTRsSUCKQVQ8kzDVIj9lUUQBTstWGq0rKwiV5AWlJlFMHFMX18fOUAKXrWoWEI9Ealyyoi+cnh0KEKQJpi1OTZtcGS0rCMrk4MdMtoOAOw/0oRCfdMwgRedYPnZaNkqwB7GuIpIbN5xnb9Z3yKS70iPl5BkNos7hw11NmkkA9tlxIxvuTC+BoWNAAWhrx5AtyPTYKVnasMWpVcZIeWl1u7RAIns+sETPkgaGaGFO8KRZeayUiiIOW5fmh7736WlGCiGBtusgpYq9B7j23IqiXBfX14G2gdv/b+f1P9zw0up2zXvD0j4D8B6CF95u1fHOgJ8woI0NYRt6e8aCAlYQTSC4tQv4QGAsMgFAW+fQu9tsAszWBThlgl2A/JwJgbe7dv3Js3MsohRg5kRDXRFhV5O0e9JNmHjZ9C7Mqc1iR24w41Cmgch1FdGqspBQBmztHHx3qxE9fdzUHCkoRJxWZTCw/J0WbulQnJshAXgOJlNNfwERc+P+m6+uCQvrXZgTkF/HI76wadWb2gcQpAsFxVhzOWCjtiJaWRSSRc2aGLXdsLupXw1Wyq3fW5uNxtaUR7JjPskqAZxXZx/+XO7cblHpTpD6APJLdqtEL90g92UrW594pfmJV5off/ngE680P76imX3curcHhNkHoAQo6yACLsO/rjxaWRSScp45yd72PQf7hK0CREIpbNplvCJTwUXHMVsbPr52e1eCCm1nx00ARUw2Lpg9Zz44pjkJp208bV4eClsd8sOk8ojBcHM/5VMmd7EA0LbOQbuNmiptVMLVRgHVfPAUX3jbWLDNVyMUEXFqlcHDzgN9Ow70Ch8PnzWdDekfpBefXEwpRcAKsUaKhKwvXVlVURQEQO7dTLiJiwJFEMnXuWT9rkuO2blyGM6sti85djf18WNyxGzT0NijnyhbURTiZypQRIolphtp7bZOrrJc8835XdlkD3b3yCOPPDpKyZ/+Fo888sgjjz50lGIDoLa3qN/sDgwbW2EEIACUBtx2VijekWcv19oSl08sC6OqlSBiWUGwS4uo2rS7B1GhYK6hQ1MnRNktrBYEUlcRWbFWZZXp6UvsPNA3sSzCHyVIAHLjvntumrZtb++2xt7+QQ5PAAACCQbsDenqHaZMQOLdf0qVLHQ6dloOB7EonDInf1pVbMbE2NzabOTAMIvAI+4dgUABLVTdJLdvTiRwenVMYDKEgB0CA4DS/GA0SDhcSxAASvOC+hvTXX3DiJTwjECEAbhvbOiwFRIJWpRSlreEUrAFrG3Z00v5uW+cqKNplUWheMRi1wlAOEhyYn49B0h3XwKNx5BYSPiL7aaEGHBDKKUWISjy9XIpAMOlzVBJhqrsbe5vbDESr08sjVAR5csQj5qyiFkbvFnfUVMWQiCgegTB4QdgkZAEQEusLW4HACTmFZEAB6F/wF6Uz8fTLxGZZUC0jbPAv1DFs53/2yYQVlUSpgJOZf8H/KQ0P6Sn13+zvuOyU4o5VCuOJ3Rq5oxJMSpAQUJcNK2uPMKgPQIECFYU2v1VnT3DQoEpAAFCeYqcJGOZ1wQUgNSURd7RMKMte3oYxEEAkIq0/a56wlURiRtwx4YO4UOYsMhJZ8/KWwHZqOU5KyiBN+oP2UZlTXkYESnyDrKNlPauoQNtAyV5QQBEtAAAiEt1C6blSLWZPjH+mQurJpZFl8wvtCw9NFjnjv9EQ0UhO+b74b9P+c+f1fc5dAwAdjX1f/uh7cdNy/7KNdXi/EPKFBMAgOC6BgOnqygM+3zCQIIVDfsBgBCYVBa9cknJ4jm54isqTuxwSpEdzSzzx9NkApQfywsdAmwdLM4LcF+TaLetounVMWbNLQKIUFbg1MZBhLDInAMWwa17+/Uc3wAwsTSMiECYP8+KRXwAEIv4Fs3M/fwlE4BPBoBIXl9vP2uXtQJFhhBnK/a3Dvx/9q40RrKrOn/n1V69d0/PdPeMPQszY49tcOJF7OBAHKJAFFDAkYBIKChYgAMSJBJE+UEiRREQSCRLASIH+JEESFAIECASwk4IGCsmRgNexvZs9uzds/RWVV1dVffkx92XVz0GhKL4fYbprur77rv3vnPOffc75547P1PX46AnRwY7Wc4d1yIz8xtfueM1t04fPrp6/lL3xr2jLGOnAWauVjI3BXmro89l1eZCjX8k29crf63IiJgR6/Vau6dnRTU/dDqD4JDnA7saRizkHfcthFYU2kCTbpLuuX6MMFLNxv2QOC8VAHDfv51Jfv+u39y5f1eTGELPBabiWEiu393U831CVQGstQdKs/S4XVnzMtuMNkpCCJOEPnB7XFnrsZ7wCPIVhpIeBBUHADaqp7U8ssO7m0JZLQCYm64+dcpmfGpvDIQQRFKNZQ30g8ciFZuvCyFHSHrOkipWlc9m8Ur3pH80rtFQKeAL0f6SJ06s795eNy9ayXfI+Znazm01BrOg6Yny2++cn5+pvermqdFmSagUT7kvqjIoQYC17eTkWJlXDjlc9SoSrxxsqyAgOOx3tFGS1wowgWplZAQzlpfXeqznu1QzlSIXaWMKFChQ4HmLgnAvUKBAgec51DrUoXblj/CXnMvUJZIdIHbyVLuFNY0tDxnsdAdBPtbZiaoQbJYlzDze9Gaok+c7ljLWyYWDu8xOlp21MxiYnw7XgacWO7vn1JfEEKyyYe9dqO9dqJNmcmXHo6BJ9PqCJemsyAVOFgNwYFdDk3jiNbdMmpMuLQnMdlHtDxYEC3AmyI6xHNjks5ifqQrrJOCxRhjltX2qwpqNk+TFuJ/zp9MVQrAlZAjEcFNmA5idrAghNIvMzAjS9Zy71O1uDmoVEppDMetYg7kp01RmImIebZTc1W+nO1Arc9JkjHAPdYxGStHRDCZmzkrKp5MpbtW9TAU9PnVqPahlbqqqyB1Nyk+NlWrVrOuwV0fPtDW3BkA17LlGrenAZJ252BKnvNmPCHednD3FWyoelqNvV1v9pWVPs+amq7A9g2Sn52eqLuF+/KxWLsgCVlRdzE9VNSXEDIwmJU3xOgzQWCPc6dLpCuM2I2M/UvTTtomykMkXpJeDEGSoWF7vr7f7I/Uymzan2BnpAJC/C06UMJsVZLeJcuVtoORfsCAiY/r42Nm2WyzLaHqsbPQx1hQAx862ZycqIBAJ5DjeDuxqsh6iG3aP3rhnTB3H5xRk34fj9cv5b/9C41MfOPQn9x0LDjE2ePjI6rs/+eRfvnv/rtmaYntJ8r50/JxnB7ZNVKQIS0dGrYov/9nN4yOlWiUTQu+2MFyx9noFLROG5AYz4eiZxABK3550R41HA3j0XGvbxITVpJRpnJtWAeADJiKMNsJK2l1hPCcABNNTp0PjsH2yqoaZwRC/+7qFt945P9YoZxnI+BQZAB874wU+ZxlNj1csBw1MjISM/9EzrbnpmumFJe3YdsoVJKnDo/WS2fpgrCkDma+O/YHURdNCReVHVhlz08osDxhECb2WE4Q64VkAwMkLoSDNTpQ9i88UE/f6T4qh1AacTSJ76yvyLLe3gWNLsM7hTgQmQHgKE2BuuqpcbkQA4tlTTUnE+nAQdHuh3ZWvNtJfUvKtslBeQ8Aoh2pHWi+grZDgtIOwXs0m1E4C5SEcjcxsuzto1krWvNKWNorSKjZZJgIzP+XLNoBZvbtCNr1azmqVzM3wfkK+sOkjTGQQeoD9Oxv6/QbjjfI737Dgjo163TMTVzBaKvcXgaxvPQ5HmNMvP+5w+a8cejuTlseuf6q21wB5gAo5fnfHE+Veo96ToN5lTGF5bEbkjy9QoECBAv9vURDuBQoUKFDAh0/o5K9z2TDt+iPJ8LdexB5WypmJkyfGibOdYAkl04kqipWREYLo8vXOQFLhhvyIF2FTYz7hzmI8ziZ/qWsWfiqUkL1uKG6D0pw+q7BbJr2mAkOkONG5qZoQDDIB2pr4sHWSSBJSspjaX6+bZ+PdwrEda5R0NCDLlZ6zHgSAeiUTzHD8GWV/a73QaVz0MpEYeNYPYGzWSmZ1Lf9fjdKlrrX7lfGK5ogTzoTRRonNmpgZQLDNfKCy9ACKkiP9hBKjpHk/VmwNzFiycB0/Ls3KOOFTDwDGDX/h0NLjzfLSpmWun7mwwYoUg6ZNKPnowkZ6a2tNIBjuXaMSbYbvD+ySnvSpmFFthqtSyhX3bmKkzCrq3NChocfl0mpvtdUfa2Ss20gpCnOsmelYTgaoEjma6lXSPJCiMcslMh0BIBOqQ3tSZPOTzMOM5YNkv1MnQ1zsvmCn0+akJulKLPEZFWCdGJ8Uv59kwyyHDRMMD2LgpE9JN6oZlDpJMpfjjTLr7b68oXqsqabPT1eh4unNHo9cmsaQU6l2A8CeucZnPnjovm+c+dr3lwYRLQVgaXnzw3977N73H5wYLRFLqhJC8MUVL9nR+Ijl6QiAoJnxKshsPtIjLVSnEkwZs/aiKJrymfPhACqF1VJYjRJKtFoDmBnFDIGP0XqmuFSAU8m4BgOd8RsAgYgXL28GZcaaJWnwZedGGyXtuWNPUphPBL2oZeRPILWUGGjtZuXDsTbGhrfLW5veWjvFbHacpPRVEuBkVUgJbGyWM9ffWI70ui+E9AKT9qZcXAkHamqs4s6jDExGChvNpspykbXgcHsy9PUDn/vQoakxy+mT/lGvZlbdw6khhHEKyv7HfR8IISBgQ9gx1vQkaa09MEMHUKfr7ZAYb5YYgpiUn1WAyHHCeKOhXEPGVW2H0oEMuIaaF8BIpGrp95krQkdAEHOujTKGrRbxAa3WwIhfcDmAZr1kXtjkv9UydR1TsdYe2OgCto4pF3PTNfWMhfbvAczGr0+qk2nIxnlOvfQrh+XEgWi4BsIkoAMRIEI/8braKSJnXuoP2LWf4yNlc1NHgs0WDuNiKfj1AgUKFHieoiDcCxQoUKBADM79kFNOrp0Fg0BxfoxmPXPCgHil1Q8KfO3Bpf/68bJd1BJOL3nHSLY3BmpNLNnrFHFQr2YB+TBSD1mW1obaQcxyNapJajAvLfd+cmL9zMXuldV+a2PQ7oqgDbKbOqpRx6oRx8ehlEtUr2WMKBkKWeJP75iOWQhLWiimXnJthjTxUa2opPPQ1AyRFzCbSWeHcSOkqGIZuGwC2Dd6Iojzeuxk6333Pu1+E6cdX28PpsfKMuISSES0qabq3oESW62FJvKY1BCBsxQBqhhNzdUotsd0QVOCrDluRVqtRrI3Ui/pWFBLEIzUMzcV+lp7YB8FlDcgbJP8k3XWqLYwc+bxOKSrMAt1qkcJ712eGobf1Fyv7qSOgtfFVtse3QPlKbEMMRhgEZ+ysNraHGnUpCNBSVMsaWUtV0bNfGQZae1Q4hQ+X8V9sI1xNVymD8Xdm8uAkSiQc70zkIG3kphJ1iOEUM9DhV4nSD+tPCxPNhIsEry2NSvMIKjkSUwZrba8Me/2hNIUTfa5gZ+q5RsD5TNU8Z9Z3LDRRsnl29WjtmyU3zQzTOZn9PhGGqX3vfna17905lP/evp/nloL/wycvdT9m6+e/tBbd7PetbPa7gdy2KhmhgY1G42IoKlr/VAlB5/ewcMwBxKAAQTTQbcn3n/v0y5DFdgiAOsbfU3pQxPJ4Z2sYfQGyW2J4tpAREzMuLQa8sjSjENAEeJCM2iOXZEIDEt3U7z3r4/oThCiyFkA652+0WtVzBhxGK+pUhjDmzPzZl8ceaZ15Nn1iyu95fVee0N0uoMgGQ7g7FUx7igmEUma1Gs7UAnhNxSw7AKtrIdWtFEltfdLG91YYY36+QR7WCjvDwFG6qWxRubekWDnNodNNo4byrNpWrETfWeGOalaxs3v91PlLC139fQKZiz5DqoDuxrW5UdmJkrtWpJzprKc2tJEDapVMusczvP6skzopD11hJ/KRvUFhDSdK+vhXP/xLz5T8+esji/erU7fus2sR9jDSD3TTkw9u4FlvIV+aiDr5kyMl0pNZb1SYalqJWPPtnLilUP5gGUyPbFvoZ5lZAIDLq5sCmcfzNIV753wwM4Rh+6H7K/b/KjdBQoUKFDg+YWCcC9QoECBAilc1bKXww8MEC9HnObsRIUhdKAuuadxSpy7tHnuUkh2uOgPZJQuq8TIKUKwUiK5PdiEN8dRjRubanc8sczyCgL98Mm1v//2+UdPhPum0z02LI9c4YuYWEazXpLBbDB8OfRVlggYshiTOdWFKQq9YI2JOU3CWMI9brNDKXCWipI1gZZy73wrekCrrf7j0WMN0BNCsFk5x8SOvzt7WGuhdgZoCjRxMzasLTtR3uQTELrP9jtud8OulUo6xaxlk8MzGNtdwYKtYDGQjqhOPVTyflPS4PwAMDkWvo+td7zRdqoNmCOPX4o1q1SSA6VIobxo39aGgD5WNmASnUaw4wPKlcTEhW5bVWAk6weNJBFWLpHkyjVVkzgVs7M5kByoTCyUYHQUO+4wlwkIY014SOYmSFaIBABhHEXMAoFE9Qf8+MktLEm/7+dbSuVwH22UoRl3kDEj2nkw/AYRjBNu33zjY+8+8PATq/d+5dSZyKF4/yNX3vbaHddsr0u/V0zDlUskdZsyaUKh2GDLKDp8v/nFAcv87kr4GciC5PL9AT/+zNYDqMRV9i5NOwJs5DQhHUInt1HcJGgz6m8lI70BQrs8tH541C5C1btKMTDPlRmZzTei/rXbgdSgcqvT/+w3T3/zoaW1yLUWd5+NlTTpydLCbeZN76ZeZdplSSCGiAeqXMqM3ZZ3iY9ykRWZaZFCqxbd8apeQmClAPBi+nW17rSb7Bpr51Gq79aoya7ddt3YWLNkxv/wsXUpILL5R571HvqLD43bzlrrmJrRtGXUg532IOoGKd+yNqN+ASP0JLcDZj+djVJuRUI7CqE4diaMeQ8vF6Y3euKIMNIoWb7dCRLQ8wJDblZLWXbWTjtdc27Gd5YbvEi9PCZfOSD35IDAaNazWw+OPnxEuSSPne2stftjDZWuLhi3l71wUjWBtB9cP+yCcy9QoECBAigI9wIFChQo4MJnK69yvevXwFhaDuOh5qerdsFL2IiW63vm6irTcXJFBIzUS1AR9On4TWhuUd+EGFyKYux6faHX8mrB/4/3n//8t867K7XRRum268Z2zVbPXep955Erfu8UN2uoXU7RPYprUASnWYiZn7Ku3BG2SW9Yk1bpo0NVPWBDKeTQ2IrkzGNS5R3kaZEE4niPwraJys7ZmilsqWdnTVmvZIbUyVvYmkayXpXGTTUcidzijSzVI0vZsKE7otQE5jpNFwExVZSZWGq2hHBA7/b7wh4eABPFFkESsaS4FR3hDjeSPzkyc9FhA3EMqdd1WY2sX9ha41zwGTmCoWQ37B2AzZ5g6PT7OVIk0ymRPQIvKmAYENLkVwTBAbmSuBG0Lss6iTLk6bIWbB1xHpZxlYyTGseKlbVRwIBMWxWXdA4FthG0AStdr2bXXdu0eysiNQGwfbJiLUeOxatEeVSCSn4W3Hb92H1/dOjTXzv91e9d9OpnPPjYyu9sl9JIm2G6auf27O7fMeQzlFykvVH6HoaDYwAiMYDXNL1+Op40+fXsZNUJtOdcSk6oiGzI7VcxBFjxksTg3mBYs1k69pwZiB2LG6T2rlez669tmvHSBoB0cwBg+5TOiOLIAqzRghUzBhhLK917PvlEcObzDbtHrru2OTtR+dIDi+5eAaU80MnJtPlK6DV0yikYgxV0XV+lH3o/GqhSBm2S1fVZvPPLVGccVgHt/tPAqrdN1UVhkwEkpYQBIZiIWV6TIK/Nd2qMShne8bq5e7+ijmw9fnbj4SOrt183ysCZi90HfmQPaX/xofHdc3XlsCG148mQ6skb2XRwia0IuhnmzQLpwTOJktR500kVu7Zpb0yhijEwO1k1w7oRbc544d6RrESmsLncNGfvfEOPvKo31r+qTKSm5FzLp1YooaLRc1RSevnMa1j6vAiYSR15rxwMlXkJWk0EvePX5w4fXd/sq0u/dP+Fd75+AczdnvjSAxfMpTPjld94yawZQDZHGKXEmovE7QUKFCjwvERBuBcoUKBAAYsc8mcLBIFFp5fCWPUD1zTsuhgcZ7N9yx2zv3rLlFr8qXjlgKU0dLtDR/gQQlN0gGCREXr9sFS1TDb3AfEjT69/7pvn3QI37Rn509/bPdoosxDffmQlJNz1ot0S+8g9uNBdYvFz48o0AcPmQ/7CU/1PM7xDFp1kL4kqUT2TNdSj4+5uPTj2wbt2sUsg6Q8MZKoGSyTIJXayKboAx+m7FbuhlulaDtIb8Nn5xR7m6lA5tu+GfAGjWQuJ255aV9t9+mAO8lzXq5nuoY5iS9FJpP9lsp99qk0NUJBnf/cOL00BgMXlaMOHN1rhBgnZ7EYtlZomYNCj3kGlY9JFFIUR3l/+nUmTI0lJM//lQSYfsX0iTgm3PEKZHHapF0cfVxS3J0jkpIJXSqjp9GQ0qCFu4e6WSHBzVuON448ABKkVpscrH797n44oJ8Ah2sCUZbDEoCLFEmkOoNo6NPlGCC1Uhj8bZssrZbrnTbvmpqqf+fpZ9/tHT7Tu+hXVhGqU6WizJ3R8Orxh8+ybUbm8pht+E0gMYPljd+81g6Z9WJpDNS5Mw6KKPAtsvTqJQ2khbYdHwsVB2d2eAEqGUtMuNyOVtsPBpDYzXvnEew7I1hOISGZYImbOsowyshGxOtdItOfJdS0zAx/57FGXbc8y+uO3777j5knZua//4OJKy7/c7bXKHp4aCHmGh0lalp5BWM3NgokQe79MbLjQs15Myv9CYLVUfTRykrZKJvha+d3i+pgF5GNU56DQ6186ffxc5xsPXZZFPvL5k798YLRSoh89vW4yq0yPV97/2zud08ghWBAAZDkB7vpuUnG0qygpt1Bz5SBLqZihmIWeRmMV+/jd+3z9JO0mlr+5OwMQZzz78Nuu3TZRAWANneNXTPgBEgbVmmPO0WAzV+Y68LQqQmbSy3nl0PcXEGFH2Pxde6QIvH+h8YG7rvnoF56VDfji/YuHj61vn6w+8Wx78Yqal8sl+tDb9lbL/luBtSYFt16gQIECBQC5VbtAgQIFChSIcRWhZxR+ILQ64uwlL1MBEW7cM6KCkYmTpKe3H1+vgSDTPWg6FJpWFvJjtDbubpr4c3VFPwr4rVYymUMCgGD+pwcWg6Z+4K6dI7WSiQiOuqxvbG4zhFtEkv52uNhhlzieBYcrSLXIWc2mWAVLtkpyMS9jgLPgb0a8bZirhJ32BKGDrJ9TLlVghjC1BE90+jlAuM/N1GVbhmaU1r/X90eEGVEyjUatBMWesiG740doSDMC2f950a0wx+26LOuhPSNBVaeXNoJvXDKINOEZyMNIjjtB9YvVY4nTSY/UVLCh9TrE8B5a4gEz/DPsEs/XUWP1pEQq+RC63QE70sLg2HlWr2SqFp17KafJ+n6ckn0ORG1LufMGiMFNPyG+qylepf5X7P39ZwI5QgVIgfNk88S5ztEzbaQk9s2vnn3ZTRPuN1fW+qbFseNNpn9xmbLn3l7lRIGuIbA27Y0Ea2ZtDEdfI/ravdUQefYuZ4Dr1cjudQes5xNTIxxzCi0xgRi0rk4MUm13jJe1yXj02Nrho17m/dfeMnXHzZOu+Y+6p2yEinRP8clOyXy1dacXgCMCF0BPOfHMP9zdzLmZ50gf+o5xlaSla0kdph3uUObomyogrCc9rp4d2yn0YN7zxoV73rQgZ5P+gB8+svbgY6uGbb9hd/Ov3rNveqzszqy+lUnCvufYYkkfoTb9OWIv1N4fLT+xillnlLqxs31HG00zIPGkacQ7GOGopcgXz6Gg4GcCdkQdNYwLKbHPe+XQuq+2Bch5gsUdvzTx0Xft27lN7Tx74pn2fx5eNmz7jqnqX/z+/tuvHzc3dt+f3F/M8BYoUKBAgecnigj3AgUKFCgQg9xT6IasefyIagL48PFWsLo4dG1zctSbbrZNhLOPzELDWy6xhwZutroDvfJTYarxGZL6uEgW4EEfQd723Tvq8zNVyADM/DawE4Itv0mD7BGC+mRW9Qf1D9OwHqfC1YePz9DIYrXRnpL1ym7pvAbVcjZSL7mc0cWVno7oVWMcB5XjahbWlnLwLjTwN6ab8M8t6zWX5/gk1E/eNhGSiKvtvg4/ttkigiz202Nl+zxkBF9yrEmH9wWdi4klVUaF3u6ea2yfrLpR7YtXNq+s9abGK8ThE/MrhjyfUhbYNpnoneELFZFCaPmcZpbRxGjJuUXecGvOYujjYBOPmBJW5ZKQ+imYKF1hqysatUy1m0DM8ZmQI7UMDEFCa2JYixD6Rvrh5ZKA8vLEpougZy5U0Wk///5Kq9/rc6Xi5KfJrWQLaxf/2XfWeScWJAwj4eT5zkf+7umjZ9ovvmHio3cfMJWw88tbXr39wUdXzEWtjQHUmGO0UapVMtf5tNre4iCHLRE/gOnxCmBTQtsB1KH08bygo0qHmQZHnDn4wi8mCJm8x/RYJfjraqsH1GxZ90I/R8TMuHet6YXbnpznnfDcmVYr7WD895HloNDLbpxQ1iqPvjVV+zY1t6jaU5Ffncb4SOjYW+sIM6vJe8XHUwOWHA8tokvCg2FDp4ci+TbwXGOLWQAk84qkpg5LperQbWamgRAr6/1en5u17CU3jF9e6wvBI43S7h21Ww+O3rRnxMoGB3u00g8snUEmb2OG/esWs6Nsfa6K6Wrs80cijmJ6PHxhW1zuXbujHpY1ekbud1tnDbIzXMp1ktMv6CZvISQs7PHl6UrV9g5A7wuQYrXWGbS7AyK88kUT7Q3R7YlmrTQ3Xb15/+jLb5qquD4nKSGUtlc5bzoFChQoUOB5gYJwL1CgQIECPpwVnDpbNJdQViSlLgti+r7D3Ui85pZJGfyuC2HPXL1cInfL+emlri7CRCpFgVkfmZghqPUbkqdfrbb6eg3KBAim5SgR9tyUpkUYl1Z7m37Y7MK2quJRGGB0okBgc63/IbmccvnZ6Gu5tzxvHWaJek3LXj3l/HPC3vm66404fdHuWpA9UMtIlTPBbx8N8Vc4GFLG4RTzi3j0Y+5Y+pzM/l3NoMDltT6RlzFXCF5tefTunvm6uYlHDaWapLSGVOwxGdm3xVh6bKzqcPbyF0195bsX3Np++OTqnbfPuJU7+/bTMrdnrl4pkxsMrgKWwy57pyzMT1drleznGIWXl69WM/4EQEAT5akbL6/1Z8ZLaowYTAiOYibCjunQu1D2acCBYCG45OQJCY6ihZFB1o9OVp7sVQ61tW+h8dDjq7ZCxqml7r6FRsBr51YyzAa4kZ7kCDzZUk4n4Eg7gQbMH/70k6cWNyA9mmTOFXaSeRPt3+mlM/KjvGn7VOXUotX94JzVq1R0/5IQ++brwQCeXuruW2ikL7nqAdwSjkdEJfCfnwkl6tRi96Z9o7lVOLfet9D4wWN27mPGqcWNfTubqbJpX0r63ACNsxfDE26vUan2FYHbiQ7e0O4qWUhLek5XbLu3BGN2IvRMyDMn2PEhX1oNj3KR2PJxyTcJNkebB24mW85qa9Dof/nu4he+cwHAJ957YNdsDR5DPQRDnDeKk5Zkd3/Af/4Ppx56fA3AH75l56tungARCwFklMGNPSe/EsonnxPM9c8PSRXbO19T71pbqdgLFsJJ8/Ri9/brxq7m1vIMlqSdIOlMV+9z1tlp9m8NcSekM5ptiRynhp5m7P3++T+WPvut8wDe8NKZP3jTgjKblJHcsUZaFNwAgdCtRQXVXqBAgQIFipQyBQoUKPA8B6kVrs81Xc1RZirgS2XOAAEr7f73fuIR7pOj5V+7bVrfQRUrl7I9c3W32GMn23nrJ2bu952gML3DPy55/vImVMSsKn3uUpgIe+e2KvRfY4ai4acUWE6RlarvDhGWV0Zl7jXEmaFjMxBBnltJ0fGVrNeoHuMWMGzeXSwFN7QxstU55EVU+MAuj4Zbaw9Ont9wCzgjgF7fJyxz2+p2JNFYn0GHqTJ31ap7Te7noTiwayQ4MvSMdfao+i5c6QVZzl+w4OdYJ1BGiVco64GQPDuFz179kpHTdHnr33rFjqCybz980YhM6k4AcGpx46HHVkz/Sxnt88mRs76nRCLQi30L9egmyZFU2p541M41pqNpBN6jHArs3OUu4NCEwHm/zVOjZZmw3g1Kr1fDwNsVf4/LucsxCZjDrkcyR+bp+jh4TZh//8fH1yOtVemFen1jN7dqgb0wKhtS7qSbrJWFAODIyXXJtgN49kJnvd3XxS2zRUC9mpUdn8TCTM01KQd9B9Xi8uZ6Z0CJcSDv9614JrdXByMf2I+Pt4JvnAFkEJKpq4c06Cpx8JqwJcfPdZxPRrUpFoXromsPH1sPWmKmwV5fuI/2arjDTjfc4dGo2V0pA5HYApJAToyvZ5bz4Pxl12wtKHj20qZjAAigU9FRLlF2LXND0hIcTyG57SFXmO1LCAF4drF7abV3abWnDm51BD5V0ZDJVTkJ/Y/48ncvSra9Xs1e8cJxk7HEGCz9isJMnoFLe1Xi/l7N48hvcoyUiq0bZ7m9taNi7sgf2NUIJs2faGe8Z/MBAOrk4dhAbN0V8mZMd9JMFnfmz2HnkRIgfU+pVw4LvY8BzI+fbH3u39XRPnfeOmleOFXyGTjTFsNNn/eLD4woUKBAgQL/x/G/AAAA///sfXegXUdx98ze+3qRnqotuUmW3G1sbIopMTiUjwAJJB9pQAKBwAchlJAESExICASngAlgOiSYYGwTsMEGXHABd+OCbUmW1Xt9T9J7er2c+f7YmdnZc86976rY2Nb+wE/v3XvOnt2Z2dmzv5ndTYR7QkJCwpGIOvMTjH+zZHzxUpkj+cku/vf1O3M5429+xfyWZocyK3ZS2ovPjDYO7h+afNiTLJ7JIJ2f0U0P7n3v59dMhs25sda8ddWWUUmG5wqv3mrpEpjRUdVNOQGgqz1Pz01ORSlJudtDu80cvw48aw5MNHiOBh3PEp3/rrhbuoYBUMUrOqg/Y0X9X/7zeOpavpELGDIEAeCCZ83MXfOLR/qlONBtoh3Ctt6xP/7ECr9GwcyAyzkxpkgQsZYJCpdluGhoKeyt7KWUJ2eAC84XLS1DwI62yrknd9svV28ZzlEPj2+O9O4cvuiMbjPxrzdxxyAcyyoBSvgl0KMsCG8RsPSYjueeGnWK+x7rX7lpSIsxreJfxieyf/7W2psf3IOA+kJ3wbN6bCHrt49QRka7uHf/ZG9/xDu/+KzwXMnfq9W20KxyIUSCLAWTElh2Fq5ilahAD89ctz3a1P6U49pzVULA2YWtD3xogV0JweObh4sVRjTlCI3XHJ+BOTI2pb0IMbw+I+JzT5nREe/fffsjIegYcYwE7/z0ylsf2hcsnG2lpoMFlbTcoH85Z6OkLtzg7cpFKcaTU3Tnsn4U+7O9ZO/glF1sdOaJHdL1EAHPjfNYiSDsP6N8JwIgfOPH2361Zr9yhrXNQEJSAADgEJ9zandegI/2g/QjK0DK6J2fXnXbQ2ZzFSeCqfWoEPQsOsYgLv/1gtnNC8wAAQB3Lx/Qwm2oae/+iX/61nrPXztAdPDcU/Nm8ItH9oXuErUC3vIvy352f19cGa2hGYFNs7ra87btiVF//dpto8VDStFUnP+pMe1Tt2zEUrhAf0Noa3bHz49C5mu2jgR1ISDCig35qInsWILGoAHAaie4OB3w6g98epstbuMO9h4tTQ7NdcVygkevdT6xl6GysQgAcPODbIFZRuOSDSBh/uLGThSpAWqd8QtiYtKv1DxjuNA78wZjK20EiOed0lXaxfhqeUFzCET0/z79+G0P9VuddLVVzl4SrfN4YNX+Yc1XULNxCIj/+f0tn/vBFvuSA+X9L7QYo+C1Ojhfds3BFq1OseaVQVy1DKmwgvBnD+xTLfIWWzbqMi2pnlj3hISEhARBItwTEhISEhhhhoZm6oeAAJOFEwt1ZS0iOIeI8POH+6+/b4+95uwlna95/my0BQI6ROfwZefNsmmVAPDtG3aAJx+JhKLGvYNT37p+59ptI+u3jRlmqnxLjfXbR/f4nHQEABgdz5ZviPi1c5Z2hAQqxJmd1VwdPBHpZ2b7R6YeXjOYe8SEfK9zfD9XzJ0pOj6ZOSez0DArdiD8DH+C2NlWzeWObd41akgi8ISsUlujhV1ufHa5MHElc87xyczyva5wydhEFjLtZYJ82vHtsmUB40d39e4bnBLN+xIxI/jc1Vv3DU7es2JAKuHFUnL4oQ3GuLL57/ikLrk3vD3izM78DgYbd44GsqakKDSiiKbaCPjq8+faSx9dNzgyNhUIcMR7VkSrNM5e0jlrRjMrW8gJBBgpbAg+Nm7OU/VEAmpVRLIoVGmgVPjf973hhKZqeDHLCD552drB4SkIvSc0ZHSc/v5ra1ZuGqo4fRoAwCueM9ta9fBY9vC6QREJIsI9y8PeAgDQ2VY5//QZoc7AT6lpaUoTl1gab3MsfG6pfkEEZMiSAh5YHbF1KzaODMfrUc47udPKz/9yXEwCAsADq0Ii513LBvYXDnXwnk0pQOd/dTCjI+I39w5ODo5OWaIL+VJoruJLzo6iU4+uG/LPlZRzbuDlN+/avGvs5gf2sucwROhQWWex/dpIHqwdIIBzIJm8INQVIsDs7miDlG/fsG1yqrDVD+K9xtpbm92F5/SINBAAXnjmzNxxoD+6s1d3rQEEAIeIj28euuq2nVfeuhOcMVbEohMYGpOgpqitqYoXFAT44OpBQHSRAPHym3dt2T1284N7PZvnf/hShgvLlcYmlegsM1b2e6BK8P//zWdH8artfWPsDQxzSISXXLXlFw/vW7WFxxcEbK7iS8+J7n1k7eD9j+8vmsFlN2zbtHPkxvt6RUjBZ9SiBAFgbuF4hl37xtWr3far/A7v42zY/Gglo4vrusaFqRdXmq/D2EQGEmcSm8TzTooY2E27xrbvnXCO/VD/8FRu8AWAodGpaPCAWPS6riv47dDhpornHYfeYCuMYxO0YiN7j6aqeYvBwtHfAOMTYiRY3vbxiYy0jky8om5PPz5JH/7ahqtu673mzr4f3bXnh3f2XXNn3y0P9j+4enBodApBD5cghGinvqK5Do9l+nBnrDK3ssFvFzaNYeuCMxkVmqp4wbOiaK52Me8xNPz23Zt3beYuBoASN0d85XNn2dtHxrIrb90dHiC1fWTt4M8e2HvzA+Y9kN0lDBVWYIxNUOh/fmiVlyOvDun+Je8SQ2NBV0rXj9R45TBdqzgkZVHyBgEi9JsN5T7zva2X3bjz6jt6r7mj9+rbe39we+9P7+u7Z0X/jr3j9i6o8UdCQkJCwhGORLgnJCQkHNEw1C6AmQAL+8aT3jXbirnekreNOJnBFbfu/tfLN9nkrmPntXzsTxc53vQSnVAkvvx5Pc2ve9EcW9yy9UOXfG/z1BRpBlzvwMRF31jf2z/hHM6f1awzt1rzzMkpuvK23frnD+/sy5ELr3ruLNnJBQGgUsEzF3fYC1ZtGdk/POW//q+f7mgtJFZv7h0DBJ/Kpezkrv6J3H61gyNTfQMTgSxDhwjomGn1bJ2XTLXqjp0XsYRrt43cu6JfJT8ylmloAxDXbo3yfAFg864xSeFCmf9GwtnaOw6oQsUwTxUQwZZdY0on+2k2ILzjtQvsZfuHp/7hv9bvHZgA3skUJyfpP67c/OCq/aA7UQhfiQCrCtnEW3aNoXMOnTeFQkVg977x8SkCx2ymEA944jH5XTtueXDPzr5xAHDoJiezqYxUSAqxY6mVCOal58w+68SQtzs6nn3vtt3K+mzeNWozlJ3DP3/1AiXP5VNAxOXr8ymcyzcMKgNhCHJU1aj0vU0o7+q1c8JR7X/5e8fbAjfsGHnHvy9/YNWAtgIBpjK6/ZG9b/3Uo/eu2AcAzz99htTLIeLcmc1/eOFRtpDLf7YTZEv5iUn631/stt+++RXzW5q8QpwzQsxllAPApl1jYBn3gv629o4L1W6Fby7YPUaG3DEcZh4bd47duWy/fnXFLVGdO9sqF5w9U3g73zMcIj57aX677Wvu7H103RCgW7Fp5MvXlvVob/nK4HKNcHG8iRAR+F2hfcNGRklsGAHxLa86OrdU5VOXb3xs45DvKACA6K69u+9bN2wHgAVzWlDNAxEcAOHKTXlbWr99RC1JTRfAGrmUAAAAzqlz5W9POb7TpkVv2T16yfc2kkRDPIbHsu/8bIde8yevPGpGZ1VjM+Cgo9X93wvm2Yqt3DT03Vt2GJ4N7l858KEvr52cos62ivNxRa9+wuUb8jHLxzYMIXi5eDfiHOJb/s9RBQFuemzjUDA1dNfe1XfZjTsA4Og5Ld6bQuhAJauRNu8cQ08Au7LgD8CW3nGNX2h9fvc35na1RQGGz31/c9/+CQTng38j49kn/2f9ncv2AUBnW1UGQQCEt7zq6PaW6N5/+Z/1KzYMQXAKeM0du7/5ky0AsHBuq469Wj9x3qrFUPHnnZZfcnTvigF/xda+sevu7uuOF2zt3DOeZUo1BgJ31ZaSEUSHh5Je7UcQBz5QqOPvK54zy15KBJddvxPEp33zJzvGJrLcFj0rNw5lGfEYAzJUoWlxGOl840W4BDv68lvYq2tHEaAftr5943Y9xKK56jTPGgFXbykYye4G2o7SzUQZixeEIfvxzSP/fcOur1y74yvX7vjqdTu+cu2O/7hqy0Xf2PBHn1j58W9v8qfB6yjg/yUqSf9/bNOwjhQAbI1DI1O57b/27J8cGsvYZblKSY29QlmaDmWs+ZNXHt0Wd7GLoy4GiBh3MefAITjff1569ixeVCS44padP7mnT8t3DldsGP6nb63PMjpqdosfxP1gj+AQXDEAs3HHiLwgqULROZ+/YTwk4fKiuDYMITgfo3FY8VeXvHLsHpOoAL+E5tC7Tw7yMWPSiUa/vf0Tl9+868s/2v7lH23/8o+2femHWz9z1eaLvrHujf+87C8+u/Lhtfv9ZVSLdE/0e0JCQsKRjUr73EW/7jo8bfDq58+ZnCjfXuD0Z/+fJ7kyCQkJCYeOeIKJfNCTmTv09o9t7R17aNXAN67bkst4nZjMNu0au2fFwE/v7bv0mq33rBiwbPsZizoufueS7s4qWn4HQHktRDz9hI77Hhuwhzqu2Try03v3btg5umz90HV3937ph9v8fPXl58268JwemZhznZdvGH4ozkB/weldNz/Yv33P+ODI1I2/3Pv92/fYKp2ztPONL5/vQNL0wFMszp7ymmWwbP3w6ER25a2771q+/5K/WHLnsn7b8PXbR+f3NHe3V9paK4i4fc/Er9YMXnr11uIBcWu2Ds/oqI5PQFNzpbXZ6QTSc0zKmDnE3v6JR2Ta5nHrQ3tveWjvtXf1fuPH22d2VU4+riMjeGzj0D0rBr57y87c1gGbdo11tFYAcM6MZs89XH7zbtvw/cNTo+PU0uTmzmiqVBwi3vzgvu17omn8+h2j82a2dLZVW5r8dNch4DHzWnfvG19jmKy+/olr7+5bs3Vk5abhmx/c+4Wrt/qZ8MK5Le/53WMqHIaA9dtHH1o99NXrtuW2Fe4bmBybyKoVN6u7qVpBQPzxPX32YNupDLb3jc/uaupqrzY1Ob9dBDpoa648uGr/LpNTNjqeXXPHrtt+tefKW7Z96ZpNv3nunJ6uZgRm8gxvpTEetRxEhDMXd/3sgb4x0eyj6wYnJ6mtubJ8w9C/X7FpwORBv+nlR114bo8vBx04hL6ByfXbR398b98PfrGroPQRAmiqusHRrOKgvbXiNaIUgtaM1a91FMrh9BO6Jqfo4TUhCX1gePL6e3t/fPfu+1f2//xXe66+fdelV2/66T27B4YnAeD0RZ3vef3xiNE2BWee2Hn/ygHdN2bHnvH120dndla3941/9n+3WNbp7CWd7/3dYy3FNTQ6tWLj8E/u2fPzh/OnH6/bNtrT1dRcdd3tVUTc3T9x0/1RXu2W3eNd7ZWmquvpqnpD/+4tuzPjNkbGs32DU93tlZmd1YoLGw7c+lC/5ZW6OypLFrb95N69I+PZzr3j/3PT7gdWRT39j35z/rkndZqOzOV0tlUfXT+0w9j2xCTddP/eK27Zff19e0bHs4/+yfE/fziq85qtI7O6mhzizK6qBAcRAZqq7qb7o/U6yzcMXX9f388e2HvZDTvWbh254Owe7dFtLZU5M5ruMmdmjo1nN/xyz7J1Q6u3jty9fOCr12278Zd7AKBawQ+/8YTuzioAoIP9w5OPrBn81g3bH1mbJ6ZXbxme1dU0mQEQdrSyPJ2ssHASrslFmRAQwKexk3PQXHX3rAjtXbV5ePmGwQVzWmd1NxPAQ6sHP3HZej0T9SVn97z7dceySAGBCSo8Y3HnvcsH7EG7D63e/9Cq/dv3jN/72MBlN277zk3bxycyAHj7qxceN78dAPuHJ5etG/rOz7bfvzLybADw2KahzvYqAM3ublLrb2upzC4T4KPrhtZsHbl7+cDXrtt24/0iwD8+vruz6k+THhqdWrZu6OrbdxcP6169daSns6mpijM6qoC4effYL2KT3rBjdO6MpqYmN7OzWShgaG2qHjW75fZHgtAGR6auv7dvx57xlZuHb7iv77P/u8lHR5Ye0/7GVxwt0RpEwPaWytyZTZ6L9xgdz66/t/fRtYOrtgzftWzfl67ZfP29vQDQVMWL3rJ0RicnYKMqU2MIolLk/S5w3szmmx/o7TdHB6/eMjw+SY+uH/7P7285/7QZLzuv577HgrTHJ2nXvomerqZ5PS0AkBGs3DR8x7KBq27dncsWX799tKu9igBzZjQDwEQGV90axbd27ZuoVlxLE87qbnYSNOzpqm7rHV9vwnIbdowuWz+0Zff4//xs513LBl5y9szXvGDOz03q/f6RqU27RpurrrO92t5a5TCXjIhCvwchZADrtg1v7R39zk3bHlwVrcsBgMkpemTt4IOr9uv/f7ly/5W37Lzxl2Gvnre+aqFDzAiWbxy6/ZF9V9y8K9f2ddtHO9t825sAYHyKrrqtpO3NTa6nq+q7AxAtWdh6+yMDYxP1yNQsg827xm56YN+5J3XP6vYvQjAwNLls/fB3b9mZc2gA8Nim4a62KgDMmtGEALv7Jx5ZO/S1H+/YGh+WmxFs2D7a1Vbtaq+0NlcA8Zcr9+f2QFu/ffSoWS1tLa6tpSLGhO2t5T6qXhcD2dcFABFOPb7j1of22mVq96wYuP3R/vXbRx9cPXjFLbu+dcN2L5N3vHbh0oXt3odMZvDousEbf9l39R27c7vtbNgx0t5aQcCxSZrZ2RQGbnlr7B+efHTd4Hdu2vHLlXntP7ZpuLOtAgCzupsQ0L9yfO267eWvHM7N6q5WENHhdXfvKb5yzOpq6mqrVpsQAQhw6bFt9z++v/S8cYvd+yZu/OWeuT3NJx3b4SQLoTZCOMW+epdFeRISEhKeEljx4PWln1eb2398T++TXJmnL3DOqRf+uuvwtMEX33/K6PCe0q/e8PbPPsmVSUhISDggkJnrEB/7xD8ZAJTpH5n/75Ir111587YDelBnW+VNLz/q9RfMqzpm8HnndcsICre/b3DyQ19eu2ZrYWNlg9MXdVz8jsV+M9bMHE125W27v/mTHfbKT79r0eev3h6d7SmYN7Ppc+9d2tNZZUYqTO3h77627v7H86wQInzoj4678Nk9//jfG+4qUDl/eOG8t796IQB88n823PrQ3voC+cibFr/qebN9qWGXWAQAoIwAYGBo6q0XL+vtzx8x5/He3zvudS+a3Tsw8fsfW1bnKe2t7gcfP8PnU/3Wh5dlxQX4AFd97NQZnU0A8JGvrn9wdb7JAPBXv3+sVJXZH8ro367YlGMec+jpql7ynpOOndeqcZo/+dRyfxJpLXzx/SctPaaNEN/5HyvXFzKpAeCTf37i80+bAUpFIy5fN/S+z68s2VgAAAAu/9g5i45uB0AXrE6PuyM2cznejICIaN3Wkb/+4srd+8rF7iXwRxfOf9urfZp/KPbTV236SQMvmm97zbFvf81x/l6tlZ9ck9YsHEzA1fL82rV37Pz89zdMewriaSd0/uu7Tp7Z0WRK4049NDr1ka+sfnhtiZYV557U9fG3LW6pOpI9mgjo5gf2XXz5xjp3Pe/Urn96ywmA8Oi6ob/58rriBcfNa/nqB5ciIgG89u+WTRR2owKA//rQSUf1NOvWuB/95kbLQLW3uEvevfgDX1xX3HgBAM47uesTf7ZIshWJEJAQ/WHJiOu3jrzvC2uK++EAwOtfPPddv7Pg3ZesWlPIhj5ufus3//YU1Q+AI4C/++qa+wpEj8cFz5r5sbcsljMlHAAQ0A/v2P3Fa7YUt9JWVCv4929a9JJzetScrr1r92euqidtAHj1+fMu+tMlqIw7IkR78kebRlPOrQN99qr1RR/uHAKRdibn8A9eOv+tv7Wg6pCAkJ2kfwQh4L7Byb/98urVW+o56t96/py//eNFvhJX3rrzS9dsrnNxa7P78cXPAoAMyKHzxv+jO3u/+MNpBPiRN57w0nNmace++f49//KdDXUe9LxTuz/xtkUEcPsj/f98WcmVJx/bfukHTvYML6sT4Yd39H7h6s11atLRVvn8e085cWGbnpaouOaOXZf+YPNE3VZ87K1LX3beXBCPYEg31LJIzuKkjJX60Or+93/usWKtTlzY9rm/XLqld/yd/7Gy+Lif/utZlQruHRj/g48/VqtKANDeWrnmn08ngqGx7Hc/Wj7WXHfxWc3VQBXuH5n8wBfWbNxZ4sCPmdvy2b88uVrB11/0cPFc5De9YsG7Xn88c+slaceQEQHB8OjUyz5wb5061wci3PLZ8wCot3/iDf/wSJ0rte2Do1O/9w/LS6/54SdOb2ZCFoBg197xf7l8c47pLsUxc1u++tcnVR0C4P/+fPdXr6v3QtXa7K791FlA8Jnvbf7pvX11rnzHa47+vQvmIcIXrt76oztLxqM3vGTeO1+7wA8tfhiVLra1fhf7uzctesnZPcWviGjFxsGPfmOdJayL+L0L5r/n9ceqGW/ZPfrmT5aLVLFgTst3P3ZWbqdARLri5h1fnM6NXPepZwHCn35qRf1Xjkvft+TEBe3o4P99etX6slfEf3rr8c89pUsGeRifoEuv2Xbj/dO83QFAS5P75ofPPOHodh84ct5NO0T+NTDtiXBPSEh4euF7X39/6eetHbPffUm9N4oEi7SlTEJCQkKC5ANHqcGSyTYdKg672isnHNX68vNmfeSNi773T2f+/kuPanIyz5AVx35DFf4/716BPV1NX/ngKe963TEL46PqPOb3NL/jtQs+8xdL25qrkgIoC41NqruCCC5+xwlnLIp2iUGE553azWy7nJ+lG6cgwMf/bPErnzPLmY3UW5vdX73h2N98dg8CnH5CB5Qg3D4tkOdUDhErusMO6PzLzeisfv79p9pNTrTmJx/XcdJx7X7f+2mf47Nfy+gLLVDXVteqKs8QOckd0Tn34Tee8Mk/P/HU4zuKBXe2VV77grn/9aHTj5/f7vxmMbJnznSVtUmcpTURs2ErwrOWdF38rpMWFOykqYovOKNn9owWn4FuS3ecKwfGnjUDHhcvbPv2RWf+8cuOntmZP42wWsFzT+6+9P0nv/01CzEYHaJrVOkgwgQEV0Hw6gkkKSfyYVg8L0vrERDwtS+cf8U/PvtNr1hY3LjZY9HR7R/8w0Vf+evTZ3U1S05sSA8EhI626n++95QP/sHxuQ2LPBYvaPvIG0/493ctbWuu8O5GvPlyI82T7XantbQ6Gg551CWXjU3QcfNbPvn2E+b3RHv3N1fxDRfM/fifLXIVdCpCz3gj+i0vTlzY/q/vWJI7fqC9tfInrzjqXb+9EAHOWZrvaKHSXOsKOKg4/Mc/W/yq5822nsHjqFnNzzttBgACb7nAJw287kXzvv43p73wzJnNTfneWq3g806b8fW/Pe2lz56N4hbDaQ71IQYMcrnqWuhaCIaEauvM/3zg9xd/7v2nn39Gj93ZP8uYbW+q4AvOmPmF953yzt8+prnq2BjAeX/lxCR6upq+9MFT3/nbx8wrM8h5Pc1/80eL/vaPFzm/eYRrcHLBrtgL0Dn8nRfP/dpfn/rCM2Y0V8sF+LW/OfXCZ89yDthcMSwWqvmMsMaqZi2cqMRVOKn/dS+e96UPnnr+6TMqhfKdw994Vs9/f/iMxQvbAR2fFCkqQcTXv3j+1z90+ovKzKCpiuef0fOtv3/Wy86bG+fzihL1oG3xEhg+gLOXdP/7u0+e3xOp4Fkndv7bO5e2NlcWH9WWOxhTK4yAjcz4ENFVXG1JsQMFGcO6O6qf/culLzu3Jyels07s/PS7T5rVVe3uqJ64oL2sHBnH+WFeEE7t3AlPOW2d66CpKuN8A+XgNFYC4hqRCL9/e+8HvriuEbYdALbsHrvvMT5MuJEG1XCKJRXmxS41R3MpLGxe5n7nRfOm7WIv5S4GvLcbv7YhOjx9Uddlf3fG6188r7sjP2giwtJj2j/x9hPf87vHym5bunKhoVbzgI/8lsjHiU97Y2N2ErRb++WHSwO4Z8X+D1y6thG2HQDGJrIf3rEzKikhISEhIUGQMtwPACnDPSEh4emLOMMd4lRIMCmRIcUdSFLeM06W5Nzg+E5bPgH6E6j81Ca/qyXqLFCqIefnEdGGHaObd43u2T+BADM6q8fMbV10dKukyMuzQTa8Ibry1t3f+Ml2+4SL//yEs5d0EsGKjSOrtw4PjWazu6vnLOk6ek6LzZuK8tuFHd61d3zZ+sH+oame7qZnL+nsaq/43NGQS0qExbmdsOcEhGFOx1lS6FCTtrw80CdR8hWS/k9c1Ibtw49tGBwcmWxucnO6m046tmPWjCZpsReAijJKZ1bp6mcsf1UQS1laL0JH5/TWmCdHWQogbQHsGxh/fPPw3v2TE5NZd0dl/szWU05orzrRqN3EVHO2/dPEvCQdl2vq/4xpaHm61lppJ0QEJILlG4Y27BgeG8/aWivHzm07+bjOjjavLE0k0zoAABJlUimSjHL+LaMMCKYyemzj4NbdowPDk+0tlVndTacd397RVmHdoc0fRoDAvDhETa/2jyafrutZDoekVRK78yag9QFA1ZFPaPVtzygkaG/dPbZ682D/0OT4xFRba7Wns+mU4ztmdTcDAmRFYwBfYe4rRAS4acfI+h0je/ePVxzO7KwuPaZ9/qxm3zqizBqOMaHQZv9PRqRyFaXyt4imFWzTEc2iigeRP//01kh00Tc33P94tMfCTz51hnMwOZXd9/jg1t3jGcG8mc3PPbWrWzclD31XO3P4QRms3DS0YcfIxBTNm9l01uLOthbHdo5IYBktMXViv+DYKrkRewYmHl47uGf/RNXhjM7qiQtaj5nbxt0LbLJ5pnY7MpYt2zC4Z2BiaGSqo7Uyq7vptBM6/LYwkhQvjwYAlJNmOapDSo+BT0VnB+KJad0gXdoSepJ6ZQT0Dps/yTIioPHxbNXmwW19o/uHpyYms7Zmt2BOy8nHdbQ1V/yhjiSHOyKGju/rG4SFsHrL8LptI4MjU4Awo6N6wlFtSxZ2IEJGGaKLtiWjjMsSl6tjh7UtWXSkMqHRcVq2YXBP/8TQ6FRHq5vV3ewFaE3T+sLwoXesvu2IUDBL59A+yQ4Dvm97T662NTgyuXz90M694+MTWUuzm9/TctqiDr/1BwYPbk1diiUYHc+Wrd/f1z85NDrV1V7t6Wo6Y3GX3/Zdmb+I5I1cF+e2A1jNEhFNTk49tHr/5l0jzuGJC9r8ztqUdwHE/kE6hDhkBJITsv2IimGIZQWDjMtoV0/YDu99TNDa3v2Tj6wb3DMw0dLsTj62Y8nCNgA98dY7Qyd51hwjcSHoCCDntshhvF6B5H8jUssJ43/wJNZ2IquwxqEGqe4xOE3KjNX4MUZHzyD+8OyPX7bxbjl3uruj8roXzjl+fjO/BwBkGW7tHbv6jl67Icmrnz/7ff/3GJRhVt4SwmDly/cfQuxgZShX6wapJuWGaY0raAFq5vpD331GxqaWbxwqdLEKsD+HGAU5EyzfOLhr73j/4GRrc6W7o3LSMe1ze1q4wuFKb+QkVfdNzxCRCuc3i/VLTVnr3l3L+09kCvrupM1mi6eMuARAoowdInlj47t5JI5sioDgB7f3fu3H233J1Qr+1vNmnbmoo6kqoXuE3v7JG3+553GzX/zx89su/9jZKJntmufOP/TFJHR261FzUkhISEh4qiBluB8WJML9AJAI94SEhKcvioQ7GOYxbECg/4btZQKKt4BSDIGwY+qWZ+Yg3zGYYzIfysySGRIi0rm98iZAsp0McxBAV96yK0e4/8ufL3r20k4iPinMz89Cgirz3whI/qRC5XVFLlqd8JufEPlH5nNd+RvnH+WJVp1PgczumFsQwh6EV+WqAM8GhVzwZcqkEJRIK/svIuBB6x0JnijwOCJ9z06Dn8cavSgDBQBeRIZ+QuIpshcQOXRSAdK5a/hB+kTWZmb0KrEMAAJ0Tkk9YQqUlWbWkae6CCpioWqU19G6SV3kaUKl6PRcYjcAWZbJ39H3IjpQQ1YiEoB8rihXhskTnk4T6ZGAvI2MJU+Fc1Rzo8DzCsfkqZjM1kRI2tAV8vGUwMYYWwlN8iqVMklNmwwlF7GGAgqXyyO4i1o7karkyglsXeBR2AbUViU+cNE31ue2dfrpxWegQyLyh1UCFNgK5mSUGzV6kYoQZUpniPQgIjyE1kJw5uKICyGQz4UJIqaO2JJ9EzytA0KkqVr5EeQtVcXDbjDECjg2A0LrqBXpxeCcPasZpWcFJszEbtQ985+ec2ejyKwClLxT4SiHD0xXaYfz9u/tHJ3XOgqhRgQ+tZ3IByApy3xnDDYBEg9gF8hPQgpkv3QahbZPw3WmxeEf85AsC65GnQCE0AjqoyHYjyQgkwTvRMus7ui54boQkLN1ix8XHmsDcCYUp1/bbmjGWTAjc9Bu+DrqU+olpJxQbbF3aTDxkIOASFkGQn9Hl0YmVoBcFYYYHg6VggYXL+7xhLv/0kk3NArXECmaxqk3s3HdMDZqHwN1dzoCFW1E9u/yX2RKrKseURyzkap/3I/v6fvcD7b6C7vaK5e+d+m8nmrk6xCAYGvf+Ds/vUp3bnnuqd2ffNti1FAeADOxYTzUXofi4TPx+aj1EFJeBgyxXgovJxxr4Q9tdgG7/NxoLkqE4N/0DvF6yFaUkTQxqCs/KqlDlZiMjErgO7a60jDeBzOS6vA1nivXoVzeNmQQoXhwUtNA7RY+BMLXe6dF5qG+UB1qiYA2bB9992fX6M51//iW488/rdvrVzosIuIUwVsvXrFNttdva6n87JLnogtMu24sI68GiXBPSEh4+iER7ocF+RVhCQkJCQnPSKDJQi373M/8AxcI0SwgP2HjSRl5RkxBCMhcNoBDYTU8rRRN7gLjzoyGZJUxf+2pQJmNZJp/TT4HEQKJmWsOOHSkpI2d4QCCJGD6OayTj8M0k3/hzHQgCiQZMtXLE1oh7CWNDyUl0DBGwij4xiLveyHJWr68LEOezYk6gmb8LJAn6MTTby8taaKnvFi1yJlpVjKGg0elbFGZDl+uXk4qEU+wuQyIs7jBSBKEKgmz68BzWv3yp4QgcYnAiAA/mPPEIWZeyJlE8qAnFB6HWGRMk5EQghpLcAiBc7eEEHCTuGhShgE1CVKJSBOZMCZmWU9uPbfGuQrJzLxYK2/BwaIAA0dnEq+JwLFmg1oMVejQkViGmAiHc0hlLFRgkLcLApDujgSVICG1FH2y3ky5+Iw8WTUWogjIZBUGb4JSG96tGzCzZ7wa3xBAAI4p6hDNQOUszZ3INqyVlS8RCFxgdNQrkFKh/lam6ZHQM1VObhaCvsKez3H+KwBfxasbgBAwAxdqoLwSOZFU0K9Z4uDUMNFh6ElkQjQQqHUlb3zVVOsA4geYPuJbvaH5Tp+nsMPvqNnK0kUwaAQByakZISJlYv4iQaXf2X8DOAcEjiirVJBDaZqdKn2GWGwiQOYX9ZMYTryd+G4Qyw8NQok2ITrMtEkowgHvgjWzFawZgQQ/EDAD3XMMHHkVCgXIUkZCTteW7maO57BuS8Y4EZbYqRBwtvq+XWgjhVKA6YnehjMIDiun2KhjFT/U/hb5QESkigs9g4ed0KlEu1h8OQgjKAL6onw3sj4bdSdxzLlyEEceogLOGTvWZ/MYRMVjPChYo1LYjrtTxi8W3P3ZU9n1XC4IElVfWeQ+SdXwk3tD3tXLzu2ZP6tJ4saB2yZ0x85tOX5+69ptvOcMkexF5hwCoRz3TIQA3Hd0MEDy5904AOL1LeQACB34SISOezwwcJQXAJCQZFOwMFpLEEX6uHGiaMYi0L6MQcsqWgTCCmaZHwSMafoXPTVgQM1AkJrywSRA/M6AiJDxh477trwaOJTjZ9AhZSTOGSEjSU/XschXV6rNxwRxKzP1Ik506ADJCMF0HuI7EG+4f6+y7UsWtp1/2gz2yE5eHQEAscnB+afP+P7Pd8n95s0pHoaCJhISEhISjkgkwj0hISEhQfiE/CRX/43n2GZiCFm4iOc7Smf4aRz5nbUD74nC3yl5L9SBnXMDOp8gyTMhXoXseS8A5uNzkM09lEXj3YQthcM8gO5WzbNljUcw8yUTbD+bdMIqKcUJGPJpAx/G81gEAFdR9jssshYeLnD6voKVimeFHAIRIRGBI+f3N5D/mOEnnaCGAsNsDwP5KDKh/MzPBaKOwg6wyBynXooEgI4AHepuOiR7bfAslBzvs8rq9VEBob+UR/etQs8XCLXupVNBCCn4nvwJ9LunZVhhPEtGNGRN4LF8FME5S1MLRQdmbq3mTADo0FGWXywvD3ZxNrJhvY3WmZYqEPAYiBTyteJdHMjzW5pH6mkIJvoDkyJNUCEQEd/kDEUFhpzTXqfEDyBkNh6mIhXazvS78LeQVVqmsG+yUwmfJxCtQVDfQcYumWcBFIpDyS6X+XgJp0bnq+jlz3xcYDlktYp0PmAXE0TP3wp1jOgoywJlJL3IubBcQ9bj+HiAtofLRaXoHYuHtygnjXGhl06FjU030xHaS9wiAIDGuQCJwDmCQDKzl0DQfcklvV3/p11AWSPbTTyn7SJOkXOwJc+eaTVuPmjvYG9g3KvRgwRqvbw4rOAAiKOJQkZJTMITgJSxYTuJFYA3TZ9nKm7Nc3AIhBWJbbHU1NWAlSqYHGzQvWtE1kzru0oloyxkyguH7VD7FmL0C+nAQLyTuCeGJfAhHt75Q2UJVQ8oYVAJNIN2lljjwvmHnaZ8jY29MOeoXVo42LAsStUif6JGprnbS2YvYaTH2AGCGpLYig5bqKOJMKjq/6xhR5+D2FuQqjDALMMQZwh/shfT00nQhQU67N3UoclOLATBvyuMWyYAHzbQRVcanw+xDxLHZ0YuBCAvbv8oBwBOyHsgYjWjPSH2hPmtpjOSvDmAH9M62sJ++rO6qtJwDsKB8N0Y2wd4vl3iHRItQyaUxXEFQ+PXF/47uGUjQt+L/S/S5UMXU+GHVxR5XyFd4AEA5ABJTmfQFybtHxq3Qw4ZB1Pjl0UIERz5n/gUL0HuIHonuUpF13HoYQ3iq7x2OWXdoWQkeGeaZU6iICH062SBjXkbBQIMb1kAG7aHk1ePn9+quwJKvUW2APa8hFndTfpdjl5X15SQkJCQcGQiEe4JCQkJRxwkn0hSpM03SlaB+RfNlzzjzc3fdQqnSe7+wrDSmieAno31TFPG+V1+qmQ3I+bSnAMQAlDTdn0WIDM1hXa5wB/7WSESoP0MOMUO5WFMiSH5GRohoEP0m2hL+hUTAzL5d+ZwzjBt0+kzauK5PA9BZ2Km0rx9OlKmGfFGO37OS6h7zxAgcwlKvoOhZCnI1xLuQbvMnyifECbbSvWqGMPEMQPEsM1uoJ/CdFluRtkTAkP+dSgeAQEzZ1gwyXnke8EUHZqkn6JGU0AEzeSaf7qLZtHgqW0MabGSeM4kgyxagIzpeisn5btYt5qHHk2cpR26340QxCTpsf5/DgAcc0ngHEQVCCQCE9ryBEmk1qcBqKCYRgUiyXxkaoQiMh4BMwypsNJ4kFqRNzDULHBmtaS1SseyaUk7jaVpG/JmJpwWyoIU6SREiJR5gYgOMJKrasHTUmjiQ0os8QUg3c/6KLmAu03FBaLNV8Rnl2pir+8TDlzERgH40JFn1JnF1oUHSEDOCY2DgR+VrUhiG2GST3bORsdOzJO8FEgmprPjXgbW8OVCNJngpJ6WK6o68ewhK4MrZnlbrxUf5lLC03QIRP4657uEqUVecAGEFEJU3rs4kx1OUk/fPhNvJdDEU3ASiQ2uhiWHQnshKrPmJcuLDmRIUpk4vx5BqktEshs+ic5I1ogwFc8eBlA2WrJ+1PcPpnQjB8+ylxxk6apl1D7ocCAaRZAjILS7eQuR3kFSZ7UdBIIMs9BkhyEkIlYjbLKvdiCuwYhNTIRZdpSiZHBQl8DwXp0NRHjdECQJp4FAaJxYNfroprDy6jKDLaG1K+8nI0sVwt92LxlqOWBibRNFeDyCyiWGZmcemCCTtSBs0TKeoW4Jzt5yKiPdJQbEHj3Vnin5zLaOW3YH6vbMxZ18MXKXwjCciRZ5dPajvzxUFnoxKe1PShAvpbbJkSTuIyGYoCYahKc6QnTOkexhZ/h2X5AjAOclKO9JJGVKxAjV8zj1cEGyoW9YK7WeHJHFLctzzBsFSYo/ZhpkzmTLNe3EIi4eCtX7cz66lq7BG6b+kWTPIUC/qx8PamMTJpOD9SA1EyfoFWdDL2cu7tbXBZABqTCmJSQkJCQciUiEe0JCQsKRjkBDgk8YtBNHTTnW2Tka4h0zZ5OWJT3Mz4JkD2ulecjmU/tEMCaoPPca1n0DE+2SEw0AmFHGxFRGgAjDY/kk95Fxk7ElPJXTORzP/rWaEOZ9nishnUPyIu/ABVCYTJoJI5kSouI4bU+Pg+PgQyBeuZJOiTihlTj/igAcIYVUVHKari1T3MBTEMlOO/FMnJtroiMOnKbIIYb8ypC0Hm5GRIKKY4oxppp9FhvTxiIZMnoDDhsQyhMNexDgeKU9ggpJWQPZhIbnySpo1B8qcuFOJV2SSLYlEK4ODJ0a+HMlopSO8I8PeeEasLGJhVxTRM39N9p3Dq1hOPsgBOGS/M71+i8ojUqmpkZx8hUTq94EnGTXyn4yGl0IVJd8ByAFcm/2DCuQ5m/L47gOwLdJn/LPIbSWphYHpMWS8hyk20iErU5IY0XMdRISwPDYFMQYGaOudhdoDta5uBM2HS0T2W5d4BqdEG/aCFS+nEle1O0dWC7BMvxDxSlphQkh7Hghe89IBM7nyAfCm9UqqnOiIvlY9lQBMNZoOhpizk0F49fgClPJbOtiLcFTaTa2unApWpPc/TcYfeMwbCQDIN3QdB8QXgllpYv5ONTfk6EhTVQiPmraQkCKEaHsHKRcqk8dVh5PL0Ngfp6ZVc3t1l5s7cnvNab9DDRuqgFZNKEmZ4TOBRCxclD6pzpzjlVQSKC3m/VrCTwuiC2JLp3hCX1PQU+hEsmGbRI1kYJ4bxZdDJTxsZAgATQhIh2g2dwj8OzSpx1ilpH4B2M/7El5n37we5WoRaAJAIgz4sEDvaMQf8qMpWwMEoZlzdHmzqmm6EIPydkboPb14BmlxsoKAye4A4Y3iqB1EulnuqAEsrAJiwaahKV1QN7M/KZJjmZ2VvU01OUbhn7r+bN9s4XuB3IOgW771b49AxP+k9Zm94IzZzr2Xeg3S/PHlduXCX8zADgZogkc+tRupo0JACtYAc1J8JE/kSqFOAobs12VYF5ZCKLnepfiPyQMYUXuKOLCwtgTvwyI5IKrlp6IINumS+cSnaLtrsCeTMyAoz7EK5SCwaiP8gkaxP2UJFio8SkEyPxzHKIeiGIcAiJUCP3OfpAZrn7OzCa96LENwxyJcC6sFERExJ17J+5atk+vfPl5s6Up2mHzsEJLSEhISDhykAj3hISEhCMagdcAUJqJwvxbZ7uWig2/V7CiR1eFm1E5bSVSUWjbsNumMFMEiJBFdSGZQ6PzJ3URgiNHGQBk5BCzDB5cFZ2yCACPrB18ydk9wLNPcs7pNEdnO4ZGYT5LSAMQWs5n4VWU3uZpI4Z2BHpM6WBgAstMOgEAZXcOB+C3TyHnMNNNADS7lKdqss+DT7j0pJ6ySX5vEomDhLrrvJWLyk/3dBm+qMhX1wldDOR3tmEiFwL3pNcHziLMk0M0wT+agLdOEbYA0dzGK+X5INbIeFCYQ08aaJYcAAA6F8htlDiB2pqqFD0vxzZMfoLMRKRSwtGc187/UYMSypIRqf6FvoRAIjj0YQV0LkeaoHmKMKQaNAjFC8mgdiRsgaHn4t2KhXQTup23RdFNeDSMwld6IlN4ZRUBGyX3PQon+ob9QAJ1BRLUYfPWgJpYmsZPVKfojBUqA+SJdpWkk6xUQkDYPzSxdusIxPjV2sHfOGumZ0xA+p4S7oihA7ggeVYQCHOOjs9YNnyYxHjYxlDMD4CjRFo4006y/4wSZKEn2ux70VrQL/sOiPYfsXQTOl6HoRKP7434qdAnTUEG5hMKZ0/oygnePQmsGQbTEunJqpLwCatWM8DV9cuRj3oZOp/nS7bMTG1d6pXrTsDastILboetRYYSWXEgBJolSOUW4eUyFr4v2QHzx5Kj7SROJQbOj0dNyUU0nj7q4MRRNY7qGf2yQMgoOggZ1VWZAUi5UR6BQgROhxIiCisVxFwzrUtoHdrH6+mQUi+tBPF+4pK2yxu3MZcacthFizwW6UcE6m3YHtQHqimazHg7JnKGOwsCgcTwvdOOdykBCXKGZV6m0MiIWdcOgljtYguNWEtxkKFaj9/7TTaeYaZZF00QAmX8fgII8PzTZvz03j7/1Fse3HvhOT3nndItg59fHgf3Pz54yfc2aeXe+LKjezqbfasdgjnbmbd1VwuWPWmcDBwSFWI5O61n6Cy8DZFnxvO9OLxriXKMRYtXITnbAHR4BfVRunCB16ZQuN08CSjs1ccEtRgz5wYAOsiozMWhaEikg+BfkPwgzrvtgXpaAn6H4BWQADKcabDXx1OAV1TImezgw48k5qM/2O4IiOD802b+/FfMpG/rG/v2Tdv/9JVHA/gXEZbv1r7xi762ZmKSZXHeyTNecOasyOCNiCAhISEh4chGItwTEhISjhTIFMr/rslf4Sud82uGaoHWMXcXPlLyxdMimm8GmoIlXJXmfivfEEgfP+8LuY6Z41kv+CnU/tGpR9cNXn9f72Mbh3LV+tFdvV3t1XNP7prd3XzM3JaInoOSfw0BEoSjO0Qg/+nJTc86yc0kAovpYJBJrEpYSQQVDPgpvk/cEpKHMj+9BFM/YYNAyBAlEzTdPbCtIDt4BGoDZOoXAirClsr2BdwW2VUYZGLOlLLQjplsgqEUGEQTYFEtb+aMjshT3qBZxvpwSb4OU3umuYSSEluRRHx0QIiOPE3rIoWKrgCBj2oTIkPWSZiyZB9+DBQoCNfgQXI1FyiMD5n6+GQ6RBf2Mo+YctQKqKhkjwa1cEHY3iYYpAaboHg5iqlxyp2nfUl2BhCrE4EAAPEeS6gFyMO8zvRgYwwZkWxIIBeLiglDfMhYmjbF1JMvkBP8hKuXkwjEgeCufWPL1g1eccuO0fH8apX//N/N/YNTS45tP3pWy+wZzQAmfmbYTG2LMDH8na4HydgdaRcIR6KqsLVrZRkor4IIPjIR+hTJ04mXF4AnYkJirY9dafjGF6I9RVSnPwnFGYLaEuitxoB9ZjRaLUt/tNr3ekD7tdi1BmvAPMBHbCTVXTwuSNq7UJYSf5VNcFjdyhE7h5ykHsJ2LBM5qZcf6zhEAjZ3O5DO7GoAjMxDVEPIaLBasLHb8BOAKhjWJtgBDtUMme9TIlJCVsxwyr7X3F5D9jkfbxMNYnAN+hOESAz6DKw8qMPgzbrC2gcb3bFqle2efHclV3GUhfFbBy/l+qJYGljWlaNo0negUq0QkYYrwY8vYSWWiUhpIEJ8CISzqUWG3AeDmfFOPsKWa2+T/2kszDtJ3Zgm6g0SamIXTXzyBgDEGfFh7xSJofGKHNQK+2rwflD+A+aaJZbNdkvyR+YAwXlSHt/yqoU//9U+vyJncor+/uvrXvGcWc8/rXtmV9PgyNT23vG7V/Q/8PiANv8lZ/e88ZVHo74Usd79H7yMSwcA0bsMlQio/oIz3jEj9q4aXuX3gWByMoiTsMTymdppMBVpsnzhX9wiHyWLV9SyJVwKiIHl9t4SUHLyxSq9nyxxcaZDxa9pwteDdk5xyIZXDy0C+500xO8jxmLJgq/XDf29a5AAIdsMEb3iObO//4tdq7cM+wdfdsOO5RuGX37urKPntIyNZ70DEw+t2v+Lh/fqzjPHzW/7+NtO4jcX/3+psLqx/ECekJCQkHAkAeeceuGvuw5PG3zx/aeMDu8p/eoNb//sk1yZhISEhINAxIvJtEk/Jyr+a74Mv8qfplid6Av9AYE91ImezgiJUBaz+7KEoKHyWgEA+ZXBdOtDez769dX1m3neKd2fec8pQgXnSDrl2EgrbGd0/skgRK2fh6HJ57R0g05iZXrPzxDuVxgbzZuNZe/r5Gd9MpcNVKvs6Cp8DiktYOoSxT2UMsDAWsTfhGaKrmxpRkvaNAC9nKE8j5+qOqH5gEzdJBDAP5XVJQqVFqJUad1gK5bCNNLOkViSmOf/cE7kHxmDWK9UMNSWv/cUhrE6baUK0dbH0taBYvP3KFMglJZaXrD8IAhlicXo0VbAfGX+5ueq+m1REfNLepem+QYb0NbJCoPQ5GC38c+ipVlaLehU2FhTMn/pt69RZ0IE//m9DT/4xS6oi7e/ZuGbX7mwwFgFzp2fi+qBoh4KharLhuwaeNF6A/rtqgwDBdZwwRwWGyW4W6ca0YWibhAWFQB4PYLtcUaQeUPyTfIpr+qXpErhxpx9q6UZf00AkJk1E7EXV+aL1aZWYvq7FSmzS/IUlHNTo+d7blSciDVw9OYQdw0ZAoK3QeXDlOK394ZOJHcazpdkNBFlqM3LTizFbm08pP6Ohfby3mh2OCDzVKV6c45IzhdB44EjParWjGaiIVC7FwFRRpH+vKWp04oEY2QpHxqFkgwxKiv+1+SWA5l4vA5GWGIbYeAxXTQwqto3UYIMMYNvh351OxJGEnMmyuyTgsnkGh/5SBk9g9VyGXFP8Z9wLnQmrx6mu9CKDUMf/caa3v5xqIumKr75lQve/PKjKxXd+wqRd8kK45rtAmbMVs2FC1QIeg60Xiz3mlE/8urWH5pRQPQjIbe8j1J71pCSkQOKPZC1GXt77hXEDFWgLw7+d4KwZZ5qA8NggkCZGS79Yyks4zCvHKLBLCcuc5dIQRTPPQn5HXPvwMRFX1+zfMNgff0CwMvOnf1Xf7h4ZmcTWjj94d8AMPwK0c+ggISEhISnJL739feXft7aMfvdlzz2JFfm6YuU4Z6QkJBwhALjJHf7IRrWKsDPfDSpztxIAGDJa86wU35BkjlJ8pR9OqQzpQlplWMMecafcdoUEVYdNlWdViieQHIh1YpzsnVozM+B5P2BJGvyVDTHHdgJkXO8NtnT4koOI+ew6zRVp83Aj5FmCH+mlXRAmU8iB7/1b8ioC1NcAE02o5DHzHeJBhAiIjc0NeJBwqGgnuUJW01rYiZq+jYAhhxMn15u5sl2Ak+aha5Jv0J1+Sb5I0MjuWBoqXyi4iUlqb0EgSThFcCIPfBWTJfEH1nmi3zOHadsBsJHnk0AgWcLAvMEhBSpm0YAN9VnDjJZpuf0QjB/UY7MroUNC4YldZNqyaF/IugcW6Hmxd94ssLmw4pkLP0BcUnSB0LrhPYQclgXO+R+GukWLA1AKFTzSGa3fHqp3xbJn01HUidAoGrFNVWnoRsqzsn2x0JdxHS7kSizgWreRd8gkTO/gqFgEwguC2sR/HoNNS1lZpUolYOUQc3aigtCertYNT9bKo2+g1sNQ5ArW5OlLJ0+xVxH6j/V7EUawAR6oHTVJrhX5t0O78CgZyjy0hYi28/CuhCUFUAkO62TrnNhSSvN7CQGI1VDrST3UyEXTYcSAeqfYeWMnNOAEia0ntk3KjPUIAK7mnA6ripBVqzE3LcWCOGcCt9elPbyphmBOrfeIDd+Br3K+OjrFdL2Y0tjGI2GMABvPG1GYfmWeUw/hBtfBKxalK3sUV0DE5eRFZoOEiqvOc7IKwBiD6a2absdL84IAhB2OKT88y46+u6hPs2KgXVofLUZotVa1WWpPTr2/2b0RHQk+yshAgehZMBVGld8MpFs9eIJ29MWdVz+D2f98I6dt/1q75otw9ExmwBtLW7Jwvbnnz7zVc+bPWdGix0CPNvOztNZN4CqY9CBVGzLGG/olNa0vCD9/2z0iJBHDGtM/l0l+CjgjoNGL9ZHIe9hboet0MVE+P5E4hDvkJE70PTmHSnok2R9BL+V8EZwpAMUhUY7NXLfwIq3GVmVJa8cILaN4c6KjJwkKz3Y+H3H8zvB++EvI8LZM5ov/cBptz7Ud9P9fY+s3T84Ep0v0lTB445qO2dp92tfOHfJwk4MAJQMd/VgPKqYrh0LISEhISHhmY+U4X4ASBnuCQkJzwBEObMyS9bPbbaX/dVebAoAyScKdDnwvFznNYGblrRHvpT8Vp2AuaeDTo9IsxSJCAEyTVoU7sb/z0/y/aTLEHNCEVhizkyAPXmgpA8gos8AtUyJpzvQplgqg2m4W3muNiFMYf0NsrcMCNPlnyVlWskyE2AUwLSPCDROYdZvpfTCdA6lIfK9TIqVWyTgTEYlTyyxDqH0wKcIhRzXQIUp02yenxvuhISyZTtgniOUE2IfajassnjKiiEFDryEpQ5yf1CikWf4W/+yfYI/YkvW6pgLEIPajKVEHER+ii2tM6Q1qpSMrCD0x1D5iAtTmxBmKrKrYJsiQIjzmi2DaU0rTmyPHsjRAgzrAILV5ippni2Fq7lGDkYOsossPDqeWSviiWsnvRgC+a4NZNI07s6sRpY3y4h32cgbP4jJqgnJneYrRFNhgNCjxZb8LVkW7FREGza+iHquVFolx42JDUltXjWuX2pRxvOoVYTng9EcEVkVE3d61bS4NvmFaxgsE9UupATdu4SvDUuXlKEzFgsSBMhxteqfxVzFxKR6Rk6hiWpx2puMLEtcTZnew13GnMBIydTEFKftJR1LjBKhgBCdUVEEXaPYmiZcm19zLZS6Rf3aOC6KpW28gl6IxuH4pwfWmA8eCXGO0Fjp08HPa+WNpK3cjFRNlTD8ady7sdvoVzMkGKsuth3ybTdBhcLoyeOh+gcp08mf4U1DvpRrfDcEJKIMYGff6P6RqYlJaG/Bzvbq7K4mNGub5D91x+gk5zkj9WbqvLQx6hhAu4k0n/nlnL5yY6h8Eg2ppV1MFEZYeFYYzSHcDgC5FHuSsTioi0s3rhiiC8xzASDvHnW80MsIECmDUAIYtUadJe42kbikTLQaRaAs89ugkbUsfVvYMzCxb3BibIKaq9jZXp09o7m5wq+X/jiQwLejzWzH/G+xJzfqK/EVCQkJCU8FpAz3w4KU4Z6QkJBw5AI5wSg349VcMz8fIcizCR5h2sObHZt5tVyAknTGz5J0Tp7/CTtq87JIZ2qBdfOru8nPYGSH96gCTCTzvN/xTEdP9gxTfH8Lmp24JWkdESsVlMmkzEhlS2blG8I+EjI/xnzL5XH6cASQ3ZZFXF6oQRw6/cRwdpyvlSdMfIKilm51FKgjK3qIVUZmGuxFALK3htgBSiF8qKWcQup3nM+3C8yBm7rxMXF+K5itwxFAd6jXdlkbFIUDBnMQwWgqpTyO7G1GGvy7zNhFDkRgckiZ6eOsVPkPNctRWqeZdyEYY/k1YME4lTYiQtwqpxyoaa9mKDshT0EsMGTXAnOMwSRM1ZQX9O0KGc3Ce/BtljmMeD5vOqCtC1Ej7X1FPg5FVlIHyjXY0l9iaZKmqHyTSFezTzkNngNxeqFWiOktBHTMVqqWlSzT7FmQdGw2CbUNlVvopwXjBwCTTwogxwN6DVPYyJzPJzDi9I8nPR8Z0fwEPUwgHOegfYGVbhRUpF9QNp3Pfa0SyFGWEHZ151aw7jjtNBhS0Ifox5xaiXENVWFB4Co3J3biWEhUqTjPbYn/wHAUcpSDz1V2KEsfuFGBkjMCtLt15/lJFwvQxCEKrqZE76jcq7gO7/pQCDoAPRdCHLjUK/Qb9U7qjWM9Yui7cdW4V4rzRs6UBzsaazK/HYhjZw9avhmqTBI+iOMOyfvWfvQ8bhlMg6CUx7cHD4Repr3SejDbtLjbqQGY7834yA/SNGeuIttuXHwBJrIlxqynCESjp1FAVGsRiPxkJpbkQ2vAAAAVhKNntx7t9zORgVXOhmWXgwjSFeRvf29Ictem8Zb+CDqkRnUO/SLEWWVAxciwMfRikb6TFspwHCzQW3wY6cIvzsgPxLadi5L61cGr7UlHCZnvuR4ansuFhowEOT8g3Iu+1/Lpp3ZwV1US6ZIaAL+CQW27ZJ0E8tDnOXbniHjdCwWPSEhEDnHOjOY5M5rV3diUDj8I+n/CX6Jk9Q+QkJCQkHAEIxHuCQkJCUcW7FQNZIYJeTYEOE8qsMpgCEq+PF8sEIa/ZIYcrajlf4V4dZxuWSCcDGMiKWYIfD0vjQ9FFSf5OgPV+a3QcKAUiWxuA7kTQZ3wZqFdOnM1c1GdyYdT30zsQRuLAGRWdRu+DBArkgrqpYlaC6OjQL7opFgyFm2xLBBDKeah5I1+QDLxBECMuTbntAxkoRTIFFWXqa0e3oYg2ZhMgnNxqOR4SIXDMMcNDEVIx+PgRKy+XCWc/VNn7P4rjKntfAki5qhAPnSvqHQl+4TVAoBAvIPVCMQVVVpNeQajkYiWkrYLUxx3WLmAC9EojpgEgdwaxG72a2IdQBRG8p8TE13ATCuA5308u2j4xoICcjDknHoLNQknpCX3a90nwYTQDEHCwTGbMwrcx+UKpVFAz/oVaaDWPKL55Pu88SuTTkTG5LgWEEsMkYlaS53z1dYeTCXV8h3zuXY/GTA8nlGWdallslbnYK/RB3nJRORa3pzUaLRRTHuZGqpPjmqhncrYD98FEG2Vg+Y5sS5kyUFgpghyMQY1Z1M9dbPAZi5FaISJbMtED5DXu2+X461D+Bez7QZiuFMtj//SVhChbI+GEjmyxLhVX+QS7LfKUYpOo+VH4UYzELsKUhYehOWRQjR772iXztUrCAq1xUZQXqDSA1VZNm4hp2Iascuh0pH0YwsNXtT+qcEGNV1UJaOWaBhn0I5uqXY0AwGf9iGvDuocStvO++4Qeb5dHT4RU+/83uLjLj4W7SK9CvnKAyxntZN0Fv0PQvSKb/c7zIlYKAyH0bBl6xyEXOrQ7GBhu5i3scgWUYbvoC0VjB/MxbZD7zNfyy1+wDWugHRHGo0OhoshdFfnfL8jRHCuIssNpRq2Y5u8EHW/NnaiQXrT9vC5DDVqw4QcU5GkE8n357dTioZ4FlWkZVapUZD6/CAlKGCakTQhISEh4emPRLgnJCQkHOnQeQsYOsaygVFqXRlB6T/KMeeSyAmlEw0lK0KxEXXr4WkCP1vWZFg7e1RelBH2Wwew0yHlC6Q+DgIlZDlzxNypnpCn2zDKXA7ZgoYhhUCCoPK/oFwzSETB5PvbjLP85DOQDuYhBKDsokzHLe9cYJqAc+cNf+SFpzNDXw2KNyUnkWthfq6z93LaF/0G/Eb7SqfmDMITFsyI5Ob8INyfyK2UlMS8ypR3wrwx2+cqtY0xg+CFY3KH4+qGyTyVTZkxKIs1GPFblgEp3mxXisR3RTxF6Bf5QlBS5n1xAACyLW5ECdnWCROEEtvgvGbPKxAXxDqPU/nBJBUaAeYoO2kBZ1yavkxEPuAVsV5SiE87dCjsB1MaiKE7234tvVUZflNzY6LhQSQXSzYlS0kvtiyzSsxcbJ2APqjAaAt9BtwCS2qDPkVCfVENcxaindTKKufA9QL93VoUUWROpgTIeR7TUq1ero8AGCOM2yUBleASQyX9rvymDk6fbij4AGcEaNYJBVfDVGAkwMD5GnWIc5AblR9UssxSwMWaSB+JdKGnocaRubzWip9YNYkWnHVZ8b3TD8S5SKF0EBsSCEyz/BrccuwlMBaUDXWAZTnBcr6G2LVWF78YRE0z4lKOOHrxyK3+AWZ+c/L0FeWPtYe6sHxBLNlbrfMHotraqka0RsFIic9b5U/8awL46D9HZ1S2AAhODibRLozIx3qLB/OF5Dh3iU9Lw9nCvZPxtxl9RZoPhp2XgFyAcRfLCdBfrx7VtzoEKbX5pbZtHUjRFUDkQ6x71Ec57Wjawe25K+YRYUwHUZW1E9MxeO99fgux6yYISdL8fZkEhBiiKd70OdNDcirsIdsuBAUxDEoyThkngLaRcZMTEhISEo4IJMI9ISEh4YhDjr+DGpRNzNcoWQOBfcsXazeWAYj4mga5ZuVGw66ehqXzNVR6hOwEVG/nKa/kl8ksKJAkEX8dODsoUrLmGjDz1RJOyn8MYQaYFy/GoQIheiy5H016rTSMGD3hEvLPzTNynxQVpHO/aLqrU2WZweapDBVaWYuCWHKzSrNXj/AjhqXSppmK2Rm1fVA0P7cZwaENNehUKbzEqiEYdpBMaaconR4rTVCLuVDEFfNV9U+PtAwF9q2MtM0RDSX8iOgUjbUA+IN/a7cupg6V13PcWSBYk1hZJOqieKJ8SvMvkxqAxBsvcJaoMOQFI8YQQgtsBoLZPcYVu7MyHcJVlZIcrAvr97QLUNjOI9wqTpJhnYC3QbkmsiWUzEercXuvdsNSJqvGn8EGbN2sF4UaFlXDnuvV0HiGXOBH/RUUyXrT0/MCVKszVg1Ga1B8UG6Est6DOA/YMtEERnM5HwJB7yAUZ+QcVBdFZy41geK9Ro9e2iVCzn1S6hyK6xWkwJKBuH6kUIsVgSsjaURtHlK/PjYGbEhwLl/I9yDzqFJ5c81f5sfSQrAh91Jh25732HYsA2MkZmAtd2uRD5W26LIAf6MhZ8U/cGvJbzYU1YQPTEdEtLS78MKgLydmoxltIAJYP8wfEu/Kkl8OmCOvS40zVkQw4FjOqseSfpHzUerirMOx90LexWl3xPi5oXre18aDNZRl3KM4edDy42HLiitufGyTcjEBSCYHR4L9ehD/9mkOtJeuIocx6Hih41L4Tz7P1yEhISEh4UhDItwTEhISjkRgDXoxR/VCzNfYeW+dYnPTPM0y0xQ2LVAfjREf7b/lSkGgV0hmZSBzXq05P91PZUn4O2WKEJGnx4DORfWULEhOVfPzqGIrfFOkFb5dzjQk4hQMW2enx2DTriFPOWF8GRSYYog5KQqzX76swPFEqKk1q6DcpFSVLjqKOGKhF12sONVyxA3pBNUIpITMghBaCJ/nxGt0V8o+5C5GqE0j1ocxrfw3udiSFUuNikUPzJGPektOwvUR9yyQJQ6WpAj1qdHl9foc7YiiXDABtob4A5S0WyVliMj3LxOhIc5fV7KdO3VUPV8TF9KKpZqo5HzwJyIx7SPaK4MQchKAGsavEsj1KeWM4mBJ7hN7Pcb3uvr3Fm8sM4OSiklDoFB+uUWViqKshhpFqFPDvBNQRTgHWZbb7hnED+QvznWoUsdoM2ENK8fFmiDTNK4GQjAYc/YPwWXVrImIGusIKtevS0VnCg+uAOPQglTpICKFpaO5F5Q1ocjSSgVVSqSavuBvp1xRRcQEa37pj1QmGvVyQgAoV820tZUbdVFb3HajSr2ASLLxKZiZqCYMSURWDDqKsYNCCQ0Cv3g4c7n1TujDJ6KgEG+QYsH44SCxGhLQAiNFmFhFJEB7Wa5fQG3bLg3iimSmd3GFhtjRAYEj09w6+2jbuthOwOg3vJX5h6OLxCX69SsavRAIwfHpqUG/VNSvrbP5W/4LH2Pueiv5hISEhIQjBIlwT0hISEhgYBnVCwdCUEIZPQHl8/yapJIhKDmTTP70syybPCiZambvBZntUDTZYULIoZku2mfZjHsom0waRJwUAMg8OS+HMtnkhVx6pf+gOOmNZ605vilUfjqUXIYh5qFP8ZPeEtUUNGurGpirmB+J5sZgLq3Bgepfeaoa6hE6+TUWYKy6lALL1aeYVy5tCZWB2N6mrZWabuFT/0QtuaSQYkJxsRAAINJTHMHqt37P9a3LKV0+LGHt7a2lBcYX2Ed70RIg6pnDnoU3dARRXNOQR5jr0fJD/UmhlKiSVq21ZFg0fi2kVAU21V0ENU1PUdh7SyVcx5DsLaWMeY4IzpVWau3Fx1F00kBUSGm7jBMA20egnJXD4sVQcDXFypu6hRtlvUiJq7Htretqik5v+mqYJqPpeiVjWbFRhbLzzgHLGHOo3Z3LHBdXL1cxf1VusMvhQIjU/HhUWr1ibeM6R8659kKQWp23vO2F2EwuolNqV3bXEX+NYd2lYgQc1rfp+FG/CFvaiXNBkI1hMBcf1PEy7nTew01TZ729KIEao3mxgPJXHRkXatp2fS0fnIur9ZaYGyfK3o58VaFUXCQLFMxIYcYgRF1oRWT3I9TelgsDh1ivDkb8cfg7MmnbxGmFkJCQkJDwDEMi3BMSEhKOUJQSEAXqhK/0v9TmoMFeWaBWdeJpC4dcBhZibhKlkyIA5C2+kXPN7Nw2YmQxPE4v0lwznhMJsWdnccqrBkajDk8ns/FIaKWisPlRZuIaycFXpjSH1OTemvaBrerBT9tqE2e6N06JumvMz1FI7VJ2Mpc7XLy3vCZm+s0lFQvPKaKWVWOgtmuVEyoDBSgBUUssZVrI6T3XKYr0QUnJNRjbPM+FZdw9GDanTutipZd3+UOhBjQZlhkOAAwWgRBOWo4IPKm3isjfrr8DhCCZPWMzv4DGeiRbpeKHBeMHJb8K16u7iK7MoUbQroRDrv910YHolUUHVfSxdQovOOrwMWLNQmoFI5U3zMmkRj1R63mgrsY8pR4VW/y8jqup7/TqCMr/Ip9Mq8rwpX06FMInJtEYSptZDGOUGkMuUhgf0lsn4lseLioQqcXxqCFFyIeHFB/N1bb4lFxtS8up1XZve0rL+jGa20s+bV1K4gFczFX3cbe0LCA4edWoIRbvqr0daqzrgOp80IZdGBd0TAGA8mHF/lK7X4S6lz639kPzb4mlrbMhCojFReHdsVbSgH8iv2YCUY2XlKBfHZFK9Zv7Wfw0ISEhIeHIRCLcExISEo5c1KEXoYwEPKCZg24vW5xRC3In2umzUCdFfroTJkVRDYREEKoxnr0G3ig38ZEJmM5sQ6G5CVJt+fDksFYAwpaAZRsyaG0Nf1SapwZQgz4rzuUaDIfYP4szXjCkTCGNF4UIKEmBrFNVV5pZ10BNtNhcfWKeoqQ0qE1t16pkjcqU1CQnFigItlbFbOGl5IhhN2pWD2L522IKKphWOKYrhp3lo0fnKHuobWa2aRgHz8yN/hvHW0URSZOVzNKH5qqMgODCLjfCfgTCCCBi7EtqXkMIYEURm6o6llJl1TSJ+j0lh1hfjRpSnetrV6yO4kruLRZSn2gTjZQ8ukiZ1bk4vqBcgLW8zbQjVJlLR4j0nuuDNYeDxlSZ72i17q3FmEMNf1WLdS1+CGVREP2qTh+pHYnRTxrqbqXFAzvV8mUHADWf0nBtixfXq22Zywpmq6tv5DnhBE1/D+9Ywk6MtIHWfaH0taJ3U5kU/HC+OQ1LoNHRXKoaenSNF7aiM1RzdY33C1uCPrSsO0T31krDxxpxwSJ3XtRvSN3QISlIUcYjsXc0rL2oPXqFs//UYNsT8Z6QkJBwJCIR7gkJCQlHNEqpE/kKoDHKxt5k761FWEONyQcWdnKXEoRpIwI5LDVXTm76LHNfQF4kHk3AzNNzXHAxkSo3+S+hOBtrV03iHqYTVy36rLSqBwTZv75kxgv5lrI49c8Gq2om9g3VBMqkagtvsJm1qO24/Dy5ZuoMtQnK4pUHAM/11O4X4fdS2gWEqIK63RaE3KlVhxrBhujRpZcdaJNDFwbk/bUlfgZ24+dQgbxd21xC2zr7i+lB07TRPKs8bhFfEz2rEa0Ve0qdGwFKWtQ4Dqhidc1p+kIaZHhLH42IUFjhUevi3LMaMXVjrjCtt5nW1dTRSH1tlt14ADqdNnxS8FclfbMQLYhKqD+CFEorF1RpfabrblahxTqXUqXlda5d2/x+27kHFdteN3YofgopyJWIolKFWM89NOyJBzn3BbIER99DNPaZk3DxxeOg9VWURs5HxQ2v16PjCkSd9KBdXP17NT/9QN+OoO5aHEmB518dSkpHwWpADhHJPc5IMfq3Rlwk/0Fi3xMSEhKOECTCPSEhISGh3pwnR37VpvBqlgxl6cbTPtoSpjI7AvRpSH7hNrooDxnN79FzsLimuEZdQHdYzc2vsEaWemlj63xVZ1V46WWFb+1lNXUBALUyK2uXVi9z+eCqmmOdGrGcg6tJLeS2AJ726cUv65IIBzNhLib3HWzduJBGAjm17q5TAaO++mYGJhkwX4IGz/wmyOYTw7YTn8KgBJUtrwa7HjmHXKONVdervCWRG9fyQdvn4TXs0oo1sMBl+jLrm1Otr6Yz44bY8/rPqn9j7OHrWWyDTq9OTerfeyg82rThEygMx1A2VNUpofERxF7ZMAlbK35Z8ymmMoUFbOW316uzpMY32vYC188OCjl1Orgs/6sUobRsTW3zI2S/rBw1m2NmiyxvnTrXwiGO5rkLGlgu0OiNjZTQ4EMbfDsCeZErBp+MfsOQxGHfoAbi8SgeSQtqQhNpiWj2/HB1IFG3hISEhIRnGBLhnpCQkJAA0Bh1Ag1MnmsV3nj5ytPFnDvIvIiX9zJTBwCgv2FcQ8zNQguVqvl38fL6bEiDPEuDcmiQ0JmWTj0gTBsaafCuWjc2bjkHV5NaFzdCY01b1EFXpv5dDXaKRoqtlc7fyO31Wzct02LvLSWw9CshwSV+Fjgsfcg0fVmrZ6IpuSujyxqRx4Fq+aDt8xANu/4th25LcLDm1LgTOLjr7TVPtKtpsCbFew8L1V6nVrXvnb5utZ7VYJUbJ2EPWgYH9IYwbVF1yqnvGUpdlnKy1mUZh1UoJPzikEP1+VcRG6VQfr9YycLv9RpebOahj6G1oiBPxHPrx13qPKL4rfze+JAklDrwi6YDMJuc8b38S8nTSl416yjuUHxFQkJCQsLTC4lwT0hISEgIOBR2sn6BdcqfdlIEPHcKZ6xJtlExjzvPvpXNf/wvB0Oy5JpwQNRMrU/qTx0PdMZ7iFDio07FSu+CMjrscNVk2so0HhuYtqhS6Db0B3rvE10xLeEQ4wqHV3em5HrxszgP8WD6si+hDl11gLUNXNi00rAnExyQ6BrnFot1O6DLDk6hOULwIJxAg3c9pVwNHEjNLQ7aDGA6nR4Wt6C3H/og8kQMQ7VGxkNXboPhkLIQTh1OlhCdRPrlrkJNc688xU1Rcq8i/q9aJPuh4FAM+6D9ABxy19ZPGsmXP/CQQPnrpQ+rmCGppn4hUvE0VHti1xMSEhKOcCTCPSEhISGhBIdC3BwQyVjj22hSBDFroLQ71M7jrj191SludEHD6YRP1Ky4wW+fCFa0Vh0OooGHi+87LJU50Ec80fceROEHvXvJIT79UDi+OgSWpqVrBzzEvlxKdhwWf3WAJM7ByPyJZmIaMadp6/DkNO0QXQ0c2vqVQ6zJYbm38WIPhcE8oNtrVSCHp2bcCAoh21pFTeuylJMFwJy/MtuMhExoubikOXGVSq6Ew9H2w27Yh3L7E92hphXXtDGVOKwSdA219Qux4mqMUNPrNyEhISHhGY9EuCckJCQkTIMnYYZQf1KkdTjQZL3ClSW3lrIST1lMW8+D2x7hicDTRaRPZfy6ZNjIcxtPKi/25YPYiKNG2KzkmmR4tfAMlswzuGk5/LqY0yetwCeu/APxNvVC/ubPcMe0j2sk8bnuLQnToE60vsHXy8OoX6g9QiUkJCQkHDlIhHtCQkJCwlMUMimC3LwIDmaDkSNl/vPMa1HCUxONsxtQ6MsNduQaT2mIq0pISEhoBAfhsg4l6g9lryIHVGbCoaPW6+Uh67fm3Um/CQkJCUcgEuGekJCQkPCUQK1JL0B+XgQHNnVJ89uEhCcVtQksACgPoTVYMKS+nJCQcLjR+OtHI1u+1HBHNd1X7VsSDg+eFP1CGqESEhISEnJIhHtCQkJCwlMFtfZfjudFUH6OVeEme2/psw64fgkJCY2hLsEBUHZwcZ3CoHZHhtSXExISDhmNvX4cxI5t07yKNFxOwiHBJrDHnwPUeL1sWC9phEpISEhIKEci3BMSEhISnkKoNSkCM58xU6M65Uz/lISEhCcO9Qks/+u0hwJO21NTX05ISDgsaOD1I+eyavkv4+PSq8hTCdOOSvHrZdJvQkJCQsIhIRHuCQkJCQlPOdSaFMm3h1Tywd+ckJBwIKhDYMkFh1p4QkJCwmHEgbx+lIQMG3RLyX39uvDk6BeSihMSEhISEuGekJCQkPDUxLRU3cEVmJCQ8CQj9eWEhISnERp3WQfhipL7+rXjCdUvJBUnJCQkJAgS4Z6QkJCQ8NTFYaHq0uQnIeHXjtSXExISnkZIkcJnNlQdh0vFSb8JCQkJCTkkwj0hISEh4amOg5sXpclPQsJTDQfRl1NHTkhI+HXB+p+DYGaT+3rq4xCZ96TihISEhIRaSIR7QkJCQsLTBmlik5DwzEDqywkJCU8vJK/1zEbSb0JCQkLC4YX7dVcgISEhISEhISEhISEhISEhISEhISEh4ZmARLgnJCQkJCQkJCQkJCQkJCQkJCQkJCQkHAYkwj0hISEhISEhISEhISEhISEhISEhISHhMCAR7gkJCQkJCQkJCQkJCQkJCQkJCQkJCQmHAf8fAAD//+zdZ1gTWdsH8JsSZVcEBQWxgCIgImJdde1dd13rujbsfW3Yxd7FArrvWrBBqCKIith2bVgQ+1qA0IWA0iSUABJMCO+H0WyekIwQo3i5/9+nYebMOWfmnLkuvefkHgTcAQAAAAAAAAAAAAA0AAF3AAAAAAAAAAAAAAANQMAdAAAAAAAAAAAAAEADEHAHAAAAAAAAAAAAANAABNwBAAAAAAAAAAAAADQAAXcAAAAAAAAAAAAAAA1AwB0AAAAAAAAAAAAAQAMQcAcAAAAAAAAAAAAA0AAE3AEAAAAAAAAAAAAANAABdwAAAAAAAAAAAAAADUDAHQAAAAAAAAAAAABAAxBwBwAAAAAAAAAAAADQAATcAQAAAAAAAAAAAAA0AAF3AAAAAAAAAAAAAAANQMAdAAAAAAAAAAAAAEADEHAHAAAAAAAAAAAAANAABNwBAAAAAAAAAAAAADQAAXcAAAAAAAAAAAAAAA1AwB0AAAAAAAAAAAAAQAMQcAcAAAAAAAAAAAAA0ADd6u4AAAAAAMAX5eN3sqBAaFK/3tgxoxQO5eXl+50IIqJOP7Tv3KljdfQOvn3Xb9zixcQR0dw50zm6+B8ZAAAAwDcF/7wDAAAAgP8WT65ffEJixw7tKgbcc3PzXHbtJaKVy50QcIfP5Oq1MB+/k0Q0Y9okBNwBAAAAvjFIKQMAAAAAAAAAAAAAoAEIuAMAAAAAAAAAAAAAaAAC7gAAAAAAAAAAAAAAGoCMgQAAAAAA8I1LT8/IEeQSkV1LW11dnerujgYIhcIUfhoRWZg3MTQ0qO7uAAAAAMB7WOEOAAAA8OV4cH279Rq0Zduu6u4IwH/LcU+fwUN+HTzk17z8/Orui2bcf/CYuaJbd+5Wd18AAAAA4F8IuAMAAAB8ISUloo2bXZKT+YePcuPiE6u7OwAAAAAAAKBhCLgDAAAAfCF6ejVtbW2IqH49YwvzxtXdHQAAAAAAANAw5HAHAAAA+EK0tLROBXjdvBXeoUNbPT296u4OAAAAAAAAaBgC7gAAAABfTt26dUaO+KW6ewEAAAAAAACfBVLKAAAAAHyNioqKy8rKPl/9IpGouPit2qdLpVKpVPrRYoVFRSkpqW9yBJ/1WlgUFRWLxeJqafrTSSRlQqFQ7dMrOUYikSjt1ev09Aw1bpRIJCotLa3qWeXl5bm5ecnJ/IIC9a+OiMRicWUu8FPIJrDaDZWWln7Kg6ZxnzLcAAAAAFAZWOEOAAAA8OW47t0fGcXTq1nziPsfSguE3bxz3NOHFxOXlZXN0dVt1Khhnz49JjmOs21hrV6LixavKhAKbVtYr161lIiev4jy9Q+8EXY7MzOLiOoZG/fq1W382NFdf+xUyUpeREbv3L3vwcPHHE6NyRPHrXFeWrF8Vlb20eNeV66FJSUlM3sMatfu3bvHRMcx3bt2YWnokPvxB4+eEJG3p7vSArm5eUuWryGigf37OE4Yo6qey39dDT4TejfigVAo1NbWbtK4Uf9+vadPndismQVL66qUlZU5LXUuLCzS0tL6w82lTh1DpcUKCoROS53Ly8tNTerv3rml8vUrXHVWVrYH1+/K1Rsvk5MlkrJatb7/oWP7EcN/GT1qmLa2yuUyVR0jkUjk7Rtw8dKVf54+Z6LJHA6nS+cfRg4f8tvoETo6Oiwdjo1LcD/s8fifp3x+GhGZmNTv0L7NJMdxPXt0Zb/S5y+iPLl+YTfv5AgEzJ4mjRv169tr1owpLEOTkZHpvHYzEY0YNmTkiF/y8vKPe/qEXrjM56dqkZaFhfmggf0WL/q9Vq3vFU7ctecPXkwcs52Y9PLDjVpZo0YNZnuN87IWNlYVW1QygQ0MevfsNnHiWPYJLPMiMtrXP/D6jVvMg2ZsbNSzR9fx40ZX8nRVzoVePBNygdkWCHKZjcNHPE+fCWW2R434ZfiwIRVPVDLcurpdunSqzHADAAAAQJUg4A4AAADw5URG8a5eCzMwMKh4SCqVzp235MKlv2V7xBJJCj+V6+Xv5x90aL/bkJ8HqtFixP2H6ekZpaWlZWVl23a4enB9JJJ/F5vnCASnz4SePhM6dsyoXTs2yQKRqip59jxynOMMZtl1SYmIz0+tWNjbN2C7i2tRUbH8TmFhYej5S6HnLw0b+rPrrq36+rWUNhQTF3/1WhjL5bx7944p0NyyqdIC+fkFC5xW3Ai7LdsjlUr5qWkeXF//gFMrli36fc50lvqV0tHRadbUwm3fASLievsvcZqntFhA4OkrV28Q0drVy6pUv/xVnzodsmHTDvml38XFb2/eCr95K9zPP9D9wN5GjcyUVlKlMXrw8LHTEufUtFfyO8Vi8Z3wiDvhER5efof2u1pbNVfa0OGj3G079siv+M7MzLp46crFS1fmzJq2cf0qpWe9e/duw6YdfieCFJaKp7167eVzwj/glNPCuYsX/a70jcLbtyXM/WnX1iEqmjdz9iL5nicmvUx0f3kj7NbB/W4K76Uio3jyM4Fx6/Zd2faCebMqNqd8AguFoRcuh164PHTI4D27txrUrq30MolIKpVud3E95uEt/6AJBLlnQy6cDbkwetTw3Ts3qzr3o1LTXld8QJ49j5Rtd+zQruJZyodbImGGm+vtf2i/W/PmzdTuFQAAAADIQ8AdAAAA4Kuwx+1PJtret0/PGdMmWZg3SUhMunf/EdfLTywWz1u47Kr1WRtrJatxK0MqLV/gtPJc6EUi+u47PftWdi1srF6nZ0RG8pi1xoFBZzIzs3y4hzkcjqpKystp3YZtTCTXoHZtYWFhxTLbXFwPuR9ntk1N6js42Lewsc7Ozo7ixfJ4sUQUev5SSgo/8ATX0FDJW4dPlJeXP2bCtOjoGOZPM7MGre3tjI2NYmLionmxIpFo6/bdOTk55eXlVa15xrRJnl5+eXn5XC//2TOnVlxMLZVK/U4EEpG+fq0J435Tr/+eXL91G7cRka6ujo2Ntb2dbUmJKDKKl8JPJaLHT56OHjs5MIBr3qSxqhoqM0aX/7o6f9EKkUjE9LZv757m5k1EIlFcfOL9+w/FEkl0dMywkeP9vI91aN9G4dywm3d27HSVSqUtbKzmz5vVxsE+Ozvn8ZOnXj4nsrKyjxzj2lg3Hz9utMJZpaWlk6bODb97j/nTvpVdxw5t69QxTOGnPnsWmcJPFYvFrnv3v0xO+XPfLpZV/G/e5EyZPi8jI5OIbFtYW1s119LWfvbsRWraq5jY+N/nL7nyVwhH99//4Nja2kgkEmabz0/jp6YRUdcfO+l+KFO7QtxcfgKbmTXo1bObWQPTzKxsHi/2+YsoIjp/8a/El8mnAryMjOoqu//lTkudZevNDQwMHOztmjWzSE7mv4iMFhYWBp85l5GZadaggaprZNeooZnsZwR5efmRUTwiatWqpfGHzjRqqPg+Rn64a+vrOzi0amXXUiwRR0XFREbxRCJRZBRvxGhHP++jbRzs1esVAAAAAMhDwB0AAADgq3Ai4BQRtWvr4O3pzmR4sLRsOmhgPwuLJmvXbxWLxaeCz1V16bTM/QcPmfW2jhPGbFrvLIsXl5eXc738t+90LSkR3bp912XX3g3rlK9QJqIXkVEFBUJrq+b73Ha0b9cmKys7/O59+QIBJ4OZYKWurs68uTOXLVkgH76/fSdi1eqN/NS0F5HR8xYu8/U6whJaVc8K5/VMtN3IqO6ObRuG/fKT7FCOQLB85forV2+4H/GUj8lWUp06htOnTnTbdyBHIPA7EThn1jSFAteu33z5MoWIfvt1RN26ddTr/6atLkTUpfMP+9x2WJg3ke0Pj7i/bPnatFev+alpC51WBgf5qLqEj44Rjxe7eOlqJvw6ftzoDWtXyr/5iImN37x15+07EQUFwplzFl48F9jwfwO4gUFnJJIyDocTdNK7fj1jIrK2at6ta+cB/XoP/HmUVCoNCDxdMeC+0nkjE21v0MB0757tvXt1lx0SSyRcL7+9fxwSCoVnzp5v0rjRqhWLVd0fX/+TEkmZoaGB+4G9skrEYrHTUueQcxfj4hP9TwRNnTxBVn7d6uWy7S3bdh0+yiUi94P7mJ5XJJvANWvWXOO8dOoUR/n7fPVa2Jbtu5OSkmNi4ubMW3zS37NiJpZjHt5MtF1XV2fh/DlLnObr6urIrtTV7c+D7sfvRjxQYwYyRo0cOmrkUGb7ytUbU2fMI6KF82fLT3V58sP90+ABLts3mtSvJzuanMxf4bw+4t5DgSB39lyn0JCTpib11esYAAAAAMjgo6kAAAAA1Y+fmvYmR0BENjZWClE8x/G/uWzf6LJ9Y+vWdmrXz0Tbd+/csmfnFvnV2VpaWtOnTQw5fYLJ8XLc0yc+IVFVJQUFQmNjI89jB9q3a0NEpqYmv44aJjual5e/facbEWlra3t5uDuvXKKwWL5nj65/XzrdqlVLIgq7eSf4wypgTbl+49aly1eJyMysweULwQohyHrGxtzjB+f/PouIxB9WPVfJzOmTmUj6MQ+fil8K9fYNICJtbe2pUyYoOblyJJKyMaNHBAV4yUfbiah71y6XLwTbt7IjokeP/wkKOqOqBvYxIqKNW1wKi4qIaO7saW67tyn8zqClrY2f97H+fXsTUVZW9jYXV4X6X0RGE1GjhmYKMWs7O9tD+11dtm/8ddQwha9xht+9d+p0CBHVr2ccctpfPtpORBxd3dkzpx4/+mfNmjWJ6JD7ceaXEKruj5FRXX+fY/KVcDicbZvXMbP6r7+vqTr3o+Qn8OGDe2fNmKIQFh/Qv0/wSW9maO5GPPA7EaRQg0CQ67b3AH14BFYsWySLtjNXunrVUu7xg9ra2urNQDXIhnvRgjkeR/fLR9uJqFkzi6AAr7G/jSSitFevd7v+35fpFQAAAMC3DQF3AAAAgOr37t07ZuPBg8f5+QXyh2rUqDFl0vgpk8arWsRaSQP695mo4iujre3tli5eQEQSSZmHpy9LJXNnT1OV69nvRFBubh4RzZw+uW+fnkrLGBgYuO7aygTiZYk7NMWD+77nmzY4N2ncqGIBLS2tlSucWtur+d7C0NBg+tSJRJSenhEUHCJ/KD4hMezmHSLq36+3qtTnldGwodmWTWvko7QyRkZ1XbZvZA4dPe7NUgnLGD189ORuxAMiatum9Rrn5UrL6OrqHDzgyoSVQ85dZJbty4hKS4koNe3V02cvFE4cNvRnZqIqvGhxP+LJbOzYtlFVMpzuXbswX3YVSyRHjnmxXN3832cx7xLkGRnV7dC+LREp9LZKZBN4+tSJgwb2U1rG1NTk6OH3UWn3wx4KuYn8A04x0e2pUyaoegQG9O8zeeI4tTtZJbLh7tCh7fKli5SW0dbW3rJ5bdOm5kR0KvhsenrGl+kbAAAAwDcMAXcAAACA6mfZrCkTJE3hp/YbNPzQYY+8vHzNNrHGmS0dzawZk5kY6/Ww26pSnOvq6oz5bZSqGq7fuEVEHA5n5XInlobaONiPGDaEiOITEllW01dVcfHbe/cfEdEPHdsPHTJYVTGOri5799jJFrkfOcaV/ySmj99JZoOJyKtt4fzZSj+oy+jQvs3wYUOIKCExKTHppdIylRkjIpoyeYLSsD6jtr6+LC3Mlf/9RGevnt2ISCqVjhk/dd3GbcnJfJUXQ0REhUVFTE4bS8umPw3uz1LScfwY5t5euXajrKxMaRk9Pb0xo0coPcSkvnn1Or2kRMTeJVWYm6OtrT19Gtsgtra3Y9bXp6a9YrK6y9y8FU6VeAScVyn++OMzkQ33iqWL2Id74bzZRCSRlF37cAoAAAAAqA053AEAAACqn46Ozq4dm6dMn1tc/DYjI3Pbjj07d+9t365tj+4//jSov52d7SfWb2BgYGPNtvJaR0enjYM9PzUtPT0jNzfP2NioYpnGjRqpSn5NRLFxCURk17LF999/x94ZB4dWTI6R+ISkqn4GVlQhlwsj6WUyk+albZvW7DVUXB9decwid7d9B16+TDkXepHJ1iIsLAwOPkdE9q3sZB+0VM/HO9+2DZMiPDYuwaq5ZcUC7GOUmJTMbEREPHj69DlLQ8xabyLi81Pl9zuvWPzkybPEpJfFxW89uX6eXL8WNlbdu/04aGDfLp07VYzqJifzmQwzNWvWXLNuC/vVGRoY5OXlFxQIc3IEpqYmFQt0bN9W6cwkohofQthiifg70mNvSClmAtepY3j4w5J8Vd6+LWE2UlJS5YeMFxNHRLYtrA0qfItVnkHt2i1tbZjkPJ+VbLgdWrdiLykrkJCQ9Hn7BAAAAPAfgIA7AAAAwFeh64+dLl8Idtt38O8r10UikURS9vDRk4ePnrjtO9DCxmrRgrkjR/yiduXW1pZaWlrsZWR5SHLzlAfczcxMVZ0rFouFQiERNWtm8dHONLd835Aaq/izsrKV7pfl4floB+rWrdOggWlmZlZVm2bMnD7Z08svLy/f/ajnqJFDtbS0gk6dFRYWEtH0qY7q1SmjNIb+PwWsPnLrWMaIiPLz35/FvPCoDIWGTE1Nzoec/L/97sGnQ3MEAiKKi0+Mi0/04PqamtSf6Dh2wbxZTDb2Dy2+H5eYmLiYmLhKNpqbm6c04G7aQMlOjZBN4NzcPNnvFT5K/ubIarC0VJ7PR56VleUXCLgzw21qUr9OHUP2krJnPy9fwz+sAQAAAPgPQsAdAAAA4Gth1dzS/YBbQYHw0uUrN2+F3733gFloHBefOH/R8viExFUrFqtXc1am8ji1vIwPMeja+vpKC7DkweBwOPr6tYqKil+9Sv9oQ6lpr5gNQwO2hcBKqQqUy5bVZ2e/Ya+htLRUkCOoarsyskXuPF7sX39fGzyov69fIBGZmtQfMXyI2tUysrKyLS2bshRIz3h/+fq1aiktwJ6rRP/DyA4dMlhHdY4Rea3tFRdHGxoabFi3avWqpWE371y9fvPu3fsp/FQiysp+47bvwMNH//h6Ha5Ro8aHFt/307aFta2tTWVaJCL92spnoNIovEbIJnA9Y+Pu3btU8ixz839T0nM4HD09PZFIlJ398WdN7fc9VcIM95scQVFRsWwglJJ7JFVmNAIAAACASkLAHQAAAODrYmhoMH7c6PHjRpeVlYXfvb//4JGIew+JaP/Bo6NGDlXvm5yvXqcLBLmq0nEwYmPjiUhfv5ax6pwkLJo1tYiM4kXzYsQSCUeX7R+Z0dExzIa5eROFQ1r0kWX4siwZCmRfSWUSg7CIjUsQSyTsZdjJFrkfOuJRo0aNhMQkIproOFZPT51MJvJ4sXHsAXdmjIioceOGatTf1MKc2XCcMOYTs99wOJyBA/oOHNCXiHi82ONc35OBp4noTnhEUHCI7PO8FuZNtLW1pVJp3bp1Du13+5QWSfVrBo1gJnCJqGTnjk3sOWFUsTBvHBefyIuJKy8vZ/lBSXl5eTQv9hN6WlnMcEul0mheTOdOHVlKRkW9fySbqPiqLQAAAABUHj6aCgAAAPCV0tHR6dWzW1CA10+DBxCRVCoND7+vdm2eXn4sR8Mj7j97HklEP3bpxB4uV6VXz+5EVFIiYk+BnZzMDzl3kYjMzBq0cbBXOGpiWp/ZYNKVKJBIyk4FK8+FYmpq0rJlCyK6eSuc/VusHp6+LEcrg1nkTkRPnjxbv3E7Eenp6U10HPuJ1RKRj0+Aqi/WElGOQHA25DzTgbZtHdSon/nkKRGdDDqtXg+VsrOz3btn+/q1K5k/w8PvyQ4ZGxt1aN+WiO7df/TRdyHVi5nAxcVvz4ZcUK+Grl07E1FBgTAw6AxLsYCTwQUFQvWaqBLZcO8/eJRlXr179+7IMS6z3bdPjy/QMQAAAIBv2/8DAAD//+zdZ1RU197H8c0AFxSV3qRIUSMIGBsqtmAkFmIvoHIVjRdbjJoYe02C8bGgUYKSqOhV0DwaBZWghkiCihi9WTdKUa8FQQYLJesJwiAwPC+OD2vugIjDID7e7+fVrHPO3mcf57gW67f3/DeBOwAAQNPbH/3d7LmfzJ77yZ07WWqnZDJZda2SUoVC41uER3yblp5R66knT0qWLl8rfZ40YZxm/QdNGi8t8Q7b+rWU3ddUXl6+cPGKP4uLhRAfTP1rzVXAzv+3BPvq1VoqXJ84mVBd+6KmwPGjhRAKhWLJsrWVlZW1XnPmx7NHjsa9+GFeZPq0yaamJkIIqZrKyBH+1laWDe/2fErqvv0Hn3d21Zp1jx7nCyEmBIzRdFKktzQtERsX/+3ufc+7bFt4ZLeevt16+q5as071eOqly9Jbeup0Ys1W48aOkD6ovaVTpzwrbT9j1vxa51GEEHJ53qCho7v19O3Vxy8rK7vWaxpb9Qv8xbqNl6/8Vus15eXlITPnSf840ryRqsDxY6QPX3y56XlFY+TyvND1DV3pX0/VX/fZpOQ65ts2bPrqWlqGEMJvoO/LbmIMAACAmgjcAQAAmp6xcavYuPjYuPha89ac7Gcps5enu8a3KC8vnxA0/eQPp9WOZ2beGDl20u3bd4UQfXx6+g301ax/Rwf7D2f/TQhRVlYWMGHqvv3qi7UzMq4PHzXhYuplIYSnh/sHU4NqdtL5bS+ZTCaE2PlN1NOnT1VPHYs9uXDxijoGEDQxQNp0NPXS5cBJ03Jz81TPVlVVRe2NnvXhx5o9nZrqRe6Shm+XWm3VmtDNW8IrKv5twqCo6I+QmfOkhNfK0mLmjA8061xXV3ftqiVSWL/28//64stN0uRHtZKS0pWrQ9dv2CKX55WWls6ZNV31rLOz0/ETCbFx8dvCI2tOady79+wt9fT4t7d0xPChUvmaf926HTBx2oWUS2oNUy7+Om5C8LW0DLk8733/wU5Ojpo9XQNVv8BPnpRMnT4n5uBhpVKpekHO/dygKTNO/nBaLs+zt2s9fNgQtR48PdzHjB4uhCgsLBo1Nkh61VWdT0kdNTZIg72CNaP6da9cHbp81eclJaWqFxQWFs368JOInbuFEMbGrVYu//TVDAwAAODNRg13AACApjfgnX6WFuaP8wt2R+13cnIMmhRQvYT5YurliMjdQggzM1MvT/UdLOvJ08O9pLT09u27ITPnDfDt16Vzp/bt28rledfSMn5IOFNaqhBC2NhYbw37so7a0y+0YN7s23fuHos9+Wdx8dLla6NjDnd+27NdO9dHj/Izr984fyG1rKxMCOHoYL/723ADA4OaPbi7dxg18v3vjx4/f+HiuMDg9/0HmZgY37h5Kz0985fkC0KIdwf0/+nsL7XevVkzw+1fbRgXOKW4+MmFlEuD3x/znt8Aj45u5uZmmZk3Ui9dufTrFSFE925dHj58VMdK+Xrq4d1V+tC3j49HR80nQlT5D30v/oczm7eEn/nxbN8+vdzdOigUirT0zDOJSXJ5nhBCX08vbNM6K0sLjW/Rp3evtWuWLVvxmVKpjNix61jsyf79erd1ddHX17t1607CqURpEbqRUfOwjaFqm5RaW1m+07/P2aTkf/5+bdHS1auWLzI2frbHZnbO/TWfPVsO36unt2orHR2dHeFhYwMmZ16/mZl5Y1zglH59fTw9OtrZ2RYV/XH+wsXqYPqd/n0WzJut8aM1XPULXFhYtHDxyqi/x/Tw7uri5FSqKL16Nf1MYpL0Ajs5OYZtDJVmhtSEfr4yLS3jxs1b97JzAiYGDxnk5+np7uzkdDcr6/eraQmnEpVKpZWlRfv27c5fuFizudZVf91CiKi90YmJP3t7d+3wVrvKSmVGxvWLqb8+zi8QQhgaGn69bZM0XwUAAIAGInAHAABoei1aGEWEhwVNCSkrK1u+8vNt23e2a+sq05XlyvOktecGBgY7I7a0atVKs/5NTU327dkxeeqstPSMs0nJZ5OS1S5wdm6zPyqydWvbhjyFjo7O9q0bbG1tdkbuUSqVaekZNYvYdO/WJTJii42N9fM6WbRw3j9++2dWVvblK7+pVfbo2aP72lVLnxe4CyE6eXkc2PfNByFzCwoKCwoKDx46onZBv74+30ZuGzYi8OUfTl31bxFqXaqvmYjtmxcYLDt67MS1tAypyocqI6PmX2/bNMC3XwPvEjx5orm52ZJla4qK/sjLeyBtdqrK2srym51fde/WpWbbzRtDR46eeC875+ChIydOJrh1eKtlyxb5+QUZmdelVflLF3/c26eHWitTU5Ojhw98tGDxj4lJQojkcynJ51LUrpkQOHb9ujWalcrRFukFdrC3i9i5q6KiMj09s3qD32pdu769K3L78yoItWrZ8lBM1JSpM69eS6+oqDwRf+pE/CnVC9o4OuyL2rEn6sCrCdyFEMGTJ5qZmixasvp//vwz535uzv1ctQtsbW0itm+qe1dVAAAA1B8lZQAAAF4LvX16HNj3jU8vbyHEw0ePz6ekJp9LkdL2dwf0P3hgVx+fng3p38bG+kTswcWfzre1tVE9bmFuPmfW307HH3VxcWpI/xKZTLZi6cJT8UdGjvBXnR6QyWTe3btuDVt/7MiBOtJ2IYSDvV3CiSOjRw1TzV4tzM0/+nDGdzF7mjdvVvcAvLt3/enM8UkTx7ds0UL1uIuL0/p1a2L271I7rplbt+8knEoUQrR1dRn47jsN71Cir68f/tXGnV+Hubt3UD1uaGg4coR/4um49/wGaOVGw/wHn0tKmDsnRG1Rs6OD/Yplnyb/nFBr2i6EsLayPBi9e+zoEXp6usXFTy5f+e1sUrIULnfs6LZl85dz54TU2tDYuNW+PTv27430G+jbrJlh9XF9ff0hg/3ijsZs3vBF06btEplMtmTRgh9PxQWMH21pYa56qkvnTjvCN8ceia67Xr+1leXxYweXLv5YbfrK3Nxs1oxppxOOvvo66cOHDU3+OSFkerC9XWvV4+3aun76yUe//BRP2g4AAKBFOhZu2vmr/T9BxPwOipLCWk+Nm771FQ8GAAC8qTIzb9zNys6Vy/V09eztW7dr69qQqtbdevrK5Xn9+vocit4jHVEqlVK97Eql0tba2quTRyMFneXl5feycwoKCo2Mmtvb2ZmYGL9U87Kyspv/uv3gwUNLSwu3Du1rLUFTB4VC8fvVtEeP8w3+8hcHB3u3Du1fqnndFi9dvT/6OyFE6Gcrpza4gPvc+Yu+P3pcCCHPvl598M6drLtZ94qLiy0sLDw93Vu1bNnAuzzPgwcPH+cXlJWVOTu1MTc3q2er3Ny86zdu5srzSktLW7e2bePo4OnhXs96RAqFIjc3r6Cw0NTUxMmpzeuQs9eqsrLyfq68oKBQT0/P1cXZyKj5SzVXKpVp6ZlyeV5FZWWj/kerv6qqqpz7uY8f5evIdGysrRr4ixYAAPDmObxrfq3HDY3MZ29R/+Ufnuc1/esWAADgP5ab21tubm81Xv8ymayTl0cnL4/Gu4VEX1+/rauLxoWhDQwMPD3c1XbgrD9DQ8NGWrf78NHjw9/HCSHMzEzHjR3ZGLcQQri4OGnlNwcvZGNjXfdvDmplZ2drZ6dhXGtoaOjq6uzq6qxZ81dGV1e3jaNDG0cHzZrLZDIvz44a77vQGHR0dBwd7B0d7Jt6IAAAAG8ySsoAAAAALyFq7wGFQiGECAwY06KFUVMPBwAAAMBrhMAdAAAAqK/i4icHYv5bCKGvpxc8eWJTDwcAAADA64XAHQAAAKivmEOHCwuLhBD+/oPUtqAEAAAAAAJ3AAAAoF7KKyqi9kZLn6cFBzXtYAAAAAC8hgjcAQAAgHqJjTt5LztHCOHdvWu3rp2bejgAAAAAXjsE7gAAAMCLVVVV7dr9d+nztOBJTTsYAAAAAK8nAncAAADgxZJ+PnctLUMI0cbRYeiQQU09HAAAAACvI72mHgAAAAAaUcj0KSUlpXZ2tk09kP/3nj59umjhPCFEJy8PPT1dLfY8ZJCfq4uzFjsEAAAA0FQI3AEAAN5kIdODm3oIb4jBgwYOHjSwMXoeOsRv6BC/xugZAAAAwCtGSRkAAAAAAAAAALSAwB0AAAAAAAAAAC0gcAcAAAAAAAAAQAsI3AEAAAAAAAAA0AICdwAAAAAAAAAAtIDAHQAAAAAAAAAALSBwBwAAAAAAAABACwjcAQAAAAAAAADQAgJ3AAAAAAAAAAC0gMAdAAAAAAAAAAAtIHAHAAAAAAAAAEALCNwBAAAAAAAAANACAncAAAAAAAAAALSAwB0AAAAAAAAAAC0gcAcAAAAAAAAAQAsI3AEAAAAAAAAA0AICdwAAAAAAAAAAtIDAHQAAAAAAAAAALSBwBwAAAAAAAABACwjcAQAAAAAAAADQAgJ3AAAAAAAAAAC0gMAdAAAAAAAAAAAtIHAHAAAAAAAAAEALCNwBAAAAAAAAANACAncAAAAAAAAAALSAwB0AAAAAAAAAAC0gcAcAAAAAAAAAQAsI3AEAAAAAAAAA0IL/BQAA///s2LEAAAAAwCB/60nsLIyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAwCAAD//+zYsQAAAADAIH/rSewsjIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAwCAAD//+zYsQAAAADAIH/rSewsjIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAwCAAD//+zdsXLkNACAYWmTHAwdBSVvQcs7XEnF8zDDu/ACPA8tQ3+cRWFblmXZu9ko2Wz4vpm7SbyWpXW2+kfjFdwBAAAAAKADwR0AAAAAADoQ3AEAAAAAoAPBHQAAAAAAOhDcAQAAAACgA8EdAAAAAAA6ENwBAAAAAKADwR0AAAAAADoQ3AEAAAAAoAPBHQAAAAAAOhDcAQAAAACgA8EdAAAAAAA6ENwBAAAAAKADwR0AAAAAADoQ3AEAAAAAoAPBHQAAAAAAOhDcAQAAAACgA8EdAAAAAAA6eLz1AgAAAIDzUkrjv5BSKn9Iw/hiSCmFYTptPCWkPCofD2H1akrDODqklNJQXLYYXky3DC+ny8Or6TZXS2lY3st4fpgvXy6+OV1KKQxhPHc93eaeFMeXdzHklVb3anNPmsc3bzakkNLj0zeff/3tph8NAN4RwR0AAIBsEytbzbQ4vhTMlFJIQ7u07hbYYf4hTMOrWc4E32E+HlIYGqX1TIEtZx/OVenx3YXG4l/pXpXDUwoh3fSDAQBcRHAHAADeWlEVy82qad6ou9nrultghymflht1537aLq2ruFnstF3tdQ2XbtRdAupQHL9gX/C0+Mv2Bedf6426+b/z+4J3NuqOpw/FKAAArie4AwDwwX39+uVukm5jU+1+0j07XUp5z297usam2vajHlY3pxjYLsjTcpfpvv775XZ/f+BuPDw8hRhjjDHE6YcYQxgP5OOn+cfp6PzSaRwUpt9PrUudpgPTwPlS8xkhxjidMx4PMc6/1nMtQx4fP936zgHwjgjuAAAvsiqVSxhNuerWpfKo6qbiAsOqbJ5/MsOwbFZ9eUS+turuTVddrc++4E3VrVZ7y48F8K4VdTUH2TLLrqvrKsjuV9ciyJ7yHGPhrefKOXhMv3tzjTm4vbxlrk0v3p1ru4z2XKtZpvfSnisuBXx5y/G0mmsasmTrEEOMp2INAPChCO4AcBeq2tgssFM/TfNTYufjYfWU2N0kOuRp1g+lDdUTdXeSaDF8eaJus7S2F5/r6Yse4FsvfpuJt8c3jw9+3r1SdYFLxKU0NjfexqLwhnC4h/c4re4W3r09vPmls3Pl6hqWtLq+VF14Q+NS7cIbVsveq8mtZBx3C+/mUgovAPD6BHcAFkVV3Oy0be513S2wV2zULb+FrPjWsmfsC87j19NdslG3HH3dRt1n7As+uFc26gI9FcGxLrx7e1RXjbJVMHee0lDFzfZTGvJDHJaQuuqhOcuGo7niTpiu31FdeOu5qjBdnNOeq3jpaK7VLDlMn278UQAA4K0I7gBM/vzj93/+/uvWqwDuW50sy+2u7cIbVttdDwrvdOJp00PnsdOQsP/whE3h3STjM2H6oCbnXw9q8lR482167ZpsGy8AALw1wR0AuHdViKwL75nH4xaNspVWY7PwNuaqcuclj8fNhffg8bhX1eSdjBuft815vYz1svdqssILAAD8rwnuAHCFbaM8fApB2S5XndSXrS2Fd3nLvmwNAACA+yS4AzD5/ocfP3373UHhfcdfthbqZe/V5FYy3hbe5jbnh4enW/+JAAAAgHdNcAdg8tPPv9x6CQAAAAB37HTrBQAAAAAAwEcguAMAAAAAQAeCOwAAAAAAdCC4AwAAAABAB4I7AAAAAAB0ILgDAAAAAEAHgjsAAAAAAHQguAMAAAAAQAeCOwAAAAAAdCC4AwAAAABAB4I7AAAAAAB0ILgDAAAAAEAHgjsAAAAAAHQguAMAAAAAQAf/AQAA///s3Xk8VFH7APAHM5ZslV0LISVK0ioVlVYVkbRrTzstIqWkPVTaNyqS7IpsSUgboUibsu9LWTIy8fvjvq/fvGNmjJnR+nw/ffpw55xzz505c8c899znYMAdIYQQQgghhBBCCCGEEOIBDLgjhBBCCCGEEEIIIYQQQjyAAXeEEEIIIYQQQgghhBBCiAcw4I4QQgghhBBCCCGEEEII8QAG3BFCCCGEEEIIIYQQQgghHsCAO0IIIYQQQgghhBBCCCHEAxhwRwghhBBCCCGEEEIIIYR4AAPuCCGEEEIIIYQQQgghhBAPYMAdIYQQQgghhBBCCCGEEOIBDLgjhBBCCCGEEEIIIYQQQjyAAXeEEEIIIYQQQgghhBBCiAcw4I4QQgghhBBCCCGEEEII8QAG3BFCCP27WlpafnUXEEIIIfT3wD8tEEIIIYQBd4QQQv+o+vqGs+ev/OpeIIR+U42NlMioWDYLP4xP/PLla5f2B/1rcAT+oY4eP9nVu7gXEUWhULqi5YCg0K5oloCXIhBCCP07SL+6AwghhFDHHsQ9iotPkJeT27RhDYtih4+61Tc0zJw+VW/MyA7bDAq5e83Le92a5WQymf2exD1MiI6Jy83Lz8srEBQUlJeXU5CXnTplktHkiSSSAPvttPf23Qe/O0Gfc/Py8vIplCZ5eTk5OdlRI3XN5s6WEBdnWGX33gMAsGC+mZbmINaNP4xPjI2Ll5aSstmynnXJmpovsXHxCYnJRUUl5RUVQoKCMjLSOkOHGM+Yqqmp0akj+v79e2LSk9gH8Z8+55WXl1N//JCWktLUHGg4YdykiRNY171y7cbn3LwOd6GpMXDhgnnM9u4fEPIi5WVefmFBYVH37pIK8nJKSn1M58zSHabdYc85qEu8HB2iHZ/EYY4aOXy28XTWtXLz8i9fvQ4Au3baiIuJtW3//DnviucNANjjsENYWJh1I8TuxoweaTxjKrMyzVTq0eMnGxsbySSy3Y6tIiIdtNna2nrc9fTX2loBfoEd2zfT9q1TcvPyo2Pinj1PLSsrr66uERcX69VLcfiwoebmJrIy0p1qqrGREv8oMTr24cecTyUlZdTmZgUFeSWlvhMNx0+eOKFnzx5stvPqdaavX+C0qZPZKXwnIISPj89ggj7DRxmODdFuov37q6j3VxusNYifn8EkGA5e3A77SfuWqa9v2Gm/t8MqAGC3Y6tS3z7Ez8TZuMMqIiIijvbb6Ta2fx7ExcRkZKSVlfrqjRnV4WBjgZtj4fiThZungh08HIHsvPcJ3Jy3mY1zdXVVjQHqGhoDGI5zhioqq2Ji4h4+SszPLywtLRMWFpaXlxs4oL+RkeG4sWOEhIRYV2fzlSVw/3FD6937jx5nL80yntbh5zKzXZNJZFXVfgPU1QZraTJ7U3z8+CklJW3f3l2s2/c4e6m0rMxgvL7RZEPa7SyeH6f9h0eNHN6ndy8Wzb5589bntj8AHNi3u8PXNPVlRmRU7OPkp0VFxRWVVT16dFdQkB8+bKihwbjJkwwEBLj6wwkhhBD6bWHAHSGE0B/gdeYbTy8fnaFDWH95Dgy+W1xcot5fjZ2Au8+tO2Vl5eER0SZzZrLTh6fPXhw+6v4i5SXtxg8fcwDgTkBI716Khw86dRiPYKiwqPjwUbfQsAjayV95+QUAEHY34shR940b1jA8cE8vHwAYO2Z0h1/sM7OyPb18NDQGsAi4NzR8O3/x6sXLng0N32i3Z799n5CY7HH20szpUzZtXMNOEKGlpSUgKOyE6+nComLa7Tk5n589T7nm6T1MR3vThjVTjCby8fExbCH2QXxCYnKHOzKZM5NhBMT3dsDpMxeJ55BQXFzy5s1bALjm6a0zdMhZjxPKSn0ZtslxXeLl6BDt+CQOkyRA6jDgXlFRSbS/dfN62qB2aVk5sd1ux9YOY7LE7oQEBVkE3cgkkppKP9sduwGA+oPqst+RdZuXr14/efo8AOzcvoWzaHtBYdHR4yeDgu/SbX+d+SYyKvakx/lFCyzWrV0hJyvTYVPfv3+/ftP3zNlLFZVVtNvLKyozXmWG3Y0QERFebrV4o/Xq7t0lO2wtLf31w/iEkpJSBQV51iWrq2uioh8MUFdjFu5kPTaG6+q4ODsOGaxJt52DF5d1Gfjft0xzc3NIaHiHVQBg3ZoVbT8TZ+MOq8jJyrSPMrOoKCIiPNFw/Abr1UO1B7PTJTrcHAvHnyzcPBXs4OEIZOe9z/15m/WzMWrk8IPOjoMGDWR9LBWVVR5nLt708WtqaqLdXlBY9CLl5U0fPwUF+a2brS3nm5FJTL/JsvnKErj8uKHjc+sOAPjc8j980InLXfft09tpj930aUYMH71y7YbBBH1mrzghMio2Lf1Vzx496ALuLJ6fmpov27bv9vW5yiIUXlhUTLzWzk4OLPb+/EXqcdfTj5Of0bVfU/PlzZu3N7xvKyv33bltC5t/gyGEEEJ/Fgy4I4QQ+hc9e57yOvMNANzy9Wfny150TNza9TZNTU0aGgOWLVkwQldHWkaaQqFUVFQ+ffriTkDI+w8fV63d7HHqWIfzB+nk5uVbWFoVFhVLS0ktt1o0ftxYRQU5fn7+isrKrKy3QSH3EpOSDx91q6mp2etox+HRsuFjzqflqzbk5HwmftUeojVYa1DPnj1KS8sKCouy3ryrra29Gx55Nzxyu+0m260bWDRVX9+wYdO2mAfxxK99+/QeNXK4vLzsly9fCwqL3r3/WFJS+jItY/mqDUaTDS+cdWcxrXWYjvbIEcNY7GvgwAHtNx464nbm3CUAmDzRwNxstpbmIElJia9fa0tKyx7ExQcEhqWlv7KwtPK5ebm/mioP6xJmTDfq26c3iz5rDFRn8ejvwHK+2aPE5NCw8Gue3pMMJxgajGNWMvvteyJ5gt6YkewEttqLin6weatdXX09AJBJJD29UWqqKkLCQkVFJQUFha9fZ9XXN1y87HnL1//8WbeJhuNZNJWbl79m3dbMrDdEU6NGjRg5YpisrAxJQKCisirjVWZiUnJDw7dz568EBoWdP+M6etQI1n1Lz3hNpf4ICArr8NCCQ+9RKJS09FesixlM0FdUVGj7ldrc/Dk3P/vtu5TUNOM5Frvtt69dvZx1Cx3q1FtGRER45/YttI8+iItPfZmh3l+N7qwoJydL146cnKwpyzNnt27dmD2kPURLSqonALS2tjY2UioqKz9/zmtspIRHRIdHRJvNnX3IZW9nL95wcyxc4uapYI3nI5AFHp63mY3zZ89Tps+at9/J3mrpQmZ1H8Ynbraxq6qqBgAJcfEJ48dqaQ2SlurZ9P17WVn5s+epz1+klpSU2tk7+QeEXDzn3uGlCPZx9nFD59u3xsDgMAAIDrnnYL+NzWGsqamhPUSr7dfW1taiouLs7Hf5BYUr12yaZ2bi7nqo/UTylpaWnbv2RoYHsn/XDpuSkp+ev3h143pOTumE1tbWE24e7qfOEb9qDFQ3mKCv0k+5R48eZWXln3Pz0jNep6Sm5ebmr9+0LeJ+9JnTxwUFBXnUfYQQQui3gAF3hBBC/yKfW/7ED0nJT9+++zBwQH8WhWtra3fu2tvU1DR71gyPU8doZ9X16d1rmI621bJF1httY2If2u/ebzhhnKhoJ8IrDo7OhUXFA9TV/Hy9aFNnyMnJamkOmm8x19X9jKv7mQuXPGdMnzJcV6eTB8qWtPRXy5ZbV1ZVAcDsWTO2bFpHFxRuaPgWEnrvlMeFwqLiE24etbV1TnvsGE5yrKn5snDJqoxXmQAwTEd7u+2m8eP0aCMFP378iItPPHP20ouUlzGxD5ctX3f1yhlmUYmRI4Z19jLD02cviIj5vr271qyyatsuJdVTRUV5rN6opUsWLF625tOnXGeXYze9LvKqbhsLc9MpRhM71eff0JGDTunpr/LyC3bs2htzP7hHj+7ty3z//t12u0NjI6VHj+7uroc5yAzgc+uOveN+KvWHiIjwqhVLV65YSpc9pri4xMfX/8Kla3X19SvXbDrlfoTZrQAZrzKXLFtbWVVFIgnMtzCz3bK+fSSurr7+0mWvS5e9ysrKFyxedcrt8OxZM1h0Ly0tAwD8A0I2rl/NbEovwT8gBADS0l61trayKGm1dGH7sVFVVe3kfDgo+O7+A0fVVFU4u0umTafeMsLCwls3W9NuKS0tS32ZoaTUh257e4oK8hxfArTZsp7ueaiqqn7wMOHy1etZWdmBQWGZmW88r5xTVmZ8DwpD3BwLl7h5Kljj+QhkhrfnbYbjvKKyynHPgbvhkY57XVT6KY8fp9e+4i1f/12791GpPyQlJdavW7VqxdL2Yf28/AJXtzMBQaEpqWnGJpa+3lfU+6t19ngZ4uDjpr2Q0Hs1NV8AoLauLjAojMWlBVrjxo5uv+vm5ubTZy6e9rjgHxjSp0+v7bab2lcsLCp2cHS+cM6dy2635+p+dpy+Hu1lAPa1tLRstrEjblrSHqJlb2fL8OVOevzklMeFx8nP7kVEUX/8uHjOvVP5/RBCCKHfHC6aihBC6J9TWVV1LyIKAHR1h8J/bwBnIeJ+THlFpYSExPGjzgzvYe/WTeTggT2iot1qa+v8A0PY70luXn78oyQAOODsyCxRtc2W9ZqaGmQy+ZqXN/sts6+ismrdepvKqioJcfHr185fOOvWfgq2qGi3RQstYqNCiLmil654HTri1r4p4ms2EbXZbrspLNjXYII+3bw8AQEBo0kGQf43HXbZAkBS8tOlVut+/PjBq8PxuxMEAPpjx9BGzGkpK/XdbrOJTCYnJCZnZ7/jVd2/jKSkhOvxgySSQHFxib2jM8Myx109iNf6oPMe1gl/GXqc/MzB0ZlK/aHeXy06Itjezrb9W0BRUWHHts3REcFamoOampo2bt4eE/uwfVNlZeVr1m2prKqSkJC4eunM8SPODOe9iouJbbPZGBJ0S0VFuampyWa7w8u0DGbdKy4uKSgsAoCPOZ+ePH3B4kAyXmW+ep0FAJVVVZ8+5bJx6P9DSqqnx8lj4/T1AODQEdfOVv87SEn1tDA3iQoPPLB/t5CQ0Lv3H1es3vD1a+2v7tev9NNG4M85b8tIS1045643ZmRLS4vLoRPtCyQ9fmLv6Eyl/higrnYvxG/ThjUMJ9Er9e1z+uTRC+fcxcRES0pKV6/dQgS4fxM+vv4AQFwaJ37mGJlM3mazcb31KgA4d+FqaWkZw2Jh9+4Tn1y81dTURFxP5aDucdfTRLR9/jzT0KBbDKPtAKA/doz/7eubN64FgMio2PWbtjVTqdz0GSGEEPqtYMAdIYTQP8fvThCFQhk9asSuHTYAEBAUSpe1nE7Wm7cAMEBdjcXt4b17KX7IfpmX85rNGW2EzKxs4gddnaHMyvDz88fcD87LeX3Oo0uCcTvs9hQUFomICPvcvEKX5pWOhISEx8ljZnNnA8Cly57Zb9/TFbh42etB3CMAcNnvaLt1A4u11AQEBDauX3Pk0D4AePY85dbtAO4PhJD55i0AsE4DbTJnZl7O67yc1xoa/5MigJu6fx+9MSM3WK8GgLC7Ee0vIyU/eX7x8jUAmD/PlIMMvPX1DZtt7Jqp1P5qqsEB3qqq/VgUVlXt5+t9RVNTg0r9se/AEQqFPga0w25vQWGRsLDwDc/zrMcwAGgMVA/0u9Gnd6/GRsrGLTvo8kS3SaWJxbO+ikb7aFoGJzk9+Pj4dm7bDADZb99n/fec8A/i5+dfuXzJzesXhYSE3r77YGffcQrsv9hPG4E/7bzNx8dHpP3JzHpD9/FRV1+/acvO5uZmFRVlf7/rrE8IADDbePq1K2fJZPKHjzl79h3sVDe6Tmpqelr6K1HRbufPuEmIi2dlZT99xupKCTu2bFonISFBoVDuR8UyK+PkfCQ3L5/LHbWX/fb9wSMMLo2w9uTpi1MeFwDAwtzE3fVwh4lidu202bN7JwCER0R3OPsBIYQQ+oNgwB0hhNC/paWlxdcvEADmzzPVGzNSvb/a16+1IaH3WFT51tgIAA3fWAXlOfPtWyPxQ8O3Bp43zo5nz1OiY+IAwGW/o+4w7Q7LCwgIHDvsPEBdrZlKdXY5SvtQbV3d+QtXAWCemcmK5YvZ2fvSxZYW5iYA4Orm8eXLV04OoJ1v374BwLdGTl4sbur+lWxtNo4YPgwA9jkfISbbEmrr6rbbOVKpP1RV+znv381By9e8vEtKSkVEhC+cc2eYr4YOMQ1cRET48+e8i5e9aB9KSEyOjYsHAOd9DiNH6LKzdzk52Qvn3EkkgdzcfM/rtxiWSadJhx0eEVVbV8ewWFNTU2hYxP/XynjNTgfa09LSIO6e+ZjzibMW/hr6eqMPHdgDAGH37tMtUv1P+Tkj8Ceft4cM1iSRBADg/fsPtNvPX7haVl4hJCR0+cJpaSkpdprS1xtNTLcPCr7L4laVn8nb9w4AGM+c1quXwpzZM4DrSe4AICwsPEhjAAB8+JDT/tHevRQlJSVqa2ttt+/m4Y1iAEDk2bvm6U1cjGFTa2vrkWPuADBksObRw/vZrGW9dsW0qZMB4OIlz+bm5s53FiGEEPodYcAdIYTQv+VhfOKnT7k9enSfZTydj4+PCByw/lZMfN198+Zt6ksef6vX/O8s6Tv+nUhEw0OXr14HAO0hWpbzzdisIiIifMProq/31XVrVtDODva7E1RZVSUq2s3ezob9DhxwdvT1vnrK/SizicadpakxEADuR8YS63D+tLp/JTKJdMrtiISERE3Nl+0797S0tBDbnfYdys3NJ5PJJ08c7uzilgBApf64eu0GACxZZMn+ErIDB/QPCbzl63111Mj/iaq3jeGFlubs90Fn6JD5FmZE9bbjokUELk3mzBQWFq6vb7h79z7Ddu5HxlZVVZNJJFMTYwBIT+cw4E4mk4WEhQCAsxwOf5kFlubEkrbnL1771X35ZX7OCPzJ521BQUFhYWH433H+/ft3z+s+ALBsyYJOrSm9cvlSIi581fNmp7rRFWpqvtwLjwSABfPNAMBi3lwACI+IJhZH4Ya4mCgANDY2tn9IRkbaeZ8D/GcBkstc7ojWlk3rBg0aCAA7du1l/xBepLwkLpLt2mkjJCTE/u5279pGJpPz8gsCAkM56C1CCCH0G8KAO0IIoX+L9607AGAyZ2a3biIAYG5uQiaT0zNep6amM6syYfxYIpnsGustrHPpdtbAger91VQB4Ogx95s+fq2trTxsvEONjZRHCY8BwGrZok6ts9end68J48dOGD+W9ht1TGw8AMwyni4vL8d+U+JiYkRTcnKy7NdiYfJkQwAoKSm1WmFNOym7q+v+rZSV++53sgeAxKTkS1euA8Dd8Eg//2AA2GazkVgFobOePn9RUVkFAMutFnWq4mCtQRPGjyVCsYS6+vqkx08BwGrZIhapMBhatWIpAJSUlKal0WfhaG5uJsKdhgbjZkw3AgB/JmEgIpvHlCkTp06ZBACvX2dxFjHPyyuor28AgE69ff5ia1dbAcCjhCTiafnX/LQR+JPP2/n5he3HefKT50S+/s6eEEgkgWVLFwJA3MOE79+/d6ouz/n5Bzc0fNPQGEDcZ6M7THuw1iAKhcJ9gvV37z8CALOnep6ZCZHUy+3kWR7O9BcRETnpekhISKi0tGyXwz42a8U+eAQA/dVUDSbod2p3qqr9/G97eV09x6slcBFCCKFfDgPuCCGE/iEFhUUP4uIBwNLiPxO6ZWWkp0+dDP+9GZwhNVWVg857AKCkpHSe5TKrlevD7t3nSRhIQEDgwlk3cTGxZirVzt5pxqx5ntd9mK2NxnPPX6QSyes7+924vcZGyrNnLwDAYPxYHvSMCxbmJsRdC0+evpg0ZbadvVNS8lMqla177bmp+xebP8+UmDx77MSpuIcJjnsOAIC+3ugN1qs4a/Dx46cAoDFQXalvHy77lpKSRsyxnWg4vrN1B6irEamiHz95RvdQZlY2EbUcNlR7/jxTAHj+IvXtuw90xQoKi4hLVhbmpsN0tAGgmUrNeMXJJHfvW34AICrajcjhg8aPGysq2q2xkfKE6yzYf6KfMwJ//nmbGOciIsK04/zJ0+cAMGjQQA5OCJMnGgDA16+1aemcLJ/AK62trb63A+C/09sJxJ8Zvn6BDO+hYVPMg/j8gkIA0B87mlmZQwf29undq7m52Xb77rY8ddzT0hy0Y9tmAIi4H3OLvdw4z56nAIChwTgOdjdyhO4Uo4mcXcRFCCGEfkOkX90BhBBCiF1VVdXXb/qyKNDQ0EEQ/JavP5X6Q1d36GCtQW0bLeaZht27fy88cu/unczSSVvON+sm2u3goRMFhUXRMXHRMXHCwsKjRw3X1xs9ZcpENVUVDg6HoKExwN/v+h6ngy9SXma8ysx4lbnH6aD2EK2xeqONJhvoDhva2Xm77CspKQUAaSkpOVkZLpsqKy9vplIBgJiwzyvvP+Tc9gtkUWDMmJHtYzTHjjgrKyudPX+5vr7hpo/fTR8/Kame+mPHjNcfY2RkyDpBMDd1CUmPn1ZX17AoQOSI6LCd38phl71paa9y8/KXLl/X0tLSs2cPN9dDAgICnLVGXFLiyVApKysHABlpKRlptvI+0+mvppqT87n9JS4iL4e0lJSKijLx79On3IDAEEeHHbTFAgJDW1paevdSNDQYTyIJKCoqFBeXpGdk0s7BZ8f9yBgiMc6SRfNFRbtxcCBtOHvLcKCm5gvrHamq9uPm4oGIiLCyslJWVnZxcQnHjbCJy0+Wrngqfs4I7KLzNjNR0Q8uXfECgCWLLGnHOfEu5uxjtFcvBQlx8dq6Ou4vVHPz3klITP7wMUdERNjMdHbbRlMT40NHXT99yn0Ynzhp4gQOuvQx5xNxgVNn6BC9MaOYFeveXfLEsQMLFq96/+HjgYPHDh/k2WrD69Ysf5TwODEp2dnl2JjRI/v1U2JdnngplZX78qoDCCGE0J8LA+4IIYT+GPkFhfa72V2Gq73m5ubbd4IAYIHF/+QrN5igr6zUNzcv/05A8NrVy5lVn208faLB+Os3b0VGxaa+zKBQKPGPkuIfJbkcPqGpqTFr5jSrZQslxMU56NiQwZrBAd5BIXfv3r2fkPSkqakpLf1VWvqrM+cuKSjIT582edXypV3xDbaquhoApKR68KCpymrih549edBam7iHCXEPE1gUuHDOvX0ERFBQcOtma5M5M2/c9I2MfpCbm19VVR0aFh4aFk4iCYwZPcps7mwz01kM48Xc1CVcuXaD9UFNmmTwxwXcJSQk3E4ctFhgRcz3P3RgT+9eihy3VlVVAwDsrJXacVP/GcM9OatOVKyspM9QTMyW1Rk6mEi1ZGFueuSYe2DwXbudNsTSpgDQ2toaEBQKAOZmc4h1IHV1tIuLS1isWpmbl//qdVbbr83N1M+5uY8SHgcGhQHAYK1BNls3cHYgbTh7y3AgNy/fdger9XKXWy3icra+VM8eAFBRUclNI+zg8pOlK56KLhqBdLrovF1UVEJkQSFQm5tzPuc+jE8kkqsM1hpka/M/47y6+gsA9OT0hCAjK11bV1dZVc1FlwG4e+8QM/dnTp9Ke1rr3l1yxrQp/oEhPr7+rAPuNTVfaJ+x1tbWoqLil2kZl69er69vkJSUOHZ4P+tL7+P09dautjp/8dr1m76GBuOmGE1kUZh9/Pz8bscPTp05t7q6Zus2+8A7N4mRxkx5RSUA9OguyZO9I4QQQn80DLgjhBD6YwgJCcmzzBhbVFzMIgFIeER0WVm5hLj47FkzaLfz8/PPMzc57nra93bgmlVWLLKZi4mJbrBevcF6dUFhUWxsfFLy08fJz2pra7OysrOysq9cvbF1s/WK5Ys5ODR+fn7zuXPM586pra19EJeQkJScmPSkuLikpKT0mqf3TW+/xQstHB12EKnkeUVEWAQAKBQerFba1rFGCi+XfJSXl2Md2O0uyfSLvbJS372Odnsd7TJeZT6MT3yc/PT589RmKjUxKTkxKfnCxavO+xz0x47hed3+aqqSkhIs+kzidGL4rzV61AiT2cYBQaGjR42gewd1FjFaKLwYKmJiYgDAcX4noqK4BP11srSMVwAwdOgQ4td5ZnNOuJ0uKyuPjX04fZoRsfFx8tPPn/P4+fktzE2JLdrag++GR6YxT6O8z/kIs4fmms5y2rOLgxVo6XDzlukUMTHRgQNYrW+pqCDP5S6I5BiioqJcttMhLj9ZuuKp6KIRSKeLztu79x5g9tDMGVMOuTjRXZkWExcFLt7FdbV1ACDO0dVuWhy/d4qLS6Kj4wBgvsVcuofmW8z1DwyJffCwoLCoT+9ezFr28w8mFsZoT0tz0PGjzpqaGh30HsBux9akx09fZ76xc9ino6PN2U0/7fXqpeCy33H9pm0vUl6e8ji/zWYji8KSEuIUCoXFS5mU/DQu7hHrPS5dskBZCefII4QQ+uNhwB0hhNAfY5DGgPAwppnWAWD4aEMW+QeIJKQmc2aKidFHcCzMTd1PnX3/4WNi0pPx4/Q67Emf3r2WWy1abrWoqakp7mGC7+3A2Lj4yqoqRyeX0rJyh1227B0QAxISEqYmxqYmxq2trS9SXgYEhgYGhzU2Ujyv+7x7/8HX51rb9EbuSUv3BICy8opmKpXLZqVlpIkfSkrKePhV2WT2jL2Odlw2oj1ES3uI1tbN1lVV1RGRMTe8b2dlZb9992HR0jVXLp42mmzI27q77bfxanbh70ZcQgwAiNWGuSEtLQUAJbxYq0BWRhoAysormpqaaJfwZVNRUXFbI20qKqtycj4DgM5/w50KCvKTJhpERT/wDwxtC3fe8Q8BAP2xo9vuPiHKFxQWFReXKCoqdLh3Momkpqairt7f0mLuBB4l0ebJW4Yd/dVUw4JZpWHhXlFxCQCwDoXzBJefLDx/Kn7aCOyi83Z7iooKw4cNNTaeZjxjavtHZWVkAKCktJSDlhsavhFz27lPjMbxe8fXL7CZSlXvr6Y3ZiTdQ3pjRqr3V3v/4aPv7YCd27ew36aEhITuMO1x+norly8mk8nsVBEUFDzpetjYZH5ZWfkOuz1eV8914hhYMpkzM+5hQkBQ6GmPCxPGjx2uq8OspJycbFl5RRHzN8urV1kXLnmy3h2xnDVCCCH0p8OAO0IIoX9C9tv3SclPAUBOTjY6Jq59gf5qqtlv3/vcusNOwL2NkJDQ9GlG06cZPX+RarPd4fPnvHMXrsycMUV7iBaXHebj4xs5QnfkCN0tm6y32zk+Snic/OS5p5f3mlVWXLbcZsAAdQCgUCipqWmdzTpNR0ZaSl5errS07PmL1DGjuWqq60hJ9VyyaP7ihRZ+d4J27z3Q2EjZuWvvs+QHgoKCXVoX0VFXVwOAl2kZnEXJaQ0ZrAUAzc3NT56+6Ozav9XVNenEPGLtwbTb2yYI0263tJgbFf3gwYP4srJyOTnZ2tra+1ExADB/3v/PadUeokUmkZqp1LT01wzDnec8XCdO/P/FXUWEhdkMpf2Dst++JxaZ0NQc+Kv78rN13Qik00Xn7bZxvnvPgcCgMBER4ZteFzUGMr0JQEtLAwBSUtPr6us7e5NHQuLjlpYWMolEuy7Lz9RMpfr6BQKAhsaAmNiH7QtoaAx4/+Hj7TtBNlvWM3u/r1i+mAjHBwXfdXB0BgAnx50LLM072xkNjQG7dto47T8cHRN3w/v20sWWnW2BGRfn3Smpabl5+bbbd0fcZbqA6uDBmq9eZyU9fsrs6sKY0SP27d3F8KEXKS/DI6L79VNiZ+gihBBCv7+uWocNIYQQ+q34+P5nAuNx19NWK9e3/5f99j0AREbFElGezho5QvfKRQ8hIaGWlpZ74VE87HmvXgpXLnqo91cDALqWiWyqra2tbDZFlwR2gLoaMTXybngkl53k4+Mjpujei4hqaWnhsrUuxcfHZznfbL+TAwCUlVckJj35OXUZIl4Rdl7BtjL8zFMe/SmIyHh9fUMUo0tfndKrlwIxqzcwOKyzdQODw6jUH2JiouPH/c/sciJ99sAB/bvTZCKeNNFAQUG+mUol8q2HhEU0NHyTkuo5Y7pRW5lu3US0tAbBf/OBtNetm4iEuHjbP4y2sxAYFAoAGgPViVPfP6XrRiCdLjpvt43zQy57+6upNjZSrDfY1tbVMSs/yXACmURqamoKC4vo7L6IN/6YMSN5m4aefZFRscTdD6Fh4Qz/tAgNCweA0tKy+5ExzBoRJJOJZ8xq6UJTE2MA2Lv/EO16D+xbtWKpocE4AHA5dPxjzicOj6odCQmJE8dcSCSBjzmf9rscZVbMaJIBALxMy3j77gPDAjpDh6xZZdX+38rlSz7n5gPAhHG8udcHIYQQ+uUw4I4QQujvV1/fQAQp+vTupd5fjdk/UdFubbPVOKAxUJ2YZFdQUMjL3gOIinYjspfk5ubTbpeSkgKAouLiDlvIyy8AgJ496EMSZqazAcD3dmB+Z/q8e++B4aMNJ08zaWj49v9NzZ0NAFlZ2WF377PfVGBQ2PDRhsNHG2a8ymS/FvdMZs8kLlfk53f6xeKmLh1ihT0WN+C3IV5BEkmg+5+/Hp1S3z76eqMB4PSZiyxSY9OhUCim5ouHjzbctHUn7fZ55iYAEBxyr1Pxqdra2rPnLgPAXJNZdEsjEOHOtvTZBBJJYJ7ZHADwDwxp+3+uySy6GfpDhw4GgAy2V61EDOXlF3he9wEAczOTX92XX+BnjsAuPW+Li4l5nDomLCz8/sPHbTt2M7uy2KNH9xkzpgLA6TMXicT9bHr2PCXiPv00/5/M59YdAJCWkmLxp4W0lBQA+PgGsNPg4YNOaqoqDQ3frDfa1tR86Wx/+Pj4XI+5SEtJ1dc32Gyz/97c3NkWmNEbM9J67UoA8Ll1h9nFgwnjxyr17dPS0nLC7XSnGg8MvvvmzVsAWLRgHvddRQghhH4HGHBHCCH09wsOvff1a62YmGhMZHD8g3vM/hGZQ/3uBNEGAWvr6h4lPH6U8Jgu2M0Qkd6a/aVNE5OSHyU8JsIrrImKdmv7v41KPyUAyMzM7rB6esZrAFDq25tu++qVS6WlpCgUyuatdt+/f2enz3fDIz29fIqLSxYtmEfbH3290UQ2nr37DuXmdfxcAUBuXr6jk0txcclwXR3uk/AAQH5BIfFiffnylXVJERFhPj5+oHmxuKnLMaW+fQDgNRuRYiKwpaykJPBnrrlKx2brBgB48+aty6HjbFZxOXzi2fOU8vLydauX025ftNBCTVWlpaVl05adbManfvz4sWmrXXlFpZiY6NbN1nQPpae/Bpr02W2IoN679x+9btxKTU0HAAtz+nAwkQMkPeN1M5XK5nEhOnX19WuttzY2UpSV+q6wWvSru/Oz/eQR2NXn7SGDNfc47ACA8Ijos+cvMyu23WYjmUwuKCyy3e7A5j1b5RWVNtscAGCo9uA5s7laxpljHz7mJCQmA8CZ08dZ/GnhceoYACQmJb//8LHDNiXExYmrFJ8/52213cXBnQfy8nKHDu4FgNSXGVlZHf95wL7ttpuIYclsiVchISHijBpxP4a4ZsaO7Ox3h4+6AYDxjKnsLA+LEEII/REw4I4QQujvR8xBM545TUJCgkWx+RZz+fn5CwqLaJO8CwsJbd66c8HilXYO+1jvhUKhvH37HgBUVPqx2bFrXj4LFq9csGhlfX0D65JEvFVFRZl244Tx+gAQF5/w6VMui7opqWlEx4jytCQkJPY72QPA8xep6zdta2yksO5GZFTsjp17AEBDY8CSRfT5YQ/s3y0pKVFZVbV85XpiRjYLHz7mWK1Y//VrrbCw8K6dW1kXZlN1dc2CxSsXLF55zcubdcnXmW+am5uB5inlpi7HiHwOhUXFYfdYTS/98uVrTMxD+G8ylr/AmNEjiPzCl654eZy9xLpwa2urq/uZa57eALDQch5dRIZMIh06uJdMJn/4mGO1cn1FZRXr1r5//75tx24i27L9Tlt5eTnaR9+9+0DkvtAZOpiuYr9+SuP09QDA2eUYAOjqDm0fGxo2VBsAGhq+EbM1UWeVlJQuWbb21essMol0yGUvlyn+/0Q/fwR29Xl7udWiWTOnAcCxE6cSk5IZllFV7We7dQMAhN27b2fv1OHVgpKSUqsV1rl5+aKi3Q4e2EOXLe2n8bnlDwAqKsr6Y0ezKDZOf0y/fkpt5TukPURrt/02AIh5EO9+ipO1T41nTLWcb8ZBRdbIZLK76yG6C/90zM3mTDQcDwD7nI/cCQjpsM2MV5mWi1aUlZXLy8u5HNjDs74ihBBCvxoG3BFCCP3lXqS8JHJNWFp0cNe5slJfYq5fW8J3ABAUFJxrOhsAEpOSibvXmTly7GR5RSWJJEAEF9hBdKm2ru6EmweLYhH3Y4j44OxZ/zOPb/FCix49uldX16xet5lZnDH77fvNNnYtLS0aA9WnTpnUvoCpifF661XEXiwWWmVmvWHYTn19wwk3j1VrN9fW1fXp3ev8GVcirQqt/mqqp9yOkEgC795/NDVfzOzp+vHjR3DIPROzRe8/fBQSEjrlfkRZqS+Lw2ffUO3BxATPmz5+OTmfmRX79q3xwMFjAKCiojxi+DDu63Js1MjhemNGAsCOnXtSUtMYlqmp+bJh8/aCwiJhYeEVyxdzucffx4H9u4l1Gg8fddtis4vZAC4sKl5jvcXV/QwA6I8ds9the/sy+nqjnfc5AMCLlJdz5i6Ie5jAbKeZWW/mL1xBhIGWLVmwvN0EauJ2EzEx0YEDBrSvTrxhKRQKMMlioaKiTKSPSMesMp30/fv36zd9Z8y2eP4iFQAOODv+NZeXOuXnj8CfcN4+dsS5Xz8lKvXHpi07C4sY50DbvHHtXNNZAOB9687ipWvevWc6Gfx+ZMws0wXpGa/5+fmPHXZufyvAz/HtW2NAUCgAzJ83l3XEn5+fn3ixAoJC2cyZs3L5kpkzpgCA+6lzsXHxHHRvv5M995eE21Pvr+awaxuLAgICAmdPnxg4oH9zc/NW2117nA4yu/Govr7B4+wly0UrKiqrJCUlLpx1k5WR5nmHEUIIoV+F9Ks7gBBCCHUtb587AKChMWDkCN0OC1tazI1/lPQo4fGnT7ltX1bXrFoWHRv3+XOe9QabTRvXWs43691LkbZWZtabk6fPE3GKjevXECuRsmPSRAOjSQYxD+IvXfGqqKxcvXIZEfNtU1JSetXz5uWrN1paWvT1RpvPnU37aM+ePQ4679m4ZUf22/djx09ZaDlv8mSD3oqKUtI9v3z5mpubFxn94LZfYGMjRUxM9Nhh5/YhcsLuXdsE+Pk9zl5KTU2fMWve9KlGRkaGmoM0pKWlvnz5kpdf8OxZqq9fQHV1DQCoqvbzvn6JyIXS3hSjiRfPndxsY1daWrZq7aaRI3SNZ04drqsjLyfbTKXm5RdkZWV737pDRLTFxEQvnHUnZsMx9OVrLYvYN9GCnJws7RaHXbbLVliXlZWbWy7bYbvJ2HiahLh426PNVOqjhKTjJ06/znzDz89/0HkPH80apNzU5dghl73mFssqq6pMzBbNnD7F3GxOnz69FRXkGhspRcUl8Y+SbvsFEiEqR/vtLCJc0TFx3UQYTDw0mKBPZDpqk5tXwDCmpqgoTzf8uhSZTPa6dt56g23cwwT/wJComLi5JsaGhuNVlJUku0uUlpbl5hVER8eF3o0g7icwmmx48Zy7sDDjND7LliwQFhKyd3TOzc1fvGzNmNEjpk8zGq6rIycrwy8gUFVZ9ep1VsyD+KjoB0SKhk0b1tjtYDA/Ny3jNQAM1R7C8M0yY7qRlFTPqqpqMTHR2bOmty/Ax8enozMkJvZhevqrZUsWcPP80GL/xeXgLcMZSlMT6x0JCAgwOxOmvkxvS9v1rfFbVVV1ZlZ2QsJj4qKLpKSE67GDtGuB/ua4eSra+yUjkLfn7fYkJSVOux+bO29xeUXl+o3bAvyuCwoKtu/5Sdcj3btLXvP0TkxKnjLNZPr0KZMmjtfSHCQl1bP5e3NZefmz56kR96NSX2YAgLiYmOuJg8YzprLY79faWobnOmFhofb97+x7JzQsvLq6hkwiEbn1WbMwN3F186ip+RIaFr7A0rzD8gBw/MiBrDdvc3PzbbY53A253dnL0uJiYm7HD5rPX8r+Ohlsslq6MD4+MeZBPLMCkpISd257WW+wfZz87KrnzaCQuyazZxpM0O/XT6l7d8my0vLPefnZ2e98bt0pr6gEAAUF+SsXT/+qCycIIYRQF8GAO0IIob9ZVVX13fBIYGN6O2Ha1MmyMtLlFZU+vnf27P7P2owKCvK3fa5ZLlrx+XOe28mzJ0+fV+mnLCcnIyYmVl9f/+lzXklJKVFyg/Xq7bab2O8eiSRw6cKp1Wu3xMbFB4fcCw65p6iooKggLyXVs7GxsbS0vC3l60TD8WdPn2ifv9tkzkx+Af6Dh04UFBZduuJ16YpX+71oamoc2OegqzuUWTf4+Pjs7WzV1FQOHXErKyu/Gx5JPGl0yCSSqYmxvZ0t64Dd9GlGfnKyu/ccyHiV+fxFKjFftb2xeqPs7WyH6WizaOq2X+BtlmvYmsyZec7DlXaL/tgxVy56rFq7qaysfLvdnj37DiorK8nKSAsJCX358vXtuw+1tbUAICYmeuKYC5HRhSd1OabeX+2W92UHxwMpqWnMnnlZGekd2zYvWmjBop3NW+0Ybk9OjKaL1ERGxUZGxbYvOX+e6VDXw53pO7fExcQ8r547fuL0lWs3amtrvW7c8rpxq32xHj26L1+2aMumdWQymUVr8y3mqqurObsce/Y85cnTF0+evmBYTE1VxWGX7bSpkxk++p/1KplceBASEpprMuvy1evGM//nYgwtnaFDYmIfpqXzcoY7+y8uB28ZzmRnvxtnyCDg20ZOViYtJZHhQ8ySCJFIAmams222bujbh361id8ZN09Fe79qBPLwvM2Q7jBteztbZ5ejKalpTvsPHz7o1L4MiSTgst9RV2fosROn8vILwu5GhN2NYNjaOH29fXvsNDQY3ARA69On3FVrGXwiK/Xt8ySJPhDf2feOj68/ABgZGdKlpWJIXl5u8mTD+5ExPr7+bAbcu3eXPO1+1MxiaVVVtfUG2+AAb2aXG5kZOUJ388Z1bifPdqpWh/j4+I4dPTBtxtyy8gpmZaSlpG7dvOJx9tKly141NV88r/swTOnOz89vamLs7ORArB+OEEII/U0w4I4QQuhv5ucfTKFQhIWFzUxnd1waQFBQ0Gzu7PMXr/kHhO7Ytrnt+22f3r0iwwMDAkO9ffyy377/mPPpY86ntloiIsKmJrNWWi3u8Pt/e0JCQp5Xz0bHxN3wvv0o4XFxcUlxcQltgYmG45cvWzTRcDyz+dSzjadPnmhw/uLVoJC7BQWFbdPZhISEVFSUrZYuXGhpzs5Km/PMTKZNnezp5RMZFUuXjkBOVmbSJIMN61YRiWg7NExHOzzsTkBQWEjovcfJz4gZygQJcfHhw3Ws164cqzeKnaY4YGgw7lFchLeP322/wPKKyuzsd9nZ79oelZOVWbxo/pLFlgzvXuemLse0NAeFBt0KDA67cvXGh485bZn0+fn5+/bpPWO60eaNa1kvP/DnIpNIDrtsFy4wv+bpHRP7kDaFND8/v5JSH/O5c1ZYLZaUZOvwdYYOCQ7wjop+cC8iKu5hAm0qAxER4XH6etOmTDKbO5tZ4P7r19p37z4A83AnAMyfZ3r56vX580xZ9AEA3n/4WF1d07NnD3a6/fsQFhaWkurZrRurHM28JSkpISsjo6zUZ9w4vcmTDHiVXQp+xbFw79eOwK4+b69dbfXseUpU9IPrN321h2gxSzJuamI8fdrkOwEhUdEPkp88b2pqantIRlpq4sQJc2bN+OXphl6mZbxMywCA+Rbspkq3tJh7PzKGqMjmFYvhujp2O7a6HDqe8SrTfvd+985fEN2y2ZpY1pW35GRlDh90WrF6I4syZDLZduuGJYstb/n6xz54SNyX0EZZua/BeP2lSxYMHNCf591DCCGEfgd80hoTf3Uf/hjntg6kfKtm+NC8VSd/cmcQQgj9Eq2trQWFRaWlZaVl5bW1dbIy0oqK8kpKfcXFxLhvvKKyqqiouKysnEhpqqig0LdvbxlpKfZb+P79e15+QVl5RW9Fxd69ezHLIdOh8orKoqLiqurqHt17qKn2YzPcyVBdfX1+XkFlVTWJRFJVUWZnMiCvNDc35+UXlJaVl5aWNX9vVlRUUFSUV1bqy3qiNPd1udHS0lJUXJKfX9izZ49+yn07O6XxT5ebl19eXlFbV9dLQUFZWUlEhPPDp1J/lJeXl1dU/qD+kJGVlpeTbZ/FgjNbbXeddDvCk6YQ4sBPGIG/8LxNi0KhlJaVV1RUCgoKysnKyMrK/Kr1Uf9cOTmfI6NjN1iv5nnLdvZOh1z2snM5HwDq6uvLysqrqqq7desmKyPNk8RWCCGEuoj/FcbroguLSq13z/7JnflzYcC9EzDgjhBCCCH0j2tspHBzJQAhLuEIRJ1SX98gJibK82YbGr516ybCk7VMEEII/VYw4M4TmFIGIYQQQgghdmGsE/1aOAJRp3RFtB0AREX/pHxNCCGE0E+GN+UhhBBCCCGEEEIIIYQQQjyAAXeEEEIIIYQQQgghhBBCiAcw4I4QQgghhBBCCCGEEEII8QAG3BFCCCGEEEIIIYQQQgghHvg/AAAA///s3XVYVOn3APBDowKSAoIIgiIWpa4FJgYWiIAodnd319qK3S3SiqAowoICIiEt0t0xoAMKSP3+eNfZ2SlmhgHc3/d8nn32Ge997513Zm5x7rnnxYA7QgghhBBCCCGEEEIIISQAGHBHCCGEEEIIIYQQQgghhAQAA+4IIYQQQgghhBBCCCGEkABgwB0hhBBCCCGEEEIIIYQQEgAMuCOEEEIIIYQQQgghhBBCAoABd4QQQgghhBBCCCGEEEJIADDgjhBCCCGEEEIIIYQQQggJAAbcEUIIIYQQQgghhBBCCCEBwIA7QgghhBBCCCGEEEIIISQAGHBHCCGEEEIIIYQQQgghhAQAA+4IIYQQQgghhBBCCCGEkABgwB0hhBBCCCGEEEIIIYQQEgAMuCOEEEIIIYQQQgghhBBCAoABd4QQQgghhBBCCCGEEEJIADDgjhBCCCGEEEIIIYQQQggJAAbcEUIIIYQQQgghhBBCCCEBwIA7QgghhP5l7/6jhoNNDh052dEdQQix1dTU1NFd+M9rbm7u6C4ghATA/dkLw8Em0y3nNDY2dnRfEEIIIQAMuCOEEOpwNTW1b3z9uWwc+C7469dvbdqf/3HpGZlPHF0qKr8uWjC3o/uCfkchoWElpWVcNn7u+bJNO/O/7MbNe9++UTu6F/9hH0LD3wd96OhetNZLH9/a2tqO7gX67XB/7P369Vvgu2CBdyAmNj49I1Pgq2VnxrQp4uLiUVGx7s+82u1NEUIIIQ5EO7oDCCGE/tfFJ3x2cvGYPGkCN41d3T2FhITGjB7F5crLyil+fgGB74Nzc/OLi0skJSVVVJT76vY2MxtrMnK4hIQE58X/Cngf8C6IfoqoiKiiooKSosKQwUba2lotdiArK+fO/UcAsHfXts6dO3FufO/+k4ysrCHGRhYzp9JP33vgKADMm2Pdr19fLt+uRRvWrlRW7sY8/eq12/UNDTazLTQ1NVpcSWXlV/+Ad0HBoQUFRaVlZRLi4kpKioYGg6aZT+rfX4+bbgBAQGDQW7+A7JzcnJw8cXFxFRVlVZVukyaON5swTlRUpMXF/QPeeXu/iY1LKKdQusrI6Or2njxpgpXlDG6WBYCfP3+6uXv6vg1Iz8z89o2qpKhoaDholsU0k1EjuFm8pqbW/dmLl698c3Jy6xsaNHv2mGg2bq6dtbSUFOcFGxsbnVw8goI+pGdkVn791ltHu69u7xXLF6mrdee8YGZm9t37j1PT0tPTM+UV5Htr9xo71tRmtoWQkBA3HW696Oi4+PjENauWttiyoaHx1BmHSRPHt7jl06SlZ/i+/Sv0Y0RxcUlpWbmcnKyqsrKh4aCJZuONDAe1+Bnv3HuUlZ1DP0VURFRBQb6bkqLJqBFqaqqcFxw+bOg080n002k71P492yUlJTm/O/PhgqVOnTrt272txWacNTQ0PnzsJC4hvmzJghYbs+yYkJCQupqabh+dAQP6KSkqsFyQ+fsEADFRsV69NPv01h40cAC7X5b7Qxbpm4qy8vq1Kzi3bG5ujomN9/MPTPj8pbS0vPp7tZysrI52r+HDhlhaTGvxYM7sqbPbz58/WzybHD1+uqi4pMW1WVpMNxs/hrzmabNp5Tafnp756VPMoQO7ODe7fPVWcUnJGNNRZhPGtvhZaFp/BgQ2WxGz/np959pZk9fJKWmPHZ0BYPnShZo9Wz4TES99fD+GRYiLie/fu11Y+O+sMrIptmjqlEkjhg+ln8L9lsmSwK89gLt9lqhvaDh+8pz5FDNu9gtPr1fFxSVjx5iwnMvHz0fU1tYdOHT8mbujmCingAP51TR6qK9cvpg2kY+dTlxcfPmyhQcO/Xnr9n1ba8sWl0UIIYTaGgbcEUIIdbCY2ITAd0FFRcWqqiqcW1ZUVPq+/Uu3jw43AfeycsrlKzcfO7rU1dXRT8/LL4j8FP3Y0UVVVWXThtVzbK04/DWY8PnL/QeO7OZqa2vNs7NZON+uUye2IZXiklKyhm2b17cYdgx4FxQQGAQADAF3sobRJiNbjF7R3q5FC+ztmAPu1Kqqlz6+ADDH1orz4t+//7h+8+7N2/e/f/9BPz0pOTUoOPTy1VtTp0xcv27FgP79OKwkLDzyxKkLkZ+i6SempWcAgKu7p7pa9xPHD44fN5rd4qVl5es37ggOCaVNqaz8mp2T6/v2r5u37l12ON1i0D8qKnbj1l2Zmdn0a0hNS3dxfTbRbNyFs3/KyclyWDw7J3fh4tWkw0RRUfHHsMh79588uHtNT0+X3YJp6RmbtuyOiY2nTSkpKQ358NHZ1WPblvUrli1it6DDpeuXrtykJbSWlJYlJaV4vXzt4vrM4fwJjR7qnD+vQMTExufk5HITcA98F5Sblx8X/3n4sCEtNk5MTDp97pKffyD9xIqKyoyMrJDQsMtXbxkaDNqxbeNo05EcVuL/17ug4FB2c01NRpw8fojlnSSyoIS4OEPAnbZD7dy+qcXIKefDBY1yN6XWB9x93/6Vl1/w1Mlt6eL5LcZkOXesUyfJ9WtXrlm1VFxcnGEW5+9TXa37vr3bZ0ybwjyL+0MW6ZuhwSDOYc3wiE/HTpyNioqln5gNuTGx8W4enucdrq5csXienXWLvxFNaVm5z2u/psbGwsKi7t3Z3okBgJAPYQmfv7S4QgP9gbTXXG42AtnmAeDOvUdjRo/ifFp84+sfExsvLyfHU8C99WdAaGkrorGYOZUWsdXS1PDxeVtSWiYmKtbivQSisbHxzxPnsnNy59pZ06Lt8GtTbFGf3joMAXcut0xm7XDtwWGfJRITkwoLi974+s+cMZVlA3ruHi+kpLqwm8vHz0cTFR13weHqjm0bOSwYHR17/4HjqBHD6APufOx0AGBtZXHi1Pmk5NTwiE9/DB3c4uIIIYRQm8KAO0IIoQ4WG5fQ0NDo/syrxT9rn794WVtbSx+mZCfwXfCGzTsplAoAkJGWHm06csCAfooK8nU/f5aUlIZHREVERhUVFe/cfdDN3fPmtQucY/0yMjKDjQ3I64aGhq9fv+UXFJKwyJFjp27deXD65OEJ48Zw+Xnbx5LF9uJiYhwasAwlv3z55vv3H7p9dIb9wSlCmp6RuXjZ2oyMLPJP/UEDBg7oJy8vV1xckpdfkPglhUqler964/3qzbYt67dsWstyJW/9Alau2VxXV6enp7twvt0QY0NFJcXa2tqysvKwsEhXd8/UtPRlKzdcvniaIQZKFBUVW9ksyM7JBYBevTSHDDbS0dbKzy/8FB2bmJiUnJI2y3r+owc3OPzVHRQcunjZmpqaWgAwNtI30B+krKyUmpoRGhZRWFj01i/Awmqeh9sjRQXWiYRl5RQrmwVFRcXkGxhsbNjY2BgUEpqZmZ2XX2Btt8jH241lBLy2tnb1uq1fviQDgMmoEWPHmMh2lUlKTnV28aiqrj505GQPdbUpk82YF3R19zx99iIAdO0qY2drpdunN6Wi8q+Adx/DIsPCI9du2PbM7QnnXEKBiImJKy0rj4iMGjrEmHNLN3dPAIiJjW8x4H71+u1TZxwaGhoBoHt31XFjTLS0NOXlZKlVVQUFRe/eh6SmpcfExtvZL7WbM/vEsQPswkxE//56+oMGkNf1P+tLSkvTM7IKC4uCgkMnT5v98oWzjnYv7j8vr5SVu1nO5BTk6ty5c+vfxdHJFQCSU9I+fAwfNWIYN4soKSqYmY2jn1JRUZmckpqdnXv67EXvl6+fPrmr3E2JeUH67xMAmpubCwoKk5JS8gsKV63Z7PPa78rFM1w+UMKH5ubms+cvX7h4jfxTRkbGdNRwDQ31+vqG3Lz87OyclNT0/ILC/QePP3j09PGDm1wmRDu7eJB4qJOLx9bN6zi0tJ9nS04lRHJKmpe3j5iY2OaNa+ibGRsa8PS5BLjNNzU17dh14M0rD3l5OZ76wCWBnAGNDPWHDjHi0KBv33/uUEpISMy1s75w8ZqL27NtW9ZzCAfTkMekAGDhfDvmueZTzDjfj9Tr26fFt+CGYK89+N5nyWWSq7tniwH3xMSk6Jg4GWnpxsZGERG2ezFPPx+9K9dujTYdyWv4m7+drmtXGbMJ47y8fTyeeWHAHSGEUIfDgDtCCKEOFhMTBwBu7p7r1iznnKr5d/wuJr65uZlDy6dObrv2HmpoaOzaVWbNqmXLlixgzr/Lyc07d/6K+7MXn6JiplnMcXpyp09vHXYr1O6l+eThLfopTU1NsXEJHs+9nJw9iotLFi1Zs3XzOoY/BTvWjm0bZaSleV3K1y8AADiX94mJjV+4eHU5hQIAM6abb1y/iiFU8f37D88XLy9evpFfUHj2/GUqterg/p0MvxeVSt2x60BdXd2M6eaXL56mDxP3UFczMtRftHDe6nVb/PwDd+89PHa0SZcu/4pRNjU1rVq7JTsnV1hYeNWKxTu3bxL7dXehqanp3oMnp844VFVXr1y96e0bz25KisyforCwaO2GbTU1tTIyMseO7J09ayZtVlV19bHjZx47uqSlZ6xZu9XF6T7LjW3/weMk2r5n15Z1a/6+V9TQ0Lhj9wFnF4+Kisoduw44PbnLvOyFi9dItH3fnu30eeLLly20s1+akZG1c/ehkSP+kJGRoV+KQqk4cOhPANDto+P46DYtJ3f1yiVXrt0+cep8VFTstet3Nq5fxdxVAcrKyiktKwcAN48XnAPuZeUUsjnFxSVwaNbc3Lxl+14X12cAoK2ttX3L+unTpjB/aWHhkSdPO0RERjk5u2dl5Tx5eIvD8yImI4cd2LeTfkpjY+MrH9/tOw9QqdRtO/Z7enCV9Mqf7qoqDO8ucBkZWe/eh5DXjk/duAy4q6urnT3ForzGSx/f/QePJyWnrlqz2cP1EX12MMH8fQJAfUPDtet3zjtc9fL20eihvmfXFt4/R8uam5u3bNvj4vYcAFRVVbZsXDPLcgbD8Tw+IfH23Ycez7wyMrJs5ix6/PCWbh+2B3OisbHR2cWDvHZy8diwfhWHO1Xz59nS//O550svbx9xcbFNG1bz/6EEvc3nFxTu2XfkxrUL/HWJM4GcAYcOMeJpv7Cfa3Pl2u1v36juz15wM6DIw8dOADByxB8DB7B4rMpmtuXEf0eu24LArz343mdjYxMA4H3Qh7z8gh7qahz67ObxAgCoVVUpKWkcnkfh9eejaWho3LJ975tXHi2WWaPH9043y2Kal7fPX4FBnK8SEUIIoXaAg6YihBDqSIWFRXn5BQCQnpH5MSySQ8u4+M/xCYkAUE6h0NcAYRDy4ePufUcaGhp1++i89HRZv3YFy6fde2r0uORw6sa1C1JSXYqKipev3FhZ+ZX7bgsLCxsZ6h8/sj/Q33uwsWFTU9OZc5fIH/z/Xc3NzdExcQDAoTRBWTll1ZrN5RSKjLT0w3vXb1w9z5wY2KVL53lzbfx9PUlhnFt3Hvx58jxDG5/XfqVl5TIyMmdOHWEZ6urcudPxo/u7dOlMpVa5eXgyzPXyfk0K0WzfumHfnu1idLn8wsLCy5YsOHZkPwCUlpVfvHyd5Qe5fPUWhVIhLCx87/YV+mg7AEhLSZ06cZgU1QkJDfN+9YZ58aTkVC9vHwDYtmU9LdoOAKKiIudOHyMp+UHBoaEfI5iX/RAaDgBmE8YyVGVRV+t+8vghACinUGLjPjMsFR0TR6VSAeDcmeP0FTCEhITWr11BKs4HBbf5CJBkCwEAb+/XDNWEGDx77lVfXw8AUb8WYcnh0nUSeZw8acJrb/cZ081ZRkmG/THkmdtj8lWHhUdu2banubmZ+26LiIjMmG5++OBuAIiIjKI9nPEf9eSpKwAYGxsAgM/rtyUlpa1Z2zTzSZcvngaA8IhPL1lt7SyJiYpuXL+K3OC5ffdhQUFRa/rAzuWrt0i0ffKkCe/+ejlvrg3z8XzQwP6XHU4/eXhLTk42v6DQ1m5Ri53x/+tddk6uqqpKT40ehYVFvm//aovOs9NG2zwpLdVGfWbQDmdAVVWVaVMnAcDjJ84t7uzJKWmk7Ml8+zkC7ANP2ufag2hxnyUZ7k1NTe4eLzis5+fPn889vekXaQtZWTnkbnE7MDUZISkpWVRUHBfPeA5FCCGE2hkG3BFCCHUk+mAcc1yVHv3cmDjWfxlWVVev37ijvr6+Vy9NN5eHLQ7pNmPalHt3roqJiaWlZ+w/dJyXjv+tp0YPD9dHJHXuwMHjnxNbrjr620pNy6BQKuTkZI2NDNm12b5zf15+QadOko6P73CuBSwjI3PZ4bTVrBkAcOv2/aTkVPq5iV+SAUC3jw6HrDd1te5pSdE5GQnM6Y2eXq8AQE9Pl10lcVtrS1Li4IWXT31DA8PchoZGsoa5c2Yz1O2lOXxwN6lx/9zzJfPcVz6+AKDcTYm+7CwhJCS0e+cWcg+ANKNXX19PPvu4sabMqx0+bAhJbE/4nMgw63NiEgB0U1I0MtRnXpDcI0n4/KWxsZHlxxEU2q5HrariHJx1+xXoKSwsYhcAjfwUfe7CFQAwn2J25+YlzoUjhIWF9+zaQsoBe718TYLOPBn3azyAzKxsXpf9fdTW1ro/ewEA2zavNxk1or6+3rnVYdZRI4aR/eXlK8YtlrN1a5Z37SpTV1f35q1/K/vALCo67uz5SwAwc8bU2zcucs6QHTfW9PGDmzIyMqVl5SdOM97hY+D41A0AbGZbWM+2AABH3rclvrXpNn/wyElSVqXdtOkZkBSHSUpODQ75yLklGWGVXTGudtD+1x4c9tlyCiU9I5O8dvPwbGpqYrcSX7+AsnIKeR3blhFqF9dnXi9ft936aSQlJQcbGwIAy7vdCCGEUHvCgDtCCKGOFEuXVPXKx5daVcWyWV1d3Qsvn3+WYlOk4vqNuyWlZRISErdvXGJXepvBqBHDSDGEZ8+9ozmm4rIjJiZ25eIZPT3d+oaGk6cd+FjDbyIqKgYADPQHsivHHB7x6a1fAAAcO7zP2IhF2JeBiIjI6RNHdPvo1Dc0HDl2in7Wj5oaAPj+g1OKNAekDNHECWPF2NepHzvGBAAqKirT0zMZZqWlZ3z7RgWAqayqwxPSUlJ/DDEGgOjoWOa53i/fAIDVrBkMtW4ILa2eZhPGAMArH1+GcL+QkDAJf0iwqsgsLCwsIS4GAE1NrDM62Q3AKCkpAQANDY1t/RA9qVRAkLAvS1HRcaRsDhEdy3rPOnn6QlNTU5/eOg7nTjJXRWBp4/pVJKZ24eK16urv3PYbAAAkJf7+zqV4KW7wu3nh5UOhVGhp9TQZNdzW2hIAnF08Wn+jZeDAfgBAi9NxSVxcvH+/vgDQFg8NnLtwuaGhsa9u77OnjnKoLk1jZKh/aP9OAHj23JvD81LZObkB74KEhYVtbWbZWFuKioq8D/rA6wfnWxtt8+pq3bt2laFSqVu27W3ru24M2u4MOHSIMbm/yDl3nlpV5eHhBQD282zbYRALljrk2oPdPhsT889lVXZ2bujHcHZrcHeny2Noswz3vrq9AWDf/mOkCFtbI+MNxGOGO0IIoY6GAXeEEEIdiYTOLWZOlZSUrK7+7u3NOgfq9Rt/CqVCTFTU0mIa/DvqR/Pz58/7Dx0BYOF8O54GQFu6eAH5g/Du/cd8fAQAkJLqcmDvDgAICAz67z7ITJ42oB8dkcHtuw9JA1JuhRudOkk+enDT6cndVSuWkCEKiX56ugDw5UtyVDQ/gYbOnTt3766qpaXJoU3v3n8PjFlRUckwq66urnt31e7dVTkXt9XR6QUAlIpKhgzBlNT0tPQMADA1Gclu2ZHDhwFAWTklPOIT/XRRURESDgiPjGJeKjkljeQbGhoOYphlbGQAALl5+Tm5ecwLRkRGA8BgY0MuQ3j8qampTfj8BQCsrSwA4ENoOLswpbuHJwD0769noD8Q/n1fjeZTVAyJiu7cvpGbQREJISGh/Xu2S0hIFBeXPPtVDIFLpFCPqKhIL62ePC34W3F0cgOAOTZWwsLC5lPMFBTkc3Lz/P9618rVkvrgZAxh3hbs1BkAampqWtkBBgmfv5A69du3bmB5W4ulObZWrk73nZ7cZTkoNOH41K2pqWm06UjNnhrqat3HjjaBXznvba3ttnklJcUjh/YAQFh45JVrtwXVYS613RlwwXw7APDzD2B53CPc3D2pVVWSkpJ2c7g9MQlWR117sNtnSehcT0+X3K4gRZmYFRYWBb4Phl/H8+TkVFK1TODOnDwqJdWlnELZumMfT6XA+DNoYH8A+MTqTjlCCCHUnjDgjhBCqMPU19eTgPvYMSbmU8yArgwFA1JPZuLEcZMmjgeAhIRE5j8yQz9GkLTlxYvm8dQNUVGRhQvmAkBAYNDPnz95/hgAADDadCSJLbZzOWABIiXy+/fTYzm3pqb2fdAHAFi0cB5PadQ91NVGm44cbTpSQkKCNnG06UhS33bF6o2ca/ez9DHE71NYoM1sCw5t8vIKyAvZrjIMswz0B34KC/wUFtirl2aLa5CV7coQxc7PLwAAYWFhEgRnacSIP/5u/KsbNMuWLAAAN3dP2riXRH19/b4DRwHA2Nhg5PA/GJYyGTWcbGA7dh1kyJr3D3j3wusVACxfuoDDx2m9uPgEUpZ986Y16mrd4dc4xgxqampJ9QBba0ty54DlIykkRqypqcFrFQhNTY0pkycAgL//O+6X+vr12+FjpwDAfPJEUizovyg2LuFTVIyYqKi11UwAkJSUnGUxHQQRL05NzQAAFRVlXhdMSU0DAIF/peRhGi2tnpzHcGY2auTw0aYjSRyTWV1dnZv7cwCwtZlFptjaWAGA+7MXfNxs4FWbbvPWVhZk2IzzDlf5y5hujTY6A1rMMFdW7tbQ0Pj4iTPLBs3NzY+fuADAzBnmXKaWC1xHXXuw22dJwN3QYBDZyH1evyXdY+Dx3LuhoVG5mxKpWdTU1MQ8dohA9O6jvXf3NgB49z7kzr1HbfEW9Pr31wOAwsKiNrp/gBBCCHEJA+4IIYQ6zOfEJBLjMDLQJ7URIiKjklPSGJrl5ReQUK/NbEuSsVXf0BAXzxjC+xgWAQD9+vXtqdGD156QWqjfvlFb81T1+HGjASA4JJTvNXSs8rJyAFBWVmI5NyIyigySyWFIVe7paPc6fmQ/ABQVFVvPWbho6Rqvl695rRDCGUlw69RJUktLk4/FGxsbSZi4X19dhlllZeUA0LNnDw6Jt7QcalqFXJopk83s59o0NTUtXrb23IUrnxO/FBQUvfULmDbTNvRjhIKC/IWzfzLf0hASErpw7oScnGxwSKjFrLn+Ae8KCoriExJPnXFYunw9ACxeNI9zVf3Wi4lNAABVVRXNnhqk+DUJ2TA0e/Xat7LyK4kF/53hHvd3pJ5eWPgnYFPLvkVkqeAPH1lWz8jOyfN57Uf7z9nF4+jx0yZjpyQlpWj0UD9yeC8f7/ibIOntEyeOo0XZ5tjMAoCAd0HZ2fwX7y4qKvYPeAcAI0cw3unhzM8/kIx6PWrkML7fnSUytvAY01GCrZLk/epNaVm5cjelKb/i+GZmY1VUlCmUCjIMcptqu22e+PPogR7qavX19Vu27f3xQ8DPHLSoLc6A4uLi8+ysAcDF7TnLT/TufUhqWjr8KvjeITrk2oPdPtvY2EgO1Ib6A2fOMJeS6lJTU0vGLKHX3NxMbpfOspyupqZK7j23XVWZhfPtSKH/k6cvJCWltNG7ECq/bv7lMd3tRgghhNpTx9S5QwghhOBXZRhFBYVevTTJf5mZ2e4envv2bKdv5u7xoqmpSV2t+9gxpqKiIt27qxYWFsXGfR72xxD6ZiUlpQCgo92Lj56oqanKSEtTq6qKi0v4/ji6ur0BID+/kO81CJDHM69ObOp9A4C0tPRU84kME0npFTlZ1qUYSPVVRQUF5W6sI/K8mmNr1blL5+N/ns3LL3jrF/DWL0BSUnLYH4NHjRg2ceI4/n5HmojIKJLHajZhHHnunlfXb94ldWOmTGHMRSUxdBWOKb1iYmIKCvIUSkVpaRnz3JN/HqJUVL5+43fuwhUygiJtqccPbrL77Lp9dB7duzHL2j4mNn7BolX0s6ZPnXz0UJvHkePiEgBgsJEBAFjPtrh4+QYpSmA2fgx9Mzf3FwAwZfIEeXk5IwN9AKipqU38kkyC7zRkX9Pu1cLogiz11tEGgLq6unJKBfMG+cbX/40vizE85eXl7t+52k1JkY935F5l5VdnFw8ODbS1tYYMNuJjzd++UcmjDLTsbADQ09MdMtgo8lO0o5Pb3t1b+Vvt1h37Kiu/ykhLz59ny/2CaekZ+w4cAwBjI/0RTM9ktBI54LTyOMDsqZM7AFhZzaQN/yAmKjp71swr1245OrnRf7Ftoe22eUJWtuvZ00ft7JelpqUfPX76xPGDrektrzifAVPTMjjvF8OHD2UZsLafa3P56i0KpeK5p/e8uTYMcx89cQaAYX8MYTi8MAj5EMZcW4weqWvHoQEH7X/twWGfTU1NJ5ndhgaDZKSlp02d7Ozi4e7hyXBD4mNYJCkIZmM9izTOzMxmNzoOtOLnozl98khcXEJJadmmrbu9PZ3FWY1iIhBiYmJycrKVlV8LCotItjtCCCHUITDgjhBCqMP8evB5IMlhtJltefL0BY/n3jt3bKYNfdbc3EzGZpxtNZMM5mlsqF9YWMT8l2FFxVcAkGdfupczpW6K1KqqckoFv58GFOTlAaCktKy+oaGjhm6j2bv/KIe5enq6DAH3qupqUqiEXe1jSkUFACgoyAmujzBj2pRxY0wfPn76xtc/Kjqutrb23fuQd+9Djp0427+/3vSpkxctnCsjLc3ravMLCjdt3d3Q0CghIbF54xo+OvY+6MN5h2sAoK2tRfIr6VEoFQDQYrxAUUGeQqlg3qKam5tv3LwXEBgEAH11e+sPGiAnJ5uckhYe8ammpvbw0VMXL5zU6KHOvMKMjKxDR0/UNzRIS0kNHWrcp7c2hVIRE5uQlp7h99e7+w8dly6ez8eH5V40XZV/zZ4apiYj3r0PcXN7Th9wz87J/RAaBgC21rMAoFcvTUUFhXIKJSY2niEiVlpWDvzusLTaEeVl5dzfAaqoqJw603bl8kU7tm1su9Fls3Nyt2zndPNj8aJ5/AXc3Tw8q6u/99ToQcqO08yxmRX5KdrN/fm2LevoCzcxqKmpIWWjaCoqKr8kpTx46JhfUAgAhw/tYVkZpry8gn7B5ubmwsKiqJi4+w+e1NTUdu0qc/rEEYEPHlBSWgbsD0f8+Zz4JSw8En49FkAzx2bWlWu3PkXFxMV/5jCIReu1wzZvMmrEyuWLrt+89/Cx09gxJiStuH1wPgMGBAaRgx47N65dYBmxVVFRnj5t8rPn3g8fOzME3LNzcv38AwFg4fw5nPvWYiWT8ePH8B1wb7trDz72WXJZJS0lRe5/2FpbOrt4REXHJSYm0UefSZm+4cOG6PbRAQBD/UEez7xYjhBO8P3z0XRTUjx14vCipWsSPn85dcZh/94dHBq3koK8fGXl18qv39ruLRBCCKEWYcAdIYRQh4mJiwcAA4O/x4e0tpp59vylkpJSf/9AWonbD6FhWVk5wsLCNrMtyRR9/YHer97EMNWolZLuAgB8lyWpolYBgDTv4V2aHz9+AICUVJcOj7YDgKHBIBEREXZz1dS6M0z5+vUbAAgLC3dlqnhOdJLsBAC1tXUs5/JNSqrL2tXL165enpdf4O//LiQ07ENoOJVKTUxMSkxMunP30aYNq5cstud+hQUFRXb2S0l5jRPHDpBoAk+CQ0KXrVxfW1srIy1948p55sA6Ge2w4d+F1Jk1NDbSGtM7d+HKeYerMtLSRw7tsZ9rQ4v8ZmRkbd91ICw80s5+6YtnTxnqERcVFdvOW1JYWDTadOSpE4dpEfmmpqY79x6dOuOw/+Dxurqfa1Yt5fXzcqmgoIiEeGg7rK215bv3Ib5+AWXlFCXFv3tLnkfR1NQgNUaEhIQMDQf5+QfGxibAwn+tsKuMdG1tLalTxKuq6mryQobV5rpqxeID+3bST6FWVX35knz95j0//8CLl29Qq6pIRaO2ICXVpa8up4ETu6uq8LHa5ubmp05uAGA924Jh154x3fzwsdOlZeUvX/lazZrBbg3JKWmTp7IeVVJVVeXgvh0zppuznOv+7AW568nM2Ej/+NEDenqMZZdar0uXzrW1tbW1gqyrTirdm4wawZCM3KuXpsmoEcEhoY5PXds04N522zy9nds3hXwIS/j8ZeeeQ4aG+rR9s61xPgOqqCirM5136Ml27cpu1sL5ds+ee39O/PIhNJy+gsrjJ85NTU3du6uam0/i3LfeOtrsTm2EKPvTZYva7tqDj302Ji4BAAx+XQD8MXSwXt8+Scmpbh4vaAH3qupqH5+3AEC7rDIwGAgAZeWUrKwcLVZjSrfm56OZaDZu4Xy7h4+dbt5+MHaMyaiRw1tchD8KCvLpGZmCPXoghBBCvOr4iABCCKH/TWXllIyMLAAw/BW/U1VVGT9ujO/bv9w8XtAC7q5ungAwauQwTU0NMoW0z8svKCws6t5dlbbCbkpKAFBUXMxHZ75//0Hyy1pTL6WouAQAuquqttiyHTg53uUpN5wE3OXl5NiF6RUV2zZ/v4e62uJF8xYvmldXVxcQGOTk7OEf8K6cQtl38FhxSemeXVu4WUlhYZGd/VKyXR0+uHuOLetQBQchHz4uXbH++/cfMjIyD+5eZflAupKSIrQUXmlubi4vpwAAQwGTkA8fzztcBYAjh/cyDPqqra318P71yVOtsrJytm7f9/Dedfq5GzfvKiws0uvb58Hda/RZzMLCwiuWLRITFdt74OjJ0+f/GGJsbMx2KNfWiI6NAwAxUVFaRHLKZDMlRYWycsqz514rly8GgKamJo9nXgBgM9uSlvJsaDDIzz+QuTqwsnK3ktKywiJ+dtiCgr/LVnC5w8pISw/7Y8iwP4aQGj73HzhaW1lwrkHBt9462l7PnQS+2g8fw5NT0kRFRcijA/S6dOlsMcP80RPnp85uHALuzBQVFPr27WNkOGjNqqUyMi2Ecen11OjRp4/OuLGm9nNtONzYa41uSooUSkVxSamgVkitqnru+RKY0tuJOTazgkNCX3j57Nuzjaevgifts82Li4s7nDsxzcK2pKR0+879D+5e4+Pt+MD5DGgxw5zhNhj3hgw2MjbSj4qOe/zEmRZwr6mpdXX3BAD7uTYtnpL27t7adsn+7Xnt0eI+S3twkDbFerblkWOnnnt679m1hdw/9vZ+XVVdLSMjM23qZNJm4IB+nTpJ1tTURsfEsQy4t+bno7d/746PYZGpaenbdux/88pDVrblMD0fyJMxGHBHCCHUsTDgjhBCqGPQUtTpw15zbGb5vv3rr7/elZSUKit3o1Kpr3394Fd5CkJ/0AAxUdH6hoaY2AT6gPuAAXoA8Ckqtqq6WlpKiqfOBAV/aGpqEhMVHTigH9+fKORDGAD079+X7zV0oLq6OmCVjk2jq9sHAGpra6OiYhiq5wuWhITElMlmUyabRURGbd62Jysr59qNO1PNJ7aYeVpUVGxnv4zUpT16eC8f9VVCQsOWLF9XXf1dRkbm0f3rQ4cYs2ympKgIAJmZ2c3Nzewqk2Rn5377RoVf0Xmaq9fvAMBgY0OGaDshLSW1e+eWFas2+vkH0le3CAuPDAkNA4A9u7ayrBmyaOFcJxePz4lfrt28e/fWZTKxoqKSLMVOJ0lJ7sdZJTts//56tKFixcXFZ1nOuHn7vpvHCxJwDwoOzcnNExUVsbb659ORO2TpGZkUSoWCgjxt+sCB/eMTEj+Ehm/bsp7LPtAEh3wEAAP9gbwWAt6yaW1wyMeIyKh7959ccjjF6/t2oCeOrgDQW0c78UtS4pckhrmkrMTHsMgvX5L79WN9CBo0sL+r8wPaP4WEhLg8Ti5ZbL9j20baP8VExTp14rP4Bvd0dXsnJaeGR3wS1Ao9nnlRq6rEREVFRITf+gUwzBURERYTFa2qrnb38OLpkRqetNs2r6enu2vH5oOHT7z1C3j0xHmBfQsVVwSiTc+AC+bbRUXHvX7jl19QSFKtn3t6UygVkpKSc5mqfrWztrv24HWfpVKpycmpQJfHAACzrWacOuNQVk7x9QuYPnUyALh5vAAAixnmtIO5mJiY/qCBYeGRcfGfebppx6vOnTudP3vccrZ9bl7+3gNHr1462xbvQj5XI9OA3gghhFB7woA7QgihjkHysPrq9qZPcRo/boyqqkpRUbHHM681q5d5evl8//5DQUHenG7gys6dOw0Y0C8mNj4mLp6+EPn4saPFREXr6uq8vHyYh1bjzOO5FwAMHz5UXp7PGuVl5ZTAwCAAmPTvNDph4b8Dss3NzS2uhLQRFhJwNWRukF+hto5txRjdPjqamhrZ2bner960acCdZugQ4zs3L5tPt66rq3v5ypdzwL24uMTOfhkZ5vT4kf2LF83j9e0+hIYvXbauuvp7164yjx/cHGxsyK6lkpICAFRVV+fk5mn21GDZJi7+M3lBkh+Juro6Ut+cPhrCYMiv930f9IH2kYOCQ8kLdgsKCQkZG+l/TvwSEBjU0NBIRjvIyMxatWYzuzcCgJ4aPbgPuMfGfYZ/3x4DAFubWTdv3//yJTkqOs7YSJ/UBR47xlRN7Z87YQb6A4WFhZuammLi4ieMG0ObbjZ+jONT18hP0WnpGWRASC7V1NS+9PEFAD5SVoWEhEabjoyIjEpOSeN12Q5UUlL6+o0fACQlpy5aymlYAkcnt+NHWVfLERER4WNEBAAQFxPjb8HWGG0y0vPFq7DwT0VFxap8FeFh8NTZHQDqGxpWreX0uIyjs1vbBdzbc5tftmTBu/chge+Cj/15ZsTwofx0lxfszoCCMnO6+Z8nz5eUlD5xdNm1YzP8Gi51xrTJbT0Mcova7tqD1302JjahqakJ6Ap/AYCigsLkSRNeeL1yd/ecPnVyalo6uY9lY21Jv6yB/oCw8EhS6K9NGRnqb9m09tQZh+eeL8eOMWl5Ad7V1dYBAN9F+RFCCCGB6IA/6RFCCCH4FXA3+HcAUVRUxNpqJvwa0Yv8f5bFdIasXlJvNO7f46bKycmSQq6Xrtz88aOG+56ER3zyec2YR8+rc+cvV1VXKyt3Gz9uDEOvyIv8XwUBOMjJzQNBjxPIJXk5OfiV586OleUMAHBy9sjNy+d+zXsPHB08bOyEyRZ8VC7W69uH5P3lcXzHkpJSO/ulqWnpAHDi+EE+ou0fwyKXLFtbVV0tJyf75MEtDtF2ABg4oB95lv/DB7b542TzFhMVHTr0n+Exi4pKGhoaAUBGhm0MRUZGhhRjof+SCwuLyNqkpdmmN5J11tXVFZeUkCkqKsqkPj67/7jPDK2vr4+LTwAA/X8H3Pvq9v5j6GAAcHN/Xln59fUbf2Daj7p2lSHD98XG/muHHW06sqdGj6amptNnL3LZDeL23YeFhUUSEhKzLKfztCChqqIMADk5uXws21GcXDzq6+u7dOncp7cOu/96qKsBgMdzb75rSf9WJk0cLycnW1dXd+nKTe6XSs/IHGEycfCwsfcfONJP/xgWmZiYBAC9dbTZfYEkAp6UlPIhNFywn4WmPbd5ISGhc6ePKSooVFd/37x198/6et77ywN2Z0BBERcXt59rAwDOLh51dXUfwyLJaKILF8xti7fjScdee9Aj5x1NTQ2GAjW21pYAEPg+uKCgiNThGdC/n5GhPn0bcjEWH5/YDpVY1q1ZPnzYEAA4ePhEfn7Ll0a8qqmtBQBJSbYjSCOEEELtADPcEUIIdYDGxkYSfWPO2LW1nnXpys2U1PQHj55GRcUCAHPxDZJmGxuXwFBPfNvmdT6v3+blF2zZtuf61fPsyn3QKy0r37x1D1nnzBmsxwxskYvbc5Jtt2nDatoz2oRa9+4SEhJ1dXWfP38ZNLA/h5WUUyiZmdkA0FOjB3/daA1Z2a7CwsLVVdWNjY3sijIvX7rg4SOncgplw6adrk73uals4P3qDYl8rV29jPbNUKuqYmLiAaCnRg9aaX52OnfuBAAcSliUlJbZ2S9NSU0XFhY+cfzg/Hm2LfaKQVh45OKla6qqq+Xl5R7dv8EQhmAmKSk5eeI4V3dP37cBLPMZv32jkrzF0aaj6Mc+JWPrAUBqajq7lSclp5AURVm6If6kpKUAoL6hIS0tg13BEFrKNm3wuh7qant3b+X8WbiU8PlLTU0tABgZMu+wluERn154+6ird6+trVVW7mZmxpg1b2gwKCkphaGMu4SExKYNqzdv2/PK5+29+0+4TCsO/Rhx4eI1AFg43442cixPyBfFeQTF30pDQ6OziwcALF+6kL60CwMqlTp42FgqlfrM07t9Soi0KVnZrsuXLjx99uJjRxdTkxG0UT04qK+v37h5V3ZObk+NHgzjNzg6uQLA8GFDPFwfc1jDLOv5YeGRT53d6EfmFKB23uZVVJT/PH5gxaqNUdGMY4wLFoczoADZz7W5dOVmaVm554tX74M/AMCQwUYcnhZqTx117cGAHGOZT2GmJiM0e2pk5+Q6u3o8e+4NALY2lgxtyFL19fXxCYnsyqkJioiIyPmzf04yt6qs/Eoe3RCsqqpqAOjcua02RYQQQogbmOGOEEKoA6SkpFGrquDfQ3sRWlo9TUaNAIAjx04DgLGxAfPAlUYG+gDw/fuPL1+S6adra2tt2bQWALxevt65+2B9QwPnbhQVFS9asjo7J7dLl87Hj+6nDfPIk0dPnHfsOgAAJqNGzLNjDL926dKZZHI5ubhzThxzdX0OAKKiIqamI/noRisJCwsryMvVNzSUsB+lUEZG5vDB3QAQERm1Zv1WEoHl4I2v//Yd+wFAT093/rx/IoCSEhIbNu2ws1+6c88hzmuora0lFWl79dJi2aC0rHyu/dLklDRhYeHTJw7zEW0Pj/i0aMkaalWVgoL8k4e3Woy2E9OmTQYA/4B3EZFRzHNv331YUVEJAFOnTqKfrqigQOJl796HZLPJsHZ0ciMvBtGV0Omv15dhLoP0jMzQj+EAoKeny6EQP9/I7TF5eTkd7V4Ms6ZPmyIjI/PtG/W8wzUAsJo1g3kAQ0P9gQAQHRNH7iXQzLaaOW6sKQAcOnrCydm9xW6EhUeuWrO5rq6ut4725o2cKquwU1n5ldRmGTyY00MMvxU//4DcvHxhYWGGEhAMZGRkpppPAgDHp67t1bW2tXL5Yv1BA5qamjZv3fPufQjnxtSqquWrNpKA445tG+lv0ZWVU175vAUAm5byiEkisM9rv9Ky8tb2no123uanmU/iY+xonnA+AwqQsnK3GdOnAMD1m/fID7pwvl3bvR1POuTag0FzczO5k808HLSwsLD1bAsAuHr9TnFxiaSkpOXMaQxt1NW6k0FxmAe4bgs9NXqQy4m2kJdfAAAqKt3aaP0IIYQQNzDgjhBCqAOQv+ikpLr01dVlnjvHZhYAkPA0y0ete/XSJInDsf+uKgMAG9atJA/dP3nqar9gRQr7VOLXb/ymW9rFxiUICwufPnGEj0S5pOTU5as27NpzqL6+Xk9P9+a1C6R2NoNVK5YAQFR03PZdB37+/MlyVa983p45fxkA7GxnKykqsGzT1siAlgWFRRzaWFpMW7N6GQD4vPazmbvoc+IXls2qq7+fPX952coN1KqqHupq16+co/9myGCbABAcEkoeqGfn5GmH0rJyUVERMtQbg7Jyip390qTkVGFh4TMnj/AxdF7kp+iFS9ZQq6oUFRSePLzFHKdgZ7TJSG1tLQDYvfcwQ7GgkNCw23ceAoCycjf6sQcIsnFWVVdv37mf3HOi9+y5N4nBaWpqmI3/J0980sTxJCP74WMnEmmi9/Xrt63b95GKPXzccuAGKexraDCIOXOzS5fOFjPM4Z8dlkVQmOxc375R09Iz6aeLiIhcvXS2r27vhobGrTv27d1/tLLyK8sO1NXVXbtx185+WTmFIi8vd/vmRT5S1L99o27aujsvv0BMTGzpIp7H1O0o5C7LaNOR7AYMoCFHzoTPX1jeB/rP6dRJ8uZ1B+VuStSqqoVLVl+9fpvd8TMqKtZytj0ZCnXl8sUWM6fSzyVFSOTkZFkeRuhNnzala1eZuro6F9dngvoUDNp5mweAwwd39+ql2apOs8HlGVCASIQ9NS29vr5eVVVl+rQWftD21J7XHixlZmaXUyjAKuAOADazLUVFRchReqr5RJYl440N9YFuAJK2ZmttOWO6YFL76dXV1RUVFQNAD3V+HoFCCCGEBAVLyiCEEOoAMXEJAGCgP4jl3+fmU8wUFOQplAopqS4ko42BkJCQoeEgP//A2Nh4hhw3ISEhh3MnZWW73rv/JDgkdOJkiylTJo4fZzqgfz8FBfn6n/UlpaXhEVE+r33JU/bSUlLnzh6fZj6J+V1ovlGptLhwY1Pjt2/U/PyC0I8RtIzdSRPHO5w7wS4aYmoyYvHCefcfOno884qIiFq8yN7YSF9drXsXqS6U8oqExC/eL1+TKKpuH52d2zex60ZUdCypAM5g4MB+pHwzvczMbGkptvW+AUBDQ11MTIx+irqaWnJKWkZG1pDBRuyWAoC9u7aKCAtfvnorKirWfLr1lElmZmZj+/fTU1RU+Pr1a05uXnh4lJOLO0nx1tbWevLwFnORnBXLFr71D8jKylm9dvP6dSvn2Fqpq3Wnb/A58YvDpevka1+3ZgVz5ZlyCsXOfmlSUgoATJk8oWvXruxi99raWrp9dJinf4qKWbB4FZVKBQD7eTYFBUUFBaxvNgwdakRfGQYAxMTEThw/OGfukqTkVAureZs2rB5sbNjU2Pg+OPS8wxUS+z52eB/zT7Bm1TKf136paekfQsOnTJu9c9tGA4NBsrJdU1LSXN09SW6yhITEZYcz9Cm68vJye3Zt3bn7YFNT0/JVGxYvmjdr5vQ+ujoUSkV0dNzpsxdJwXfzKWZtlPL594gLbG5I2FhbkoISI0f8wXIoSF3d3jLS0tSqqpiYOIbfomtXGVfnB6vWbA79GHH/oaOn1yuLGVPHjB6lpdVTTla2qro6v6AwODjUy/s1GeFAW1vr9o1LfXqz+EFpSkrLIj9F0/7Z3NxcUlqWmpr+xNGlpLQMAA4f3G1sbMDTN/DWL6BzJxYFCsaMHkWqHtHU1tVlZGRxWJWIiEiLlZRoMjOzSXK3rU3LVZ7/GDpYT083KSnF8albWxeF4AZPhyyWNHqouzo/WLR0TVZWzvET5546u1vOnDZyxDA1NVUJCYm8vPyMjCyPZ14hoX+PprBty3qSaEzT2Njo5OIOABYzpzL8Usw6d+40y2L6/YeOTs7ua1YtZVdcq5XaYpvnQFpK6vyZ47NtF7D8LbjRyjMg8fUblfN+ISXVRVm5hZTkwcaGxsYGpNbcPDtrhlMYB0XFJZzfXUlJgYzMwYD+s9OTlJQgTyrQtMW1B0+iY+MAQEJCggx8wkBNTXXsGFM//0Bgc1sUAPT1B3q/ehPNqgCRQH4+ZieOHYiOjuVmhBvukbHTJSUlMcMdIYRQx8KAO0IIoQ7AOX4nISExy2L67bsPp02dLCPNenhJQ4NBfv6BMbGMGe4AICoqcuzwPmNDg9NnL+bk5nl5+3h5+7BcicmoEYf279TTY5FlTy8zM3vZyvUsZ/Xqpbl+7Uqb2Raca7YePbxXXl7uxq17efkFR46dYtlm0sTxxw7vY5l3Rly+eovl9PNnjjMXDTCf3kK6d6D/S4bQ5+DBhv4B75KSUzkvKCQktHvnFh2dXn+ePF9SUur96o33qzfMzcRERS0tpu3euYXlH+GqqirOjvfmzFuSlZVz3uGqw6XrvbQ0lZWVpKSkqqurM7NySIYaAKxdvXzbFsYvv5xCmWu/nFZQ6JXPW+a8b5qtm9fp9lnHMDEqKnb+opXfvlHJPx0uXefwkV2dH4wawfjYwagRw04cP7hv/9HCwiJSUYHenl1bpppPZF6VlFSXxw9vrl2/7VNUTFZWzqq1WxgakLo9xkaMlW3mz7P98ePH2fOXv3//cf+BI8OYkAAwauTws6eOcVM7mFdl5X+PLsAuE9PIUH/ggH4Jn7/MtmIcboEQERExMBgYFBwaG5fAvK0qKig4Pbl76crNW7cfVFZ+vf/Q8f5Dxk8HAKKiInNsrHbt2MxhHyGee7587vmS5Sw5OdlVK5Ys4n2gxQ2bdrKcHhr8liHxPCkpxWQsi9uENMrdlGI+BXP5vo5Ork1NTd2UFCdPHM9Ne1try0NHTnq/enNg3w7yzEoH4umQxU5vHe3n7o779h996eNLDhfnHa4yN9PW1tq0frXVrBkM0wMCg7KzcwFgjg1X72hrM+v+Q8fsnNyAwCCzCYyjEQiKwLd5zoYOMd6wbhXL740brT8DAoCziwcZioAdi5lTr10+12JnFs63i4qKlZCQYDl+Bju79x7m3ODE8YMs71ay++w9NXp8DGEMxAv82oMn5IG/QQP7MwwyT2NrPcvPP1BLq+fIEcNYNiBH+Ny8/OLiEhUVZfpZgvr5GMjJyZ49fWzu/GW8LshBfHwiAAwa2L+NbpghhBBCXMKAO0IIofb27Rs1JSUN2AfcAcDW2vL23Yfs8rDg11+GqWnpFRWVLIMRlhbTpkye4Oru6fv2r9CPEXV1dbRZSooK48aNnjndfMzoUbx2XkxUVKmbUjclRWMjA1PTkWNMR3KTZCcsLLx187o5NlZnzl0MCvlYXFxCmyUjLT1ggN7G9atI5foONNjYEAASPrOuEsPA2spi8qQJ9x84vvH1Zyjso9xNafz4MWtXLdPS6slhDT3U1d688nD3ePHE0SUpOTU9IzM94596I506SVpaTF+6yJ45JEGhVMybv5xdNRtuRMfELViyihZt59v8ebZaWj0vX7kVHBJKmzjY2HD9upVm48ewW6qHutqLZ09d3T0vX71JAtmElFSXqeaTdm3fxC5PcOXyxVPNJ504df6Nrz99Af0+vXW2bFrTFs/mEzExfyc8ctxhZ+Xm5XMo2WFoMCgoOJRddWAxMbGtm9fZz7VxdHL7K+A9QzMd7V4Txo+2tbFi+aRCi6SlpDR69lDrrmpsZLBw/hyWeay/p9raWjf3FwAw22omN2MUA8DsWTNPnnaora11cXu+ZtXSNu5gO+mmpHjrxsXQjxFPnd0C3wXT12CRkJDQ69tn4YK5VpYzWD4v9eSpK/y6J8TNew0a2N/IUD86Ju7JU1eWAXdRMVEFBXkufw4O2nSbZ7Zxw+qg4NCW27WEvzOgAM2YNuXPk+dHjRim3E2pPd+Xe2107dEiMtIGh6O0mdlYFRVlW+tZ7O6O6A8aICYqWt/QEB0Tz1wPrY2YmoxYvnRhYmIShzY87XTxCYkAoE83CApCCCHUIYQU9cZ1dB/+M65t6lv7o4LlLOtlDu3cGYQQ+n9v05ZdDudPCmRVtbW1xSWlZWXl4uLiyt2UunVTEsgYZXyrqq7Oysr5/v2HlqYGQx5ZB6qtre03aFhjY+PnuI+cy9EwKC0rLygopFRUyMnK6Whr8VpouLm5OS+/oLi4pLiklEqt6qak2L27Ss+eGjz1oWOVlpXn5eY3NDZo9FBXVVXhfkFqVVVGRhaVWqWl1VNdrTuXm2VTU1NefkFWVo6sbFcd7V5tMUoqryorv168fOPQgV0CWRu1qqqkpJRCqegqI9Otm1KHZ2qj30d9fX1Wdk5ZGaW+vl6zp4a6ulpb1w1vH+2wzWdkZL1567929XKBr7mdnbtwZYzpKF6rQnWI3+3a4+TpCwvs55DBUX8fdXV1R46dPn50v0DWNnbCtJTU9BvXLsyYxulJI4QQQhy43WFd41Syi8KaC5xukSJ6GHDnAQbcEUKoPdXU1NKXsUbtYLbtgtCPEQ/uXptohpcHiDe4wyL0m6uu/v473J9rparq6v/Q7djfym97lBbUlpmdnTvCdKKoqEhc1Ac5OdnWrxAhhP43YcBdIDryHjtCCCHEwe/5Z+H/b6SqzMtXvh3dEfTfgzssQr+5/wfRdgDAaDvfftujtKC2zIDAIAD4Y+hgjLYjhBDqcP8HAAD//+zdZ1gTSxsG4CEEpApIE8GCXbGDBcQuKqKIWLBhr9h7o9hQLFiwoliwAKLgEbGLDcSKYEE9VgRUULFQFATC9yPnLMOmkIQE9DvPffEjM7s7mSQTFt6dfQcBdwAAAPhH1y4dCSHnLlzKzs6p6L4AAAAASOpERCQhxMnRoaI7AgAAgIA7AAAA/KtNa8sG9etmZ+ecPnuhovsCAAAAIJHExKdxcQnq6mp9+4hcvhsAAKDcIOAOAAAAxYa4DCCEBOw7yOPxKrovAAAAAKULPBRMCOnr0KtyZelWbgcAAFAEBNwBAACg2CjXobVq1UhMfHoq8mxF9wUAAACgFElvk48eO6HC5U6eNK6i+wIAAEAIIdyK7gAAAAD8RtTU1LZuXv/gwSM1td90dTUAAAAAxtev37zcF1atatywQb2K7gsAAAAhCLgDAAAAi2Wr5patmld0LwAAAABK17JFs5YtmlV0LwAAAIohpQwAAAAAAAAAAAAAgBwg4A4AAAAAAAAAAAAAIAcIuAMAAAAAAAAAAAAAyAEC7gAAAAAAAAAAAAAAcoCAOwAAAAAAAAAAAACAHCDgDgAAAAAAAAAAAAAgBwi4AwAAAAAAAAAAAADIAQLuAAAAAAAAAAAAAABygIA7AAAAAAAAAAAAAIAcIOAOAAAAAAAAAAAAACAHCLgDAAAAAAAAAAAAAMgBAu4AAAAAAAAAAAAAAHKAgDsAAAAAAAAAAAAAgBwg4A4AAAAAAAAAAAAAIAcIuAMAAFSAw0GhLa06tLTqcDLiNFMZeeY8vzLwUHAF9g0AAAD+CDwer2OX3vw/HlpadXDsP5TH4xFCetg7M5U9ezvnFxRUdE8BAAD+Q7gV3YE/hrY6h1f4i5AiYRuVpG3tW0Zq/q+fQjfpGlRXUVGTqrWfOd+yMz8J3aSuoaulYyht9wAAQKHyCwp27ApI//iJENKqVQt+ZVFR0bbtu/mVLZo3rcj+AQAAwJ/gceLTl69eM8W5c6ZzOJxXr948TnzCVE6eNFaFi3/8AQB+FwX5eV8/JwvdxFWppGdQQ9oGv3x6W1jwS+imKoY1lbmqkjfF4xWKiHwSHi9f2o79l+G8K6n6ptxfed9EbJT6RoH42NDP6a+FburmOK+KUS2pWnv/9uH92FChm+pZdG5hPVDa7gEAgEKFh0ckJSUTQurWqV3dzJRfeSnq6sNHiYQQff0qTZs05le+efM2YP9BwRZUuCrm5jXr16vbskVTNTUhl2lZB9YxNx87ZoTQzkSeOX/z1h2m6GDf08a6DVNc6rmSecxR4qxcvpQ+VvxWoaIuX7t89TqrUlVF1dDQwMzUpL1NO339KqU2IqGU1Hd79x168vTv5OSUGtXNGjVqMH7cSOYNl42oT4QQUklVtVo1k04d29erW0dwa8C+g2+S3jLFCeNG1aop5I/p3NzclavXM0V1dXX3xfOYotB3jxCioa5Rr16dBvXrNmtqoaQkfB6ADB+WhH0mhGRlZ4ceO/H48ZPklNSUlHc6ujqm1UxMTU062trYde/C4Qj/S4n1crp37dylcwfWPj9+/PT22UDXiOkGbdfu/SmpqXTNrBluhgb6QneOuXHz7PlLdI1dty6dO9mKavz798xLUVevXItOTk5NS0vX0NAwNjZqYtGwZ49uVpYtRb1ePoWOBEKIlqamea2a3bp1FvViJe+bKIMH9m/erImoo1ivSFSbSkpKerq6Fo0bdupoq65eylwTaQeY4LCRRDWTqlOnTJD2KL7nL17SdyZNd5tYtaqx+ENYH2KzJhYug50Fd5Ph7dXS1DQyMqxtXsu6XWuhJwgx3WC1I+1YSkl9d+78pdibdz58SPv0OaNKFT0TY+O2bS179ehep465VD1h/UIoz3MH4/yFqOsxsfzHrO+gKDIPeJkPvBF7m3lsZlpt8EAnQsiNm8WVhgb6I4a5lNpzAAAoN9lZn6+e3iJ0k55Bje5OC6Rt8O61Q5nf0oRu6jXIU1vHSPKmCvLzCCkUuik/L1Pajv2XIeAOAABQrgoLC3ft3sd/3N6mLVO/fWfAP5XWbZn4UVr6x/0Hjohpzdy85jKPRXbdu7DqWQd27dJRVMD9/v0Ees/69erSAXd6k4qKCitKK36rUI8ePxHzirhcZet2badPnWDb3rrUpsQ7EhS6YtW6rOxsfjE5JTUm9lZQyDH3JfNHuQ6VudlSPxFCyIhhg92Xzq+srU1XXoq6ej06lik6OToIDbP+ys+n2zc2MqRDPOLfPUKIbXvrFcuWNGxQT3CTDB+WJH3OzMzc6b/v0JGjX758ZSpT371PTHzKf9L69eqOHTNixLDBglFR1supamwsGHDPy8tjvWRRbx2LlWWLNT6+dBaFrMxsv81rBffMys6eO989JfUdU1Ovbp0lC+cKbTYrO3vnrr179gbm5Pyg65+/eBkdE7vTf1/jxg0XL5jdrWsnUR0rn5GgqamxYN7McWNcxUf/xfdNlLZtrOiAu/hXVGqbNaqb+axeJuryhmwDTHDYSMLKsqXMAfcDgUEHDgYxRQN9/dkz3cQfwvoQNTU1bNtbm5qasHYry9urraXVo0fX2TPcateuJWE3BEk4lpLeJq/39TvxVyRd+eFDWmLi00uXr3qv8bXr3mXJorkN6teVsCesXwjldu6grduw5emz50yxa+eO9PlRKJkHvMwH3rxZfMl84oTRqqqqhJBYqnLc2JGamhriuw0AAADyhRzuAAAA5Sry9Lm/n7/kP7b+91/36JjYO3fjWJWSePPm7aixU/5vcr4XFBRGx8QOHjpm7IRp37/LPofifvyDJe4rmGg7Iyfnh6eX981bd8vWzVIcDgrt1XtA0lvhN4oqVMyNm737DqIzCShU+sdPA11Gb9m6iw6Gsjx/8XLRkmVu0+YWFAifLKMgVpYtZ86YQtccDz957foNwT3Xb/Cjo+0qXO7GDauFxqfiEx52s3Pc7LeTFW2nPXnyzHX0pOmzFuTm5pah+2WVk/PDa/maoSPG//6Jm5NTUoe5jl+3Qcg8r995gNGys3PCSwaaQ46GSdufnJwfGzb6ybVfJCs7Oyw8ootd37XrN/PzestAkrEUcjSsq50jK9rOcvHSlR69nPz37JetG+LJ69xBuxF7m462E0KCjx4ve7NiBrwMB+bn59++c4//2NjIcNiQQYQQHo93898Z7jo6lUePlP0aMwAAAMgGAXcAAIDyU1RUtNP/n+ntHA6HmSu3bUcAs0+pE+gEea/ZQKdw/T9w7vylfs7DZI5Z+6zdRMeGVFRUmMf5BQVyj2oJSnqbvHDxsqIi4QkQFSo3N3fW3CV5eXmKfqKioqJZcxZJGNyPiDy7ZetORXeJZca0yW3bWNE1Hl7erDj4/fgHBw6WmDY7e9ZUy1bNBVs7fyFq8NDRqe/eS/LUYeERg4aOllfgT2bRMbFbt/lXbB8k5LfNPyb2Fl3z+w8wxomTkZmZJT7rlNR3UZevStvOsbCTjx7L/2pZfn7+lq27xk2cXpZfC2LG0tr1m+fMXyrJFab8goLlK9cuXOyluN+NZTx30ATD65Gnz3/6nFH2lomwAS/bgXH3E5hLy2PHuGpoqBNCEp88Y/o5euSwypUrl7m/AAAAIB0E3AEAAMrPxUtX+InaCSFNLBoZ6OsTQu7eux/9b5ZYM9NqQjOA8zVrahHgv3W734aRI4ZwucpMfXZ2zsmIM4rseAV4/uLl+EkzsrNzpD2wsLAw4eEjprhh7cqXz+6vXbOcqXn4KFFe0375n0iA/1a/zWuHuAygUy5Ex8QGBR+Ty7OIMsDZMcB/68b13l27dKTrnzx5djcuXqFPTQi5EXuLNWHcxrrNjq2+F86GnwwP2rjemxW23r4z4OtXUcvhKASXq7zJdzUdbHr56rUfFTQsKChc6rGSnols3a719KkTBZt68PDx9FkLxExsFxQXlzBt5vzCwvKYds0fCQH+W9f5rOhga0Nv2rJ117O/X8jWbJUqesZGhoI/qtQVLGktXjgnwH/rnl1+nu4L6TwnPB5v0ZJldES4LANMSUlJsNus/Nc6OpVZO2hra8n2ooR+02X4+vN4vDVrN8rWh1KdvxC1cLFXqbtJO5YOHg7ZsnWXVD05dOSonyKvA8l87qB9+pxx+swFVmVeXt6xYyekakfyAS/bgUzqGD093VH/zmRnsrpraWmOG+sqVYcBAABALhBwBwAAKD9MonZCzWSnK+ms7oIMDPR729v1d+rjs3rZimUlcnArYl5kOfBZvSz5dWLig1unToRMmjBGhVtidZknT555eK2Sts137z8woZZKlSoNHNBPRUXFZVB/pvGcnB9fMr6UvfPk30+kt73dQOd+G9d7r129jN4aevwvuTyLKPXr1e1tbzfEZcDhwN39HB3oTY8eKXw8nLsQRRc7dWwfcmS/Uz+HJhaNW1u1GuIyICz0ED3BPDc39+y5i4ruFUutmjWWey6ia3b672OChnv2Bj54+JjZpKNTeeOG1crKyqSknz9zp0ydw4rfaWtpzZ097eLZE8+fxCXExQTu32XXrTPrwKjL1xQaWGTwR0Jve7sRwwaHHNk7aIATsyk/Pz/8xCnZmt0fsD3+XrTgT6+e3WXuaru2Vr3t7Rx695g8ccy5yDB6vYHXr5Po5R/LMsB0dXUEu+3Yx55ucO2a5awdjhzcI8MriotLoEcRI+rK9bfJKdK2dvVazOUrwpcwlcSVS5FvXz+Ovxd96IC/Q+8erK2hx/8KORomvgWpxtLjxCceXt6sFszNa65dszz2+oWXz+Jvx0Zt2rC6UaMGrH3W+/rRn7UMFHHuoIUeCxcaDQ8ODZMqOY/kA162A5k1z0ePHMYsHMLkkxk2ZBD/uj4AAACUMwTcAQAAykl0TOzde/eZoo1NW0LI48QnFy5eZiqtrcUF3GlDXQbQmVKysrLk1M1ypczhcLnKenq6lpYtvDwWngg7wlpS71jYSf7qiJLT09NlZprn5eXxY3CHj4Qys9r19HSNjY3k0X224cMG169X3P+4+wnllkF7+NCBdLEcxkNKyju62L1bZ/quC0KIqqrqyBFD6JoXLysg8ZHLYGfHvr2ZYl5enrvnyqKiopTUd5u37KD3XO61pGaN6oIt7NkbyMpQ0baN1bnTYXNnT7OwaKSlpWlkaGDXrXPg/l2+61axsjfs8t+XlpYu1xdUCiUlpcULZ9M1CQkPy7MDktPS0pzmVuJ+gniqq3/KADsSUjyT3dy8JhP05PF4wSGypPz2WbdZ5hsjuMrKKlyusZFht66d9uzy27LJR0enxIDctGWH5KsLlDqWVvtszM/Pp2uGDhl47nSY63CXWrVqaGioVzczdRnsfPrk0YnjR9M3APF4vNU+vjKnlSeKOXfQ3QumrkxYWDRiHr969UaShYWFEj/gZTgwJ+fHvbgEQoi2ltbY0f+si56fn3/7ThwhRE1NbdKE0bJ1FQAAAMoIAXcAAIByQidqV+Fy+XMzt+/cS+/TXuKAe0FBYVFRcbTCzNRUHn2sYK1aNj8UuFtbqzixA4/H2x0QKFUj2lpatu3bMUV3L+95Cz3cqdmOQ10GlL2rojRsWJ95zOPxxCz2KF/5+SUi+9XNFD4e6PAZIeTCxSuCGVd62HUNPryX+Rk80IlUBB9vL/oNib15Jyj4mIeXN72srlM/B6Hdy8vL2+lf4kvaskWz0OD95uY1BXceOmRgwG4/+p3Jys7es1e6AVx2VasaGxoUT2vN+CKf+zkUgTX3mf6+/BED7Nu376cizzJFZ6e+vXp2Y4pHj51gxaMl8TjxSaiUeUtEGTTAacPaEhO9U1LfiV/alEXMWLoXF3/1Wgy987gxrr7rVtG/wPnU1NSWeS6aM2sqXRmf8DDq8jXJeyKeXM4djGvXb7x+ncQUPZfOr1WzBlMsS64w1oDPkPheK6EH3rkbx5+GP2L4YH39KvxN9+MfZGZlEUJcBvU3Makqc1cBAACgLBBwBwAAKCdBh/akvEnk/7x+8YAfGti2ZR1TmfIm0dTURMLWdu3eR+eetu8le5KH34qZabVZM93omstXr9OvVBIeS+ZXqlSJ/zgj4wsdH7G0bDFj+uSy91OU9PSPdFEw9qQIBQWFdFS3UqVK3bt3UfST1i4ZcY6Oie3QxX77zj1Pnz1nKjU1NTp1bM/8CGaWKB+6ujq+61fRAVyPZavpO0tqVDdbvdJT6LHXrt+g1z5VV1fzXe+tIjqJua1Nu/FjR9I1Z89fkr3rMvnx4+fXb8Xp8hV0P4dcsL4vdFf/iAF2PPwkfRmgn2NvOrlTevpH2dIo+W7e/uPHTzn0jxCH3j162HWla6KuSBHmFjOWzpwtkeK8YYN6SxbNFdPUjGmTLS1b0DXy/WrI5dzBF0TdtWBmWq29Tbu+fXoxNecvRH34kCZbJ1kDXlNTsywHdu5ky//LwX3JfGZTm9aW/MrVq4T/TgMAAIBywC19FwAAAJAHwdzQoipF+fAhLfBQcF5e3u07cXQcp2uXjnaKD7CWm1GuQ9es9WUCJRkZXx4nPmnRvKnkLVhYNBo31nUHlRyfr4Otzd7dW7W0JI1xSOvp07/vxz9gitWqmWhoqCvouQghCQ8eBR4KzszMOnvuYsKD4nViZ82YQk9KVRCnfn0C9h6kc+akpaV7r/H1XuNrYlK1bRtLq1Ytu3TuIHQmuFCXoq6mpbOzr+TmilxUUCq27a0nTxyzY9fef5stzqrB4XA2rF+lq6sj9MBr0SXW7RwxzIVOpizUgnkzg0OOM9Pnk5KSn794SecaUrTj4SfpOCO94qJU9gQE/hVxWrDee4WHbA0KOhZWYp0DerTIfYApAp00xrJV87p1ateqWdPY2IgJjx4JPk5nNBLDsY995Jnz/Cwr799/2B1wYNaMKXLp5OiRw+jLS9HRNyU/VsxYulYys8q8OTNYy9KycLnKi+bPHjRkFFNz5Wq05D2RRNnPHYSQDx/SLlwofrsc+9pzOBwnR4et23fza/ILCkJCw2eXDO5LiDXga9UUksNK8gOVlJQE/4QQWgkAAADlDAF3AACAP8bTZ88XL13Oqhzg7Lh6lef/0z/YGhrqtc3Nn794ydSkpaUTaYImBw+HBB4MYlVW1tb237FJQdH23Nzc2Jt3PJevpjNIdO/aSRHPxTh77iJr/iyHw3FfMr988vY2bdLY02Oh4JKJhJAPH9L+Onn6r5OnCSEtWzQbNNBpxDAXVgJuQXfv3acXOZC7BfNm3oi9Lbi+5ZRJ42xt2gk9hBCSmvqeLnbp3KHUJ9LQULe2bkOHOFNT35dPwP3bt+8nT51ZvcaXrmzXtrVsrUWeOS+0Xi4B99R373fvOUCnN1FTU7NqVTwDWu4DTO5uxN6mp9vzA+tcrrJjH3vmjpPomNiXr17XrVO71NYsLBqpq6sd/TeZzC7/fcOGDjIyNCh7P1mXiLKys79/z2TldhdU6lhKppaE5XA4knw1rNu1rly5cmbmP7eMpKd//PkzV3yYXiplP3cQQoKPhtGXefi3LDRq1KBpk8bM4uRHQ8NnTJsk1WlXcMCrcLmdO5X+psl8IAAAAFQgBNwBAAD+bBcvXtFQV58/b4aBvsInNZebevVq00GTzxInui0qKlrqsfKAQLSdEJKZlbXUc+W2LeuVlJQIIVnZ2Q8ePhYTaZXE5SvXq9VoKHSTvn4V2aZAlgWPx9t/4PCvX7/cJo8vh/jjuDGuubm5flv96WToLPEJD+MTHh4JPubjvcyyVXNFd0kMVVXVzRt9+vQbTOcAadG86YJ5M8Qc9enTZ7ooYU5k02olckN9/PhJmp5Kbc3ajWvWbhS6qUXzpg72PRT67FLp5zxM1KaRI4aw3t7ffICFhBavq8mPs/MfO/btTad4Cgo+5um+UJIG582ZEXnmPH98ZmZlbd6yQy5ZQapWNdbT0/36tTgzzKfPn0UF3CUcS5mZmfT3yNBAX5K4OYfDMa1WlQm4E0LSP36k06OXncznDr6CgkI6gT4/zs5/3K9vbybgnpySGnX5GitXj1BiBvzkSWPFJJGT+UAAAAD4HSCHOwAAwJ8tMyvr0JGjjv2H/v38Zel7/yE+fy4RJdHU0JDwwE1bdrCi7XTm7hN/Rfpt8yeE8Hi8mbMXjRozmbXonxx5ui+okNzZKanvfNZtch09UUyMUo6mTplwNSpyzOjhxkaGYnZLTHw6drxbckpqOXRJjAb16/bqWWK1gwnjRolJyE4I0SqZhZ+OFYrBX7SwuBHt8kjlL0hHp/LKZUv5V5h+c40aNZgxbZJg/W87wD5nZESeLr4DoIOtDfN9t2zVvF7dOsym42ERdAojMUxNTcaOHsEUjwSF0rFjmf38mZvFGpASpw5nsMaShoYmfUnve2ZWUVGRJO18+17iGyT3VS5kPnfwRV2+So8iJyojfz9HB/pscqQMS6cSQho1rM9aRVbRBwIAAEB5QsAdAADgj2FiUnWAsyP/p01rS/qf/6Sk5Lnzl/Lz/woqoG6QZyksFH5IBeLxeE+f/k3XGBpJlFchKSl5s98OumbShDEhR/YyC6gSQtb7+p05e9Fn3eZz5y/9/Jk7YfKMmBtSZDSWhJGhwXa/DYMGOInZR9RSfoXSLPHXrKkFfzA49XNoUL9ExpJr12/4btwmeVNlYWJS1XuFx73bV0NDDkxzm2hl2VKFK+Qeyk+fM6bOmCemHW0tLWMjQ9aP3JPRc0tmgVAu7T4AY+MScd64+w9E7ckoKiqKu59A11QVfelFLiNBqOpmpqHBB1jLVEqlShU9wU9EfOBbNu1t2h4PCaxSRU/oVnkNMPkKDT2Rl1e8wAArUbtjX3vm8eeMjFOnz0nY7FS3CUwamfyCAp91m8vcU/Ls7+f0MONwOPpSfq0ExxKXq2xkVDyqc3NzBZM1CUp6m0wvN6qmpibqQ5eNzOcORlDJMDr9OZqamthYt2WKUZevvaWS6kjFsY990OESJyZFHwgAAADlDCllAAAA/hiNGtbfunkdU7weHTt6nBszd/J+/IPI0+f4cR/VkpN2v3z5RkT4nJFBF1XFzvYtH3fv3acnCHO5yo0a1JfkwKCQ43RcadOG1S6DnQkhK5YtWbjYi1/J4/Gmz5r/8+c/b1pOzo9lK9dePHtCtlnAlSpV0v03M4O2tnajhvUbN244Ythgff0qrD1VVVTp4pcvX4U2+OlziQQmqqqqQnfjc+jdc/rUifzHRUVFftv8164vDs/tP3B48sQxVasaS/ZSykpZWdnWph0/Rc/Xr98uX7l+LOyv6yWXVYyLS3ic+KSJRWOhLUybOpF5OYyvX79ZNC9T2p8yat6sSVh4BFMMCj42csQQ8WvhRp45n5SUzBQ1NTUaNWzAFBUxEjgcDn2xrUoVveWeix372oufvF+q/QHbW1u1KksLglhdbdbUwn3pfEkyO5V9gMkRj8cLpvLJEEKioq7eunWHKX4smYkoOCRM/BU4RmVt7RnTJrt7reIXz52/JPjLRFrRMSWuKTaxaCT0igWf5GOpZYum799/YIp79x+iT09CBew7SBetLFvK9/YLmc8dfG+TU6KuXGeK2lpam7eUuIL7/ft35jGPxws5GrZw/izxbVapovfPu62kVNu8ZsOG9Tt36mDXrXOpnZH5QAAAAPgdIOAOAADwp+rYwcZ1uAudLPjBw8f8gLuurg6957v37/MLCoQGWVhJGPT0dBXTWUkVFBQuW+FD17S2aiVhyOnps+K5jQOcHfnRdkKI63CXZ38/33/gCL/IRNsJIdpaWn4bfWQO+rS3aXs4cLcke+rolsiYLGpqJOvjkHz6p5KS0szpk8+cvcBkGc4vKHj0+ImCAu4JDx7dp+Z6129Ql46Z6unp8qfeHw8/OWvOYjp+9+LF63KIh8pRr57dPZetZoovX7329tkgZtXQj58+e3iuomu6dOqgqVmc10IRI8FlsHNk5DkmiRA/iF/GaLuCjBk1fO/+Q0wx6W2K0HVBf/MBdj069tWrN3SNqAVm+W7dvpuY+NTCopEkjbu6Dgk8FPzi5St+MUPKLOQsKanvtu/YQ9d07dJRzP6Sj6WePbqdPnOBKYaFR9h178IkshcUHRN7ILBEvq+ePUrPgS65spw7+IJDjtNjKSs7+yiVz13Q0WMn5syaKv6LJvNVK0Vc7gIAAIByg5QyAAAAf7A6dczpYkrKO/6DqlWN6fD616/fTkacFjz84aPEuLgSuS+qVavIpdgKCwtX+2xgpSYY0N9RwsPpyFSTkrGtZZ6LO9jasPbncDgbN6xu3Fj4qqfyVa3kapChx04Izf8THFJi2qy0H0fdurXpouJSWj99+re71yrmR1T6moHO/dq2saRrfv78qaAuKYiZaTXW0oj7Dxzx37NfaMbqtLR0t2lzWLObh7gMoIuKGAm1atZgzbRd7L78yZNnYg6pKH379Orr0IspZmZmTpk6Jzs7h7Xbbz7AgqTP3x109LiEe6pwufPFLuQruW/fvs9b4EEv58DlKvd36iPmEMnHkn1PO9b1PHePVax7Dhj34uLnznenh3rlypVZeXjKooznDkJIfn6++PC6oLS09LPnL0l1CAAAAPxHIOAOAADwB7t1+y5dNDOrxn+gqanRokUzetMq7/UXLl6maxIePJoxayFdo6ena1Eu0WehXr9OGjRk9K7d++nKenXrDB7kLGEL9Czg2Njb9CYVLreHXRfW/u1t2jn07iFTZ6XWto0VXXz+4uX0WQu+U+sH5ufnr/bZeP5CFL1bm9ZSzHDMy8uLj39I11Q3M5Wps6WrUaM6Xbx/P4GZWU/j8XhvqOQqhBCTkuHmP8KiBbNZd4csX7l2mOv416+TmJqCgsLwE6d62DvH3rxD79m5ky1rQrGCRsLoUcPoOeDZ2TlTps2VcInX8qSkpLRyhTudmv/ps+fzF3mydvudB9iHD2msT0cSYeGnBK8riNKnd892bVtL+xQsV6/F9OztHB1TIgI+aGB/ekFXoSQcS5qaGrNnutE1nzMyhrmO91q+5tu37/Th6339BgxyTX33nt556pTx8lqhoeznDkLI2XMX09M/SvvUMlx6AQAAgP8CpJQBAAD4I+Xl5fnvOfDXyRLz1hvUr8c8dujd4+69+0zx46fPo8e5VTczrV27lqqKyqs3SUlJyayptQ72PZSVS1lDUpTCwkLfTcJnoU6eOJZOqUE7eersk6d/Z2Vlv0lKik94xOqPiorKGm8vbmnLWjJaW7W6/G8G3otRVzdt2TFz+mQOh5OVnb1x03b/PftZ+0fHxIYcDWNNQFYQG+s2xsZGdEDnxF+RFy5erluntplZtfT0Ty9evqKjroQQFRWVXj27S9j+p88ZHp6rkt6WCD42aFBP6M6yfVi0dm2tTEyqMusf5hcUjJ84fcsmHzpK+OvXL6/la9LS0pmaSpUqNWtqUWrjv5uGDerNmum23tePrrx2/YZt515NmzSuUcMsNzfv0aNE1sR2QoiBvr5g8hkFjQQOh7POZ0WP3v2ZqO6Ll69mz1sa4O8n3zTZZWdkaLDca4nb9LlMzcmI0y2aN5k0YQxT8zsPsJDQ8HxqGeqOHWxEJWk5GXEmPuGfa2CZmZknI04PHzZYwmdZvHB2P+dh0vZt89ad2lpaX799f/Q4kb4gxFejutmiBbNLbUTysTRsyMBz5y9duRrN1PB4vD17Aw8eDmnZopmRocGXL1/jHzzMyfnBegory5YTx4+S9tXR5HvuIIQcCS5xC4LrcBfWDWSMTVt2MN/Q69GxL1+9rlunttA9AQAA4D8LAXcAAIA/xs1bd6xt7QghRUVFH9LS8/Pz6a16erqdO9kyxRHDXPz3HGAiVnwpqe9SUt8JbVxNTc1t8niZ+8bj8UTFcEe6DhUVw425cTPmxk2hmwghq1a421i3kbwPgwc6Bew7yCSWWe/rdyT4WK2a1ROfPGNFMBlLPFbWrVvbyrKl5M8iGzU1tSmTxrJSDOfk/Hjw8DErDQLDZVD/miXn+bLs2r2PP78yv6CAXr2Qr7VVqxrVzYQeKNuHRVNWVp40YTT9clJS3zkPcrWybNmwQT0dHZ0PaWlXr8WwVgTt69Cr7CtAVohZM6a8ev0m/MQpVv2jx0+EzrwmhFSqVGnHtg3m5jVZ9YoYCXy1atVYOH+Wh5c3U3P23MVtO/YILkVb4Zz6OZw5e4HOe756jW/TJhbM9/23HWCFhYVHQ8PpmmlTJ4pa9FVXV5cJuBNCgkKOSx5wb23VyrGPfUTkWam6Ry/wy1JZW9t/52YJJ5VLOJaUlZV3bPV1HjTi6bPndH1eXh7r7itajepme3ZtqVSpkiQ9EUW+544XL1/RtwJoaWl6LF2gpaUpdOe/n78MDimOzgcFH/N0Xyh0TwAAAPjPQkoZAACAP8bPn7lvk1PeJqckp6Syou2EEPfF84yNjZiihob6jq0bJA9qrPH2qlWrhtz6WjZaWpq7tm90He4i1VEmJlV9vJfRNe/ff4i9eYcVbbduVzxJNjc3d/LUOfQkWcUZP3ak5DPWm1g0LjWI8/XrN/54EIy2q6mprV2zXKFTm8ePHdm9a2dW5b24+MNBodt37gk/cYoVDK1uZurl8aeGpZSUlDb7+owb4yrh/oYG+ocDd9u2txa6Ve4jgTFm1HBW8He97xZRabUr1qqVHnTwN7+gYNrM+fQ38fccYJeirtJLI1Q3M7VpJzKwa9+rOx20jU94eD/+gaidBS2YN1NeK9+am9c8cfxw82ZNJD9EwrGko1M5NPiAqEsOglo0bxoWeog+VcmXbOeOoJLT23v26CYq2k4I6d/PgS4eD4vIzc0VtTMAAAD8NyHgDgAA8MfT0tJcsmiOYGqUtm2sgg4FmJlWE394ZW3tbVvWuwzqr7AOSqevQ68zp47Jtp6eQ+8e7ovnqaurCd1qoK+/Z5dfWOihQQOcmMr37z9Mcpudl5cnY3clxuFwdmzdIEkkqFvXTkGH94iJ+IhXo7qZ/45NDUXkk5EXDocTsNvPZbBEWZKbN2ty7GjgHzq9nY/LVV65fOl2vw2i7htg2Peyi/grpL1NW1E7KG4kcDictWuW0/sXFBTOmLWAlT77d2BkaLDMczFdk5aWPnXGPCZby+85wFg5u/v2tedwRP4/pa2lxVpxNyhE0qVTCSG1a9ca5TpU2h6yqKuruU0ed/pkaKNGDaQ6UPKxpK9f5cihPXNnT9PW0hLToJqa2uSJY44fPWhqqqiluWU7d+Tm5rLuDOjnKK4FG+u29Fn1c0bGqdPnpHpGAAAA+L+HgDsAAMCfqlo1k04d208cP/rS+ZPT3CYKnc5s3a511MUIL4+FTSwaCwaG6tQxnzl98rXLp5379y2XLgunrq5mbl6zg63N4oVzLl885b9zc1lS4rpNGX/p3MlePbvTC11qaWkOGuB0/kwYf5XUtWuWtaQWlb177/5i9xVleQkS4k88jzgR7NTPgV7ilelkt66dAvfvOrh/l4G+dMsJcrnK9erWse9lt2jB7KgLEXbd2SvEKoKqquqmDatDQw706tld6FRcDodj161z4P5dpyNCS41T/xH6O/W5GhXpvcLD1qYdK0O0vn4Vl8HO4ccO7d29tdQMMIobCebmNRfMm0nXfPz02W3a3F+/fknVTjno79SHtWrxzVt3V3mvZ4q/2wBLTkmN+neVCD4nsZFZQkg/xxKzoSNOnRGV3kqomdMn6+npSr4/n45O5Qb16/bq2X2dz4qbMZfcl8zX1dWRthEizVhSUVGZO3vatcunZ890a9SwPmtr7dq13CaPu3wxwtN9oYaGugw9EUUu546IyHOfMzKYopGhQaeOtmL253A4jn3t6ZrgkDBpnxQAAAD+v/0PAAD//+zdeXCU933H8efeQ6sTSSshCXQCEpc4LGNjDEZgY9d27GAb3609nf7RzqR246ZNptPJpJ52kmkznTSN08SJbyeNj+ADbMwpDOIQEpaQQUa3kNAt7a5Wu9Lu8zy//qGMx3GxCULSAnq//mAYPY9++32GHXb383z3+5NTizde/CxI0qpC45GNX9W1odz/lz/5ikMXtv+9Hw/0tlzwUPndz6Sk517Sas2nD9ZU/u6Ch4oWbyi94b5LWg0AcK3y+fzNLW2BQMCyraTExJzsrOn7Xv+VwO8PNHx2NjASTEudU1RY8KXR5JZlWZb1xZ8YhjGT5dm23dTc0t8/ODo66o5zpyQlFS0o/OJNgqvLSDDY1tbR0dF5rrMrGo1mZnozMzIK8nMzMryxLm26+P2Bc52dvb39TqczM8ObMy97cv9819gzYZrMwifY1aunp7frfM/Q8HByUmJmRsb0tbQDAHA18g117X773y54KDl13qZ7vnOpC+5689mAr+eCh7bc/8/xiZfwiS8yHnrnlQsXICva0z/vu9TaZi3eygMAMFskJSWuWrk81lXMnMTEhOvLVn/VUVVVVVX9qqMzQFGUBUWFC4oKY1jDFIr3eJYuKVm6pCTWhcycxMSExMSSJYsvd51r7JkwTWbhE+zqlZHh5UYIAACYzRgpAwAAAAAAAADAFCBwBwAAAAAAAABgChC4AwAAAAAAAAAwBQjcAQAAAAAAAACYAmyaCgDAJbCFGAuPv7H9wHO/3O4P2ooipae6Htu26cnH77JtW1G4kw0AAAAAwOxF4A4AwCWwLdHdO/TR3urQmCwrDodDFOTNveH6pZZlK4oc6+oAAAAAAEAs0YgHAMCfKho1VVV+Z8ehlvY+SxiKrOiqvGxxwfx5GbIsyTKBOwAAAAAAsxqBOwAAfxIhhKqq57sHDh055R+J2EJSFZGVkXjTmqW6rjFMBgAAAAAAkA4AAPCnGhgKfP/fXmpu65UUVVOFLMZKlxUUFeZoqhrr0gAAAAAAQOwRuAMAcHFCiGjU/GhvVd3pNtNWdE2XhJmZkXDXHWs9HhfDZAAAAAAAgETgDgDARQkhbNvevffIi6/tHA3bkmJYlq2rdlFe1rIlhbGuDgAAAAAAXCm0WBcAAMBVYCQYPnmqtW8oJIRTlmRFmB63sWrlQlXl1jUAAAAAAPgDYgIAAC5CluXfvr3//Y+qx6OKEJImybpiF+TN/fNH74h1aQAAAAAA4ApC4A4AwEX09A79/t2DgcCYrusej0tTRXJy3OOPbIl1XQAAAAAA4MpC4A4AwFcSQurpHfzBD3/d2+uTJM3tcLpdhpDCJcXZixbOi3V1AAAAAADgykLgDgDA1xA7d1VWVzeYpoiLc6UkJ42O+JKTXJvLV6enJQkhYl0eAAAAAAC4ghC4AwBwYbYthn3BxqbucEhSVDUjY46hKtFIaMni/NKlRYosy7Ic6xoBAAAAAMAVhMAdAIALs2zrTENb7ak2pyvB7XY6XWr/QE9SgmvLpuszM1IkibQdAAAAAAD8EQJ3AAAuwLbtQCD027f29fUH/QF/Xt58SZjR8dGcLG/xwvmKwgsoAAAAAAD4MvICAECMCSF9Pgxd/BEpVjPShRCh8Pir/7u7uropEo3OzfKWlS32DfsT4p0Pb9s0LztdEhLjZAAAAAAAwJdosS4AADB72baYiK1tW5imaQsRCo3LkqRpqtvtUFVFkiYy9xkdli6EEJJ0rOrTDz48Nj4mdFVZtKgwMhYKBoNlpQtXrlhoC6HI3LEGAAAAAABfRuAOAIgN27ZlWTZNq/5MW2Q88klty3jE7urqkyQ5OSmhbPWCxCRPclJcfl6GbdvyzAbcw76R7Ts+7u8LGZqxenVhckrc3n1VTkMv37DCm5Zk2zbt7QAAAAAA4P8jcAcAzDTbFpIkwmORio/rW9rO7a+o6erqj47bmmbYli0k2TCMd3ccMgx10aKczeWr1q9bnpTgURRFUWYi57Zs+2hV3Sd1TbaQi4oynv7WN59/8YPhwcEli/NKly+MRKKGoc9AGQAAAAAA4KpD4A4AmDkTs9r9gdHevsHfvXng2PFPh4d9kiRpipowxyPLsizJmq5Fo9HQWGQ0HD75ydmmls7qusbHt23OzJgTH+9Wprm3XAgxNOivqDg54h9L8MRv3ryys6vv2LETbrex5dY13vQUXeelEwAAAAAAXBipAQBghkw0ttfUNu2vqKmq+bS7s1dV5YKCzFvWr9Y01eOJUxRZSELXdNM0m9s6Pz5cf+7c0PDw2O49NS3NnVtuXfON229MTPRMd5977ammE1VNqmwULshZU1a8d9/xQGCktLRkzXUluq7N6Dh5AAAAAABwVSFwBwDMEEWRKw7V/fTnb3X3DUqyKC7J/c5Tj7rdzvS0FGliX1RZkqSJP6TwWOTh+2/70Y9/U1VzNjRmtrUPvfHWAdmW77v3ZqfTmNhPdTr4/MHfvLHX7x93uI0tm1ZHItHKo/WS0BYtyM3JSiVtBwAAAAAAX2NG96ADAMxOQojR0NiefTX/+sNXz3X2pqUnbt685hc//V5R4bysuemapmqaqqqKqiiq8geeOFdmxpx/+sfH77l7bdbcJEkSgUD08JHTff0+RZEnRtNMh8amzlN1rbKi/NntN9xavup3bx9oPNvtTcv49lMPKsp0z7MBAAAAAABXNzrcAQDTRQhpYmx7c3Pniy/vPH6iQZLlG9csf+zhW5cvyf88u/6atvE5KQnPfGvbmutKnnt+e1vbUP3p9v/4r7eeeer+3Jz0aahWhMPjz/7oddNWs7NTN96yorW950xDm8cT/+QTd075wwEAAAAAgGsPHe4AgGkhhLCF7fOPfna242f/82bl0ZMej/Opbz3wt3+9dWlJ/iXNZrnphqXfefqhgtw0y44cqzr938/vCI9FprbJ3baFEOKt31f09vtcce4N61csW5z7/gcfd3b2Fi3IueOO66bwsQAAAAAAwLWKwB0AMC1M0woEwi+9vvdffvhyTV3jjTeWfvcfHt+yuWxu5hxNUy4pcBdCLF9S+PdPb8ubn6ZrRsWB2kOVp6Z6nLro7R3at7/KElp6RsrNNy053dB2/Hid2+3aeu9ah6FN3xAbAAAAAABwzSBwBwBMMSFJUdMKjoZffv2D379T0Tvgv+cbm595+tGy1cWyLOn6JU8zk2XZNK2CgqyNG1Y4HXJ03Hz55R319U1TVbBtC59v9Be/fPdsY5esmDetKc6Zm/rhR5XBkdCa65eWFOfKssx2qQAAAAAA4KKY4Q4AmEpCkoRtj4bGfvWbPe++f9ChKQ98c9O2+zbEuZ22LRRlkjd6J3ZVvbW8rK2tu6KivqPLX3miubBwvtOpX27BQliW/WlD28lTHRFLy8xy3bhmUWNzV011U2Z6+kP3bchITxJCELgDAIDZzLKsoWFfNBK1LNOyLNu2ZVlWVVXXdV3X3XFut8sV6xoBALgiELgDAKaUEL7A6HMvvPfB3hOGoj2w9ZZHHyx3Oo0pCaznzcvYuGF1/am28/2ju/advHPLdZne5Mtc2baFLewTNQ19A8OSIv7ubx5csij3xz95s7d78Mm/uDM/b64QkqKQtgMAgFnKNM1oNOrz+Xfvqejr6wsEAsFgcHx8XFVVj8eTmpqalpa2ZHHxokVFmqZN4ruMAABcY3gtBABMGVuIkZHQr17atXPnYVVTt2277aH7yx0OfUrSdlmWhW1vuHnFocO1vXtqfUMj4bHI5abtQiiK/MnJxkOVdePRsfzCnLVly3fvr/m48mRKWvLK1cUOh0FrOwAAmM2OHT/x4Ye7W1pah4aGIpGIZVmyLE98bdG2bVVVDcNITU1dUFRUVlZWXr5OVdVYlwwAQCwRuAMApoCQJEkIny/4yuv7dn143FD0e++++aGtt8S5HVM7jEVVlZQUj6YqI8Gx557f+e/PPnk5814UWR4bj1SdaBgcCCYne37wvcf6B/2/emXHWCj04NbyFcsLLmcMDgAAwNXLtu133tnR0PBZc3NLT2+vJKSEhIS5mXNT09KKivI9nriGM43jkfGAP9DX1zcwMHD02LHOzs6urs677ro9NXVOrMsHACBmCNwBAJdLCCGE5A+Mvvjarnfeq1Rleeu9Gx5/eLMnzilJU9ofLsuSJOXkpDtdRnBgbGjQP/HokwvchZAkSZw/P7hnb00oFLllzfL0tOQ3tx/q7uqel5O+bu0y0nYAADAL9fX119V9ev589+HDR/r6+hRFmZuZlZ+fW1q6NDk5OT4+wetNcziMosJC0zTD4bDf72/4rLGurn5ocPDQoUpd19evvyknJyvW1wEAQGwQuAMALpcQks8ffOG13dvfPWjoxoP3bXzwvg0ul0OWp3irUUWWLctav27V2+9VDQx29fQMnOvsz85KFUKaXOQuy3JdfXNvry85JeHWjWX9g/53d1Q4ncam8usL8ufK8uSWBQAAuFqdO9d15MixiorDPT09Dodj+fJlOTnZXq93/vx5S5cWf/HMoqL8L/y9KD8vr7m5pabmk4MHD+u6fvPNazMzvTNe/uzl8wX8/kAkEolGo9GoaVmWZVm2bQkhZFlRFFlVVVVVFUWVFVlTVV03NE1NTExISkqIde0AcK0hcAcAXBbbFv7A6AuvfvTBrmO2Zd9979pHtpXruqpp0zS+U/bEuQ1DU1V5fMzeuev4Xz15hySJybTSy/LBw7UvvLJT0/TFJfmLS3J/9JNXhwYH8/NzbihbLMsS7e0AAGCWEEIEAsFAILB7977du/cHAn6v17tyZemdd27JzZ130V/Pzs7Mzs4cGSlzOZ2VR44eOnTEMIxNmzbEx3tmoPhZyzTNQCA4EbKfPdvS2NgaCARGR4PhcDgSiUYikYmZ+5qmqqrqcDgcDqeu64qquJxOj8fjcDgLCnIXLMhTVVXTNE3TPJ44h8OI9WUBwFWPwB0AMHlCCNM0Tze0HTlaNz4+9s1vbHjikVudTn36ouqJrnO326HrmiSEw5j8RwIzap6qbzx/ftDpdG8uX3Hq05aa6rOqqpRvWF1YkK1pvEQCAIBZQQgRiUQPHjy6Z8/exsYmVVUWLSpev/7mjRvXejxx0h/mBwpJukg7Qny854knH7Vs++jR40ePViUkJJaXr5uha5hlbNu2bTEwMPTRRwe7urq6u7v7+/tHRkYikYht25IkGYahqopti4lNboUQqqYpimJblmVZiqJM7G3rcrmSk5NTUlJSU1PnzJmzdu11eXk5kiTJsszmtwAwaaQJAIBJmvjo1dza9dJr73f39D+wddOTj93u8TineI7Mhei6KsmWaUuRSHRyKwgh9fQO1tY1WZa8orQow5v0s19u9w1Hrrtu4do1ywyd10cAADBb9PcPvvHGuzU1Ne3tHZ54z6byW7Ztu9flcrvdzokT+voG6+s/03V91aqlcXGur1/t/vvviUTGak7Wnj5zmsB9mlRX1x4+fKytrW1gYDAcHhsbC8uy4nK5vN70lJSU9PT0lJSU4uKi+fOzg8HRmpr6SCRqWZZpWZHx8VAoFAwGR0dHQ6HQ6Oioz+cbGhpqaWlRFOXw4UNJSUlpaWl5ebn33HO7zltiAJgU/vcEAEzGRJdTT9/wfz739qnTLVvv3vjEY1tmJm2XJEnTdEmSZUnEeRyTW8G0zF+/8l7d6RbNEVdaWnzqdHNDQ0ve/JzvfvuRvPnembkKAACAmOvt7a+srKqurmlvbzcMo3zjhrvvvj0tLfXzE2pr6/fuPdjY2JyYmLBwYe5FA/fExITFS5Z09/Q3NTZt3/7+HXfcZhj6Bc/s7x/8rKGxvb1jYGAgPt5zw43XFxcvnMpru+ZEo2ZVVe2ZM2fOnGno6uoKh8cURfZ6MzZuXJeVNVfTdMPQHQ6H0+k0DCMxMcHjcZummZSUNNERL4Rt27ZpmqZpRqNRy7Ki0ahpWkLYQoiKisqm5pa29o729o7GxsamprMpKSkZXm9JycKiBQWxvnQAuJoQuAMAJskWouaT5pN159JS5yxfXuiJc87Iw8qSJEuyU5L1OamOR7aV27Z9qRNshBCmaX1S3+4Pmwvy04YC0ocf7BfCfvb7D+fnZggxTZUDAABccc6f7z548HBra6vL5bzttk233bZx3rzsz4+eOHFy1669VVXVw8O++Pi4ysrj69bdkJo65+vXXLSoqKe7Z/+BigMHDhbk5xcW5btcX36j2NraXn3iZE1NbUdHRzgcdrlcQ0PD4XB45crSqb/Ia4LfH6iqOrlv36HW1tZQaNTlcixYUFhWtjI5OWXFimUpKckX/C1N07ze1Ase+pI4j+f8+e62to7Wlvbh4eH6+jOapiYkJLS2tS3pKMnOzi4qymPODAD8Kf4PAAD//+zdd3RUV54v+r1PqBylUs5SKSIJCUkIEYRIBmPctLObnrZ7uvtOr5k103175t535856b9ZN897Mnbnz+s2anrs6B7udscEkAwYjJFAAoYxyDiVVqUqVwwl7vz/KTdM2KGCBAP8+f+Gqc/b5nfrDnPryq9+GwB0AAMC9iAjipYaOn/z8Q61asbdu8+ZNRZQihnkAjeEUIRoMBoksI3Qv0Xi0N7++oXPe4dHrjBUVJUT0hkOhqooiS6yJUgTd7QAAAAD4kpiZsXV0dA0ODlAq79y5/fDhg5mZGdG3KKV9fQMnTpxpb+8IhUIqldLj8Vy+3Gi1Zi0buCfEx5WVldhstqtXmq40NsUnWD4TuI+OjtdfamhtvT4/b2cYxmw2u1yuq1ebZUJiY2MzMtLu1w0/spxOV3t758mT5/r7B5VKRV6eNS/ParVm79q1ZkN7SkuKSkuK5uYcw8OjNtvc4qJrfHzKbne0t3eOjo7n5OQEAtVxcXEWS4xGs8yvHAAA4EsOAncAAACrRikaGZ197e3zC67FjcV5B/ZUajVKhr1fG6V+5tKUokAwhDFSqaLf3FYdkLtcvjfe+TgUlLNzshLjjD/7xbFYk+LQk9ssFiOlFObJAAAAAODLwO8PXLrUcP78RYxRdXXVd77zamxsTPQtSZLsdsdrr73V09Or1WoLCvJYlmtpaZ2ZmXE4FiIRQalcZuP6/PzccDjc0nLtRnv7tu1bYmLMPM8jhAghLtfi8eMn29raw6FwUlJSYVGBxWJpbbk2OjrS0917IS7uW9/6o/t+848Uvz/Q1tZ+7NjJ2dk5lUpZWFjw3HNPV1aW349rJSbGJSbGRf98/Xpnb2/f8PDw9PTM1atXx8bGNmzYUF1dYbVmQeYOAABLgMAdAADA6lBKRVE6fa51ZGwuNyftr//Dy6nJcfiBptQ0Eg4jTLVazarPpJRS9PEn16enHbLEsKz2k/puBUc3V20o3pCN0INp0gcAAAAAWH9XrrQ0NbU4nc7i4qK///v/dvvT3Py845/+6V96e3tjYmK+/vWXDh06MD09MzIy6vV6rrd1JCYlFRXmLbu+Wq1OTk6empxqabmhNxgyM9MQQsFg6Kc/+WVLSyvP82VlG+vqdm7bvhkhZLHEfvD+sZGRkZGRkft3y4+opqaWU6fOTkxMqlTq2tra5547lJqa/ACuW1m5saKidHh4vLGxubu7e35u7rLTOTc3t2dP3datVQ+gAAAAeERB4A4AAGAVog3gb7x76fT5Vo7ni0uy01PjJUnm+Qf0FwqlNBIRRVkiVFaqlmmtutPpSBRF27zD5QnwSnPAH3S7ZuNjDXt3VSbE3XnwJQAAAADAY6m7u2d8fEKv11utOben7b29fW+++V5/f39qauqRIy9s3lyJMeY4LiYmZsHpmJiYcNgdaAWBe0ZG+r/7zqt/93f/OD4+7l50o8y06enZ9979oKfnplKpfPbZw7t279RqtdFLb9lSOWezud3u8bGJt9764Omn999Da8VjqaHh6uXLjTMz07m5OT/4wV9otVqj0fDAro4xzshIsVierKvbeunSlc7OrrGxsVOnQl6v98CBPQ+sDAAAeLQ8iJ//AwAAeGxQisYn5k5/1BIMCtlZSd98eR+l9IGl7YRQlmXPX2h1Ob2UEqWSR2h1I9cpJZ3dQ5caO2XC8rzCH/TIJPzUwertNRsobJYKAAAAgC8HWZZbr90YHh6JRCIFBXn79++99VZj49Vf//q3XV3d8fFxR468WFm5yWDQI4RYlktISGAwY7fbF92LK7mKUqlISEyIjY11OBZ8Pt/09OylTxqbmlpCodCzzx3eWbcjPj7uVqqu02nrdu3YWbcjEAw0NzdHIpH7ceOPos6urrHxcaPRtHHjxoyMNIsl5oE9e0cpFAqz2ZSenrp3b92rrx7Jz8+12eZaW693dfVJkvQgKwEAgEcFdLgDAABYKULIzKzzl6+fm5i0JyTGPPPUdpNR92AnnlOEkMvloxTxPGc06FZ1MiEkEAy3tPXNOdwywYGQXxDFTaUZT+7bTAiFYTIAAAAA+JKQJLmtrcOx4FBr1OnpqdnZmZTS8fGpwcHBc+cu9PX1Z2RmPHXwwJYtVTqdNnoKx7Hx8XFqtdrn8wX8/hVeSK1WHTz4xPHjp69fu9HXN3DjRqfP53vu+a/W1dUmJMR/5uDU1JSCgrxLlxqGh0fq6xtra7fdmim/jgghI6PjwWBQEiWEEMexKpUqOzszOpL+vhJFsaOzu6+vX5Lk8rKCmprq+33FJbAsm5aWnJaWPD/vsNsXJien6usbrdYMjoNYCQAAPgv+zwgAAGDl8ODw9I32YYZFe3dXHHqi6gH310QFgyFJFLU6zYvP1K5qj1NCaDAYHhie8gclzKkoFbU6btfO8pRkCyEE9koFAAAAwJcEpcTpdAqCoOAVoVB4cHA4GAw2t7RduXJlYWEhOzvr4MEDTx3cf/spSqWysDD/atMVm21u5e3nKpXqif17rlxpaW6+HomEZVnOyEh/8YVn9Qb9HY/X6/WJiYnT0zMffnjaas1+8IE7IcThcAYCgXA4LAiCJEmCIFxra/e4vaIoIIQUCoVOp6uqLNfpdAajITY21niXe/niwuHImdNnbbb5lJSUkpLiggLrfbrQquTn505Pz16+3NDZ2SmKL613OQAA8DCCwB0AAMCKSJJsd3jOnL0+P+/Ozk2ursxbl7QdIRQIhCOCaIwx6XTqVaXklFJJksOCzHAKShmlgj2wt+orB7bJhLAMzFgDAAAAwJcFxthkMrEs6/V52zs6bXPzCwsLDoddkuTCwoInD+zft2/XZ07RajW7d+94//33Z2dtoVA4FAqp1eoVXi7GHBsOhxcXFzMy0nfV7eIVd92Gx2w25+Va+/sHJicnHY6FSCSiVCrv/T5XJhQKi6IoyZIsyZFIpKGhZXxi3G63ezyeUCgkimL0HxhYlmUYhlJKKW1qatZoNIWFhTVbNpeUFCkUCrVaxazp86QkSU6na3BwiGHYvLz8zMzMNVz8i8jKSi8szLtxo93lcvp8Pq1Wy3HsehcFAAAPFwjcAQAALI8QyrJMz82J/oEpXsF895sHqyvy16WSUFjweP2yJMRbDIrVJP6EUJ7nhoYnbbOLVMayFExKTdi9vUyjVkLaDgAAAIAvFYZhUpKTtVrt3Nxcb2/v0NCQRqPOz88vKSnZvq2moCD3bieq1GqO4272DVy92rpnz84VXk6hVDIMq1KpCwrynn3+0BJDSDIy0vY9sbu752Z7e/vJk2d1Ov3mzZtWfXur1NJyY2hoeNY2Oz8/5/F4fT6fLMlKpdJoNCYnJxuNRr1Oz/Ecy7CEknA47PF4ZmdnFxYWWlpaxkZH0zMyioqK9u6pvTV+Z01MT8/+6ldveL3+tLT0TeWlVmvmGi7+BXEcp1KpRFE6duzMs88eSk5OXO+KAADg4QKBOwAAPOaibTgIIURRdFdQhsGrHZ+CMXIu+k581Lqw6N+5o2jblqK1L3Q5lFKEcXfv6MDwDMfgnTWFZtMqZrhjjDzewLkL1532oByKKJXi9qr8jcXZLAtpOwAAAAC+XDiOq6vbFgz6e3pvhsNhg8GQlZVZU7M5xmzW63Use9eGZb1ep1QqA4GAy+Va+eWcTmc4HNZoNAajaemR3xhjnU6bl5c3MjIyOTnpcDhWfpVVGRubvHGja3Z2xuFwzM7a/P4AwzJqtTo2JjY7KzsuLq6kpCgjI43jOY5lWZbFGCOEEaKEUFmWBEG43NDU0907Pz/f3t4xODA4Njry1a8eysrKXKsKg8HgyMioLJPMzMzY2Ni1bZ//ghiGYVmWECIIAiFkvcsBAICHDgTuAADw2Po0Z0f4C24HGl1nZHS2t39MoWSeOrBFoeBWNTx9zVDqdLkXnF6FQmE26laelUdvYXxitu3GgBAWMJKKi6wvPbdHo1bdz3IBAAAAAJbX3tE1Pj6Zk5NdWvKAehowxmazaWfdjtLSYkmWlQqF0WhISIhfdgNMnU7H83wgEPB4vSu5UCgU+ujMxf6+gWAwxDBMMBhc9hSj0bhnT21Dw2WPx9Pe3pmenlayRh+LIIiDgyPjExMup2t6enZ8fMLn88mybDKZdu2qtVqzlUqlQqlQq9QajSYuzmIwLNXbwfOKkuKi4eHRpqbW4eHh5uZrXq8vPT0tKSkpOzsrLy/7i5Q6N2fv6rrpdrsZhi0rK05JebhayAVBCAQCHMdt315tNpvWuxwAAHjoQOAOAACPLceC2x8IfnyhdWBoOuwXJUkIRXxqtbK0NP8bRw4ZDCv90SvG2OXy/utP3hfCkdRUi06njr54P2u/A0qRKMoulzcUEkxGnVqjQmilNWCM3R7/v/zvdx12L8JsYoLxb//zNzMzku5rwQAAAAAAyxoYHP7444tDQyM1NVseWOAelZqSnJqSvKpT9Ho9z3PBYMjn8y17sM/n7+rqPfHhmWAwZDKZMMbBQGDZs1QqpdWalZSUtLjoHhgY7B8Y/OKBu8vlnp6embXZ2tu7JicmI5GIQqG0WGIrKjYqlUqLxbJxY0laWsqq1kxNTU5NTU5LS7VYYkdHx1parnV0dPX29iUkJOTl5dodJZvKN2o0mnsr2OFYGBgYFgUxKzs7MzNdr1/Fzzrvt/HxyZs3+wOBQEZGemFhnlZ7j/cIAACPMQjcAQDgsUIpRQjb5hY6OgdOn2scHBr3B4LhkEQljmGQLAssy4yMzuRkp+3fV7PC0FyS5KbWnulJh1ql2F6zoSA3jRD6Bbvm7828fbH12oAk48SEmPS0+FVl/j5/cHpqgRBWoSJ7dpVnZiTctzIBAAAAAFaqteV6W1vH4uJiXFzceteyPINer1AoFhfdoVBo2YPn5+0nT340MzOzdVsNy3CTk5P+QHBuzh4fb1l6QArLslu3bpmfn3e73auaXfN5s7Nzbrd7eGSss7N7fHzc4/GkJCenp6elpqYUFhZUVpZ9kcURQnFxsbt319bVbTeZTC0t16ampicnJ+bmbAODA+Fw2BIbq1arY2LMcXGWVS0bCoXci26GYXbs2PqQtJATQhYWXG63u7Gx6fr1G2q1aufOWsXd978FAIAvMwjcAQDg8REdnGKzOV5746PzF5sdTifCiFewOpNWq1Cr1aoFx6Lb7Xe5AkePXqyuKjaZ9Mtm7pQiSmnD1e6AP1JQmLC9ppjn+XVJ2ymlkYjgdvsYhk1JjUtPjV/5iTIhZ85dnZ11Iqoym7V7dm3i+XWaigMAAAAAcBun0xUMhCVRts87QqGwUqlclwetFdLpDQqFihIkS9LSR0YikampqdbWlpTk1CNffy4UFE6cODMwMPDxufrnX3xapVpqrB/P81/72vM3b/bduNHh9XiDwZBGo15VnbIsh0JhSRI//PD0tettTqeTY1mj0VBUWPgnf/LHqamra2ZfFsMwzz9/2Gq1NjW19Pf3ezzu6anpf/qnHyoVyvT09O3bt+7bt4thMMNEh58zHMfxPL/EgqIohSNhtUb91FP7jEbD2la7KqIoSZIky7LfH7h4seHatesLCwsqlbKiovzpp/evY2EAAPAwg8AdAAAeE9H4uK9/7K23z507f1UkVK3RW3NTMjMStDrdrm3lBbmZP/y3dz76qFGKkIH+ydHR2YqKgmVDZ4zRnH1xbt5LEZuTk5aZnsSux5ZNlCKWZewOl8vpJbJkNhkxxitMzDHGdvvi5YYOSliVmj+4f2vJBqskEY57iPaeAgAAAMCXk8ft83r8kiS5XJ7jx88++eRuo1G/3kXdlUql4TkFxgxCyzxHXW1qfu31N1Vq5bZtWw0GQ1ZWzMTE2MBA39T0hCyvaJvNhIR4lUrV2dnz7rvHXn31a6uqc2pq9sSJMz09PTbbHM/zWZlZW7duOXBgD8Mw6vu2hU9xcX5+fo4sy06n6913j4+Mjiw4FsbHJ6ampo4d+1Cv18fGxsbHJyQmJubl5VRUlC6xlN/v83q9SUlJ675Xan//8M2bA9PT0xMT4wsLTo7jMjIyamu31e6oWd/CAADgYQaBOwAAPPIoRYSQYDB8/OSlt9/5yOMJaPV6qzWrtrastDgnLtbAMJhjGa1G9RfffW5seLyne1QmzLtHL1RUFCy7uCjJ5y5eH5uwx1r0e3aW6XXqdWkKp5T4/KFr1256/H6lRlFdVaBQcCsfidPY1DM0bFNq1CazpnhDjkLBs+zD2zsGAAAAgC8DQsilSy2Tk7OiKFNKQ6HwxMSkKIrrXddSKitK6i9dGhoastnmr13rqKzceMfnsZbW65cbrvj9/lxr7oEn98TEmDiOValULMs4nS5CVhS45+cX9PcPjY6OdnR05efnlZUVq1TKZc9qbb1x40bHyMjI+PgkxjgnJ2fPnp1FRQVGo+F+T0LnOC6666xSqfza154LhUIdHT1DQyMLCwsejzcQCC4uukdGRhUKRUOD4dSpeLPZbI6J0Wm1arVaqVSyLIsQYll2bm6utbXV7/clpyQ9yJ9jdnf3u92eUCgUCAR8Pt/CwkIoFPJ4vOFwBCHEcXxhYeHu3TtSUpLNZpPqvv27BQAAPAYgcAcAgEdbdIyMx+M7+v6l3759OhgMZGSmPv3Uri1VG7x+7wcfnnMsLKoUigSL/quH9+VkZ1izU7q7bmKMC/PTVrL+vH2xoak3GIpkZSbGxxkZBq/LGBZKKaLIHwxGhEhMnKW4KHOFJxJC5u2Lp043BfwSYqVNm0o3lljxOt0FAAAAAMAtlNKhwRGPx4cxRghHIpG5uTlpuVEt68tkMkY3AvV4vDMztoqK0js+Uw0NDY2Pjaelprz44vMpKUnRGJrjOZZlPR539PF1WSUlRePjY3a7fWJioqmptaDAerfAfXHRMzAwPD8/7/V6enr6pqamZVlOTk7ev3+3xWKxWrNjYsxf4KZXjee5lJQkhJBOpy8szA8GA6FQOBKJtLd3z87Oejwel8vldDqVSqVSqeR5nuM4pVKpUChkWcYYe71eu90uCILdbn/33Q9UKiVCGCHEMAzLMgghQihCNDqeBmMsy4RSghCOitZw66GdUhT9AyFElmVCCMYIY0wIkWUSfcqWZVmW5ZmZuVAoJIqiIAiCIEQiEaVSaTKZ8vPzcnIylUqlVqvLycmEXVIBAGBZELgDAMAjjBCCMe7sHDh56vKly73hEN24sfjbf/x0UUHWyNjkP/3wp0NDk4jwDGIyUy27amsQQkajIS01fseOyqef3rnsSBZKqc8ftNkWWY6v3lyUnZm0LnPPKUUMw8zaHP39o4IQUWuUFKHoF4+lEUIxxsc/vNTTPcaySsIJW6qLzCY9A2k7AAAAANYbpcjtXhSEiFarYVkmFA7Z7XZZfqgDd4QQx3EYM5FIxOfz3fGAzs7ugYFBlmVLSourq6tuvc4yTDRNnp6ezcnOVC7Xrp6YGLd1a7XL5aq/3NjZ2XnzZkVJSdFnutQnJ6enp2cmJiZ7ewempqb8fh9COCsro6ioMCMjfdeuHes7kiUxMS4x8fd74SYnJ8/NzXs8Hr/fLwgRWSYzMzafzy8Igs/nwxiLoiiKoiRJDMNotdpgIPjR2fMYY0QRQohhGJ7novk4pZRhGY7jMMKEyIRSBmOGYaJJOsKYY1mGYaPP7QzDUEpkmUR/WxAN7ilF0ZieZVmGZXieVygUSYnxer0eIcQwmON4nU4XE2POysrMyEhdlw8QAAAeURC4AwDAo4pSShHq7Br+f/7nL2dn5hisyMpM/Od/+L5eryaElG7IUykwkSOIkrTUtK8+u39jeSFC6NVvPP38s3vNZr1SqVw2bccYf3iywbUYsMQaY2IN0Z6a9UAxxpOT8/PzHoZhkxJNPM8ufw6lGKO33zv7xltnIwLLKXBSotFs0q/7KEwAAAAAAIQQQjQQDMiylJWVYTDo2zs6nM4FWZbX8ALBYNDlWgwEgtHWZgZjtVptMpvMZtM9r8myLMNgURQDgcBnWtUlSZ6fn3/v6Aejo2NFRUXlZWW3v8uwLMuyoVCou+tmfHzcsoE7QmjDhkKPx9PV3TMxMX7mzDlewW8oyuc4zuPxeb2eUCh05UrL9es3bDZbtDc8PT01MzNz166d1dWV93yD98+GDfkbNuTf/kpXV9/CgjMQCASDQUGIiKIYiUQEQZAkSZaJKIkul4sQmRCKKMUYsyxLKYom7Cjaxo4wRRQhzDAMgzFFlMgEY8yyHMsyGDMYY4bB0Wb2Tzdtjb7HsCzLMAzD87xGqzUajSajsbR0Q1JSwjp9PAAA8PiAwB0AAB5JlFJBlNrah/71Jx8Mjc7FWQybK6z/4Qd/rNOpKKXRTPkf/u5vjh47TSn+9qsv8jwXfdFo1BmNOkrRsk3e0WN6+22U4Mz02JcObyOErGNaHQhGwhGqVCiOPLvLZNAiRJdtcp+3O8993Oz1U8TwFIe2bymv27rx1u9qAQAAAADWVzAY4BVc3a5tqanJff39Dsd8KBReqycuURRv3hz46Mz5vr6+QCAQDocVCkVOTk5dXe0T+3dHB47fw0MRyzIYY0kSg8EgQr9P3Amhbrf7t2+809bWlpaWtrmqYuPGkttP5DlOpVIhhNxutyStdFS9yWTKzs4aGRmpv1zPciyl1Gw2NV29dvXq1ZHREY/Hw/O8Xq83m82FhYXf/e63EuLjll/0oVFaWrjeJQAAAFh7ELgDAMCjh1Iqy6T1+s0f//L48PB4ZmbKK0ee3F5TbDIZbj8sId7yZ3/yyh1XWEHaTjFG9Ve6nIteBc+kpsSh279RrR4hf3A2w6zi2x3G2OcPXrna6fOHTDF6g8EYXZBh7hqdyzKxOxZ/8esPb/ZPijKDsaTkUGxMtJlr+aQeAAAAAOB+oxSFQgGLJdZsNvE8p9Np5uaks2cvqFSqjIwV7bWztPPnLp44cWp0dCw6acRgMAiCMDg4aLfbu7q6q6qqNm/eFBO76uHmSqVKqVTKsiSKwu2vLzidly5duXbtularO3z46R07tn3mxOizIM/zq7pcbm7Oyy8/PzExOTk50djY2NHRwbFsMBQSBYFQkpCQkJaWtnXrlicP7ON5Tqu9v9uiAgAAACsBgTsAADx6MMZdPcM//uXRwaEJnU6zubJod90mg34t9y+KDoK80tLtdDq1Gt3BfZtlmdzbSBlZJgyDP5OwU0pvdeKvBCWk++YYQYzeYIqJMWGMo2n7HauKtv9/fKH9k/quiMAyLEZI4jhk0GsRQpC2AwAAAGDd+f2Ba9c7XC53Vla22WxmWazRaDDG09MzgUDwi69/8sSZi5/U+/2BoqKi7OzsyqoyjUbT1dV7o619ZmamqanZZpvzeD1bt1anpaWsamWtVqPRaHw+nyD8QZe6w+6or68PBALl5WWpqanRZvbbybIsCIIsy3q9nmNXmkXwPJ+dlfVXf/m9n/38l7OzNkoRy7EWS6zJZIqPj6+q2pSRnh4TY46NjVnVXQAAAAD3DwTuAADw6LnWdvN//vD1ielZjUa9ZXPZ9//sBbVasbY5MoOx0+Xt7hmORIS6HXmZGQmr6klHCFFKCaXRCZOOBU/PzTGEsCRJCBGlki8rydPptQit6BfTFKEL9W1zdiehCn8gfPKjq4kWPUZMUpKlfKMVIcqyfzDS3e8PXmntudzYGQqR1LS0yalZURBUSjUL09sBAAAA8HCIRCLDw2ORSKSkpDArK91mm9PpdJTSBaczHAl/wZXr6xsvXbocDoU3b66qqtpkiYvLzEznONZiibXmZI2Mjp396PzExET9pcuSJG3duiUrK33l66tUaqVS5fV6IpHIrRdHR8fqLzdOTExoNJrt27empiZ//kRCiCRJlNINGwq0Ou3Kr6hWq0pKNrz88gset4dSyrAsz/MatcZg0KenpxkM+pUvBQAAADwAELgDAMCjhFLq8QZ++qvjA0MTvIIvyM/5/p++oFTyaAVTYlZ1FUrRjY5B14KX5/mykiyTUbvyEZ+UUoSQIEoul9/nD164dGNgcLy3b1QUiSSJhEhGo66qoqR4Q86+XeUGvXaJxnlCKMZo3r74xtvnIhGZYZHDbv/Zz99DMqNUKvVG9Stf3/+Vp3ZoNapoedGdu1we349+/P7czGJBUW5CYvzM7IxIqdmo37e7Gga4AwAAAOBhIIqSfd6OEMrMTI2Li3W5Fk0mE8MwbrdbiAjLnn43Xq+vo73z+LGTwWCwsrJiz566gsK8W++mpCSnpCTn5+cqFIpPLtZPTU1dunSZUqpSK5MSV7pVplKpVCh4WZbD4XD00Wt2dq6hoamx4aokSbm5uSXFRTHmO0yqkWVZFCWO4zKz0tTqz/a/L41hmG1ba1Z1CgAAALBeIHAHAIBHCaX0Wlv/6JgNYS421vzE7uqYGCPGS4XI0fg7ajVZMxVFURAJpYhl8WrSdkQpci36Llxsu9E5Mm1zDA6OKRQKSijGjCwjf1AMBLxnXG1Xm3vn5hxHXthrNus+06IeJcskHI60Xr957kLr0MgMw/KSJCh4SmUii6wsMV5/8Ge//jAtNX5rdSnDfBq5I4QaGntss66k5NhXv76nua1XlkWMGZPJGGcxRefbrPhDAAAAAAC4LyRJnJ+fZxiMMYMQ0ut1mZkZCoUi4A+I4ko3FP2McDjc3z/45pvvzszObKmurtu14/a0/ZaY2Jhnnnlao9Ee++D41ORkQ8MVnV7/1cMHV3gVtVrF8wpRlMLhMELU6/U3NDTV1zfa5uYSEuJra7cbDIY7niiKoiAIWq0Gw3w/AAAAjzUI3AEA4JFBCHW5vJcb2uwLi5hh4y2movxMjCjD3CGtvuXeGropRZGIKIiEY3mOW2r9zxAl6fRHLRcvtbXf6PcFQ5yKiYkxpqUk7ttVYbWmqlXKn/7yxNXmTn/AE46Efv36aULk737rsEKBPp+5Mwxz9Ngnb713dnJqgWKeEDku3mTNSn7u8LbTp1rabgwgytvmPB+eulKYnxVj1mPMYIw/+rjlzbc/ZhFXXmrdWJx9/NR5WZZYVqVRK+/hcwAAAAAAWHOUUlEUvV4PwzDR8XrJyYl1dTWvvfZaOBwSRIFSeg+PcKOjExcv1E9NTWXnZL308vM5OVl3O5Ln+UOH9lNCTpw8PTE50dzU9NTBfRzHreSiWq1OpVJJkhQOhyVJbm5uu3jx0uDggFarLSws2LO7VqFQ3PGWJUmilBiNMRi6HwAAADzWIHAHAIBHBqFk0e0bHZtCFGFKYsx6rVb9mRnoFCGMECGUYbDT5Wm+dvPUR43T0zZRlMs25n3vT19KiI9Zdmw6pXRm1nG5sT0QEI1GvYLnl60t2kdvX/CcOtP8+hsfudxeXoGzcuLz89P+6s//yKDTcBwXHR3zj//3n31S3/r//dtvxifcYVn1+htndFrVK0eexBhHCyOEzMw6Xn/r7PSs43pbl9cXwowKIazVK589XPudVw4aDZqSIut//R8/b7ner9JqbfOuRbfPZNRhTG90DvzytZP2OVdmZuLhQzviLCZEEaYcy2KtTn3vHz0AAAAAwNqZmZm7fLnJ6/WmZ6RptJ/ue48xVqoUXm+4s7M3MyMzJydztcvabLahoaHklKS//Mvvp6QkLXv87j21kiydOvVRd0/vf/rr/+tv/uY/WmJjlz1LoeA5jiWEuFyLP//5a2OjY7bZWYRQQUHeX/z5d/m7PDcOD40PD41RShUKJexgDwAA4PEGgTsAADxKJFkKRyIcz3EsrdiYl5IUeys9vzU6xusPdnUPeryBt45eGBicDIdlSSYMkgPB4MbSvJef20fIMluVUooEQfB6fUSiCfExuda0pasihCJEr7b0/PgXp0ZH5kRJSkmPq9tRtnN7WXlxLs9zt1WIeY59Yk8Ny6If/ujd4TFXICS8e/R8eWnupvICQgjGeHrG/tobp8+cu+r2BRBCqemZPl/EHwzGxGhrNufrdWqEUFZW0hP7qjq6ByIRYXbWMTo2nZme6A+ELtZf7x+c0nLqutryzIykmVm73e6mhMEcVat5hO7v97vbp/dEwbx4AAAAAHxeIBCYnbVJsvjss1/JSP/0QYtl2ZiYGL/fPztrW3A6Vxu4t7a2Xb3aIstybl5ufHzc3YLv22m12m3bagghxz882dPT+9prbz777OFb9dyN1ZqZmZnW3Mw4nc7Gxit+n8/j9SYlJZWVlcXExNztLK/X63a7CSE6nY55LB6Qjh49Njo2HhMTU1RUWLOlar3LAQAA8BCBwB0AAB4lRCaEUBazlMpKlYoQihCJvoUxnnMsioJ4/kLLiZMNszZnMCwihDHLYSSrlYxeqzLqNWhlKbAsE0mmSpUqMSEmO3OpDilZlhHCZ863/OSXJ2amHQadds+uqmcOb8/JTtZr1bdf6/Y/76mrUam0f/FXPxQjeGHBef6T5qysFJZlZ22On/z02LVrff5AQKVkamtrSooLfv3GWZ/Xo+RYjmUJIdEROiqVQqVSCgGy6PX1Do7Xbi//4MNPjn9Yjwl+9tmdL7+4x2TUftLZ57A7EaEYEUJldD/zdkKIKEmuRY8QlhDGGrXKbNZzHEvpWu5nCwAAAIDHQCQS8fq8Op0uLzdHr9dFX+Q4Lj4ufmZ6ZmFhweP2rGrBoaHRpqbWqcmp9PS0fXt3KRTLp+1R8fGWrVurI0LkzTffuXKlSaVS7du722rNXuIUk8lgNOoxxsFgcGpqilJqNpurqzdv27ZlibO8Pp/b7WEYNj4+Di/3a8uHHCF0YmKqpfV6X1+/Xq+fmJgMBgI1NZs1Gs16lwYAAOChAIE7AAA8ShiGwZTKoixTOmtbFCVZrVIghHz+4ODw9L/+7D2H3T0/u+gPCAqFWq1US2KQIiEpybQhL+2JJ2pqt2+SZfmOO5T+ISrJRJKjDdvk843btxBCMMPUN3b+v/92zOsO6vW6A/sqv/lHT5pMeoWCXzpozs5MSU+OHR2ZEiLyyJhNksnr75w9duyTBXtAklCMQV1Vlfe3f/3N37530bHglEUhOy0pIy3xVm++JEmSIGOKVSpleVl+wB96/9glvy+cn5vz7W8+pdWqMcaSKMiSgBDBWJGXk4buT8s5pUgQRJ5nrzS3//xXRxfsPp5VZGWmPPnkls1VJZZYM4UfTgMAAADgNpFIJBgMJiUlsuzvv5KzLBsbG8vzikWX2+fzrWrBtraOgYEhk8lUu3N7RWX5qs5NSkrcWbu9p6evra3t0qUGjUaj0+kSE+OXOIVhMMNiQkgoFNJqtZWVm/bsqcvLsy5xis/r9fq8Op1248bSWz9/fGTRUCis1xuUSqXD4XC73Xa7g+XY8rJSo9G43rUBAABYf4/633MAAPAlghFSq5QWi2l41E4Rf+J0syyj+DgDlaXxiZnm6/1T03YWswixCp5nGZllZEuSITcv48Vn9lpzUhPizYRSdoUtRZRIgiCJAoOZu3VoU0oZhmnvGv5f//KW2+U1mnT7dld848g+i8W4gkwfxcYYtlRtmJmel2Q8Mb7wL//7g6vNbS6Xh2FRXnbq11/at6uu0u3xn7/YyjEMr+SrN5dYYk23agkEgoIosqzGbLJMT3r+7V//cWRkKjU14Y/+6Am9QcMyDCFUEiVBjBDK6rTqTWUFkiSvagPY5T8kSimlskwCwWBf/9g//vMvJsZnOUYti+LI8NDszHiMSW+JNSPocgcAAADA70QiEY/HEwqFCgsLOP4PAneD0aBWq/1+f8AfWOFqhJDFRffg4FAgENy6tXrv3l33UJLBaNy3b+/U1NTCwkJLyzWD3rB//x6N5q7732DMsCzLsJhSlJiYsG/f7vLy0qUv4Q/4Q6FQWmrK9h1LNcI/EhiGKSrK83h3UUo7Ozvdbvfg4OBbb73HMuymTWVaLfS5AwDAlx0E7gAA8MhgGCY5Oa5u5+ahsXn7vN/hWHz76McMljkGC2FBFBFDOIZlOA6bjJqsrIRca+qGDdbyjfmJCTEIY0rRStP26Fh2QhiMGPaup1BKw2Hx1KmrczNutUa9f2/1q0f2xluMK8mWKaUcx+bkpFCEEFXMz3k/Pn8tHPYRWbJaU3/wvZc3VxZzHDs8PhsKhmWZmAwajVZzqz/d5wtOT9sliWCWuJyB1988PzM5btBrjrz0xO7acpZhEaIIIUmWiUwQYiiliCKGWbPUO9r1Twh1uTzX2noar1xva++x2RZYhkeUcCzDq1SFBdklJQXLTswHAAAAwJfK8PBYR0ePIESSk5O42zrcGYbRarVKpcrt9gmitMLV/P7Aa6+9Ozw8lpaWlpWVdW8l6XXaHdurJyYm3nvv6MDAgMFgiLXE1e6ovtvxhBJKCcuyDMOUlJZYLMtvtRoIBERJVGsfn03sa7ZU6XV6S6ylvaPdZrMtLCwcff+4TEjdzu3rXRoAAIB1BoE7AAA8MjDGPM/trqu6dmPw4qU2QRTDYZlSiciiguPUKpVKqUhMjNu5s7wgLyMvN91k1nEcx3MsxhhjvPKxJpQiSglFhFJZEgR0p4kylFKM8dzc4o0bw5TIBr36madrEuNN0ddXeCFJliWJSCLBmA0GIqIkZKTH/de//dPCgixKKMsylxs7Fhf9GKGsrNQt1Rui90EInZ11tHcMIsRgxPp9waDPq+T5yoriZ76yW6NRYYw+nYZDCKGUYRgaTdzXDsa4samr7+bIwODYjRu9Hq8vFAoSIqpUSpPJpNeokpItT39lr0qlgH1TAQAAAHC72dnZiclxo8FwYP/e27uhGYY1GowKhQIhMjo62dMzVFycu+xqgiDcuNFOCNm6taq8vOSeq2JZ9vBXDs7OztTXN3R0dOh02iUCd5ZleJ5Xq9Vms/npQwcyMzOWXvzjjy91dfcqFIqUlJR7rvAhZLVmJSUl1NRU/vwXv5menrbZbG63e72LAgAAsP4gcAcAgEdGNMtOTIjRapSIihyLKRUYRoox67My07555NDmiiKEGbVaybIMQkiWCcPgewt8KaUISbIUESJhdPeoGjNUqUSy5FerYhX8Kqa1YIwX3b4zZ5sRZTiWlQmRpbDZqKmpLisuyqEUUYYihKan50UBYYQyUhMT483RT4BhcCgieHwRntdwCo0oBiUhUFqe91f//ohO9wdtUyzL4Ojge4wxwksMo1/Bp/H7+e+/+u2J+vrWqal5l8sTDkcwQgzLmM2GrKykl188tHPHZkopy7FqlQrj+zI1HgDwZUNkiRCZUsIwHMOwj/p+gwB8yS0uLvp9/qzsTKPRcPvrGo26urri448vIISdTpfNNrds4D45OX306HGXy1laujE1NWWJITDLwhibzabnn3uG47iGhivd3T2v//btrzz9pMFg+PzBaWnpO3bs4Dh2+7aa3NwcpVKx9OL9A4Mej2fDhsI9u3fec4UPIZVKqVIpNRrVt7/1qt/vwxhnZKSvd1EAAADWHwTuAADwaCCEIISuXO36zRunujr7WIaoeC41Lbm42Prqka9kZSSj2xLhaDDN3n0azGd8LommCFFKCc+zSpXyjpExxphSmpGe8P3vvfDG26cOH9qVlhK/qvZ2UZA8nqBMEIMJZsIpKeY9uzZ/789ewhgjRDHGp882d3ePSQJRq/nNVYUIYYSoLJPJads//POv3d6gIBGZBjAObSrP/uv/+I309IQ/GJaOkVqt0Wi1oZAsEzLvcG0oylrtNPVPp7QTQgidn3c2NHa+9c65+fm5YCiEEeY4nJoSFxcfU1iQnZwU/9wz+4wG3SpWBwCAu5NlcXaie3L42uxk92fe0upj03MqM3Kr9caldjUEADyExsYmJyamEMZJSUmfeYvnudTUJI1GwzCMz+dbXFxceqm5OXtTU2tjY5PRaKzZWpWS8tkF70FenvWppw5gjBsuXzl16ozRoK+pqf78xBirNVur1fIcV1SUv/SznyAIXV29g4ODPM/nWq3L9sI/itRq9bIj7AEAAHypQOAOAAAPu2ga7vOHWlp7f/aLY+MTUxyLykrzKiuKa7aUFhfl8Pxn/2e+qq5qSmkwFF5c9LIMyyt4jmMJkVmOY1hOEEXb3MLQ8FRhQebnT4xm7hXlhakp8ZZY02q76Y8dvzhnczGYkeVw4YbUV79xqLqyWK1WIvTpJqN+fygQFBCm6ekpXzm4NZp9Y4x/8ZtjN/vHiKyUqcgiISc7/s//9OX8vCyE/iBMxwiZTAaFgpdkIRSMnD3fvKeuUiaExSv6d4jo7HVBED1e/8X664uL3ubm7u7uMVkiGJP4OEtaWkJ2VsrOHRVx8TG5OekKBb/yewcAgCVEwv6hnk9G+hqESPCOBwR8zr6Os30dZ+OScgtK9yWmFT3gCgEA96y7++bExFRsjLl4Q+EdD1AoFBzHhUIhr9ezxDper6+zs6epqZUQubZ2W/XmTRZLzJpUuKGoUIgIkxPTff19J06ewZiprq6Mi7PcfkxCfFxCfNyyS0UiwuTU9ImTp222ufLyMqs1Z00qfLzZbHM6nU6vhx4OAAB4hEHgDgAADzVKaSgU6e4dOXn68uUrnZGIYDLra7eX//Erh41GvUatxCuLj5dYPxwRfvzTd1qu92LMpSQlajS8XsdvripTa3SELric3qnp+TsG7gghjDHHcSnJ8asM+dHkxPT7H3wUCoZZlo+JN/7pn7xQu63s1qamGCNBlAaGx0PhEIP52BhDtFSGYT44Xt/cfFMQGYwJ5iJmi/YH3ztSVlbAsuztFWCMCaHFRdaM9OTp6WFRklzRNrEVDJUh5NMBMi6Xt76x7aNzjdfbb0oSYRHLKziLxVBcZN3/RE1xcY5GrTIYdDA3BgCwVoRIsLft1PDN+hUe77ANOWxDxpjkjdXPJKTcObwDADxU5ubmgqFgYWFeTc2dJ6QrFDzHceFwxO8PLLHO4OBoa2vb9PR0enraK698Ta1WrWGRSclJO+t2BgKB8fHx945+IIri3r277iECdjpdFy9e7ujoNJlM27fXbNxYvIZFPn4IIW635+OPL2VnZxYVFajVapVKud5FAQAAuBcQuAMAwMNLlolMyBvvnDtx6tKczcHyfElp7uGndu6tq1QoOITwrYT63lCKCKFtbT1nz1+1zXkwVgwOTMmyPzk5tqS4UKvVq1UamSC/37/EIhgjtPL9WH/n6PsnFxYcHB8jCEJpaVnVpiKWY/HvqqIU9d4c7erq51iGIhqOhBBCskzOn2/+zW9O22w+jHlJjmTlJP6v//4XhXk5CKHPfxQYI7VaqVGpMUaUknAwSAghhCw9aUeSZISQIEoNjTcuNXQ2NLYFAqFwhMbGx2amJ+3fXWaxxO7ZtZljWUJkzDAsTFIGAKyRoZ5LvTdOiUJotSd6XLOXz/woIaWwrOY5gynxftQGAFgrbrcbUazT3TW85nmeYZhIRAiHw0usMzo2OjDQz7Ls1q1bOW4V++isREJ83J7dtTzHH33/6NTU1HtHPwiFw0e+9sJq17HN2Y4dOyaK4tatW+PjYQTWMnw+/49+9JPBwUGKUGFh4e7ddTVbKte7KAAAAPcCAncAAHgYUYooJW6P//U3z546fdnlcsWYDbt3Vz55YEfphlxCKbMWOS/GCGMUFxeTmhzrdC5gRI1Gfa41OzU1wZqTuqFo7kpLvz/MzDu8giApFGv5V0ZSUrxWzYfFcIY18eATVTqdisi3R+FUJrJ9wSlTWaNRvfTcHlkmC07PhUvXJqbtFCsRCVuMiv27ajYUWAkhLHuH75nRrvO8vPTWazcDgcjY+OyZc1cP7t9GCP18Ok8ppRRRSiem5vv7x8993NjfP+p0LfIcZ81JzMnOePnFp0xGXXJSTHSAD6WI4+DvUADA2pgZ7+hqPeb3LnyRReZn+s6+9z+sRTs3VDylUGrWqjYAwFqRJPnChcvj45Msy2o02rsdlpiUpNVqI5FFWZbvdszJU2cbG6/6A/6S4g379tWt+TMJxthg0NXW1kSE8Llz5ycnJ48dO+5wOL7/vT9b+SL19Q2v//YtWZYzMzP37qnLhN1EVwAzDKHU4/F09/QYjHoI3AEA4BEFYQEAADx0CKHhiNDZPXjh4vWz55qITAoL8o68vG/7to1ajZpStIZd1RjjXGvGt7/1XE9PP8OwCQnxNdVlDMPodNrUlHilmg2FxGudY4dd3qQE8xoOTjl0aD9CbDAoZGambdlShhC6PW2nCAmCGAxFMINValVaakJj083m1s6Gpu6IjCRZ0qvoU/u3HHn+CYTwHdN29LupMn/8ylfPnWuYDIeCwcjRY5cqNm2Isxg/35Lv94c6ugbsdueJ002T0/MO+7yCZ5ISzQefrK3dXpmWmqTX6zD+NJdnGBghAwBYGwGf8/rl39ptg2u14PDN+smRa6Wbv5qVv3Wt1gQArAlC5M7OzoWFhcyszITEhLsdZrHEaTQap9PldC7evDlUWGi9/bEjEol0dfU1NDROTk6WFG944YVnY2JM96NalmVNJuOO7TXpaSkXL37S1Nz6ySf1lJAcq7WqclNi4lLt6m03Ont6eq9fb5ucnEpISHjlG0fy8qwwHWVZao366aef5Di2q6vb7XZ3dHR+cOzEwSefUCrhowMAgEcMBO4AAPBwIYRiBl+qb//16x8Oj4yrVcqvHKo78rUnExNjGYzXpLH9dtGvcFs2l1dWlGKEmN9nyVir1aiUbDgs2R3uUDhCCGXZNYuZtVrN888/RSliGAZ/brdVjBDLsDzLRwQpHBF/8frHszPzk5M2QWAxlYgcrKvb9u1vPR8fZ142+NZo1KmpyVNTDkmmnR0Db7178Rtf2xcdCo8Qiu7Cev3GwJtvn+3rH3K7vcFQSBSF+PjYQ0/ufPH5J2JjTGq1klKEMYZZ7QCAtTV883J36zFJEtZ2WSESvN7wxtRo2+a6b6rU+rVdHABwbyIRYXx8cnx8Qpbl7KyMnOzMOx6GMS4szG24HDM5Oe10Lg4OjhQWWm8/IBgMXbjwyeDgMM/zxcVFpaX3cSo6xigpKSEpKUGn0yqUyqamljMfnUtO7pmbmyveUJSWnpqaknz78YFAcGpqZmp6qrGxqbf3Zjgctlpz9uyu27JlM+wtvxIKnt9YWixJksFgGB0dU6tUapUKHj4BAOBRBIE7AAA8RCilsix/9FHLz35+0m53xsZa9u6p+j9+8A30u2j4flw0uiz/ux8jR/+TELJn56aTZxouNfTMzjp/+qtTf/9fvkMIWavEH+NPO9PvdlMMw3CYJVIkGAxfvtoZCQosYhnMcAzZVlv+f/71t0xG/bKfR3R0zA++90p//39zOn2yLB87fgEj8fChHaIk//jnx10u7/y8Y35+IRQUKMUKno2P11dVlXz7m89nZabcqg2+6QAA1tbkyPX+zvMe18yyRypVutiEbKM5WW9KUCi1fo/d657zuGac9rGlT5yfGTjzzn/JLtieX7oXYncA1p3f72+9dmNhwWk2m63WnJSUpLsdWZCfY7HEYIyDwYDD4aT0988hPp+vu7v32rXroVCopqY6Nzf3wRRfXFyk1WpVSlVzS+vMzMyJE6e6uno2lZdt2rRRpVJyHE8oESKCbW6+7XpHV3eX3W5XKBR5ebl79+5+6uD+B1PkY6NiU1lsbOzU5IxSpdhctWm9ywEAAHAvIHAHAICHBaXUHwidONP4q9+c8PuE7Oz03bs3fevVg9F372t7y+cXj77y4nP7unsm5hdC/QNjo2Oz2VnJt3/rW/OL3noHIapSKjQazumWKUGRsIgQS4ikVOK6ndX/+T+9YjTedauxz7PEmXdsr/jwxEVKsWvB9evXT772xkmMsSiIghBBiCCEDDptUlLiztqqqsrCrVvKIGEHANwno/1X+jvPB3zLjGtXKLUZ1qqUrHKzJd1hG/K6bfbZwUjIZzAnxiZk5RbXKVX62YmuieFWh23obotIYmSw+8Jg94Xsgu0FG/dp9bFrfTcAgJUKhUJ9N/vC4XBFRUVS0l3T9iiVSq1Q8OFwxO1eRIhGR+FFIkJHR8+PfvQTu92emZW5b9/uTZs2PpDaEUIoKyvjlVeOJCentHe0Dw8P9/f39/X1nTx1OiEhwWQyRSIRh8Nht9tDoRDP8xaLJS8vd9++PTu21zywCh8nmRlpmRlp610FAACAeweBOwAArD9KKSFUEMQTp6+89uYZny+4tabi6y89kZ+b+rsvWQ8axpgQsnXzhrhYvdsrzs4ufHK5LTMjkdLbh63fp0sjSnF2dspLLzzxo58cC0YIZihCEY2GObBv83e/81WDXoNX03VuMur37d1ys2+wr38EY14WsYSwKEUwogoFo1Er01IT6mq3VFWWFhfnKngerdeHDgB4fC0uTNlnB4Z6L4UC7qWPVCg1+aX7rEU7Hbah4d5622S3LIu33rVN9UT/YDAlpVsrq+u+GfC7ettO2mcHllhztL9xtL8xLaciNbMsPjkftlQF4MELh8MjIyORSGTbtqqCAuvSB+v1OqVSFQj4Fxd//3+M5uZrb7zxzsTEhMFg2FRenhB/1ynw94lerzt06IkDB3ZfudLS3HxtaHhofn5+bm4Ofbr5PFUqlfHx8fn5+a+88rXUlGSeVzzgCgEAAICHxP8PAAD//+zdd1ic150v8POWKcBQh94RIEACFVRR77YjyXKLHW/im9yUG2dTnvjmZpN9kjz3JrvPXWeTrLPx3U3ixJviEjvNUe9CIAGSEAJEL8PQGZiBaUyfec/9YyjDMEjUGZC+Hz+PzJxz3nN+74seY36nvEi4AwAEHsMwLMucOlf6/oeXDHpLfsHqb379pWh5BMuyAVxq7V6BfuTg1u7fXRw12W+U1zx7fE9EROgiLnKfCcsyPMd98uVjaq3j5Jkync7gdBl37Cj68qvPRUWFsyw3pwAopVu3FHzly5+6cuXmjZt3jSarVCoRi0LT05K2bs0PC5UVblybkZ7McRzH4XWoALBQJqPGoBs06FQWk9ZmGbVZjVpNj91mns21OesOr9n4pKq3+eqpHxm0Aw9oadAN1N89XX/3dHb+/qKDn9cN99wr+9CoH3zAJT2Kqh5FFSEkQp4cIU8Oi0wIj0iQBodJpLKgkCV56SLASjQyon3rrf+SR8sP7N+bmZmxKH22tSlOnTo3OjqalZUVFRU10/veJ0RGRslkIcPDw3q93l1SXHzzzJnz7e3tUqk0Pz//4MG9DziUZokwDCMWi8Vi8datm3JzV5vNZp1eX1FRqdfrOY5bnZ2Zk5MtFouDg4MTEuLEYmTbAQDg8YWEOwBAIFFKCKF1DcprJXf//NElKnA7ijZ+79v/TSYLIpS6jyAPFIZhKKX79hSev3Rb2WWpud/x5i8/eu0rL4bKgpZ6AbjLJbAsU1vX3tiocDjMHG/bvq3gu//wuciI0HlMQrjPi9+9s3Dn9o13q+oooTzP8zwfExOVmBDjbiO4BI5/yG+/AAATjPpB/ciAQTdg0A4YtCq9tn+BHUbHZ23a9bLNOlpy7s0RdefsL2yrL1a2lOcUHDr4zD8om8vqq864HvYWVt1wr264d6ZaaVBYWGRCeFRCWER8WGRiRFQiL5LOPh6AFU2r1d2+fbfi1m2ZTLZmTe5iJdyHh0daW9t4nj9x4mhi4sMT5XJ5VEREeGenoNVqb9+uFolEN29WtLW1CwKNi4t98cVnMzMzpFLJosQ2D+HhYeHhYYQQh8MREx1tsVhZjo2OlsdE49wqAAAAQpBwBwAIIEqpyyV09aguXK44d6GCZYOKdqz96hefD5UFUUoW/npSSukCz35nGCY5KfaJQ5t+885FahdX1yrqG5VbCnN4nlu6leCCQFUqTWVV41u/OdXXp5JIRCc+tvsbX/tUWJiMYeZ5PyzLCILA8ezWreumjEUp487II9sOALMwPKTsarvT01E1yxXrs8GLpOu3PReTkF17688DPQ3z6MHpsDXcO9veWLK28OiTL3yvsvTdB58w82BWi8FqMXj2EJOQnZa9NSWjkBcFLMEH4B8mk6Wnp99kMun1ekV7R87q7OgFJ5FVqiGFQmk0jiYmJhYWro+ICH/oJenpKSkpiQ0N9Tqdrri4lBCmsbHJaDSGh4cVFBRs2rRBJBItMKpFIRKJVq1KD3QUAAAAyw4S7gAAgUEpJYQ0NHe8/btTDQ1KlpMWbd306ucOJiZEE0IWuLadUsowzJ//cr6/T/XSS8fj42Pm3ZVYzB/Yt6XsVlPlvU5lt/o3751LSopJTZp/hw/gDtvhcBRfv/3b359Tj4xGREQcObLts68cdb8ldSFZ/ukTGAzDzO1sGgB4jKl6G+vvntFquhe327Ssrfmbj3crKi/86fsL7MpmHb1X/mFka8W2/f99ZEhZV3nSYtYvSpDqgTb1QFtNxV+y1+5dXXAQR8DDIywoSJqQEC8RS82mkYbG5ty83IUn3Bsamisr77Ess3PnDql0VvtFMjJSMjPTQmTBRoOhpqbaZrMZjUaGYZKTk/ft2/vQE2kAAAAgsJBwBwAIAHe2XTWke/OXp+trW3ieKdyQ/Z3/9WxIiGSBK8cFQRAEeqeq8T9/+cfWltagIPHhI3sXknAnhGSkJ377G3/3ha/8i1ZvrbnfVl3bmpYc606OL6RbL5QShmG0+tH/80+/qr7XYDDo09MSf/h/X1uVkSwSLdqCehzRDgBz5XTaK678StXbtLjdxiXlrtv23KhefePCfxp0DzqufU60mu4Lf/p+1pq9B058s7u9srnmosNhXZSenQ5rU83FtvriLXtfSc7YuCh9Aiw3cnnk5s3rQ0JC9Hq9Rq3RarUL7NButysUio6OjqysVZ/61IuzvzA6OjopKbFWU6tQKHieF4vFaWmp27dv2bVr6wJDAgAAgKWGhDsAQAAwDGO12ctv13coVCIuqHB9xj99//My2YIOyaWUCoJgttje+cO537572mZ1cBybm5cdGfnwncsPlZwUe2DvujMXKiwW2w/f+IDn+EP7CyVi0aLkrymlgkANRlNbe/cbb/6hrb2HUHZT4Zp//NZnM1elEmTJASBwHA5rydmfLeLC9sjo1Lik3ISUfJfLcbf03UVfMu/W3liibC3Pytt76NlvD/W3DPY1DfW32W2mhffsdNorrr69bd+nU7O2LLw3gGWI4zi5XK7RqIdHhnU63QJ7O336QmVllUwmy8nJmdOFcXFxWVnZSmXnqHGU47j8/Pynn/7Y3r07FxgPAAAA+AES7gAAgVF26/67H543Wwzr1mR9+e9fkIUEzXvNOKXUfVz74JD27PkbxSW3bVYLFQR5TOSzTx+Ij5PThb7klAkKkn7ja58RCHP6XLlp1PyvP37fZnU8dWSLRCJayL5m90p/l0swmazvvHfh7Lnrff2DERHhe/due+n5gxnpKZQu9HQdAICFmHe2neNEwaFRwSGRwbKooOCI4NCoEFlUVEy63Wbq77p/r/wD/chC37P6YC6no6XuSntTacqqwsy8PUUHv6Af6Tfqh0yjGqtJbzZpzaNai0k7v2Nnbl//HcuJkjM2LHrYAAHH83xKSkqHssNgMJpGRxfYW2tbm1anLdy48dixJ+d0YVpayq6d24c1wyMjI5mZmTt3bsvPzwsOxoFOAAAAKwAS7gAAAaAaHD57sWxgYCg8PGxnUX5qSiwhzDyy7YIguFwCz3NGo7mppeuDP166W3XfYrO4XI74OPkzxw8UbdtAFpptJ+64goLEX/rcx0cNluulDRaz861fnxIE4fjRIo7j5jdV4HIJDMPYHY76BuXZc+XXiu8YDPpoedSr/+OFgwe2RoTLGIZBth0AAqjq5gezybbL41aFRyaEhseFhscFhYSLJSFiqYznxe5ai0lnGh3RDfd0NN+8c/13i3Wu+iy5nPbO1ludrbcIIdHxmfLYVfK4jISUtcEhkbxobFuVzTpqt5lsFqPJOGzQDRq0/SPqLqvF8OCeK0vfjZAnycKW5JUeAAEkEonS0tKCg4M1GnVvb79S2Z2RkTqPfmw2+1//+re6unoRL0pLS0lKSpjT5SEhwXl5q0Ui3mKxxsTEJCcnhIbK5hEGAAAA+B8S7gAAAdDc0nXnTgPLsHt3bfi7lw5xHDvXzLIgCJRSjuNYli2/XXvy1LWqqha1ephhqSxMtmdX4cefO7JlcwHPsYtyHgvDMDzPR8sjvvftz9ttbxWXVNvUttffeK+rX/XCiX0pSTEMpdPfSjoT9+k3HMd1dKre/+DijZvVvT0qmSwoNTXhG6+9smvHOpdL4HkeB8kAQAD1Kms6mm8+oMHqgoOJqQUxCdmEEItJZ9CpDDqVWtVut47abCabxWg2aS2mhZ5HsYg0KoVGpZj4yPPiYJlcGhwmCZJJJDKxNCQ0PDZl1cbQ8Kc4XmTUD6oH2tsbr8+0Et/psJZf+fWR5/7RX+ED+IlYLF63bk1JaYxWq+3q7qlvaJxHwt1stjQ1tfzt5GmDwVhUtC0vL3cekURGRmzZUjiPCwEAACCwkHAHAPA3vWH03ffP26zO2LiozRvzWG62eeoJlNKe3iGj0XT56u2ePlVdQ6tarRGcrqio8B07Cvfu3ly0bX2oLJhhGPeZLYuF49iwMNnx47sE4rx1p8HpEn10skTZPvC5zxzPXJUQKguazbQBpWR01KoZ1r3/YXFNraK7q8/uMMXHRxz72J5nTuxLTYknhIhE+PEEAIHkctrvlX0wU608NmPLnlfE0pC+zlpFU+lQf6vNutBzJ/zP6bQbdAM+39caFZMem7g6LjnvyHPfaa69VFd50mcP+pE+RWNp5po9SxwpgF9JJOKCgrzUlOT+vj61Wq1QKB5+zVRWq1Wh6Dh5+qzBYExOTt67Z3dh4fqlCBUAAACWJ2Q0AAD8x539vlFW3dikpJRJSJBnZ6WwzNwOk6GUlN+q++Wv/zw4OGw0mk1mM2GIPDpq5/aCrZvyD+zfLhGLOY51H/OyuK8bda9h37d706YNuT/7xftnL5SbR+m96pb+/uHdu9avL8jcu2cdP/OR7u6j5u9WNZfcrK2qau7u1lgtDo53bd9W8MzTezZvyouKDCN4RSoALANNNRdnyqHnrDu0uuBQS+0lRfMNl9Ph58D8Y0TdOaLubK69FBmdkrfhySc//r9Lzv27z9X69VVnUrO3ikQLeuk3wDIUExMTIgtRqVQD/QMul2tOb6xRKrvOnrt4926lw2nPz1+blJS4dHECAADAMoSEOwCA/1BKWZY5da7YbLWJROKkhOj01HiBCtwMKWZKCSGUEMIwjNls5Xnu9++drb3f1NSk1AxrKaUcxycnx6SlpX76U0dzs1PDwsYO91z0VLsnsUgkjwr/2qsvS3jRleIqg97e1ds3+Ff1hYs3z11cdfSpXdu3rCGEMCzrDsG9yt5oNJ8+d6Ond+j+/fbeHrXDQVmWyKNCthflf/6zT6elzu1gUwCApWO3mVvrr/msyik4lLJq04U/fd9ht/g5qoDQanrKr/wqOaNw39Gvl55/02Qc9mpgt5nb6ovXbHwqIOEBLJ3Y2FiZLJTSgZ7e3kuXrx0+tJ/nZ/u7s0qlqqmpcblcO4qKDh/an5aWsqShAgAAwHKDhDsAgP9QKlDKGgwmShmJRBIeHkYIYWZ4p6kgCO6kud3uaGnpfu+987X1bUMaDaVOlqHBQVxyUvyTT+z55MvHJBKxP++CYQghTLQ88jvf+sJnXnnma998o7d3wGQ2Wm3WS1fu3iirDwsLEYnZyMiwoJAgShmzyWyz2Y2G0cFBtcPhEItEVBBiYuRbCvOeObG3aFuBP4MHAHio9sYSn0vXc9YdTkhZe/3MG06n3f9RBVCv8p7Tadvz1FeLT//EajF61SLhDo+koqIt9fV1HR0KnU7X1NR88MDeWV5YVnbrwsXLJrMpZ/Xq5597Jj0jTSQSLWmoAAAAsNwg4Q4A4D8cx3V1949odZQIHM8EB7v34FNCGDK+EpwQIghUEKjNbm9p7VQNqBublMVX76jVI4TlQoKDEhOid+9aHxcXtWF9XlZmKqXUfXqM/29HEGhiQvRPf/Ta+UsVVfeaBgdHurs0Dqeg0egZluntU1NKGJYnlGUZhuc4MR8SGx2ckhIdFMzt273lpecPuw+ZwREyALB8uFyOtvri6eVRsemZebsv/eWfH7dsu5uqp6FJGrp136dLz/8/ryq7zaxsqcjIKQpIYABLJD4+NjExITw83GQyqVSqWb4U505l1aXLV9rbFSnJyS+88Fxu7mqJRLLUoQIAAMByg4Q7AID/CIIgkUqkEp5Qm9Nld7oEQqjTJfCEUEpYlqGUUErvNygsZmvVvdabZdUatcZkMhEqxMRFbt+2Jik5flNhQW5OhkjEu/PU7nPVA4JlGUppckLMK5944vD+LQbDaHFJVX+/ymKxisVipbJXbzBSynAcHyoLysxMCQkJ3rqlICszmePY5MQYQggObAeA5aa3457dZvYq5EXSogOfu1X8m8cz2+7W2XYrZVVh1tp97Q3Xvao6mm8i4Q6PnoSEhPi4+HZFu0YzrOzsykhPe0D23Ol0NjQ2nT59rrGxKTYm+siRQ3t27/RjsAAAALCMIOEOAOBPTHysPChISlhmdNRy+07j88f3xcVFMIQwDCm/3TgyouvtHywtqzZoTRqNzul0SMRcRGTo7t0bD+3fviYvg+d5sVjMsgxZHrlqdwxSiTg1JU5wxWZnpTjsDvdhOH19Qz29AyzLMgwbExORnp7MMkxISBClhGGY8VsI9A0AAEzV0VI+vXDNxqf6u+uGBzv8H8+yUnnjvSee/253e6XdZvIsH1F3GXWDoRFxgQoMYClkZKSnpCa3tbeq1eqLF6984qUX4uJifba02WydnV1vv/37DkVHdIz80OGDz5w47t9gAQAAYBlBwh0AVqrhoc5rp37KMIz7FaGEEIZhyVgieiIfzYz/6f6D8fhz7NWiXu3HG0y73P211+Ue7T0aj3Uw3oydGItShmWZkCCeUCIIpK6+44tfez0uiheJeCrQzr5R0+ioxWK2WS0SkYTl2JTkqJdO5EdFhESES6WCorWunWdYhvMKmyWT9zL20fddj30aLxnLdnve1/g1D3xEnu297poKY+fjCJTER/PxMSnurgghDuswy7B6O8ex7ufs9YSZqWGzHk+YMIT1au/xhN3/ZslEp8jiA8B8GXQqjUrhVSgSB2Xm7brwpx8EJKRlxWrWd7Xdzs7f31B1xqtK0Xxjw/YXAhIVwBLJy1ud27S6tPTGyMhIZWXlsaNPzpRwVyiUP/jB6/39fXK5/OVPvPjEE4f8HCoAAAAsK0i4A8BKJbicZOzc84lzNV0BjWi2dq5le/vDBobMLqdD2anq6SEMIU6XyyW4JDwJCeIjQqMSY8Tx8aEZSSxvazQMEr1qRS4GdyffA3JKu3de3jOtP6VkPK3vNVPivtxrisI70e8xE+M51TFeS8i0SYUZZmKmXO57jsFrtuNBcxLeYT/0rsfbzzzWrCerZj/XNa29z5mVqWMRj24n23tNuc0wJTb+GAAeqL2hZHphzrpDPcpqi1nv/3iWoZa6K088/92W+5edDptneWfLrYLNT3O8X1/iDbDUEuLjc3JyamtrhobUZ85eOHbsqcxVGZ4NGhpaKipuV1fXGAyGhITEL33p85s3bwxUtAAAALBMIOEOAOBvsiC6e3NcebVarTEyRMQQyvOEEhoZGZWdIkqU0+Dg4IgQp0Rsm8gOrsRsOxnPbgYkePdMDKFkVu84g8fDgae/Lo9ND3QUsHw5HdbOtttehRwvzszbc+3UjwIS0jJkMen6u+syc3e31F3xLHc4rJ2ttzLX7AlUYABLITd39ZHDB4eGhgYGBmpqaiMiIlmGzchIc9eWlJSVld1qam42jZqys7OeffbpwsL1MpkssDEDAABAwCHhDgArlUgSFBOfOZZQpdS9yp0SOvG1x/J3OlFDiLudu4KON5rIz058cHdMPVbQU48c7nhLQgklLpdjTpGzDM1JNGfGBTuFMJ05hGftoVIrywgMw3Cce92yZbGeEgBM4HhRoEOAZa298YZr2jtR07K2agYVRv1QQEJanlrrru468iWvhDshpLW+GAl3mLeqm3/saK7w3DrmtTWKTNlBNXUr2/jOp/F27MSupsndWjOcSje1Q4+T+sYvHtVYIyIiBweH+nr7b5Te7O9pj5NLKSV6va6tU6fW6KVSaV5u5uqMKM7WUn+ndaZ+ppynRyb3b01p5b1JazLshz0Zdlo/HrfpMZzn7ropu9m8jxYkvrbreQ/tEeQMT9hjuKlH/03Zb+f9ZLyHJmSiw8l/2AcOPXl3HkMT7HUDAAD/QMIdAFaqiKikfce+GugoZkQ9cvrjGfyJXP+U2ml5/Jly/ROfhIlc//gUwuTXk62o4HHJWAAeQxPfUwg+piKm9TNt9mLK0JNTEZ6zIIQSYUp0vp7M1CB9PRmP4TyGHu/QYxZkypPxvveZhp4YWZgS+PjQ7iEmB5gyNPH9ZHw9dkI9A/P5ZLzndaYNTQjW7s8DnhnMzOV0tNZdnV6enb//XtkH/o9nOdMN9xr1g8kZG3uV1Z7lowZ1r7ImOWNDoAKDFcrpdN2/X9euVA0NOwMbyXj6mDAMQwVKKWUYxmhh7DaHWCQ2mUzNLS1DQ+ro6GhBEDQajV6vl0ql0dHRUREyw0hH9TD16GpxtvjR8c7Gf4bRyf69Yh/70z8/6jxHYcjDRp3lg6BzabyIWJabyPWPRzBlAsdz+sEdo+dkx1jIYxewE9+tiamFKYf+jV02fsnEAJN//SZnNiZrPKaPpocx+RfXo9VkdOMRTk5ejE9yeN4b8R50/CFMdubRj4/wJocgk9dP7XYi5skH5lnDejYiU4KaDIiMT7RwHB8aHvPAb+yM1q8v4DhuftcCAMwSEu4AAEvCY0kOgD+4XI4pswtjXwqEkAfv9phxvuQhswIzz5dMmRXwnJCYmLR40HzJ1CmHOc6XTJ2QGO927GtpcKg/vhOwMilbym3WUa/CmPgsQXCpB9oCEtJy1nL/St6GJ70S7oSQxnvnkHCHubJara+//m+BjoIQQliWZRiWEsqxrNPpcgkunuMopQaDgRDCMIzNZlOpVENDQ06nUyQSMQzjcDh6enqGh4cpYQTBxbGs+2cVQxiWXej/BVJChMnkLCVEcP9gZQghhDKUjKVEKSGEdacvx37QM7NOu1My9xS3e4iJDz4T7oznFwwhhFLGu2p8/PFi6tkjoXMJi87tJuZz13PsntDJO5odhuL3Bj/57W9/ERwcHOgoAOARh4Q7AADAo4DjcF4KwDy5nPbm2kvTy7PW7m2rv+b/eJY/VW/jxh0vhUUmGLQDnuV6bT8WucNcOZ3OqqqaQEdBCPGRgxWJeKlEzHGczWZjWVYsFkskEp7nOI612exms9nhcAqUupfeikQcwzAul+ByCYu1FY0ykyn2iQCZaavKvRLsPnPVM2Zz5xrntH4e2sFs8v+eMc9+vsDjmjm2X+KdAGOzIuMfZxPdw3cKwCJxuYRAhwAAjz4k3AEAAADgsdZYfcFi1nsVBodEyuMyK66+HZCQlr+2huLV+Qfu3njPq7y6/MO4pByROCggUcFKFB4e1tBQGegoZuTOU1PqI2FNlzI9OnWTljDlmDuPM+jGC8YbeLSfekjglPbTzg+kvraOTTm00PvIu2mnI05uVhvfUUentCfem888Nrp5lHjGJky0n/LRc/PclLCFyaP7prb3uguPYwQ9wxY8t835vmuP3se+SR5nBk6P7SGPyOuuJ0qmhC2MjzbxuIAQQiIiEw+ceG1+10qlksUNBgBgOiTcAQAAAODxNWrQ+F7enr9P0Vji/3hWiq622/kv//P9O3+z20ye5VaLsfbWXzfv+WSgAoMVh2EY5L8A5sHlcngdr+c9LTF9smHKFMu0aQb3zI33YYOTsyPT5gmEqXMkk7XEe5rB97zFTDM3XncxvX9JUCj+uwEAyxkS7gAAAADwmHI67WWXfjG9XCwJTsvaduFP3/d/SCuFw27pUdzNXruv4d5Zrypla0VUbPqq3J0BCQwA4DGB4wQBAJYtNtABAAAAAAAERvnltww61fTy7Pz9iqZSh93i/5BWkPq7pzNyd/IiH2sMq27+QaNS+D8kAAAAAICAQ8IdAAAAAB5H5Vd+PdjXPL08KCQiLWtba91V/4e0stiso23119ZuOuaz9sbFn4+ou/wcEgAAAABAwCHhDgAAAACPF6fTXnL2Z32dNT5rN+18ubn2otNh83NUK1HL/SuJqevksRnTq5wO6/WzPx3sa/J/VAAAAAAAAYSEOwAAAAA8RmwW47WTPx4aaPVZu2bjx3iRpKO5zM9RrVyVpb8vOvSF4JDI6VUup6P0/H90td32f1QAAAAAAIGChDsAAAAAPC702v7LH72u1/b7rF2Vu3NV7s6Kq7/2c1QrmkalaG8o2fXk34slIT4b3Cl5p67ypJ+jAgAAAAAIFCTcAQAAAOCxMNDTcPXkjy1mvc/aVbk71246Xnr+TZt11M+BrXTNtRfVA237jn59ppx7c+3lsstvuVwOPwcGAAAAAOB/SLgDAAAAwKOvqebizYs/dzntPmtXFxxcs/Fj18/8m0Gn8nNgj4bq8j8O9bfsP/4/g4LDfTbo77p/7dRPbBajnwMDAAAAAPAzJNwBAAAA4BF3q/g39XdPz1RbuOOljNVFV07+q1E/5M+oHjE1t/7c2Vpx4MQ3o2LTfTbQDfde/tsPDdoB/8YFAAAAAOBXSLgDAAAAwCPL6bCVnP1Zj6LKZ600OPzQM98SS0OunvqRdYajZmD2Wu5fuVf2wa7Dr2bn7/fZwGLSXT31E/VAm58DAwAAAADwGyTcAQAAAODR5HI5Ss79bGig1WdteGTigePfULZW3Lr2X06Hzc+xPaoGuusvffQvKas2bdzxos8GTof1+tl/16gUfg4MAAAAAMA/kHAHAAAAgEdT2aW3RtRdPqtiErJ3HP7inZLfKRpL/RzVI89q1l879WOOF+849IWZ2ty4+HO9tt+fUQEAAAAA+AcS7gAAAADwCKq6+YfBviafVYlp6wp3fqLk7E+xznrp3C19d3hIue/o13lePL3W6bDeOP8fdpvJ/4EBAAAAACwpJNwBAAAA4FHT03Gvo7nMZ1Vq1paCLSdKzv7UbNL6OarHTcv9K73K6n3HXhOJpNNrLWZ9xZW3/R8VAAAAAMCSQsIdAAAAAB4pFpOusvQdn1VxSXlrC49eP/OG1WL0c1SPp/bGkm7F3V1PfMln7dBAa8v9K34OCQAAAABgSSHhDgAAAACPFEXzTZfTMb08JDR6275P37z0c5t11P9RPbZa665azIYN21/wWdtce8nP8QAAAAAALCkk3AEAAADgkaJsLvdZvuvIq7V3PjLqBhd9REoXvctlN+JCVJa+E5+yJjFt3fQqu82sbPH9/QIAAAAAWIn4QAcAAAAAALBohvpbrRbD9PLkjI02m6mr7fbijKKVKlWyIa3UZOVMVt5m50S8ECRxhQY5EuSWxGhLotzCsouWFLc72Y5+mWo4aEgnHbXwNgdHKRHxgkQkRIXZ5GG2pGhLSqyJYebcc11HxKhlPr8RRIfbspNneyyPy2mvLv/j+m3P9Xfdn16rbKnIyNkxjxgAAAAAAJYhJNwBAAAA4NGh1XT7LM9Zd7jx3tkFdm53stVtUS3dYdOT1A4n63CyBpOoTxNMWkiI1Lk2Xb8mXR8sdS5kRINZdKdJ3tEf6nR5Z9PdI45a+O7BkOo2EiRx5aXpC1ePiHlh9v23dIcN6Xy80fShVqcYZp9wJ4QM9jULgis+eY2qt9GranhIOY8AAAAAAACWp/8PAAD//+zdd1hTZxcA8EMGO0DYW5YTN+69955VW7d11VGtVat1f45aa13VuvdEHOAEFUURJ6KCbJC9AmSRhAy+Py5c0+RmoAzH+T3t89y8d73JBbw597znxZIyCCGEvi0ymfxiwNXZPy3m8ShyYBFCXzrKgLuVjRvT0Dg7PfqjD6tQGLxOYp+87fkizlqflHChmPE01uZUiEdUEvujy7+8iLc+c8cjPt1CPdquTiShv4y3PhXsmZjJ+sjzVbPYqFt1fbtRruIWZtVsXxBCCCGEEKoumOGOEELom/DX33vi4hKKirlxcfH5BRwAWLt6uUVt9wohVOVEJVz1Rmu7OnmZcR99zBIJ/eYT55xCk8ruKJXRHr2xS0hn9WubZW5SiVR3RZnBvZcOcemV/islktBvP3MSiBjNfYoqu291y0mP8es0nnKVWMSzBOca7g9CCCGEEELVAQPuCKEvUuSr1/4Xryi3tG3jN2TwgMoep7CwaNv23cotfi2bjxg++FP797GePH1+NfBGZfeytmYv/vmnTzz12XMXI1+9lspkcplcUaZQKBRlZWU0Go1Bp5uZmZmbm1laWHh61qlfr66Xl8cnnqtWRMfExsUnmJiYENF2hNDXqowqn9zKxrWYk/5xByzgGl2PcPm4QueEvGLji/fdB7TLtLOS6LnLkxibj4i2k8Lf2pmbyHxcKlHypQbIZKVymdTE1JLyoQhCCCGEEEJfBwy4I4S+SCkp748cO2VsbFxWViaRSAAgOORe//59mIzK/VnzD7hy5Ngp8mVdH29vL88q7mtlJCQmHzl2islkAoBUKiXbbW1sXFycDA0NDQ2ZDAZDKpUmp7zPyckl1tZxd/v0gPujx08uBlw1MTGWSEoVivL6v0ZGRu5urnQ6rbCwKC+/gGj09vYcPLDfj9MnW1lZfuJJa9Kh/bsAICsru1W77rXdF4RQNaKsvcKyckhLev4RRyviG15+6FYq/dQyjEIx48ojtxFd0qxZpTo3zuaYvEq0/sQz3o+yd7IRmX1aBfkqx+fmsiwdqALulZ/vFSGEEEIIoc8SBtwRQl+koUMGDB0ygE6nz1+41D/gCgBkZGYFBd0cPmxQpY5z7nwAuTxl0oT1a1fQaLU5ucWYUcNGjxxqZGQ0aers4JB7AMBkMHZs3zJ0yAADA9VgxKPwJ6vXbYqJiRVL9E2Z1OKPTev++nMjk8Go27ClUFgCAI19Gx0/stfR0YHYIDcv/9btO/sPHk1KSvl7594Tp87t3rG1a5eOn37qmlQiEtV2FxBC1cvIhKKCeZlC8REBXUkp/XqEi85oO41WZsxUiErp2mu1l0pp1x67jOyaZmok137AqETqsu80WpmPC7+uK5/NKmXSFSIJgy9iJGSwkjJZcrX3JymlR6datmnweY3pMTCgKcoo5nQ1Nv1M684jhBBCCCFUWRhwRwh9keh0OrEgEn+Inx49frpSAfdH4U/excaTL2fPmla70XYAMDQ0JBaEQiGx0LVLp2FDB1Ju3LFD2zMnD/XqM6S0VHe+pE4mJsYAIJXJiGg7AEyZNJ6MtgOAg73dxO+/Gzl8yPSZ8+4/eMThFE6cMivgwkm/ls0+/ew1Ri6nCPQghL4mZuY26o1yuZTOYFb2ULefO3GFGveys5I0cOd6OApZplIAUCgMuEJmep7Z2xTLYoEh5S78Eua9l44D22dqOalIQk/NMVNvN2Qq+rfNcrEtIVtMjOTWFpI6DsLmPkWXwtykMtV/wuLSLFrX56g9rtXNy1mgM1JvyNTx2IASg2kkl1E8JLZkYwF3hBBCCCH0lajl0BJCCH0ikUhMlpF59vzlixev9N/3zDl/ctnIyMjV5TP6ti+VlhcB8PSso2UzO1ub0aOGiUTiqjqvTPqh+IC9vZ36BmZmprt3bLW0tAAAqVS6eu3Gqjp1zaAs7owQ+pqYsSgC7jKpmMGs3JSnSVms9DxTylVGTEX3Frmju71v4lVMRNsBgEYrY7NKm3oXje+V2tMvh0Gn/mvzPtcsKUtbNncR31BRRhEjb+JZrBxtV2ZrKenSLE+9nV/C5AqpQ//aGTHl1hYS7f9Vag5YEtPQRFqqOtKIclACQgghhBBCXygMuCOEvmxisdjG1qZTx/bEy6MnTuu5Y15+wbXrt9u1bU28pNE+r+qx5Ih7IvFcixbNm4nF4qqKI5PV2wHA0JA6r9PGxnrwwH7E8svIqKSklCo5dZVITk5dsmxVr37Dxo6f+jY6pra7gxCqBZY2LuqN/OJcCytH/Q+iKDN4EkMRuAcAcxPZ8M7pDetom/azvhtvRJc0TSHpR2/stPzN5pdQ/+111hBtJ3g5CWg0ioNyBZXO669W5hZ2Al6BSiPbxrVWOoMQQrVIJpNfDLg6+6fFPB6vtvuCEEKoimHAHSH0ZSspERkbGY0aOZR4eTXwRnZ2jj47nj13USKR/Dh9EvFSJBJLZZ/XzHIEhq5pYG1treG/M6xWFfWq8aRmTRuTy8kpqVV+6o/zMDyi36CRp06fj4mJDXsYvv5/f9Z2jxBCtcDalmJgELco29K6EsOYYtMsKMvCMOmKQe0zrS10z5xhaynp5ZdNuUogYiRna8zplmmoNl/A1fb8lclQNPMu9nbmq/xHGYWvLWxb92JOhnq7tZ1HjfcFIfRli3jyrKiouIZPqlAojhw9tXL1hoTEpI8+yF9/75k5e+GYcVP82nSZt/DXK1eviSVVUBwSIYTQZwVruCOEvmwikcjQ0HDQgL6r127kcnlSqfTEqXO//rJA+14ymfz0mQsNG9bv3as7jUYj0rr5PL61NVufkyYnp76KejNi+GCyJfLV60fhERxOkZeXx6gRQ3WmpVehVn4tYt8+JYu/1wxLK0tyuaREW9IlqYDDiXjyPCXlfXFxMQDY29u1btWyZYtK138XicR37z1ISU0tKChkscwb1K/XuXN7CxYrKyt7+o/zmzVt3L1blw0btwKAkd6fiUAgDH3wMCEhicvlWVuzW7Zo2q5tGwaDrufuCoUiOOSeo6OD8nMIdRFPnpWUiHp076LnYT+dSCR+/uLl2+jYoqLi0tJSNtuqaRPfTh3bMZmVyHiNePJMJpORg0hkMnnog7DIyNeS0lK/Fs369e2l5cEMVMV1Lysru3X7jruba6NGDYiWmJjY8IinOTm5dDrdzc21W9dOn1U9KFTr6AymBduJV/SfYDevKMuqMmnUSZnUAfGOTfP1ibYTnG1FbRpyKOvS5BUZeTvzKfcyM6aujf4s1oZlKvVxod4LANr75uvZsdpiZePKLcpSb7e211Y8DaEvVH4B5+8d/xBjEMuUAZSVlZkYG5ubm7HMzR0c7Js29fX28qz1mYRU5Bdw/tq+WyaXy6RSmVxeVlamUCgMDAxoNJqRkZG5mRmLZe7oYO/j4+XbqKG5OcXME9WHLxBMnDJr1o9TFy2cW5Pn3bP34KYtfwHAjZshYfdumJpWrlIZITomNi4+wcTEJL/g85rUGiGEUBXCgDtC6MtWUiKysrI0NTUZOnjA8ZNnAeD0mQvzf5ppbKwt5H3zdkhaesb6tSvodDqLZc7l8gCAx9cWcH8ZGZWeniESiaNjYi/4X+bx+YMH92cyGKmpaUt/WxP2MJzc8vKVIP9zx7VHIasQnU63sLComXORBHwBuWxjS111gRT56vXO3f8Gh9yj0QxcXV2MjYzSMzKJqVnbtW29Y/tmN1eK+g/qSkpEf/6188y5i1wur1GjBmwry8SklNzcPDMz07FjRvB5AitLi2OH95mamri6OsfGxv8wYazOY2Zn5+zZd/DMWX+VOvgNG9b/e9umJo0badoxv4Dz+PETSWlpXl7+jZshLyOj5syerhJwVygUQdduymTyouLih48ibt2+075da8qA+19/79mxc69K47Kli2bPnKrcMmvuohs3biu3HNy/q3ev7uoHzMnJ3bVn/3n/S0JhiZOTI5ttlZOTW1hYBAAeddy3bFrTuVMHTW8NAILvhAr4Ai6P9+Tpi8CgG+3btSYC7g/CwlesWq9cRGjBvFlLlyykPMinXHeJRHLjZohYLM7OyQ0Oufcq6s2cWdMaNWpw7frtHbv2qRQLYjDokydOWLVyqf7PSNBXz9bBWyXgzufmGZuwjE0sxCLdI/clUlpmAUUYhc0qbeiurZKMulb1Oa3qVy6kwmZRB/RlcoPbz5yiEtn13Xlu9kJLs6of2FTd7Bx9CvNSqdrr1nhfEKp2XC73yLFTDAadwWCKxR9uM9xcXeztbXk8QVFRcWFREZH2YWlp0aVThzGjh3fv1vkzibxzudxjJ86o99/eztbO3k4oFGZn50okEgAwNjbu3Kn91Mnfd+3SsWb6du3aLYFA6H/xysL5s2vy47oXGkYsZGfnxMbFf0TiCAAc2r8LALKyslu1o7iFQwgh9HXAgDtC6MtWIhLZO9gBwPhxo4mAe15+weUr174bO1LLXidOnjM3Nxs1YigAWFlaEgF3vlIQWd2pMxfOnPVXbuHz+DGxcXPmLpZIJGNGDePy+Ldu3wGAxxHPMrOyqzXl9p+9B4Ou3zp/5mgN5xORYuMSiAVjY+PmTZto2fLc+YBlK9bK5bLZM6dNnzbRwd4OAEQi8b79h7du2xnx5Nl3E6bevHaRZW6u/YwJiUnTZsxLTEr29W0YcP5Ew4b1AUAmk588fW71mo2Hj5wEgNkzpxKpRkMG9R8yqL/Od+F/8cquPf8q5IoB/fvUr+djZGQUHf3uatBNsVj87l3c9xNnXA/0d3Fxotw3Li5+1txF2o8vlUp1bkNo2aLZzwvnHjt+OjcvHwCYDMYfm9epR9J7dO9S18crMSnlytVrbLbVmlXL2rdro360qNdvp0yfm5OT269vr19/WdCgfl0AUCgUt27fWbhoeer7tIlTZl8JON20ia+m/qxZtykl5T35ksvlA8C/B478b9OfTo6OU6d8//TpSyLqHXjtJmXA/ROvO5fHnzNvsXJLenrmjFnzr12/7dey2dIlC52cHIuLi6/fCH767IVMJj94+LhILN66eZ2md4S+NXZOPsmxD1Ua87MTHVwbvk94onP3tFwzBVVdl6ZeRTXwLNXSTGpnJc4vpn5snFtknFtkTGzmYlfibCNyshGRE7dWFYmUXsgz0r6NlXlpZevVOLg2TIi+p9LItnVjMHWcC6EvkZenR2JspKmpyT/7DhFj7wBg6+Z1E8aPIbcRCIQvXr56+uzFBf/LgdduBl676eHhvnL5kgH9e9dSrz+g7P//1v0+edJ4Iq1EKpW+inpz+qz/Bf/LwSH3gkPuDRk8YPufG2tgoOelK9cAIPV9Wuj9hzU5drCuj1fEk2cAwDI396jjrmmziCfPLC0tGzaop+VQJSLV6aMRQgh9TT6Lh+cIIfTRBAIhUTmkaRPf1q1aEo1Hj2ubOvVdbHzYw/DBg/pbWloAgIVFed0AHk/jOH0AWLRg7v27156E3yHLcbx4+WrKtDlNmjR6EHrj7782z5hWXg7e1sbGmq1XaZqPJpZIXkW9USioyw5UN5FIfL0iz3ro4P5agv4JiUnLV66TSCTz5s5csXwxEXUFABMT458XzOnZoysApKS8P3L0lPYz5uUXTJ42JzEp2dqafeLIPiLaDuWpzeN/WTyfeHnB/4pymFinjZu3jR094lnE3V1///HTnB9nTJv091+bL188Rfxg5Bdwtu/8R9O+zZs1vRscGPEopFePbpq2MTQ0DLl5+dH9W5v+t5po0TTuoVvXTgvnzyZLptSt5zN2zAj18RZjRg1b/PNPRG2WLZvWjh45TP3Dl0ql8xcuzcnJ7dSh3cF/dxLRdgCg0Wj9+/We99OPACCRSDb/sV1TtwHg6KF/HobeJDKwiO1PnDq3dv2WGdMmhYXe2LB2Zf9+vYhVnh4UhSA+/bqz2VZBV87dv3vtl0XziJbAazejo2NPnzgYePncgnmzxowa9uP0yZf8T06fOpHY4NTp8y8jo7S8KfRNsXeiyJguyE1ycGmgz+5FfOqCVHUchZ/ULb351SvUuQ1XyIxJtQx54XjitufxW173oxwy8k2raP5sSM4yP3u3jvb/+KLKJe6YsWyYTOOignSVdjuqi4XQV4BGoxF5AEJh+Z8OdzdX5Wg7AJibm3Xt0nHJ4vkP79/8Y/M6NtsqNTVt+sx5s+YuqvkC5SrU++/m6jJl8gTyZobJZLZu1XL7nxsP7d9F3B5fDbw+d/4v1d2x9IzMR+ERxPL5C5eq+3TKlv3687ChA/38mu/Z/aemcbFFRcUTJs7Q2TG5XFENHUQIIfS5wIA7QugLJpPJJRIJWb6c/A7z+k30o3CNOYwnT50DgPFjRxEvyYA7+XWCkouLU10fb0sLFjk96aIlKzp1bH/k4B4intihfZv9+3bMnjn11IkDH1fSUX961pqvJuv/90dGZhYAWFpaLKkIdlMKDr5HjEHOoprJdkC/8uyta9dvaT/j8hVriUj6pB/GOTo6qKydOWMyMZ6ggMNZvXaTvm8D4I9Na9esWqZSkKdpE18yyBsUdFN5DLUyc3OzBvXruru5isQaE5QMDAwaNWrg6VlHLpOTLVr607ZNK2IhMzOLGGCuLj4h8f6DR21a+w0a0Jdyg9dvYoiJvDIys9QHWQ/sX77Xg7BwDkdjRK+uj7eXlwe5e3ZOzuq1m5YvXfT7il+JX7ef5sxYs2rZgnmztm/bqL77p193JoPRskWzuj7e5OfgUcfd/9yxbl07KW9mYGDw+4olddzdiJcBlwM1HRB9a4xNLc1YqtWu8rMT7Bx99NldKKYIJZubyMxNamhubS9nQX033aVvSAIRIzrF8uoj1yM3vMNe24skn2N5JRt7r8J8imeiel4UhL5cUmn5nw77iifQ6gwNDb8fP+ZqwBkiLfpq4PVR300ixr3VOrL/Dg72lBv07dOTLIJ381ZIcIjqQJaqdelyEHl7cONWSE1WQmezrf7ZtS3w0lkt+RZnzweoFCqkVFZVD0gRQgh9ljDgjhD6gpWISgCADLgPHdzf3s6WWD6mIcmdx+dfDLjarGljP7/mRAuLxSJX6TyjpPTDsH1LS4vdO7Yqz1Y6aEDf31f8qqXw90e4/+DhytUbVq3ZuGbd5jXrNq/bsGXDxq2h91VLJdSMzMzsWXMXEQMILFisQ/t3OztTV1wpVxFfLi6mqHpcr255kCU2Nr60tFTTMRKTkm/cDCaWu3frrL6BoaHhgP59iOWQu6Hv01TTJzXpRVX9HABGDh/CZDAAgMfnR756o/0gEonGnpPIqL0BaAu49+3Tk1jgcnlk6paKC/5XAGDKpPGaDkKG9AsLi9S/y3l4uJuZmQKAQqF4FxevvduSiosiEAj79e05b+6P5Comk/nj9MlLlyy0taGq4F8V1728DxUfb4MG9Sh/2JhM5pDB5eWDHj2i/tDQt8nWwVulhZOXYmTCMjG1pNxeWQlVwN3MuIai7YQeLXMauFci5k4Ql9LfJFudDvF8ncRWlNXQVCJ6snX0LshJomrHgDv6yinKyqPDhoY6Ji339vY8dfwAkVvw7l3c9JnzdP5DWQP06f/E778jl68G3ajW/ly6HGhvZ0vcyUulUv+LV6r1dJWSnZ2zc/e+2u4FQgih2oc13BFCXzAif8SoIuRtZGQ07rtRO3btA4Cbt0PSMzLVZ2W8ePEqj88fP2402UJWkdZew52gHMFc/fsyInZZrWLjEvLyCszMTE1MTOh0Op/PT0pOkclqophM+OOnJSUimUzOFwjev0+LfPX6UXiETCZnMOj9+vRauWKJu5ur9iNMGDf6XWwch1P4y88/qa9ls62IBalMVlTMddCQ9hUW9phcdtNwRuVy5JGRr8mU549jZWVZt55PTEwsACQlp7Rv11rLxmWgO0FJTqara81wr1/Px8+v+YsXrwDgvP9l9XlN5XL5lavXHOztyAcM6lq2aLZw/uxnz19OGDdGPaHewMCAbWVFzFzK0ZkRVvHTbmZmum7Nbzo2VlIl172iC+UfnVyu8We+lV8LYiE5OVUqlZJFn9A3ztbR+33iU5XGwrxUGwevjJRI7ftK5RQpKQx6jQ7/NzCAHi1z6rvxHr6x4+gqp65CIqU9fGMXn84a3CHTyLB2io+ps7H3fP1UtcaChZWjoVG1/0uK0GdC+0A3gqOjw86/t4z5bjIAvHjxatee/Yup/jGtFVr67+zs5OzslJWVDQCVqu9XWS9evIqLT5wxbZKPj1f5LdOFAJVJ5muLVCr9ZenvxNRQCCGEvnEYcEcIfcFEIhEAMJXSbSZ+/90/+w5JpVKZTH7i5LnflqlOWXn6nL8FizVs6ECyhSwpIxBUrjivejS/OsycMYWscELIyMz6YdKPcfGJ1X3qv3fuVWlp26bVgP69+/Xtped7t7S02PX3H5rWKl84TZVbACAzK4tcptOpB2bZ29uSy/qMVNDJzdWFCLjn5xd8+tFIOr9pT/huNPHt8WrgjRXLFqvUzwl7+DgjM2v2zKnaY8q//rJAy1ryYxeLJXp1GsDM1JQ6k12DKrnuBHLMuJaPjnwMI5XJCguLNA14R98aKxuK53MFuUnWdnV0BtxNjSiS2UsktXDb7GJXMqb7+3fvLWPTLHMKKzcPYV6xcWC4y4gu6ZWd2rQ60BlMKxtXTl6KSjvb9pOejyL0VerUoV2P7l3u3nsAAPsPHJ00cRzlv8LJyamvot6MGD6YbCFyIzicIi8vj1EjhtbA5KXK2GwrIuBeUlJSfWcJuBIIACOGD/ao47567SaxWBwXn/g44pn29AjSs+cvS0pEXbt0JF5mZ+eE3n+Ylp5RWlpqb2/Xvl0bLVPKk+ITEmNj44cMHkC2SGWyyMiordt2aqlpqQ+BQBj64GFCQhKXy7O2Zrds0bRd2zYMhu4qYQUcTsST5ykp74mZfuzt7Vq3atmyRbNP6QxCCKFPgQF3hNAXTFQiAgDl4KOTk+OQwf0vBlwFgLPnLv68YI7yl40nT59HR7+b9MM4Mqsd9J40VV2Zhirb1c3VxXnmjCmLlqyo7hPt3rG1WdPGNBpt0ZIVT54+B4ACDmdAvz4uLlrLyFQ1Ov3D14zCwiLtNUwAgCwr9CnIyUgFAt3jHqrQsKEDN/+xPS+/QCqVHjtxZumShcprAy4FAsDYMSNqsksAoFDUWrSOHFKiXo+eZMH68OtMJO8jBAAWbIq/VIV5qd4NKSpTqaCsHiMoYSgUBjUfvDYwgEYe3EYeXIGIkZzFSskxyyk0kcv1KheTV2wcmcjWZwrW6mbJdikuzJRJVZ/zWVrXxKNrhL44M2dMJgLufIHgYsDVmTOmEO0vI6PS0zNEInF0TOwF/8s8Pn/w4P5MBiM1NW3pb2vCHoaTR7h8Jcj/3HF9cuqrCr/iRtrWtgruxChJpdKgoJu+vg2bNW0MAH1697gaeB0Azl8I0BJwv3P3PqewiMMpfPL0ecid0BbNm3Tt0vH1m+ht23ffuXtfZdac7t06//XnRvXhd8Eh94qKuRxOYVTUm1vBdy0tWMoB91lzfibrHxIOHDp2+MgJ5RaWBevtq8egQXZ2zp59B8+c9Vep/96wYf2/t23SUq8y8tXrnbv/DQ65R6MZuLq6GBsZpWdkErdD7dq23rF9c81kCCGEEFKBAXeE0BesRCQGAMP/ZvtOnfw9EXAv4HAuXQ5Urh5z5qw/AIz7bpTy9uYVwXftk6aqq8XJjry8PGrgLPb2tt7engCwf9+OPv2H5+bmJSWlzJyz8JL/yY+u2pGXX/D6zdukpBSBQJidk0u2a/lC6OPjRS5HR8eSFcCVZWZmEwtGRkatW7X8uL4po1eEd8mJwmqGsbHx+HGjibEFp89cWDBvlrFx+RMjgUB46/addm1bU34CWggEwjdvY2Jj44u5XIFAUFhYVL5C7y/h+pTN0e4jrnv5qSt+y7RsyVD6aSyVSjVthr41DIahGctGyP9P6SQ+L8/cUvcYCMrJUaVyWjbHxMWu1h7qmJvImnoXNfUukisMcgpNMvNN0nLN8op1ZLBGJbJb1C2iGVTut9jGQuLuoOPfRCNmJZ46W1g58oqyKdqpnosghNq1a2PBYhGD9kLuhJIB91NnLhB3syQ+jx8TGzdn7mKJRDJm1DAuj3/r9h0AeBzxLDMrm5hVvgYUFhZlZZf/jvu1rK7E6uCQ0PwCzswfywvIjBw+mAi4B12/tXb1cgsLC8q9Nm7e9i72w7w1hUXF27bv3rFrr6uLy6yZU328PKUyWfjjp4FBNxQKxb3QsO8n/Rh0+ayR0X9qea1Zv/m/pXJYymvbtW1laWlBp9ND7oTm5uYBQPNmTdq1bUWj0el0Gp1Op9Fo5B2dOv+LV3bt+VchVwzo36d+PR8jI6Po6HdXg26KxeJ37+K+nzjjeqA/Zb7LufMBy1aslctls2dOmz5tIvGcQCQS79t/eOu2nRFPnn03YerNaxeVM40QQgjVDAy4I4S+YCKxCJQmTSW0aN60Q/s24Y+fAsCxE2fIgHtxMTfw2s1Wfi1UxopaVmS48yuZy1yLAffmzZo8uHfdvKbunu1sbVavXDpn3mIAeBkZtXP3v5UtJ5qWnnHB//Llq9eSklIAgGVu7uPjZWZmRm6gJZzap1cP8jvntRu3hg8bpL4NOVvmyBFDbGysK9U37ciJwqqEPiHuST+M2/vvYYlEkl/AuRhwdcL4MUT7tRu3+QLBmFHD9DwXj8e7EnjjYsDVl5GvZDI5k8n08fGyt7Mli6Hrn/X20T/qn3LdVU5dgyl66OthasZWDbgX55pbaJs2gKApqh6fwarFgDuJTitzsS1xsS1p05AjFDNSs82iU60KuNR13sWl9Mx8Ezf7ynXbni1u71uVBbXMWDYCXp56u7EJS70RIcRkMFq1akEkub94GUXOULJowdxZP04xNjbu1LWfVCoFgBcvX82Zt7hNaz8iLzv88VMi4G5rY2PNZtdYhy9dCSJmGGIw6GNGDa+2swTSaLRhQ8pTy7t16+zgYJ+bmycUlgRcDpo8kXpK+Z3bt9AZjOzsnAkTZwBASsr7fw8cWf37sskTx5PDKH+YMLZ/v15zflqsUCiio98dPnpKpS78vj3bmUxmSkrqtB/nqZ9ixrRJxMLQEeOJgHvbNn4rf1ui5/vauHnb9KkTFy2co/zMYOqUH8aOn8Ll8vILONt3/vPnlvUqeyUkJi1fuU4ikfy8YM6SxfPJdhMT458XzHkZGXXn7v2UlPdHjp6a/9NMPXuCEEKoqmgcoI0QQp8/YtAlk6n67HDq5B+IhTdvYx6Gl4di/QOuiETi8f9NbwcA84p6FJUuKfPJab8fzdDQ0MfbS0uRjSo3bOjAbl07Ecu7/zmgnCiknVBY8vvq/3Xo3Gfb9t0yqWzJ4vm3rge8e/v02tXzW7esIzfTEni1tLRY8dsvxPL1G8HkBSXFxiUEXrsJAPXr+axc/ov+b0ofZVVaTUWfGLeDg/2QQf2J5aMnzpDtly4HWlhYDK5YpUVZWdnxk2fbdOi1dPnq2LiEHyZ8d/7MkfiY53duXTlz8hBZk0f/EPZHBNw//bqrnLomB8Wjr4YRVTBXWipiMnVkhdtaSlimFKMl4tIteCWVG99TwDWKSbVU/y8pizrQrFAYSOU09f80Hd/MWObryR3T/X235rl0DeVuCis552p1YDCNSiUUQX+moUnNdwahL4K3lyexIBaLMzLK57NxcXGq6+NtacGSVozoWrRkRaeO7Y8c3ENkN3do32b/vh2zZ049deKAqWkN/X7FJySSE/9MnzrR07NOdZylsLAo5M79jh3aOTuX53ozGYyhFXVdzl9QnZOZ5OvbsEH9uuT3BSaTefjA7mlTflAuWggAQwb1Jyd5unjpqspBmjRu1KB+XQZDR8IimahhUJm79D82rV2zaplKhn7TJr7kNE5BQTfVp70JDr5HNGZl56gfc0C/3sTCteu39O8JQgihqoIZ7gihL5iopAT+W8Od0K9vTx9vr8SkZAA4euxUpw7tAODchUtstpVyvUWCZcXdbWWrdddiYWt1AZcCfX0b1q9XuWIjlbJh7cre/YeJRGKJRPLbynUXzx/XGfFPTk6dNG02kd386y8L5s6ernyxlGPZBqAtnPrDhLGFhUVbt+1UKBSz5y7asnFt/369iAjs02cvFi5eLpFI6tX1OXLwHysry096k2p0xprptPJva/rU9Nczajx1yvcXLl4GgOjodw/Cwrt07pCZmf3wUcSEcaPNzEy171tSIpo5Z+Gdu/cBYMig/hvWr1Speq/PNKQq5PLKpflX1XUHpS+uNANMEUCVZmRspt4oLRUxDI2lUh0T9no6CV4nqSaHKhQGoZEOgztk6PnbI5XRbjxx5lPF6FvULfR2pnjKG5Vk9TiaIgd/xqBEJkPbb2IjD65ESn8cTVE6WSiu/Rt+OsNQLqN4hkGnf2SBMoS+epaWH8KvuXl5ylFsSalUebPdO7YqD/ccNKDvoAF9a6aTcrn88pVrGzZu5XAKAWDwwH7Lly2upnNdCbwukUjI9HbCyBFD9h88CgCvot68inrTvFkTTbtLJKXEgomxcaeO7Sm3GTl8CDFfTkxMbG5unvo07GKJjgnnyZscnXc4ynr16q6pP+vWb5HKZDw+P/LVG9U69RX/FBUXc9X3JSsQxsbGl5aWqgwIRgghVN3w6ytC6AtWkeGu+nWdRqNNmTSBWL4dfDc1Ne3Z85fR0e9GDh+inuzDIjPc+V9MSRl1a9ZtjoyMqtZTeHl5zP9pFrH85OnzY0rJ15REIvHkaXOIqOvPC+YsnD9b5UqRtU1Aj2zrBfNmHT6w28TEmMMpnD5zXqt23YeOGN+hS59hIycUFRXP+nHKjSB/Dw/3j3hf2il0hdGNjctTR3V+BwO9Y9zNmjbu2KEtsUx8zpevBikUCn3GaC/9bTURbe/Usf2eXX+qzzErI0vK6P9VsDI/6lV73THDHX0K9Sk6AYDOMKRsV9HEk0s5P2pGvmn4W91FaQCgrAzuR9lTRtsNDMDXkyI+AhrKxwNAfrHuLHUvqgg+ABhUsoB7dZBJJXQGxUeh88kHQt8s5YC7WPyfv1rKt6Crf1+m82F8VSko4Fy7fjs45N6Vq9cOHTmxZNmqth17zVv4a25evrub6x+b1+37ZztTVw74R7t0OcjY2HhA/z7KjU0aNyInFNWS5A4AiooPTa6Qa9qmVasW5HJCUrL6BjqzK8hLQ6NVwX2LlZVl3YpkmqTkFJW1E8aNHjliSLeunX6hqvTIZlsRC1KZrIgqIo8QQqha1X7CC0IIfTSRWAwAlKM7x44ZsX3HPwUcjkwmP3r8NFEBfJxaPRlQCrgL9Ai4K3/D+XwC7nyBoLCoqAZSV+bMmnY16Ma7d3EA8MefO/r16enk5KhpY/+AK4kV31XI0paaaA+nlpSIVq3deOXqtX59e/k2bKAoUxQWFpVKpfZ2dp6edXr16GZioqNABEnPq0ZupTPgTo6QIEp2aqd/1HjKpO8fhT8BgOCQuxmZWYFBN319G/r5Nde+V0JiEjFjMABMnTxBZax0ZTtDflaV+lGvwusOyunwmrf8fH4T0edGIqGY9tPI2FxaKtK5r6V5aaM63LcpVuqropLYEim9W/Ncyoh8+amltJAXTu9zKFLsAaC+G8+CqmQNaA64v02xcrbV0W2ZhsozLNManfyZkrRURFk9RkpVZwYhBAASpSC7lns8N1eXGukOAEBcfOKMWfOVW8zMTGdMm9SpU/vuXTszGNruOj5RQmLS8xeRgwf2U34OQRgxfPCbtzEAcOlK0MrflmgqpFOmxwg/lrm5vZ1tXn4BABTkczRtpgV531hVhR/dXF1iYmIBID9fdV4NS0uLXX//oWlHpuGHZ5zq5WgQQghVNwy4I4S+YHy+AKhquAOAqanJ9xPGEAUlz567qChTdGjfpmGDelqOVszVnf0hl30IW+gMxap7/SbaxMS4ro+3HieqxMyWERHPFAqFkZHG/EeJRBL1+m2dOu5EfU9t55UrxWXUTs1kMv+3buWosZMUCgWXy1uxasPhA7s1HerFi0higc22oqz0ovxVRMvblMvlk6bOehT+5MzJQ127dNTef51kSldQ20krsp8UuoK5ZFq9lrr2paXlo5j1r4vSt08PLy+P5ORUmUy+YeOfr99Er129XOdeL168IpddXZ0pt6FXfOw6f7RkMvJDqMSPelVdd4Kk4qPTdrH0u6boGyQRqT5GNWPZCPn6zgXaqgEnLt1CKqP4tY1Ns8jmmLRrVODpLKD9N39cKqfFpVm8SmBrqvZubCjv0Dhf00kd2GIjQ7mkVDVulZjJcmCLm/kUaekw5eMBAGCZUAf3a1KJoNDBpYF6u1hcubFlCH07Cos+/L5bW2uc/lSfinZVpZVfi53btygUishXrxcsWqZQKITCEhsb6949u1X3qYlKL4MHU8xkM2zooI2btkllMi6XFxh0Y+yYEZRH+JB7rvVmzMLCggi4l5R8zOPAKg+4m5uXP7itbOlLhBBCtQsD7gihL1hmZhYAmJubU66d9MO4vf8elkgk5entYynS2wGgoKCQWODzBQqFQvv9sVDp5lt7+rC6xb+uPHPWHwBWLv9lzuzp2jcWCstPpPN+XSaT7/33MAAYGVNnPwkEwpFjfnjzNsbc3OzwwT1ERXud5wUNX0jatW09edL4w0dOAsDNWyHn/S+PGTWM8lDSijBoUVExh1NoY2OtssGlK0HkspanBTduhTwKf2JiYty5E3XBzUpRnhpXy6hn8nOg6/r8mzUtrxaakvI+Ovqdr29DlQ1i4xIOHz1JLDOoHg5RotPpk34Yt3rtJgC4Gnjd2Nh45PAhOvcqlX4Iq6W+T2/s20hlgzt37xdwyjO2tHzmhBJReTotWadeH1V13cv7UFLeBy15c//9rcRaeeiDooI0lRZLaxdeMcXkcpRMjeQ9WuTeeuZEuZYrZN565mRsKHezL7E0KzUyVAhEDK6Amc0xlUi1/Rx2bppnbKixoAGNVubjLIhOpXhYFR5tVyqjNfUuMmKqxtfkcoP7UQ6xaaqJnwBgxFS42lU6bJSeZ3Y9QkfarLNtSXOtDwCU8Xl5dRtTFCnmF+dAnaaV7R5C34KExPLhYkZGRt5eHpo2q8lhXkZGhkSegZeXx/u09D//2gUAm//Y7uXlUa1V4xUKxZWr1y0sLHr16Kq+1sHernv3LreD7wLAef9LmgLuHxJltD6bJ/N4lO+pKtHVDyVlquaGhLwRlUp1j1XKyy94/eZtUlKKQCDMzskl2zEdASGEah4G3BFCXyqFQvEgLBwANA0ddXCwHzZ04LnzAQBgZ2szaCD1N4EHYY/IA4pEYu11MKOjY8ll/cuYAEBMTCwRbQeAP7fvnjF9knrpeVJ6RmZKaiqxbGiobUK5rKzs39dsjHjyDACMNcQuz1+4RIy0FQiEu3bv1x5wD3/8lFw20jB+efmvi8LCHickJgHAqtX/8/Ks08qvhfpmvg0bXLpcHlrdsOnPPzavIwPcycmpazdsCb3/kNyYxWJp6lJsbDwAiETiJctWTZv8fb16dT9lzHJ0zDtigUajabrWCoUitiJd3cSE+qeL1K1rJzbbqqioGADW/W/riaP7lMd9B4fcW7xkJfkdT9PPKqXvxo786+89XC4PAPr17aklu43k2+hDuH/nrn87tm9LVvDkcnk7d+87cOiYQcVzFAsL6idVJGIIMwCYVKbbVXXdAaCsrCwurvxCaAnNK/9WGhtX4rcSfd0EPIpMdmu7OsWcDP0P4u3Cb803fBarOhcCSVxKT8jQ9mOsolUDTl1X6krrpCZexe/SLBQK1fhIWRk8i7WJSmLXc+VZmZdamMkMDMqEIkY2xyQlx7xUQ5S/rhuPTq90PE4gYghEOr4mGDI1PjZQxy3MZNtSTLPBLcyqXM8Q+jZIZbKnz14Qy34tm2m5aaytumrzfpp541ZIdPQ7AFj5+/p2bVupTxtTVcIjnqa+TzMzMx04ZAzlBoWF5Q//Hkc8i4tPrF9R91xZme4adVWgyjPcPxxZ83DDtPSMC/6XL1+9RsygwzI39/HxMjP7UNMMA+4IIVTzMOCOEPrySGWyO3dCL10OSn2fBgDBwffevInhCwRLFs1zdv5PKuKMqROJgPuokUPVA3YvI6Nu3b6z79/DZMuGjVtlcjnbyuq3ZYtUNhYIhBFPn239ayfZEhh0EwA6tG/bvl1rnX0u5vLIZbFYLBKJKL87ZWVl3wsNO3DoOFnN411s/NHjp+VyuVwul8nkFQsyLpcXn5AU8eSZtCIBR1N9Ty7vw6m1DEd98zYm9P7Dffs/fBpnLwQEXAlkMphrVi1T3tLMzHTPrq2jxkzi8fk8Pn/MuCk/TBjbsUPbbl07Kfdh/LjRh46ezM7OAYBz5wNevoxq3bolACQkJD17/tLO1ubMyUPfT/pRLBYzmcz9B48KBAIPjzrq+fJubq7Ewpmz/mfO+jMZDEdHBzbbytzcjMViWVuznRwdfLy9mjVt7OlZR9O7A4CiouKwR4//2Xuw/F2Ymh44dFwoFA4dMqBe3Q9fzN69izt+8uz7tHTiZXJy6s7d/zKZzNkzp1Ie1tTU5Jef561YtR4Awh6G9x80auSIoU6ODtk5uXfuhj6OeDZi+OCB/ftM+3EeAGRkZO3as5/H4w8d0l89/VwFy9x87OgR+w8eBYCxo6nTtVT4tWzWq0e3kLuhAPA2OqZrj4Fdu3Y0NzPLyMwKf/xEKpWu/n1Z6P2HxKyqwSGhT56+AIDFanNt5ebm3bl7/1zF5GMGBgb/7D0oEAp/mDBWS9V+QlVd9/iExNNn/GPjEoiX6emZu/bsVygUC+bNIrdR/60MuBQolUq7dO7QulVLfT4x9BWjDKxb23kkRodW6jitG3CEIkbMe4qU88ry9eC2aaC7KLC1haRVvcKnGqL8pVKaptIx6kyM5H71CivRxWojl0l5xdlsW3eVYQeVev6B0LcjLCycW3Hr2Kd3Dy1blkHtBNyZDMb6Nb+NGP0DAOTlF6xdv0VLPfFPRNST8fbyZLHMGQyGIZPJJP5nMJiGTEMmk8lkBlwOJMLu585fXLVyqfpByqo695xSWbUF3D/MaqNEKCzZ/Mf2I8dOKRSKOu5uSxbP79Wzm2+jBjQa7X1aevtOvYnNMOCOEEI1DwPuCKEvD5/HnzrjQ4gw6PotYmHmjCkqVasbNWrQvVvne6Fh478brX6cff8eJvclHDtxBgAa+zZSD7jff/BIZZ6obdt3A4C5uZk+AfeWLZp6etZJSXkPAH379LSwoBj4DwB3Q8N+XbZKuSXgUiDxNUMnTSnA/fr0/HvnXiIuP3gQRe1Lwv6DR8n5NgmnTp8HAHc3V5WAOwA09m108MCu6TPm8fh8sVh84NCxA4eOvXgSqhyNtbKyPHX8wPyFS99GxwBAQmISkRRPo9GGDxu0YtliZ2cndzfX+IREqVS6YeNWABg5Yoh64HXEsEEBlwLDHoYTL6UyWXpGZnpGpvpbqOvjPXbMiMkTx1Mmkp/3v7R2/RbyJV8gIE7aokVT5YD7lOlz09I/BIBC7oaG3A2t6+OtKeAOAFMmTxCJRH/v2isQCN/FxhOHBYB6dX0O/rtrQP/ecfGJRMvTZy+IhLXmzZroDLgDwORJ4w8fPeHq6qJ/OZ3du7YuXrLi2vXbAFDA4ZDX1M+v+ZqVy/z8mickJBEtBw4dAwAnJ0f1gPuevQcPHj5OvszJyd2w6U8A6Kt1mlxCVV33n+b/ShyBEPYwPOxhuL2drXLAXf23cvMf2wHAxsYaA+6Ik5us3mhj7xFxl6Jdu24tctms0vBou09JJG3XqKCl3rHvlvUL84qNUzXMuaonAwPo2TLHzLj2Z0wlcPJSbRy8VALuvOIcmVTMYOLYFIT+g7gjBQALFmvMqOFatlRQxWFrRru2rcePG336zAUAuBhwdfjQQT26d6nys5SUiK7fCLaztQm8ck5LMUC5Qn7k6CkACLgUuHzpIvW8FjJDvHoD7tUW1lcfypCcnDpp2mwiq/3XXxbMnT1d+V0rB+gNAAPuCCFU0zDgjhD68lhbs7PSYnVvBwAAa1YtmzBujLe3p/qq/ft26H/SgQP66H9SdcbGxv5nj504dc7c3HzKpAmaNvt+/Jjvx1OPlv1oDRvWDzh/4vrN276NGo4YPljTZrv+/qNSqUmdOrSLjX6mfZsG9evevOYfHvE0MvJ1fn4Bk8lwc3Pt3bO7i0v5QITQO0HajwAATCbz1PED+w8e3bBxK4NBJ3P/1SUkJm3YuNX/4uXjR/91dVGdMnTmjCkzZ0zRebqIRyE6t1E3Z/b00aOH3733ICkpRSQSOTjYtW7Vsk1rPyKlqH49n4/74fGo4/78yX1DJlP/r20WLNaBfTvfxcY/Co/IyMgqKytzcLDv1LFd0ya+xAabN67ZvHGN9oOsW/PbujW/fUSHCVVy3W/fCNC5zSf+VqKvW35OokqLpbWLuIRXKhF+xNGa+RSxWaX3o+z5GqZC1cLCTNq1Wa6bfSUKqdMMyvq1zbr70iE+nfrprE6GDEXvVtnuDh/zZqtJQXaic50m6iMM8nMSndwa10aPEPpMPQyPCA65RyxPm/oD5QzkpNoqKUNYsWzxnTuhuXn5ALBy9YaQtlcqVT1PHzduBvN4vInff6cl2g4AI4YNIQLuefkFN26FDFFLMSE/qJqJPiuqejJblQOKROLJ0+YQ0fafF8xZOH+2yvZy+YcbZkxwRwihmocBd4TQV66uj3ddH+/a7gUAgJOT46+/LKiVU/v5Nffza14rp6bRaJ06tNNeOF6nc+cv7ti518nJ8cjBPfXr+eTm5fN4PIFAyBcIi4uLc3Ly4uITnj59kZGZBQCxcQk/L15+4eyxKnoH+rKztRk7WlsO2sext7P9iL0aNqjXsEG9Ku+M/qrkuiP00WRSifqMqTb2npy8lI8+pruDcHyv1DfJVi/irSWles0kYWwob+xZ3LJeIaPyVdRpBmW9/HLqOAgfR9vpLKeu3tWOjfPZrNLKnrRa5WXHN2tHUR2rICcJA+4Ikbhc3vIVa4nlhg3qzf9ppvo2ykH22g24s9lWK377Zf7CpQCQmpr25187Kcu5fIrLV68BQN8+PbVv5teyWcMG9d7FxgPAxYCrFAH3ioC19uiz9s9T56dNjjcVCnU8ZNXzwpFbqQTc/QOuJCaVD9iaMW2S9oNgSRmEEKp5GHBHCCH0WTty7NSK39cDwKGDu4k0bfeKqu7KysrKgkPuLVn6e34B51H4k/iEROVCMQihb0pBbpJ6o62jd0EORbv+6LSy5j5FDetwU7LNU7PN0/NMpXKK0SdMusLRRuzjwq/n+jETliqr68r3cBLGp7Hi0i1zCnXUXTFkKuo4CBt7FjvZiD7lpNWkRFAol8tYlg58bq5ye3626lgEhL4y8orBeTpzq4XCkh9nLyTSlu3tbA/s20lZMFAu+1AqSs9M6vdp6QUFhc2bNabTKz3zvPb+jxox9NLloHuhYQBw8PDxwYP6t2jeVH2zoqLi+ITExr6NNE1ZTyk3L//Bg0dstlWnjrof4Q8c0JcIuD8IC+fxeCr1GyWl5ZMeaY8+kyMpKTfTvhYAyOEI2Tk52nsrU7qIWrokV5SfUfHfAP2LF5HEApttRTkGQnlwJAbcEUKo5mHAHSGE0OergMPZuHkbALRu1VJ7urSBgUGf3j0kpaUzZy8EgMTEFAy4I/TNys9OUG+0dfCOjbr96Qc3YioauPMauPPkcoNCvpFQzBCK6WIJ3ZCpMDaUW5hJ7awkNIMqyzll0hW+nlxfT65AxMgtMs4vNuaXMEtltFIpjUYrM2QoTIzk1iyJjWWpk7WIRqv0eUd1Ux0KUH3ys+NtHbxUAu6cvBS5XEqnV7pWD0JfipKS8mRnA60F4lJT0+YtXPLiZRQAeNRxP7R/l5eXB+WWwpIP2dP6BNDPnrv46/JVMpm8T+8eRw7uqWz4VWf/N/1vdZ9+w3l8vkwmX7JsVdDls8bG/3lA+OZtzIQfZhRwOJ6edS5fPG1nSz0ptLrzFy5JZbL+/Xqr12RX17pVC2JBIpHcvRc2bOhAyndB11qaRiAsr8RF+cGWiMofZ9I0fOwN6td7EBYOAM+fR5aVlSl/1A/CwuPiE8hsdB6PT67SUi2HzJSn//fDl1bE64uKijmcQhsba5UdL135UL5P0zxPCCGEqk81ThiCEEIIfaJHjyKIbxr16+kVPW/XtnwCW0zlQehbpp40bWzCMjQy5RVlV+FZ6PQyOyuxh6PA14PrV7+wiVdxXVe+A1tchdF2ZeYmMm9nQbtGBb1bZQ9slzm8c/rQjhn922Z1a57b1LvYxbbkI6LtNawgJ8nGkaLIG+UMtwh9HWQy+fOKZGRjI0PKbbKzczb/sb3PgOFEtH3IoP5XLp1p2LC+pmNGR3+Yv8TERPecwxs3/0WkZt8Ovvs4QscEPFr6b2RI3X93N9eVK5YQyzExsb8s/V0q+890zbv37C/gcAAgJeX9yVPn9Dw1h1N4+MgJAFAJnWtSWFhELr+KeqOyNi6u/EGslk8sNzcvJ6f8iaAR1cWKiYnVfhBy2tj3aelnz10k228H35390yLi+hKiY94RCzQaTVPWv0KhiI2Nrzjjf4rj+zZsQC5v2PSn8geenJw6aersHbv2kS0sFovy+AghhKoPZrgjhBD6fCkU5fEjjtKXKC2ysrIBgEajNWuKFYER+nap12pn27qrV3VHNayYk+FZv4N6e2H+e3tnjbFFhL5QIpH4dvCdCxevvKuImWZm5+z+Zz+TyWQwGABQUiLKy8t/8zbmZeQrIiDeuVOHObOmde3SUdMxBQJhxNNnW//aSbYEBt0EgA7t27Zv15pyF6lMxuXxlI4g+Pj+Z2WtXb9FIBQOHTJAZdzh9+PHPHv28sLFywAQcCkwOTl1/LjRrVu1JBImirkfOsDn80EXHp9/O/ju3n8P5+blMxmM0NCw69dvGxoarlm1jHL7tPSMe6Fhe/45QLaEP366dv0WHp8/Z+Y0c3OzO3fvn7twiVglk8r27D0gFJZMnjSBnClHoVC8jIz66+895BGePH2RkZHl7uY6csQQAMjNzdN5EADo3Kl92zatnjx9DgBLlq26FXzX2cnxbfS75y8iW7ZotnXLOgAoKioOe/T4n70HiV3MTE0PHDouFAqHDhmgPDrz3bu44yfPvk9LJ14mJ6fu3P0vk8mcPXMqAIwfN/rQ0ZPZ2TkAcO58wMuXUa1btwSAhISkZ89f2tnanDl56PtJP4rFYiaTuf/gUYFA4OFRZ8yoYTo/fIQQQlUCA+4IIYQ+X61atWAymVKp9F5oWGJSso+3l5aNFQrF9h3/AMDokUOdnZ1qqo8Ioc9LYf579UYrG9fiwsya7wxSxi3MZNu6q7dTXjKEvnSZWVmzf1qs3BITE0umSAOAiYmxBYvl5OQ4bMigFi2a9uzRlXKWGmX3HzyaMWu+csu27bsBwNzcTFPAnclgDBrY99LlIABwc3Vpp2Ezffr/LjaeCL77tWimvv2ff6wXiURB128BwKuoN6+i3vwwYeyWTWsBYOCAPmEPw4nODBzQT+epY2PjiYlYAUAqk/2z7xAAeHrW0RRwDwq6uWHTn8otb6Nj3kbHAMDY0cOPnThz8PBxclVaesb/Nm0DgCGDB5Cx8uJi7pDh45SPcPrMBQAYOmQgEXDfs/egzoMAgIGBwd7d2yZPm/P6TbRCobgdfJdoHzZ04OaNa1jm5gBw3v/S2vVbyF34AsGGjVsBoEWLpsoB9ynT56alZ5AvQ+6GhtwNrevjTQTcrawsTx0/MH/hUuJtJiQmJSQmAQCNRhs+bNCKZYudnZ3c3VzjExKlUilx/JEjhmDAHSGEaoyBbcMetd2HL4Ofj+GEHuYaVtJGT9+pYRW1e4F/FWgYPNtzyC/W9h6VOlpSzIOX4ecpV9X17da8/ahKHQ0hhD4rW7ftJMLoHnXcd2zf3LpVS8rNMjKzVq7acDv4bqeO7Q8d2EV8pUEIfYMSYx5Eqt0Xte0+OTczNjU+ola6hEgDxq57cHO3gJun3Ghqzh743fra6hJCXz2JRHL0+OniYu6E8WNcXZxrpQ9Xrl57/Sa6b5+ebVr71UoHapJUJgsJuRf56o1EInF1de7ds7uHB8Wzxk+nUCjCI55GRr7Ozy9gMhlubq69e3Z3ccGkE4Q+d8WFmcEBmyhXsW3dew37tbIHvOW/gVdMPVdzv9GrWJb2+h+qVFJy5QR1BwxojJ/35VGuQuowwx0hhNBn7ZdF8wwNDXfu3pf6Pm3oiPGdO3Xo3q1zg/p1LS0tFIoyLpebnJL65Onz28H36HT6rB+nLF+2WMvcUwihr55KMJfANDSRiPQtpICqT6lEyGSqTt9XIiiSy6R0Bs6bilC1MDIymjljSu32YeiQgUOH6FWK/SvAZDD69+vdv1/v6j4RjUbr1KGdSnkfhBBCnwMMSSCEEPqsGRgYLJg3a8yoYWfOXbx770FExFNiVDKJRqM1beI7e+bUyRPHOzo61FY/EUKfCQEvX72RzjCUySQ13xmkQiYrpdMpAutCAcfCyrHm+4MQQgghhFCVw4A7QgihL4CTk+OihXMXLZxbWlqalp5RUMARiyUMJsOGzXZ2drK0tKjtDiKEPheiEq56I53OVCjkNd8ZpEIhl9GoAu7iEi4G3BFCCCGE0NcBA+4IIYS+JIaGhj7eXtpnT0UIfdPKytTbhHyOhZUjR8MMOqjGmLFsSgQcqjUGNd0VhBBCCCGEqgettjuAEEIIIYRQ9SrmZFjZuNZ2L751dAbT3MJOwCtQX2VggAF3hBBCCCH0lcCAO0IIIYQQ+nowDU3UG4sK0hxcGtR8Z5AyR1dfTl4K5SoG07iGO4MQQgghhFA1wYA7QgghhBD6eljb1VFvzMuKMwAD5zpNa74/iNSweb+kd2GUq9i2bjXcGYQQQgghhKrJ/wEAAP//7N1nVJTX1gfwAzMDMzSBofcuRUWKolRBVLBjLzexRKPGFjUxGlMwN4maYonXRI2JGgUREEEiKopdpEhXrEhvA0Md+gDvB+7LNfDMMCAO7f9bfmCduh/XEpnNefZBwh0AAAAABg9lNQPK9idJEZY23uKNBf5HXdtcSpqV/TK2c9cwJS3xxwMAAAAA8I4g4Q4AAAAAg4eGjoWUtEzn9pxX8ZI0utnIieIPCaSkZWydFqfEXqTs1TawFnM8AAAAAADvDhLuAAAAADB40BlMY0tXyq7YmydH2M9AMXfxc57yEbc4Iz8ruXMXjc4wG+kh/pAAAAAAAN4RJNwBAAAAYFAxtZrAoLqEs7K8IDX2ouOkNSrqRuKPashy9PyQyZJPfBBA2Wtq5U55zy0AAAAAwACFhDsAAAwkKamPgy6EJiSm9HUgANB/STPlRjvOp+x6lX4nN+ORi/dGVQ0TMUc1NDlNWqOqafIg8hif39i5V05BxdIWhfUBAAAAYFBBwh0AALonKTm1D3ffvuOrzVt2cLncPowBAPo/A1MHNa3hlF2P7vllvXjo4r0BtWXeKRqd4eK1XllV/+alnyrLCyjHjPNYSaMxxBwYAAAAAMA7Re/rAAAAYCBpamr6aMO28LAAFTa7y8GPEpIys7LfbKFJ0gwM9MxMTeTkZHuwe1x8QtrjdD1dnYkebl0OzszMvn33fn5BIa+ap6urbWRoYGtjra6uJuJeD6JjHz9Jz87O5fP56upq+vq6XpM9hYTd+WE7YDKZM6Z5ibg7ALy98RM/uBPxSwU3r3NXUnRgQx3P1XtjzK0/czMSxB/boMeQYrl4rWcwmFGXfqrllVGOGee+QklFT8yBAQAAAAC8a0i4AwBAN1yOiMzOyQ0MvPjRulVdDg6+EPbXWYqivZKSkvPnzd61c5soWfs3+Z8LIoQsXjSPRqMJGZaQmLJn38/RD+M6tDOZzMWL5q5b84GOtpaQ6Q9j4vf+cCD+UWKHdgUFhZXLl366bZOEhETnWYIetp2WliYS7gDiJCUtM2H6x7f/PkiZc09PiigryXRwX8lkKbx8fEv84Q1iTJaC29RNVRVFd+/8RVlJhhDi6Lla28BazIEBAAAAAIgBEu6D3Msnt18+ud2LC5pbTx45ZmYvLggAA0tbytv/fPDaNSslJUWqS+Y1xXO42X9rJbe2thYXcxISU84HhkRF3bkYfNbY2FDErcvKysMvX2UwGAvn+wgZduS33/fsO9DS0iItLT3Rw9XK0kJaSiovv+DpsxexcY9OnvI7F3Dh8MEfpk2dTDk9MSll2cq1PF7NiuVL3Vychg83ZbFYHA7n7t3oP06dPfjLb0XFnP0/fidod5/Z060sLSi7ZGRwKyCAuDEYzAnTNt+9eqSMk9W5tyjv6fWLe5wnr2PJDEuNCxV7dIOTvKK6q9eG18/uP02+JmiM85S1mrojxBkVAAAAQM/wqkquBO7u6yhggEHCHQAARPX02Yv70TGEkNevs+7cfeA+wUWUWd5envPnzn6zhc9vPvjLr/sPHtm8dcfF4LMMhkgFfAODQ+vq6mfOmKqhoS5ozJ59+w8fOU4ImeTp/sOe3R0KyEQ/jDtw6MiD6NiPNmz9Ye83CxfM6TC9ubn5w3Uf83g1vx7+efasae3taqoqI6wsZ8+aNm3WwoDzFxYvnDvG3pYygAluzh0eFgD6FkOK5ea98c6Vw5Q591pe2a2/9ztPXjfOfWXMrT/FHt1gw1Y3cpq0JulhoJBCPci2AwAAAMDghktTAQBAVH7nAgkhH65a3v51z9DptE+2bpzg5pyYlHI5IlKUKa2trecCggkhSxfPEzTmUnjE4SPHmUzmvj27T//5W+dy7Y7jxwYFnN752dYmPn/b9i8SEpI7DHjxMqOgoNDCYvib2fZ2Wlqae779av261VwudT1iAOif6AxpN+8NggqYNDXW3fp7f2Njrdu0zXS6lJhjG0w0da3Gui17EHlUULadzmC6Td2EbDsAAAAADG5IuAMAgEh4vJoLIZfU1VQ/37F1hJVl5PWb+fmFb7NgW0HztMdPRBl87/7Dl68yTE2MnZ3GUw6oq6vf/e0PhJDv//3le0sXCllq4/oPF873aWlp+ea7H1pbW9/sevwknRCirakpaK7XFM9dO7d5TfEUJWYA6D/oDKaj52pbp0U0GvUrNYkPAvIzk128N9IZ0mKObXDQMbQdYT/jZvhPXE4m5QBZefYkn8/UtMzEHBgAAAAAgJgh4Q4AACK5GPZ3ZWXVvLmzpaSkFi7w4fObz50PfpsFtbQ0CSFZ2bmiDG6rHb9k8TzKC0sJIecCggsLi9wnuCxaOLfL1fbt2b1j+xZXF8f8gn/8zkBVRYUQEhMXX1tbJ0pUADCwGFs4u8/YIiUtS9n7Kv1ObsYjV++NNJxz7yZtg9GWNt53Ig431FVTDlDRMPac/ZmcgqqYAwOAoebGzdtBF0Jz8/L7OhAAABjSkHAHAACR+PkHEkIWLZhDCJkzewaLxTx3/kITn9/jBV9nZhFCjAwNuhxZVFR85doNFosppDx6xNVI8v/lbrokJSW1acOabVs26GhrvdluazNKhc3m8WqWvr+6qKhYlKUAYGBRUtGb5LNDQVGDsvdV+p3KsoLxE1eJOaoBTUXdyN5lSXTU740NNZQD9EzGuE/fIiUtI+bAAGCo4ZSUrl6z+bOdviwWs69jAQCAIQ2XpgIAQNfi4hNS0564ODsaGxsSQpSUFKd6T74QculaZNT0qVN6sGATnx8YdJEQMmqUVZeDAwJDmpqa5syerqysRDmgtrYuLj5BVlZm/LgxPQimnYKCwqEDe5etXBsb92iSt8+8ObO8vTztbEfTaLS3WRYA+hUZOSWPmdtu/32wooziCGTywyBPnx3DR3o+T7sh/tgGHDqDOc7jg5TYi7xKDuUAK7tpljbeYo4KAERx5ep1Xk3NNO8pMjKszr1NfH5o2N9SDMasmRQX27Rrbm6Oi0+MiY0vLubU1Naqq6mamhhPnOimwmYLmZWdkxsX/7/LHiQkJBQVh6mrqVmYD6fTe/5D1/nAkIaGhrlzZgrZvbW1NTEpNTY2nlNSym/mGxkYGBkZjB1jR/mX0MGD6NjHT9Kzs3P5fL66upq+vq7XZE85OYq3ph4lJGVmZQtZislkthVXBACAQQkJdwAA6JqffxAhZPEb1VoWLphzIeSSn39gDxLu1TzeF19+m5L6ePy4MVO9Jgkf3NzcHHD+AiFkyeL5gsZwOCV8frOJsbaU1NsWgnCf4BIeev4r3+/jHyUe+/3ksd9PstnKLs7jJ3t6eHi4KsjLC58eFBQaG0d9W+AYe9uF833eMjwA6BUMKZbbtM23wvdXVRR16Gpuboq/c2birE/zspJqqrl9Et4AYu0wp7qyOOvFQ8peO+fFRuZOYg4JAES078dDL16+Gj9uLGWuua6ubvOWHWy2sqCEexOf7+cfePjI8cLCjt9I6XTaVO8p27dtMjIyoJybmJiyecuOzu1KSooe7q5rV6+wsrLo3sMQ0tLS0lbtcKmAnxhbW1vDLkX8uP+XzMyOqXB1NdXVHyxb9v4SWVnqd3EexsTv/eFA/KPEDu0KCgorly/9dNumDjUPgy+E/XU2QEi0WlqaSLgDAAxiSLgDAEAXuNyy8MtXVVXY3l7/uyzUabyDibHRnbsPXmW8NjE2EjI9+MKlhITktq9bW1uLijnJyaklpVxNTY39P33f5eHxG1G3c3LzRo6wHGNvK2hMNY9HCBH0Gam7rEeNCL3gF/8o8VpkVOSNWxkZmaFhl0PDLjOZzLlzZm7asEZXR1vQ3PvRMSQ6hrKLTqMh4Q7Qf0hJy7hN23zr7/28ypIOXWUlWVkvHlraTo2/c6ZPYhso5IapGZk7XQnaTdnr4L5cz9hezCEBgHjk5xeu+ejjxKQUQoid3Wh3Nxc9PR0ZlgynpCQhMflG1O1L4RHXIqO+++YLIQcmhpuZOIy1J4S0trZWVfPy8vJSUh9fCLl0MfTvJYvmfeP7OZPZjcowUbfuZmXlWFqaj3OgeN+xvr5+85Yd4ZevEkJU2OxJk9yNDQ0aGhtzcvMSE1Nevsr4ds9Pf50NOHP6mKmJcYe5iUkpy1au5fFqVixf6ubiNHy4KYvF4nA4d+9G/3Hq7MFffisq5uz/8bvOm/rMnm5lSf2bA1EO1AMAwMCFhPsgZ2o1YfT4ed2d9Tz1Rmpc6LuIBwAGovOBIfX19cvfXywtLd3eKCEhsWD+7O/37vfzD/r6y8+ETL93P/re/eg3WxgMxvL3l+zY/rGCgkKXu7cdrl+6ZIGQMcpKSoQQbll5l6uJSEJCYuwYu7Fj7L7ctT0zM/vm7buXIyJjYuP9/APDw6+c8/vDZvQoyombN651daE+zqmuhtsCAfoXJkvefdrHUWE/1dZ0/O7xNPma9wLfp0lXeFWlfRLbgGA52iv7ZSxlMRlrhznItgMMVrl5+bPnLi0sLLKwGL77653OjuPe7F3+/pKKisqDv/x2/MSpTz77spRbtmnDGsp17Oxs9n7v+2ZLWVn5X2cDjv1+8qx/YPrT5/5nT3T5cmE7/3NBRMDx9qampveXr70fHUOn09asXvnJ1g1v/kzb3NwcHHLp8JFjr19nLVi0/PTJo6NGWr3Z++G6j3m8ml8P/zx71v8O+6upqoywspw9a9q0WQsDzl9YvHBu56MhE9ychdw/BACDgLyiute8L7s7q6Is/3rInncRD/QfSLgDAIAwLS0t/ueDCSHOTuPz8gve7BrvMFZSUjI4JGz7J5uFXE61auX77UeNaDRJPT1dE2NDBoMhyu5Z2Tk3b99VkJf3mT1dyDA1NRU5OdmcnDwut4zNVhZlZdEZGup/YPjeByveS0pO9f1mb/yjxJWr1kdeDVVVoSgPamRk8JZ15AFAnJgyw9ymbboS2PGMNq+qJOdVvNmIiYnR5/sksP5PRlZJ39ThSuDXnbv0TcaYjfQQf0gAIAb19fWr12wqLCxyc3U69ttByoS4ouIw36922Npab9y8/YefDpmZGntN8ew8rDNlZaWPN62bNWPq2vVbEpNSNmz89NSfv0pKSnY5MTcvP+rmbXk5ubk+Mzr3+v577/3oGD1dnQM/7+n8cxqNRls432eOz4zVazZFXr+5/IOP7ty8LC8n19b74mVGQUGhhcXwN7Pt7bS0NPd8+1VCYgqXWybKAwIAwBDR9X9dAAAwlN26fe/16yxCyL+WfTh2vMebf2b4LGppaeFyyy6FRwhZYeRIy6nek9r+TJk80cLcTMRsOyHE/1xwS0vLHJ8Z7R97KDEYDMfxDi0tLVevvcNLDm1Gj/I/c8LC3KyYUxItoG4MAAw4cgqqI+wpEjTpSRHGlq5S0r1Tq2rwMR3hnvUypvMbAFLSsj14vRIABoo/Tp5JTXtiYTH8+NFDwo+fz5zuvfvrnS0tLb7f7K2vrxd9C0ND/TOnjxsY6N24eTskNFyUKecCgvn85lkzp3Z+ezI17cnJU37ycnJ//v4fIaciGHT64UM/WFlZFBUVHzp8tL398ZN0Qoi2pqagiV5TPHft3CbibxQAAGCIQMIdAACE8TsXRAixt7PxcHft/Kftc4t/QPC72LqxsTEo+CIhZMnirnM3c3xmEEKOHD1RV9f1J7rcvHxHl8m2Y91eZbzuVkiysjLeXpMIIckpj7s1EQD6M4vRU+SHqXVorK7k5Gcl65mM7ZOQ+j99U4enSVc7t1s7+EhJy4o/HgAQg4aGht+O/UkI+Xb3F8IPQ7RZ/v6S8ePG5OTmnTt/oVsbqamq7Pn2a0LI/oNHWltbhQ9u4vPPB10kAioQHvn1d0LIhvUfWlqaC19HXk7uxLFftm3ZIC8nx+c3tzWqqqgQQmLi4mtr67r1CAAAMJShpAwAAAiUm5d/I+qWsrLSef+TlEVjmpubnd284h8lpqY9ebPeZa+4HBFZzClxGGs/wsqyy8EzpnkdtzmVmJTy6Y4vDx/8QUJCQtDIpqamLdt2ZmXnvLd0YYfrXo+fOFVeXuHkNK5DNdLOpKWlRHwKABgQrGynxdw62aHx5ZPbNo4LXj253RcR9WuaeiOqK4p4VR3vm5Ubpmpg1sX3TwAYuO49eFhWVu4w1l70AnprVq94GBN/9VrUimVLu7WXm6vT2DF2cfEJiYkpdnajhYy8cvV6YWGRnd1o61EjOnTV1NTeuHmbyWQuX7ZElE319XS3bdnwZoutzSgVNruUy136/urf/vOzhoZ6t54CAACGJpxwBwAAgfzPBfH5zT6zpgsq0U6j0RbM9yGE+PkH9vru5wKCiWjH2wkhEhISh/bvVVZWCrkYvnnLjsbGRsphnJLSRUtXRj+M09BQ37Z1Y4fekhLuocNH9/14UNBZqiY+P/L6LUKIrY11N54EAPo9XWM7WfmOFzOUFL4krYStZtgnIfVnxuYur9Lvdm63HO0l/mAAQGxiYxMIIR7urqJPcXVxZDKZMTFxTU1N3d1uoocbIeTBw1jhw/57XeoiiutS4+IT6urqHcbaiXIen5KCgsKhA3vpdFps3KNJ3j67/70vLj6hubm5Z6sBAMAQgRPuAABArampqe393EUL5ggZtnC+z4FDR0LDLu/aua1z3cwee/b85f3oGBU2e8Y0UdM3xsaGR389sHrNpuCQsOSUtM0b106e7NH++aqUy/XzDzp12q+YU2Kgr3f29HE1VZUOKyxZNO/0Gf+EhOStn+76t+8uObl/VEXgcss+/+Kbx0/SR46wdO/OR00AGBDMrScn3D/XofHlk1tGFs5cTmafhNQ/ycgqKanq3Y/8rXO7vqlDn4QEAD3m+80eFovVub2pid+5kcMpIYTo6+mIvj6TydTW1szIyCzmlOhoa3UrNiNDA0JIUVGxkDEvX2XcvRetrKw0c8bUzr3FxRxCiKGBfrf27cB9gkt46PmvfL+Pf5R47PeTx34/yWYruziPn+zp4eHhKqSQfVBQaGxcAmXXGHvbhfN93iYqAADoz5BwBwAAapcjIouKiu3tbKysLIQM09LS9JzofvXajQsh4SuWd+9lYSHaDivNnzeLyaQ+XE/J2XFccMDpDZs/ff7i1caPt0tLSxsa6MnJyeUXFBYWFrWNcXJ0OPjzXm1tisuvDA31/zxxZOWq9ecDQyIiIj083HS0tRQU5PPy8jNeZ6alpVfzeKYmxkePHGDQqf8D3bPvwJFfT1B2KSsrhQSdEf1ZAEDMjMyd0uLDGhtq32zMyYgfYTedIcVqakT13v8ysXKjLLNjOmKCuEMBgLcWceW66IPr6uoIIZQJeiFkWCxCSE1NbZcjO2g7+lDN4wkZ438umBAyb84sGRmKqNrmUnZ1i/WoEaEX/OIfJV6LjIq8cSsjIzM07HJo2GUmkzl3zsxNG9bo6mh3nnU/OoZEx1AuSKfRkHAHABjEkHAHAABqbSlv4cfb2yxeOPfqtRt+AUG9lXCvra27cPESIWQJ1dvBwllZWUReDT3rdz4kNDwhIfnZ85dt7bKyMmPH2K1b+4Hw+uzOjuPCQ8+fOu0XcjE87NLlN7sM9PW2blm/ZPF8IW8lFxUVCzqHpaVFkeIHgH7FyNz5WUrkmy3N/KbXz6OHj/R8nBDeV1H1Kwwplr7puKtBuzu00+hSRuZOfRISALyN77/9SllZqXN7XW3dlk8+79DIZisTQrjcsm5twSkpJYSoq6l2N7bSUi4hRIXdsd5Xu/r6+uCQMELI4kXUFQiVlBQJIWXlFd3dujMJCYmxY+zGjrH7ctf2zMzsm7fvXo6IjImN9/MPDA+/cs7vD5vRozpM2bxxrasL9TfGHvxtAADAAIKEOwAAUAsMOCXiyEme7gU5zzq37/3ed+/3vj3YOuzS5fLyCjdXJ2PjnpROZtDpK5YtXbFsaVlZeX5BIY9Xo6urraWpISkp0s0lw81M9nz39VdffJabl1dczCkvr2Cz2dramro62jQaTdCsHj8sAPQfJpauHRLuhJAXaVHeC3yfp93AIXdCiLn15KwXDzv/VRiajaczuvFCEgD0E54TJ1BWeqmqru6ccDc01CeEJCWnLlo4V8T1s7Jzios5mpoaiorDuhtbSupjQoiBgZ6gAWHhV7jcMhdnx+FmJpQD2g6eP3nytLtbC2doqP+B4XsfrHgvKTnV95u98Y8SV65aH3k1VFXlH78bMDIyEP12WQAAGExwaSoAAPQ7/gFBhJClSxa85TrKykojR1iOHzdGR1tLxGx7OxaLaWZq4uLsOHPGVCdHBwN9PSHZdgAYHFiyitoGozs0NjXWZb2MsbTx7pOQ+hWWrKKxhcuLtKjOXWYj3cUfDwCImafHBEJI5PWbtbWi/gIy7FIEIWTKJI/u7tXQ0HD12o32TSm1vY65ZJHA7L+t7WglJcW0x+mvMl53NwBR2Iwe5X/mhIW5WTGnJFpA9RgAABiCkHAHAID+JSk5NSExRVNTY8rkiX0dCwAMOSZWFFciP026qmdsr6z6VtfuDQIOE5Y/S4lsqO9YT1lD11JWvuM11AAw+BgZGbg4OxZzSo4e/1OU8ZyS0uMnThFCFnS/XvnR4yfz8gsmerhR3rtDCEl7nB7/KFFdXW2q92RBizDo9NmzphFCfj5wRJRNr1y9bmPvMnXG/KamJhHjlJWV8faaRAhJTnks4hQAABj0kHAHAID+xT8gmBCyeOFcQReTAgC8O2qaZnIKHUvrNjXWJT0MdHBf2Sch9RNG5s4MKVbnkjuEEFPLCWIPBwD6xmefbpaUlDz0y29RN+8IH9nY2PjRhq3l5RU+s6ePth7ZrV0ir9/8+cBhBp2+c/sWQWP8/AMJIQvn+zAYDCFLbVq/Rl5OLuzS5dNnzgnfND+/cMfnvsWcklUr329f8/iJU/t+PHhfhNPr0tJSXY4BAIAhAgl3AADoR6qqqsIuXabTaaLXBgUA6F0mVm6dG/Mykyu4ea7eG2j0oZhS0dIfZe3gE3fnr85dMrJKGrqW4g8JAPqErY31p9s2NfH5H67bfDH0b0HDSrncpe+vjn4YZ2xs+G/fXaKv39zcfPzEqdVrN/P5zb5f77S0NKccVs3jhYZdlpSUFHRdajt1dbUf9u4mhHz59bd/nDwjaFhiUorPvKUlpVwXZ0ef2dPb20tKuIcOH93348HW1lbKiU18fuT1W4QQWxvrLp8OAACGCCTcAQCgH0lKThs7xm71B8so7+8CABADA7NxlO0Po34nRGLCtM1D7XZQHUNbB/cV9yOPVpbld+41RfV2gCFm04Y1q1a+X1dXv37TJytWrX8YE9/c3NzeW1hY9OtvJ9w9ZzyIjjU01P/z9/8oKyt1uWY1j/f02Ys/Tp6Z7O3j+83e1taWXTu3rVi2VND4CyGXqqqrJ3q46evpdrn4rJnTvty1nc9v/vLr7xYtXXn/wUM+/38Bv3j5asfnvvMWLsvLL5jg5vzn7/+RkJBo712yaJ6cnGxCQvLWT3fxeDUdVuZyyzZs/OTxk/SRIyzd3SkqkgEAwNCEt/UBAKAfcXN1cnN16usoAGBIYzCY5taTKWun3L1y2NV7o/eCr5+n3sh4ereZL2qR3wFKka1rZTtVXcfi3tUjJYUvOw+QZsoZmzuLPzAA6EMSEhLf+H5uYW62Z9+Ba5FR1yKjlJQUdbS1pKWlS7ncrKyctmFTvSft+343m60saB3/c0Ftt552YD1qxK7PP3F2pP7d5//PDSaE/GvJAhFjXrdmpYa62pe+3929F333XvSwYQp6ujp0Oj0rO6e8vIIQwqDTly5Z8N03X0hJ/eM1JkND/T9PHFm5av35wJCIiEgPDzcdbS0FBfm8vPyM15lpaenVPJ6pifHRIwc610Lcs+/AkV9PUMajrKwUEiTwuD0AAAx0SLiLTKLrIb2ilVC/qiZEdVWJoK7amgrKT0fC8apKBS9Y3oMF3yTFlB2mhIOrAAAA0H9Z2nhlPo/ufDsoIeTulcOGwx1H2s80t56c9TImNyOhvDRH/BG+Uwwplo7BaD2TMWpaw/MykyJDvudVcihHWjv4DM0aOwCweNG8aVMnnz4TcPXajaTk1La0NSGEzVae6O66eNE8h7H2oq+mwmara6iNsbOZ6OHm4e765hnzzuLiEx4/SdfX0/XozqFyn9nT3Vydjh4/GXE18vXrrLTK9PaAJ0/yWL92lZGRAeVEZ8dx4aHnT532C7kYHnbp8ptdBvp6W7esX7J4vrycXOeJRUXFRUXFlGtqaVHfBAsAva6xoaayrOBtVqirqRDU1dzU2KOcm8AkHr+pvr62kikzrLtrCiIhtmwm/JOEioVHX8cwMNiZSC31oPhPlBBCiOT8Vb90a7Vb4ftLi19Tdk2c+YmymkG3Vgs6saFb4/uWlv4op0kf9nUUAAAAAMJkv4yNuyPw+CGNzjC2cNXSG6msZlDHK6+qLG6o5zXUVdXyyqsrOdWVxUI+m/U3imwd+WHqcsNUmSwFaaYck6WgqmlaU80tzn+W9eIhl5MpaCJbzdBj5jZxhgoA/VNVVVVRMaeurl5NVUVNTZVGo73T7TZv2RF0IfSzTz/evHFtz1bIzy8s5nCam5sNDfVV2GwRZ9XV1efm5RUXc8rLK9hstra2pq6O9rt+WAB4SwXZaQ+uH+vrKLrBznmxkXn33vm+FvxtVUURZZfX/K/kh6mJvlRjQ23Yme2UXRKS9C1HqU9gQGc44Q4AAAAA0JG+qUNh7pPc14mUvc38phdpUS/SogghKhrGCoqacgqqimxdDR1LKWlZKaYcnS7FqyqtrSmrq6mo5ZXX1VbUVHMruXl1tZXifY7/YasZyiqoyMgqycgqsWQVmTLDZOXZ0ky5hnpeY31NfX11TXVpZVl+Tll8zM0/6+uqhK8mJS07fuIH4okcAPo5BQUFBQUF8exVVlb+d8RVBoOxaMGcHi+ira2prd3tM+YsFtPM1MTM1KTH+wIAwBCBhDsAAAAAAIUxrv+qLCsQdGKoXWlRRmlRRodGGo0hI6/MklGUlVNmySopqejpGIxWVjVobKgpyEl7/ewB5QWkvY5Gl9I1tNU3HaumNbyyLL+6sqSmupRXVcIpfFHLK6+rKe/xLwDGeaxgySr2brQAAF06H3Sxrq5+5oyp6urdOLMJAAAgTki4AwAAAABQoNGl3GdsuX35UA9KfzY3N1VXFFdXdKzeq6yqr2ts7z59C5eTlRYfVsHN7aVgO6LRGSaWE8ytJ/EqSzKe3XsYdaKxoba3Fnf0XK2ubd5bqwEAiKi1tfVcQNt1qfP7OhYAAACBkHAHAAAAAKAmJS3rMWPrg8jjnMIXvbJgWUl2WUn2k0fhw60nuc/YWpyXnhoXKuTurJ4xsXSzsPGqq6l4EHlU0L1BPebouVrbwLp31wQAEMXde9GvMl6bmZo4OY7r61gAAAAEQsIdAAAAAEAgOoPpNm1T1svY1NiLDfW8XlmTz298knA5I/2uld107wW+T5OvPX50qVdWVlLRc3BfLiFBS34YJKgAfY9p6Y20cVogI6vUu8sCAIgo/elzD3fXWTOnSkhI9HUsAAAAAiHhDgAAAADQBQNTBy29kTkZj4rzn3EKXvCb6t9+zfq66oT7516k3RxhP8Nr3leP7vt1rgUvOhqNYWU3Xd90bHpiRMbTe28fXrthSloaupZaeiNVNIx7cVkAgO5at2blujUr+zoKAACALiDhDgAwJGTn5MbFJxjo642xt+3rWIDao4SkzKzsMfa2Bvp6fR0LAFCQkpYxsXQ1sXQlhFRXcqrKCyrLC6vKC6vKiyrLu13kvV11ZfHDqBNsdSN75yWlxRmpcaFNjXXdXURNa7i9y9L8rOQrgb78poYeB0MIYbIUFJQ0hilryQ/TGKakOYytzWAw32ZBAAAAAIAhBQl3kYnrlbVW0tqLq7FkFeUUVHtxQdFVlhU0NtT0ydYA0FliYsrmLTuWLJ6PhHu/FXwh7K+zAYcO7EXCHaD/kx+mJj9MTdtgdHtLY0NNQx2voZ7XUF/dUF/z3y/qeA311WUlOV3m0LnFr69d+Hb4KM9JPjtfPbn94vFNESNRZOuMtJ9JY0jfj/ytqrxQlClKKnoysorSLHkmS0FKWkaaKSfd9gVLDuViAAAAYFARnM1jqxtJStLEGMp/8ZsayktzxLOXhNiymfBPSLiLrDfT4ML07j8GHYPRo8fP68UFRfcg8lhBTlqfbA0wcDU2Nl6/cTvjdWZ2Ti6LxVRXU7O0GD7BzZlG64OfAwactlP8wsd4TfGUl5MTTzwAMKRISctKScvKE3XK3vLSHE7Bi5xX8RVl+UIWeZ564/WzB+bWk7wX+GY8vZf9Kq6hrlrQYHVtcwOz8bLy7PTEiKK8dOHh0egMHQMbLf2R6trmDCmWKE8EAAAAMOAJzuY5T14jJS0rxlD+q6Is/3rIHvHs1buHekF0SLgDAPQX/ueCDh85np2T26FdX09352dbZs6Y2idRDSBtp/iFj7l36woS7gAgfkoqekoqesNHeVZw816l3818Hi1oZFNjXVr8peepUcYWLhNnflrD43LynzfU8xrqqvn8BmmWvDRTTkFRQ1vfuqQoIyP9DqfwhfCtZeSULEZ76Rnb0xnSvf1YAAAAAADQ0f8BAAD//+zdd1xTVxsH8EMggDKUDTJFpopAwb1FxQV14MaiaK36ttYttW5FrFVbrYqICtSNigOxWAfWgYioKHuKCELYBIFAEvL+kfeT8kISEr0k2P6+f8V7znnOc29MlOcezkXBHQCgQwgJPfPj5h0a6uo//rDa0dHB2qoHh80pKCyMvnU39Pezy75bU1/PmjljqoyzYrFYlZVVRkaGMp6XEPJH9O2Kispx7qN1dLSlGuji4jTefYyoVmmjdRAffTUAoKPpqmPiOnSOTe+Rzx+dK2PkiurW2FCblhidlhhtZNbboJudnpG1ZldDZVU1ZmXRh+rSqoqCWxH+Yha/8ynRVe2d3O0cRX4lAgAAAAAA5VBwBwCQv7S0jK3bAwwM9M+EHevZ005w3NjYqH8/1xHDh8z2XrgzYO+kiePU1DrLLKumpib3CdPe5OVduXjGxcWp7QGUCgw6mfD8pYNDL2lLzLY21suWLGynrOTlo68GAHRMmlpGIz1WFbxJfB1/pbamXEzPovzkovzkj5iiu+1AB1dPlU4aH5sjAAAAAAB8DBTcAQDkLy4+gc3hTBg/pnm1XWD4sMFbNq0vK6vIz39nb28rs6yamnj19fUcDre+gSWzSQEA/j1MujuZdHdKexmd/PwGhWG19S1chszuqm1MYUwAAAAAAJAQCu4AAPKXkppOCOkmeueWb75eIMN0/kdJSTE66jKDUSLLKj8AwL+NvfM4E0vnpzFhlWX5nxhKUZHey2WibZ/RlCQGAAAAAAAfgSbvBAAAgOjqaBNC/nog8hl68qKtrYVqOwBAe9PoYjB68jqnAV50uupHBzE27zN22gZU2wEAAAAA5Asr3AEA5G/4sCEHDwU9evxk/Q9bdmz7UVlZWZJRRwKPV1ZVf7vs6y5dNJsfLyoqPhl6xsjQwHeBt9CBFRWVp85ciH/2nFlTY2Rg4DZq+HSvyTSakFuwx46HlpaWf73IR19Pt3XrnXv3Hz9+mpKazmKxevW0c3VxnjJ5ktA4fOXlFTejb6ekpL3JyzczM3F2dPCa9mWLk933yyEWq4EQUvi+iBASEnpaV1eXEOI17UtbG6u2L4r0MrOyz567lJqW0djY2N3CbOoUj6FDBlVWVh05ekKra5dlSxe1HsLmcG7ciE5KTknPyNLR0baxtpo9a5qujk6Lbsyamt8OHevSRePbZYtbND2Je3Yv5kH//i6jR40Qk5v4qxEUHFJWVjHabXj/fq4tBhYXM06EnKbRFNasXk5Xwr/1AJ8H694jzK37pbyIyk75S6qBXXVMnAZM0zOybqfEAAAAAABAcvghHABA/gYO6Lti+dJfDwaeOnMh7mnCjOmT3ce6WfWwFD8q/NLVzKxsn69mtyi4l5aVHw4MdnVxFlpwfxqf8P1Kv/x3BYIjN27eioyK/nV/QOuS8eWI60nJqV7TvmxRcK+srNq01T/iSqTgSMLzl2Gnzp0Pv7zbf2uPHt1bz3sv5sFav81FRcWCI2fOhh8JOhGwc/PQIYMEB0N/P1teXiH444WLV/gv+ro6t0fB/fyFy5u2+tfW1vH/GP/s+YWLVxYvmj9nttfhwGAba6vWBffc3LwVq39IeP6y+cHDgcdXr/zP1wt9mh+sq607HBhsaWnRuuCelJxyODCYECK+4C7+atBotMOBwU/i4m9cu9Bi4O+nzx8ODPb0mIBqO8DnRVmls/PA6T2dx2clx+SkPWxsqBPf38DY3rbPaANj/CoSAAAAAEBHgZ/DAQA6hHVrvreztfYP2JeVneMfsM8/YJ+FhdnI4UPHubsNGNCPqrJpQsLLixevdOrcee3q5V84OyoqKSYmvj4WHHYv5sFUr3m3bkZ06tT2bgaNjY2z5vomJaeamZos+ca3f18XQsir18mHAoMfxz71mvlV9M0IA3295kOuR95c8p9VhBDHPr3HjB5pY2NVVFR8/sLltPRM36+/PRUaNKB/X37PA/t3czgcQgj/Umzd7GdhbkYIcXLqI/k5rlm/SWiTjrbWD+tXCf54IuTUpi3+hBDPSePdx7qZmZpk5+RevhJ57Hho7JN4oRHy3uZP8JzBZDKNjAwne07o1dO+sbHxxs1b92IebNkWwOFwl37jK2GekhB/NbznzDx6LOTFy1f3/3o0YvgQwaiGhoZz5y8RQnznz6UwGQCQGRVV9d6uHr1dPUqKMhkF6aXF2dXlBRxOI79VXVNPW8/c0LSXgbGtaidN8aEAAAAAAEDGUHAHAOgoPD0mjB0z6q8Hj6P/vHv37l95efkheWdCws7o6eosWuizwGeuurraJ06RmZVtaWlxOvSYhYUZ/8iQQQOmTfH08V2WnJJ64LdAv3Ur2wyy75dDScmp9va24WdDdHS0+Qft7W0nfznRx3fZw0exq9f+eCo0SEFBgd9UVl6+eesuQsjSb3z91q8S3DxY4OO91m/ThfCI5SvWP35wi06nE0JGjRzGbz10JJgQMqB/3z4OvaQ9x8ysbKFNNtZWgoJ7cTHj532/EUL27N7uPWcG/6CLi9N0r8m79/x66Mix1sN5PN76H7YymczhwwYfOvCz4NxnzZx2+my434atO/z3jBg2mMJd78VfjU6dVJcsXrBlW8CRwOPNC+5Xr99klJS6uDj16+tCVSYAIBf6Rjb6Rjb811wum9fEVVRSEXy7AgAAAABAB4SCOwBAB6Kqquo+1s19rBuXy331Ovnuvb+u3/gjJ+dNwE/7r16PunQ+TEur6ydOEbBzs6DazmdkZPjzT9s9J88KCg5dtnSRpoaGmOHMmprAoBOEkAP7AwQVZ0HyQUd+GTzc/V7MgwcPY4cPG8w/HnQstKS0bOiQQRs3rG1eJ1JSUtyze3tGRlZWdk7kjeipUzw+8dT4xoweuWSx8GXmqqoqgtfBJ8KYTObUKR6CajsfjUbzW7fiaXzCs4QXLYbfi3nw8FGsvp7uwV/3tDh37zkz0tIzwi9e+f30+QD/LZSciCT4i9wfxcY9jU8Q7OR+6vR5Qoivj/Ad/AHgM6WoSCeKdHlnAQAAAAAAbUDBHQCgI1JUVPzC2fELZ8fVK7+9cfPWTv+f09Iyvlm2MvxcSJtjm5qaRDXZ29k03zBdwLFP7/79XB/FxqWlZbR+AmdzKSnpHA7X3t62qYn3OimldYf+/Vyjb92JffJUUHBPTkklhCzyndd6VSZdSelm5MU2z0gqenq6Awf0bbNbcko6IWTu7Bmtm2g0mvfcGa0L7skpaYSQaVM99XRbbnZPCPHfvsl/u/CtbFprauJJ2FO8vxe5Hz3Bf+OeJbx48fKVqYnxpEnjKJkCAAAAAAAAACSHgrvEZPXLuzxCTRWmPaJRoqaKkfLiJlXRDI3tdAzaeLAkwGeNRqN5ThpvY2010XP6o8dPGIwSAwN98UMqKipFNVlbi3zuqI2t1aPYuMysHPEF96zsHEJIWlrGuInTxHQrLSsXvM7IzCaE2LTDI08/BX/bGRvrHkJb7WxtWh/kn7uN6GsoOTHvkbT4i9xv34lJSk516N3z99PnCSHzvGficakAAAAAAPDZ4XLY6a9vUxWtppohqonHk1PFTF7zggzhp3GJyerjoEBpaZ/aaJSoqWakUldwp9NVUHCHfwM7W+svnB0fxz5NfJXkPtZNfGcGo0RUk5g6b3l5JSFER1tbVAc+/tNQ7WytPT0miE9Y8FpXR6e4mFFRUWluZio+uCzp6GgzGCUVlZUtNofhKy+vaH1QW0uLEFJRWfXps4t5j6QlWOQeGHRiy8b11yP/UFdXE7pyHwAAAAAAoIPjctkUVo3EkNtzcfA8nn8BFNwlJvbjUFqUJVUwdiNLVFNlWT6Xy5Y8FI8ncu8IQkhdbZW0uYmirW+hKNXOoTL5AsFtQfgH+PCh9nBgMCFk9iwvM1MT8Z1VVFSavVYmhDSwGlr0eRL3TNTwpOQUJpOpqanZ4nhDQ8OLF4mEkJ5tPfCzZ087QkhJadmyJQuVlZXFd+azt7NJTkl98iTe2alP69ay8nIOm6OhoaGm1lmSaFSxs7VOTU1/Gv/c2krIIvfYJ/GtD9rb2RBC4uLil34jZI94Zk1NXW2dioqKYJ99/pvFavUGcbnc1vvVfAr+IvcbUdE0Go3NZnvPmfHpe/0DAAAAAAD8g0m7wr2qvIDdWP/p835glopprakukbaOx+E0imqqKH3LqquWPBSbLbJcCVJBwV1i4j6GTfejDlA1z4vYcKpCEUIK8xIL8xIpCTVh5jY1DSHbFoskk1o4bgvCP4C6utrj2KcJz182NjZu+nGd0D7vCgqfv3iloqLi0Lun4KC5mWlScmpO7psePboLDhYXMyKjokXNVV3N3LFr78+7t7c4vu+Xw+8KCp0cHczN21iEbmpiPHBA3ydxz7ZsC2j9dNAzZ8MfP3mqp6u7dbOfYL3AOHe3i5evHjwUNHGie4tF7teuR323Yh2Hw711M6L5qcnA2DGjIq5E7t13cJy7m67O/325pWdkHT/5e+shw4YO1tTQuH33fmRUtMfE/9shPSMze+bs+SWlZdu3bljk+xX/oJZWV21trZKSkupqZpcuf9/k+OPWnby3+RSei2CRe8SVSBqNNt9nDoXBAQAAAAAA/nmkXeGeGHeZqiWtYmQm3c1MuktVtPj7YVSFAqnQ5J0AAACQBT5zCSHBJ8JCQs9wudwWrWnpmfMXLmOxWHNmeTXf/6RfPxdCSGDQyZoPHwQ9Z87xZbNF/pYMjUY7czZ85ZoNgiH19azNW3cdOnJMSUlxx7aNkvyfY+9POzXU1cNOnVv23ep3BYX8g1VV1Ru37Fzrt/nqtShXV+fmccaPGzP5y4nMmpopXt6378TwT5DN4Zw7f2n5Sj8Ohzt92mQZV9sJIZ6Txo8cMbSktGyq17znz/++MXn7Tszsub4cjpBraGxs9IPfKkLI8hXrjxw9wWL97+b/k7hn83wWl5SW2dpYzZk1vfmQgQP6cjjcvft/46+e4PF4N/+4vWbtRhqN4n9/vefMNDIyJIS4jRoudM0+AAAAAAAAAMgAVrgDAMjflMmTCt+/37V7/4+bdwQGnRg2bLCBvh6dTs/NzcvOyU1OSeVwuGNGj9y4YW3zUV95zwo7de5pfMKgoWOteli+zX9XXMyg0Wgrli/d/+thoRN5eoxns9kXwiMirkT27mWvqKiYnJLGYrHodPqWjetdvnCUJNvu3c0P/bZ33fpNV69FXb0WZWZqoqau9ubNWxaLpaSkuG3zhharvwkhO7dtLCstfxQb5+O7VF1dzdzc7P37osrKKkLIxAljW6+Ul43du7YuWvxdUnKqx5RZ5mamZmammVnZDEaJvp6u/47N638QktVX3rMys7JDQs/s3PXzT3t+sbKyrKpmFhUVE0Icevc8/Nvezp07Ne+/ZtXyP2/HnAg5dftOjKGhQXpGFpPJ1NXR8Z0+Regi+o/G4/E4bDYhZOGCeRSGBQAAAAAAAACpYIU7AECH8O2yxedOnxjnPrqYwTh77uIvB47s2XvgUsS1xFdJzk6ORw/vDzl+uFMn1eZDlJWVL50Pcxs1vLKy6ml8QnExw6qHZcjxw2PHjBI1S+fOnYOPHty+dYOBvt7LxNf8fWz6OPS6dCHMd4G35NmOcRtx+9bVmTOmampq5r8rSEvL4HDYY9xGXA4/tWD+3Nb9tbW1zp89ucFvlba21ocPtSkpaZWVVZaWFmEhR4OPHmxRpJYZUxPjaxFnF/jM1dLq+jb/3cNHsUwmc/SoETcjLw4dMlDoEAUFBf/tm8JOBlpaWrA5nLT0zKKiYk1NzS2b1kddv2jVo+UznG1trCLCT9naWOW/K4h/9pzJZA4ZNCDi0ikTk27UnsuF8IjSsvJevexFZQ4AAAAAAAAAMqCgay+yLgPNuVgpzx2lLu8s5EnaPdwf/xn0Pj+p/fLhc+w/xcbBrb1nAZClqqrqwsL3RQxGfT3LyNDAxLiboaGB+CEfPtRm5+R20dS0sDCTfB+64mJGQeF7O1sbdXU1UX3cJ0xNSk6NuXPD1sZKaAc2h1NUVMxiscxMTVRVVYX2+b/+bHZ6RlZdXZ2FuZmBgb6EqbY3Ho+Xm5tXW1dnb2dDp0v6dOis7JzS0vJu3QxNTYwVFRXFdy4pLSsoKOxmZNjmu/kRuFzusFET3rx5u2/PztmzvCiPDwAAAAAAIBuNDXXXTgl/thm1vpz3k7KKyJ+FW7sfdUAGe7h3WAo0pZVHS+SdxWcDW8oAAHQsXbt26dq1S69e9pIPUVdXc3J0kHYiQ0ODTy/+0pWUzExNpOhPp8t+u/Y2KSgoNH/wrISsrXpIvlu6vp6uvp6utFNI6EZU9Js3b/X1dKdMntROUwAAAAAAAACAJFBwl5h0zy4GkVdM18Cyt6uHVJFy0x/n5yQIbeJJmxUASIPFaiCEKLW1fBvk69jxMEKI99yZkvySAQAAAAAAwOeIrtxp8JjFUg0pY+QmJ0QKbeLxUFKC9oKCu8TwMZSWiCumrKquZ2QtVaTiglRRTbgPAtB+6utZb/LyCCF6elJsJwUy9vBR7MvE1yoqKvO8Z8k7FwAAAAAAgPZCoylKW1BiN7JENUm+HSuAtFBwl5i4j6GCnpHw3Y1FqSp7x2YL/8xr6Zoq0aVZosjjlRZni2rspNZVXVNP8mAVpXlcDluK2cWQyRcX7oMAtIfc3DxLS4t9vx7icLiOfXpramrKOyMQKSg4lBAy2XOCgb4U3/YAAAAAAACfmY8okYseQeEK9646JnTlThJ25rAbKsvyRbVqdNFX7dxFqtkrSt9yOY1Cm7T1zBWVlCUPxWviljFypZodhELBXWLiPoYKIyZ+L1WwmMj9ov4GfzF4lraeuVTRLh7/VlSTiYWT00ApHqD3x8VtH6pLpZpdJJnUwnE7EqA9jJ/kxeFy6utZNBpt1UqR3zAgd8kpqfdiHhBCFsz3lncuAAAAAAAA7ekjSuSiR1C4wt150AxdA0sJO1dVFN6OCBDVauPgZmk3WKrZ/7y8q7ryvdCmfiN8NLroSx5KZk+s/cejyTsBAADocDw8xhsY6Lu6OJ8MPjTGbYS80wGRjgWHEUKGDhnUx6GXvHMBAAAAAAAAAKxwBwCAVvb+tEPeKYBE/NatWLf2e00NdXknAgAAAAAAAACEoOAOAADw+erWzUjeKQAAAAAAAADA37ClDAAAAAAAAAAAAAAABVBwBwAAAAAAAAAAAACgAAruAAAAAAAAAAAAAAAUQMEdAAAAAAAAAAAAAIACKLgDAAAAAAAAAAAAAFAABXcAAAAAAAAAAAAAAAqg4A4AAAAAAAAAAAAAQAEU3AEAAAAAAAAAAAAAKICCOwAAAAAAAAAAAAAABVBwBwAAAAAAAAAAAACgAAruAAAAAAAAAAAAAAAUUJJ3Ap8PBXkn8FEK8hKrKgol719fWyWqKS4mRFGRLnmo6or3Qo+XFefcjzogeRxCSC2zTFRTdurD9/nJUkUD+GhDxi5RoqvIOwsAAAAAAACZenL3RAPrg7yzgH8FXhNXVFMD64O0BaVGVq2opkd/BtFoipKHqiovENX0MjacrtxJwjgcdoPkk0qCR3iimhQ+02rm5w8Fd4mJ/NvbodXXVompoUuloiSPkjiNDbWlRVmUhCKE1NaU1daILMcDUIvHa5J3CgAAAAAAALJWXvKGqtoCwKegsKBUzsilKpSYWrwMiKmqi6nFQ7vCljIAAAAAAAAAAAAAABRAwR0AAAAAAAAAAAAAgAIouAMAAAAAAAAAAAAAUAAFdwAAAAAAAAAAAAAACvwXAAD//+zcy0qUYRzH8WzGA6NmqCkVgQoeoIFop62colXrLiC6gK6pC+gWzE1itGmh4KFSOiARloSHaaymrdC8MsK/95nJz2f74PP8FjKL7+IV3AEAAAAAIIDgDgAAAAAAAQR3AAAAAAAIUEw9oH10pB6Qbf7Bk6irXi4+PTrYa3g0W3nUU7oU9RC0o2KxO/UEAACAvM3de/z718/UKyCl18vP9nY/Njy6PfdwYPBayCv9AyNn/ZP6hXrWUUcr18z/muDetMz/3vSuXJ2MuqpQ7Mw6GhodL/UNRj0EAAAAtIWhkfHUEyCxrq5S1tHl4RvDoxN5jjnplKp+Sovnn/JJGQAAAAAACCC4AwAAAABAAMEdAAAAAAACCO4AAAAAABBAcAcAAAAAgACCOwAAAAAABBDcAQAAAAAggOAOAAAAAAABBHcAAAAAAAgguAMAAAAAQADBHQAAAAAAAgjuAAAAAAAQQHAHAAAAAIAAgjsAAAAAAAQQ3AEAAAAAIEAx9YD20ZHTO+/WXux8WM3psb/UqgdZRxsrC51dpTzHQKuZuXW/UOhMvQIAACBXGysLx7Vq6hWQ0sH+btbR1vrS509reY45qXr0PdXTZBHcm1bP6Z2t9aWcXjqjzZXF1BMgsalyRXAHAADOm82V54f731KvgBa1vbGcegKtxSdlAAAAAAAggOAOAAAAAAABBHcAAAAAAAgguAMAAAAAQADBHQAAAAAAAgjuAAAAAAAQQHAHAAAAAIAAxdQD2kdH5GVj03Mj12cibwzyZnWx9uOw4dHkzfnO7lLOe6ClXCz4zQQAAM6dyXLluFZNvQJS2t5YPtz/2vBobGq21DeY855mdPf0pp5wTolHTatHXjY+NRd5XZz3b19lBvdypbd/KOc9AAAAQFpT5bupJ0BiX3Y2s4L7+PSd4dGJnPfQynxSBgAAAAAAAgjuAAAAAAAQQHAHAAAAAIAAgjsAAAAAAAQQ3AEAAAAAIIDgDgAAAAAAAQR3AAAAAAAIILgDAAAAAEAAwR0AAAAAAAII7gAAAAAAEEBwBwAAAACAAII7AAAAAAAEENwBAAAAACDAHwAAAP//7NwxTgJRGIVRh4G4Cyu34PpcghtwAS5AOxJLO0NppY0mJsZEjMAgKK4AQnGZN8g57d/cYjLFVzzBHQAAAAAAAgR3AAAAAAAI6JcesD+qDbfVzdV5a0N2ajb9WHe6vb6oqrrNMdA1J6dnvZ7fJgAAcFien+6Xi3npFVBSMxuvO90NL3v1oM0xO7MqPeCfUI62tumTW02/3lsbUspssrbFw4F4GA1LTwAAAGjfsvQA6K5m9ll6At3iSRkAAAAAAAgQ3AEAAAAAIEBwBwAAAACAAMEdAAAAAAACBHcAAAAAAAgQ3AEAAAAAIEBwBwAAAACAgH7pAXtj9Pj9Op7XdekdQDnNYl56AgAAQNuOB0dV6Q1AQYtlU3rCPhHct/Xze/TyNim9AgAAAACAjvKkDAAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAECA4A4AAAAAAAGCOwAAAAAABAjuAAAAAAAQILgDAAAAAEDAHwAAAP//7NixAAAAAMAgf+tJ7CyMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADAIAAP//7dixAAAAAMAgf+tJ7CyMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMhDsAAAAAAAyEOwAAAAAADIQ7AAAAAAAMAmWY7bvdwWRqAAAAAElFTkSuQmCC
-"""  
-
-def save_certificate_background():
-    if not certificate_base64.strip():
-        return None
-    clean_b64 = certificate_base64.replace("\n", "").replace(" ", "")
-    img_bytes = base64.b64decode(clean_b64)
-    file_path = os.path.join(CERT_DIR, "madlms.png")
-    os.makedirs(CERT_DIR, exist_ok=True)
-    with open(file_path, "wb") as f:
-        f.write(img_bytes)
-    return file_path
-
-BG_IMAGE_PATH = save_certificate_background()
+# ====================== CERTIFICATE BACKGROUND ======================
+# Shipped as a binary asset and used in place; the rendering template parses it
+# once per process (see get_certificate_template).
+BG_IMAGE_ASSET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "madlms.png")
+BG_IMAGE_PATH = BG_IMAGE_ASSET if os.path.exists(BG_IMAGE_ASSET) else None
 
 # ====================== LOAD STUDENTS ======================
-@st.cache_data
-def load_students():
+@st.cache_resource
+def get_roster(aes_mtime):
+    # aes_mtime only keys the cache, so replacing the .aes file reloads the roster.
+    return load_roster_index(AES_FILE, AES_PASSWORD, ROSTER_CACHE_DIR, BUFFER_SIZE)
+
+@tracer.traced("load_roster")
+def load_roster():
     try:
-        decrypted = io.BytesIO()
-        with open(AES_FILE, "rb") as f:
-            f.seek(0, 2)
-            file_len = f.tell()
-            f.seek(0)
-            pyAesCrypt.decryptStream(f, decrypted, AES_PASSWORD, BUFFER_SIZE, file_len)
-        decrypted.seek(0)
-        df = pd.read_excel(decrypted)
-        df["RegNo"] = df["RegNo"].astype(str).str.strip()
-        df["Name"] = df["Name"].astype(str).str.strip()
-        df["Year"] = df["Year"].astype(str).str.strip()
-        df["Section"] = df["Section"].astype(str).str.strip()
-        df["Dept"] = df["Dept"].astype(str).str.strip()
-        return df
+        return get_roster(os.path.getmtime(AES_FILE))
     except Exception as e:
         st.error(f"❌ Failed to load student file: {e}")
         return None
 
-# ====================== GITHUB PROGRESS ======================
-def load_progress_from_github():
-    url = f"https://raw.githubusercontent.com/{REPO}/main/{PROGRESS_FILE}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        df = pd.read_csv(io.BytesIO(response.content), dtype={"RegNo": str})
-        df["RegNo"] = df["RegNo"].astype(str).str.strip()
-        return df
-    else:
-        return pd.DataFrame(columns=["RegNo","Name","Year","Section","Dept","Video_Status","Certificate_Status","Timestamp"])
+@tracer.traced("load_students")
+def load_students():
+    roster = load_roster()
+    return roster.frame() if roster is not None else None
 
-def upload_progress_to_github(df):
-    csv_data = df.to_csv(index=False).encode()
-    b64_data = base64.b64encode(csv_data).decode()
-    url = f"https://api.github.com/repos/{REPO}/contents/{PROGRESS_FILE}"
+# ====================== GITHUB PROGRESS ======================
+@st.cache_resource
+def get_github_client():
+    return GitHubClient(GITHUB_TOKEN, api_url=GITHUB_API_URL, raw_url=GITHUB_RAW_URL)
 
-    get_resp = requests.get(url, headers={"Authorization": f"token {GITHUB_TOKEN}"})
-    sha = get_resp.json()["sha"] if get_resp.status_code == 200 else None
+@st.cache_resource
+def get_progress_backend():
+    return GitHubProgressBackend(get_github_client(), REPO, PROGRESS_FILE)
 
-    payload = {
-        "message": f"Update progress - {datetime.now().isoformat()}",
-        "content": b64_data,
-        "branch": "main"
-    }
-    if sha:
-        payload["sha"] = sha
+@st.cache_resource
+def get_progress_cache():
+    return ProgressCache(get_progress_backend(), ttl=PROGRESS_CACHE_TTL)
 
-    put_resp = requests.put(url, json=payload, headers={"Authorization": f"token {GITHUB_TOKEN}"})
-    return put_resp.status_code in [200, 201]
+@tracer.traced("load_progress_from_github")
+def load_progress_from_github():
+    # Served from the shared cache; the returned frame must not be modified.
+    return get_progress_cache().frame()
+
+@tracer.traced("upload_progress_to_github")
+def upload_progress_to_github(df, wait=True):
+    # Whole-file write; the app itself goes through get_progress_store() instead.
+    # With wait=False the upload runs on the GitHub client's pool and a Future[bool] is returned.
+    backend = get_progress_backend()
+
+    def upload():
+        try:
+            _, sha = backend.fetch()
+            backend.push(df, sha, f"Update progress - {datetime.now().isoformat()}")
+            return True
+        except Exception:
+            return False
+
+    return upload() if wait else get_github_client().submit(upload)
+
+@st.cache_resource
+def get_progress_store():
+    store = ProgressStore(get_progress_backend(), PROGRESS_JOURNAL,
+                          flush_interval=PROGRESS_FLUSH_INTERVAL, batch_size=PROGRESS_FLUSH_BATCH)
+    store.on_flush.append(get_progress_cache().invalidate)
+    return store
 
 # ====================== GENERATE CERTIFICATE ======================
-def generate_certificate(name, regno, year, section, dept): 
-    timestamp = datetime.now().strftime("%Y-%m-%d") 
-    file_path = os.path.join(CERT_DIR, f"{name}_{regno}.pdf") 
-
-    pdf = FPDF(orientation="L", unit="mm", format="A4") 
-    pdf.add_page()
-
-    if BG_IMAGE_PATH and os.path.exists(BG_IMAGE_PATH):
-        pdf.image(BG_IMAGE_PATH, x=0, y=0, w=297, h=210)
-    
-    pdf.ln(91)
-    pdf.set_font("Helvetica", 'B', 29)
-    pdf.cell(0, 5, name, ln=True, align="C")
-   
-    pdf.ln(5)
-    pdf.set_font("Helvetica", '', 15)
-    pdf.cell(0, 5, f"{regno}- {year} {dept} - {section}", ln=True, align="C")
-
-    pdf.ln(63)
-    pdf.set_font("Helvetica", '', 16)
-    pdf.cell(0, 10, f"Completed on: {timestamp}", ln=True, align="C")
-    
-
-    pdf.output(file_path)
-    return file_path
+@st.cache_resource
+def get_certificate_template(background_path):
+    return CertificateTemplate(background_path)
+
+@st.cache_resource
+def get_certificate_cache():
+    return CertificateCache(CERT_CACHE_DIR, max_bytes=CERT_CACHE_MAX_BYTES, max_age=CERT_CACHE_MAX_AGE)
+
+@tracer.traced("generate_certificate")
+def generate_certificate(name, regno, year, section, dept, completed_on=None):
+    """Return the student's certificate as PDF bytes, rendering it only on a cache miss."""
+    date = completed_on if isinstance(completed_on, str) and completed_on else today()
+    template = get_certificate_template(BG_IMAGE_PATH)
+    cache = get_certificate_cache()
+    key = cache.key(template.version, (name, regno, year, section, dept), date)
+    return cache.get_or_create(key, lambda: template.render(name, regno, year, section, dept, date))
+
+def completed_students(roster, group):
+    """Certificate fields for every student in ``group`` ("All" or "Year Dept - Section") who has completed."""
+    progress_cache = get_progress_cache()
+    students = []
+    for s in roster:
+        if group != "All" and group != f"{s.year} {s.dept} - {s.section}":
+            continue
+        record = progress_cache.get(s.regno)
+        if record is not None:
+            students.append((s.name, s.regno, s.year, s.section, s.dept, str(record.get("Timestamp", ""))))
+    return students
+
+def bulk_certificates(students, as_zip):
+    """Render ``students`` into one ZIP (one PDF each) or one multi-page PDF and return its bytes."""
+    if not as_zip:
+        return get_certificate_template(BG_IMAGE_PATH).render_pdf(students)
+    # Build the archive on disk so the returned bytes are the only in-memory copy.
+    with tempfile.TemporaryFile(dir=CERT_DIR) as f:
+        write_zip(BG_IMAGE_PATH, students, f)
+        f.seek(0)
+        return f.read()
 
 
 # ====================== VIDEO WITH TIMER ======================
@@ -202,6 +239,55 @@ def show_video_with_timer(video_url, duration_sec):
     """
 
     components.html(html_code, height=600, scrolling=True)
+# ====================== ADMIN DASHBOARD ======================
+ADMIN_PAGE_SIZE = 50
+
+@st.cache_resource
+def get_dashboard():
+    return ProgressDashboard()
+
+@st.fragment
+def show_admin_dashboard(roster):
+    # A fragment, so filtering and paging rerun only this block.
+    dashboard = get_dashboard()
+    dashboard.sync(roster, get_progress_cache())
+    by_class = dashboard.by_class
+
+    with st.expander("📊 Student Progress", expanded=True):
+        students, completed = int(by_class["Students"].sum()), int(by_class["Completed"].sum())
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Students", students)
+        c2.metric("Completed", completed)
+        c3.metric("Pending", students - completed)
+
+        students_tab, class_tab, daily_tab = st.tabs(["Students", "By class", "Daily"])
+        with students_tab:
+            cols = st.columns(5)
+            status = cols[0].selectbox("Status", ["All", "Completed", "Pending"], key="admin_status")
+            year, dept, section = (
+                col.selectbox(field, ["All"] + dashboard.options(field), key=f"admin_{field}")
+                for col, field in zip(cols[1:4], ["Year", "Dept", "Section"])
+            )
+            search = cols[4].text_input("Search RegNo / name", key="admin_search").strip()
+            matches = dashboard.filter(status, *(v if v != "All" else None for v in (year, dept, section)), search)
+
+            pages = dashboard.page(matches, 1, ADMIN_PAGE_SIZE)[1]
+            page = st.number_input("Page", min_value=1, max_value=pages, value=1, key="admin_page")
+            rows, _ = dashboard.page(matches, page, ADMIN_PAGE_SIZE)
+            st.dataframe(rows, hide_index=True)
+            st.caption(f"{len(matches)} students · page {page} of {pages}")
+
+            e1, e2 = st.columns(2)
+            e1.download_button("⬇️ Export CSV", lambda: export_csv(matches),
+                               file_name="progress.csv", mime="text/csv", key="admin_export_csv")
+            e2.download_button("⬇️ Export Excel", lambda: export_excel(matches), file_name="progress.xlsx",
+                               mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                               key="admin_export_xlsx")
+        with class_tab:
+            st.dataframe(by_class, hide_index=True)
+        with daily_tab:
+            st.bar_chart(dashboard.daily)
+
 # ====================== MAIN APP ======================
 def main():
     st.title("🎓 CS22088 _Mobile Application Development ( Microlearning_ LMS)")
@@ -212,48 +298,99 @@ def main():
     admin_pass = st.sidebar.text_input("Enter admin password", type="password")
     if admin_pass == ADMIN_PASSWORD:
         st.sidebar.success("✅ Admin access granted")
-        df_progress = load_progress_from_github()
-        st.sidebar.subheader("📊 Student Progress")
-        st.sidebar.dataframe(df_progress)
+        roster = load_roster()
+        if roster is not None:
+            show_admin_dashboard(roster)
+
+            st.sidebar.subheader("📦 Bulk Certificates")
+            groups = sorted({f"{s.year} {s.dept} - {s.section}" for s in roster})
+            group = st.sidebar.selectbox("Class", ["All"] + groups)
+            students = completed_students(roster, group)
+            st.sidebar.caption(f"{len(students)} students have completed")
+            if len(students) <= BULK_ZIP_MAX_STUDENTS:
+                output = st.sidebar.radio("Output", ["Single PDF", "ZIP"], horizontal=True)
+            else:
+                output = "Single PDF"
+                st.sidebar.caption(f"ZIP (one file per student) is offered for up to {BULK_ZIP_MAX_STUDENTS} "
+                                   "students; this selection downloads as one PDF.")
+            as_zip = output == "ZIP"
+            # A callable, so the certificates are rendered only when the button is clicked.
+            st.sidebar.download_button("⬇️ Download certificates", lambda: bulk_certificates(students, as_zip),
+                                       file_name=f"certificates_{group.replace(' ', '_')}.{'zip' if as_zip else 'pdf'}",
+                                       mime="application/zip" if as_zip else "application/pdf",
+                                       key="bulk_download", disabled=not students)
+
+        metrics = get_metrics()
+        st.sidebar.subheader("📈 Usage")
+        st.sidebar.caption("Downloads by day and class")
+        st.sidebar.dataframe(metrics.breakdown("downloads"), hide_index=True)
+        st.sidebar.caption("Visits by day")
+        st.sidebar.dataframe(metrics.breakdown("visits"), hide_index=True)
+
+        progress_store = get_progress_store()
+        synced = None
+        if st.sidebar.button("Sync now"):
+            with st.spinner("Syncing progress to GitHub..."):
+                synced = progress_store.sync()
+        st.sidebar.caption(f"🔄 Progress sync: {progress_store.pending_count()} completions waiting")
+        if progress_store.last_error is not None:
+            st.sidebar.warning(f"Last GitHub sync failed: {progress_store.last_error}")
+        elif synced is not None:
+            st.sidebar.success(f"Synced {synced} completions to GitHub")
+
+        cache_stats = get_certificate_cache().stats()
+        st.sidebar.caption(f"🗂️ Certificate cache: {cache_stats['entries']} files, {cache_stats['bytes'] / 1e6:.1f} MB, "
+                           f"{cache_stats['hits']} hits / {cache_stats['misses']} misses")
+
+        if tracer.enabled:
+            st.sidebar.subheader("⏱️ Stage timings")
+            st.sidebar.dataframe(tracer.summary(), hide_index=True)
+            t1, t2 = st.sidebar.columns(2)
+            t1.download_button("⬇️ JSON", tracer.to_json, file_name="traces.json",
+                               mime="application/json", key="trace_json")
+            t2.download_button("⬇️ Prometheus", tracer.to_prometheus, file_name="metrics.prom",
+                               mime="text/plain", key="trace_prom")
+            if st.sidebar.button("Reset timings"):
+                tracer.reset()
 
    
 
     # Load students
-    student_df = load_students()
-    if student_df is None:
+    roster = load_roster()
+    if roster is None:
         return
 
     regno = st.text_input("Enter your Registration Number:").strip()
     if not regno:
         return
 
-    student = student_df[student_df["RegNo"] == regno]
-    if student.empty:
+    tracer.set_context(regno=regno)
+    with tracer.span("student_lookup"):
+        student = roster.get(regno)
+    if student is None:
         st.error("❌ Invalid Registration Number")
         return
 
-    name = student.iloc[0]["Name"]
-    year = student.iloc[0]["Year"]
-    section = student.iloc[0]["Section"]
-    dept = student.iloc[0]["Dept"]
+    name, year, section, dept = student.name, student.year, student.section, student.dept
 
     st.success(f"Welcome {name} (RegNo: {regno})")
 
-    cert_file = os.path.join(CERT_DIR, f"{name}_{regno}.pdf")
+    cert_name = certificate_filename(name, regno)
+    group = f"{year} {dept} - {section}"
 
     # Load progress
-    df_progress = load_progress_from_github()
-    df_progress["RegNo"] = df_progress["RegNo"].astype(str).str.strip()
-    record = df_progress[df_progress["RegNo"] == regno]
+    progress_cache = get_progress_cache()
+    progress_store = get_progress_store()
 
-  
-    if not record.empty:
+    with tracer.span("progress_lookup"):
+        # The journal also holds completions the remote file doesn't show yet.
+        record = progress_cache.get(regno) or progress_store.get_record(regno)
+    if record is not None:
         st.info("✅ You have already watched the video. You can download your certificate below.")
-        if not os.path.exists(cert_file):
-            cert_file = generate_certificate(name, regno, year, section, dept)
-        with open(cert_file, "rb") as f:
-            st.download_button("📄 Download Certificate", f, file_name=os.path.basename(cert_file), key=f"download_{regno}")
-            update_download_count()
+        completed_on = record.get("Timestamp")
+        cert = generate_certificate(name, regno, year, section, dept, completed_on)
+        st.download_button("📄 Download Certificate", cert, file_name=cert_name, key=f"download_{regno}",
+                           on_click=update_download_count, args=(group,))
     else:
         if st.session_state.get("current_student") != regno:
             st.session_state.video_finished = False
@@ -261,7 +398,8 @@ def main():
 
         show_video_with_timer(VIDEO_URL, VIDEO_DURATION)
         if st.button("✅ I have watched the video", key=f"watch_{regno}"):
-            cert_file = generate_certificate(name, regno, year, section, dept)
+            completed_on = today()
+            cert = generate_certificate(name, regno, year, section, dept, completed_on)
             new_row = {
                 "RegNo": regno,
                 "Name": name,
@@ -270,16 +408,20 @@ def main():
                 "Dept": dept,
                 "Video_Status": "Completed",
                 "Certificate_Status": "Downloaded",
-                "Timestamp": datetime.now().strftime("%Y-%m-%d")
+                "Timestamp": completed_on
             }
-            df_progress = df_progress[df_progress["RegNo"] != regno]
-            df_progress = pd.concat([df_progress, pd.DataFrame([new_row])], ignore_index=True)
-            upload_progress_to_github(df_progress)
+            with tracer.span("record_completion"):
+                progress_store.record(new_row)
+                progress_cache.note_local(new_row)
+                get_dashboard().mark_completed(regno, completed_on)
             st.success("🎉 Certificate generated! You can download it now.")
-            with open(cert_file, "rb") as f:
-                st.download_button("📄 Download Certificate", f, file_name=os.path.basename(cert_file), key=f"download_after_{regno}")
-                update_download_count()
+            st.download_button("📄 Download Certificate", cert, file_name=cert_name, key=f"download_after_{regno}",
+                               on_click=update_download_count, args=(group,))
     # ... your certificate generation code ...
 
 if __name__ == "__main__":
-    main()
+    tracer.set_context(session=session_id(), regno=None)
+    profile = tracer.profile(TRACE_DIR, f"rerun-{session_id()}") if TRACE_PROFILE else nullcontext()
+    with profile, tracer.span("rerun"):
+        main()
+    tracer.export(TRACE_DIR)
@@ -0,0 +1,97 @@
+"""Certificate rendering benchmark: the old per-student FPDF path vs cert_engine.
+
+    python bench/bench_certificates.py [-n 200] [--workers 4] [--background assets/madlms.png]
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from fpdf import FPDF
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cert_engine import CertificateTemplate, write_zip  # noqa: E402
+
+
+def legacy_certificate(background, out_dir, name, regno, year, section, dept):
+    """generate_certificate() as app.py shipped it before the template engine."""
+    timestamp = time.strftime("%Y-%m-%d")
+    file_path = os.path.join(out_dir, f"{name}_{regno}.pdf")
+    pdf = FPDF(orientation="L", unit="mm", format="A4")
+    pdf.add_page()
+    pdf.image(background, x=0, y=0, w=297, h=210)
+    pdf.ln(91)
+    pdf.set_font("Helvetica", 'B', 29)
+    pdf.cell(0, 5, name, new_x="LMARGIN", new_y="NEXT", align="C")
+    pdf.ln(5)
+    pdf.set_font("Helvetica", '', 15)
+    pdf.cell(0, 5, f"{regno}- {year} {dept} - {section}", new_x="LMARGIN", new_y="NEXT", align="C")
+    pdf.ln(63)
+    pdf.set_font("Helvetica", '', 16)
+    pdf.cell(0, 10, f"Completed on: {timestamp}", new_x="LMARGIN", new_y="NEXT", align="C")
+    pdf.output(file_path)
+    return file_path
+
+
+def students(n):
+    return [(f"STUDENT NUMBER {i}", f"21272205{i:05d}", "IV", "AB"[i % 2], "CSE") for i in range(n)]
+
+
+def per_cert(label, fn, items):
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        fn(*item)
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+    print(f"{label:<28} p50 {statistics.median(latencies) * 1000:8.2f} ms   "
+          f"max {max(latencies) * 1000:8.2f} ms   {len(items) / total:8.1f} certs/s")
+
+
+def batch(label, fn, n):
+    start = time.perf_counter()
+    size = fn()
+    total = time.perf_counter() - start
+    print(f"{label:<28} total {total:7.2f} s   {n / total:8.1f} certs/s   {size / 1e6:8.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=200, help="certificates per run")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--background", default=os.path.join(ROOT, "assets", "madlms.png"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        background = args.background
+        items = students(args.n)
+        # The legacy path is slow; a slice is enough for stable per-certificate numbers.
+        legacy_items = items[:max(10, args.n // 10)]
+
+        per_cert("legacy (per student)", lambda *s: legacy_certificate(background, tmp, *s), legacy_items)
+
+        template = CertificateTemplate(background)
+
+        def write_template(*s):
+            with open(os.path.join(tmp, f"{s[0]}_{s[1]}.pdf"), "wb") as f:
+                f.write(template.render(*s))
+
+        per_cert("template (per student)", write_template, items)
+        batch("bulk single PDF", lambda: len(template.render_pdf(items)), args.n)
+
+        def bulk_zip():
+            buf = io.BytesIO()
+            write_zip(background, items, buf, workers=args.workers)
+            return len(buf.getvalue())
+
+        batch(f"bulk ZIP (workers={args.workers or os.cpu_count()})", bulk_zip, args.n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""In-memory stand-in for the parts of GitHub the app talks to.
+
+Serves the contents API (``GET``/``PUT /repos/{owner}/{repo}/contents/{path}``
+with SHA checks and 409 on a stale SHA) and raw file downloads
+(``GET /raw/{owner}/{repo}/{branch}/{path}`` with ETag / ``If-None-Match``),
+and sends ``X-RateLimit-*`` headers. Point the app at it with::
+
+    [github]
+    api_url = "http://127.0.0.1:8765"
+    raw_url = "http://127.0.0.1:8765/raw"
+
+or start it in-process with ``FakeGitHub().start()``. ``python
+bench/fake_github.py --port 8765`` runs it standalone.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class FakeGitHub:
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, rate_limit=5000):
+        self.files = {}  # "owner/repo/path" -> bytes
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_used = 0
+        self.requests = []  # (method, path, status)
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def api_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def raw_url(self):
+        return f"{self.api_url}/raw"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def put_file(self, repo, path, content):
+        with self.lock:
+            self.files[f"{repo}/{path}"] = content
+
+    def get_file(self, repo, path):
+        with self.lock:
+            return self.files.get(f"{repo}/{path}")
+
+    @staticmethod
+    def sha(content):
+        return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=None):
+                with fake.lock:
+                    fake.rate_used += 1
+                    remaining = max(fake.rate_limit - fake.rate_used, 0)
+                    fake.requests.append((self.command, self.path, status))
+                if isinstance(body, dict):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-RateLimit-Limit", str(fake.rate_limit))
+                self.send_header("X-RateLimit-Remaining", str(remaining))
+                self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _key(self):
+                """``owner/repo/path`` and which endpoint, from the request path."""
+                parts = urlsplit(self.path).path.strip("/").split("/")
+                if parts[0] == "raw" and len(parts) >= 5:
+                    return "raw", "/".join(parts[1:3] + parts[4:])
+                if parts[0] == "repos" and len(parts) >= 5 and parts[3] == "contents":
+                    return "contents", "/".join(parts[1:3] + parts[4:])
+                return None, None
+
+            def do_GET(self):
+                time.sleep(fake.latency)
+                kind, key = self._key()
+                with fake.lock:
+                    content = fake.files.get(key)
+                if kind is None or content is None:
+                    return self._send(404, {"message": "Not Found"})
+                sha = fake.sha(content)
+                if kind == "raw":
+                    etag = f'"{sha}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        return self._send(304, headers={"ETag": etag})
+                    return self._send(200, content, {"ETag": etag})
+                owner, repo, path = key.split("/", 2)
+                return self._send(200, {
+                    "sha": sha,
+                    "encoding": "base64",
+                    "content": base64.b64encode(content).decode(),
+                    "download_url": f"{fake.raw_url}/{owner}/{repo}/main/{path}",
+                })
+
+            def do_PUT(self):
+                time.sleep(fake.latency)
+                kind, key = self._key()
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                if kind != "contents":
+                    return self._send(404, {"message": "Not Found"})
+                content = base64.b64decode(payload["content"])
+                with fake.lock:
+                    current = fake.files.get(key)
+                    if current is not None and payload.get("sha") != fake.sha(current):
+                        conflict = True
+                    else:
+                        conflict = False
+                        fake.files[key] = content
+                if conflict:
+                    return self._send(409, {"message": "sha does not match"})
+                return self._send(201 if current is None else 200, {"content": {"sha": fake.sha(content)}})
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the fake GitHub server.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    args = parser.parse_args()
+    fake = FakeGitHub(port=args.port, latency=args.latency)
+    print(f"api_url = {fake.api_url}\nraw_url = {fake.raw_url}")
+    fake.server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
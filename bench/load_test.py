@@ -0,0 +1,269 @@
+"""Load test for the login -> video -> certificate flow.
+
+Imports the real app.py (in Streamlit's bare mode) inside a scratch directory
+with a synthetic encrypted roster and bench/fake_github.py standing in for
+GitHub, then runs concurrent simulated sessions through the same helpers the
+page uses:
+
+    load_students -> load_progress_from_github -> RegNo lookup
+    -> generate_certificate -> record completion -> update_download_count
+
+It reports p50/p95/p99 latency per stage, session throughput, peak RSS and
+lost updates (completions missing from the final progress file, download
+increments missing from the counter). ``--write-path legacy`` replays the old
+read-modify-upload_progress_to_github flow for comparison. ``--completed``
+seeds the fake GitHub with a progress file in which that fraction of the
+roster has already finished, so the CSV parse, reindex and ETag revalidation
+are exercised.
+
+    python bench/load_test.py --sessions 200 --students 2000 --latency 0.05 --completed 0.5
+"""
+import argparse
+import concurrent.futures
+import importlib.util
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import pandas as pd
+import pyAesCrypt
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_github import FakeGitHub  # noqa: E402
+from progress_store import PROGRESS_COLUMNS, parse_progress  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO = "bench/lms"
+PROGRESS_FILE = "progress.csv"
+PASSWORD = "bench-password"
+
+
+def make_roster(path, n):
+    df = pd.DataFrame({
+        "RegNo": [f"{2127220500000 + i}" for i in range(n)],
+        "Name": [f"STUDENT {i}" for i in range(n)],
+        "Year": [["I", "II", "III", "IV"][i % 4] for i in range(n)],
+        "Section": [["A", "B", "C"][i % 3] for i in range(n)],
+        "Dept": [["CSE", "ECE"][i % 2] for i in range(n)],
+    })
+    buf = io.BytesIO()
+    df.to_excel(buf, index=False)
+    buf.seek(0)
+    with open(path, "wb") as out:
+        pyAesCrypt.encryptStream(buf, out, PASSWORD)
+    return df
+
+
+def make_progress(roster, fraction, seed=0):
+    """A progress CSV in which ``fraction`` of the ``roster`` frame has completed."""
+    done = roster.sample(frac=fraction, random_state=seed)
+    df = done.assign(Video_Status="Completed", Certificate_Status="Downloaded",
+                     Timestamp=[f"2025-10-{1 + i % 28:02d}" for i in range(len(done))])
+    return df[PROGRESS_COLUMNS].to_csv(index=False).encode()
+
+
+def write_secrets(directory, aes_file, fake):
+    os.makedirs(os.path.join(directory, ".streamlit"), exist_ok=True)
+    with open(os.path.join(directory, ".streamlit", "secrets.toml"), "w") as f:
+        f.write(f'[aes]\nfile = "{aes_file}"\npassword = "{PASSWORD}"\n\n'
+                f'[github]\ntoken = "bench"\nrepo = "{REPO}"\nprogress_file = "{PROGRESS_FILE}"\n'
+                f'api_url = "{fake.api_url}"\nraw_url = "{fake.raw_url}"\n\n'
+                f'[admin]\npassword = "bench"\n')
+
+
+def quiet_streamlit():
+    # Bare-mode Streamlit warns on every session_state/cache access; keep the report readable.
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def import_app():
+    import streamlit  # noqa: F401  (creates its loggers so they can be quietened first)
+
+    quiet_streamlit()
+    spec = importlib.util.spec_from_file_location("lms_app", os.path.join(ROOT, "app.py"))
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+    quiet_streamlit()
+    return app
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def time(self, stage, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        except Exception:
+            with self._lock:
+                self.errors[stage] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.samples[stage].append(elapsed)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def session(app, rec, regno, write_path):
+    students = rec.time("load_students", app.load_students)
+    rec.time("load_progress_from_github", app.load_progress_from_github)
+    student = rec.time("regno_lookup", lambda: app.load_roster().get(regno))
+    if students is None or student is None:
+        raise RuntimeError(f"{regno} not in roster")
+    record = rec.time("progress_lookup", app.get_progress_cache().get, regno)
+    fields = (student.name, regno, student.year, student.section, student.dept)
+    if record is not None:
+        # Already finished: main() only serves the certificate again.
+        cert = rec.time("generate_certificate", app.generate_certificate, *fields, record.get("Timestamp"))
+    else:
+        completed_on = datetime.now().strftime("%Y-%m-%d")
+        cert = rec.time("generate_certificate", app.generate_certificate, *fields, completed_on)
+        row = {"RegNo": regno, "Name": student.name, "Year": student.year, "Section": student.section,
+               "Dept": student.dept, "Video_Status": "Completed", "Certificate_Status": "Downloaded",
+               "Timestamp": completed_on}
+        if write_path == "store":
+            def record_completion():
+                app.get_progress_store().record(row)
+                app.get_progress_cache().note_local(row)
+            rec.time("record_completion", record_completion)
+        else:
+            # The flow main() used before the write-behind store: read, append, upload the whole file.
+            def legacy_upload():
+                df = app.load_progress_from_github()
+                df = pd.concat([df[df["RegNo"] != regno], pd.DataFrame([row])], ignore_index=True)
+                return app.upload_progress_to_github(df)
+            rec.time("upload_progress_to_github", legacy_upload)
+
+    if not cert.startswith(b"%PDF"):
+        raise RuntimeError(f"{regno}: certificate is not a PDF")
+    rec.time("update_download_count", app.update_download_count, f"{student.year} {student.dept} - {student.section}")
+    rec.time("get_download_count", app.get_download_count)
+
+
+def run(args, write_path):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        fake = FakeGitHub(latency=args.latency).start()
+        try:
+            return _run(args, write_path, workdir, fake)
+        finally:
+            fake.stop()
+            os.chdir(cwd)
+
+
+def _run(args, write_path, workdir, fake):
+    aes_file = os.path.join(workdir, "students.xlsx.aes")
+    roster = make_roster(aes_file, args.students)
+    regnos = roster["RegNo"].tolist()
+    if args.completed:
+        fake.put_file(REPO, PROGRESS_FILE, make_progress(roster, args.completed))
+    write_secrets(workdir, aes_file, fake)
+    os.chdir(workdir)
+    app = import_app()
+
+    downloads_before = app.get_download_count()
+    sessions = [regnos[i % len(regnos)] for i in range(args.sessions)]
+    rec = Recorder()
+    failures = 0
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(session, app, rec, regno, write_path) for regno in sessions]
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                failures += 1
+    wall = time.perf_counter() - start
+
+    # Let the write-behind paths drain before counting what reached the "remote".
+    app.get_progress_store().flush()
+    app.get_metrics().flush()
+    remote = fake.get_file(REPO, PROGRESS_FILE)
+    stored = set(parse_progress(remote)["RegNo"]) if remote else set()
+    expected = set(sessions)
+
+    return {
+        "write_path": write_path,
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "students": args.students,
+        "completed_fraction": args.completed,
+        "github_latency_s": args.latency,
+        "wall_s": round(wall, 3),
+        "sessions_per_s": round(args.sessions / wall, 1),
+        "failed_sessions": failures,
+        # ru_maxrss is in KiB on Linux (bytes on macOS).
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) if resource else None,
+        "lost_completions": len(expected - stored),
+        "lost_download_increments": downloads_before + args.sessions - failures - app.get_download_count(),
+        "github_requests": len(fake.requests),
+        "stages": {
+            stage: {
+                "n": len(values),
+                "errors": rec.errors[stage],
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+            }
+            for stage, values in rec.samples.items()
+        },
+    }
+
+
+def report(result):
+    print(f"\n== write path: {result['write_path']} ==")
+    print(f"{result['sessions']} sessions x {result['concurrency']} concurrent, {result['students']} students "
+          f"({result['completed_fraction']:.0%} already completed), GitHub latency {result['github_latency_s'] * 1000:.0f} ms")
+    print(f"wall {result['wall_s']} s, {result['sessions_per_s']} sessions/s, "
+          f"peak RSS {result['peak_rss_mb']} MB, {result['github_requests']} GitHub requests")
+    print(f"failed sessions {result['failed_sessions']}, lost completions {result['lost_completions']}, "
+          f"lost download increments {result['lost_download_increments']}")
+    print(f"{'stage':<28}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for stage, s in result["stages"].items():
+        print(f"{stage:<28}{s['n']:>6}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}{s['errors']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the LMS app's hot paths.")
+    parser.add_argument("--sessions", type=int, default=200, help="simulated student sessions")
+    parser.add_argument("--concurrency", type=int, default=None, help="concurrent sessions (default: all)")
+    parser.add_argument("--students", type=int, default=1000, help="synthetic roster size")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake GitHub latency per request, seconds")
+    parser.add_argument("--completed", type=float, default=0.0,
+                        help="fraction of the roster already in the remote progress file")
+    parser.add_argument("--write-path", choices=["store", "legacy"], default="store")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    args.concurrency = args.concurrency or args.sessions
+
+    result = run(args, args.write_path)
+    report(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Content-addressed on-disk cache for rendered certificates.
+
+Entries are keyed by a hash of (template version, student fields, completion
+date), so a changed background/layout or corrected student details simply miss
+and re-render. Files are stored as ``<key>.pdf`` next to an ``index.json``
+holding size, digest and last use; the directory is kept under ``max_bytes``
+and ``max_age`` by evicting least-recently-used entries.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+INDEX_FILE = "index.json"
+
+
+def _atomic_write(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class CertificateCache:
+    def __init__(self, directory, max_bytes=200 * 1024 * 1024, max_age=30 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._verified = set()
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()
+
+    @staticmethod
+    def key(template_version, fields, completion_date):
+        payload = json.dumps([template_version, [str(f) for f in fields], str(completion_date)])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE)) as f:
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            return self._rebuild_index()
+
+    def _rebuild_index(self):
+        # Digests are unknown for recovered files; they are re-hashed on first use.
+        index = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pdf"):
+                stat = entry.stat()
+                index.append((entry.name[:-4], {"size": stat.st_size, "sha256": None,
+                                                "created": stat.st_mtime, "used": stat.st_mtime}))
+        index.sort(key=lambda item: item[1]["used"])
+        return OrderedDict(index)
+
+    def _save_index(self):
+        _atomic_write(os.path.join(self.directory, INDEX_FILE), json.dumps(self._index).encode())
+
+    def _valid(self, key, meta):
+        """Cheap size check on every hit; a full digest check the first time this process serves it."""
+        path = self._path(key)
+        try:
+            if os.path.getsize(path) != meta["size"]:
+                return False
+            if key not in self._verified:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                if meta["sha256"] is None:
+                    meta["sha256"] = digest
+                elif digest != meta["sha256"]:
+                    return False
+                self._verified.add(key)
+        except OSError:
+            return False
+        return time.time() - meta["created"] <= self.max_age
+
+    def get(self, key):
+        """Return the cached file path for ``key``, or None."""
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is not None and self._valid(key, meta):
+                meta["used"] = time.time()
+                self._index.move_to_end(key)
+                self.hits += 1
+                return self._path(key)
+            if meta is not None:
+                self._drop(key)
+                self._save_index()
+            self.misses += 1
+            return None
+
+    def put(self, key, data):
+        path = self._path(key)
+        _atomic_write(path, data)
+        now = time.time()
+        with self._lock:
+            self._index[key] = {"size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+                                "created": now, "used": now}
+            self._index.move_to_end(key)
+            self._verified.add(key)
+            self._evict()
+            self._save_index()
+        return path
+
+    def get_or_create(self, key, render):
+        """Return the PDF bytes for ``key``, calling ``render()`` for them on a miss."""
+        path = self.get(key)
+        if path is not None:
+            try:
+                with open(path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                pass  # evicted by another session since get(); render it again
+        data = render()
+        self.put(key, data)
+        return data
+
+    def _drop(self, key):
+        self._index.pop(key, None)
+        self._verified.discard(key)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        cutoff = time.time() - self.max_age
+        total = sum(meta["size"] for meta in self._index.values())
+        # The index is in least-recently-used order.
+        for key, meta in list(self._index.items()):
+            if total <= self.max_bytes and meta["created"] >= cutoff:
+                continue
+            if len(self._index) == 1:
+                break
+            total -= meta["size"]
+            self._drop(key)
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._index),
+                "bytes": sum(meta["size"] for meta in self._index.values()),
+            }
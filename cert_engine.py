@@ -0,0 +1,201 @@
+"""Certificate rendering.
+
+The full-page background PNG is parsed once per process into a template; each
+certificate then only adds the text overlay. ``render_pdf`` puts many
+certificates in one PDF that embeds the background a single time, and
+``write_zip`` renders one PDF per student in a process pool and streams them
+into a ZIP archive.
+
+Run ``python cert_engine.py --help`` for the bulk-export command line.
+"""
+import argparse
+import concurrent.futures
+import getpass
+import hashlib
+import multiprocessing
+import os
+import re
+import zipfile
+from datetime import datetime
+
+from fpdf import FPDF
+from fpdf.image_parsing import preload_image
+
+from tracing import tracer
+
+BULK_CHUNK_SIZE = 25  # certificates handed to a worker process at a time
+LAYOUT_VERSION = 1    # bump when _add_page changes, so cached certificates re-render
+
+
+class CertificateTemplate:
+    def __init__(self, background_path):
+        self.background_path = background_path
+        self._pdf = self._blank()
+        background_hash = "none"
+        if background_path and os.path.exists(background_path):
+            with open(background_path, "rb") as f:
+                background_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+            preload_image(self._pdf.image_cache, background_path)
+        else:
+            self.background_path = None
+        # Identifies what a rendered certificate looks like, for cache keys.
+        self.version = f"{LAYOUT_VERSION}-{background_hash}"
+
+    @staticmethod
+    def _blank():
+        return FPDF(orientation="L", unit="mm", format="A4")
+
+    def _new_pdf(self):
+        pdf = self._blank()
+        # Hand the already-parsed image to the new document instead of decoding the PNG again.
+        # This uses fpdf2 internals (image_cache, ImageInfo usages, preload_image), hence the
+        # fpdf2 pin in requirements.txt.
+        template = self._pdf.image_cache
+        pdf.image_cache.images = {key: type(info)(info, usages=0) for key, info in template.images.items()}
+        pdf.image_cache.icc_profiles = dict(template.icc_profiles)
+        return pdf
+
+    def _add_page(self, pdf, name, regno, year, section, dept, date):
+        pdf.add_page()
+        if self.background_path:
+            pdf.image(self.background_path, x=0, y=0, w=297, h=210)
+
+        pdf.ln(91)
+        pdf.set_font("Helvetica", 'B', 29)
+        pdf.cell(0, 5, name, new_x="LMARGIN", new_y="NEXT", align="C")
+
+        pdf.ln(5)
+        pdf.set_font("Helvetica", '', 15)
+        pdf.cell(0, 5, f"{regno}- {year} {dept} - {section}", new_x="LMARGIN", new_y="NEXT", align="C")
+
+        pdf.ln(63)
+        pdf.set_font("Helvetica", '', 16)
+        pdf.cell(0, 10, f"Completed on: {date}", new_x="LMARGIN", new_y="NEXT", align="C")
+
+    def render(self, name, regno, year, section, dept, date=None):
+        """Return one certificate as PDF bytes."""
+        with tracer.span("certificate.render"):
+            pdf = self._new_pdf()
+            self._add_page(pdf, name, regno, year, section, dept, date or today())
+            return bytes(pdf.output())
+
+    def render_pdf(self, students, date=None):
+        """Return a single PDF with one page per ``(name, regno, year, section, dept[, date])``."""
+        pdf = self._new_pdf()
+        for student in students:
+            name, regno, year, section, dept, *rest = student
+            self._add_page(pdf, name, regno, year, section, dept, (rest and rest[0]) or date or today())
+        return bytes(pdf.output())
+
+
+def today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def certificate_filename(name, regno):
+    """Download/archive name for a certificate, safe for any file system."""
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", f"{name}_{regno}").strip("._")
+    return f"{stem or 'certificate'}.pdf"
+
+
+# ====================== BULK ======================
+_worker_template = None
+
+
+def _init_worker(background_path):
+    global _worker_template
+    _worker_template = CertificateTemplate(background_path)
+
+
+def _render_chunk(students, date):
+    out = []
+    for name, regno, year, section, dept, *rest in students:
+        pdf = _worker_template.render(name, regno, year, section, dept, (rest and rest[0]) or date)
+        out.append((certificate_filename(name, regno), pdf))
+    return out
+
+
+def write_zip(background_path, students, fileobj, date=None, workers=None):
+    """Render one PDF per student in parallel and stream them into a ZIP written to ``fileobj``.
+
+    ``workers`` defaults to the CPU count; with one worker (or one chunk) the
+    certificates are rendered in this process. Returns the number written.
+    """
+    students = list(students)
+    chunks = [students[i:i + BULK_CHUNK_SIZE] for i in range(0, len(students), BULK_CHUNK_SIZE)]
+    date = date or today()
+    workers = workers or os.cpu_count() or 1
+    # PDFs are already compressed; deflating them again costs time for nothing.
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_STORED) as zf:
+        if len(chunks) <= 1 or workers <= 1:
+            _init_worker(background_path)
+            return _write_batches(zf, (_render_chunk(chunk, date) for chunk in chunks))
+        # spawn, not fork: the Streamlit server is multi-threaded.
+        ctx = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx,
+            initializer=_init_worker, initargs=(background_path,),
+        ) as pool:
+            return _write_batches(zf, pool.map(_render_chunk, chunks, [date] * len(chunks)))
+
+
+def _write_batches(zf, batches):
+    count = 0
+    for batch in batches:
+        for filename, pdf in batch:
+            zf.writestr(filename, pdf)
+            count += 1
+    return count
+
+
+# ====================== CLI ======================
+def _select(roster, progress, year=None, dept=None, section=None):
+    completed = None
+    if progress is not None:
+        completed = dict(zip(progress["RegNo"], progress["Timestamp"].astype(str)))
+    for s in roster:
+        if year and s.year != year or dept and s.dept != dept or section and s.section != section:
+            continue
+        if completed is None:
+            yield (s.name, s.regno, s.year, s.section, s.dept)
+        elif s.regno in completed:
+            yield (s.name, s.regno, s.year, s.section, s.dept, completed[s.regno])
+
+
+def main(argv=None):
+    from progress_store import parse_progress
+    from roster import load_roster
+
+    parser = argparse.ArgumentParser(description="Render certificates for a whole roster or section.")
+    parser.add_argument("aes_file", help="encrypted student list (.aes)")
+    parser.add_argument("-o", "--output", required=True, help="output .zip or .pdf")
+    parser.add_argument("--background",
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "madlms.png"))
+    parser.add_argument("--progress", help="progress CSV; only students listed there get a certificate, "
+                                           "dated with their completion Timestamp")
+    parser.add_argument("--year")
+    parser.add_argument("--dept")
+    parser.add_argument("--section")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for ZIP output (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    password = os.environ.get("ROSTER_PASSWORD") or getpass.getpass("Roster password: ")
+    roster = load_roster(args.aes_file, password, ".roster_cache")
+    progress = None
+    if args.progress:
+        with open(args.progress, "rb") as f:
+            progress = parse_progress(f.read())
+    students = list(_select(roster, progress, args.year, args.dept, args.section))
+
+    if args.output.endswith(".pdf"):
+        with open(args.output, "wb") as f:
+            f.write(CertificateTemplate(args.background).render_pdf(students))
+        count = len(students)
+    else:
+        with open(args.output, "wb") as f:
+            count = write_zip(args.background, students, f, workers=args.workers)
+    print(f"Wrote {count} certificates to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
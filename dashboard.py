@@ -0,0 +1,132 @@
+"""Admin analytics over the roster joined with the progress file.
+
+``ProgressDashboard`` does one vectorized merge of the roster and progress
+tables when either changes, precomputes completion counts per class and per
+day, and then answers filtered, paginated queries from memory. Completions
+recorded by this process are applied incrementally via ``mark_completed``.
+"""
+import io
+import threading
+
+import pandas as pd
+from openpyxl import Workbook
+
+from roster import ROSTER_COLUMNS
+
+CLASS_KEYS = ["Year", "Dept", "Section"]
+EXPORT_CHUNK_ROWS = 5000
+
+
+class ProgressDashboard:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._roster = None
+        self._version = None
+        self._joined = pd.DataFrame(columns=ROSTER_COLUMNS + ["Completed", "Timestamp"])
+        self._position = {}
+        self.by_class = pd.DataFrame(columns=CLASS_KEYS + ["Students", "Completed", "Pending", "Percent"])
+        self.daily = pd.Series(dtype="int64", name="Completions")
+
+    def sync(self, roster, progress_cache):
+        """Rebuild if the roster or the remote progress file changed since the last call."""
+        # Revalidate first: a refresh bumps the version, and reading it before would go stale at once.
+        progress_cache.refresh()
+        version = progress_cache.version
+        if roster is self._roster and version == self._version:
+            return
+        self.rebuild(roster.frame(), progress_cache.frame())
+        self._roster, self._version = roster, version
+
+    def rebuild(self, roster_df, progress_df):
+        done = (progress_df.loc[progress_df["Video_Status"].eq("Completed"), ["RegNo", "Timestamp"]]
+                .drop_duplicates("RegNo", keep="last"))
+        joined = roster_df.merge(done, on="RegNo", how="left", indicator="_match")
+        joined["Completed"] = joined.pop("_match").eq("both")
+        for col in CLASS_KEYS:
+            joined[col] = joined[col].astype("category")
+        joined = joined.reset_index(drop=True)
+        with self._lock:
+            self._joined = joined
+            self._position = dict(zip(joined["RegNo"], joined.index))
+            self._aggregate()
+
+    def _aggregate(self):
+        joined = self._joined
+        by_class = (joined.groupby(CLASS_KEYS, observed=True)["Completed"]
+                    .agg(Students="size", Completed="sum").reset_index())
+        by_class["Pending"] = by_class["Students"] - by_class["Completed"]
+        by_class["Percent"] = (100 * by_class["Completed"] / by_class["Students"]).round(1)
+        self.by_class = by_class
+        self.daily = joined.loc[joined["Completed"], "Timestamp"].value_counts().sort_index().rename("Completions")
+
+    def mark_completed(self, regno, timestamp):
+        """Apply one new completion without re-joining the tables."""
+        with self._lock:
+            pos = self._position.get(regno)
+            if pos is None or self._joined.at[pos, "Completed"]:
+                return
+            self._joined.at[pos, "Completed"] = True
+            self._joined.at[pos, "Timestamp"] = timestamp
+            row = self._joined.loc[pos, CLASS_KEYS]
+            match = (self.by_class[CLASS_KEYS] == row.values).all(axis=1)
+            self.by_class.loc[match, "Completed"] += 1
+            self.by_class.loc[match, "Pending"] -= 1
+            self.by_class.loc[match, "Percent"] = (
+                100 * self.by_class.loc[match, "Completed"] / self.by_class.loc[match, "Students"]).round(1)
+            self.daily.loc[timestamp] = self.daily.get(timestamp, 0) + 1
+            self.daily = self.daily.sort_index()
+
+    def options(self, column):
+        return sorted(self._joined[column].cat.categories) if len(self._joined) else []
+
+    def filter(self, status="All", year=None, dept=None, section=None, search=""):
+        """Matching rows of the joined table; ``status`` is "All", "Completed" or "Pending"."""
+        df = self._joined
+        mask = pd.Series(True, index=df.index)
+        if status == "Completed":
+            mask &= df["Completed"]
+        elif status == "Pending":
+            mask &= ~df["Completed"]
+        for col, value in (("Year", year), ("Dept", dept), ("Section", section)):
+            if value:
+                mask &= df[col] == value
+        if search:
+            mask &= (df["RegNo"].str.contains(search, case=False, regex=False)
+                     | df["Name"].str.contains(search, case=False, regex=False))
+        return df[mask]
+
+    @staticmethod
+    def page(df, page, page_size):
+        """Rows of 1-based ``page`` and the page count."""
+        pages = max(1, -(-len(df) // page_size))
+        page = min(max(page, 1), pages)
+        return df.iloc[(page - 1) * page_size:page * page_size], pages
+
+
+def export_csv(df):
+    """The whole CSV file as bytes (``download_button`` needs it in one piece).
+
+    Rows are encoded chunk by chunk, so the full CSV never also exists as one
+    ``str`` next to its encoded copy.
+    """
+    buf = io.BytesIO()
+    for start in range(0, max(len(df), 1), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        buf.write(chunk.to_csv(index=False, header=start == 0).encode())
+    return buf.getvalue()
+
+
+def export_excel(df):
+    """The whole XLSX file as bytes (``download_button`` needs it in one piece).
+
+    openpyxl's write-only mode appends rows without building a cell object for
+    every value of the sheet.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Progress")
+    ws.append(list(df.columns))
+    for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+        ws.append(list(row))
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
@@ -0,0 +1,136 @@
+"""Shared HTTP client for the GitHub contents API and raw.githubusercontent.
+
+One pooled ``requests.Session`` (keep-alive) per process, bounded timeouts,
+retries with jittered exponential backoff on connection errors and 5xx, and
+throttling driven by GitHub's ``X-RateLimit-*`` / ``Retry-After`` headers (the
+``X-RateLimit`` budget is the API's, so raw downloads are never held back by it).
+``submit()`` runs a call on a small background pool so the Streamlit script
+thread doesn't wait on GitHub. Base URLs are configurable so the client can be
+pointed at a local fake (see ``bench/fake_github.py``).
+"""
+import concurrent.futures
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+API_URL = "https://api.github.com"
+RAW_URL = "https://raw.githubusercontent.com"
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class GitHubClient:
+    def __init__(self, token=None, api_url=API_URL, raw_url=RAW_URL, timeout=(3.05, 15),
+                 max_retries=3, backoff=0.5, max_rate_wait=60, pool_size=10):
+        self.api_url = api_url.rstrip("/")
+        self.raw_url = raw_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_rate_wait = max_rate_wait
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = "microlearning-lms"
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+
+        self._lock = threading.Lock()
+        self.rate_remaining = None
+        self.rate_reset = 0.0
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="github")
+
+    def contents_url(self, repo, path):
+        return f"{self.api_url}/repos/{repo}/contents/{path}"
+
+    def raw_file_url(self, repo, branch, path):
+        return f"{self.raw_url}/{repo}/{branch}/{path}"
+
+    def _throttle(self, give_up):
+        with self._lock:
+            remaining, reset = self.rate_remaining, self.rate_reset
+        if remaining is not None and remaining <= 0:
+            wait = min(reset - time.time(), self.max_rate_wait)
+            if give_up is not None:
+                wait = min(wait, give_up - time.monotonic())
+            if wait > 0:
+                log.warning("GitHub rate limit exhausted, waiting %.0fs", wait)
+                time.sleep(wait)
+
+    def _note_rate(self, resp):
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        with self._lock:
+            self.rate_remaining = int(remaining)
+            self.rate_reset = float(resp.headers.get("X-RateLimit-Reset", 0))
+
+    def _retry_delay(self, resp, attempt, api):
+        """Seconds to wait before retrying ``resp``, or None if it shouldn't be retried."""
+        if resp.status_code in (403, 429):
+            if "Retry-After" in resp.headers:
+                return min(float(resp.headers["Retry-After"]), self.max_rate_wait)
+            if api and resp.headers.get("X-RateLimit-Remaining") == "0":
+                return min(max(self.rate_reset - time.time(), 0), self.max_rate_wait)
+            return None
+        if resp.status_code in RETRY_STATUSES:
+            return self._backoff(attempt)
+        return None
+
+    def _backoff(self, attempt):
+        # Full jitter: spreads out retries from sessions that failed together.
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    @staticmethod
+    def _can_wait(give_up, delay):
+        return give_up is None or time.monotonic() + delay < give_up
+
+    def request(self, method, url, max_retries=None, deadline=None, **kwargs):
+        """``requests``-style call with retries.
+
+        ``max_retries`` overrides the client's retry budget for this call and
+        ``deadline`` is a total budget in seconds: no retry or rate-limit wait
+        is started that would end past it. Calls on the script thread use
+        these to make one short attempt; background writes keep the full budget.
+        """
+        retries = self.max_retries if max_retries is None else max_retries
+        give_up = None if deadline is None else time.monotonic() + deadline
+        kwargs.setdefault("timeout", self.timeout)
+        # Only the API counts against X-RateLimit; raw file reads must not wait on it.
+        api = url.startswith(self.api_url + "/") and not url.startswith(self.raw_url + "/")
+        for attempt in range(retries + 1):
+            if api:
+                self._throttle(give_up)
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self._backoff(attempt)
+                if attempt == retries or not self._can_wait(give_up, delay):
+                    raise
+                time.sleep(delay)
+                continue
+            if api:
+                self._note_rate(resp)
+            delay = self._retry_delay(resp, attempt, api)
+            if delay is None or attempt == retries or not self._can_wait(give_up, delay):
+                return resp
+            log.info("GitHub %s %s -> %s, retrying in %.1fs", method, url, resp.status_code, delay)
+            time.sleep(delay)
+        return resp
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def submit(self, fn, *args, **kwargs):
+        """Run ``fn`` on the client's background pool; returns a ``Future``."""
+        return self._executor.submit(fn, *args, **kwargs)
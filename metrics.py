@@ -0,0 +1,124 @@
+"""Visit/download counters shared by every session in the process.
+
+Increments only touch an in-memory counter under a lock. A background thread
+adds the pending deltas to a SQLite table every ``flush_interval`` seconds with
+an atomic ``value = value + delta`` upsert, so several worker processes can
+share one database without losing counts. Counts are kept per day and per
+label (e.g. the student's class) for breakdowns.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+from collections import Counter
+from datetime import date
+
+LEGACY_DAY = "legacy"  # totals imported from the old counter files
+
+
+class Metrics:
+    def __init__(self, db_path, flush_interval=10.0):
+        self.flush_interval = flush_interval
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS counters ("
+            " name TEXT NOT NULL, day TEXT NOT NULL, label TEXT NOT NULL, value INTEGER NOT NULL,"
+            " PRIMARY KEY (name, day, label))"
+        )
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = Counter()
+        self._inflight = Counter()  # being written by flush()
+        self._stored = Counter()
+        self._load_totals()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def seed(self, name, path):
+        """Import a total from an old single-number counter file, once."""
+        if self._stored[name] or not os.path.exists(path):
+            return
+        with open(path) as f:
+            value = int(f.read().strip() or 0)
+        with self._flush_lock:
+            with self._db_lock:
+                self._db.execute("INSERT OR IGNORE INTO counters VALUES (?, ?, '', ?)", (name, LEGACY_DAY, value))
+            self._load_totals()
+
+    def incr(self, name, label="", n=1):
+        with self._lock:
+            self._pending[(name, date.today().isoformat(), label)] += n
+
+    def total(self, name):
+        with self._lock:
+            unsaved = sum(v for counter in (self._pending, self._inflight)
+                          for (n, _, _), v in counter.items() if n == name)
+            return self._stored[name] + unsaved
+
+    def breakdown(self, name):
+        """``[{"day", "label", "count"}]`` for ``name``, newest day first."""
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT day, label, value FROM counters WHERE name = ?", (name,)
+            ).fetchall()
+        counts = Counter({(day, label): value for day, label, value in rows})
+        with self._lock:
+            for (n, day, label), v in self._pending.items():
+                if n == name:
+                    counts[(day, label)] += v
+        return [{"day": day, "label": label, "count": count}
+                for (day, label), count in sorted(counts.items(), reverse=True)]
+
+    def _load_totals(self):
+        with self._db_lock:
+            rows = self._db.execute("SELECT name, SUM(value) FROM counters GROUP BY name").fetchall()
+        with self._lock:
+            self._stored = Counter(dict(rows))
+            self._inflight = Counter()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                self._inflight, self._pending = self._pending, Counter()
+                inflight = self._inflight
+            if inflight:
+                try:
+                    with self._db_lock:
+                        # One transaction, so a failure leaves nothing half-written to be re-added.
+                        self._db.execute("BEGIN IMMEDIATE")
+                        try:
+                            self._db.executemany(
+                                "INSERT INTO counters VALUES (?, ?, ?, ?) "
+                                "ON CONFLICT (name, day, label) DO UPDATE SET value = value + excluded.value",
+                                [(name, day, label, v) for (name, day, label), v in inflight.items()],
+                            )
+                            self._db.execute("COMMIT")
+                        except BaseException:
+                            if self._db.in_transaction:
+                                self._db.execute("ROLLBACK")
+                            raise
+                except sqlite3.Error:
+                    with self._lock:
+                        self._pending.update(inflight)
+                        self._inflight = Counter()
+                    raise
+            # Picks up increments flushed by other processes too.
+            self._load_totals()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                pass  # retried on the next tick
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        self.flush()
@@ -0,0 +1,360 @@
+"""Progress persistence for the LMS app.
+
+Completions are written to a local SQLite (WAL) journal, which makes a click
+O(1), and a background thread flushes the pending rows to the progress CSV in
+coalesced batches. ``ProgressCache`` serves reads from memory, revalidating
+with a conditional GET at most once per TTL.
+
+Backends are pluggable: ``GitHubProgressBackend`` talks to GitHub,
+``LocalProgressBackend`` keeps the CSV on disk (handy for development and
+benchmarks).
+"""
+import atexit
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from tracing import tracer
+
+log = logging.getLogger(__name__)
+
+PROGRESS_COLUMNS = ["RegNo", "Name", "Year", "Section", "Dept", "Video_Status", "Certificate_Status", "Timestamp"]
+
+
+class ConflictError(Exception):
+    """The remote file changed between our read and our write."""
+
+
+def empty_progress():
+    return pd.DataFrame(columns=PROGRESS_COLUMNS)
+
+
+def parse_progress(content):
+    df = pd.read_csv(io.BytesIO(content), dtype={"RegNo": str})
+    df["RegNo"] = df["RegNo"].astype(str).str.strip()
+    return df
+
+
+def merge_progress(remote, rows):
+    """Replace or append ``rows`` (dicts keyed by column) into ``remote`` by RegNo."""
+    if not rows:
+        return remote
+    new = pd.DataFrame(rows)
+    kept = remote[~remote["RegNo"].isin(new["RegNo"])]
+    return pd.concat([kept, new], ignore_index=True)
+
+
+# ====================== BACKENDS ======================
+class GitHubProgressBackend:
+    def __init__(self, client, repo, path, branch="main", read_timeout=(3.05, 5)):
+        self.client = client
+        self.read_timeout = read_timeout  # read() runs on the script thread: one short attempt
+        self.repo = repo
+        self.path = path
+        self.branch = branch
+        self.url = client.contents_url(repo, path)
+        self.raw_url = client.raw_file_url(repo, branch, path)
+        self._last_written = None  # (df, sha) from our last successful push
+
+    def read(self, etag=None):
+        """Return ``(df, etag)``; ``df`` is None when the file still matches ``etag``.
+
+        Only a 404 means the file is empty; other errors raise so callers keep their copy.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        with tracer.span("github.read"):
+            resp = self.client.get(self.raw_url, headers=headers, timeout=self.read_timeout, max_retries=0)
+        if resp.status_code == 304:
+            return None, etag
+        if resp.status_code == 404:
+            return empty_progress(), None
+        resp.raise_for_status()
+        return parse_progress(resp.content), resp.headers.get("ETag")
+
+    def fetch(self, fresh=True):
+        """Return ``(df, sha)`` for the current remote file; ``sha`` is None if it doesn't exist.
+
+        With ``fresh=False`` the file we last pushed is returned without a
+        request; if someone else wrote since, the push will conflict and the
+        caller retries with a fresh fetch.
+        """
+        if not fresh and self._last_written is not None:
+            return self._last_written
+        with tracer.span("github.fetch"):
+            resp = self.client.get(self.url, params={"ref": self.branch})
+        if resp.status_code == 404:
+            return empty_progress(), None
+        resp.raise_for_status()
+        meta = resp.json()
+        if meta.get("encoding") == "base64" and meta.get("content"):
+            content = base64.b64decode(meta["content"])
+        else:
+            # The contents API omits the body for files over 1 MB.
+            raw = self.client.get(meta["download_url"])
+            raw.raise_for_status()
+            content = raw.content
+        return parse_progress(content), meta["sha"]
+
+    def push(self, df, sha, message):
+        payload = {
+            "message": message,
+            "content": base64.b64encode(df.to_csv(index=False).encode()).decode(),
+            "branch": self.branch,
+        }
+        if sha:
+            payload["sha"] = sha
+        with tracer.span("github.push"):
+            resp = self.client.put(self.url, json=payload)
+        if resp.status_code in (409, 422):
+            self._last_written = None
+            raise ConflictError(resp.text)
+        resp.raise_for_status()
+        new_sha = resp.json()["content"]["sha"]
+        self._last_written = (df, new_sha)
+        return new_sha
+
+
+class LocalProgressBackend:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def read(self, etag=None):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return empty_progress(), None
+        current = f"{stat.st_mtime_ns}-{stat.st_size}"
+        if current == etag:
+            return None, etag
+        df, _ = self.fetch()
+        return df, current
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return None, None
+        with open(self.path, "rb") as f:
+            content = f.read()
+        return content, hashlib.sha1(content).hexdigest()
+
+    def fetch(self, fresh=True):
+        content, sha = self._read()
+        if content is None:
+            return empty_progress(), None
+        return parse_progress(content), sha
+
+    def push(self, df, sha, message):
+        with self._lock:
+            _, current = self._read()
+            if current != sha:
+                raise ConflictError(f"{self.path} changed (expected {sha}, found {current})")
+            content = df.to_csv(index=False).encode()
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, self.path)
+            return hashlib.sha1(content).hexdigest()
+
+
+# ====================== WRITE-BEHIND STORE ======================
+class ProgressStore:
+    """Durable local journal of completions, flushed to ``backend`` in batches.
+
+    ``record()`` only touches the local journal. Pending rows are flushed every
+    ``flush_interval`` seconds, or sooner once ``batch_size`` rows are waiting.
+    A flush re-reads the remote file, merges every pending row into it and
+    writes it back with the SHA it read; on a conflict it re-reads and retries.
+    """
+
+    def __init__(self, backend, journal_path, flush_interval=30.0, batch_size=25, max_retries=5):
+        self.backend = backend
+        self.on_flush = []  # callables taking the list of flushed rows
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.last_error = None
+
+        self._db = sqlite3.connect(journal_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS journal ("
+            " regno TEXT PRIMARY KEY, row TEXT NOT NULL,"
+            " updated REAL NOT NULL, flushed INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _query(self, sql, args=()):
+        with self._db_lock:
+            return self._db.execute(sql, args).fetchall()
+
+    def record(self, row):
+        """Journal a completion row (a dict with at least ``RegNo``)."""
+        self._query(
+            "INSERT OR REPLACE INTO journal (regno, row, updated, flushed) VALUES (?, ?, ?, 0)",
+            (row["RegNo"], json.dumps(row), time.time()),
+        )
+        if self.pending_count() >= self.batch_size:
+            self._wake.set()
+
+    def get_record(self, regno):
+        """The journaled row for ``regno`` (flushed or not), or None."""
+        rows = self._query("SELECT row FROM journal WHERE regno = ?", (regno,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def pending_count(self):
+        return self._query("SELECT COUNT(*) FROM journal WHERE flushed = 0")[0][0]
+
+    @tracer.traced("progress.flush")
+    def flush(self):
+        """Push all pending rows in one write; return how many were flushed."""
+        with self._flush_lock:
+            pending = self._query("SELECT regno, row, updated FROM journal WHERE flushed = 0")
+            if not pending:
+                return 0
+            rows = [json.loads(row) for _, row, _ in pending]
+            message = f"Update progress ({len(rows)} records) - {datetime.now().isoformat()}"
+            for attempt in range(self.max_retries):
+                # The first attempt may reuse the backend's copy of its last write.
+                remote, sha = self.backend.fetch(fresh=attempt > 0)
+                try:
+                    self.backend.push(merge_progress(remote, rows), sha, message)
+                    break
+                except ConflictError:
+                    log.info("progress flush conflict, retrying (attempt %d)", attempt + 1)
+                    if attempt:
+                        time.sleep(min(0.5 * 2 ** (attempt - 1), 8))
+            else:
+                raise ConflictError(f"gave up after {self.max_retries} conflicting writes")
+            # Rows re-recorded while we were writing keep flushed = 0 and go out next time.
+            with self._db_lock:
+                self._db.executemany(
+                    "UPDATE journal SET flushed = 1 WHERE regno = ? AND updated = ?",
+                    [(regno, updated) for regno, _, updated in pending],
+                )
+            for callback in self.on_flush:
+                callback(rows)
+            return len(rows)
+
+    def sync(self):
+        """``flush()`` that records the outcome in ``last_error``; returns the count, or None on failure."""
+        try:
+            flushed = self.flush()
+        except Exception as e:
+            self.last_error = e
+            log.exception("progress flush failed")
+            return None
+        self.last_error = None
+        return flushed
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.sync()
+
+    def close(self):
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        try:
+            self.flush()
+        except Exception:
+            log.exception("final progress flush failed")
+
+
+# ====================== CACHED READER ======================
+class ProgressCache:
+    """Process-wide, read-mostly view of the progress file indexed by RegNo.
+
+    The remote file is revalidated (``If-None-Match``) at most once every
+    ``ttl`` seconds by a single thread, outside the lock that readers and
+    ``note_local`` take, so a slow GitHub never stalls other sessions. Rows we
+    wrote ourselves are kept in a local overlay until the remote copy shows
+    them, so a student never "un-completes" while a flush or a CDN refresh is
+    in flight.
+    """
+
+    def __init__(self, backend, ttl=10.0):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()  # guards the swap of the loaded copy and the overlay
+        self._refresh_lock = threading.Lock()  # held by the one thread revalidating
+        self._loaded = False
+        self._df = empty_progress()
+        self._index = {}
+        self._local = {}
+        self._etag = None
+        self._fetched_at = 0.0
+        self.version = 0  # bumped whenever a changed remote file is loaded
+
+    def refresh(self, force=False):
+        if not force and time.monotonic() - self._fetched_at < self.ttl:
+            return
+        # One caller revalidates; the others keep serving the current copy instead of
+        # queueing behind the network read. Only the very first load is waited for.
+        if not self._refresh_lock.acquire(blocking=not self._loaded):
+            return
+        try:
+            # Another thread may have refreshed while we waited for the first load.
+            if not force and time.monotonic() - self._fetched_at < self.ttl:
+                return
+            try:
+                df, etag = self.backend.read(self._etag)
+            except Exception:
+                log.exception("progress refresh failed, serving cached copy")
+                self._fetched_at = time.monotonic()
+                return
+            if df is not None:
+                with tracer.span("progress.reindex"):
+                    index = dict(zip(df["RegNo"], df.to_dict("records")))
+                with self._lock:
+                    self._index = index
+                    self._df = df
+                    self._etag = etag
+                    self.version += 1
+                    for regno in [r for r in self._local if r in index]:
+                        del self._local[regno]
+            self._loaded = True
+            self._fetched_at = time.monotonic()
+        finally:
+            self._refresh_lock.release()
+
+    def invalidate(self, *_):
+        """Force the next read to revalidate against the backend."""
+        self._fetched_at = 0.0
+
+    def note_local(self, row):
+        with self._lock:
+            self._local[row["RegNo"]] = row
+
+    def has_completed(self, regno):
+        self.refresh()
+        return regno in self._local or regno in self._index
+
+    def get(self, regno):
+        self.refresh()
+        return self._local.get(regno) or self._index.get(regno)
+
+    def frame(self):
+        """The progress table including local overlay rows. Treat it as read-only."""
+        self.refresh()
+        local = list(self._local.values())
+        return merge_progress(self._df, local) if local else self._df
@@ -0,0 +1,132 @@
+"""Student roster loaded from the AES-encrypted Excel file.
+
+Decrypting and parsing the workbook is the slowest part of a cold start, so
+the parsed roster is written next to it as an encrypted pickle snapshot named
+after the SHA-256 of the ``.aes`` file. Later starts (and other workers) load
+the snapshot instead and only re-parse the Excel file when it changes.
+"""
+import glob
+import hashlib
+import io
+import logging
+import os
+import pickle
+
+import pandas as pd
+import pyAesCrypt
+
+from tracing import tracer
+
+log = logging.getLogger(__name__)
+
+ROSTER_COLUMNS = ["RegNo", "Name", "Year", "Section", "Dept"]
+SNAPSHOT_VERSION = 2  # 2: duplicate RegNos keep their first row
+
+
+class Student:
+    __slots__ = ("regno", "name", "year", "section", "dept")
+
+    def __init__(self, regno, name, year, section, dept):
+        self.regno = regno
+        self.name = name
+        self.year = year
+        self.section = section
+        self.dept = dept
+
+    def __repr__(self):
+        return f"Student({self.regno!r}, {self.name!r})"
+
+
+class Roster:
+    """RegNo -> ``Student`` index with O(1) lookups."""
+
+    def __init__(self, rows):
+        self._by_regno = {}
+        for row in rows:
+            # A RegNo listed twice resolves to its first row, as the Excel lookup always did.
+            if row[0] not in self._by_regno:
+                self._by_regno[row[0]] = Student(*row)
+        self._frame = None
+
+    @classmethod
+    def from_frame(cls, df):
+        df = df[ROSTER_COLUMNS].astype(str).apply(lambda col: col.str.strip())
+        return cls(df.itertuples(index=False, name=None))
+
+    def rows(self):
+        return [(s.regno, s.name, s.year, s.section, s.dept) for s in self._by_regno.values()]
+
+    def get(self, regno):
+        return self._by_regno.get(regno)
+
+    def __contains__(self, regno):
+        return regno in self._by_regno
+
+    def __len__(self):
+        return len(self._by_regno)
+
+    def __iter__(self):
+        return iter(self._by_regno.values())
+
+    def frame(self):
+        """The roster as a DataFrame (built once). Treat it as read-only."""
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.rows(), columns=ROSTER_COLUMNS)
+        return self._frame
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _decrypt(path, password, buffer_size):
+    decrypted = io.BytesIO()
+    with open(path, "rb") as f, tracer.span("roster.decrypt"):
+        pyAesCrypt.decryptStream(f, decrypted, password, buffer_size)
+    return decrypted.getvalue()
+
+
+def _read_snapshot(path, password, buffer_size):
+    # pyAesCrypt authenticates the ciphertext (HMAC), so a snapshot that
+    # unpickles was written by someone holding the roster password.
+    version, rows = pickle.loads(_decrypt(path, password, buffer_size))
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"snapshot version {version}, expected {SNAPSHOT_VERSION}")
+    return Roster(rows)
+
+
+def _write_snapshot(roster, path, password, buffer_size):
+    data = pickle.dumps((SNAPSHOT_VERSION, roster.rows()), protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as out:
+        pyAesCrypt.encryptStream(io.BytesIO(data), out, password, buffer_size)
+    os.replace(tmp, path)
+
+
+def load_roster(aes_file, password, snapshot_dir, buffer_size=64 * 1024):
+    """Return the ``Roster`` for ``aes_file``, via its snapshot when one exists."""
+    os.makedirs(snapshot_dir, exist_ok=True)
+    snapshot = os.path.join(snapshot_dir, f"roster-{file_digest(aes_file)[:16]}.pkl.aes")
+    if os.path.exists(snapshot):
+        try:
+            with tracer.span("roster.snapshot_load"):
+                return _read_snapshot(snapshot, password, buffer_size)
+        except Exception:
+            log.exception("ignoring unreadable roster snapshot %s", snapshot)
+
+    content = _decrypt(aes_file, password, buffer_size)
+    with tracer.span("roster.parse_excel"):
+        roster = Roster.from_frame(pd.read_excel(io.BytesIO(content)))
+    try:
+        with tracer.span("roster.snapshot_write"):
+            _write_snapshot(roster, snapshot, password, buffer_size)
+        for stale in glob.glob(os.path.join(snapshot_dir, "roster-*.pkl.aes")):
+            if stale != snapshot:
+                os.remove(stale)
+    except OSError:
+        log.exception("could not write roster snapshot %s", snapshot)
+    return roster
@@ -0,0 +1,230 @@
+"""Lightweight timing spans for the app's hot paths.
+
+``tracer`` is a process-wide singleton. When disabled (the default) ``span()``
+returns a shared no-op context manager and ``traced`` calls straight through,
+so instrumented code pays about one attribute check. When enabled, every span
+feeds a per-stage histogram (Prometheus-style buckets plus a window of recent
+samples for percentiles) and a ring buffer of recent spans tagged with the
+current session/RegNo context. ``profile()`` wraps a block in cProfile, or
+pyinstrument when it is installed.
+"""
+import contextvars
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+SAMPLE_WINDOW = 2048
+
+_context = contextvars.ContextVar("trace_context", default={})
+# One profiler per process: on Python 3.12+ cProfile uses sys.monitoring, which
+# refuses a second active profiler.
+_profile_lock = threading.Lock()
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count", "max", "recent")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+        self.recent = deque(maxlen=SAMPLE_WINDOW)
+
+    def add(self, ms):
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.counts[i] += 1
+                break
+        self.total += ms
+        self.count += 1
+        self.max = max(self.max, ms)
+        self.recent.append(ms)
+
+    def percentile(self, q):
+        values = sorted(self.recent)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "stage", "attrs", "start")
+
+    def __init__(self, tracer, stage, attrs):
+        self.tracer = tracer
+        self.stage = stage
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        ms = (time.perf_counter() - self.start) * 1000
+        self.tracer._record(self.stage, ms, self.attrs, exc_type is not None)
+        return False
+
+
+class Tracer:
+    def __init__(self, max_spans=500):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.spans = deque(maxlen=max_spans)
+        self._last_export = 0.0
+
+    def configure(self, enabled):
+        self.enabled = bool(enabled)
+
+    @staticmethod
+    def set_context(**context):
+        """Tag spans started from the current thread/context (e.g. session, regno)."""
+        _context.set({**_context.get(), **context})
+
+    def span(self, stage, **attrs):
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, stage, attrs)
+
+    def traced(self, stage):
+        """Decorator form of ``span``."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Span(self, stage, {}):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, stage, ms, attrs, failed):
+        with self._lock:
+            hist = self.histograms.get(stage)
+            if hist is None:
+                hist = self.histograms[stage] = Histogram()
+            hist.add(ms)
+            self.spans.append({"stage": stage, "ms": round(ms, 3), "at": time.time(), "error": failed,
+                               **_context.get(), **attrs})
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.spans.clear()
+
+    # ====================== EXPORT ======================
+    def summary(self):
+        """One row per stage, slowest total time first."""
+        with self._lock:
+            rows = [{
+                "stage": stage,
+                "count": h.count,
+                "mean_ms": round(h.total / h.count, 2),
+                "p50_ms": round(h.percentile(50), 2),
+                "p95_ms": round(h.percentile(95), 2),
+                "p99_ms": round(h.percentile(99), 2),
+                "max_ms": round(h.max, 2),
+                "total_ms": round(h.total, 1),
+            } for stage, h in self.histograms.items()]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def to_json(self):
+        with self._lock:
+            spans = list(self.spans)
+        return json.dumps({"stages": self.summary(), "recent_spans": spans}, indent=2)
+
+    def to_prometheus(self):
+        lines = [
+            "# HELP lms_stage_duration_ms Time spent per app stage.",
+            "# TYPE lms_stage_duration_ms histogram",
+        ]
+        with self._lock:
+            for stage, h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS_MS, h.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f'lms_stage_duration_ms_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'lms_stage_duration_ms_sum{{stage="{stage}"}} {h.total:.3f}')
+                lines.append(f'lms_stage_duration_ms_count{{stage="{stage}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory, min_interval=10.0):
+        """Write ``traces.json`` and ``metrics.prom`` to ``directory``, at most every ``min_interval`` s."""
+        now = time.monotonic()
+        if not self.enabled or now - self._last_export < min_interval:
+            return
+        self._last_export = now
+        os.makedirs(directory, exist_ok=True)
+        for name, text in (("traces.json", self.to_json()), ("metrics.prom", self.to_prometheus())):
+            tmp = os.path.join(directory, f".{name}.tmp")
+            with open(tmp, "w") as f:
+                f.write(text)
+            os.replace(tmp, os.path.join(directory, name))
+
+    # ====================== PROFILING ======================
+    @contextmanager
+    def profile(self, directory, label="rerun"):
+        """Profile the block and dump it to ``directory`` (pyinstrument HTML if available, else .prof).
+
+        Only the calling (script) thread is captured, not the background flush
+        or GitHub pool threads. If another rerun is already being profiled the
+        block runs unprofiled and nothing is dumped.
+        """
+        if not _profile_lock.acquire(blocking=False):
+            yield
+            return
+        try:
+            with self._profiled(directory, label):
+                yield
+        finally:
+            _profile_lock.release()
+
+    @staticmethod
+    @contextmanager
+    def _profiled(directory, label):
+        os.makedirs(directory, exist_ok=True)
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() // 1_000_000 % 1000:03d}"
+        if pyinstrument is not None:
+            profiler = pyinstrument.Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                with open(os.path.join(directory, f"{label}-{stamp}.html"), "w") as f:
+                    f.write(profiler.output_html())
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(directory, f"{label}-{stamp}.prof"))
+
+
+tracer = Tracer()